@@ -10,16 +10,29 @@ from .e3dc.RscpConnection import RscpConnectionException
 
 DOMAIN = const.DOMAIN
 
+# seconds to wait for the first connection and authorization
+CONNECT_TIMEOUT = 10
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     """Sets up the integration from config entry."""
+    coordinator = E3dcRscpCoordinator(hass, entry)
+    # the supervisor connects, authorizes and reconnects in the background, it
+    # only probes the connection if the polls stop
+    supervisor = coordinator.client.start_supervisor(
+        probe_interval=coordinator.probe_interval
+    )
     try:
-        coordinator = E3dcRscpCoordinator(hass, entry)
-        await coordinator.client.client.connect()
+        if not await supervisor.wait_ready(CONNECT_TIMEOUT):
+            raise RscpConnectionException("Not connected or not authorized in time")
 
         await coordinator.async_config_entry_first_refresh()
     except RscpConnectionException as err:
+        await coordinator.client.close()
         raise ConfigEntryNotReady(f"Error establishing the connection {err}") from err
+    except BaseException:
+        await coordinator.client.close()
+        raise
 
     # Speichere den Koordinator zentral
     hass.data.setdefault(DOMAIN, {})[entry.entry_id] = {
@@ -39,5 +52,6 @@ async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry, ["sensor", "select"]
     )
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        data = hass.data[DOMAIN].pop(entry.entry_id)
+        await data["coordinator"].client.close()
     return unload_ok
@@ -1,10 +1,15 @@
 "Client which uses RscpConnections to E3DC storage devices."
 
+import asyncio
 import logging
+import time
 
 from .e3dc.RscpConnection import RscpConnection
+from .e3dc.RscpConnectionSupervisor import RscpConnectionSupervisor
 from .e3dc.RscpEncryption import RscpEncryption
 from .e3dc.RscpFrame import RscpFrame
+from .e3dc.RscpRequestScheduler import PRIORITY_BULK, PRIORITY_COMMAND, PRIORITY_POLL
+from .e3dc.RscpTransport import RscpTransport
 from .e3dc.RscpValue import RscpValue
 from .model.StorageRscpModel import StorageRscpModel
 from .model.WallboxRscpModel import WallboxRscpModel
@@ -15,21 +20,56 @@ from .model.RscpHandlerPipeline import RscpHandlerPipeline
 
 _LOGGER = logging.getLogger(__name__)
 
+# seconds after which identify_device probes for devices which have not been found
+DEVICE_PROBE_INTERVAL = 3600
+
+
+class RscpCommandError(Exception):
+    "A queued command was not answered or answered with an error by the device."
+
 
 class RscpClient:
     "Class which holds an RscpConnection to communicate with an E3DC storage device."
 
     def __init__(
-        self, host: str, port: int, username: str, password: str, rscp_key: str
+        self,
+        host: str,
+        port: int,
+        username: str,
+        password: str,
+        rscp_key: str,
+        transport: RscpTransport | None = None,
+        poll_periods: dict[str, int] | None = None,
+        probe_interval: float = DEVICE_PROBE_INTERVAL,
     ) -> None:
-        "Initializes the client connection."
+        """Initializes the client connection.
+
+        poll_periods are the periods of the poll groups in calls of fetch_data, see
+        RscpHandlerPipeline.set_poll_periods. probe_interval are the seconds after
+        which identify_device probes again for the devices which have not been found.
+        """
         self.client = RscpConnection(
-            host, port, RscpEncryption(rscp_key), username, password
+            host, port, RscpEncryption(rscp_key), username, password, transport
         )
         self.__storage = None
         self.__sg_ready = None
         self.__wallboxes = []
-        self.__handlerPipeline = RscpHandlerPipeline()
+        self.__handlerPipeline = RscpHandlerPipeline(poll_periods)
+        # (request, reply path, future) of the commands for the next fetch_data
+        self.__commands = []
+        self.__connect_lock = asyncio.Lock()
+        self.__supervisor = None
+        self.__probe_interval = probe_interval
+        self.__last_probe = None
+
+    def set_poll_periods(self, poll_periods: dict[str, int]) -> None:
+        "Changes the periods of the poll groups in calls of fetch_data."
+        self.__handlerPipeline.set_poll_periods(poll_periods)
+
+    @property
+    def crypto_stats(self):
+        "Time and data spent on encryption and decryption of the connection."
+        return self.client.crypto_stats
 
     @property
     def wallboxes(self):
@@ -57,6 +97,17 @@ class RscpClient:
             return None
         return self.__storage.get_model()
 
+    @property
+    def topology(self) -> dict:
+        "The indexes of the devices which have been found."
+        storage = self.__storage.get_model() if self.__storage is not None else None
+        return {
+            "wallboxes": [wallbox.index for wallbox in self.__wallboxes],
+            "inverters": sorted(storage.inverters) if storage else [],
+            "batteries": sorted(storage.device_states.battery) if storage else [],
+            "sg_ready": self.__sg_ready is not None,
+        }
+
     @property
     def sg_ready(self):
         "Get access to the sg ready data."
@@ -64,68 +115,178 @@ class RscpClient:
             return None
         return self.__sg_ready.get_model()
 
-    async def _connect_and_login(self) -> None:
-        if not self.client.is_connected():
-            await self.client.connect()
-        if self.client.is_connected() and not self.client.is_authorized():
-            if not await self.client.authorize():
-                raise ConnectionError(
-                    "Couldn't authorize! Check username and password!"
-                )
+    def start_supervisor(self, **kwargs) -> RscpConnectionSupervisor:
+        """Keeps the connection ready in the background, see RscpConnectionSupervisor.
 
-    def __add_identified_storage(self, storage):
-        def set_storage(self, storage):
-            self.__storage = storage
-            self.__handlerPipeline.add_handler(storage)
+        While the supervisor runs, requests don't connect themselves anymore, they
+        fail at once if the connection is not ready. kwargs are passed to the
+        supervisor.
+        """
+        if self.__supervisor is None:
+            self.__supervisor = RscpConnectionSupervisor(self.client, **kwargs)
+        self.__supervisor.start()
+        return self.__supervisor
+
+    @property
+    def supervisor(self) -> RscpConnectionSupervisor | None:
+        "The supervisor of the connection, if it was started."
+        return self.__supervisor
 
-        if storage is None:
-            _LOGGER.warning("Can't set storage to None!")
+    async def close(self) -> None:
+        "Stops the supervisor and closes the connection."
+        if self.__supervisor is not None:
+            await self.__supervisor.stop()
+        self.client.disconnect()
+
+    async def _connect_and_login(self) -> None:
+        if self.__supervisor is not None and self.__supervisor.running:
+            if not self.__supervisor.is_ready():
+                self.__supervisor.wake()
+                raise ConnectionError("Not connected, reconnecting in the background!")
             return
 
-        if self.__storage is None:
-            set_storage(self, storage)
+        # concurrent requests connect only once
+        async with self.__connect_lock:
+            if not self.client.is_connected():
+                await self.client.connect()
+            if self.client.is_connected() and not self.client.is_authorized():
+                if not await self.client.authorize():
+                    raise ConnectionError(
+                        "Couldn't authorize! Check username and password!"
+                    )
+
+    def __set_storage(self, storage: StorageRscpModel) -> None:
+        if self.__storage is not None:
+            if storage.get_model().serial == self.__storage.get_model().serial:
+                _LOGGER.info("Re-Identified storage: %s!", storage.get_model().serial)
+                return
+            self.__handlerPipeline.remove_handler(self.__storage)
+        self.__storage = storage
+        self.__handlerPipeline.add_handler(storage)
+
+    def __set_wallboxes(self, identified: dict[int, WallboxRscpModel]) -> None:
+        """Updates the wallboxes with the identified ones by index.
+
+        Known wallboxes with the same serial keep their handler, the others are
+        replaced or removed.
+        """
+        wallboxes = []
+        for wallbox in self.__wallboxes:
+            found = identified.pop(wallbox.index, None)
+            if (
+                found is not None
+                and found.get_model().serial == wallbox.get_model().serial
+            ):
+                wallbox.get_model().device_name = found.get_model().device_name
+                wallbox.get_model().firmware_version = (
+                    found.get_model().firmware_version
+                )
+                wallboxes.append(wallbox)
+                continue
+            _LOGGER.info("Wallbox on index %d is gone", wallbox.index)
+            self.__handlerPipeline.remove_handler(wallbox)
+            if found is not None:
+                identified[found.index] = found
+
+        for wallbox in identified.values():
+            _LOGGER.info(
+                "Wallbox %s found on index %d",
+                wallbox.get_model().serial,
+                wallbox.index,
+            )
+            self.__handlerPipeline.add_handler(wallbox)
+            wallboxes.append(wallbox)
+        self.__wallboxes = sorted(wallboxes, key=lambda x: x.index)
+
+    def __set_sg_ready(self, sg_ready: SgReadyRscpModel | None) -> None:
+        if sg_ready is not None and self.__sg_ready is not None:
             return
+        if self.__sg_ready is not None:
+            self.__handlerPipeline.remove_handler(self.__sg_ready)
+        self.__sg_ready = sg_ready
+        if sg_ready is not None:
+            self.__handlerPipeline.add_handler(sg_ready)
+
+    async def __probe_devices(self) -> None:
+        "Identifies the storage, all wallbox indexes and SG Ready."
+        requests = []
+        requests.extend(StorageRscpModel.get_identification_tags())
+        requests.extend(WallboxRscpModel.get_identification_tags())
+        requests.extend(SgReadyRscpModel.get_identification_tags())
+
+        received_values = await self.send_and_receive(requests, PRIORITY_BULK)
+        for x in received_values:
+            _LOGGER.info(f"received identification: {x.toString()}")
+
+        wallboxes = {}
+        sg_ready = None
+        for value in received_values:
+            storage = StorageRscpModel.identify(value)
+            if storage is not None:
+                self.__set_storage(storage)
+                continue
+
+            wallbox = WallboxRscpModel.identify(value)
+            if wallbox is not None:
+                wallboxes[wallbox.index] = wallbox
+                continue
+
+            sg_ready = SgReadyRscpModel.identify(value) or sg_ready
+
+        self.__set_wallboxes(wallboxes)
+        self.__set_sg_ready(sg_ready)
+        if self.__storage is not None:
+            # the inverters and batteries are probed with the next polls
+            self.__storage.probe_devices()
+
+    async def __verify_devices(self) -> bool:
+        """Verifies serial and software version of the storage and the known wallboxes.
+
+        Returns False if another storage answers.
+        """
+        requests = []
+        requests.extend(StorageRscpModel.get_verification_tags())
+        requests.extend(
+            WallboxRscpModel.get_identification_tags(
+                [wallbox.index for wallbox in self.__wallboxes]
+            )
+        )
+
+        received_values = await self.send_and_receive(requests, PRIORITY_BULK)
+        wallboxes = {}
+        for value in received_values:
+            if not self.__storage.verify(value):
+                _LOGGER.warning("Another storage answers, identify it again")
+                return False
 
-        if storage.ident_serial == self.__storage.ident_serial:
-            _LOGGER.info("Re-Identified storage: %s!", storage.ident_serial)
-        else:
-            set_storage(self, storage)
+            wallbox = WallboxRscpModel.identify(value)
+            if wallbox is not None:
+                wallboxes[wallbox.index] = wallbox
+
+        self.__set_wallboxes(wallboxes)
+        return True
 
     async def identify_device(self) -> dict:
-        "Reads serial number and firmware version from device."
+        """Identifies the storage and the devices connected to it.
+
+        The devices found are cached. The first identification and every
+        probe_interval seconds all device indexes are probed, in between only the
+        serial and software version of the known devices are verified.
+        """
         try:
             if not self.client.is_connected() or not self.client.is_authorized():
                 _LOGGER.info("Not connected, try to reconnect!")
                 await self._connect_and_login()
 
-            self.__wallboxes.clear()
-
-            requests = []
-            requests.extend(StorageRscpModel.get_identification_tags())
-            requests.extend(WallboxRscpModel.get_identification_tags())
-            requests.extend(SgReadyRscpModel.get_identification_tags())
-
-            received_values = await self.send_and_receive(requests)
-            for x in received_values:
-                _LOGGER.info(f"received identification: {x.toString()}")
-            # TODO read serial number and firmware from wallbox and add data to coordinator *and* to device_info
-            #
-            for value in received_values:
-                storage = StorageRscpModel.identify(value)
-
-                if storage is not None:
-                    self.__add_identified_storage(storage)
-
-                wallbox = WallboxRscpModel.identify(value)
-                if wallbox is not None:
-                    self.__wallboxes.append(wallbox)
-                    self.__handlerPipeline.add_handler(wallbox)
-                    continue
-
-                sg_ready = SgReadyRscpModel.identify(value)
-                if sg_ready is not None:
-                    self.__sg_ready = sg_ready
-                    self.__handlerPipeline.add_handler(sg_ready)
+            now = time.monotonic()
+            if (
+                self.__storage is None
+                or self.__last_probe is None
+                or now - self.__last_probe >= self.__probe_interval
+                or not await self.__verify_devices()
+            ):
+                await self.__probe_devices()
+                self.__last_probe = now
 
         except ConnectionError as err:
             raise Exception(f"Error: {err}") from err
@@ -135,33 +296,90 @@ class RscpClient:
 
         return
 
-    async def send_and_receive(self, rscpValuesToSend: list) -> list:
+    async def send_and_receive(
+        self,
+        rscpValuesToSend: list,
+        priority: int = PRIORITY_POLL,
+        deadline: float | None = None,
+    ) -> list:
         """Sends and receives data to the device.
 
         Packs a list of RscpValues into a frame and send it to the device.
         The answer of the device is returned as list of RscpValues.
         """
-        await self.client.send(RscpFrame().packFrame(rscpValuesToSend))
-        recv_buffer = await self.client.receive()
+        return await self.send_frame_and_receive(
+            RscpFrame().packFrame(rscpValuesToSend), priority, deadline
+        )
 
-        if recv_buffer is None:
-            _LOGGER.warn("recv buffer is None, decryption failure???")
-            return []
+    async def send_frame_and_receive(
+        self,
+        frame: bytes,
+        priority: int = PRIORITY_POLL,
+        deadline: float | None = None,
+    ) -> list:
+        """Sends an already packed frame to the device.
 
-        recvd_frame_length = RscpFrame.getFrameLength(recv_buffer)
+        The answer of the device is returned as list of RscpValues. Concurrent
+        requests are sent one after another by priority, see RscpConnection.exchange.
+        """
+        recv_buffer = await self.client.exchange(frame, priority, deadline)
 
         frame = RscpFrame()
-        if len(recv_buffer) > recvd_frame_length:
-            frame.unpack(recv_buffer[0:recvd_frame_length])
+        # the handlers only read the childs they need
+        frame.unpack(recv_buffer, lazy=True)
 
         return frame.getRscpValues()
 
-    async def send_set_sun_mode_request(self, index: int, value: bool):
-        """Sends a sun mode set request to the storage."""
+    def queue_command(self, request: RscpValue, reply_path: str) -> asyncio.Future:
+        """Queues a request which changes data on the device, e.g. a set request.
+
+        The request is sent in front of the tags of the next fetch_data. The returned
+        future gets the value at reply_path in the reply, see RscpValue.get_tag_by_path.
+        It fails with a RscpCommandError, if the value is missing or an error, and
+        with the exception of fetch_data, if the frame couldn't be exchanged.
+        """
+        future = asyncio.get_running_loop().create_future()
+        self.__commands.append((request, reply_path, future))
+        return future
+
+    def cancel_command(self, future: asyncio.Future) -> None:
+        "Takes a queued command out of the queue, if it has not been sent yet."
+        self.__commands = [x for x in self.__commands if x[2] is not future]
+        future.cancel()
+
+    def queue_set_sun_mode_request(self, index: int, value: bool) -> asyncio.Future:
+        """Queues a sun mode set request, see queue_command."""
 
         wallbox = self._get_wallbox(index)
-        if wallbox is not None:
-            await wallbox.get_sun_mode_request(value, self.send_and_receive)
+        if wallbox is None:
+            raise ValueError(f"Unknown wallbox: {index}")
+        return self.queue_command(
+            wallbox.get_sun_mode_request(value), wallbox.get_sun_mode_reply_path()
+        )
+
+    @staticmethod
+    def __answer_commands(commands: list, received_values: list | None) -> None:
+        for _request, reply_path, future in commands:
+            if future.done():
+                continue
+            # commands and polls of the same container are answered in separate
+            # containers, so the path is searched in each received value
+            reply = None
+            for value in received_values or ():
+                reply = RscpValue.get_tag_by_path([value], reply_path)
+                if reply is not None:
+                    break
+
+            if reply is None:
+                future.set_exception(RscpCommandError(f"No reply for {reply_path}"))
+            elif reply.isError:
+                future.set_exception(
+                    RscpCommandError(
+                        f"Error {reply.getValue()} in reply for {reply_path}"
+                    )
+                )
+            else:
+                future.set_result(reply)
 
     def __get_value_for_path(self, path, rscp_value: RscpValue):
         "Returns the value for the given path, or None if path not found."
@@ -173,24 +391,43 @@ class RscpClient:
     async def fetch_data(self):
         "Creates RSCP frames and send it to the device, to fetch updated data!"
         result_values = {}
+        # cancelled commands are not sent anymore
+        commands = [x for x in self.__commands if not x[2].done()]
+        self.__commands = []
+        request_frame = None
         try:
             if not self.client.is_connected():
                 _LOGGER.info("Not connected, try to reconnect!")
                 await self._connect_and_login()
 
-            requests = await self.__handlerPipeline.collect_tags()
-            # transfer data and wait for response
-            received_values = await self.send_and_receive(requests)
+            request_frame = await self.__handlerPipeline.collect_frame(
+                [request for request, _, _ in commands]
+            )
+            # transfer data and wait for response, commands are sent before the polls
+            # of other callers
+            received_values = await self.send_frame_and_receive(
+                request_frame, PRIORITY_COMMAND if commands else PRIORITY_POLL
+            )
             if received_values is None:
+                self.__handlerPipeline.poll_failed()
                 _LOGGER.warning(
-                    "Received no values from device: %s for tags: %s",
+                    "Received no values from device: %s for request: %s",
                     getattr(self.__storage, "serial", None),
-                    requests,
+                    request_frame.hex(),
                 )
 
+            self.__answer_commands(commands, received_values)
             await self.__handlerPipeline.process(received_values)
 
         except Exception as err:
+            if request_frame is not None:
+                # the groups of the frame are polled again with the next frame
+                self.__handlerPipeline.poll_failed()
+            for _request, _reply_path, future in commands:
+                if not future.done():
+                    future.set_exception(err)
+            if self.__supervisor is not None:
+                self.__supervisor.wake()
             # TODO make Exception more specific
             raise Exception("Error during data fetch: {err}") from err
 
@@ -44,11 +44,18 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
 
     async def async_step_init(self, user_input=None):
         """Manage the options."""
+        errors = {}
         if user_input is not None:
-            return self.async_create_entry(title="", data=user_input)
+            if (
+                user_input["min_update_interval"]
+                <= user_input["update_interval"]
+                <= user_input["max_update_interval"]
+            ):
+                return self.async_create_entry(title="", data=user_input)
+            errors["base"] = "invalid_update_interval"
 
         # Aktuelle Werte aus Optionen oder Fallback auf ursprüngliche Konfiguration
-        current = self.config_entry.options or self.config_entry.data
+        current = user_input or self.config_entry.options or self.config_entry.data
 
         return self.async_show_form(
             step_id="init",
@@ -60,8 +67,17 @@ class OptionsFlowHandler(config_entries.OptionsFlow):
                     vol.Required("password", default=current.get("password", "")): str,
                     vol.Required("key", default=current.get("key", "")): str,
                     vol.Required(
-                        "update_interval", default=current.get("update_interval", "10")
-                    ): int,
+                        "update_interval", default=current.get("update_interval", 10)
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Required(
+                        "min_update_interval",
+                        default=current.get("min_update_interval", 5),
+                    ): vol.All(int, vol.Range(min=1)),
+                    vol.Required(
+                        "max_update_interval",
+                        default=current.get("max_update_interval", 60),
+                    ): vol.All(int, vol.Range(min=1)),
                 }
             ),
+            errors=errors,
         )
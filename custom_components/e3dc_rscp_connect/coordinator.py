@@ -1,18 +1,78 @@
 "This file contains the DataUpdateCoordinator for the e3dc_rscp_connect home assistant integration."
 
+import asyncio
 from datetime import UTC, datetime, timedelta
 import logging
 
 from homeassistant.core import HomeAssistant
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
 
-from .client import RscpClient
+from .client import RscpClient, RscpCommandError
+from .model.AdaptivePollInterval import AdaptivePollInterval
+from .model.RscpHandlerPipeline import POLL_FAST, POLL_NORMAL, POLL_SLOW
 from .model.SgReadyDataModel import SgReadyDataModel
 from .model.StorageDataModel import StorageDataModel
 from .model.WallboxDataModel import WallboxDataModel
 
 _LOGGER = logging.getLogger(__name__)
 
+# periods of the normal and slow poll groups, the fast group is polled with the
+# update interval
+NORMAL_POLL_PERIOD = timedelta(seconds=30)
+SLOW_POLL_PERIOD = timedelta(minutes=5)
+
+# default bounds of the adaptive update interval in seconds
+DEFAULT_MIN_UPDATE_INTERVAL = 5
+DEFAULT_MAX_UPDATE_INTERVAL = 60
+# change of a power in W between two polls, which is handled as transient
+POWER_CHANGE_THRESHOLD = 500
+# seconds to wait for the answer of a command after the refresh
+COMMAND_TIMEOUT = 10
+# seconds the connection may be idle longer than the maximum update interval, before
+# the supervisor probes it, a successful poll already proves that it's alive
+PROBE_INTERVAL_MARGIN = 10
+
+
+def supervisor_probe_interval(
+    maximum: float, margin: float = PROBE_INTERVAL_MARGIN
+) -> float:
+    "Returns the probe interval of the supervisor for the maximum update interval."
+    return maximum + margin
+
+
+def poll_periods(update_interval: timedelta) -> dict[str, int]:
+    "Returns the periods of the poll groups in update cycles."
+    return {
+        POLL_FAST: 1,
+        POLL_NORMAL: max(1, round(NORMAL_POLL_PERIOD / update_interval)),
+        POLL_SLOW: max(1, round(SLOW_POLL_PERIOD / update_interval)),
+    }
+
+
+def update_interval_bounds(options) -> tuple[int, int, int]:
+    """Returns the update interval and its minimum and maximum from the options.
+
+    Entries stored before the options flow checked the bounds may contain invalid
+    bounds, they are replaced by the defaults.
+    """
+    update_interval = max(1, int(options.get("update_interval", 10)))
+    minimum = options.get(
+        "min_update_interval", min(update_interval, DEFAULT_MIN_UPDATE_INTERVAL)
+    )
+    maximum = options.get(
+        "max_update_interval", max(update_interval, DEFAULT_MAX_UPDATE_INTERVAL)
+    )
+    if minimum < 1 or maximum < minimum:
+        _LOGGER.warning(
+            "Invalid update interval bounds %s - %s, using the defaults",
+            minimum,
+            maximum,
+        )
+        minimum = min(update_interval, DEFAULT_MIN_UPDATE_INTERVAL)
+        maximum = max(update_interval, DEFAULT_MAX_UPDATE_INTERVAL)
+    return update_interval, minimum, maximum
+
 
 class E3dcRscpCoordinator(DataUpdateCoordinator):
     "DataUpdateCoordinator for the e3dc_rscp_connect integration."
@@ -40,19 +100,34 @@ class E3dcRscpCoordinator(DataUpdateCoordinator):
         self.__last_device_info_update: datetime | None = None
         self.__device_info_interval = timedelta(minutes=5)
 
-        __update_interval = current.get("update_interval", 10)
+        # the configured update interval is the start value, it adapts to the
+        # changes of the polled data within the configured bounds
+        self.poll_interval = AdaptivePollInterval(
+            *update_interval_bounds(current),
+            default_threshold=POWER_CHANGE_THRESHOLD,
+        )
 
         super().__init__(
             hass,
             _LOGGER,
             name="E3DC RSCP connect client",
-            update_interval=timedelta(seconds=__update_interval),
+            update_interval=timedelta(seconds=self.poll_interval.interval),
         )
 
         self.client = RscpClient(
-            self.host, self.port, self.username, self.password, self.key
+            self.host,
+            self.port,
+            self.username,
+            self.password,
+            self.key,
+            poll_periods=poll_periods(self.update_interval),
         )
 
+    @property
+    def probe_interval(self) -> float:
+        "Probe interval of the connection supervisor, regular polls aren't probed."
+        return supervisor_probe_interval(self.poll_interval.maximum)
+
     def __device_info_need_update(self):
         now = datetime.now(UTC)
         if (
@@ -85,15 +160,62 @@ class E3dcRscpCoordinator(DataUpdateCoordinator):
         "Returns the ident data of a give wallbox."
         return self.client.get_wallbox(index)
 
+    def __poll_snapshot(self) -> dict:
+        "Returns the values which are watched to adapt the update interval."
+        snapshot = {}
+        storage = self.storage
+        if storage is not None:
+            for name, value in vars(storage.powers).items():
+                snapshot[f"power_{name}"] = value
+        for wallbox in self.wallboxes:
+            snapshot[f"wallbox_{wallbox.index}_cp_state"] = wallbox.cp_state
+            snapshot[f"wallbox_{wallbox.index}_sun_mode"] = wallbox.sun_mode
+            snapshot[f"wallbox_{wallbox.index}_power"] = wallbox.assigned_power
+        sg_ready = self.sg_ready
+        if sg_ready is not None:
+            snapshot["sg_ready_state"] = sg_ready.state
+        return snapshot
+
+    def __adapt_update_interval(self):
+        interval = timedelta(seconds=self.poll_interval.update(self.__poll_snapshot()))
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "Update interval changed to %s, change: %.2f",
+                interval,
+                self.poll_interval.change,
+            )
+            self.update_interval = interval
+            self.client.set_poll_periods(poll_periods(interval))
+
     async def _async_update_data(self):
         try:
             if self.__device_info_need_update():
                 await self.__update_device_info()
-            return await self.client.fetch_data()
+            data = await self.client.fetch_data()
         except Exception as err:
             _LOGGER.exception("Exception in update_data:")
             raise UpdateFailed(f"Fehler beim Abrufen: {err}") from err
 
+        self.__adapt_update_interval()
+        return data
+
     async def set_sun_mode(self, wallbox_id: int, value: bool):
-        "Uses the client implementation to change the sun mode."
-        await self.client.send_set_sun_mode_request(wallbox_id, value)
+        """Changes the sun mode with the request of an immediate refresh.
+
+        The request is sent with the tags of the refresh in one frame, it returns
+        after the device has answered. If the command isn't answered, it is taken out
+        of the queue and a HomeAssistantError is raised.
+        """
+        command = self.client.queue_set_sun_mode_request(wallbox_id, value)
+        try:
+            await self.async_refresh()
+            if not command.done() and not self.last_update_success:
+                raise RscpCommandError("Refresh failed before the command was sent")
+            async with asyncio.timeout(COMMAND_TIMEOUT):
+                await command
+        except Exception as err:
+            raise HomeAssistantError(
+                f"Couldn't set sun mode of wallbox {wallbox_id}: {err}"
+            ) from err
+        finally:
+            self.client.cancel_command(command)
@@ -2,8 +2,17 @@ import asyncio
 import logging
 import socket
 
+from .RscpCryptoWorker import RscpCryptoStats, RscpCryptoWorker
 from .RscpEncryption import RscpEncryption
 from .RscpFrame import RscpFrame
+from .RscpFrameReader import RscpFrameReader
+from .RscpRequestScheduler import (
+    PRIORITY_BULK,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    RscpRequestScheduler,
+)
+from .RscpTransport import RscpSocketTransport, RscpTransport
 from .RscpValue import RscpValue
 
 log = logging.getLogger(__name__)
@@ -14,6 +23,16 @@ class RscpConnectionException(Exception):
 
 
 class RscpConnection:
+    """Connection to a device.
+
+    The bytes are transferred by transport, which defaults to a RscpSocketTransport.
+    timeout (in seconds) is used to connect and as deadline to send a frame or to
+    receive a complete frame. Data of at least crypto_offload_threshold bytes is
+    encrypted and decrypted in an executor instead of on the event loop.
+
+    Requests are exchanged with exchange, which serializes them by priority.
+    """
+
     def __init__(
         self,
         host,
@@ -21,6 +40,9 @@ class RscpConnection:
         ciphersuite: RscpEncryption = None,
         username=None,
         password=None,
+        transport: RscpTransport | None = None,
+        timeout: float = 5,
+        crypto_offload_threshold: int = 4096,
     ):
         self.__host = host
         self.__port = port
@@ -28,7 +50,38 @@ class RscpConnection:
         self.__username = username
         self.__password = password
         self.__auth_level = 0
-        self.__clientsock = None
+        self.__transport = transport or RscpSocketTransport()
+        self.__timeout = timeout
+        self.__reader = RscpFrameReader(ciphersuite)
+        self.__crypto = None
+        if ciphersuite:
+            self.__crypto = RscpCryptoWorker(ciphersuite, crypto_offload_threshold)
+        self.__send_lock = asyncio.Lock()
+        self.__scheduler = RscpRequestScheduler()
+        # event loop time of the last received frame
+        self.__last_receive = 0.0
+
+    @property
+    def transport(self) -> RscpTransport:
+        "The transport used by this connection."
+        return self.__transport
+
+    @property
+    def idle_time(self) -> float:
+        "Seconds since the last frame was received or the connection was established."
+        return asyncio.get_running_loop().time() - self.__last_receive
+
+    @property
+    def scheduler(self) -> RscpRequestScheduler:
+        "The scheduler of the requests of this connection."
+        return self.__scheduler
+
+    @property
+    def crypto_stats(self) -> RscpCryptoStats | None:
+        "Statistics of the encryption, None for an unencrypted connection."
+        if self.__crypto is None:
+            return None
+        return self.__crypto.stats
 
     async def connect(self):
         if self.is_connected():
@@ -38,49 +91,46 @@ class RscpConnection:
         self.__auth_level = 0
 
         log.debug(f"connecting to device: {self.__host} on port {self.__port}")
-        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        client_socket.setblocking(False)
-
-        loop = asyncio.get_running_loop()
 
         try:
             await asyncio.wait_for(
-                loop.sock_connect(client_socket, (self.__host, self.__port)), timeout=5
+                self.__transport.open(self.__host, self.__port), timeout=self.__timeout
             )
         except TimeoutError as e:
             log.info("Connection timed out")
-            client_socket.close()
+            self.__transport.close()
             raise RscpConnectionException(str(e)) from e
         except OSError as e:
             log.info(f"Error while connecting to device {self.__host}: {str(e)}")
-            client_socket.close()
+            self.__transport.close()
             raise RscpConnectionException(str(e)) from e
 
-        self.__clientsock = client_socket
         log.info("Connection established")
+        self.__last_receive = asyncio.get_running_loop().time()
 
-        if self.__ciphersuite:
-            self.__ciphersuite.reset()
+        if self.__crypto:
+            await self.__crypto.reset()
+        self.__reader.reset()
 
         return True
 
     def is_connected(self):
-        if self.__clientsock is not None:
-            return True
-        return False
+        return self.__transport.is_open()
 
     def disconnect(self):
-        if self.__clientsock is not None:
-            self.__clientsock.close()
-            self.__clientsock = None
+        if self.__transport.is_open():
+            self.__transport.close()
             self.__auth_level = 0
+            self.__reader.reset()
             log.info("Connection closed")
 
     async def send(self, buffer):
-        if self.__ciphersuite:
-            buffer = self.__ciphersuite.encrypt(buffer)
+        # frames have to be sent in the order they were encrypted
+        async with self.__send_lock:
+            if self.__crypto:
+                buffer = await self.__crypto.encrypt(buffer)
 
-        return await self._send(buffer)
+            return await self._send(buffer)
 
     async def _send(self, buffer):
         if not self.is_connected():
@@ -88,8 +138,9 @@ class RscpConnection:
             return False
         try:
             log.debug(f"sending {len(buffer)} bytes of data")
-            loop = asyncio.get_running_loop()
-            await loop.sock_sendall(self.__clientsock, buffer)
+            await asyncio.wait_for(
+                self.__transport.write(buffer), timeout=self.__timeout
+            )
             log.debug(f"sending done")
             return True
         except (TimeoutError, BrokenPipeError, ConnectionResetError, OSError) as e:
@@ -102,29 +153,55 @@ class RscpConnection:
             log.error(f"Error while sending data to device {self.__host}: {str(e)}")
             raise RscpConnectionException(str(e))
 
-    async def receive(self, timeout=1000):
-        _buffer = await self._receive(timeout)
+    async def receive(self, timeout: float | None = None):
+        """Receives exactly one frame.
 
-        buffer = _buffer
+        Data is read from the transport until a complete frame has been received. Data
+        which belongs to the next frame is kept for the next call. If the frame is not
+        complete within timeout seconds (default: the timeout of the connection), the
+        connection is closed, because the rest of the frame would be received later.
+        """
+        if timeout is None:
+            timeout = self.__timeout
 
-        if self.__ciphersuite:
-            buffer = self.__ciphersuite.decrypt(_buffer)
-            if buffer is None:
-                log.warning(
-                    "[%s] Decryption failed: len(buffer) == %d",
-                    self.__host,
-                    len(_buffer),
-                )
+        try:
+            async with asyncio.timeout(timeout):
+                return await self.__receive_frame()
+        except TimeoutError as e:
+            log.error(f"Timeout while receiving data from device {self.__host}")
+            self.disconnect()
+            raise RscpConnectionException("Timeout while receiving a frame!") from e
 
-        return buffer
+    async def __receive_frame(self):
+        while True:
+            try:
+                frame = self.__reader.next_frame()
+            except ValueError as e:
+                log.error(f"Invalid data received from device {self.__host}: {str(e)}")
+                self.disconnect()
+                raise RscpConnectionException(str(e)) from e
+
+            if frame is not None:
+                self.__last_receive = asyncio.get_running_loop().time()
+                return frame
+
+            data = await self._receive()
+            if self.__crypto is None:
+                self.__reader.feed_plaintext(data)
+                continue
+
+            blocks = self.__reader.collect_blocks(data)
+            if blocks:
+                self.__reader.feed_plaintext(await self.__crypto.decrypt(blocks))
 
-    async def _receive(self, timeout):
+    async def _receive(self):
+        if not self.is_connected():
+            log.info(f"You cannot receive data from a closed socket! ({self.__host})")
+            raise RscpConnectionException("Not connected!")
         try:
             log.debug(f"start data receiption")
-            loop = asyncio.get_running_loop()
-            buffer = await loop.sock_recv(self.__clientsock, 4096)
+            buffer = await self.__transport.read()
             log.debug(f"received {len(buffer)} bytes of data")
-            return buffer
         except (TimeoutError, BrokenPipeError, ConnectionResetError, OSError) as e:
             log.error(f"Error while sending data to device {self.__host}: {str(e)}")
             self.disconnect()
@@ -135,6 +212,84 @@ class RscpConnection:
             log.error(f"Error while receiving data from device {self.__host}: {str(e)}")
             raise RscpConnectionException(str(e))
 
+        if not buffer:
+            log.info(f"Connection closed by device {self.__host}")
+            self.disconnect()
+            raise RscpConnectionException("Peer disconnected, perpare reconnect!")
+        return buffer
+
+    async def exchange(
+        self,
+        frame: bytes,
+        priority: int = PRIORITY_POLL,
+        deadline: float | None = None,
+    ) -> bytes:
+        """Sends a request frame and returns the reply frame.
+
+        Only one request is exchanged at a time, waiting requests are served by
+        priority, see RscpRequestScheduler. deadline is a time of the event loop, a
+        request which waits until its deadline fails without touching the connection.
+        If the deadline is reached while the reply is received, or the request is
+        cancelled after it was sent, the connection is closed, because the reply
+        would be received by the next request.
+        """
+        try:
+            await self.__scheduler.acquire(priority, deadline)
+        except TimeoutError as e:
+            raise RscpConnectionException(
+                "Deadline exceeded while waiting for the connection!"
+            ) from e
+
+        try:
+            timeout = self.__timeout
+            if deadline is not None:
+                remaining = deadline - asyncio.get_running_loop().time()
+                if remaining <= 0:
+                    raise RscpConnectionException("Deadline exceeded before sending!")
+                timeout = min(timeout, remaining)
+            await self.send(frame)
+            return await self.receive(timeout)
+        except asyncio.CancelledError:
+            self.disconnect()
+            raise
+        finally:
+            self.__scheduler.release()
+
+    async def probe(self, timeout: float = 3) -> bool:
+        """Checks with a request of the user level, that the device answers.
+
+        Returns False, if the connection is not authorized anymore or the device didn't
+        answer within timeout seconds. The connection is closed in both cases.
+        """
+        if not self.is_connected():
+            return False
+        if self.__scheduler.busy or self.__scheduler.waiting:
+            # the running request checks the connection with its own timeout
+            return True
+
+        request = RscpFrame().packFrame(
+            [RscpValue().withTagName("TAG_RSCP_REQ_USER_LEVEL", None)]
+        )
+        try:
+            reply = await self.exchange(
+                request,
+                PRIORITY_BULK,
+                asyncio.get_running_loop().time() + timeout,
+            )
+        except RscpConnectionException as e:
+            log.warning(f"No answer to probe from device {self.__host}: {str(e)}")
+            self.disconnect()
+            return False
+
+        frame = RscpFrame()
+        frame.unpack(reply)
+        level = RscpValue.get_tag_by_path(frame.getRscpValues(), "TAG_RSCP_USER_LEVEL")
+        if level is None or level.isError or level.getValue() <= 0:
+            log.warning(f"Device {self.__host} does not accept the login anymore")
+            self.disconnect()
+            return False
+        return True
+
     async def authorize(self, username=None, password=None):
         if username:
             self.__username = username
@@ -152,8 +307,9 @@ class RscpConnection:
             "TAG_RSCP_REQ_AUTHENTICATION", [auth_user, auth_pw]
         )
 
-        await self.send(RscpFrame().packFrame(auth_container))
-        responseData = await self.receive()
+        responseData = await self.exchange(
+            RscpFrame().packFrame(auth_container), PRIORITY_COMMAND
+        )
         responseFrame = RscpFrame()
         responseFrame.unpack(responseData)
 
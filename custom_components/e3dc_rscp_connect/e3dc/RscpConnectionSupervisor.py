@@ -0,0 +1,135 @@
+import asyncio
+import logging
+
+from .RscpConnection import RscpConnection, RscpConnectionException
+
+log = logging.getLogger(__name__)
+
+
+class RscpConnectionSupervisor:
+    """Keeps a RscpConnection connected and authorized in the background.
+
+    A closed connection is connected and authorized again within connect_timeout
+    seconds, failed attempts are repeated with an exponential backoff from
+    min_backoff up to max_backoff seconds.
+    An open connection which was idle for probe_interval seconds is probed, a device
+    which does not answer a probe within probe_timeout seconds is disconnected.
+    """
+
+    def __init__(
+        self,
+        connection: RscpConnection,
+        probe_interval: float = 10,
+        probe_timeout: float = 3,
+        min_backoff: float = 1,
+        max_backoff: float = 60,
+        connect_timeout: float = 5,
+    ):
+        self.__connection = connection
+        self.probe_interval = probe_interval
+        self.probe_timeout = probe_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.connect_timeout = connect_timeout
+        self.__task: asyncio.Task | None = None
+        self.__wakeup = asyncio.Event()
+        self.__connected = asyncio.Event()
+        # statistics
+        self.reconnects = 0
+        self.failed_attempts = 0
+        self.probes = 0
+        self.failed_probes = 0
+
+    @property
+    def running(self) -> bool:
+        "True while the supervision runs."
+        return self.__task is not None and not self.__task.done()
+
+    def is_ready(self) -> bool:
+        "True if the connection is connected and authorized."
+        return self.__connection.is_connected() and self.__connection.is_authorized()
+
+    def start(self) -> None:
+        "Starts the supervision in a background task."
+        if not self.running:
+            self.__task = asyncio.create_task(self.__run())
+
+    async def stop(self) -> None:
+        "Stops the supervision, the connection stays as it is."
+        if self.__task is None:
+            return
+        self.__task.cancel()
+        try:
+            await self.__task
+        except asyncio.CancelledError:
+            pass
+        self.__task = None
+
+    def wake(self) -> None:
+        "Checks the connection at once, e.g. after a request failed."
+        self.__wakeup.set()
+
+    async def wait_ready(self, timeout: float | None = None) -> bool:
+        "Waits until the connection is ready, returns False if timeout elapsed before."
+        if self.is_ready():
+            return True
+        self.wake()
+        try:
+            async with asyncio.timeout(timeout):
+                while not self.is_ready():
+                    self.__connected.clear()
+                    await self.__connected.wait()
+        except TimeoutError:
+            return False
+        return True
+
+    async def __run(self) -> None:
+        backoff = self.min_backoff
+        connected_before = self.is_ready()
+        while True:
+            if not self.is_ready():
+                if await self.__reconnect():
+                    if connected_before:
+                        self.reconnects += 1
+                    connected_before = True
+                    backoff = self.min_backoff
+                    self.__connected.set()
+                else:
+                    self.failed_attempts += 1
+                    log.info("Reconnect failed, next attempt in %.1f s", backoff)
+                    await self.__sleep(backoff)
+                    backoff = min(backoff * 2, self.max_backoff)
+                continue
+
+            await self.__sleep(self.probe_interval - self.__connection.idle_time)
+            if self.is_ready() and self.__connection.idle_time >= self.probe_interval:
+                self.probes += 1
+                if not await self.__connection.probe(self.probe_timeout):
+                    self.failed_probes += 1
+
+    async def __reconnect(self) -> bool:
+        connection = self.__connection
+        try:
+            async with asyncio.timeout(self.connect_timeout):
+                if not connection.is_connected():
+                    await connection.connect()
+                if not connection.is_authorized() and not await connection.authorize():
+                    log.error("Couldn't authorize! Check username and password!")
+                    connection.disconnect()
+                    return False
+        except (RscpConnectionException, OSError) as e:
+            log.info(f"Reconnect failed: {str(e)}")
+            connection.disconnect()
+            return False
+        return True
+
+    async def __sleep(self, seconds: float) -> None:
+        "Sleeps for seconds or until wake is called."
+        try:
+            async with asyncio.timeout(max(0, seconds)):
+                await self.__wakeup.wait()
+            # only a received wake is consumed, a wake after a timeout ends the
+            # next sleep
+            self.__wakeup.clear()
+        except TimeoutError:
+            pass
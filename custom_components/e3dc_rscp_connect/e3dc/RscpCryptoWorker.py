@@ -0,0 +1,95 @@
+import asyncio
+from dataclasses import dataclass
+import logging
+import time
+
+from .RscpEncryption import RscpEncryption
+
+log = logging.getLogger(__name__)
+
+
+@dataclass
+class RscpCryptoStats:
+    "Time and data spent on encryption and decryption by one connection."
+
+    encrypted_bytes: int = 0
+    decrypted_bytes: int = 0
+    calls: int = 0
+    offloaded_calls: int = 0
+    # time the event loop was blocked by encryption and decryption
+    loop_seconds: float = 0.0
+    # time spent in the executor for offloaded data
+    executor_seconds: float = 0.0
+
+
+class RscpCryptoWorker:
+    """Runs the encryption of a connection on the event loop or in an executor.
+
+    Data of at least offload_threshold bytes is encrypted or decrypted in the default
+    executor of the event loop, smaller data directly on the event loop. Each direction
+    runs one operation at a time and in call order, because every message continues the
+    CBC chain of the previous one. A cancelled offloaded operation keeps its direction
+    locked until the executor is done with it.
+    """
+
+    def __init__(self, ciphersuite: RscpEncryption, offload_threshold: int = 4096):
+        self.__ciphersuite = ciphersuite
+        self.__offload_threshold = offload_threshold
+        self.__encrypt_lock = asyncio.Lock()
+        self.__decrypt_lock = asyncio.Lock()
+        self.__stats = RscpCryptoStats()
+
+    @property
+    def stats(self) -> RscpCryptoStats:
+        "The collected statistics."
+        return self.__stats
+
+    @property
+    def offload_threshold(self) -> int:
+        "Data of at least this size is processed in the executor."
+        return self.__offload_threshold
+
+    async def encrypt(self, plaintext: bytes) -> bytes:
+        async with self.__encrypt_lock:
+            ciphertext = await self.__run(self.__ciphersuite.encrypt, plaintext)
+        self.__stats.encrypted_bytes += len(plaintext)
+        return ciphertext
+
+    async def decrypt(self, ciphertext: bytes) -> bytes:
+        async with self.__decrypt_lock:
+            plaintext = await self.__run(self.__ciphersuite.decrypt, ciphertext)
+        self.__stats.decrypted_bytes += len(ciphertext)
+        return plaintext
+
+    async def reset(self):
+        "Resets the ciphersuite once no operation is running."
+        async with self.__encrypt_lock, self.__decrypt_lock:
+            self.__ciphersuite.reset()
+
+    async def __run(self, operation, data: bytes) -> bytes:
+        self.__stats.calls += 1
+        if len(data) < self.__offload_threshold:
+            start = time.perf_counter()
+            result = operation(data)
+            self.__stats.loop_seconds += time.perf_counter() - start
+            return result
+
+        log.debug("processing %d bytes in the executor", len(data))
+        self.__stats.offloaded_calls += 1
+        future = asyncio.get_running_loop().run_in_executor(
+            None, _timed, operation, data
+        )
+        try:
+            result, seconds = await asyncio.shield(future)
+        except asyncio.CancelledError:
+            # the executor cannot be interrupted, the next operation must wait for it
+            await asyncio.wait([future])
+            raise
+        self.__stats.executor_seconds += seconds
+        return result
+
+
+def _timed(operation, data: bytes) -> tuple[bytes, float]:
+    start = time.perf_counter()
+    result = operation(data)
+    return result, time.perf_counter() - start
@@ -1,6 +1,8 @@
 import py3rijndael
 import logging
 
+from .RscpRijndael import Rijndael256Cbc
+
 logger = logging.getLogger(__name__)
 
 
@@ -13,18 +15,41 @@ class NoPadding(py3rijndael.ZeroPadding):
 
 
 class RscpEncryption:
+    """Encryption of the RSCP data stream.
+
+    backend selects the cipher implementation: "rijndael256" expands the key once and
+    keeps the CBC state in a Rijndael256Cbc, "py3rijndael" creates a new
+    py3rijndael.RijndaelCbc for every message.
+    """
+
     KEY_SIZE = 32
     BLOCK_SIZE = 32
+    BACKENDS = ("rijndael256", "py3rijndael")
 
-    def __init__(self, key):
+    def __init__(self, key, backend: str = "rijndael256"):
         if len(key) > RscpEncryption.KEY_SIZE:
-            log.error(f"Key must be smaller keysize ({RscpEncryption.KEY_SIZE})")
+            logger.error(f"Key must be smaller keysize ({RscpEncryption.KEY_SIZE})")
             raise ValueError(f"Key must be smaller keysize ({RscpEncryption.KEY_SIZE})")
+        if backend not in RscpEncryption.BACKENDS:
+            raise ValueError(f"Unknown encryption backend: {backend}")
 
         self.__key = key.encode() + b"\xff" * (RscpEncryption.KEY_SIZE - len(key))
+        self.__cipher = None
+        if backend == "rijndael256":
+            self.__cipher = Rijndael256Cbc(
+                self.__key, b"\xff" * RscpEncryption.BLOCK_SIZE
+            )
         self.reset()
 
+    @property
+    def backend(self) -> str:
+        "The name of the used cipher implementation."
+        return "py3rijndael" if self.__cipher is None else "rijndael256"
+
     def encrypt(self, plaintext: bytes) -> bytes:
+        if self.__cipher is not None:
+            return self.__cipher.encrypt(plaintext)
+
         cipher = py3rijndael.RijndaelCbc(
             self.__key,
             self.__encryptionIV,
@@ -37,13 +62,18 @@ class RscpEncryption:
         return ciphertext
 
     def decrypt(self, ciphertext: bytes) -> bytes:
-        logger.debug(f"ciphertext: {ciphertext}")
+        logger.debug("ciphertext: %s", ciphertext)
         # if ciphertext length is not multiple of BLOCK_SIZE we cannot decrypt
         if len(ciphertext) % RscpEncryption.BLOCK_SIZE != 0:
             # TODO: do not simple discard the decryption here! Try to decrypt a part of the blokc if
             # len(ciphertext) > block size or try to receive some more data!
             return None
 
+        if self.__cipher is not None:
+            plaintext = self.__cipher.decrypt(ciphertext)
+            logger.debug("Plaintext (%d bytes): %s", len(plaintext), plaintext)
+            return plaintext
+
         cipher = py3rijndael.RijndaelCbc(
             self.__key,
             self.__decryptionIV,
@@ -51,7 +81,7 @@ class RscpEncryption:
             block_size=RscpEncryption.BLOCK_SIZE,
         )
         plaintext = cipher.decrypt(ciphertext)
-        logger.debug(f"Plaintext ({len(plaintext)} bytes): {plaintext}")
+        logger.debug("Plaintext (%d bytes): %s", len(plaintext), plaintext)
         self.__decryptionIV = ciphertext[(RscpEncryption.BLOCK_SIZE * -1) :]
         return plaintext
 
@@ -59,3 +89,5 @@ class RscpEncryption:
         logger.debug("set IV vectors")
         self.__encryptionIV = b"\xff" * RscpEncryption.BLOCK_SIZE
         self.__decryptionIV = b"\xff" * RscpEncryption.BLOCK_SIZE
+        if self.__cipher is not None:
+            self.__cipher.reset(self.__encryptionIV)
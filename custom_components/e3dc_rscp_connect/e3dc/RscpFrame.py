@@ -4,7 +4,6 @@ import time
 
 from .RscpValue import RscpValue
 
-
 log = logging.getLogger(__name__)
 
 
@@ -14,6 +13,9 @@ class RscpFrame:
     """
 
     frame_header_fmt = f"<HHQIH"
+    frame_header = struct.Struct(frame_header_fmt)
+    # seconds and nanoseconds inside the header, starting at offset 4
+    frame_time = struct.Struct("<QI")
 
     def __init__(self):
         log.debug("created frame")
@@ -28,44 +30,76 @@ class RscpFrame:
         """returns the length of the frame, including header and data
         The function reads the data_length field from the buffer and calculates the frame length.
         """
-        frame_header_size = struct.calcsize(RscpFrame.frame_header_fmt)
+        frame_header_size = RscpFrame.frame_header.size
         if len(buffer) < frame_header_size:
             raise ValueError("buffer is to small to calculate header size!")
 
-        magic, ctrl, time_seconds, time_nanoseconds, data_length = struct.unpack(
-            RscpFrame.frame_header_fmt, buffer[0:frame_header_size]
+        magic, ctrl, time_seconds, time_nanoseconds, data_length = (
+            RscpFrame.frame_header.unpack_from(buffer)
         )
 
         return frame_header_size + data_length
 
     def packFrame(self, values):
-        if isinstance(values, list):
-            # raise NotImplementedError("list support not finished")
-            value_data = b""
-            for value in values:
-                data = value.pack()
-                value_data += data
+        """packs the values into a frame.
+
+        The frame header and all values are written into a single buffer, the data length
+        of the frame is patched into the header at the end.
+        """
+        if isinstance(values, RscpValue):
+            values = [values]
+
+        buffer = bytearray(RscpFrame.frame_header.size)
+        for value in values:
+            value.pack_into(buffer)
+
+        RscpFrame.__packHeader(buffer)
+        return bytes(buffer)
 
-            value_data_length = len(value_data)
+    @classmethod
+    def packFrameData(self, data: bytes) -> bytearray:
+        """packs already packed values into a frame.
 
-        elif isinstance(values, RscpValue):
-            value_data = values.pack()
-            value_data_length = len(value_data)
+        The returned buffer can be reused for further requests with the same data,
+        only updateFrameTime needs to be called before sending it again.
+        """
+        buffer = bytearray(RscpFrame.frame_header.size)
+        buffer += data
+        RscpFrame.__packHeader(buffer)
+        return buffer
 
-        frame_fmt = f"<HHQIH{value_data_length}s"
-        data = 0xDCE3, 0x0100, int(time.time()), 0, value_data_length, value_data
+    @classmethod
+    def updateFrameTime(self, buffer: bytearray) -> None:
+        """sets the time in the header of a packed frame to now."""
+        RscpFrame.frame_time.pack_into(buffer, 4, int(time.time()), 0)
+
+    @staticmethod
+    def __packHeader(buffer: bytearray) -> None:
+        RscpFrame.frame_header.pack_into(
+            buffer,
+            0,
+            0xDCE3,
+            0x0100,
+            int(time.time()),
+            0,
+            len(buffer) - RscpFrame.frame_header.size,
+        )
 
-        return struct.pack(frame_fmt, *data)
+    def unpack(self, buffer, lazy: bool = False):
+        """unpacks a frame from a bytes-like buffer.
 
-    def unpack(self, buffer):
-        frame_header_size = struct.calcsize(RscpFrame.frame_header_fmt)
+        The values are decoded from a single memoryview on the buffer, so the frame data is
+        never copied while walking through the values and containers. If lazy is set,
+        the childs of containers are decoded when they are accessed.
+        """
+        frame_header_size = RscpFrame.frame_header.size
         if len(buffer) < frame_header_size:
             raise ValueError(
                 f"received buffer size ({len(buffer)}) is to small for calculate header size {frame_header_size}!"
             )
 
-        magic, ctrl, time_seconds, time_nanoseconds, data_length = struct.unpack(
-            RscpFrame.frame_header_fmt, buffer[0:frame_header_size]
+        magic, ctrl, time_seconds, time_nanoseconds, data_length = (
+            RscpFrame.frame_header.unpack_from(buffer)
         )
 
         if magic != 0xDCE3:
@@ -79,15 +113,14 @@ class RscpFrame:
         if len(buffer) > total_frame_size:
             log.info("buffer to big, cut of rest")
 
-        buffer_rest = buffer[total_frame_size:]
-        buffer = buffer[:total_frame_size]
+        buffer = memoryview(buffer)[:total_frame_size]
 
         log.debug(f"RscpFrame data length: {data_length}")
         data_position = frame_header_size
 
         values = []
-        while data_position < len(buffer):
-            value = RscpValue().withBuffer(buffer[data_position:])
+        while data_position < total_frame_size:
+            value = RscpValue().withBuffer(buffer, data_position, lazy)
             values.append(value)
             data_position += value.getPackedDataSize()
 
@@ -0,0 +1,84 @@
+import logging
+
+from .RscpEncryption import RscpEncryption
+from .RscpFrame import RscpFrame
+
+log = logging.getLogger(__name__)
+
+
+class RscpFrameReader:
+    """Reassembles complete frames from the received data stream.
+
+    Received data can be fed in chunks of any size. Encrypted data is collected until
+    whole cipher blocks are available, which are decrypted right away. Every encrypted
+    frame is padded with zeros up to the block size, the padding is dropped after the
+    frame has been taken. Data of the next frame stays in the reader.
+    """
+
+    def __init__(self, ciphersuite: RscpEncryption | None = None):
+        self.__ciphersuite = ciphersuite
+        self.__ciphertext = bytearray()
+        self.__plaintext = bytearray()
+
+    def reset(self):
+        "Drops all received data, e.g. after a reconnect."
+        self.__ciphertext.clear()
+        self.__plaintext.clear()
+
+    def feed(self, data: bytes) -> None:
+        "Adds received data to the reader, complete cipher blocks are decrypted."
+        if self.__ciphersuite is None:
+            self.feed_plaintext(data)
+            return
+
+        blocks = self.collect_blocks(data)
+        if blocks:
+            self.feed_plaintext(self.__ciphersuite.decrypt(blocks))
+
+    def collect_blocks(self, data: bytes) -> bytes:
+        """Adds received ciphertext and takes all complete cipher blocks.
+
+        The returned blocks have to be decrypted by the caller and passed to
+        feed_plaintext in the same order.
+        """
+        self.__ciphertext += data
+        complete = len(self.__ciphertext)
+        complete -= complete % RscpEncryption.BLOCK_SIZE
+        if complete == 0:
+            return b""
+
+        blocks = bytes(self.__ciphertext[:complete])
+        del self.__ciphertext[:complete]
+        return blocks
+
+    def feed_plaintext(self, data: bytes) -> None:
+        "Adds received or decrypted plaintext to the reader."
+        self.__plaintext += data
+
+    def next_frame(self) -> bytes | None:
+        """Returns the next complete frame, or None if more data is needed.
+
+        Raises a ValueError if the received data is not a frame.
+        """
+        buffer = self.__plaintext
+        if len(buffer) < RscpFrame.frame_header.size:
+            return None
+
+        magic = RscpFrame.frame_header.unpack_from(buffer)[0]
+        if magic != 0xDCE3:
+            raise ValueError(f"received data is not a valid frame (magic: {magic:04X})")
+
+        frame_length = RscpFrame.getFrameLength(buffer)
+        if len(buffer) < frame_length:
+            log.debug("frame incomplete: %d of %d bytes", len(buffer), frame_length)
+            return None
+
+        frame = bytes(buffer[:frame_length])
+
+        consumed = frame_length
+        if self.__ciphersuite is not None:
+            # skip the zero padding of the last cipher block
+            consumed += -frame_length % RscpEncryption.BLOCK_SIZE
+        del buffer[:consumed]
+
+        return frame
@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import functools
+import re
+from typing import TYPE_CHECKING, Iterable
+
+from . import RscpTags
+
+if TYPE_CHECKING:
+    from .RscpValue import RscpValue
+
+_SEGMENT = re.compile(r"\s*([^()=\s]+)\s*(?:\(\s*([^()=\s]+)\s*==\s*(.*?)\s*\))?\s*")
+
+
+def _tag_code(name: str, path: str) -> int:
+    tag = RscpTags.getTagByName(name)
+    if tag is None:
+        raise ValueError(f"Unknown tag {name} in path {path}")
+    return tag[1]["tagvalue"]
+
+
+def _parse_literal(text: str):
+    "Converts the filter value of a path to int, float or bool, other values stay str."
+    for convert in (int, float):
+        try:
+            return convert(text)
+        except ValueError:
+            pass
+    if text in ("True", "False"):
+        return text == "True"
+    return text
+
+
+class _Segment:
+    "One segment of a path, a tag with an optional filter on the value of a child."
+
+    __slots__ = ("tag_code", "filter_code", "filter_text", "filter_value")
+
+    def __init__(self, segment: str, path: str):
+        match = _SEGMENT.fullmatch(segment)
+        if match is None:
+            raise ValueError(f"Invalid segment {segment!r} in path {path}")
+        tag_name, filter_name, filter_text = match.groups()
+
+        self.tag_code = _tag_code(tag_name, path)
+        self.filter_code = None
+        self.filter_text = filter_text
+        self.filter_value = None
+        if filter_name is not None:
+            self.filter_code = _tag_code(filter_name, path)
+            self.filter_value = _parse_literal(filter_text)
+
+    def select(self, candidates: Iterable[RscpValue]) -> RscpValue | None:
+        "Returns the first candidate which matches the filter, the candidates have the tag already."
+        filter_code = self.filter_code
+        for candidate in candidates:
+            if filter_code is None:
+                return candidate
+            for child in candidate.get_childs(filter_code):
+                value = child.getValue()
+                if value.__class__ is str:
+                    if value == self.filter_text:
+                        return candidate
+                elif value == self.filter_value:
+                    return candidate
+        return None
+
+
+class RscpPathQuery:
+    """A compiled path to a RscpValue, see RscpValue.get_tag_by_path for the format.
+
+    The path is parsed once, the tags are resolved to tag codes and the filter values
+    are converted to their type. A query compares only tag codes and the values of the
+    filter tags, only the childs of the containers on the path are decoded.
+    """
+
+    __slots__ = ("path", "__segments")
+
+    def __init__(self, path: str):
+        "Compiles path, raises a ValueError if the path is invalid or contains unknown tags."
+        self.path = path
+        self.__segments = tuple(_Segment(x, path) for x in path.split("/"))
+
+    def find(self, values: Iterable[RscpValue]) -> RscpValue | None:
+        "Returns the value at the path in values, or None if it is not found."
+        segments = self.__segments
+        tag_code = segments[0].tag_code
+        found = segments[0].select(x for x in values if x.getTagCode() == tag_code)
+
+        for segment in segments[1:]:
+            if found is None:
+                return None
+            found = segment.select(found.get_childs(segment.tag_code))
+        return found
+
+
+@functools.lru_cache(maxsize=1024)
+def compile_path(path: str) -> RscpPathQuery:
+    "Returns the compiled query for path, queries are cached by path."
+    return RscpPathQuery(path)
@@ -0,0 +1,77 @@
+import asyncio
+import contextlib
+import heapq
+import itertools
+
+# priorities of requests, lower values are served first
+PRIORITY_COMMAND = 0
+PRIORITY_POLL = 1
+PRIORITY_BULK = 2
+
+
+class RscpRequestScheduler:
+    """Grants the turns to exchange frames on a connection, one request at a time.
+
+    Waiting requests get their turn by priority and in the order of their arrival
+    within a priority. A request which is cancelled or reaches its deadline while it
+    waits leaves the queue. A running request is not interrupted by a request of a
+    higher priority.
+    """
+
+    def __init__(self):
+        self.__busy = False
+        # (priority, arrival, future) of the waiting requests
+        self.__waiting = []
+        self.__arrivals = itertools.count()
+
+    @property
+    def busy(self) -> bool:
+        "True while a request has the turn."
+        return self.__busy
+
+    @property
+    def waiting(self) -> int:
+        "Number of requests waiting for their turn."
+        return sum(1 for _, _, future in self.__waiting if not future.done())
+
+    async def acquire(
+        self, priority: int = PRIORITY_POLL, deadline: float | None = None
+    ) -> None:
+        """Waits for the turn of a request, deadline is a time of the event loop.
+
+        Raises a TimeoutError if the turn isn't granted before deadline.
+        """
+        if not self.__busy and not self.waiting:
+            self.__busy = True
+            return
+
+        future = asyncio.get_running_loop().create_future()
+        heapq.heappush(self.__waiting, (priority, next(self.__arrivals), future))
+        try:
+            async with asyncio.timeout_at(deadline):
+                await future
+        except BaseException:
+            if future.done() and not future.cancelled():
+                # the turn was granted in the meantime, pass it on
+                self.release()
+            else:
+                future.cancel()
+            raise
+
+    def release(self) -> None:
+        "Ends the turn of the current request and grants the turn to the next one."
+        while self.__waiting:
+            _, _, future = heapq.heappop(self.__waiting)
+            if not future.done():
+                future.set_result(None)
+                return
+        self.__busy = False
+
+    @contextlib.asynccontextmanager
+    async def turn(self, priority: int = PRIORITY_POLL, deadline: float | None = None):
+        "Context manager, which holds the turn of a request, see acquire."
+        await self.acquire(priority, deadline)
+        try:
+            yield
+        finally:
+            self.release()
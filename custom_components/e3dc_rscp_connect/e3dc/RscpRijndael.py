@@ -0,0 +1,441 @@
+"""Table driven Rijndael cipher with 256 bit blocks in CBC mode.
+
+RSCP uses Rijndael with a block size of 32 bytes, which is not part of AES and is not
+provided by the usual crypto libraries. This implementation combines SubBytes,
+ShiftRows and MixColumns of a round into lookups of precomputed 32 bit tables and
+keeps the expanded key and the CBC chaining values between messages.
+"""
+
+import struct
+
+BLOCK_SIZE = 32
+KEY_SIZE = 32
+ROUNDS = 14
+
+_BLOCK = struct.Struct(">8I")
+
+
+def _mul(a: int, b: int) -> int:
+    "Multiplies two elements of GF(2^8)."
+    result = 0
+    while b:
+        if b & 1:
+            result ^= a
+        a <<= 1
+        if a & 0x100:
+            a ^= 0x11B
+        b >>= 1
+    return result
+
+
+def _ror(word: int) -> int:
+    return (word >> 8 | word << 24) & 0xFFFFFFFF
+
+
+def _create_sbox() -> tuple[int, ...]:
+    inverse = [0] * 256
+    for a in range(1, 256):
+        for b in range(1, 256):
+            if _mul(a, b) == 1:
+                inverse[a] = b
+                break
+
+    sbox = []
+    for x in inverse:
+        s = x
+        for _ in range(4):
+            x = (x << 1 | x >> 7) & 0xFF
+            s ^= x
+        sbox.append(s ^ 0x63)
+    return tuple(sbox)
+
+
+def _rotate_tables(table: tuple[int, ...]) -> tuple[tuple[int, ...], ...]:
+    tables = [table]
+    for _ in range(3):
+        tables.append(tuple(map(_ror, tables[-1])))
+    return tuple(tables)
+
+
+_SBOX = _create_sbox()
+_INV_SBOX = tuple(_SBOX.index(x) for x in range(256))
+
+# one column of MixColumns and InvMixColumns for each input byte
+_MIX = tuple(_mul(x, 2) << 24 | x << 16 | x << 8 | _mul(x, 3) for x in range(256))
+_INV_MIX = tuple(
+    _mul(x, 14) << 24 | _mul(x, 9) << 16 | _mul(x, 13) << 8 | _mul(x, 11)
+    for x in range(256)
+)
+
+_TE = _rotate_tables(tuple(_MIX[s] for s in _SBOX))
+_TD = _rotate_tables(tuple(_INV_MIX[s] for s in _INV_SBOX))
+_INV_MIX_TABLES = _rotate_tables(_INV_MIX)
+
+
+def _sub_word(word: int) -> int:
+    return (
+        _SBOX[word >> 24] << 24
+        | _SBOX[word >> 16 & 0xFF] << 16
+        | _SBOX[word >> 8 & 0xFF] << 8
+        | _SBOX[word & 0xFF]
+    )
+
+
+def _inv_mix_column(word: int) -> int:
+    u0, u1, u2, u3 = _INV_MIX_TABLES
+    return (
+        u0[word >> 24] ^ u1[word >> 16 & 0xFF] ^ u2[word >> 8 & 0xFF] ^ u3[word & 0xFF]
+    )
+
+
+def expand_key(key: bytes) -> tuple[list[tuple], list[tuple]]:
+    """Returns the round keys for encryption and decryption.
+
+    The decryption keys are in reverse order and have InvMixColumns applied, so
+    decryption uses the same structure as encryption.
+    """
+    if len(key) != KEY_SIZE:
+        raise ValueError(f"Key must have {KEY_SIZE} bytes, got {len(key)}")
+
+    words = list(_BLOCK.unpack(key))
+    rcon = 1
+    for i in range(8, (ROUNDS + 1) * 8):
+        word = words[i - 1]
+        if i % 8 == 0:
+            word = _sub_word(_ror(_ror(_ror(word)))) ^ rcon << 24
+            rcon = _mul(rcon, 2)
+        elif i % 8 == 4:
+            word = _sub_word(word)
+        words.append(words[i - 8] ^ word)
+
+    encryption_keys = [tuple(words[r * 8 : r * 8 + 8]) for r in range(ROUNDS + 1)]
+    decryption_keys = encryption_keys[::-1]
+    for r in range(1, ROUNDS):
+        decryption_keys[r] = tuple(map(_inv_mix_column, decryption_keys[r]))
+    return encryption_keys, decryption_keys
+
+
+class Rijndael256Cbc:
+    """Rijndael with 32 byte keys and blocks in CBC mode.
+
+    The key is expanded once. The chaining values of both directions are kept between
+    calls, so every call continues the stream of the previous one, as RSCP requires.
+    """
+
+    def __init__(self, key: bytes, iv: bytes):
+        self.__encryption_keys, self.__decryption_keys = expand_key(key)
+        self.reset(iv)
+
+    def reset(self, iv: bytes):
+        "Restarts both directions with the initialization vector iv."
+        if len(iv) != BLOCK_SIZE:
+            raise ValueError(f"IV must have {BLOCK_SIZE} bytes, got {len(iv)}")
+        self.__encryption_chain = _BLOCK.unpack(iv)
+        self.__decryption_chain = self.__encryption_chain
+
+    def encrypt(self, plaintext: bytes) -> bytes:
+        "Encrypts plaintext, which is padded with zeros to a multiple of BLOCK_SIZE."
+        padding = -len(plaintext) % BLOCK_SIZE
+        if padding:
+            plaintext = bytes(plaintext) + bytes(padding)
+
+        te0, te1, te2, te3 = _TE
+        sbox = _SBOX
+        unpack_from = _BLOCK.unpack_from
+        pack_into = _BLOCK.pack_into
+        first, *rounds, final = self.__encryption_keys
+        x0, x1, x2, x3, x4, x5, x6, x7 = first
+        f0, f1, f2, f3, f4, f5, f6, f7 = final
+        v0, v1, v2, v3, v4, v5, v6, v7 = self.__encryption_chain
+
+        ciphertext = bytearray(len(plaintext))
+        for offset in range(0, len(plaintext), BLOCK_SIZE):
+            p0, p1, p2, p3, p4, p5, p6, p7 = unpack_from(plaintext, offset)
+            s0 = p0 ^ v0 ^ x0
+            s1 = p1 ^ v1 ^ x1
+            s2 = p2 ^ v2 ^ x2
+            s3 = p3 ^ v3 ^ x3
+            s4 = p4 ^ v4 ^ x4
+            s5 = p5 ^ v5 ^ x5
+            s6 = p6 ^ v6 ^ x6
+            s7 = p7 ^ v7 ^ x7
+            for k0, k1, k2, k3, k4, k5, k6, k7 in rounds:
+                a0 = (
+                    te0[s0 >> 24]
+                    ^ te1[s1 >> 16 & 0xFF]
+                    ^ te2[s3 >> 8 & 0xFF]
+                    ^ te3[s4 & 0xFF]
+                    ^ k0
+                )
+                a1 = (
+                    te0[s1 >> 24]
+                    ^ te1[s2 >> 16 & 0xFF]
+                    ^ te2[s4 >> 8 & 0xFF]
+                    ^ te3[s5 & 0xFF]
+                    ^ k1
+                )
+                a2 = (
+                    te0[s2 >> 24]
+                    ^ te1[s3 >> 16 & 0xFF]
+                    ^ te2[s5 >> 8 & 0xFF]
+                    ^ te3[s6 & 0xFF]
+                    ^ k2
+                )
+                a3 = (
+                    te0[s3 >> 24]
+                    ^ te1[s4 >> 16 & 0xFF]
+                    ^ te2[s6 >> 8 & 0xFF]
+                    ^ te3[s7 & 0xFF]
+                    ^ k3
+                )
+                a4 = (
+                    te0[s4 >> 24]
+                    ^ te1[s5 >> 16 & 0xFF]
+                    ^ te2[s7 >> 8 & 0xFF]
+                    ^ te3[s0 & 0xFF]
+                    ^ k4
+                )
+                a5 = (
+                    te0[s5 >> 24]
+                    ^ te1[s6 >> 16 & 0xFF]
+                    ^ te2[s0 >> 8 & 0xFF]
+                    ^ te3[s1 & 0xFF]
+                    ^ k5
+                )
+                a6 = (
+                    te0[s6 >> 24]
+                    ^ te1[s7 >> 16 & 0xFF]
+                    ^ te2[s1 >> 8 & 0xFF]
+                    ^ te3[s2 & 0xFF]
+                    ^ k6
+                )
+                a7 = (
+                    te0[s7 >> 24]
+                    ^ te1[s0 >> 16 & 0xFF]
+                    ^ te2[s2 >> 8 & 0xFF]
+                    ^ te3[s3 & 0xFF]
+                    ^ k7
+                )
+                s0, s1, s2, s3, s4, s5, s6, s7 = a0, a1, a2, a3, a4, a5, a6, a7
+            v0, v1, v2, v3, v4, v5, v6, v7 = (
+                (
+                    sbox[s0 >> 24] << 24
+                    | sbox[s1 >> 16 & 0xFF] << 16
+                    | sbox[s3 >> 8 & 0xFF] << 8
+                    | sbox[s4 & 0xFF]
+                )
+                ^ f0,
+                (
+                    sbox[s1 >> 24] << 24
+                    | sbox[s2 >> 16 & 0xFF] << 16
+                    | sbox[s4 >> 8 & 0xFF] << 8
+                    | sbox[s5 & 0xFF]
+                )
+                ^ f1,
+                (
+                    sbox[s2 >> 24] << 24
+                    | sbox[s3 >> 16 & 0xFF] << 16
+                    | sbox[s5 >> 8 & 0xFF] << 8
+                    | sbox[s6 & 0xFF]
+                )
+                ^ f2,
+                (
+                    sbox[s3 >> 24] << 24
+                    | sbox[s4 >> 16 & 0xFF] << 16
+                    | sbox[s6 >> 8 & 0xFF] << 8
+                    | sbox[s7 & 0xFF]
+                )
+                ^ f3,
+                (
+                    sbox[s4 >> 24] << 24
+                    | sbox[s5 >> 16 & 0xFF] << 16
+                    | sbox[s7 >> 8 & 0xFF] << 8
+                    | sbox[s0 & 0xFF]
+                )
+                ^ f4,
+                (
+                    sbox[s5 >> 24] << 24
+                    | sbox[s6 >> 16 & 0xFF] << 16
+                    | sbox[s0 >> 8 & 0xFF] << 8
+                    | sbox[s1 & 0xFF]
+                )
+                ^ f5,
+                (
+                    sbox[s6 >> 24] << 24
+                    | sbox[s7 >> 16 & 0xFF] << 16
+                    | sbox[s1 >> 8 & 0xFF] << 8
+                    | sbox[s2 & 0xFF]
+                )
+                ^ f6,
+                (
+                    sbox[s7 >> 24] << 24
+                    | sbox[s0 >> 16 & 0xFF] << 16
+                    | sbox[s2 >> 8 & 0xFF] << 8
+                    | sbox[s3 & 0xFF]
+                )
+                ^ f7,
+            )
+            pack_into(ciphertext, offset, v0, v1, v2, v3, v4, v5, v6, v7)
+
+        self.__encryption_chain = (v0, v1, v2, v3, v4, v5, v6, v7)
+        return bytes(ciphertext)
+
+    def decrypt(self, ciphertext: bytes) -> bytes:
+        "Decrypts ciphertext, its length must be a multiple of BLOCK_SIZE."
+        if len(ciphertext) % BLOCK_SIZE != 0:
+            raise ValueError(
+                f"Ciphertext length {len(ciphertext)} is no multiple of {BLOCK_SIZE}"
+            )
+
+        td0, td1, td2, td3 = _TD
+        inv_sbox = _INV_SBOX
+        unpack_from = _BLOCK.unpack_from
+        pack_into = _BLOCK.pack_into
+        first, *rounds, final = self.__decryption_keys
+        x0, x1, x2, x3, x4, x5, x6, x7 = first
+        f0, f1, f2, f3, f4, f5, f6, f7 = final
+        v0, v1, v2, v3, v4, v5, v6, v7 = self.__decryption_chain
+
+        plaintext = bytearray(len(ciphertext))
+        for offset in range(0, len(ciphertext), BLOCK_SIZE):
+            c0, c1, c2, c3, c4, c5, c6, c7 = unpack_from(ciphertext, offset)
+            s0 = c0 ^ x0
+            s1 = c1 ^ x1
+            s2 = c2 ^ x2
+            s3 = c3 ^ x3
+            s4 = c4 ^ x4
+            s5 = c5 ^ x5
+            s6 = c6 ^ x6
+            s7 = c7 ^ x7
+            for k0, k1, k2, k3, k4, k5, k6, k7 in rounds:
+                a0 = (
+                    td0[s0 >> 24]
+                    ^ td1[s7 >> 16 & 0xFF]
+                    ^ td2[s5 >> 8 & 0xFF]
+                    ^ td3[s4 & 0xFF]
+                    ^ k0
+                )
+                a1 = (
+                    td0[s1 >> 24]
+                    ^ td1[s0 >> 16 & 0xFF]
+                    ^ td2[s6 >> 8 & 0xFF]
+                    ^ td3[s5 & 0xFF]
+                    ^ k1
+                )
+                a2 = (
+                    td0[s2 >> 24]
+                    ^ td1[s1 >> 16 & 0xFF]
+                    ^ td2[s7 >> 8 & 0xFF]
+                    ^ td3[s6 & 0xFF]
+                    ^ k2
+                )
+                a3 = (
+                    td0[s3 >> 24]
+                    ^ td1[s2 >> 16 & 0xFF]
+                    ^ td2[s0 >> 8 & 0xFF]
+                    ^ td3[s7 & 0xFF]
+                    ^ k3
+                )
+                a4 = (
+                    td0[s4 >> 24]
+                    ^ td1[s3 >> 16 & 0xFF]
+                    ^ td2[s1 >> 8 & 0xFF]
+                    ^ td3[s0 & 0xFF]
+                    ^ k4
+                )
+                a5 = (
+                    td0[s5 >> 24]
+                    ^ td1[s4 >> 16 & 0xFF]
+                    ^ td2[s2 >> 8 & 0xFF]
+                    ^ td3[s1 & 0xFF]
+                    ^ k5
+                )
+                a6 = (
+                    td0[s6 >> 24]
+                    ^ td1[s5 >> 16 & 0xFF]
+                    ^ td2[s3 >> 8 & 0xFF]
+                    ^ td3[s2 & 0xFF]
+                    ^ k6
+                )
+                a7 = (
+                    td0[s7 >> 24]
+                    ^ td1[s6 >> 16 & 0xFF]
+                    ^ td2[s4 >> 8 & 0xFF]
+                    ^ td3[s3 & 0xFF]
+                    ^ k7
+                )
+                s0, s1, s2, s3, s4, s5, s6, s7 = a0, a1, a2, a3, a4, a5, a6, a7
+            o0, o1, o2, o3, o4, o5, o6, o7 = (
+                (
+                    inv_sbox[s0 >> 24] << 24
+                    | inv_sbox[s7 >> 16 & 0xFF] << 16
+                    | inv_sbox[s5 >> 8 & 0xFF] << 8
+                    | inv_sbox[s4 & 0xFF]
+                )
+                ^ f0,
+                (
+                    inv_sbox[s1 >> 24] << 24
+                    | inv_sbox[s0 >> 16 & 0xFF] << 16
+                    | inv_sbox[s6 >> 8 & 0xFF] << 8
+                    | inv_sbox[s5 & 0xFF]
+                )
+                ^ f1,
+                (
+                    inv_sbox[s2 >> 24] << 24
+                    | inv_sbox[s1 >> 16 & 0xFF] << 16
+                    | inv_sbox[s7 >> 8 & 0xFF] << 8
+                    | inv_sbox[s6 & 0xFF]
+                )
+                ^ f2,
+                (
+                    inv_sbox[s3 >> 24] << 24
+                    | inv_sbox[s2 >> 16 & 0xFF] << 16
+                    | inv_sbox[s0 >> 8 & 0xFF] << 8
+                    | inv_sbox[s7 & 0xFF]
+                )
+                ^ f3,
+                (
+                    inv_sbox[s4 >> 24] << 24
+                    | inv_sbox[s3 >> 16 & 0xFF] << 16
+                    | inv_sbox[s1 >> 8 & 0xFF] << 8
+                    | inv_sbox[s0 & 0xFF]
+                )
+                ^ f4,
+                (
+                    inv_sbox[s5 >> 24] << 24
+                    | inv_sbox[s4 >> 16 & 0xFF] << 16
+                    | inv_sbox[s2 >> 8 & 0xFF] << 8
+                    | inv_sbox[s1 & 0xFF]
+                )
+                ^ f5,
+                (
+                    inv_sbox[s6 >> 24] << 24
+                    | inv_sbox[s5 >> 16 & 0xFF] << 16
+                    | inv_sbox[s3 >> 8 & 0xFF] << 8
+                    | inv_sbox[s2 & 0xFF]
+                )
+                ^ f6,
+                (
+                    inv_sbox[s7 >> 24] << 24
+                    | inv_sbox[s6 >> 16 & 0xFF] << 16
+                    | inv_sbox[s4 >> 8 & 0xFF] << 8
+                    | inv_sbox[s3 & 0xFF]
+                )
+                ^ f7,
+            )
+            pack_into(
+                plaintext,
+                offset,
+                o0 ^ v0,
+                o1 ^ v1,
+                o2 ^ v2,
+                o3 ^ v3,
+                o4 ^ v4,
+                o5 ^ v5,
+                o6 ^ v6,
+                o7 ^ v7,
+            )
+            v0, v1, v2, v3, v4, v5, v6, v7 = c0, c1, c2, c3, c4, c5, c6, c7
+
+        self.__decryption_chain = (v0, v1, v2, v3, v4, v5, v6, v7)
+        return bytes(plaintext)
@@ -0,0 +1,20 @@
+"""Integer codes of all RSCP tags, e.g. RscpTagCodes.TAG_WB_INDEX.
+
+The constants are looked up in the tag database of RscpTags on first access. RscpValue
+compares tags by code, the names are only needed for logging and toString.
+"""
+
+from . import RscpTags
+
+
+def __getattr__(name: str):
+    if name == "__all__":
+        value = list(RscpTags.rscpTags)
+    else:
+        tag = RscpTags.getTagByName(name)
+        if tag is None:
+            raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+        value = tag[1]["tagvalue"]
+
+    globals()[name] = value
+    return value
@@ -0,0 +1,172 @@
+"""Compact binary database of the RSCP tags, built from the modules of the tags package.
+
+Layout of the database, all integers are little endian:
+
+    header      magic b"RSCPTAGS", version (u16), tag count (u32), size of the names
+                (u32), size of the type names (u32)
+    codes       tag count * u32, sorted, duplicated codes keep the order of definition
+    name ends   tag count * u32, end offset of the name of each tag in the names
+    types       tag count * u8, index of the type name, bit 7 marks variable types
+    name order  tag count * u16, indexes of the tags sorted by name
+    names       the tag names, ascii without separators
+    type names  ascii, separated by newlines
+
+Build the database from the repository root with:
+
+    python -m custom_components.e3dc_rscp_connect.e3dc.tags
+"""
+
+from __future__ import annotations
+
+from array import array
+from bisect import bisect_left
+from pathlib import Path
+import struct
+import sys
+
+DATABASE_PATH = Path(__file__).parent / "tags" / "rscp_tags.bin"
+
+_MAGIC = b"RSCPTAGS"
+_VERSION = 1
+_HEADER = struct.Struct("<8sHIII")
+_TYPE_VARIABLE = 0x80
+
+
+def _read_array(typecode: str, data: bytes, offset: int, count: int) -> array:
+    values = array(typecode)
+    values.frombytes(data[offset : offset + count * values.itemsize])
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values
+
+
+def _write_array(typecode: str, values) -> bytes:
+    values = array(typecode, values)
+    if sys.byteorder == "big":
+        values.byteswap()
+    return values.tobytes()
+
+
+def build_database(tags: dict) -> bytes:
+    "Returns the database of tags, a dict of tag name -> tag description like RscpTags.rscpTags."
+    names = list(tags)
+    # sorted is stable, so the first definition of a duplicated code stays first
+    order = sorted(range(len(names)), key=lambda x: tags[names[x]]["tagvalue"])
+    names = [names[x] for x in order]
+    if len(names) > 0xFFFF:
+        raise ValueError(f"Too many tags for the database: {len(names)}")
+
+    type_names = sorted({description["type"] for description in tags.values()})
+    types = []
+    for name in names:
+        description = tags[name]
+        if set(description) - {"tagvalue", "type", "type_variable"}:
+            raise ValueError(f"Unsupported description of {name}: {description}")
+        type_index = type_names.index(description["type"])
+        if description.get("type_variable"):
+            type_index |= _TYPE_VARIABLE
+        types.append(type_index)
+
+    encoded_names = [name.encode("ascii") for name in names]
+    name_ends = []
+    end = 0
+    for name in encoded_names:
+        end += len(name)
+        name_ends.append(end)
+    name_data = b"".join(encoded_names)
+    type_data = "\n".join(type_names).encode("ascii")
+
+    return b"".join(
+        (
+            _HEADER.pack(_MAGIC, _VERSION, len(names), len(name_data), len(type_data)),
+            _write_array("I", (tags[name]["tagvalue"] for name in names)),
+            _write_array("I", name_ends),
+            bytes(types),
+            _write_array("H", sorted(range(len(names)), key=names.__getitem__)),
+            name_data,
+            type_data,
+        )
+    )
+
+
+class RscpTagDatabase:
+    """Read access to a database built by build_database.
+
+    Tags are addressed by their index in the database, the indexes are sorted by code.
+    Codes are found by binary search in the code array, names by binary search in
+    the name order.
+    """
+
+    def __init__(self, data: bytes):
+        magic, version, count, names_size, types_size = _HEADER.unpack_from(data)
+        if magic != _MAGIC or version != _VERSION:
+            raise ValueError("Data is not a tag database of a supported version")
+
+        offset = _HEADER.size
+        self.__codes = _read_array("I", data, offset, count)
+        offset += 4 * count
+        self.__name_ends = _read_array("I", data, offset, count)
+        offset += 4 * count
+        self.__types = data[offset : offset + count]
+        offset += count
+        self.__name_order = _read_array("H", data, offset, count)
+        offset += 2 * count
+        self.__names = data[offset : offset + names_size]
+        offset += names_size
+        self.__type_names = data[offset : offset + types_size].decode().split("\n")
+
+    @classmethod
+    def load(cls, path: Path = DATABASE_PATH) -> RscpTagDatabase:
+        "Reads the database from a file."
+        return cls(path.read_bytes())
+
+    def __len__(self) -> int:
+        return len(self.__codes)
+
+    def find_code(self, tag_code: int) -> int | None:
+        "Returns the index of the first tag with tag_code, or None if the code is unknown."
+        index = bisect_left(self.__codes, tag_code)
+        if index < len(self.__codes) and self.__codes[index] == tag_code:
+            return index
+        return None
+
+    def find_name(self, tag_name: str) -> int | None:
+        "Returns the index of the tag with tag_name, or None if the name is unknown."
+        position = self.__find_name_position(tag_name)
+        if position < len(self.__name_order):
+            index = self.__name_order[position]
+            if self.name(index) == tag_name:
+                return index
+        return None
+
+    def find_prefix(self, prefix: str) -> list[int]:
+        "Returns the indexes of the tags with names starting with prefix, sorted by name."
+        position = self.__find_name_position(prefix)
+        indexes = []
+        for index in self.__name_order[position:]:
+            if not self.name(index).startswith(prefix):
+                break
+            indexes.append(index)
+        return indexes
+
+    def __find_name_position(self, tag_name: str) -> int:
+        return bisect_left(self.__name_order, tag_name, key=self.name)
+
+    def code(self, index: int) -> int:
+        return self.__codes[index]
+
+    def name(self, index: int) -> str:
+        start = self.__name_ends[index - 1] if index else 0
+        return self.__names[start : self.__name_ends[index]].decode()
+
+    def description(self, index: int) -> dict:
+        "Returns a new tag description like in RscpTags.rscpTags."
+        type_index = self.__types[index]
+        description = {
+            "tagvalue": self.__codes[index],
+            "type": self.__type_names[type_index & ~_TYPE_VARIABLE],
+        }
+        if type_index & _TYPE_VARIABLE:
+            description["type_variable"] = True
+        return description
+
@@ -1,4886 +1,108 @@
-rscpTags = {
-    "TAG_RSCP_REQ_LIST_NON_PAIRED_DEVICE_TYPE_EVCS": {
-        "tagvalue": 0x00000000,
-        "type": "Container",
-    },
-    "TAG_RSCP_REQ_AUTHENTICATION": {"tagvalue": 0x00000001, "type": "Container"},
-    "TAG_RSCP_AUTHENTICATION_USER": {"tagvalue": 0x00000002, "type": "CString"},
-    "TAG_RSCP_AUTHENTICATION_PASSWORD": {"tagvalue": 0x00000003, "type": "CString"},
-    "TAG_RSCP_REQ_USER_LEVEL": {"tagvalue": 0x00000004, "type": "None"},
-    "TAG_RSCP_REQ_SET_ENCRYPTION_PASSPHRASE": {
-        "tagvalue": 0x00000005,
-        "type": "CString",
-    },
-    "TAG_RSCP_REQ_AUTH_CHALLENGE": {"tagvalue": 0x00000006, "type": "None"},
-    "TAG_RSCP_AUTH_CHALLENGE_INDEX": {"tagvalue": 0x00000007, "type": "UChar8"},
-    "TAG_RSCP_AUTH_CHALLENGE_DATA": {"tagvalue": 0x00000008, "type": "ByteArray"},
-    "TAG_RSCP_REQ_SET_PROTOCOL_VERSION": {"tagvalue": 0x00000009, "type": "UChar8"},
-    "TAG_RSCP_REQ_SUPPORTED_PROTOCOL_VERSIONS": {
-        "tagvalue": 0x0000000A,
-        "type": "None",
-    },
-    "TAG_RSCP_REQ_TEST": {"tagvalue": 0x0000000C, "type": "None"},
-    "TAG_RSCP_REQ_TRIGGER_FRAME_DUMP": {"tagvalue": 0x0000000D, "type": "Uint32"},
-    "TAG_RSCP_AUTHENTICATION_TYPE": {"tagvalue": 0x00000815, "type": "UChar8"},
-    "TAG_RSCP_CONFIG_PROCESSED_STATE": {"tagvalue": 0x00400001, "type": "Int16"},
-    "TAG_RSCP_AUTHENTICATION": {"tagvalue": 0x00800001, "type": "UChar8"},
-    "TAG_RSCP_USER_LEVEL": {"tagvalue": 0x00800004, "type": "UChar8"},
-    "TAG_RSCP_SET_ENCRYPTION_PASSPHRASE": {"tagvalue": 0x00800005, "type": "Bool"},
-    "TAG_RSCP_AUTH_CHALLENGE": {"tagvalue": 0x00800006, "type": "Container"},
-    "TAG_RSCP_SET_PROTOCOL_VERSION": {"tagvalue": 0x00800009, "type": "UChar8"},
-    "TAG_RSCP_SUPPORTED_PROTOCOL_VERSIONS": {"tagvalue": 0x0080000A, "type": "UInt16"},
-    "TAG_RSCP_SET_POWER_SETPOINT": {"tagvalue": 0x0080000B, "type": "Bool"},
-    "TAG_RSCP_TRIGGER_FRAME_DUMP": {"tagvalue": 0x0080000D, "type": "Bool"},
-    "TAG_RSCP_TAG_AVAHIB_RESPONSE_PLAY": {"tagvalue": 0x0080000E, "type": "Bool"},
-    "TAG_RSCP_TEST_1": {"tagvalue": 0x0080000F, "type": "Char8"},
-    "TAG_RSCP_EMOBILITY_GET_OVERLOAD_CHARGING_CURRENT_LIMIT_PER_PHASE": {
-        "tagvalue": 0x00810021,
-        "type": "None",
-    },
-    "TAG_RSCP_GENERAL_ERROR": {"tagvalue": 0x00FFFFFF, "type": "Error"},
-    "TAG_EMS_REQ_SMGW_USE_CASES": {"tagvalue": 0x01000000, "type": "None"},
-    "TAG_EMS_REQ_POWER_PV": {"tagvalue": 0x01000001, "type": "None"},
-    "TAG_EMS_REQ_POWER_BAT": {"tagvalue": 0x01000002, "type": "None"},
-    "TAG_EMS_REQ_POWER_HOME": {"tagvalue": 0x01000003, "type": "None"},
-    "TAG_EMS_REQ_POWER_GRID": {"tagvalue": 0x01000004, "type": "None"},
-    "TAG_EMS_REQ_POWER_ADD": {"tagvalue": 0x01000005, "type": "None"},
-    "TAG_EMS_REQ_AUTARKY": {"tagvalue": 0x01000006, "type": "None"},
-    "TAG_EMS_REQ_SELF_CONSUMPTION": {"tagvalue": 0x01000007, "type": "None"},
-    "TAG_EMS_REQ_BAT_SOC": {"tagvalue": 0x01000008, "type": "None"},
-    "TAG_EMS_REQ_COUPLING_MODE": {"tagvalue": 0x01000009, "type": "None"},
-    "TAG_EMS_REQ_STORED_ERRORS": {"tagvalue": 0x0100000A, "type": "None"},
-    "TAG_EMS_REQ_MODE": {"tagvalue": 0x01000011, "type": "None"},
-    "TAG_EMS_REQ_BALANCED_PHASES": {"tagvalue": 0x01000012, "type": "None"},
-    "TAG_EMS_REQ_INSTALLED_PEAK_POWER": {"tagvalue": 0x01000013, "type": "None"},
-    "TAG_EMS_REQ_DERATE_AT_PERCENT_VALUE": {"tagvalue": 0x01000014, "type": "None"},
-    "TAG_EMS_REQ_DERATE_AT_POWER_VALUE": {"tagvalue": 0x01000015, "type": "None"},
-    "TAG_EMS_REQ_ERROR_BUZZER_ENABLED": {"tagvalue": 0x01000016, "type": "None"},
-    "TAG_EMS_REQ_SET_BALANCED_PHASES": {"tagvalue": 0x01000017, "type": "UChar8"},
-    "TAG_EMS_REQ_SET_INSTALLED_PEAK_POWER": {"tagvalue": 0x01000018, "type": "Uint32"},
-    "TAG_EMS_REQ_SET_DERATE_PERCENT": {"tagvalue": 0x01000019, "type": "Float32"},
-    "TAG_EMS_REQ_SET_ERROR_BUZZER_ENABLED": {"tagvalue": 0x0100001A, "type": "Bool"},
-    "TAG_EMS_REQ_START_ADJUST_BATTERY_VOLTAGE": {
-        "tagvalue": 0x0100001B,
-        "type": "Float32",
-    },
-    "TAG_EMS_REQ_CANCEL_ADJUST_BATTERY_VOLTAGE": {
-        "tagvalue": 0x0100001C,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_ADJUST_BATTERY_VOLTAGE_STATUS": {
-        "tagvalue": 0x0100001D,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_CONFIRM_ERRORS": {"tagvalue": 0x0100001E, "type": "None"},
-    "TAG_EMS_REQ_POWER_WB_ALL": {"tagvalue": 0x0100001F, "type": "None"},
-    "TAG_EMS_REQ_POWER_WB_SOLAR": {"tagvalue": 0x01000020, "type": "None"},
-    "TAG_EMS_REQ_EXT_SRC_AVAILABLE": {"tagvalue": 0x01000021, "type": "None"},
-    "TAG_EMS_REQ_RESCUE_BAT_MODE": {"tagvalue": 0x01000022, "type": "None"},
-    "TAG_EMS_REQ_SET_RESCUE_BAT_MODE": {"tagvalue": 0x01000023, "type": "Bool"},
-    "TAG_EMS_REQ_IS_PV_DERATING": {"tagvalue": 0x01000024, "type": "None"},
-    "TAG_EMS_REQ_AC_POWER_LIMIT": {"tagvalue": 0x01000025, "type": "None"},
-    "TAG_EMS_REQ_POWER_ADD_SINKS": {"tagvalue": 0x01000026, "type": "None"},
-    "TAG_EMS_REQ_SET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01000027, "type": "Bool"},
-    "TAG_EMS_REQ_GET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01000028, "type": "None"},
-    "TAG_EMS_REQ_SET_MAX_EP_WALLBOX_POWER_W": {
-        "tagvalue": 0x01000029,
-        "type": "Uint32",
-    },
-    "TAG_EMS_REQ_GET_MAX_EP_WALLBOX_POWER_W": {"tagvalue": 0x0100002A, "type": "None"},
-    "TAG_EMS_REQ_GET_MIN_EP_WALLBOX_POWER_W": {"tagvalue": 0x0100002B, "type": "None"},
-    "TAG_EMS_REQ_SET_MIN_EP_WALLBOX_POWER_W": {
-        "tagvalue": 0x0100002C,
-        "type": "Uint32",
-    },
-    "TAG_EMS_REQ_SET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0100002D, "type": "Uint32"},
-    "TAG_EMS_REQ_GET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0100002E, "type": "None"},
-    "TAG_EMS_REQ_SET_IDLE_PERIODS_2": {"tagvalue": 0x0100002F, "type": "Container"},
-    "TAG_EMS_REQ_SET_POWER": {"tagvalue": 0x01000030, "type": "Container"},
-    "TAG_EMS_REQ_SET_POWER_MODE": {"tagvalue": 0x01000031, "type": "UChar8"},
-    "TAG_EMS_REQ_SET_POWER_VALUE": {"tagvalue": 0x01000032, "type": "Int32"},
-    "TAG_EMS_REQ_GET_IDLE_PERIODS_2": {"tagvalue": 0x01000033, "type": "None"},
-    "TAG_EMS_REQ_SET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01000034, "type": "Bool"},
-    "TAG_EMS_REQ_GET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01000035, "type": "None"},
-    "TAG_EMS_REQ_DPP_GET_DATA": {"tagvalue": 0x01000036, "type": "Container"},
-    "TAG_EMS_REQ_DPP_SET_DATA": {"tagvalue": 0x01000037, "type": "Container"},
-    "TAG_EMS_REQ_SET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01000038, "type": "UChar8"},
-    "TAG_EMS_REQ_GET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01000039, "type": "None"},
-    "TAG_EMS_REQ_MANIPULATOR_COLLECTION": {"tagvalue": 0x0100003B, "type": "Container"},
-    "TAG_EMS_REQ_MANIPULATOR_EVENT_TOTAL_COUNT": {
-        "tagvalue": 0x0100003C,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_STATUS": {"tagvalue": 0x01000040, "type": "None"},
-    "TAG_EMS_REQ_USED_CHARGE_LIMIT": {"tagvalue": 0x01000041, "type": "None"},
-    "TAG_EMS_REQ_BAT_CHARGE_LIMIT": {"tagvalue": 0x01000042, "type": "None"},
-    "TAG_EMS_REQ_DCDC_CHARGE_LIMIT": {"tagvalue": 0x01000043, "type": "None"},
-    "TAG_EMS_REQ_USER_CHARGE_LIMIT": {"tagvalue": 0x01000044, "type": "None"},
-    "TAG_EMS_REQ_USED_DISCHARGE_LIMIT": {"tagvalue": 0x01000045, "type": "None"},
-    "TAG_EMS_REQ_BAT_DISCHARGE_LIMIT": {"tagvalue": 0x01000046, "type": "None"},
-    "TAG_EMS_REQ_DCDC_DISCHARGE_LIMIT": {"tagvalue": 0x01000047, "type": "None"},
-    "TAG_EMS_REQ_USER_DISCHARGE_LIMIT": {"tagvalue": 0x01000048, "type": "None"},
-    "TAG_EMS_REQ_SET_POWER_CONTROL_OFFSET": {"tagvalue": 0x01000060, "type": "Int32"},
-    "TAG_EMS_REQ_REMAINING_BAT_CHARGE_POWER": {"tagvalue": 0x01000071, "type": "None"},
-    "TAG_EMS_REQ_REMAINING_BAT_DISCHARGE_POWER": {
-        "tagvalue": 0x01000072,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_EMERGENCY_POWER_STATUS": {"tagvalue": 0x01000073, "type": "None"},
-    "TAG_EMS_REQ_SET_EMERGENCY_POWER": {"tagvalue": 0x01000074, "type": "UChar8"},
-    "TAG_EMS_REQ_SET_OVERRIDE_AVAILABLE_POWER": {
-        "tagvalue": 0x01000075,
-        "type": "Int32",
-    },
-    "TAG_EMS_REQ_SET_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01000076, "type": "UChar8"},
-    "TAG_EMS_REQ_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01000077, "type": "UChar8"},
-    "TAG_EMS_REQ_SET_BATTERY_BEFORE_CAR_MODE": {
-        "tagvalue": 0x01000078,
-        "type": "UChar8",
-    },
-    "TAG_EMS_REQ_BATTERY_BEFORE_CAR_MODE": {"tagvalue": 0x01000079, "type": "UChar8"},
-    "TAG_EMS_REQ_GET_IDLE_PERIODS": {"tagvalue": 0x01000080, "type": "None"},
-    "TAG_EMS_REQ_SET_IDLE_PERIODS": {"tagvalue": 0x01000081, "type": "Container"},
-    "TAG_EMS_IDLE_PERIOD": {"tagvalue": 0x01000082, "type": "Container"},
-    "TAG_EMS_IDLE_PERIOD_TYPE": {"tagvalue": 0x01000083, "type": "UChar8"},
-    "TAG_EMS_IDLE_PERIOD_DAY": {"tagvalue": 0x01000084, "type": "UChar8"},
-    "TAG_EMS_IDLE_PERIOD_START": {"tagvalue": 0x01000085, "type": "Container"},
-    "TAG_EMS_IDLE_PERIOD_END": {"tagvalue": 0x01000086, "type": "Container"},
-    "TAG_EMS_IDLE_PERIOD_HOUR": {"tagvalue": 0x01000087, "type": "UChar8"},
-    "TAG_EMS_IDLE_PERIOD_MINUTE": {"tagvalue": 0x01000088, "type": "UChar8"},
-    "TAG_EMS_IDLE_PERIOD_ACTIVE": {"tagvalue": 0x01000089, "type": "Bool"},
-    "TAG_EMS_REQ_IDLE_PERIOD_CHANGE_MARKER": {"tagvalue": 0x0100008A, "type": "None"},
-    "TAG_EMS_REQ_GET_POWER_SETTINGS": {"tagvalue": 0x0100008B, "type": "None"},
-    "TAG_EMS_REQ_SET_POWER_SETTINGS": {"tagvalue": 0x0100008C, "type": "Container"},
-    "TAG_EMS_REQ_SETTINGS_CHANGE_MARKER": {"tagvalue": 0x0100008D, "type": "None"},
-    "TAG_EMS_REQ_GET_MANUAL_CHARGE": {"tagvalue": 0x0100008E, "type": "None"},
-    "TAG_EMS_REQ_START_MANUAL_CHARGE": {"tagvalue": 0x0100008F, "type": "Uint32"},
-    "TAG_EMS_REQ_START_EMERGENCYPOWER_TEST": {"tagvalue": 0x01000090, "type": "Bool"},
-    "TAG_EMS_REQ_GET_GENERATOR_STATE": {"tagvalue": 0x01000091, "type": "None"},
-    "TAG_EMS_REQ_SET_GENERATOR_MODE": {"tagvalue": 0x01000092, "type": "UChar8"},
-    "TAG_EMS_REQ_EMERGENCYPOWER_TEST_STATUS": {"tagvalue": 0x01000093, "type": "None"},
-    "TAG_EMS_EPTEST_NEXT_TESTSTART": {"tagvalue": 0x01000094, "type": "Timestamp"},
-    "TAG_EMS_EPTEST_START_COUNTER": {"tagvalue": 0x01000095, "type": "Uint32"},
-    "TAG_EMS_EPTEST_RUNNING": {"tagvalue": 0x01000096, "type": "Bool"},
-    "TAG_EMS_REQ_GET_SYS_SPECS": {"tagvalue": 0x01000097, "type": "None"},
-    "TAG_EMS_REQ_SYS_STATUS": {"tagvalue": 0x01000098, "type": "None"},
-    "TAG_EMS_SYS_SPEC": {"tagvalue": 0x01000099, "type": "Container"},
-    "TAG_EMS_SYS_SPEC_INDEX": {"tagvalue": 0x0100009A, "type": "Int32"},
-    "TAG_EMS_SYS_SPEC_NAME": {"tagvalue": 0x0100009B, "type": "CString"},
-    "TAG_EMS_SYS_SPEC_VALUE_INT": {"tagvalue": 0x0100009C, "type": "Int32"},
-    "TAG_EMS_SYS_SPEC_VALUE_STRING": {"tagvalue": 0x0100009D, "type": "CString"},
-    "TAG_EMS_SYS_STATUS": {"tagvalue": 0x0100009E, "type": "None"},
-    "TAG_EMS_POWER_LIMITS_USED": {"tagvalue": 0x01000100, "type": "Bool"},
-    "TAG_EMS_MAX_CHARGE_POWER": {"tagvalue": 0x01000101, "type": "Uint32"},
-    "TAG_EMS_MAX_DISCHARGE_POWER": {"tagvalue": 0x01000102, "type": "Uint32"},
-    "TAG_EMS_DISCHARGE_START_POWER": {"tagvalue": 0x01000103, "type": "Uint32"},
-    "TAG_EMS_POWERSAVE_ENABLED": {"tagvalue": 0x01000104, "type": "UChar8"},
-    "TAG_EMS_WEATHER_REGULATED_CHARGE_ENABLED": {
-        "tagvalue": 0x01000105,
-        "type": "UChar8",
-    },
-    "TAG_EMS_WEATHER_FORECAST_MODE": {"tagvalue": 0x01000106, "type": "UChar8"},
-    "TAG_EMS_POWERSAVE_TIMEOUT": {"tagvalue": 0x01000107, "type": "Uint32"},
-    "TAG_EMS_MANUAL_CHARGE_START_COUNTER": {"tagvalue": 0x01000150, "type": "Uint32"},
-    "TAG_EMS_MANUAL_CHARGE_ACTIVE": {"tagvalue": 0x01000151, "type": "Bool"},
-    "TAG_EMS_MANUAL_CHARGE_ENERGY_COUNTER": {"tagvalue": 0x01000152, "type": "Uint32"},
-    "TAG_EMS_MANUAL_CHARGE_LASTSTART": {"tagvalue": 0x01000153, "type": "Timestamp"},
-    "TAG_EMS_REQ_REMOTE_CONTROL ": {"tagvalue": 0x01000200, "type": "Container"},
-    "TAG_EMS_REQ_DEACTIVATE_REMOTE_CONTROL": {"tagvalue": 0x01000201, "type": "None"},
-    "TAG_EMS_REQ_IP_REMOTE_CONTROL": {"tagvalue": 0x01000202, "type": "None"},
-    "TAG_EMS_REQ_EP_DELAY": {"tagvalue": 0x01000203, "type": "None"},
-    "TAG_EMS_REQ_SET_EP_DELAY": {"tagvalue": 0x01000204, "type": "UChar8"},
-    "TAG_EMS_REQ_REMOTE_CONTROL_STATUS": {"tagvalue": 0x01000205, "type": "None"},
-    "TAG_EMS_REQ_IDLE_PERIOD_MIN_SOC_UCB": {"tagvalue": 0x01000206, "type": "None"},
-    "TAG_EMS_REQ_IDLE_PERIOD_MAX_SOC_UCB": {"tagvalue": 0x01000207, "type": "None"},
-    "TAG_EMS_REQ_SET_IDLE_PERIOD_MIN_SOC_UCB": {
-        "tagvalue": 0x01000208,
-        "type": "UChar8",
-    },
-    "TAG_EMS_REQ_SET_IDLE_PERIOD_MAX_SOC_UCB": {
-        "tagvalue": 0x01000209,
-        "type": "UChar8",
-    },
-    "TAG_EMS_REQ_REGULATOR_MODE": {"tagvalue": 0x01000210, "type": "None"},
-    "TAG_EMS_REQ_SET_REGULATOR_MODE": {"tagvalue": 0x01000211, "type": "UChar8"},
-    "TAG_EMS_REQ_SUPPORTED_REGULATOR_MODES": {"tagvalue": 0x01000212, "type": "None"},
-    "TAG_EMS_REQ_EMERGENCY_POWER_OVERLOAD_STATUS": {
-        "tagvalue": 0x01000213,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_EMERGENCY_POWER_RETRY": {"tagvalue": 0x01000214, "type": "None"},
-    "TAG_EMS_REQ_DETECT_PHASE_OFFSET": {"tagvalue": 0x01000217, "type": "None"},
-    "TAG_EMS_REQ_PHASE_DETECTION_STATUS": {"tagvalue": 0x01000218, "type": "None"},
-    "TAG_EMS_REQ_PHASE_OFFSET": {"tagvalue": 0x01000219, "type": "None"},
-    "TAG_EMS_REQ_ABORT_PHASE_DETECTION": {"tagvalue": 0x01000220, "type": "None"},
-    "TAG_EMS_REQ_REGULATOR_STRATEGY": {"tagvalue": 0x01000221, "type": "None"},
-    "TAG_EMS_REQ_SET_REGULATOR_STRATEGY": {"tagvalue": 0x01000222, "type": "UChar8"},
-    "TAG_EMS_REQ_POWER_PV_AC_OUT": {"tagvalue": 0x01000223, "type": "None"},
-    "TAG_EMS_REQ_PV_ENERGY": {"tagvalue": 0x01000224, "type": "None"},
-    "TAG_EMS_REQ_ENERGY_STORAGE_MODEL": {"tagvalue": 0x01000228, "type": "None"},
-    "TAG_EMS_REQ_SPECIFICATION_VALUES": {"tagvalue": 0x01000234, "type": "None"},
-    "TAG_EMS_REQ_EP_RESERVE": {"tagvalue": 0x01000242, "type": "None"},
-    "TAG_EMS_REQ_SEC_LIMITS": {"tagvalue": 0x01000243, "type": "None"},
-    "TAG_EMS_REQ_SEC_DEVICE_STATUS": {"tagvalue": 0x01000252, "type": "None"},
-    "TAG_EMS_REQ_BAT_CURRENT_IN": {"tagvalue": 0x01000258, "type": "None"},
-    "TAG_EMS_REQ_BAT_CURRENT_OUT": {"tagvalue": 0x01000259, "type": "None"},
-    "TAG_EMS_REQ_MAX_DC_POWER": {"tagvalue": 0x01000260, "type": "None"},
-    "TAG_EMS_REQ_AC_REACTIVE_POWER": {"tagvalue": 0x01000261, "type": "None"},
-    "TAG_EMS_REQ_SET_EP_PARTIAL_GRID": {"tagvalue": 0x01000262, "type": "Bool"},
-    "TAG_EMS_REQ_GET_PARTIAL_GRID": {"tagvalue": 0x01000263, "type": "None"},
-    "TAG_EMS_REQ_ESTIMATED_POWER_LIMITS": {"tagvalue": 0x01000264, "type": "None"},
-    "TAG_EMS_REQ_DESIGN_POWER_LIMITS": {"tagvalue": 0x01000265, "type": "None"},
-    "TAG_EMS_REQ_SET_CAN_ID_FEED_IN_REDUCTION": {
-        "tagvalue": 0x01000266,
-        "type": "Int32",
-    },
-    "TAG_EMS_REQ_CAN_ID_FEED_IN_REDUCTION": {"tagvalue": 0x01000267, "type": "None"},
-    "TAG_EMS_REQ_SET_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01000268, "type": "Int32"},
-    "TAG_EMS_REQ_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01000269, "type": "None"},
-    "TAG_EMS_REQ_SET_WALLBOX_MODE": {"tagvalue": 0x01000270, "type": "UChar8"},
-    "TAG_EMS_REQ_GET_WALLBOX_MODE": {"tagvalue": 0x01000271, "type": "None"},
-    "TAG_EMS_REQ_SET_MAX_FUSE_POWER": {"tagvalue": 0x01000272, "type": "Uint32"},
-    "TAG_EMS_REQ_GET_MAX_FUSE_POWER": {"tagvalue": 0x01000273, "type": "None"},
-    "TAG_EMS_REQ_SET_CONNECTED_POWER": {"tagvalue": 0x01000274, "type": "Uint32"},
-    "TAG_EMS_REQ_GET_CONNECTED_POWER ": {"tagvalue": 0x01000275, "type": "None"},
-    "TAG_EMS_REQ_DERATE_AT_CONNECTED_POWER": {"tagvalue": 0x01000276, "type": "None"},
-    "TAG_EMS_REQ_SET_DERATE_AT_CONNECTED_POWER": {
-        "tagvalue": 0x01000277,
-        "type": "Bool",
-    },
-    "TAG_EMS_REQ_SET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
-        "tagvalue": 0x0100027A,
-        "type": "Bool",
-    },
-    "TAG_EMS_REQ_GET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
-        "tagvalue": 0x0100027B,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_SET_WB_DISCHARGE_BAT_UNTIL": {
-        "tagvalue": 0x0100027C,
-        "type": "UChar8",
-    },
-    "TAG_EMS_REQ_GET_WB_DISCHARGE_BAT_UNTIL": {"tagvalue": 0x0100027D, "type": "None"},
-    "TAG_EMS_REQ_WB_AVAILABLE": {"tagvalue": 0x01000280, "type": "None"},
-    "TAG_EMS_REQ_WB_PREFERRED_CHARGE_POWER": {"tagvalue": 0x01000281, "type": "None"},
-    "TAG_EMS_REQ_SET_PEAK_SHAVING_POWER": {"tagvalue": 0x01000282, "type": "Uint32"},
-    "TAG_EMS_REQ_GET_PEAK_SHAVING_POWER": {"tagvalue": 0x01000283, "type": "None"},
-    "TAG_EMS_REQ_GET_RUNSCREENVALUES": {"tagvalue": 0x01000284, "type": "None"},
-    "TAG_EMS_REQ_SET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01000286, "type": "Container"},
-    "TAG_EMS_REQ_GET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01000287, "type": "None"},
-    "TAG_EMS_REQ_SET_LIST_ACTOR": {"tagvalue": 0x01000288, "type": "Container"},
-    "TAG_EMS_REQ_GET_LIST_ACTOR": {"tagvalue": 0x01000289, "type": "None"},
-    "TAG_EMS_REQ_WB_BIC_LOAD_PRICE_POWER_TABLE": {
-        "tagvalue": 0x01000307,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_WB_BIC_PRICE_POWER_TABLE_STATUS": {
-        "tagvalue": 0x01000308,
-        "type": "None",
-    },
-    "TAG_EMS_REQ_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01000309, "type": "Container"},
-    "TAG_EMS_REQ_SET_OVERRIDE_DERATE_FEEDIN": {
-        "tagvalue": 0x0100030A,
-        "type": "Container",
-    },
-    "TAG_EMS_REQ_GET_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x0100030B, "type": "None"},
-    "TAG_EMS_PARAM_DERATE_POWER_VALUE": {"tagvalue": 0x01040001, "type": "Float32"},
-    "TAG_EMS_PARAM_AVAILABLE_POWER": {"tagvalue": 0x01040002, "type": "Int32"},
-    "TAG_EMS_PARAM_IP_REMOTE_CONTROL": {"tagvalue": 0x01040004, "type": "CString"},
-    "TAG_EMS_PARAM_POWEROFFSET_VALUE": {"tagvalue": 0x01040005, "type": "Int32"},
-    "TAG_EMS_PARAM_POWER_VALUE_L1": {"tagvalue": 0x01040006, "type": "Int32"},
-    "TAG_EMS_PARAM_POWER_VALUE_L2": {"tagvalue": 0x01040007, "type": "Int32"},
-    "TAG_EMS_PARAM_POWER_VALUE_L3": {"tagvalue": 0x01040008, "type": "Int32"},
-    "TAG_EMS_PARAM_SET_POINT": {"tagvalue": 0x01040009, "type": "Int32"},
-    "TAG_EMS_PARAM_DERATE_POWER_VALUE_L1": {"tagvalue": 0x01040010, "type": "Float32"},
-    "TAG_EMS_PARAM_DERATE_POWER_VALUE_L2": {"tagvalue": 0x01040011, "type": "Float32"},
-    "TAG_EMS_PARAM_DERATE_POWER_VALUE_L3": {"tagvalue": 0x01040012, "type": "Float32"},
-    "TAG_EMS_PARAM_REMOTE_CONTROL_ACTIVE": {"tagvalue": 0x01040013, "type": "Bool"},
-    "TAG_EMS_PARAM_TIME_TO_RETRY": {"tagvalue": 0x01040014, "type": "UInt16"},
-    "TAG_EMS_PARAM_NO_REMAINING_RETRY": {"tagvalue": 0x01040015, "type": "UInt16"},
-    "TAG_EMS_PARAM_INDEX": {"tagvalue": 0x01040016, "type": "Int16"},
-    "TAG_EMS_PARAM_WALLBOX_SETPOINT_L1": {"tagvalue": 0x01040017, "type": "Int32"},
-    "TAG_EMS_PARAM_WALLBOX_SETPOINT_L2": {"tagvalue": 0x01040018, "type": "Int32"},
-    "TAG_EMS_PARAM_WALLBOX_SETPOINT_L3": {"tagvalue": 0x01040019, "type": "Int32"},
-    "TAG_EMS_PARAM_REGULATOR_MODE": {"tagvalue": 0x01040113, "type": "UChar8"},
-    "TAG_EMS_PARAM_REGULATOR_STRATEGY": {"tagvalue": 0x01040114, "type": "UChar8"},
-    "TAG_EMS_PARAM_DEACTIVATE_SURPLUS_ACTOR": {
-        "tagvalue": 0x01040115,
-        "type": "UChar8",
-    },
-    "TAG_EMS_PARAM_POWER_GRID_OFFSET_L1": {"tagvalue": 0x01040294, "type": "Uint32"},
-    "TAG_EMS_PARAM_POWER_GRID_OFFSET_L2": {"tagvalue": 0x01040295, "type": "Uint32"},
-    "TAG_EMS_PARAM_POWER_GRID_OFFSET_L3": {"tagvalue": 0x01040296, "type": "Uint32"},
-    "TAG_EMS_PARAM_POWER_GRID_OVERRIDE_L1": {"tagvalue": 0x01040297, "type": "Uint32"},
-    "TAG_EMS_PARAM_POWER_GRID_OVERRIDE_L2": {"tagvalue": 0x01040298, "type": "Uint32"},
-    "TAG_EMS_PARAM_POWER_GRID_OVERRIDE_L3": {"tagvalue": 0x01040299, "type": "Uint32"},
-    "TAG_EMS_REQ_ALIVE": {"tagvalue": 0x01050000, "type": "Bool"},
-    "TAG_EMS_PARAM_MANIPULATOR_STATUS": {"tagvalue": 0x01400000, "type": "Char8"},
-    "TAG_EMS_MANIPULATOR_EVENT": {"tagvalue": 0x01400001, "type": "Container"},
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_MAX_ROWS": {
-        "tagvalue": 0x01400002,
-        "type": "Int16",
-    },
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_TIME_START": {
-        "tagvalue": 0x01400003,
-        "type": "Uint64",
-    },
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_TIME_END": {
-        "tagvalue": 0x01400004,
-        "type": "Uint64",
-    },
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_POWER": {"tagvalue": 0x01400005, "type": "Int32"},
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_TYPE": {"tagvalue": 0x01400006, "type": "Int32"},
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_SOURCE": {
-        "tagvalue": 0x01400007,
-        "type": "CString",
-    },
-    "TAG_EMS_PARAM_MANIPULATOR_EVENT_ID": {"tagvalue": 0x01400008, "type": "CString"},
-    "TAG_EMS_MANIPULATOR_EVENT_PUSH_DATA_SAVED": {
-        "tagvalue": 0x01400009,
-        "type": "CString",
-    },
-    "TAG_EMS_MANIPULATOR_EVENT_PUSH_WAIT_FOR": {
-        "tagvalue": 0x0140000A,
-        "type": "UInt16",
-    },
-    "TAG_EMS_DPP_PROTOCOL_MAJOR_VERSION": {"tagvalue": 0x0140000B, "type": "UInt16"},
-    "TAG_EMS_DPP_PROTOCOL_MINOR_VERSION": {"tagvalue": 0x0140000C, "type": "UInt16"},
-    "TAG_EMS_DPP_ERROR_CODE": {"tagvalue": 0x0140000D, "type": "Int16"},
-    "TAG_EMS_DPP_ERROR_MESSAGE": {"tagvalue": 0x0140000E, "type": "CString"},
-    "TAG_EMS_DPP_CONSTRAINT_SERIAL_NO": {"tagvalue": 0x0140000F, "type": "CString"},
-    "TAG_EMS_DPP_CONSTRAINT_INSTALLATION_ID": {
-        "tagvalue": 0x01400010,
-        "type": "CString",
-    },
-    "TAG_EMS_DPP_CONSTRAINT_START_TIMESTAMP": {
-        "tagvalue": 0x01400011,
-        "type": "Uint64",
-    },
-    "TAG_EMS_DPP_CONSTRAINT_DURATION_MS": {"tagvalue": 0x01400012, "type": "Uint64"},
-    "TAG_EMS_DPP_ENERGY_PRICES_DATA": {"tagvalue": 0x01400013, "type": "Container"},
-    "TAG_EMS_DPP_GRID_CONSUMPTION_DATA": {"tagvalue": 0x01400014, "type": "Container"},
-    "TAG_EMS_DPP_CONSTRAINT_START_OFFSET_MS": {
-        "tagvalue": 0x01400015,
-        "type": "Uint64",
-    },
-    "TAG_EMS_DPP_PRICES": {"tagvalue": 0x01400016, "type": "Container"},
-    "TAG_EMS_DPP_PRICE_LOWER_BORDER": {"tagvalue": 0x01400017, "type": "Int64"},
-    "TAG_EMS_DPP_PRICE_VALUE": {"tagvalue": 0x01400018, "type": "Float32"},
-    "TAG_EMS_DPP_GRID_FEED_IN_DATA": {"tagvalue": 0x01400019, "type": "Container"},
-    "TAG_EMS_PARAM_LIMITS_TOTAL_MAX": {"tagvalue": 0x01400265, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_TOTAL_MIN": {"tagvalue": 0x01400266, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_PHASE_MAX_L1": {"tagvalue": 0x01400267, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_PHASE_MAX_L2": {"tagvalue": 0x01400268, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_PHASE_MAX_L3": {"tagvalue": 0x01400269, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_PHASE_MIN_L1": {"tagvalue": 0x01400270, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_PHASE_MIN_L2": {"tagvalue": 0x01400271, "type": "Int32"},
-    "TAG_EMS_PARAM_LIMITS_PHASE_MIN_L3": {"tagvalue": 0x01400272, "type": "Int32"},
-    "TAG_EMS_PARAM_CURR_CHARGED_ENERGY_EP_RESERVE": {
-        "tagvalue": 0x01400278,
-        "type": "Float32",
-    },
-    "TAG_EMS_REQ_SET_TOTAL_EP_RESERVE_W": {"tagvalue": 0x01400279, "type": "Float32"},
-    "TAG_EMS_IDLE_PERIOD_2": {"tagvalue": 0x0140027A, "type": "Container"},
-    "TAG_EMS_DERATE_TO_PERCENT": {"tagvalue": 0x0140027B, "type": "UChar8"},
-    "TAG_EMS_DERATE_TO_POWER": {"tagvalue": 0x0140027C, "type": "Uint32"},
-    "TAG_EMS_DERATE_UNTIL_TIMESTAMP_MS": {"tagvalue": 0x0140027D, "type": "Uint64"},
-    "TAG_EMS_SMGW_USE_CASES": {"tagvalue": 0x01800000, "type": "Container"},
-    "TAG_EMS_POWER_PV": {"tagvalue": 0x01800001, "type": "Int32"},
-    "TAG_EMS_POWER_BAT": {"tagvalue": 0x01800002, "type": "Int32"},
-    "TAG_EMS_POWER_HOME": {"tagvalue": 0x01800003, "type": "Int32"},
-    "TAG_EMS_POWER_GRID": {"tagvalue": 0x01800004, "type": "Int32"},
-    "TAG_EMS_POWER_ADD": {"tagvalue": 0x01800005, "type": "Int32"},
-    "TAG_EMS_AUTARKY": {"tagvalue": 0x01800006, "type": "Float32"},
-    "TAG_EMS_SELF_CONSUMPTION": {"tagvalue": 0x01800007, "type": "Float32"},
-    "TAG_EMS_BAT_SOC": {"tagvalue": 0x01800008, "type": "UChar8"},
-    "TAG_EMS_COUPLING_MODE": {"tagvalue": 0x01800009, "type": "UChar8"},
-    "TAG_EMS_STORED_ERRORS": {"tagvalue": 0x0180000A, "type": "Container"},
-    "TAG_EMS_ERROR_CONTAINER": {"tagvalue": 0x0180000B, "type": "Container"},
-    "TAG_EMS_ERROR_TYPE": {"tagvalue": 0x0180000C, "type": "UChar8"},
-    "TAG_EMS_ERROR_SOURCE": {"tagvalue": 0x0180000D, "type": "CString"},
-    "TAG_EMS_ERROR_MESSAGE": {"tagvalue": 0x0180000E, "type": "CString"},
-    "TAG_EMS_ERROR_CODE": {"tagvalue": 0x0180000F, "type": "Int32"},
-    "TAG_EMS_ERROR_TIMESTAMP": {"tagvalue": 0x01800010, "type": "Uint64"},
-    "TAG_EMS_MODE": {"tagvalue": 0x01800011, "type": "UChar8"},
-    "TAG_EMS_BALANCED_PHASES": {"tagvalue": 0x01800012, "type": "UChar8"},
-    "TAG_EMS_INSTALLED_PEAK_POWER": {"tagvalue": 0x01800013, "type": "Uint32"},
-    "TAG_EMS_DERATE_AT_PERCENT_VALUE": {"tagvalue": 0x01800014, "type": "Float32"},
-    "TAG_EMS_DERATE_AT_POWER_VALUE": {"tagvalue": 0x01800015, "type": "Float32"},
-    "TAG_EMS_ERROR_BUZZER_ENABLED": {"tagvalue": 0x01800016, "type": "Bool"},
-    "TAG_EMS_SET_BALANCED_PHASES": {"tagvalue": 0x01800017, "type": "Bool"},
-    "TAG_EMS_SET_INSTALLED_PEAK_POWER": {"tagvalue": 0x01800018, "type": "Bool"},
-    "TAG_EMS_SET_DERATE_PERCENT": {"tagvalue": 0x01800019, "type": "Bool"},
-    "TAG_EMS_SET_ERROR_BUZZER_ENABLED": {"tagvalue": 0x0180001A, "type": "Bool"},
-    "TAG_EMS_START_ADJUST_BATTERY_VOLTAGE": {"tagvalue": 0x0180001B, "type": "Bool"},
-    "TAG_EMS_CANCEL_ADJUST_BATTERY_VOLTAGE": {"tagvalue": 0x0180001C, "type": "Bool"},
-    "TAG_EMS_ADJUST_BATTERY_VOLTAGE_STATUS": {"tagvalue": 0x0180001D, "type": "Uint32"},
-    "TAG_EMS_CONFIRM_ERRORS": {"tagvalue": 0x0180001E, "type": "Bool"},
-    "TAG_EMS_POWER_WB_ALL": {"tagvalue": 0x0180001F, "type": "Int32"},
-    "TAG_EMS_POWER_WB_SOLAR": {"tagvalue": 0x01800020, "type": "Int32"},
-    "TAG_EMS_EXT_SRC_AVAILABLE": {"tagvalue": 0x01800021, "type": "Char8"},
-    "TAG_EMS_RESCUE_BAT_MODE": {"tagvalue": 0x01800022, "type": "Bool"},
-    "TAG_EMS_IS_PV_DERATING": {"tagvalue": 0x01800024, "type": "Bool"},
-    "TAG_EMS_AC_POWER_LIMIT": {"tagvalue": 0x01800025, "type": "Container"},
-    "TAG_EMS_POWER_ADD_SINKS": {"tagvalue": 0x01800026, "type": "Int32"},
-    "TAG_EMS_SET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01800027, "type": "Bool"},
-    "TAG_EMS_GET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01800028, "type": "Bool"},
-    "TAG_EMS_SET_MAX_EP_WALLBOX_POWER_W": {"tagvalue": 0x01800029, "type": "Uint32"},
-    "TAG_EMS_GET_MAX_EP_WALLBOX_POWER_W": {"tagvalue": 0x0180002A, "type": "Uint32"},
-    "TAG_EMS_GET_MIN_EP_WALLBOX_POWER_W": {"tagvalue": 0x0180002B, "type": "Uint32"},
-    "TAG_EMS_SET_MIN_EP_WALLBOX_POWER_W": {"tagvalue": 0x0180002C, "type": "Uint32"},
-    "TAG_EMS_SET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0180002D, "type": "Uint32"},
-    "TAG_EMS_GET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0180002E, "type": "Uint32"},
-    "TAG_EMS_SET_IDLE_PERIODS_2": {"tagvalue": 0x0180002F, "type": "UChar8"},
-    "TAG_EMS_SET_POWER": {"tagvalue": 0x01800030, "type": "Int32"},
-    "TAG_EMS_GET_IDLE_PERIODS_2": {"tagvalue": 0x01800033, "type": "Container"},
-    "TAG_EMS_SET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01800034, "type": "Bool"},
-    "TAG_EMS_GET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01800035, "type": "Bool"},
-    "TAG_EMS_SET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01800038, "type": "Bool"},
-    "TAG_EMS_GET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01800039, "type": "UChar8"},
-    "TAG_EMS_MANIPULATOR_COLLECTION": {"tagvalue": 0x0180003B, "type": "Container"},
-    "TAG_EMS_MANIPULATOR_EVENT_TOTAL_COUNT": {"tagvalue": 0x0180003C, "type": "Int32"},
-    "TAG_EMS_STATUS": {"tagvalue": 0x01800040, "type": "UChar8"},
-    "TAG_EMS_USED_CHARGE_LIMIT": {"tagvalue": 0x01800041, "type": "Int32"},
-    "TAG_EMS_BAT_CHARGE_LIMIT": {"tagvalue": 0x01800042, "type": "Int32"},
-    "TAG_EMS_DCDC_CHARGE_LIMIT": {"tagvalue": 0x01800043, "type": "Int32"},
-    "TAG_EMS_USER_CHARGE_LIMIT": {"tagvalue": 0x01800044, "type": "Int32"},
-    "TAG_EMS_USED_DISCHARGE_LIMIT": {"tagvalue": 0x01800045, "type": "Int32"},
-    "TAG_EMS_BAT_DISCHARGE_LIMIT": {"tagvalue": 0x01800046, "type": "Int32"},
-    "TAG_EMS_DCDC_DISCHARGE_LIMIT": {"tagvalue": 0x01800047, "type": "Int32"},
-    "TAG_EMS_USER_DISCHARGE_LIMIT": {"tagvalue": 0x01800048, "type": "Int32"},
-    "TAG_EMS_SET_POWER_CONTROL_OFFSET": {"tagvalue": 0x01800060, "type": "Int32"},
-    "TAG_EMS_REMAINING_BAT_CHARGE_POWER": {"tagvalue": 0x01800071, "type": "Uint32"},
-    "TAG_EMS_REMAINING_BAT_DISCHARGE_POWER": {"tagvalue": 0x01800072, "type": "Uint32"},
-    "TAG_EMS_EMERGENCY_POWER_STATUS": {"tagvalue": 0x01800073, "type": "UChar8"},
-    "TAG_EMS_SET_EMERGENCY_POWER": {"tagvalue": 0x01800074, "type": "Bool"},
-    "TAG_EMS_SET_OVERRIDE_AVAILABLE_POWER": {"tagvalue": 0x01800075, "type": "Bool"},
-    "TAG_EMS_SET_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01800076, "type": "UChar8"},
-    "TAG_EMS_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01800077, "type": "UChar8"},
-    "TAG_EMS_SET_BATTERY_BEFORE_CAR_MODE": {"tagvalue": 0x01800078, "type": "UChar8"},
-    "TAG_EMS_BATTERY_BEFORE_CAR_MODE": {"tagvalue": 0x01800079, "type": "UChar8"},
-    "TAG_EMS_GET_IDLE_PERIODS": {"tagvalue": 0x01800080, "type": "Container"},
-    "TAG_EMS_SET_IDLE_PERIODS": {"tagvalue": 0x01800081, "type": "UChar8"},
-    "TAG_EMS_IDLE_PERIOD_CHANGE_MARKER": {"tagvalue": 0x0180008A, "type": "UChar8"},
-    "TAG_EMS_GET_POWER_SETTINGS": {"tagvalue": 0x0180008B, "type": "Container"},
-    "TAG_EMS_SET_POWER_SETTINGS": {"tagvalue": 0x0180008C, "type": "Container"},
-    "TAG_EMS_SETTINGS_CHANGE_MARKER": {"tagvalue": 0x0180008D, "type": "UChar8"},
-    "TAG_EMS_GET_MANUAL_CHARGE": {"tagvalue": 0x0180008E, "type": "Container"},
-    "TAG_EMS_START_MANUAL_CHARGE": {"tagvalue": 0x0180008F, "type": "Bool"},
-    "TAG_EMS_START_EMERGENCYPOWER_TEST": {"tagvalue": 0x01800090, "type": "UChar8"},
-    "TAG_EMS_GET_GENERATOR_STATE": {"tagvalue": 0x01800091, "type": "UChar8"},
-    "TAG_EMS_SET_GENERATOR_MODE": {"tagvalue": 0x01800092, "type": "UChar8"},
-    "TAG_EMS_EMERGENCYPOWER_TEST_STATUS": {"tagvalue": 0x01800093, "type": "Container"},
-    "TAG_EMS_GET_SYS_SPECS": {"tagvalue": 0x01800098, "type": "Container"},
-    "TAG_EMS_RES_POWER_LIMITS_USED": {"tagvalue": 0x01800100, "type": "Char8"},
-    "TAG_EMS_RES_MAX_CHARGE_POWER": {"tagvalue": 0x01800101, "type": "Char8"},
-    "TAG_EMS_RES_MAX_DISCHARGE_POWER": {"tagvalue": 0x01800102, "type": "Char8"},
-    "TAG_EMS_RES_DISCHARGE_START_POWER": {"tagvalue": 0x01800103, "type": "Char8"},
-    "TAG_EMS_RES_POWERSAVE_ENABLED": {"tagvalue": 0x01800104, "type": "Char8"},
-    "TAG_EMS_RES_WEATHER_REGULATED_CHARGE_ENABLED": {
-        "tagvalue": 0x01800105,
-        "type": "Char8",
-    },
-    "TAG_EMS_RES_WEATHER_FORECAST_MODE": {"tagvalue": 0x01800106, "type": "Char8"},
-    "TAG_EMS_RES_POWERSAVE_TIMEOUT": {"tagvalue": 0x01800107, "type": "Uint32"},
-    "TAG_EMS_REMOTE_CONTROL ": {"tagvalue": 0x01800200, "type": "UChar8"},
-    "TAG_EMS_DEACTIVATE_REMOTE_CONTROL": {"tagvalue": 0x01800201, "type": "UChar8"},
-    "TAG_EMS_IP_REMOTE_CONTROL": {"tagvalue": 0x01800202, "type": "CString"},
-    "TAG_EMS_EP_DELAY": {"tagvalue": 0x01800203, "type": "UChar8"},
-    "TAG_EMS_SET_EP_DELAY": {"tagvalue": 0x01800204, "type": "UChar8"},
-    "TAG_EMS_REMOTE_CONTROL_STATUS": {"tagvalue": 0x01800205, "type": "Container"},
-    "TAG_EMS_IDLE_PERIOD_MIN_SOC_UCB": {"tagvalue": 0x01800206, "type": "UChar8"},
-    "TAG_EMS_IDLE_PERIOD_MAX_SOC_UCB": {"tagvalue": 0x01800207, "type": "UChar8"},
-    "TAG_EMS_SET_IDLE_PERIOD_MIN_SOC_UCB": {"tagvalue": 0x01800208, "type": "UChar8"},
-    "TAG_EMS_SET_IDLE_PERIOD_MAX_SOC_UCB": {"tagvalue": 0x01800209, "type": "UChar8"},
-    "TAG_EMS_REGULATOR_MODE": {"tagvalue": 0x01800210, "type": "UChar8"},
-    "TAG_EMS_SET_REGULATOR_MODE": {"tagvalue": 0x01800211, "type": "UChar8"},
-    "TAG_EMS_SUPPORTED_REGULATOR_MODES": {"tagvalue": 0x01800212, "type": "UChar8"},
-    "TAG_EMS_EMERGENCY_POWER_OVERLOAD_STATUS": {
-        "tagvalue": 0x01800213,
-        "type": "Container",
-    },
-    "TAG_EMS_EMERGENCY_POWER_RETRY": {"tagvalue": 0x01800214, "type": "Bool"},
-    "TAG_EMS_DETECT_PHASE_OFFSET": {"tagvalue": 0x01800217, "type": "UChar8"},
-    "TAG_EMS_PHASE_DETECTION_STATUS": {"tagvalue": 0x01800218, "type": "UChar8"},
-    "TAG_EMS_PHASE_OFFSET": {"tagvalue": 0x01800219, "type": "UChar8"},
-    "TAG_EMS_ABORT_PHASE_DETECTION": {"tagvalue": 0x01800220, "type": "UChar8"},
-    "TAG_EMS_REGULATOR_STRATEGY": {"tagvalue": 0x01800221, "type": "UChar8"},
-    "TAG_EMS_SET_REGULATOR_STRATEGY": {"tagvalue": 0x01800222, "type": "UChar8"},
-    "TAG_EMS_POWER_PV_AC_OUT": {"tagvalue": 0x01800223, "type": "Container"},
-    "TAG_EMS_PV_ENERGY": {"tagvalue": 0x01800224, "type": "Container"},
-    "TAG_EMS_PARAM_AC_ENERGY_OUT": {"tagvalue": 0x01800225, "type": "UInt16"},
-    "TAG_EMS_PARAM_AC_ENERGY_IN": {"tagvalue": 0x01800226, "type": "UInt16"},
-    "TAG_EMS_PARAM_DC_IN": {"tagvalue": 0x01800227, "type": "UInt16"},
-    "TAG_EMS_ENERGY_STORAGE_MODEL": {"tagvalue": 0x01800228, "type": "Container"},
-    "TAG_EMS_PARAM_CURR_CHARGED_ENERGY": {"tagvalue": 0x01800229, "type": "Float32"},
-    "TAG_EMS_PARAM_FULL_CHARGED_ENERGY_EP_RESERVE": {
-        "tagvalue": 0x01800230,
-        "type": "Float32",
-    },
-    "TAG_EMS_PARAM_DESIGN_ENERGY": {"tagvalue": 0x01800231, "type": "Float32"},
-    "TAG_EMS_PARAM_FULL_CHARGED_ENERGY": {"tagvalue": 0x01800232, "type": "Float32"},
-    "TAG_EMS_PARAM_USED_CAPACITY": {"tagvalue": 0x01800233, "type": "Float32"},
-    "TAG_EMS_SPECIFICATION_VALUES": {"tagvalue": 0x01800234, "type": "Container"},
-    "TAG_EMS_PARAM_MAX_CHARGE_POWER": {"tagvalue": 0x01800235, "type": "Int32"},
-    "TAG_EMS_PARAM_MAX_DISCHARGE_POWER": {"tagvalue": 0x01800236, "type": "Int32"},
-    "TAG_EMS_PARAM_MAX_PV_POWER": {"tagvalue": 0x01800237, "type": "Int32"},
-    "TAG_EMS_PARAM_MAX_AC_POWER": {"tagvalue": 0x01800238, "type": "Int32"},
-    "TAG_EMS_PARAM_INSTALLED_BAT_CAP": {"tagvalue": 0x01800239, "type": "Int32"},
-    "TAG_EMS_PARAM_HYBRIT_SUPPORTED": {"tagvalue": 0x01800240, "type": "Bool"},
-    "TAG_EMS_PARAM_INIT_STATUS": {"tagvalue": 0x01800241, "type": "Int32"},
-    "TAG_EMS_EP_RESERVE": {"tagvalue": 0x01800242, "type": "Float32"},
-    "TAG_EMS_SEC_LIMITS": {"tagvalue": 0x01800243, "type": "Container"},
-    "TAG_EMS_PARAM_SEL_TOTAL_MAX": {"tagvalue": 0x01800244, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_TOTAL_MIN": {"tagvalue": 0x01800245, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_PHASE_MAX_L1": {"tagvalue": 0x01800246, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_PHASE_MAX_L2": {"tagvalue": 0x01800247, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_PHASE_MAX_L3": {"tagvalue": 0x01800248, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_PHASE_MIN_L1": {"tagvalue": 0x01800249, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_PHASE_MIN_L2": {"tagvalue": 0x01800250, "type": "Int32"},
-    "TAG_EMS_PARAM_SEL_PHASE_MIN_L3": {"tagvalue": 0x01800251, "type": "Int32"},
-    "TAG_EMS_SEC_DEVICE_STATUS": {"tagvalue": 0x01800252, "type": "Container"},
-    "TAG_EMS_PARAM_PVI_1": {"tagvalue": 0x01800253, "type": "Uint32"},
-    "TAG_EMS_PARAM_PVI_2": {"tagvalue": 0x01800254, "type": "Uint32"},
-    "TAG_EMS_PARAM_PVI_3": {"tagvalue": 0x01800255, "type": "Uint32"},
-    "TAG_EMS_PARAM_DCDC": {"tagvalue": 0x01800256, "type": "Uint32"},
-    "TAG_EMS_PARAM_BAT": {"tagvalue": 0x01800257, "type": "Uint32"},
-    "TAG_EMS_BAT_CURRENT_IN": {"tagvalue": 0x01800258, "type": "Float32"},
-    "TAG_EMS_BAT_CURRENT_OUT": {"tagvalue": 0x01800259, "type": "Float32"},
-    "TAG_EMS_MAX_DC_POWER": {"tagvalue": 0x01800260, "type": "Container"},
-    "TAG_EMS_AC_REACTIVE_POWER": {"tagvalue": 0x01800261, "type": "Container"},
-    "TAG_EMS_GET_PARTIAL_GRID": {"tagvalue": 0x01800263, "type": "Bool"},
-    "TAG_EMS_ESTIMATED_POWER_LIMITS": {"tagvalue": 0x01800264, "type": "Container"},
-    "TAG_EMS_DESIGN_POWER_LIMITS": {"tagvalue": 0x01800265, "type": "Container"},
-    "TAG_EMS_SET_CAN_ID_FEED_IN_REDUCTION": {"tagvalue": 0x01800266, "type": "Int32"},
-    "TAG_EMS_CAN_ID_FEED_IN_REDUCTION": {"tagvalue": 0x01800267, "type": "Int32"},
-    "TAG_EMS_SET_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01800268, "type": "Int32"},
-    "TAG_EMS_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01800269, "type": "Int32"},
-    "TAG_EMS_SET_WALLBOX_MODE": {"tagvalue": 0x01800270, "type": "UChar8"},
-    "TAG_EMS_GET_WALLBOX_MODE": {"tagvalue": 0x01800271, "type": "UChar8"},
-    "TAG_EMS_SET_MAX_FUSE_POWER": {"tagvalue": 0x01800272, "type": "Uint32"},
-    "TAG_EMS_GET_MAX_FUSE_POWER": {"tagvalue": 0x01800273, "type": "Uint32"},
-    "TAG_EMS_SET_CONNECTED_POWER": {"tagvalue": 0x01800274, "type": "Uint32"},
-    "TAG_EMS_GET_CONNECTED_POWER": {"tagvalue": 0x01800275, "type": "Uint32"},
-    "TAG_EMS_DERATE_AT_CONNECTED_POWER": {"tagvalue": 0x01800276, "type": "Bool"},
-    "TAG_EMS_SET_DERATE_AT_CONNECTED_POWER": {"tagvalue": 0x01800277, "type": "Bool"},
-    "TAG_EMS_SET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
-        "tagvalue": 0x0180027A,
-        "type": "Bool",
-    },
-    "TAG_EMS_GET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
-        "tagvalue": 0x0180027B,
-        "type": "Bool",
-    },
-    "TAG_EMS_SET_WB_DISCHARGE_BAT_UNTIL": {"tagvalue": 0x0180027C, "type": "Bool"},
-    "TAG_EMS_GET_WB_DISCHARGE_BAT_UNTIL": {"tagvalue": 0x0180027D, "type": "UChar8"},
-    "TAG_EMS_WB_AVAILABLE": {"tagvalue": 0x01800280, "type": "Bool"},
-    "TAG_EMS_WB_PREFERRED_CHARGE_POWER": {"tagvalue": 0x01800281, "type": "Int32"},
-    "TAG_EMS_SET_PEAK_SHAVING_POWER": {"tagvalue": 0x01800282, "type": "None"},
-    "TAG_EMS_GET_PEAK_SHAVING_POWER": {"tagvalue": 0x01800283, "type": "Uint32"},
-    "TAG_EMS_GET_RUNSCREENVALUES": {"tagvalue": 0x01800284, "type": "Container"},
-    "TAG_EMS_SET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01800286, "type": "UInt16"},
-    "TAG_EMS_GET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01800287, "type": "Container"},
-    "TAG_EMS_SET_LIST_ACTOR": {"tagvalue": 0x01800288, "type": "UInt16"},
-    "TAG_EMS_GET_LIST_ACTOR": {"tagvalue": 0x01800289, "type": "Container"},
-    "TAG_EMS_ACTOR_ITEM": {"tagvalue": 0x01800290, "type": "Container"},
-    "TAG_EMS_ACTOR_ID": {"tagvalue": 0x01800291, "type": "CString"},
-    "TAG_EMS_ACTOR_NAME": {"tagvalue": 0x01800292, "type": "CString"},
-    "TAG_EMS_ACTOR_PRIORITY": {"tagvalue": 0x01800293, "type": "Uint32"},
-    "TAG_EMS_PERIOD_ITEM": {"tagvalue": 0x01800300, "type": "Container"},
-    "TAG_EMS_PERIOD_ACTIVE": {"tagvalue": 0x01800301, "type": "Bool"},
-    "TAG_EMS_PERIOD_NAME": {"tagvalue": 0x01800302, "type": "CString"},
-    "TAG_EMS_PERIOD_WEEKDAYS": {"tagvalue": 0x01800303, "type": "UChar8"},
-    "TAG_EMS_PERIOD_START": {"tagvalue": 0x01800304, "type": "Uint32"},
-    "TAG_EMS_PERIOD_STOP": {"tagvalue": 0x01800305, "type": "Uint32"},
-    "TAG_EMS_PERIOD_POWER": {"tagvalue": 0x01800306, "type": "Int32"},
-    "TAG_EMS_WB_BIC_LOAD_PRICE_POWER_TABLE": {"tagvalue": 0x01800307, "type": "Bool"},
-    "TAG_EMS_WB_BIC_PRICE_POWER_TABLE_STATUS": {"tagvalue": 0x01800308, "type": "None"},
-    "TAG_EMS_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01800309, "type": "Bool"},
-    "TAG_EMS_ALIVE": {"tagvalue": 0x01850000, "type": "None"},
-    "TAG_EMS_SET_TOTAL_EP_RESERVE_W": {"tagvalue": 0x01C00279, "type": "Bool"},
-    "TAG_EMS_SET_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01C0027A, "type": "Bool"},
-    "TAG_EMS_GET_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01C0027B, "type": "Container"},
-    "TAG_EMS_GENERAL_ERROR": {"tagvalue": 0x01FFFFFF, "type": "Error"},
-    "TAG_PVI_REQ_GET_POSSIBLE_ELETRICAL_SYSTEM_TYPES": {
-        "tagvalue": 0x02000000,
-        "type": "None",
-    },
-    "TAG_PVI_REQ_ON_GRID": {"tagvalue": 0x02000001, "type": "None"},
-    "TAG_PVI_REQ_STATE": {"tagvalue": 0x02000002, "type": "None"},
-    "TAG_PVI_REQ_LAST_ERROR": {"tagvalue": 0x02000003, "type": "None"},
-    "TAG_PVI_REQ_IS_FLASHING": {"tagvalue": 0x02000004, "type": "None"},
-    "TAG_PVI_REQ_START_FLASHING": {"tagvalue": 0x02000005, "type": "CString"},
-    "TAG_PVI_REQ_FLASH_FILE_LIST": {"tagvalue": 0x02000006, "type": "None"},
-    "TAG_PVI_REQ_SERVICE_PROGRESS_STATE": {"tagvalue": 0x02000008, "type": "None"},
-    "TAG_PVI_REQ_TYPE": {"tagvalue": 0x02000009, "type": "None"},
-    "TAG_PVI_REQ_GET_GAPP_LAST_CHANGE_TIME": {"tagvalue": 0x0200000A, "type": "None"},
-    "TAG_PVI_REQ_GET_GAPP_SYNC_TIME": {"tagvalue": 0x0200000B, "type": "None"},
-    "TAG_PVI_REQ_SET_GAPP_SYNC_TIME": {"tagvalue": 0x0200000C, "type": "Int64"},
-    "TAG_PVI_REQ_SET_TYPE_OF_ELECTRICAL_SYSTEM": {
-        "tagvalue": 0x0200000D,
-        "type": "Char8",
-    },
-    "TAG_PVI_REQ_GET_TYPE_OF_ELECTRICAL_SYSTEM": {
-        "tagvalue": 0x0200000E,
-        "type": "None",
-    },
-    "TAG_PVI_REQ_LAND_CODE": {"tagvalue": 0x02000010, "type": "None"},
-    "TAG_PVI_REQ_LAND_CODE_LIST": {"tagvalue": 0x02000011, "type": "None"},
-    "TAG_PVI_REQ_SET_LAND_CODE": {"tagvalue": 0x02000012, "type": "CString"},
-    "TAG_PVI_REQ_ERROR_LIST": {"tagvalue": 0x02000013, "type": "None"},
-    "TAG_PVI_ERROR_LIST": {"tagvalue": 0x02000014, "type": "Container"},
-    "TAG_PVI_REQ_STATUS_LIST": {"tagvalue": 0x02000015, "type": "None"},
-    "TAG_PVI_STATUS_LIST": {"tagvalue": 0x02000016, "type": "Container"},
-    "TAG_PVI_REQ_SET_DEVICE_SILENCE": {"tagvalue": 0x02000017, "type": "Bool"},
-    "TAG_PVI_REQ_DEVICE_SILENCE": {"tagvalue": 0x02000018, "type": "None"},
-    "TAG_PVI_REQ_SELF_TEST": {"tagvalue": 0x02000019, "type": "UChar8"},
-    "TAG_PVI_REQ_SET_FREE_INVERTER": {"tagvalue": 0x02000020, "type": "None"},
-    "TAG_PVI_REQ_SET_BLOCK_INVERTER": {"tagvalue": 0x02000021, "type": "None"},
-    "TAG_PVI_REQ_UZK_VOLTAGE": {"tagvalue": 0x02000050, "type": "None"},
-    "TAG_PVI_REQ_COS_PHI": {"tagvalue": 0x02000060, "type": "None"},
-    "TAG_PVI_REQ_SET_COS_PHI": {"tagvalue": 0x02000061, "type": "Container"},
-    "TAG_PVI_COS_PHI_VALUE": {"tagvalue": 0x02000062, "type": "Float32"},
-    "TAG_PVI_COS_PHI_IS_AKTIV": {"tagvalue": 0x02000063, "type": "Bool"},
-    "TAG_PVI_COS_PHI_EXCITED": {"tagvalue": 0x02000064, "type": "UChar8"},
-    "TAG_PVI_REQ_VOLTAGE_MONITORING": {"tagvalue": 0x02000070, "type": "None"},
-    "TAG_PVI_REQ_SET_VOLTAGE_MONITORING": {"tagvalue": 0x02000071, "type": "Container"},
-    "TAG_PVI_VOLTAGE_MONITORING_THRESHOLD_TOP": {
-        "tagvalue": 0x02000072,
-        "type": "Float32",
-    },
-    "TAG_PVI_VOLTAGE_MONITORING_THRESHOLD_BOTTOM": {
-        "tagvalue": 0x02000073,
-        "type": "Float32",
-    },
-    "TAG_PVI_VOLTAGE_MONITORING_SLOPE_UP": {"tagvalue": 0x02000074, "type": "Float32"},
-    "TAG_PVI_VOLTAGE_MONITORING_SLOPE_DOWN": {
-        "tagvalue": 0x02000075,
-        "type": "Float32",
-    },
-    "TAG_PVI_REQ_FREQUENCY_UNDER_OVER": {"tagvalue": 0x02000080, "type": "None"},
-    "TAG_PVI_REQ_SET_FREQUENCY_UNDER_OVER": {
-        "tagvalue": 0x02000081,
-        "type": "Container",
-    },
-    "TAG_PVI_FREQUENCY_UNDER": {"tagvalue": 0x02000082, "type": "Float32"},
-    "TAG_PVI_FREQUENCY_OVER": {"tagvalue": 0x02000083, "type": "Float32"},
-    "TAG_PVI_REQ_SET_SYSTEM_MODE": {"tagvalue": 0x02000084, "type": "UChar8"},
-    "TAG_PVI_REQ_SYSTEM_MODE": {"tagvalue": 0x02000085, "type": "None"},
-    "TAG_PVI_REQ_SET_POWER_MODE": {"tagvalue": 0x02000086, "type": "UChar8"},
-    "TAG_PVI_REQ_POWER_MODE": {"tagvalue": 0x02000087, "type": "None"},
-    "TAG_PVI_REQ_USED_STRING_COUNT": {"tagvalue": 0x02000090, "type": "None"},
-    "TAG_PVI_REQ_SET_USED_STRING_COUNT": {"tagvalue": 0x02000091, "type": "UChar8"},
-    "TAG_PVI_REQ_DERATE_TO_POWER": {"tagvalue": 0x02000092, "type": "Float32"},
-    "TAG_PVI_REQ_TEMPERATURE": {"tagvalue": 0x02000100, "type": "UChar8"},
-    "TAG_PVI_REQ_TEMPERATURE_COUNT": {"tagvalue": 0x02000101, "type": "UChar8"},
-    "TAG_PVI_REQ_MAX_TEMPERATURE": {"tagvalue": 0x02000102, "type": "UChar8"},
-    "TAG_PVI_REQ_MIN_TEMPERATURE": {"tagvalue": 0x02000103, "type": "UChar8"},
-    "TAG_PVI_REQ_CT_TAR_USV_BOX": {"tagvalue": 0x02000104, "type": "None"},
-    "TAG_PVI_REQ_ROTARY_FIELD_DIRECTION": {"tagvalue": 0x02000105, "type": "None"},
-    "TAG_PVI_REQ_DATA": {"tagvalue": 0x02040000, "type": "Container"},
-    "TAG_PVI_INDEX": {"tagvalue": 0x02040001, "type": "UInt16"},
-    "TAG_PVI_VALUE": {"tagvalue": 0x02040005, "type": "None", "type_variable": True},
-    "TAG_PVI_REQ_DEVICE_STATE": {"tagvalue": 0x02060000, "type": "None"},
-    "TAG_PVI_REQ_SERIAL_NUMBER": {"tagvalue": 0x020ABC01, "type": "None"},
-    "TAG_PVI_REQ_VERSION": {"tagvalue": 0x020ABC02, "type": "None"},
-    "TAG_PVI_VERSION_MAIN": {"tagvalue": 0x020ABC03, "type": "CString"},
-    "TAG_PVI_VERSION_PIC": {"tagvalue": 0x020ABC04, "type": "CString"},
-    "TAG_PVI_VERSION_ALL": {"tagvalue": 0x020ABC05, "type": "CString"},
-    "TAG_PVI_REQ_GAPP_JSON": {"tagvalue": 0x020ABC13, "type": "None"},
-    "TAG_PVI_REQ_GAPP_JSON_MD5": {"tagvalue": 0x020ABC14, "type": "None"},
-    "TAG_PVI_REQ_SET_RESET_GPIO": {"tagvalue": 0x020ABC50, "type": "Bool"},
-    "TAG_PVI_REQ_SET_POWEROFF_GPIO": {"tagvalue": 0x020ABC51, "type": "Bool"},
-    "TAG_PVI_REQ_SET_NIGHTSWITCH_GPIO": {"tagvalue": 0x020ABC52, "type": "Bool"},
-    "TAG_PVI_REQ_SET_PRE_GRID_CHARGE": {"tagvalue": 0x020ABC60, "type": "None"},
-    "TAG_PVI_REQ_AC_MAX_PHASE_COUNT": {"tagvalue": 0x020AC000, "type": "None"},
-    "TAG_PVI_REQ_AC_POWER": {"tagvalue": 0x020AC001, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_VOLTAGE": {"tagvalue": 0x020AC002, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_CURRENT": {"tagvalue": 0x020AC003, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_APPARENTPOWER": {"tagvalue": 0x020AC004, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_REACTIVEPOWER": {"tagvalue": 0x020AC005, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_ENERGY_ALL": {"tagvalue": 0x020AC006, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_MAX_APPARENTPOWER": {"tagvalue": 0x020AC007, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_ENERGY_DAY": {"tagvalue": 0x020AC008, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_ENERGY_GRID_CONSUMPTION": {
-        "tagvalue": 0x020AC009,
-        "type": "UChar8",
-    },
-    "TAG_PVI_REQ_AC_FREQUENCY": {"tagvalue": 0x020AC00A, "type": "UChar8"},
-    "TAG_PVI_REQ_INVERTER_COUNT": {"tagvalue": 0x020CCCC9, "type": "None"},
-    "TAG_PVI_REQ_DC_MAX_STRING_COUNT": {"tagvalue": 0x020DC000, "type": "None"},
-    "TAG_PVI_REQ_DC_POWER": {"tagvalue": 0x020DC001, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_VOLTAGE": {"tagvalue": 0x020DC002, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_CURRENT": {"tagvalue": 0x020DC003, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_MAX_POWER": {"tagvalue": 0x020DC004, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_MAX_VOLTAGE": {"tagvalue": 0x020DC005, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_MIN_VOLTAGE": {"tagvalue": 0x020DC006, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_MAX_CURRENT": {"tagvalue": 0x020DC007, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_MIN_CURRENT": {"tagvalue": 0x020DC008, "type": "UChar8"},
-    "TAG_PVI_REQ_DC_STRING_ENERGY_ALL": {"tagvalue": 0x020DC009, "type": "UChar8"},
-    "TAG_PVI_REQ_AC_ENERGY_PRODUCED_L1": {"tagvalue": 0x020DC00A, "type": "None"},
-    "TAG_PVI_REQ_AC_ENERGY_PRODUCED_L2": {"tagvalue": 0x020DC00B, "type": "None"},
-    "TAG_PVI_REQ_AC_ENERGY_PRODUCED_L3": {"tagvalue": 0x020DC00C, "type": "None"},
-    "TAG_PVI_REQ_AC_ENERGY_CONSUMED_L1": {"tagvalue": 0x020DC00D, "type": "None"},
-    "TAG_PVI_REQ_AC_ENERGY_CONSUMED_L2": {"tagvalue": 0x020DC00E, "type": "None"},
-    "TAG_PVI_REQ_AC_ENERGY_CONSUMED_L3": {"tagvalue": 0x020DC00F, "type": "None"},
-    "TAG_PVI_REQ_ENABLE_FAN_TEST": {"tagvalue": 0x020DC010, "type": "None"},
-    "TAG_PVI_REQ_DISABLE_FAN_TEST": {"tagvalue": 0x020DC011, "type": "None"},
-    "TAG_PVI_REQ_RESET_LAND_NORM": {"tagvalue": 0x020DC012, "type": "None"},
-    "TAG_PVI_REQ_IS_FAN_INSTALLED": {"tagvalue": 0x020DC013, "type": "None"},
-    "TAG_PVI_GET_POSSIBLE_ELETRICAL_SYSTEM_TYPES": {
-        "tagvalue": 0x02800000,
-        "type": "UChar8",
-    },
-    "TAG_PVI_ON_GRID": {"tagvalue": 0x02800001, "type": "Bool"},
-    "TAG_PVI_STATE": {"tagvalue": 0x02800002, "type": "CString"},
-    "TAG_PVI_LAST_ERROR": {"tagvalue": 0x02800003, "type": "CString"},
-    "TAG_PVI_IS_FLASHING": {"tagvalue": 0x02800004, "type": "Bool"},
-    "TAG_PVI_FLASH_FILE_LIST": {"tagvalue": 0x02800006, "type": "Container"},
-    "TAG_PVI_FLASH_FILE": {"tagvalue": 0x02800007, "type": "CString"},
-    "TAG_PVI_SERVICE_PROGRESS_STATE": {"tagvalue": 0x02800008, "type": "Float32"},
-    "TAG_PVI_TYPE": {"tagvalue": 0x02800009, "type": "UChar8"},
-    "TAG_PVI_GET_GAPP_LAST_CHANGE_TIME": {"tagvalue": 0x0280000A, "type": "Int64"},
-    "TAG_PVI_GET_GAPP_SYNC_TIME": {"tagvalue": 0x0280000B, "type": "Int64"},
-    "TAG_PVI_SET_GAPP_SYNC_TIME": {"tagvalue": 0x0280000C, "type": "None"},
-    "TAG_PVI_SET_TYPE_OF_ELECTRICAL_SYSTEM": {"tagvalue": 0x0280000D, "type": "Char8"},
-    "TAG_PVI_GET_TYPE_OF_ELECTRICAL_SYSTEM": {"tagvalue": 0x0280000E, "type": "Char8"},
-    "TAG_PVI_LAND_CODE": {"tagvalue": 0x02800010, "type": "CString"},
-    "TAG_PVI_LAND_CODE_LIST": {"tagvalue": 0x02800011, "type": "Container"},
-    "TAG_PVI_ERROR_STRING": {"tagvalue": 0x02800013, "type": "CString"},
-    "TAG_PVI_STATUS_STRING": {"tagvalue": 0x02800015, "type": "CString"},
-    "TAG_PVI_DEVICE_SILENCE": {"tagvalue": 0x02800018, "type": "Bool"},
-    "TAG_PVI_SELF_TEST": {"tagvalue": 0x02800019, "type": "UChar8"},
-    "TAG_PVI_SET_FREE_INVERTER": {"tagvalue": 0x02800020, "type": "Bool"},
-    "TAG_PVI_SET_BLOCK_INVERTER": {"tagvalue": 0x02800021, "type": "Bool"},
-    "TAG_PVI_UZK_VOLTAGE": {"tagvalue": 0x02800050, "type": "Float32"},
-    "TAG_PVI_COS_PHI": {"tagvalue": 0x02800060, "type": "Container"},
-    "TAG_PVI_VOLTAGE_MONITORING": {"tagvalue": 0x02800070, "type": "Container"},
-    "TAG_PVI_FREQUENCY_UNDER_OVER": {"tagvalue": 0x02800080, "type": "Container"},
-    "TAG_PVI_SET_FREQUENCY_UNDER_OVER": {"tagvalue": 0x02800081, "type": "Bool"},
-    "TAG_PVI_SET_SYSTEM_MODE": {"tagvalue": 0x02800084, "type": "UChar8"},
-    "TAG_PVI_SYSTEM_MODE": {"tagvalue": 0x02800085, "type": "UChar8"},
-    "TAG_PVI_SET_POWER_MODE": {"tagvalue": 0x02800086, "type": "UChar8"},
-    "TAG_PVI_POWER_MODE": {"tagvalue": 0x02800087, "type": "UChar8"},
-    "TAG_PVI_USED_STRING_COUNT": {"tagvalue": 0x02800090, "type": "UChar8"},
-    "TAG_PVI_DERATE_TO_POWER": {"tagvalue": 0x02800092, "type": "UChar8"},
-    "TAG_PVI_TEMPERATURE": {"tagvalue": 0x02800100, "type": "Container"},
-    "TAG_PVI_TEMPERATURE_COUNT": {"tagvalue": 0x02800101, "type": "None"},
-    "TAG_PVI_MAX_TEMPERATURE": {"tagvalue": 0x02800102, "type": "Float32"},
-    "TAG_PVI_MIN_TEMPERATURE": {"tagvalue": 0x02800103, "type": "Float32"},
-    "TAG_PVI_CT_TAR_USV_BOX": {"tagvalue": 0x02800104, "type": "UChar8"},
-    "TAG_PVI_ROTARY_FIELD_DIRECTION": {"tagvalue": 0x02800105, "type": "Int16"},
-    "TAG_PVI_DATA": {"tagvalue": 0x02840000, "type": "Container"},
-    "TAG_PVI_DEVICE_STATE": {"tagvalue": 0x02860000, "type": "Container"},
-    "TAG_PVI_DEVICE_CONNECTED": {"tagvalue": 0x02860001, "type": "Bool"},
-    "TAG_PVI_DEVICE_WORKING": {"tagvalue": 0x02860002, "type": "Bool"},
-    "TAG_PVI_DEVICE_IN_SERVICE": {"tagvalue": 0x02860003, "type": "Bool"},
-    "TAG_PVI_SERIAL_NUMBER": {"tagvalue": 0x028ABC01, "type": "CString"},
-    "TAG_PVI_VERSION": {"tagvalue": 0x028ABC02, "type": "Container"},
-    "TAG_PVI_GAPP_JSON": {"tagvalue": 0x028ABC13, "type": "CString"},
-    "TAG_PVI_GAPP_JSON_MD5": {"tagvalue": 0x028ABC14, "type": "CString"},
-    "TAG_PVI_AC_MAX_PHASE_COUNT": {"tagvalue": 0x028AC000, "type": "UChar8"},
-    "TAG_PVI_AC_POWER": {"tagvalue": 0x028AC001, "type": "Container"},
-    "TAG_PVI_AC_VOLTAGE": {"tagvalue": 0x028AC002, "type": "Container"},
-    "TAG_PVI_AC_CURRENT": {"tagvalue": 0x028AC003, "type": "Container"},
-    "TAG_PVI_AC_APPARENTPOWER": {"tagvalue": 0x028AC004, "type": "Container"},
-    "TAG_PVI_AC_REACTIVEPOWER": {"tagvalue": 0x028AC005, "type": "Container"},
-    "TAG_PVI_AC_ENERGY_ALL": {"tagvalue": 0x028AC006, "type": "Container"},
-    "TAG_PVI_AC_MAX_APPARENTPOWER": {"tagvalue": 0x028AC007, "type": "Container"},
-    "TAG_PVI_AC_ENERGY_DAY": {"tagvalue": 0x028AC008, "type": "Container"},
-    "TAG_PVI_AC_ENERGY_GRID_CONSUMPTION": {"tagvalue": 0x028AC009, "type": "Container"},
-    "TAG_PVI_AC_FREQUENCY": {"tagvalue": 0x028AC00A, "type": "Container"},
-    "TAG_PVI_INVERTER_COUNT": {"tagvalue": 0x028CCCC9, "type": "UInt16"},
-    "TAG_PVI_DC_MAX_STRING_COUNT": {"tagvalue": 0x028DC000, "type": "UChar8"},
-    "TAG_PVI_DC_POWER": {"tagvalue": 0x028DC001, "type": "Container"},
-    "TAG_PVI_DC_VOLTAGE": {"tagvalue": 0x028DC002, "type": "Container"},
-    "TAG_PVI_DC_CURRENT": {"tagvalue": 0x028DC003, "type": "Container"},
-    "TAG_PVI_DC_MAX_POWER": {"tagvalue": 0x028DC004, "type": "Container"},
-    "TAG_PVI_DC_MAX_VOLTAGE": {"tagvalue": 0x028DC005, "type": "Container"},
-    "TAG_PVI_DC_MIN_VOLTAGE": {"tagvalue": 0x028DC006, "type": "Container"},
-    "TAG_PVI_DC_MAX_CURRENT": {"tagvalue": 0x028DC007, "type": "Container"},
-    "TAG_PVI_DC_MIN_CURRENT": {"tagvalue": 0x028DC008, "type": "Container"},
-    "TAG_PVI_DC_STRING_ENERGY_ALL": {"tagvalue": 0x028DC009, "type": "Container"},
-    "TAG_PVI_AC_ENERGY_PRODUCED_L1": {"tagvalue": 0x028DC00A, "type": "Double64"},
-    "TAG_PVI_AC_ENERGY_PRODUCED_L2": {"tagvalue": 0x028DC00B, "type": "Double64"},
-    "TAG_PVI_AC_ENERGY_PRODUCED_L3": {"tagvalue": 0x028DC00C, "type": "Double64"},
-    "TAG_PVI_AC_ENERGY_CONSUMED_L1": {"tagvalue": 0x028DC00D, "type": "Double64"},
-    "TAG_PVI_AC_ENERGY_CONSUMED_L2": {"tagvalue": 0x028DC00E, "type": "Double64"},
-    "TAG_PVI_AC_ENERGY_CONSUMED_L3": {"tagvalue": 0x028DC00F, "type": "Double64"},
-    "TAG_PVI_RESET_LAND_NORM": {"tagvalue": 0x028DC012, "type": "Bool"},
-    "TAG_PVI_IS_FAN_INSTALLED": {"tagvalue": 0x028DC013, "type": "Bool"},
-    "TAG_PVI_GENERAL_ERROR": {"tagvalue": 0x02FFFFFF, "type": "Error"},
-    "TAG_BAT_REQ_RSOC": {"tagvalue": 0x03000001, "type": "None"},
-    "TAG_BAT_REQ_MODULE_VOLTAGE": {"tagvalue": 0x03000002, "type": "None"},
-    "TAG_BAT_REQ_CURRENT": {"tagvalue": 0x03000003, "type": "None"},
-    "TAG_BAT_REQ_MAX_BAT_VOLTAGE": {"tagvalue": 0x03000004, "type": "None"},
-    "TAG_BAT_REQ_MAX_CHARGE_CURRENT": {"tagvalue": 0x03000005, "type": "None"},
-    "TAG_BAT_REQ_EOD_VOLTAGE": {"tagvalue": 0x03000006, "type": "None"},
-    "TAG_BAT_REQ_MAX_DISCHARGE_CURRENT": {"tagvalue": 0x03000007, "type": "None"},
-    "TAG_BAT_REQ_CHARGE_CYCLES": {"tagvalue": 0x03000008, "type": "None"},
-    "TAG_BAT_REQ_TERMINAL_VOLTAGE": {"tagvalue": 0x03000009, "type": "None"},
-    "TAG_BAT_REQ_STATUS_CODE": {"tagvalue": 0x0300000A, "type": "None"},
-    "TAG_BAT_REQ_ERROR_CODE": {"tagvalue": 0x0300000B, "type": "None"},
-    "TAG_BAT_REQ_DEVICE_NAME": {"tagvalue": 0x0300000C, "type": "None"},
-    "TAG_BAT_REQ_DCB_COUNT": {"tagvalue": 0x0300000D, "type": "None"},
-    "TAG_BAT_REQ_RSOC_REAL": {"tagvalue": 0x0300000E, "type": "None"},
-    "TAG_BAT_REQ_ASOC": {"tagvalue": 0x0300000F, "type": "None"},
-    "TAG_BAT_REQ_FCC": {"tagvalue": 0x03000010, "type": "None"},
-    "TAG_BAT_REQ_RC": {"tagvalue": 0x03000011, "type": "None"},
-    "TAG_BAT_REQ_MAX_DCB_CELL_CURRENT": {"tagvalue": 0x03000012, "type": "None"},
-    "TAG_BAT_REQ_MIN_DCB_CELL_CURRENT": {"tagvalue": 0x03000013, "type": "None"},
-    "TAG_BAT_REQ_MAX_DCB_CELL_VOLTAGE": {"tagvalue": 0x03000014, "type": "None"},
-    "TAG_BAT_REQ_MIN_DCB_CELL_VOLTAGE": {"tagvalue": 0x03000015, "type": "None"},
-    "TAG_BAT_REQ_MAX_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03000016, "type": "None"},
-    "TAG_BAT_REQ_MIN_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03000017, "type": "None"},
-    "TAG_BAT_REQ_DCB_ALL_CELL_TEMPERATURES": {"tagvalue": 0x03000018, "type": "UChar8"},
-    "TAG_BAT_REQ_DCB_ALL_CELL_VOLTAGES": {"tagvalue": 0x0300001A, "type": "UChar8"},
-    "TAG_BAT_REQ_OPEN_BREAKER": {"tagvalue": 0x0300001C, "type": "None"},
-    "TAG_BAT_REQ_OPEN_BREAKER_CONFIRM": {"tagvalue": 0x0300001D, "type": "None"},
-    "TAG_BAT_REQ_READY_FOR_SHUTDOWN": {"tagvalue": 0x0300001E, "type": "None"},
-    "TAG_BAT_REQ_FIRMWARE_VERSION": {"tagvalue": 0x0300001F, "type": "None"},
-    "TAG_BAT_REQ_INFO": {"tagvalue": 0x03000020, "type": "None"},
-    "TAG_BAT_REQ_TRAINING_MODE": {"tagvalue": 0x03000021, "type": "None"},
-    "TAG_BAT_REQ_UPDATE_STATUS": {"tagvalue": 0x03000022, "type": "None"},
-    "TAG_BAT_REQ_SET_TRAINING_MODE": {"tagvalue": 0x03000023, "type": "UChar8"},
-    "TAG_BAT_REQ_TIME_LAST_RESPONSE": {"tagvalue": 0x03000024, "type": "None"},
-    "TAG_BAT_REQ_MANUFACTURER_NAME": {"tagvalue": 0x03000025, "type": "None"},
-    "TAG_BAT_REQ_USABLE_CAPACITY": {"tagvalue": 0x03000026, "type": "None"},
-    "TAG_BAT_REQ_USABLE_REMAINING_CAPACITY": {"tagvalue": 0x03000027, "type": "None"},
-    "TAG_BAT_REQ_SET_A1_DATA": {"tagvalue": 0x03000028, "type": "Container"},
-    "TAG_BAT_REQ_SET_A1_MODE": {"tagvalue": 0x03000029, "type": "UChar8"},
-    "TAG_BAT_REQ_DELETE_DCB_TYPE": {"tagvalue": 0x0300002A, "type": "None"},
-    "TAG_BAT_REQ_DCB_TYPE": {"tagvalue": 0x0300002B, "type": "None"},
-    "TAG_BAT_REQ_PV_CHARGE_MODE": {"tagvalue": 0x0300002C, "type": "None"},
-    "TAG_BAT_REQ_SET_PV_CHARGE_MODE": {"tagvalue": 0x0300002D, "type": "Bool"},
-    "TAG_BAT_REQ_SET_A1_VOLTAGE": {"tagvalue": 0x03000030, "type": "Float32"},
-    "TAG_BAT_REQ_SET_A1_CURRENT": {"tagvalue": 0x03000031, "type": "Float32"},
-    "TAG_BAT_REQ_CONTROL_CODE": {"tagvalue": 0x03000032, "type": "None"},
-    "TAG_BAT_REQ_BPM_STATUS": {"tagvalue": 0x03000033, "type": "None"},
-    "TAG_BAT_REQ_DCB_ERROR_LIST": {"tagvalue": 0x03000034, "type": "None"},
-    "TAG_BAT_REQ_DCB_INFO": {"tagvalue": 0x03000042, "type": "Uint32"},
-    "TAG_BAT_REQ_SPECIFICATION": {"tagvalue": 0x03000043, "type": "Container"},
-    "TAG_BAT_REQ_INTERNALS": {"tagvalue": 0x03000044, "type": "Container"},
-    "TAG_BAT_REQ_DESIGN_CAPACITY": {"tagvalue": 0x03000045, "type": "None"},
-    "TAG_BAT_REQ_DESIGN_VOLTAGE": {"tagvalue": 0x03000046, "type": "None"},
-    "TAG_BAT_REQ_CHARGE_HIGH_TEMP": {"tagvalue": 0x03000047, "type": "None"},
-    "TAG_BAT_REQ_CHARGE_LOW_TEMP": {"tagvalue": 0x03000048, "type": "None"},
-    "TAG_BAT_REQ_MANUFACTURE_DATE": {"tagvalue": 0x03000049, "type": "None"},
-    "TAG_BAT_REQ_SERIALNO": {"tagvalue": 0x03000050, "type": "None"},
-    "TAG_BAT_REQ_DATA_TABLE_VERSION": {"tagvalue": 0x03000051, "type": "None"},
-    "TAG_BAT_REQ_PROTOCOL_VERSION": {"tagvalue": 0x03000052, "type": "None"},
-    "TAG_BAT_REQ_PCB_VERSION": {"tagvalue": 0x03000053, "type": "None"},
-    "TAG_BAT_REQ_TOTAL_USE_TIME": {"tagvalue": 0x03000054, "type": "None"},
-    "TAG_BAT_REQ_TOTAL_DISCHARGE_TIME": {"tagvalue": 0x03000055, "type": "None"},
-    "TAG_BAT_REQ_AVAILABLE_BATTERIES": {"tagvalue": 0x03000056, "type": "None"},
-    "TAG_BAT_REQ_OPEN_FET": {"tagvalue": 0x03000060, "type": "Bool"},
-    "TAG_BAT_REQ_FET_STATE": {"tagvalue": 0x03000061, "type": "None"},
-    "TAG_BAT_REQ_BATTERY_SOFT_ON": {"tagvalue": 0x03000062, "type": "None"},
-    "TAG_BAT_REQ_SET_BAT_VOLT_ADJUSTMENT": {
-        "tagvalue": 0x03000063,
-        "type": "Container",
-    },
-    "TAG_BAT_REQ_BAT_VOLT_ADJUSTMENT": {"tagvalue": 0x03000064, "type": "Container"},
-    "TAG_BAT_REQ_BAT_VOLT_ADJ_READY_INDEX": {"tagvalue": 0x03000065, "type": "None"},
-    "TAG_BAT_REQ_DISCHARGE_UNTIL_EMPTY_STATE": {"tagvalue": 0x03000092, "type": "None"},
-    "TAG_BAT_REQ_SET_DISCHARGE_UNTIL_EMPTY": {"tagvalue": 0x03000094, "type": "Int32"},
-    "TAG_BAT_REQ_CONTROL_STATE": {"tagvalue": 0x03000095, "type": "None"},
-    "TAG_BAT_REQ_INTERNAL_STATE": {"tagvalue": 0x03000096, "type": "None"},
-    "TAG_BAT_REQ_IS_BREAKER_OPEN": {"tagvalue": 0x03000097, "type": "None"},
-    "TAG_BAT_REQ_CLOSE_BREAKER": {"tagvalue": 0x03000098, "type": "None"},
-    "TAG_BAT_REQ_DATA": {"tagvalue": 0x03040000, "type": "Container"},
-    "TAG_BAT_INDEX": {"tagvalue": 0x03040001, "type": "UInt16"},
-    "TAG_BAT_REQ_DEVICE_STATE": {"tagvalue": 0x03060000, "type": "None"},
-    "TAG_BAT_PARAM_BAT_VOLT_STATUS": {"tagvalue": 0x03400001, "type": "Int32"},
-    "TAG_BAT_PARAM_BAT_VOLT_TARGET_VALUE": {"tagvalue": 0x03400002, "type": "Float32"},
-    "TAG_BAT_PARAM_BAT_VOLT_MIN_VOLTAGE": {"tagvalue": 0x03400003, "type": "Float32"},
-    "TAG_BAT_PARAM_BAT_VOLT_MAX_VOLTAGE": {"tagvalue": 0x03400004, "type": "Float32"},
-    "TAG_BAT_PARAM_BAT_VOLT_ENABLED": {"tagvalue": 0x03400005, "type": "Bool"},
-    "TAG_BAT_PARAM_BAT_NUMBER": {"tagvalue": 0x03400006, "type": "Int32"},
-    "TAG_BAT_PARAM_RACK_NUMBER": {"tagvalue": 0x03400007, "type": "Int32"},
-    "TAG_BAT_RSOC": {"tagvalue": 0x03800001, "type": "Float32"},
-    "TAG_BAT_MODULE_VOLTAGE": {"tagvalue": 0x03800002, "type": "Float32"},
-    "TAG_BAT_CURRENT": {"tagvalue": 0x03800003, "type": "Float32"},
-    "TAG_BAT_MAX_BAT_VOLTAGE": {"tagvalue": 0x03800004, "type": "Float32"},
-    "TAG_BAT_MAX_CHARGE_CURRENT": {"tagvalue": 0x03800005, "type": "Float32"},
-    "TAG_BAT_EOD_VOLTAGE": {"tagvalue": 0x03800006, "type": "Float32"},
-    "TAG_BAT_MAX_DISCHARGE_CURRENT": {"tagvalue": 0x03800007, "type": "Float32"},
-    "TAG_BAT_CHARGE_CYCLES": {"tagvalue": 0x03800008, "type": "Uint32"},
-    "TAG_BAT_TERMINAL_VOLTAGE": {"tagvalue": 0x03800009, "type": "Float32"},
-    "TAG_BAT_STATUS_CODE": {"tagvalue": 0x0380000A, "type": "Bitfield"},
-    "TAG_BAT_ERROR_CODE": {"tagvalue": 0x0380000B, "type": "Bitfield"},
-    "TAG_BAT_DEVICE_NAME": {"tagvalue": 0x0380000C, "type": "CString"},
-    "TAG_BAT_DCB_COUNT": {"tagvalue": 0x0380000D, "type": "UChar8"},
-    "TAG_BAT_RSOC_REAL": {"tagvalue": 0x0380000E, "type": "Float32"},
-    "TAG_BAT_ASOC": {"tagvalue": 0x0380000F, "type": "Float32"},
-    "TAG_BAT_FCC": {"tagvalue": 0x03800010, "type": "Float32"},
-    "TAG_BAT_RC": {"tagvalue": 0x03800011, "type": "Float32"},
-    "TAG_BAT_MAX_DCB_CELL_CURRENT": {"tagvalue": 0x03800012, "type": "Float32"},
-    "TAG_BAT_MIN_DCB_CELL_CURRENT": {"tagvalue": 0x03800013, "type": "Float32"},
-    "TAG_BAT_MAX_DCB_CELL_VOLTAGE": {"tagvalue": 0x03800014, "type": "Float32"},
-    "TAG_BAT_MIN_DCB_CELL_VOLTAGE": {"tagvalue": 0x03800015, "type": "Float32"},
-    "TAG_BAT_MAX_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03800016, "type": "Float32"},
-    "TAG_BAT_MIN_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03800017, "type": "Float32"},
-    "TAG_BAT_DCB_ALL_CELL_TEMPERATURES": {"tagvalue": 0x03800018, "type": "Container"},
-    "TAG_BAT_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03800019, "type": "Float32"},
-    "TAG_BAT_DCB_ALL_CELL_VOLTAGES": {"tagvalue": 0x0380001A, "type": "Container"},
-    "TAG_BAT_DCB_CELL_VOLTAGE": {"tagvalue": 0x0380001B, "type": "Float32"},
-    "TAG_BAT_OPEN_BREAKER": {"tagvalue": 0x0380001C, "type": "Bool"},
-    "TAG_BAT_OPEN_BREAKER_CONFIRM": {"tagvalue": 0x0380001D, "type": "Bool"},
-    "TAG_BAT_READY_FOR_SHUTDOWN": {"tagvalue": 0x0380001E, "type": "Bool"},
-    "TAG_BAT_FIRMWARE_VERSION": {"tagvalue": 0x0380001F, "type": "UInt16"},
-    "TAG_BAT_INFO": {"tagvalue": 0x03800020, "type": "Container"},
-    "TAG_BAT_TRAINING_MODE": {"tagvalue": 0x03800021, "type": "UChar8"},
-    "TAG_BAT_UPDATE_STATUS": {"tagvalue": 0x03800022, "type": "UInt16"},
-    "TAG_BAT_TIME_LAST_RESPONSE": {"tagvalue": 0x03800024, "type": "Uint64"},
-    "TAG_BAT_MANUFACTURER_NAME": {"tagvalue": 0x03800025, "type": "CString"},
-    "TAG_BAT_USABLE_CAPACITY": {"tagvalue": 0x03800026, "type": "Float32"},
-    "TAG_BAT_USABLE_REMAINING_CAPACITY": {"tagvalue": 0x03800027, "type": "Float32"},
-    "TAG_BAT_SET_A1_DATA": {"tagvalue": 0x03800028, "type": "Bool"},
-    "TAG_BAT_DELETE_DCB_TYPE": {"tagvalue": 0x0380002A, "type": "Bool"},
-    "TAG_BAT_DCB_TYPE": {"tagvalue": 0x0380002B, "type": "CString"},
-    "TAG_BAT_PV_CHARGE_MODE": {"tagvalue": 0x0380002C, "type": "Bool"},
-    "TAG_BAT_CONTROL_CODE": {"tagvalue": 0x03800032, "type": "Uint32"},
-    "TAG_BAT_BPM_STATUS": {"tagvalue": 0x03800033, "type": "UInt16"},
-    "TAG_BAT_DCB_ERROR_LIST": {"tagvalue": 0x03800034, "type": "UInt16"},
-    "TAG_BAT_DCB_INFO": {"tagvalue": 0x03800042, "type": "Container"},
-    "TAG_BAT_SPECIFICATION": {"tagvalue": 0x03800043, "type": "Container"},
-    "TAG_BAT_INTERNALS": {"tagvalue": 0x03800044, "type": "Container"},
-    "TAG_BAT_DESIGN_CAPACITY": {"tagvalue": 0x03800045, "type": "Double64"},
-    "TAG_BAT_DESIGN_VOLTAGE": {"tagvalue": 0x03800046, "type": "Double64"},
-    "TAG_BAT_CHARGE_HIGH_TEMP": {"tagvalue": 0x03800047, "type": "Int32"},
-    "TAG_BAT_CHARGE_LOW_TEMP": {"tagvalue": 0x03800048, "type": "Int32"},
-    "TAG_BAT_MANUFACTURE_DATE": {"tagvalue": 0x03800049, "type": "Int32"},
-    "TAG_BAT_SERIALNO": {"tagvalue": 0x03800050, "type": "Int32"},
-    "TAG_BAT_DATA_TABLE_VERSION": {"tagvalue": 0x03800051, "type": "Int32"},
-    "TAG_BAT_PROTOCOL_VERSION": {"tagvalue": 0x03800052, "type": "Int32"},
-    "TAG_BAT_PCB_VERSION": {"tagvalue": 0x03800053, "type": "Int32"},
-    "TAG_BAT_TOTAL_USE_TIME": {"tagvalue": 0x03800054, "type": "Int32"},
-    "TAG_BAT_TOTAL_DISCHARGE_TIME": {"tagvalue": 0x03800055, "type": "Int32"},
-    "TAG_BAT_AVAILABLE_BATTERIES": {"tagvalue": 0x03800057, "type": "Container"},
-    "TAG_BAT_BATTERY_SPEC": {"tagvalue": 0x03800058, "type": "Container"},
-    "TAG_BAT_INSTANCE_DESCRIPTOR": {"tagvalue": 0x03800059, "type": "CString"},
-    "TAG_BAT_FET_STATE": {"tagvalue": 0x03800061, "type": "Bool"},
-    "TAG_BAT_BATTERY_SOFT_ON": {"tagvalue": 0x03800062, "type": "UChar8"},
-    "TAG_BAT_SET_BAT_VOLT_ADJUSTMENT": {"tagvalue": 0x03800063, "type": "Container"},
-    "TAG_BAT_BAT_VOLT_ADJUSTMENT": {"tagvalue": 0x03800064, "type": "Container"},
-    "TAG_BAT_BAT_VOLT_ADJ_READY_INDEX": {"tagvalue": 0x03800065, "type": "Int32"},
-    "TAG_BAT_DISCHARGE_UNTIL_EMPTY_STATE": {"tagvalue": 0x03800092, "type": "Int32"},
-    "TAG_BAT_SET_DISCHARGE_UNTIL_EMPTY": {"tagvalue": 0x03800094, "type": "Int32"},
-    "TAG_BAT_CONTROL_STATE": {"tagvalue": 0x03800095, "type": "Uint32"},
-    "TAG_BAT_INTERNAL_STATE": {"tagvalue": 0x03800096, "type": "Uint32"},
-    "TAG_BAT_IS_BREAKER_OPEN": {"tagvalue": 0x03800097, "type": "Bool"},
-    "TAG_BAT_CLOSE_BREAKER": {"tagvalue": 0x03800098, "type": "Uint32"},
-    "TAG_BAT_DCB_INDEX": {"tagvalue": 0x03800100, "type": "UInt16"},
-    "TAG_BAT_DCB_LAST_MESSAGE_TIMESTAMP": {"tagvalue": 0x03800101, "type": "Uint64"},
-    "TAG_BAT_DCB_MAX_CHARGE_VOLTAGE": {"tagvalue": 0x03800102, "type": "Float32"},
-    "TAG_BAT_DCB_MAX_CHARGE_CURRENT": {"tagvalue": 0x03800103, "type": "Float32"},
-    "TAG_BAT_DCB_END_OF_DISCHARGE": {"tagvalue": 0x03800104, "type": "Float32"},
-    "TAG_BAT_DCB_MAX_DISCHARGE_CURRENT": {"tagvalue": 0x03800105, "type": "Float32"},
-    "TAG_BAT_DCB_FULL_CHARGE_CAPACITY": {"tagvalue": 0x03800106, "type": "Float32"},
-    "TAG_BAT_DCB_REMAINING_CAPACITY": {"tagvalue": 0x03800107, "type": "Float32"},
-    "TAG_BAT_DCB_SOC": {"tagvalue": 0x03800108, "type": "Float32"},
-    "TAG_BAT_DCB_SOH": {"tagvalue": 0x03800109, "type": "Float32"},
-    "TAG_BAT_DCB_CYCLE_COUNT": {"tagvalue": 0x03800110, "type": "Uint32"},
-    "TAG_BAT_DCB_CURRENT": {"tagvalue": 0x03800111, "type": "Float32"},
-    "TAG_BAT_DCB_VOLTAGE": {"tagvalue": 0x03800112, "type": "Float32"},
-    "TAG_BAT_DCB_CURRENT_AVG_30S": {"tagvalue": 0x03800113, "type": "Float32"},
-    "TAG_BAT_DCB_VOLTAGE_AVG_30S": {"tagvalue": 0x03800114, "type": "Float32"},
-    "TAG_BAT_DCB_DESIGN_CAPACITY": {"tagvalue": 0x03800115, "type": "Float32"},
-    "TAG_BAT_DCB_DESIGN_VOLTAGE": {"tagvalue": 0x03800116, "type": "Float32"},
-    "TAG_BAT_DCB_CHARGE_LOW_TEMPERATURE": {"tagvalue": 0x03800117, "type": "Float32"},
-    "TAG_BAT_DCB_CHARGE_HIGH_TEMPERATURE": {"tagvalue": 0x03800118, "type": "Float32"},
-    "TAG_BAT_DCB_MANUFACTURE_DATE": {"tagvalue": 0x03800119, "type": "Uint32"},
-    "TAG_BAT_DCB_SERIALNO": {"tagvalue": 0x03800120, "type": "Uint32"},
-    "TAG_BAT_DCB_PROTOCOL_VERSION": {"tagvalue": 0x03800121, "type": "Uint32"},
-    "TAG_BAT_DCB_FW_VERSION": {"tagvalue": 0x03800122, "type": "Uint32"},
-    "TAG_BAT_DCB_DATA_TABLE_VERSION": {"tagvalue": 0x03800123, "type": "Uint32"},
-    "TAG_BAT_DCB_PCB_VERSION": {"tagvalue": 0x03800124, "type": "Uint32"},
-    "TAG_BAT_SPECIFIED_CAPACITY": {"tagvalue": 0x03800125, "type": "Int32"},
-    "TAG_BAT_SPECIFIED_DSCHARGE_POWER": {"tagvalue": 0x03800126, "type": "Int32"},
-    "TAG_BAT_SPECIFIED_CHARGE_POWER": {"tagvalue": 0x03800127, "type": "Int32"},
-    "TAG_BAT_SPECIFIED_MAX_DCB_COUNT": {"tagvalue": 0x03800128, "type": "Int32"},
-    "TAG_BAT_ROLE": {"tagvalue": 0x03800129, "type": "Int32"},
-    "TAG_BAT_INTERNAL_CURRENT_AVG30": {"tagvalue": 0x03800130, "type": "Double64"},
-    "TAG_BAT_INTERNAL_MTV_AVG30": {"tagvalue": 0x03800131, "type": "Double64"},
-    "TAG_BAT_INTERNAL_MAX_CHARGE_CURRENT": {"tagvalue": 0x03800132, "type": "Double64"},
-    "TAG_BAT_INTERNAL_MAX_DISCHARGE_CURRENT": {
-        "tagvalue": 0x03800133,
-        "type": "Double64",
-    },
-    "TAG_BAT_INTERNAL_MAX_CHARGE_CURR_PER_DCB": {
-        "tagvalue": 0x03800134,
-        "type": "Double64",
-    },
-    "TAG_BAT_INTERNAL_MAX_DISCHARGE_CURR_PER_DCB": {
-        "tagvalue": 0x03800135,
-        "type": "Double64",
-    },
-    "TAG_BAT_INTERNAL_MAX_CHARGE_CURR_DATA_LOG": {
-        "tagvalue": 0x03800136,
-        "type": "Double64",
-    },
-    "TAG_BAT_INTERNAL_MAX_DISCHARGE_CURR_DATA_LOG": {
-        "tagvalue": 0x03800137,
-        "type": "Double64",
-    },
-    "TAG_BAT_DCB_NR_SERIES_CELL": {"tagvalue": 0x03800300, "type": "Uint32"},
-    "TAG_BAT_DCB_NR_PARALLEL_CELL": {"tagvalue": 0x03800301, "type": "Uint32"},
-    "TAG_BAT_DCB_MANUFACTURE_NAME": {"tagvalue": 0x03800302, "type": "CString"},
-    "TAG_BAT_DCB_DEVICE_NAME": {"tagvalue": 0x03800303, "type": "CString"},
-    "TAG_BAT_DCB_SERIALCODE": {"tagvalue": 0x03800304, "type": "CString"},
-    "TAG_BAT_DCB_NR_SENSOR": {"tagvalue": 0x03800305, "type": "Uint32"},
-    "TAG_BAT_DCB_STATUS": {"tagvalue": 0x03800306, "type": "UInt16"},
-    "TAG_BAT_DCB_WARNING": {"tagvalue": 0x03800307, "type": "UInt16"},
-    "TAG_BAT_DCB_ALARM": {"tagvalue": 0x03800308, "type": "UInt16"},
-    "TAG_BAT_DCB_ERROR": {"tagvalue": 0x03800309, "type": "UInt16"},
-    "TAG_BAT_DATA": {"tagvalue": 0x03840000, "type": "Container"},
-    "TAG_BAT_DEVICE_STATE": {"tagvalue": 0x03860000, "type": "Container"},
-    "TAG_BAT_DEVICE_CONNECTED": {"tagvalue": 0x03860001, "type": "Bool"},
-    "TAG_BAT_DEVICE_WORKING": {"tagvalue": 0x03860002, "type": "Bool"},
-    "TAG_BAT_DEVICE_IN_SERVICE": {"tagvalue": 0x03860003, "type": "Bool"},
-    "TAG_BAT_GENERAL_ERROR": {"tagvalue": 0x03FFFFFF, "type": "Error"},
-    "TAG_DCDC_REQ_SET_BAT_CONNECTED": {"tagvalue": 0x04000000, "type": "Bool"},
-    "TAG_DCDC_REQ_I_BAT": {"tagvalue": 0x04000001, "type": "None"},
-    "TAG_DCDC_REQ_U_BAT": {"tagvalue": 0x04000002, "type": "None"},
-    "TAG_DCDC_REQ_P_BAT": {"tagvalue": 0x04000003, "type": "None"},
-    "TAG_DCDC_REQ_I_DCL": {"tagvalue": 0x04000004, "type": "None"},
-    "TAG_DCDC_REQ_U_DCL": {"tagvalue": 0x04000005, "type": "None"},
-    "TAG_DCDC_REQ_P_DCL": {"tagvalue": 0x04000006, "type": "None"},
-    "TAG_DCDC_REQ_SELF_TEST": {"tagvalue": 0x04000007, "type": "Bool"},
-    "TAG_DCDC_REQ_FIRMWARE_VERSION": {"tagvalue": 0x04000008, "type": "None"},
-    "TAG_DCDC_REQ_FPGA_FIRMWARE": {"tagvalue": 0x04000009, "type": "None"},
-    "TAG_DCDC_REQ_SERIAL_NUMBER": {"tagvalue": 0x0400000A, "type": "None"},
-    "TAG_DCDC_REQ_BOARD_VERSION": {"tagvalue": 0x0400000B, "type": "None"},
-    "TAG_DCDC_REQ_FLASH_FILE_LIST": {"tagvalue": 0x0400000C, "type": "None"},
-    "TAG_DCDC_REQ_IS_FLASHING": {"tagvalue": 0x0400000E, "type": "None"},
-    "TAG_DCDC_REQ_FLASH": {"tagvalue": 0x0400000F, "type": "CString"},
-    "TAG_DCDC_REQ_STATUS": {"tagvalue": 0x04000010, "type": "None"},
-    "TAG_DCDC_REQ_STATUS_AS_STRING": {"tagvalue": 0x04000013, "type": "None"},
-    "TAG_DCDC_REQ_GET_BAT_CONNECTED": {"tagvalue": 0x04000016, "type": "None"},
-    "TAG_DCDC_REQ_SET_ZK_SYM_ACTIVE": {"tagvalue": 0x04000017, "type": "Bool"},
-    "TAG_DCDC_REQ_GET_ZK_SYM_ACTIVE": {"tagvalue": 0x04000018, "type": "None"},
-    "TAG_DCDC_REQ_SET_ISO_TEST_REQUESTED": {"tagvalue": 0x04000019, "type": "Bool"},
-    "TAG_DCDC_REQ_GET_ISO_TEST_REQUESTED": {"tagvalue": 0x0400001A, "type": "Bool"},
-    "TAG_DCDC_REQ_GET_ISO_TEST_SUCCESSFULLY_DONE": {
-        "tagvalue": 0x0400001B,
-        "type": "None",
-    },
-    "TAG_DCDC_REQ_GET_BAT_ON": {"tagvalue": 0x0400001C, "type": "None"},
-    "TAG_DCDC_REQ_GET_ZK_SYM_ON": {"tagvalue": 0x0400001D, "type": "None"},
-    "TAG_DCDC_REQ_GET_ISO_ACTIVE": {"tagvalue": 0x0400001E, "type": "None"},
-    "TAG_DCDC_REQ_GET_RELAYS_ON": {"tagvalue": 0x0400001F, "type": "None"},
-    "TAG_DCDC_REQ_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
-        "tagvalue": 0x04000020,
-        "type": "Float32",
-    },
-    "TAG_DCDC_REQ_VERIFY_CORTEX": {"tagvalue": 0x04000021, "type": "CString"},
-    "TAG_DCDC_REQ_FLASH_FPGA": {"tagvalue": 0x04000022, "type": "Container"},
-    "TAG_DCDC_REQ_FLASH_FPGA_FILE_LIST": {"tagvalue": 0x04000023, "type": "None"},
-    "TAG_DCDC_REQ_SELF_TEST_RESULT": {"tagvalue": 0x04000024, "type": "None"},
-    "TAG_DCDC_REQ_FLASH_STATUS": {"tagvalue": 0x04000025, "type": "None"},
-    "TAG_DCDC_REQ_GET_PARAMETER": {"tagvalue": 0x04000026, "type": "Container"},
-    "TAG_DCDC_REQ_SET_PARAMETER": {"tagvalue": 0x04000027, "type": "Container"},
-    "TAG_DCDC_REQ_SET_PID_DEBUG": {"tagvalue": 0x04000028, "type": "Bool"},
-    "TAG_DCDC_REQ_COPY_RING_BUFFER": {"tagvalue": 0x04000029, "type": "None"},
-    "TAG_DCDC_REQ_GET_PID_DEBUG": {"tagvalue": 0x0400002A, "type": "None"},
-    "TAG_DCDC_REQ_PID_DEBUG_DATA": {"tagvalue": 0x0400002B, "type": "None"},
-    "TAG_DCDC_REQ_GET_LAST_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
-        "tagvalue": 0x0400002C,
-        "type": "None",
-    },
-    "TAG_DCDC_REQ_GET_DESIRED_IC": {"tagvalue": 0x0400002D, "type": "None"},
-    "TAG_DCDC_REQ_GET_ISO_VALUE": {"tagvalue": 0x0400002E, "type": "None"},
-    "TAG_DCDC_REQ_BROADCAST_BAT_LIMITS": {"tagvalue": 0x0400002F, "type": "None"},
-    "TAG_DCDC_REQ_RING_BUFFER": {"tagvalue": 0x04000030, "type": "Container"},
-    "TAG_DCDC_REQ_FREE_RING_BUFFER": {"tagvalue": 0x04000031, "type": "None"},
-    "TAG_DCDC_REQ_UNICAST_BAT_LIMITS": {"tagvalue": 0x04000032, "type": "None"},
-    "TAG_DCDC_REQ_SET_POWERSAVE": {"tagvalue": 0x04000033, "type": "Bool"},
-    "TAG_DCDC_REQ_GET_POWERSAVE": {"tagvalue": 0x04000034, "type": "None"},
-    "TAG_DCDC_REQ_GET_HW_CHARACTERISTIC": {"tagvalue": 0x04000035, "type": "UInt16"},
-    "TAG_DCDC_REQ_U_DCL_DIFF": {"tagvalue": 0x04000036, "type": "None"},
-    "TAG_DCDC_REQ_DERATING": {"tagvalue": 0x04000037, "type": "None"},
-    "TAG_DCDC_REQ_DERATING_VALUE": {"tagvalue": 0x04000038, "type": "None"},
-    "TAG_DCDC_REQ_TARGET_POWER": {"tagvalue": 0x04000039, "type": "None"},
-    "TAG_DCDC_REQ_DCL_OPERATION_VOLTAGE": {"tagvalue": 0x04000050, "type": "Uint32"},
-    "TAG_DCDC_REQ_SET_DCL_OPERATION_VOLTAGE": {
-        "tagvalue": 0x04000051,
-        "type": "Container",
-    },
-    "TAG_DCDC_REQ_SET_POWER": {"tagvalue": 0x04000071, "type": "Double64"},
-    "TAG_DCDC_REQ_SET_IDLE": {"tagvalue": 0x04000072, "type": "None"},
-    "TAG_DCDC_REQ_HANDLE_ERRORS": {"tagvalue": 0x04000073, "type": "None"},
-    "TAG_DCDC_REQ_CLEAR_ERRORS": {"tagvalue": 0x04000074, "type": "None"},
-    "TAG_DCDC_REQ_SEND_COMMAND": {"tagvalue": 0x04000075, "type": "None"},
-    "TAG_DCDC_REQ_BROADCAST_COMMAND": {"tagvalue": 0x04000076, "type": "None"},
-    "TAG_DCDC_REQ_ERROR_PENDING": {"tagvalue": 0x04000077, "type": "None"},
-    "TAG_DCDC_REQ_SET_PVI_TYPE": {"tagvalue": 0x04000078, "type": "Int32"},
-    "TAG_DCDC_REQ_PVI_TYPE": {"tagvalue": 0x04000079, "type": "None"},
-    "TAG_DCDC_REQ_ON_GRID": {"tagvalue": 0x04000080, "type": "None"},
-    "TAG_DCDC_REQ_SET_ON_GRID": {"tagvalue": 0x04000081, "type": "Bool"},
-    "TAG_DCDC_REQ_NEXT_SLAVE_STATE": {"tagvalue": 0x04000082, "type": "None"},
-    "TAG_DCDC_REQ_ENABLE_NEXT_SLAVE": {"tagvalue": 0x04000083, "type": "Bool"},
-    "TAG_DCDC_REQ_DCDC_TYPE": {"tagvalue": 0x04000084, "type": "None"},
-    "TAG_DCDC_REQ_SEND_KICKSTART": {"tagvalue": 0x04000085, "type": "Bool"},
-    "TAG_DCDC_REQ_IS_HEALTHY": {"tagvalue": 0x04000086, "type": "None"},
-    "TAG_DCDC_REQ_SET_IS_MULTI_GC": {"tagvalue": 0x04000087, "type": "Char8"},
-    "TAG_DCDC_REQ_SEND_STARTUP_TYPE": {"tagvalue": 0x04000089, "type": "None"},
-    "TAG_DCDC_REQ_SEND_BAT_CHARGING_STATE": {"tagvalue": 0x0400008A, "type": "None"},
-    "TAG_DCDC_REQ_SEND_STANDBY_RELEASE": {"tagvalue": 0x0400008B, "type": "None"},
-    "TAG_DCDC_REQ_DATA": {"tagvalue": 0x04040000, "type": "Container"},
-    "TAG_DCDC_INDEX": {"tagvalue": 0x04040001, "type": "UInt16"},
-    "TAG_DCDC_PARAM_FLASH_PROGRESS": {"tagvalue": 0x04040010, "type": "Double64"},
-    "TAG_DCDC_PARAM_FLASH_TYPE": {"tagvalue": 0x04040011, "type": "Uint32"},
-    "TAG_DCDC_PARAM_FLASHING_ACTIVE": {"tagvalue": 0x04040012, "type": "Bool"},
-    "TAG_DCDC_PARAM_FLASH_MODE": {"tagvalue": 0x04040013, "type": "UChar8"},
-    "TAG_DCDC_PARAM_FLASH_FILE": {"tagvalue": 0x04040014, "type": "CString"},
-    "TAG_DCDC_PARAM_CRC": {"tagvalue": 0x04040015, "type": "Uint32"},
-    "TAG_DCDC_PARAM_PARAMETER_BLOCK": {"tagvalue": 0x04040016, "type": "UChar8"},
-    "TAG_DCDC_PARAM_PARAMETER_INDEX_FROM": {"tagvalue": 0x04040017, "type": "UChar8"},
-    "TAG_DCDC_PARAM_PARAMETER_INDEX_UNTIL": {"tagvalue": 0x04040018, "type": "UChar8"},
-    "TAG_DCDC_PARAM_PARAMETER_VALUE": {"tagvalue": 0x04040019, "type": "UInt16"},
-    "TAG_DCDC_PARAM_RING_BUFFER_ELEMENT": {"tagvalue": 0x04040030, "type": "Container"},
-    "TAG_DCDC_PARAM_RB_ID": {"tagvalue": 0x04040031, "type": "UChar8"},
-    "TAG_DCDC_PARAM_RB_TIME": {"tagvalue": 0x04040032, "type": "Uint64"},
-    "TAG_DCDC_PARAM_RB_I_BAT": {"tagvalue": 0x04040033, "type": "Double64"},
-    "TAG_DCDC_PARAM_RB_U_BAT": {"tagvalue": 0x04040034, "type": "Double64"},
-    "TAG_DCDC_PARAM_RB_I_DCL": {"tagvalue": 0x04040035, "type": "Double64"},
-    "TAG_DCDC_PARAM_RB_U_DCL": {"tagvalue": 0x04040036, "type": "Double64"},
-    "TAG_DCDC_PARAM_RB_MODE": {"tagvalue": 0x04040037, "type": "UChar8"},
-    "TAG_DCDC_PARAM_RB_SUBSTATE": {"tagvalue": 0x04040038, "type": "UChar8"},
-    "TAG_DCDC_PARAM_RB_SETPOINT": {"tagvalue": 0x04040039, "type": "Float32"},
-    "TAG_DCDC_PARAM_RB_INDEX_DCDC": {"tagvalue": 0x04040040, "type": "UChar8"},
-    "TAG_DCDC_PARAM_RB_INDEX_FROM": {"tagvalue": 0x04040041, "type": "Uint32"},
-    "TAG_DCDC_PARAM_RB_INDEX_UNTIL": {"tagvalue": 0x04040042, "type": "Uint32"},
-    "TAG_DCDC_PARAM_DCL_OV_UPPER_VOLTAGE": {"tagvalue": 0x04040050, "type": "Float32"},
-    "TAG_DCDC_PARAM_DCL_OV_LOWER_VOLTAGE": {"tagvalue": 0x04040051, "type": "Float32"},
-    "TAG_DCDC_PARAM_DCL_OV_INDEX": {"tagvalue": 0x04040052, "type": "Uint32"},
-    "TAG_DCDC_REQ_COUNT_HW_CONTROLLER": {"tagvalue": 0x04040060, "type": "None"},
-    "TAG_DCDC_REQ_ENABLE_FAN_TEST": {"tagvalue": 0x04040061, "type": "None"},
-    "TAG_DCDC_REQ_DISABLE_FAN_TEST": {"tagvalue": 0x04040062, "type": "None"},
-    "TAG_DCDC_REQ_DEVICE_STATE": {"tagvalue": 0x04060000, "type": "None"},
-    "TAG_DCDC_SET_BAT_CONNECTED": {"tagvalue": 0x04800000, "type": "Bool"},
-    "TAG_DCDC_I_BAT": {"tagvalue": 0x04800001, "type": "Float32"},
-    "TAG_DCDC_U_BAT": {"tagvalue": 0x04800002, "type": "Float32"},
-    "TAG_DCDC_P_BAT": {"tagvalue": 0x04800003, "type": "Float32"},
-    "TAG_DCDC_I_DCL": {"tagvalue": 0x04800004, "type": "Float32"},
-    "TAG_DCDC_U_DCL": {"tagvalue": 0x04800005, "type": "Float32"},
-    "TAG_DCDC_P_DCL": {"tagvalue": 0x04800006, "type": "Float32"},
-    "TAG_DCDC_SELF_TEST": {"tagvalue": 0x04800007, "type": "Int32"},
-    "TAG_DCDC_FIRMWARE_VERSION": {"tagvalue": 0x04800008, "type": "CString"},
-    "TAG_DCDC_FPGA_FIRMWARE": {"tagvalue": 0x04800009, "type": "CString"},
-    "TAG_DCDC_SERIAL_NUMBER": {"tagvalue": 0x0480000A, "type": "CString"},
-    "TAG_DCDC_BOARD_VERSION": {"tagvalue": 0x0480000B, "type": "UChar8"},
-    "TAG_DCDC_FLASH_FILE_LIST": {"tagvalue": 0x0480000C, "type": "Container"},
-    "TAG_DCDC_FLASH_FILE": {"tagvalue": 0x0480000D, "type": "CString"},
-    "TAG_DCDC_IS_FLASHING": {"tagvalue": 0x0480000E, "type": "Bool"},
-    "TAG_DCDC_FLASH": {"tagvalue": 0x0480000F, "type": "Bool"},
-    "TAG_DCDC_STATUS": {"tagvalue": 0x04800010, "type": "Container"},
-    "TAG_DCDC_STATE": {"tagvalue": 0x04800011, "type": "UChar8"},
-    "TAG_DCDC_SUBSTATE": {"tagvalue": 0x04800012, "type": "UChar8"},
-    "TAG_DCDC_STATUS_AS_STRING": {"tagvalue": 0x04800013, "type": "Container"},
-    "TAG_DCDC_STATE_AS_STRING": {"tagvalue": 0x04800014, "type": "CString"},
-    "TAG_DCDC_SUBSTATE_AS_STRING": {"tagvalue": 0x04800015, "type": "CString"},
-    "TAG_DCDC_GET_BAT_CONNECTED": {"tagvalue": 0x04800016, "type": "Bool"},
-    "TAG_DCDC_SET_ZK_SYM_ACTIVE": {"tagvalue": 0x04800017, "type": "Bool"},
-    "TAG_DCDC_GET_ZK_SYM_ACTIVE": {"tagvalue": 0x04800018, "type": "Bool"},
-    "TAG_DCDC_SET_ISO_TEST_REQUESTED": {"tagvalue": 0x04800019, "type": "None"},
-    "TAG_DCDC_GET_ISO_TEST_REQUESTED": {"tagvalue": 0x0480001A, "type": "Bool"},
-    "TAG_DCDC_GET_ISO_TEST_SUCCESSFULLY_DONE": {"tagvalue": 0x0480001B, "type": "Bool"},
-    "TAG_DCDC_GET_BAT_ON": {"tagvalue": 0x0480001C, "type": "Bool"},
-    "TAG_DCDC_GET_ZK_SYM_ON": {"tagvalue": 0x0480001D, "type": "Bool"},
-    "TAG_DCDC_GET_ISO_ACTIVE": {"tagvalue": 0x0480001E, "type": "Bool"},
-    "TAG_DCDC_GET_RELAYS_ON": {"tagvalue": 0x0480001F, "type": "Bool"},
-    "TAG_DCDC_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
-        "tagvalue": 0x04800020,
-        "type": "Float32",
-    },
-    "TAG_DCDC_VERIFY_CORTEX": {"tagvalue": 0x04800021, "type": "Bool"},
-    "TAG_DCDC_FLASH_FPGA": {"tagvalue": 0x04800022, "type": "Bool"},
-    "TAG_DCDC_FLASH_FPGA_FILE_LIST": {"tagvalue": 0x04800023, "type": "Container"},
-    "TAG_DCDC_SELF_TEST_RESULT": {"tagvalue": 0x04800024, "type": "Uint64"},
-    "TAG_DCDC_FLASH_STATUS": {"tagvalue": 0x04800025, "type": "Container"},
-    "TAG_DCDC_GET_PARAMETER": {"tagvalue": 0x04800026, "type": "Container"},
-    "TAG_DCDC_SET_PARAMETER": {"tagvalue": 0x04800027, "type": "Container"},
-    "TAG_DCDC_COPY_RING_BUFFER": {"tagvalue": 0x04800029, "type": "Uint32"},
-    "TAG_DCDC_GET_PID_DEBUG": {"tagvalue": 0x0480002A, "type": "Bool"},
-    "TAG_DCDC_PID_DEBUG_DATA": {"tagvalue": 0x0480002B, "type": "ByteArray"},
-    "TAG_DCDC_GET_LAST_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
-        "tagvalue": 0x0480002C,
-        "type": "Float32",
-    },
-    "TAG_DCDC_GET_DESIRED_IC": {"tagvalue": 0x0480002D, "type": "Float32"},
-    "TAG_DCDC_GET_ISO_VALUE": {"tagvalue": 0x0480002E, "type": "Float32"},
-    "TAG_DCDC_BROADCAST_BAT_LIMITS": {"tagvalue": 0x0480002F, "type": "None"},
-    "TAG_DCDC_RING_BUFFER": {"tagvalue": 0x04800030, "type": "Container"},
-    "TAG_DCDC_FREED_RING_BUFFER": {"tagvalue": 0x04800031, "type": "None"},
-    "TAG_DCDC_UNICAST_BAT_LIMITS": {"tagvalue": 0x04800032, "type": "None"},
-    "TAG_DCDC_SET_POWERSAVE": {"tagvalue": 0x04800033, "type": "Bool"},
-    "TAG_DCDC_GET_POWERSAVE": {"tagvalue": 0x04800034, "type": "Bool"},
-    "TAG_DCDC_GET_HW_CHARACTERISTIC": {"tagvalue": 0x04800035, "type": "UInt16"},
-    "TAG_DCDC_U_DCL_DIFF": {"tagvalue": 0x04800036, "type": "Float32"},
-    "TAG_DCDC_DERATING": {"tagvalue": 0x04800037, "type": "Bool"},
-    "TAG_DCDC_DERATING_VALUE": {"tagvalue": 0x04800038, "type": "Float32"},
-    "TAG_DCDC_TARGET_POWER": {"tagvalue": 0x04800039, "type": "Float32"},
-    "TAG_DCDC_DCL_OPERATION_VOLTAGE": {"tagvalue": 0x04800051, "type": "Container"},
-    "TAG_DCDC_SET_POWER": {"tagvalue": 0x04800071, "type": "Double64"},
-    "TAG_DCDC_SET_IDLE": {"tagvalue": 0x04800072, "type": "None"},
-    "TAG_DCDC_HANDLE_ERRORS": {"tagvalue": 0x04800073, "type": "None"},
-    "TAG_DCDC_CLEAR_ERRORS": {"tagvalue": 0x04800074, "type": "None"},
-    "TAG_DCDC_SEND_COMMAND": {"tagvalue": 0x04800075, "type": "Bool"},
-    "TAG_DCDC_BROADCAST_COMMAND": {"tagvalue": 0x04800076, "type": "Bool"},
-    "TAG_DCDC_ERROR_PENDING": {"tagvalue": 0x04800077, "type": "Bool"},
-    "TAG_DCDC_PVI_TYPE": {"tagvalue": 0x04800079, "type": "Bool"},
-    "TAG_DCDC_ON_GRID": {"tagvalue": 0x04800080, "type": "Bool"},
-    "TAG_DCDC_NEXT_SLAVE_STATE": {"tagvalue": 0x04800082, "type": "Bool"},
-    "TAG_DCDC_DCDC_TYPE": {"tagvalue": 0x04800084, "type": "UChar8"},
-    "TAG_DCDC_SEND_KICKSTART": {"tagvalue": 0x04800085, "type": "Bool"},
-    "TAG_DCDC_IS_HEALTHY": {"tagvalue": 0x04800086, "type": "Bool"},
-    "TAG_DCDC_REQ_GET_IS_MULTI_GC": {"tagvalue": 0x04800087, "type": "None"},
-    "TAG_DCDC_SEND_STARTUP_TYPE": {"tagvalue": 0x04800089, "type": "UChar8"},
-    "TAG_DCDC_SEND_BAT_CHARGING_STATE": {"tagvalue": 0x0480008A, "type": "UChar8"},
-    "TAG_DCDC_SEND_STANDBY_RELEASE": {"tagvalue": 0x0480008B, "type": "Char8"},
-    "TAG_DCDC_DATA": {"tagvalue": 0x04840000, "type": "Container"},
-    "TAG_DCDC_COUNT_HW_CONTROLLER": {"tagvalue": 0x04840060, "type": "Uint32"},
-    "TAG_DCDC_DEVICE_STATE": {"tagvalue": 0x04860000, "type": "Container"},
-    "TAG_DCDC_DEVICE_CONNECTED": {"tagvalue": 0x04860001, "type": "Bool"},
-    "TAG_DCDC_DEVICE_WORKING": {"tagvalue": 0x04860002, "type": "Bool"},
-    "TAG_DCDC_DEVICE_IN_SERVICE": {"tagvalue": 0x04860003, "type": "Bool"},
-    "TAG_DCDC_GET_IS_MULTI_GC": {"tagvalue": 0x04860004, "type": "Char8"},
-    "TAG_DCDC_SET_IS_MULTI_GC": {"tagvalue": 0x04860005, "type": "Char8"},
-    "TAG_DCDC_GENERAL_ERROR": {"tagvalue": 0x04FFFFFF, "type": "Error"},
-    "TAG_PM_REQ_POWER_L1": {"tagvalue": 0x05000001, "type": "None"},
-    "TAG_PM_REQ_POWER_L2": {"tagvalue": 0x05000002, "type": "None"},
-    "TAG_PM_REQ_POWER_L3": {"tagvalue": 0x05000003, "type": "None"},
-    "TAG_PM_REQ_ACTIVE_PHASES": {"tagvalue": 0x05000004, "type": "None"},
-    "TAG_PM_REQ_MODE": {"tagvalue": 0x05000005, "type": "None"},
-    "TAG_PM_REQ_ENERGY_L1": {"tagvalue": 0x05000006, "type": "None"},
-    "TAG_PM_REQ_ENERGY_L2": {"tagvalue": 0x05000007, "type": "None"},
-    "TAG_PM_REQ_ENERGY_L3": {"tagvalue": 0x05000008, "type": "None"},
-    "TAG_PM_REQ_DEVICE_ID": {"tagvalue": 0x05000009, "type": "None"},
-    "TAG_PM_REQ_ERROR_CODE": {"tagvalue": 0x0500000A, "type": "None"},
-    "TAG_PM_REQ_SET_PHASE_ELIMINATION": {"tagvalue": 0x0500000B, "type": "UChar8"},
-    "TAG_PM_REQ_FIRMWARE_VERSION": {"tagvalue": 0x0500000C, "type": "None"},
-    "TAG_PM_REQ_SET_FOR_EMERGENCY_TEST": {"tagvalue": 0x0500000D, "type": "None"},
-    "TAG_PM_REQ_IS_CAN_SILENCE": {"tagvalue": 0x0500000E, "type": "None"},
-    "TAG_PM_REQ_MAX_PHASE_POWER": {"tagvalue": 0x0500000F, "type": "None"},
-    "TAG_PM_REQ_GET_EXTERN_LOAD": {"tagvalue": 0x05000010, "type": "None"},
-    "TAG_PM_REQ_VOLTAGE_L1": {"tagvalue": 0x05000011, "type": "None"},
-    "TAG_PM_REQ_VOLTAGE_L2": {"tagvalue": 0x05000012, "type": "None"},
-    "TAG_PM_REQ_VOLTAGE_L3": {"tagvalue": 0x05000013, "type": "None"},
-    "TAG_PM_REQ_TYPE": {"tagvalue": 0x05000014, "type": "None"},
-    "TAG_PM_REQ_SET_TYPE": {"tagvalue": 0x05000015, "type": "Uint32"},
-    "TAG_PM_REQ_SET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05000016, "type": "Uint32"},
-    "TAG_PM_REQ_GET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05000017, "type": "None"},
-    "TAG_PM_REQ_GET_PHASE_ELIMINATION": {"tagvalue": 0x05000018, "type": "None"},
-    "TAG_PM_REQ_GET_CURRENT_SENSOR_TYPE_STRING": {
-        "tagvalue": 0x05000019,
-        "type": "None",
-    },
-    "TAG_PM_REQ_COMM_STATE": {"tagvalue": 0x05000050, "type": "None"},
-    "TAG_PM_REQ_CONNECTED_DEVICES": {"tagvalue": 0x050000A0, "type": "None"},
-    "TAG_PM_REQ_SET_DEVICE_NAME": {"tagvalue": 0x050000B0, "type": "CString"},
-    "TAG_PM_REQ_DEVICE_NAME": {"tagvalue": 0x050000B1, "type": "None"},
-    "TAG_PM_REQ_SET_EXTERN_LOAD": {"tagvalue": 0x050000B3, "type": "Container"},
-    "TAG_PM_REQ_INJECT_DATA": {"tagvalue": 0x050000B4, "type": "Container"},
-    "TAG_PM_REQ_SET_CAN_ID": {"tagvalue": 0x050000B5, "type": "Container"},
-    "TAG_PM_REQ_DATA": {"tagvalue": 0x05040000, "type": "Container"},
-    "TAG_PM_INDEX": {"tagvalue": 0x05040001, "type": "UInt16"},
-    "TAG_PM_REQ_DEVICE_STATE": {"tagvalue": 0x05060000, "type": "None"},
-    "TAG_PM_ID1": {"tagvalue": 0x05400001, "type": "CString"},
-    "TAG_PM_ID2": {"tagvalue": 0x05400002, "type": "CString"},
-    "TAG_PM_ID3": {"tagvalue": 0x05400003, "type": "CString"},
-    "TAG_PM_POWER_L1": {"tagvalue": 0x05800001, "type": "Double64"},
-    "TAG_PM_POWER_L2": {"tagvalue": 0x05800002, "type": "Double64"},
-    "TAG_PM_POWER_L3": {"tagvalue": 0x05800003, "type": "Double64"},
-    "TAG_PM_ACTIVE_PHASES": {"tagvalue": 0x05800004, "type": "UChar8"},
-    "TAG_PM_MODE": {"tagvalue": 0x05800005, "type": "UChar8"},
-    "TAG_PM_ENERGY_L1": {"tagvalue": 0x05800006, "type": "Double64"},
-    "TAG_PM_ENERGY_L2": {"tagvalue": 0x05800007, "type": "Double64"},
-    "TAG_PM_ENERGY_L3": {"tagvalue": 0x05800008, "type": "Double64"},
-    "TAG_PM_DEVICE_ID": {"tagvalue": 0x05800009, "type": "Uint32"},
-    "TAG_PM_ERROR_CODE": {"tagvalue": 0x0580000A, "type": "UChar8"},
-    "TAG_PM_SET_PHASE_ELIMINATION": {"tagvalue": 0x0580000B, "type": "Bool"},
-    "TAG_PM_FIRMWARE_VERSION": {"tagvalue": 0x0580000C, "type": "UChar8"},
-    "TAG_PM_SET_FOR_EMERGENCY_TEST": {"tagvalue": 0x0580000D, "type": "Bool"},
-    "TAG_PM_IS_CAN_SILENCE": {"tagvalue": 0x0580000E, "type": "Bool"},
-    "TAG_PM_MAX_PHASE_POWER": {"tagvalue": 0x0580000F, "type": "Double64"},
-    "TAG_PM_GET_EXTERN_LOAD": {"tagvalue": 0x05800010, "type": "Container"},
-    "TAG_PM_VOLTAGE_L1": {"tagvalue": 0x05800011, "type": "Float32"},
-    "TAG_PM_VOLTAGE_L2": {"tagvalue": 0x05800012, "type": "Float32"},
-    "TAG_PM_VOLTAGE_L3": {"tagvalue": 0x05800013, "type": "Float32"},
-    "TAG_PM_TYPE": {"tagvalue": 0x05800014, "type": "UInt16"},
-    "TAG_PM_SET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05800016, "type": "Bool"},
-    "TAG_PM_GET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05800017, "type": "Uint32"},
-    "TAG_PM_GET_PHASE_ELIMINATION": {"tagvalue": 0x05800018, "type": "UChar8"},
-    "TAG_PM_GET_CURRENT_SENSOR_TYPE_STRING": {
-        "tagvalue": 0x05800019,
-        "type": "CString",
-    },
-    "TAG_PM_COMM_STATE": {"tagvalue": 0x05800050, "type": "Container"},
-    "TAG_PM_CS_START_TIME": {"tagvalue": 0x05800051, "type": "Uint64"},
-    "TAG_PM_CS_LAST_TIME": {"tagvalue": 0x05800052, "type": "Uint64"},
-    "TAG_PM_CS_SUCC_FRAMES_ALL": {"tagvalue": 0x05800053, "type": "Uint64"},
-    "TAG_PM_CS_SUCC_FRAMES_100": {"tagvalue": 0x05800054, "type": "Uint64"},
-    "TAG_PM_CS_EXP_FRAMES_ALL": {"tagvalue": 0x05800055, "type": "Uint64"},
-    "TAG_PM_CS_EXP_FRAMES_100": {"tagvalue": 0x05800056, "type": "Uint64"},
-    "TAG_PM_CS_ERR_FRAMES_ALL": {"tagvalue": 0x05800057, "type": "Uint64"},
-    "TAG_PM_CS_ERR_FRAMES_100": {"tagvalue": 0x05800058, "type": "Uint64"},
-    "TAG_PM_CS_UNK_FRAMES": {"tagvalue": 0x05800059, "type": "Uint64"},
-    "TAG_PM_CS_ERR_FRAME": {"tagvalue": 0x0580005A, "type": "Uint64"},
-    "TAG_PM_CONNECTED_DEVICES": {"tagvalue": 0x058000A0, "type": "Container"},
-    "TAG_PM_CONNECTED_DEVICE": {"tagvalue": 0x058000A1, "type": "Container"},
-    "TAG_PM_DEVICE_NAME": {"tagvalue": 0x058000B1, "type": "CString"},
-    "TAG_PM_SET_EXTERN_LOAD": {"tagvalue": 0x058000B3, "type": "Container"},
-    "TAG_PM_INJECT_DATA": {"tagvalue": 0x058000B4, "type": "Container"},
-    "TAG_PM_SET_CAN_ID": {"tagvalue": 0x058000B5, "type": "Bool"},
-    "TAG_PM_DATA": {"tagvalue": 0x05840000, "type": "Container"},
-    "TAG_PM_DEVICE_STATE": {"tagvalue": 0x05860000, "type": "Container"},
-    "TAG_PM_DEVICE_CONNECTED": {"tagvalue": 0x05860001, "type": "Bool"},
-    "TAG_PM_DEVICE_WORKING": {"tagvalue": 0x05860002, "type": "Bool"},
-    "TAG_PM_DEVICE_IN_SERVICE": {"tagvalue": 0x05860003, "type": "Bool"},
-    "TAG_PM_GENERAL_ERROR": {"tagvalue": 0x05FFFFFF, "type": "Error"},
-    "TAG_DB_REQ_TEC_ALL": {"tagvalue": 0x0600000F, "type": "Container"},
-    "TAG_DB_REQ_TEC_WALLBOX_VALUES": {"tagvalue": 0x06000016, "type": "None"},
-    "TAG_DB_REQ_TEC_ROOT_EM_VALUE": {"tagvalue": 0x06000017, "type": "None"},
-    "TAG_DB_REQ_TEC_EM_VALUES": {"tagvalue": 0x06000018, "type": "None"},
-    "TAG_DB_REQ_TEC_BAT": {"tagvalue": 0x06000027, "type": "None"},
-    "TAG_DB_REQ_TEC_PRODUCTION": {"tagvalue": 0x06000028, "type": "None"},
-    "TAG_DB_REQ_TEC_CONSUMPTION": {"tagvalue": 0x06000029, "type": "None"},
-    "TAG_DB_REQ_TEC_DC_POWER": {"tagvalue": 0x0600002A, "type": "None"},
-    "TAG_DB_REQ_HISTORY_DATA_DAY": {"tagvalue": 0x06000100, "type": "Container"},
-    "TAG_DB_REQ_HISTORY_TIME_START": {"tagvalue": 0x06000101, "type": "Timestamp"},
-    "TAG_DB_REQ_HISTORY_TIME_INTERVAL": {"tagvalue": 0x06000102, "type": "Timestamp"},
-    "TAG_DB_REQ_HISTORY_TIME_SPAN": {"tagvalue": 0x06000103, "type": "Timestamp"},
-    "TAG_DB_REQ_HISTORY_UTC_TIME_START": {"tagvalue": 0x06000104, "type": "Timestamp"},
-    "TAG_DB_REQ_ENERGY_COUNTERS": {"tagvalue": 0x06000105, "type": "None"},
-    "TAG_DB_REQ_SET_IDLE": {"tagvalue": 0x0600010A, "type": "Bool"},
-    "TAG_DB_REQ_IS_IDLE": {"tagvalue": 0x0600010B, "type": "Bool"},
-    "TAG_DB_REQ_HISTORY_DATA_WEEK": {"tagvalue": 0x06000200, "type": "Container"},
-    "TAG_DB_REQ_HISTORY_DATA_MONTH": {"tagvalue": 0x06000300, "type": "Container"},
-    "TAG_DB_REQ_HISTORY_DATA_YEAR": {"tagvalue": 0x06000400, "type": "Container"},
-    "TAG_DB_REQ_SYNC_HIST": {"tagvalue": 0x06000500, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_HIST": {"tagvalue": 0x06000501, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_BPU": {"tagvalue": 0x06000502, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_BPU": {"tagvalue": 0x06000503, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_DCB": {"tagvalue": 0x06000504, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_DBC": {"tagvalue": 0x06000505, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_BPU_CONF": {"tagvalue": 0x06000506, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_BPU_CONF": {"tagvalue": 0x06000507, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_DCB_CONF": {"tagvalue": 0x06000508, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_DBC_CONF": {"tagvalue": 0x06000509, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_WALLBOX": {"tagvalue": 0x0600050A, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_WALLBOX": {"tagvalue": 0x0600050B, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_PV_DEBUG": {"tagvalue": 0x0600050C, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_PV_DEBUG": {"tagvalue": 0x0600050D, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_CONFIG": {"tagvalue": 0x0600050E, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_CONFIG": {"tagvalue": 0x0600050F, "type": "Uint64"},
-    "TAG_DB_REQ_SET_SYNC_TIME": {"tagvalue": 0x06000510, "type": "Uint64"},
-    "TAG_DB_REQ_PVI_DIAL_RECORDINGS": {"tagvalue": 0x06000511, "type": "None"},
-    "TAG_DB_REQ_SYNC_BAT_DIAGNOSE": {"tagvalue": 0x06000512, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_BAT_DIAGNOSE": {"tagvalue": 0x06000513, "type": "Uint64"},
-    "TAG_DB_REQ_SYNC_EXT_LG": {"tagvalue": 0x06000514, "type": "Container"},
-    "TAG_DB_REQ_VACUUM_EXT_LG": {"tagvalue": 0x06000515, "type": "Uint64"},
-    "TAG_DB_REQ_CLEAN_DATABASE": {"tagvalue": 0x06000516, "type": "None"},
-    "TAG_DB_REQ_SYNC_ALL": {"tagvalue": 0x06000517, "type": "Container"},
-    "TAG_DB_REQ_RESET_TIMESTAMP": {"tagvalue": 0x06000518, "type": "Container"},
-    "TAG_DB_TEC_WALLBOX_VALUE": {"tagvalue": 0x06400001, "type": "Container"},
-    "TAG_DB_TEC_WALLBOX_ENERGYALL": {"tagvalue": 0x06400002, "type": "Uint32"},
-    "TAG_DB_TEC_WALLBOX_WB_ENERGY_SOLAR": {"tagvalue": 0x06400003, "type": "Uint32"},
-    "TAG_DB_TEC_WALLBOX_INDEX": {"tagvalue": 0x06400004, "type": "Uint32"},
-    "TAG_DB_TEC_EM_VALUE": {"tagvalue": 0x06400005, "type": "Container"},
-    "TAG_DB_TEC_EM_ENERGY_L1": {"tagvalue": 0x06400006, "type": "Double64"},
-    "TAG_DB_TEC_EM_ENERGY_L2": {"tagvalue": 0x06400007, "type": "Double64"},
-    "TAG_DB_TEC_EM_ENERGY_L3": {"tagvalue": 0x06400008, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_IN_L1": {"tagvalue": 0x06400009, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_IN_L2": {"tagvalue": 0x0640000A, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_IN_L3": {"tagvalue": 0x0640000B, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_OUT_L1": {"tagvalue": 0x0640000C, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_OUT_L2": {"tagvalue": 0x0640000D, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_OUT_L3": {"tagvalue": 0x0640000E, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_IN": {"tagvalue": 0x0640000F, "type": "Double64"},
-    "TAG_DB_TEC_EM_NET_OUT": {"tagvalue": 0x06400010, "type": "Double64"},
-    "TAG_DB_TEC_EM_INDEX": {"tagvalue": 0x06400011, "type": "Uint32"},
-    "TAG_DB_GRAPH_INDEX": {"tagvalue": 0x06800001, "type": "Float32"},
-    "TAG_DB_BAT_POWER_IN": {"tagvalue": 0x06800002, "type": "Float32"},
-    "TAG_DB_BAT_POWER_OUT": {"tagvalue": 0x06800003, "type": "Float32"},
-    "TAG_DB_DC_POWER": {"tagvalue": 0x06800004, "type": "Float32"},
-    "TAG_DB_GRID_POWER_IN": {"tagvalue": 0x06800005, "type": "Float32"},
-    "TAG_DB_GRID_POWER_OUT": {"tagvalue": 0x06800006, "type": "Float32"},
-    "TAG_DB_CONSUMPTION": {"tagvalue": 0x06800007, "type": "Float32"},
-    "TAG_DB_PM_0_POWER": {"tagvalue": 0x06800008, "type": "Float32"},
-    "TAG_DB_PM_1_POWER": {"tagvalue": 0x06800009, "type": "Float32"},
-    "TAG_DB_BAT_CHARGE_LEVEL": {"tagvalue": 0x0680000A, "type": "Float32"},
-    "TAG_DB_BAT_CYCLE_COUNT": {"tagvalue": 0x0680000B, "type": "Float32"},
-    "TAG_DB_CONSUMED_PRODUCTION": {"tagvalue": 0x0680000C, "type": "Float32"},
-    "TAG_DB_AUTARKY": {"tagvalue": 0x0680000D, "type": "Float32"},
-    "TAG_DB_PRODUCTION_POWER": {"tagvalue": 0x0680000E, "type": "Float32"},
-    "TAG_DB_TEC_ALL": {"tagvalue": 0x0680000F, "type": "Container"},
-    "TAG_DB_SUM_CONTAINER": {"tagvalue": 0x06800010, "type": "Container"},
-    "TAG_DB_TEC_BAT_POWER_IN": {"tagvalue": 0x06800011, "type": "Double64"},
-    "TAG_DB_TEC_BAT_POWER_OUT": {"tagvalue": 0x06800012, "type": "Double64"},
-    "TAG_DB_TEC_PRODUCTION_L1": {"tagvalue": 0x06800013, "type": "Double64"},
-    "TAG_DB_TEC_PRODUCTION_L2": {"tagvalue": 0x06800014, "type": "Double64"},
-    "TAG_DB_TEC_PRODUCTION_L3": {"tagvalue": 0x06800015, "type": "Double64"},
-    "TAG_DB_TEC_WALLBOX_VALUES": {"tagvalue": 0x06800016, "type": "Container"},
-    "TAG_DB_TEC_ROOT_EM_VALUE": {"tagvalue": 0x06800017, "type": "Container"},
-    "TAG_DB_TEC_EM_VALUES": {"tagvalue": 0x06800018, "type": "Container"},
-    "TAG_DB_TEC_BAT_CHARGE_LEVEL": {"tagvalue": 0x06800019, "type": "Double64"},
-    "TAG_DB_TEC_BAT_CURRENT_IN": {"tagvalue": 0x0680001A, "type": "Double64"},
-    "TAG_DB_TEC_BAT_CURRENT_OUT": {"tagvalue": 0x0680001B, "type": "Double64"},
-    "TAG_DB_TEC_CONSUMPTION_L1": {"tagvalue": 0x0680001C, "type": "Double64"},
-    "TAG_DB_TEC_CONSUMPTION_L2": {"tagvalue": 0x0680001D, "type": "Double64"},
-    "TAG_DB_TEC_CONSUMPTION_L3": {"tagvalue": 0x0680001E, "type": "Double64"},
-    "TAG_DB_TEC_DC_POWER_S1": {"tagvalue": 0x0680001F, "type": "Double64"},
-    "TAG_DB_VALUE_CONTAINER": {"tagvalue": 0x06800020, "type": "Container"},
-    "TAG_DB_TEC_DC_POWER_S2": {"tagvalue": 0x06800021, "type": "Double64"},
-    "TAG_DB_TEC_DC_POWER_S3": {"tagvalue": 0x06800022, "type": "Double64"},
-    "TAG_DB_TEC_ACCURACY": {"tagvalue": 0x06800023, "type": "Double64"},
-    "TAG_DB_TEC_ACCURACY_LM": {"tagvalue": 0x06800024, "type": "Double64"},
-    "TAG_DB_TEC_ACCURACY_WB": {"tagvalue": 0x06800025, "type": "Double64"},
-    "TAG_DB_TEC_BAT_ASOC_CHARGE_LEVEL": {"tagvalue": 0x06800026, "type": "Double64"},
-    "TAG_DB_TEC_BAT": {"tagvalue": 0x06800027, "type": "Container"},
-    "TAG_DB_TEC_PRODUCTION": {"tagvalue": 0x06800028, "type": "Container"},
-    "TAG_DB_TEC_CONSUMPTION": {"tagvalue": 0x06800029, "type": "Container"},
-    "TAG_DB_TEC_DC_POWER": {"tagvalue": 0x0680002A, "type": "Container"},
-    "TAG_DB_HISTORY_DATA_DAY": {"tagvalue": 0x06800100, "type": "Container"},
-    "TAG_DB_ENERGY_COUNTERS": {"tagvalue": 0x06800105, "type": "Container"},
-    "TAG_DB_SET_IDLE": {"tagvalue": 0x0680010A, "type": "Bool"},
-    "TAG_DB_IS_IDLE": {"tagvalue": 0x0680010B, "type": "Bool"},
-    "TAG_DB_HISTORY_DATA_WEEK": {"tagvalue": 0x06800200, "type": "Container"},
-    "TAG_DB_HISTORY_DATA_MONTH": {"tagvalue": 0x06800300, "type": "Container"},
-    "TAG_DB_HISTORY_DATA_YEAR": {"tagvalue": 0x06800400, "type": "Container"},
-    "TAG_DB_SYNC_HIST": {"tagvalue": 0x06800500, "type": "Container"},
-    "TAG_DB_VACUUM_HIST": {"tagvalue": 0x06800501, "type": "Uint64"},
-    "TAG_DB_SYNC_BPU": {"tagvalue": 0x06800502, "type": "Container"},
-    "TAG_DB_VACUUM_BPU": {"tagvalue": 0x06800503, "type": "Uint64"},
-    "TAG_DB_SYNC_DCB": {"tagvalue": 0x06800504, "type": "Container"},
-    "TAG_DB_VACUUM_DCB": {"tagvalue": 0x06800505, "type": "Uint64"},
-    "TAG_DB_SYNC_BPU_CONF": {"tagvalue": 0x06800506, "type": "Container"},
-    "TAG_DB_VACUUM_BPU_CONF": {"tagvalue": 0x06800507, "type": "Uint64"},
-    "TAG_DB_SYNC_DCB_CONF": {"tagvalue": 0x06800508, "type": "Container"},
-    "TAG_DB_VACUUM_DCB_CONF": {"tagvalue": 0x06800509, "type": "Uint64"},
-    "TAG_DB_SYNC_WALLBOX": {"tagvalue": 0x0680050A, "type": "Container"},
-    "TAG_DB_VACUUM_WALLBOX": {"tagvalue": 0x0680050B, "type": "Uint64"},
-    "TAG_DB_SYNC_PV_DEBUG": {"tagvalue": 0x0680050C, "type": "Container"},
-    "TAG_DB_VACUUM_PV_DEBUG": {"tagvalue": 0x0680050D, "type": "Uint64"},
-    "TAG_DB_SYNC_CONFIG": {"tagvalue": 0x0680050E, "type": "Container"},
-    "TAG_DB_VACUUM_CONFIG": {"tagvalue": 0x0680050F, "type": "Uint64"},
-    "TAG_DB_SET_SYNC_TIME": {"tagvalue": 0x06800510, "type": "Uint64"},
-    "TAG_DB_PVI_DIAL_RECORDINGS": {"tagvalue": 0x06800511, "type": "Container"},
-    "TAG_DB_SYNC_BAT_DIAGNOSE": {"tagvalue": 0x06800512, "type": "Container"},
-    "TAG_DB_VACUUM_BAT_DIAGNOSE": {"tagvalue": 0x06800513, "type": "Uint64"},
-    "TAG_DB_SYNC_EXT_LG": {"tagvalue": 0x06800514, "type": "Container"},
-    "TAG_DB_VACUUM_EXT_LG": {"tagvalue": 0x06800515, "type": "Uint64"},
-    "TAG_DB_SYNC_ALL": {"tagvalue": 0x06800517, "type": "Container"},
-    "TAG_DB_RESET_TIMESTAMP": {"tagvalue": 0x06800518, "type": "Container"},
-    "TAG_DB_PAR_TIME_MIN": {"tagvalue": 0x06B00000, "type": "Uint64"},
-    "TAG_DB_PAR_TIME_MAX": {"tagvalue": 0x06B00001, "type": "Uint64"},
-    "TAG_DB_PARAM_ROW": {"tagvalue": 0x06B00002, "type": "Container"},
-    "TAG_DB_PARAM_COLUMN": {"tagvalue": 0x06B00003, "type": "Container"},
-    "TAG_DB_PARAM_INDEX": {"tagvalue": 0x06B00004, "type": "Uint32"},
-    "TAG_DB_PARAM_VALUE": {"tagvalue": 0x06B00005, "type": "CString"},
-    "TAG_DB_PARAM_MAX_ROWS": {"tagvalue": 0x06B00006, "type": "Uint32"},
-    "TAG_DB_PARAM_TIME": {"tagvalue": 0x06B00007, "type": "Uint64"},
-    "TAG_DB_PARAM_VERSION": {"tagvalue": 0x06B00008, "type": "CString"},
-    "TAG_DB_PARAM_HEADER": {"tagvalue": 0x06B00009, "type": "Container"},
-    "TAG_DB_PARAM_PRODUCTION_L1": {"tagvalue": 0x06B00010, "type": "Double64"},
-    "TAG_DB_PARAM_PRODUCTION_L2": {"tagvalue": 0x06B00011, "type": "Double64"},
-    "TAG_DB_PARAM_PRODUCTION_L3": {"tagvalue": 0x06B00012, "type": "Double64"},
-    "TAG_DB_PARAM_DC_POWER_S1": {"tagvalue": 0x06B00013, "type": "Double64"},
-    "TAG_DB_PARAM_DC_POWER_S2": {"tagvalue": 0x06B00014, "type": "Double64"},
-    "TAG_DB_PARAM_DC_POWER_S3": {"tagvalue": 0x06B00015, "type": "Double64"},
-    "TAG_SRV_REQ_IS_ONLINE": {"tagvalue": 0x08000001, "type": "None"},
-    "TAG_SRV_REQ_ADD_USER": {"tagvalue": 0x08000002, "type": "CString"},
-    "TAG_SRV_REQ_SET_LOCAL_USER": {"tagvalue": 0x08000003, "type": "CString"},
-    "TAG_SRV_REQ_CREATE_USER": {"tagvalue": 0x08000004, "type": "Container"},
-    "TAG_SRV_REQ_CREATE_USER_STATUS": {"tagvalue": 0x08000005, "type": "None"},
-    "TAG_SRV_NAME": {"tagvalue": 0x08400001, "type": "CString"},
-    "TAG_SRV_STREET": {"tagvalue": 0x08400002, "type": "CString"},
-    "TAG_SRV_STREET_NO": {"tagvalue": 0x08400003, "type": "CString"},
-    "TAG_SRV_POSTCODE": {"tagvalue": 0x08400004, "type": "CString"},
-    "TAG_SRV_CITY": {"tagvalue": 0x08400005, "type": "CString"},
-    "TAG_SRV_COUNTRY": {"tagvalue": 0x08400006, "type": "CString"},
-    "TAG_SRV_FON": {"tagvalue": 0x08400007, "type": "CString"},
-    "TAG_SRV_E_MAIL": {"tagvalue": 0x08400008, "type": "CString"},
-    "TAG_SRV_SURNAME": {"tagvalue": 0x08400009, "type": "CString"},
-    "TAG_SRV_IS_ONLINE": {"tagvalue": 0x08800001, "type": "Bool"},
-    "TAG_SRV_ADD_USER": {"tagvalue": 0x08800002, "type": "Bool"},
-    "TAG_SRV_SET_LOCAL_USER": {"tagvalue": 0x08800003, "type": "Bool"},
-    "TAG_SRV_CREATE_USER": {"tagvalue": 0x08800004, "type": "Int32"},
-    "TAG_SRV_CREATE_USER_STATUS": {"tagvalue": 0x08800005, "type": "Int32"},
-    "TAG_SRV_GENERAL_ERROR": {"tagvalue": 0x08FFFFFF, "type": "Container"},
-    "TAG_HA_REQ_DATAPOINT_LIST": {"tagvalue": 0x09000001, "type": "None"},
-    "TAG_HA_REQ_ACTUATOR_STATES": {"tagvalue": 0x09000010, "type": "None"},
-    "TAG_HA_REQ_ADD_ACTUATOR": {"tagvalue": 0x09000020, "type": "Container"},
-    "TAG_HA_REQ_REMOVE_ACTUATOR": {"tagvalue": 0x09000030, "type": "UInt16"},
-    "TAG_HA_REQ_COMMAND_ACTUATOR": {"tagvalue": 0x09000040, "type": "Container"},
-    "TAG_HA_REQ_COMMAND": {"tagvalue": 0x09000041, "type": "CString"},
-    "TAG_HA_REQ_DESCRIPTIONS_CHANGE": {"tagvalue": 0x09000050, "type": "Container"},
-    "TAG_HA_REQ_CONFIGURATION_CHANGE_COUNTER": {"tagvalue": 0x09000060, "type": "None"},
-    "TAG_HA_REQ_POSSIBLE_POWER_METERS": {"tagvalue": 0x09000070, "type": "None"},
-    "TAG_HA_REQ_POSSIBLE_ANALOG_MODES": {"tagvalue": 0x09000080, "type": "None"},
-    "TAG_HA_REQ_DEVICE_STATE": {"tagvalue": 0x09060000, "type": "None"},
-    "TAG_HA_DATAPOINT_LIST": {"tagvalue": 0x09800001, "type": "Container"},
-    "TAG_HA_DATAPOINT": {"tagvalue": 0x09800002, "type": "Container"},
-    "TAG_HA_DATAPOINT_INDEX": {"tagvalue": 0x09800003, "type": "UInt16"},
-    "TAG_HA_DATAPOINT_TYPE": {"tagvalue": 0x09800004, "type": "Uint32"},
-    "TAG_HA_DATAPOINT_NAME": {"tagvalue": 0x09800005, "type": "CString"},
-    "TAG_HA_DATAPOINT_DESCRIPTIONS": {"tagvalue": 0x09800006, "type": "Container"},
-    "TAG_HA_DATAPOINT_DESCRIPTION": {"tagvalue": 0x09800007, "type": "Container"},
-    "TAG_HA_DATAPOINT_DESCRIPTION_NAME": {"tagvalue": 0x09800008, "type": "CString"},
-    "TAG_HA_DATAPOINT_DESCRIPTION_VALUE": {"tagvalue": 0x09800009, "type": "Int32"},
-    "TAG_HA_ACTUATOR_STATES": {"tagvalue": 0x09800010, "type": "Container"},
-    "TAG_HA_DATAPOINT_STATE": {"tagvalue": 0x09800011, "type": "Char8"},
-    "TAG_HA_DATAPOINT_MODE": {"tagvalue": 0x09800012, "type": "Char8"},
-    "TAG_HA_DATAPOINT_STATE_TIMESTAMP": {"tagvalue": 0x09800013, "type": "Uint64"},
-    "TAG_HA_DATAPOINT_STATE_VALUE": {"tagvalue": 0x09800014, "type": "Char8"},
-    "TAG_HA_DATAPOINT_SUPPLY_QUALITY": {"tagvalue": 0x09800015, "type": "Char8"},
-    "TAG_HA_DATAPOINT_SIGNAL_QUALITY": {"tagvalue": 0x09800016, "type": "Char8"},
-    "TAG_HA_ADD_ACTUATOR": {"tagvalue": 0x09800020, "type": "Bool"},
-    "TAG_HA_REMOVE_ACTUATOR": {"tagvalue": 0x09800030, "type": "Bool"},
-    "TAG_HA_COMMAND_ACTUATOR": {"tagvalue": 0x09800040, "type": "Bool"},
-    "TAG_HA_DESCRIPTIONS_CHANGE": {"tagvalue": 0x09800050, "type": "Bool"},
-    "TAG_HA_CONFIGURATION_CHANGE_COUNTER": {"tagvalue": 0x09800060, "type": "Uint32"},
-    "TAG_HA_POSSIBLE_POWER_METERS": {"tagvalue": 0x09800070, "type": "Container"},
-    "TAG_HA_POSSIBLE_POWER_METER": {"tagvalue": 0x09800071, "type": "CString"},
-    "TAG_HA_POSSIBLE_ANALOG_MODES": {"tagvalue": 0x09800080, "type": "Container"},
-    "TAG_HA_POSSIBLE_ANALOG_MODE": {"tagvalue": 0x09800081, "type": "CString"},
-    "TAG_HA_DEVICE_STATE": {"tagvalue": 0x09860000, "type": "Container"},
-    "TAG_HA_DEVICE_CONNECTED": {"tagvalue": 0x09860001, "type": "Bool"},
-    "TAG_HA_DEVICE_WORKING": {"tagvalue": 0x09860002, "type": "Bool"},
-    "TAG_HA_DEVICE_IN_SERVICE": {"tagvalue": 0x09860003, "type": "Bool"},
-    "TAG_HA_GENERAL_ERROR": {"tagvalue": 0x09FFFFFF, "type": "Error"},
-    "TAG_INFO_REQ_SERIAL_NUMBER": {"tagvalue": 0x0A000001, "type": "None"},
-    "TAG_INFO_REQ_PRODUCTION_DATE": {"tagvalue": 0x0A000002, "type": "None"},
-    "TAG_INFO_REQ_MODULES_SW_VERSIONS": {"tagvalue": 0x0A000003, "type": "None"},
-    "TAG_INFO_REQ_A35_SERIAL_NUMBER": {"tagvalue": 0x0A000007, "type": "None"},
-    "TAG_INFO_REQ_IP_ADDRESS": {"tagvalue": 0x0A000008, "type": "None"},
-    "TAG_INFO_REQ_SUBNET_MASK": {"tagvalue": 0x0A000009, "type": "None"},
-    "TAG_INFO_REQ_MAC_ADDRESS": {"tagvalue": 0x0A00000A, "type": "None"},
-    "TAG_INFO_REQ_GATEWAY": {"tagvalue": 0x0A00000B, "type": "None"},
-    "TAG_INFO_REQ_DNS": {"tagvalue": 0x0A00000C, "type": "None"},
-    "TAG_INFO_REQ_DHCP_STATUS": {"tagvalue": 0x0A00000D, "type": "None"},
-    "TAG_INFO_REQ_TIME": {"tagvalue": 0x0A00000E, "type": "None"},
-    "TAG_INFO_REQ_UTC_TIME": {"tagvalue": 0x0A00000F, "type": "None"},
-    "TAG_INFO_REQ_TIME_ZONE": {"tagvalue": 0x0A000010, "type": "None"},
-    "TAG_INFO_REQ_INFO": {"tagvalue": 0x0A000011, "type": "None"},
-    "TAG_INFO_REQ_SET_IP_ADDRESS": {"tagvalue": 0x0A000012, "type": "CString"},
-    "TAG_INFO_REQ_SET_SUBNET_MASK": {"tagvalue": 0x0A000013, "type": "CString"},
-    "TAG_INFO_REQ_SET_DHCP_STATUS": {"tagvalue": 0x0A000014, "type": "Bool"},
-    "TAG_INFO_REQ_SET_GATEWAY": {"tagvalue": 0x0A000015, "type": "CString"},
-    "TAG_INFO_REQ_SET_DNS": {"tagvalue": 0x0A000016, "type": "CString"},
-    "TAG_INFO_REQ_SET_TIME_ZONE": {"tagvalue": 0x0A000018, "type": "CString"},
-    "TAG_INFO_REQ_SW_RELEASE": {"tagvalue": 0x0A000019, "type": "None"},
-    "TAG_INFO_REQ_SET_GUI_TARGET": {"tagvalue": 0x0A00001A, "type": "UChar8"},
-    "TAG_INFO_REQ_GUI_TARGET": {"tagvalue": 0x0A00001B, "type": "None"},
-    "TAG_INFO_REQ_PLATFORM_TYPE": {"tagvalue": 0x0A00001C, "type": "None"},
-    "TAG_INFO_REQ_IS_CALIBRATED": {"tagvalue": 0x0A00001D, "type": "None"},
-    "TAG_INFO_REQ_CALIBRATION_CHECK": {"tagvalue": 0x0A00001E, "type": "UChar8"},
-    "TAG_INFO_REQ_RESET_CALIBRATION": {"tagvalue": 0x0A00001F, "type": "None"},
-    "TAG_INFO_REQ_HW_TIME": {"tagvalue": 0x0A000020, "type": "None"},
-    "TAG_INFO_REQ_SET_TIME_UTC": {"tagvalue": 0x0A000021, "type": "Timestamp"},
-    "TAG_INFO_REQ_SET_HW_TIME": {"tagvalue": 0x0A000022, "type": "Timestamp"},
-    "TAG_INFO_REQ_SET_FACILITY": {"tagvalue": 0x0A000023, "type": "Container"},
-    "TAG_INFO_REQ_GET_FACILITY": {"tagvalue": 0x0A000024, "type": "None"},
-    "TAG_INFO_REQ_GET_FS_USAGE": {"tagvalue": 0x0A000025, "type": "None"},
-    "TAG_INFO_REQ_UPNP_STATUS": {"tagvalue": 0x0A000037, "type": "None"},
-    "TAG_INFO_REQ_SET_UPNP_STATUS": {"tagvalue": 0x0A000038, "type": "Bool"},
-    "TAG_INFO_REQ_IS_OVP_POSSIBLE": {"tagvalue": 0x0A000039, "type": "None"},
-    "TAG_INFO_REQ_IS_RSCP_PASSWORD_SET": {"tagvalue": 0x0A00003A, "type": "None"},
-    "TAG_INFO_REQ_SET_EULA_VERSION": {"tagvalue": 0x0A00003B, "type": "CString"},
-    "TAG_INFO_REQ_SET_EULA_CHECKSUM": {"tagvalue": 0x0A00003C, "type": "CString"},
-    "TAG_INFO_REQ_SET_WAIT_FOR_EULA": {"tagvalue": 0x0A00003D, "type": "Bool"},
-    "TAG_INFO_REQ_ASSEMBLY_SERIAL_NUMBER": {"tagvalue": 0x0A00003E, "type": "None"},
-    "TAG_INFO_REQ_SET_UUID": {"tagvalue": 0x0A00003F, "type": "CString"},
-    "TAG_INFO_REQ_GET_UUID": {"tagvalue": 0x0A000040, "type": "None"},
-    "TAG_INFO_REQ_GET_SUID": {"tagvalue": 0x0A000041, "type": "None"},
-    "TAG_INFO_REQ_IS_OVP2_POSSIBLE": {"tagvalue": 0x0A000042, "type": "None"},
-    "TAG_INFO_LC_REQ_SET_TIME": {"tagvalue": 0x0A000043, "type": "Container"},
-    "TAG_INFO_LC_REQ_GET_IS_TIME_SYNCHRO": {
-        "tagvalue": 0x0A000044,
-        "type": "Container",
-    },
-    "TAG_INFO_LC_REQ_GET_SYSTEM_TIME": {"tagvalue": 0x0A000045, "type": "Container"},
-    "TAG_INFO_LC_REQ_GET_TIME_TIMEZONE": {"tagvalue": 0x0A000046, "type": "Container"},
-    "TAG_INFO_REQ_GET_IS_MULTI_GC_POSSIBLE": {"tagvalue": 0x0A000047, "type": "None"},
-    "TAG_INFO_REQ_GET_VALUES_PRESENTATION_SETTINGS": {
-        "tagvalue": 0x0A000048,
-        "type": "None",
-    },
-    "TAG_INFO_LC_PARAM_TOKEN": {"tagvalue": 0x0A400001, "type": "CString"},
-    "TAG_INFO_LC_PARAM_STATUS": {"tagvalue": 0x0A400002, "type": "Uint64"},
-    "TAG_INFO_LC_PARAM_TIME_SYSTEM": {"tagvalue": 0x0A400003, "type": "Timestamp"},
-    "TAG_INFO_LC_PARAM_TIMEZONE": {"tagvalue": 0x0A400004, "type": "CString"},
-    "TAG_INFO_LC_PARAM_TIME_DIFF": {"tagvalue": 0x0A400005, "type": "Timestamp"},
-    "TAG_INFO_LC_PARAM_TIME_BROWSER": {"tagvalue": 0x0A400006, "type": "Timestamp"},
-    "TAG_INFO_LC_PARAM_TIME_SYNCHRO_STATE": {"tagvalue": 0x0A400007, "type": "Bool"},
-    "TAG_INFO_SERIAL_NUMBER": {"tagvalue": 0x0A800001, "type": "CString"},
-    "TAG_INFO_PRODUCTION_DATE": {"tagvalue": 0x0A800002, "type": "CString"},
-    "TAG_INFO_MODULES_SW_VERSIONS": {"tagvalue": 0x0A800003, "type": "Container"},
-    "TAG_INFO_MODULE_SW_VERSION": {"tagvalue": 0x0A800004, "type": "Container"},
-    "TAG_INFO_MODULE": {"tagvalue": 0x0A800005, "type": "CString"},
-    "TAG_INFO_VERSION": {"tagvalue": 0x0A800006, "type": "CString"},
-    "TAG_INFO_A35_SERIAL_NUMBER": {"tagvalue": 0x0A800007, "type": "CString"},
-    "TAG_INFO_IP_ADDRESS": {"tagvalue": 0x0A800008, "type": "CString"},
-    "TAG_INFO_SUBNET_MASK": {"tagvalue": 0x0A800009, "type": "CString"},
-    "TAG_INFO_MAC_ADDRESS": {"tagvalue": 0x0A80000A, "type": "CString"},
-    "TAG_INFO_GATEWAY": {"tagvalue": 0x0A80000B, "type": "CString"},
-    "TAG_INFO_DNS": {"tagvalue": 0x0A80000C, "type": "CString"},
-    "TAG_INFO_DHCP_STATUS": {"tagvalue": 0x0A80000D, "type": "Bool"},
-    "TAG_INFO_TIME": {"tagvalue": 0x0A80000E, "type": "Timestamp"},
-    "TAG_INFO_UTC_TIME": {"tagvalue": 0x0A80000F, "type": "Timestamp"},
-    "TAG_INFO_TIME_ZONE": {"tagvalue": 0x0A800010, "type": "CString"},
-    "TAG_INFO_INFO": {"tagvalue": 0x0A800011, "type": "Container"},
-    "TAG_INFO_SET_IP_ADDRESS": {"tagvalue": 0x0A800012, "type": "CString"},
-    "TAG_INFO_SET_SUBNET_MASK": {"tagvalue": 0x0A800013, "type": "CString"},
-    "TAG_INFO_SET_DHCP_STATUS": {"tagvalue": 0x0A800014, "type": "Bool"},
-    "TAG_INFO_SET_GATEWAY": {"tagvalue": 0x0A800015, "type": "CString"},
-    "TAG_INFO_SET_DNS": {"tagvalue": 0x0A800016, "type": "CString"},
-    "TAG_INFO_SET_TIME": {"tagvalue": 0x0A800017, "type": "Timestamp"},
-    "TAG_INFO_SET_TIME_ZONE": {"tagvalue": 0x0A800018, "type": "CString"},
-    "TAG_INFO_SW_RELEASE": {"tagvalue": 0x0A800019, "type": "CString"},
-    "TAG_INFO_SET_GUI_TARGET": {"tagvalue": 0x0A80001A, "type": "UChar8"},
-    "TAG_INFO_GUI_TARGET": {"tagvalue": 0x0A80001B, "type": "UChar8"},
-    "TAG_INFO_PLATFORM_TYPE": {"tagvalue": 0x0A80001C, "type": "CString"},
-    "TAG_INFO_IS_CALIBRATED": {"tagvalue": 0x0A80001D, "type": "Bool"},
-    "TAG_INFO_CALIBRATION_CHECK": {"tagvalue": 0x0A80001E, "type": "UChar8"},
-    "TAG_INFO_RESET_CALIBRATION": {"tagvalue": 0x0A80001F, "type": "UChar8"},
-    "TAG_INFO_HW_TIME": {"tagvalue": 0x0A800020, "type": "Timestamp"},
-    "TAG_INFO_SET_TIME_UTC": {"tagvalue": 0x0A800021, "type": "UChar8"},
-    "TAG_INFO_SET_HW_TIME": {"tagvalue": 0x0A800022, "type": "UChar8"},
-    "TAG_INFO_SET_FACILITY": {"tagvalue": 0x0A800023, "type": "UChar8"},
-    "TAG_INFO_GET_FACILITY": {"tagvalue": 0x0A800024, "type": "Container"},
-    "TAG_INFO_NAME": {"tagvalue": 0x0A800025, "type": "CString"},
-    "TAG_INFO_STREET": {"tagvalue": 0x0A800026, "type": "CString"},
-    "TAG_INFO_STREET_NO": {"tagvalue": 0x0A800027, "type": "CString"},
-    "TAG_INFO_POSTCODE": {"tagvalue": 0x0A800028, "type": "CString"},
-    "TAG_INFO_CITY": {"tagvalue": 0x0A800029, "type": "CString"},
-    "TAG_INFO_FON": {"tagvalue": 0x0A80002A, "type": "CString"},
-    "TAG_INFO_E_MAIL": {"tagvalue": 0x0A80002B, "type": "CString"},
-    "TAG_INFO_COUNTRY": {"tagvalue": 0x0A80002C, "type": "CString"},
-    "TAG_INFO_GET_FS_USAGE": {"tagvalue": 0x0A80002D, "type": "Container"},
-    "TAG_INFO_FS_SIZE": {"tagvalue": 0x0A80002E, "type": "CString"},
-    "TAG_INFO_FS_USED": {"tagvalue": 0x0A80002F, "type": "CString"},
-    "TAG_INFO_FS_AVAILABLE": {"tagvalue": 0x0A800030, "type": "CString"},
-    "TAG_INFO_FS_USE_PERCENT": {"tagvalue": 0x0A800031, "type": "CString"},
-    "TAG_INFO_INODES": {"tagvalue": 0x0A800032, "type": "CString"},
-    "TAG_INFO_INODES_USED": {"tagvalue": 0x0A800033, "type": "CString"},
-    "TAG_INFO_INODES_AVAILABLE": {"tagvalue": 0x0A800034, "type": "CString"},
-    "TAG_INFO_INODES_USE_PERCENT": {"tagvalue": 0x0A800035, "type": "CString"},
-    "TAG_INFO_SURNAME": {"tagvalue": 0x0A800036, "type": "CString"},
-    "TAG_INFO_UPNP_STATUS": {"tagvalue": 0x0A800037, "type": "Bool"},
-    "TAG_INFO_SET_UPNP_STATUS": {"tagvalue": 0x0A800038, "type": "Bool"},
-    "TAG_INFO_IS_OVP_POSSIBLE": {"tagvalue": 0x0A800039, "type": "Bool"},
-    "TAG_INFO_IS_RSCP_PASSWORD_SET": {"tagvalue": 0x0A80003A, "type": "None"},
-    "TAG_INFO_SET_EULA_VERSION": {"tagvalue": 0x0A80003B, "type": "Bool"},
-    "TAG_INFO_SET_EULA_CHECKSUM": {"tagvalue": 0x0A80003C, "type": "Bool"},
-    "TAG_INFO_SET_WAIT_FOR_EULA": {"tagvalue": 0x0A80003D, "type": "Bool"},
-    "TAG_INFO_ASSEMBLY_SERIAL_NUMBER": {"tagvalue": 0x0A80003E, "type": "CString"},
-    "TAG_INFO_SET_UUID": {"tagvalue": 0x0A80003F, "type": "Bool"},
-    "TAG_INFO_GET_UUID": {"tagvalue": 0x0A800040, "type": "CString"},
-    "TAG_INFO_GET_SUID": {"tagvalue": 0x0A800041, "type": "CString"},
-    "TAG_INFO_IS_OVP2_POSSIBLE": {"tagvalue": 0x0A800042, "type": "Bool"},
-    "TAG_INFO_LC_SET_TIME": {"tagvalue": 0x0A800043, "type": "Container"},
-    "TAG_INFO_LC_GET_IS_TIME_SYNCHRO": {"tagvalue": 0x0A800044, "type": "Container"},
-    "TAG_INFO_LC_GET_SYSTEM_TIME": {"tagvalue": 0x0A800045, "type": "Container"},
-    "TAG_INFO_LC_GET_TIME_TIMEZONE": {"tagvalue": 0x0A800046, "type": "Container"},
-    "TAG_INFO_GET_IS_MULTI_GC_POSSIBLE": {"tagvalue": 0x0A800047, "type": "Bool"},
-    "TAG_INFO_GET_VALUES_PRESENTATION_SETTINGS": {
-        "tagvalue": 0x0A800048,
-        "type": "CString",
-    },
-    "TAG_INFO_GENERAL_ERROR": {"tagvalue": 0x0AFFFFFF, "type": "Error"},
-    "TAG_EP_REQ_SWITCH_TO_GRID": {"tagvalue": 0x0B000001, "type": "None"},
-    "TAG_EP_REQ_SWITCH_TO_ISLAND": {"tagvalue": 0x0B000002, "type": "None"},
-    "TAG_EP_REQ_IS_READY_FOR_SWITCH": {"tagvalue": 0x0B000003, "type": "None"},
-    "TAG_EP_REQ_IS_GRID_CONNECTED": {"tagvalue": 0x0B000004, "type": "None"},
-    "TAG_EP_REQ_IS_ISLAND_GRID": {"tagvalue": 0x0B000005, "type": "None"},
-    "TAG_EP_REQ_IS_INVALID_STATE": {"tagvalue": 0x0B000006, "type": "None"},
-    "TAG_EP_REQ_IS_POSSIBLE": {"tagvalue": 0x0B000007, "type": "None"},
-    "TAG_EP_REQ_LEAVE_INVALID_STATE_TO_ISLAND": {
-        "tagvalue": 0x0B000008,
-        "type": "None",
-    },
-    "TAG_EP_REQ_LEAVE_INVALID_STATE_TO_GRID": {"tagvalue": 0x0B000009, "type": "None"},
-    "TAG_EP_SWITCH_TO_GRID": {"tagvalue": 0x0B800001, "type": "Bool"},
-    "TAG_EP_SWITCH_TO_ISLAND": {"tagvalue": 0x0B800002, "type": "Bool"},
-    "TAG_EP_IS_READY_FOR_SWITCH": {"tagvalue": 0x0B800003, "type": "Bool"},
-    "TAG_EP_IS_GRID_CONNECTED": {"tagvalue": 0x0B800004, "type": "Bool"},
-    "TAG_EP_IS_ISLAND_GRID": {"tagvalue": 0x0B800005, "type": "Bool"},
-    "TAG_EP_IS_INVALID_STATE": {"tagvalue": 0x0B800006, "type": "Bool"},
-    "TAG_EP_IS_POSSIBLE": {"tagvalue": 0x0B800007, "type": "Bool"},
-    "TAG_EP_LEAVE_INVALID_STATE_TO_ISLAND": {"tagvalue": 0x0B800008, "type": "Bool"},
-    "TAG_EP_LEAVE_INVALID_STATE_TO_GRID": {"tagvalue": 0x0B800009, "type": "Bool"},
-    "TAG_EP_GENERAL_ERROR": {"tagvalue": 0x0BFFFFFF, "type": "Container"},
-    "TAG_SYS_REQ_SYSTEM_REBOOT": {"tagvalue": 0x0C000001, "type": "None"},
-    "TAG_SYS_REQ_IS_SYSTEM_REBOOTING": {"tagvalue": 0x0C000002, "type": "None"},
-    "TAG_SYS_REQ_RESTART_APPLICATION": {"tagvalue": 0x0C000003, "type": "None"},
-    "TAG_SYS_REQ_SCRIPT_FILE_LIST": {"tagvalue": 0x0C000010, "type": "CString"},
-    "TAG_SYS_REQ_EXECUTE_SCRIPT": {"tagvalue": 0x0C000015, "type": "CString"},
-    "TAG_SYS_REQ_SYSTEM_SHUTDOWN": {"tagvalue": 0x0C000016, "type": "None"},
-    "TAG_SYS_REQ_IS_SYSTEM_SHUTTING_DOWN": {"tagvalue": 0x0C000017, "type": "None"},
-    "TAG_SYS_REQ_GUI_PASSWD_RESET": {"tagvalue": 0x0C000018, "type": "None"},
-    "TAG_SYS_REQ_IS_GUI_PASSWD_RESET": {"tagvalue": 0x0C000019, "type": "None"},
-    "TAG_SYS_REQ_GUI_PASSWD_RESET_PERFORMED": {"tagvalue": 0x0C000020, "type": "None"},
-    "TAG_SYS_SYSTEM_REBOOT": {"tagvalue": 0x0C800001, "type": "Int32"},
-    "TAG_SYS_IS_SYSTEM_REBOOTING": {"tagvalue": 0x0C800002, "type": "Bool"},
-    "TAG_SYS_RESTART_APPLICATION": {"tagvalue": 0x0C800003, "type": "Bool"},
-    "TAG_SYS_SCRIPT_FILE_LIST": {"tagvalue": 0x0C800010, "type": "Container"},
-    "TAG_SYS_SCRIPT_FILE": {"tagvalue": 0x0C800011, "type": "CString"},
-    "TAG_SYS_EXECUTE_SCRIPT": {"tagvalue": 0x0C800015, "type": "Bool"},
-    "TAG_SYS_IS_SYSTEM_SHUTING_DOWN": {"tagvalue": 0x0C800017, "type": "Bool"},
-    "TAG_SYS_GUI_PASSWD_RESET": {"tagvalue": 0x0C800018, "type": "Bool"},
-    "TAG_SYS_IS_GUI_PASSWD_RESET": {"tagvalue": 0x0C800019, "type": "Bool"},
-    "TAG_SYS_GUI_PASSWD_RESET_PERFORMED": {"tagvalue": 0x0C800020, "type": "Bool"},
-    "TAG_SYS_GENERAL_ERROR": {"tagvalue": 0x0CFFFFFF, "type": "Container"},
-    "TAG_UM_REQ_UPDATE_STATUS": {"tagvalue": 0x0D000001, "type": "None"},
-    "TAG_UM_REQ_UPDATE_DCDC": {"tagvalue": 0x0D000002, "type": "CString"},
-    "TAG_UM_REQ_CHECK_FOR_UPDATES": {"tagvalue": 0x0D000003, "type": "None"},
-    "TAG_UM_LC_REQ_SET_START_FILE_TRANSFER": {
-        "tagvalue": 0x0D000004,
-        "type": "Container",
-    },
-    "TAG_UM_LC_REQ_SET_FILE_TRANSFER": {"tagvalue": 0x0D000005, "type": "Container"},
-    "TAG_UM_LC_REQ_SET_END_FILE_TRANSFER": {
-        "tagvalue": 0x0D000006,
-        "type": "Container",
-    },
-    "TAG_UM_LC_PARAM_TOKEN": {"tagvalue": 0x0D400001, "type": "CString"},
-    "TAG_UM_LC_PARAM_STATUS": {"tagvalue": 0x0D400002, "type": "Uint64"},
-    "TAG_UM_LC_PARAM_FILE_NAME": {"tagvalue": 0x0D400003, "type": "CString"},
-    "TAG_UM_LC_PARAM_FILE_SIZE": {"tagvalue": 0x0D400004, "type": "Uint32"},
-    "TAG_UM_LC_PARAM_FILE_CHECKSUM": {"tagvalue": 0x0D400005, "type": "CString"},
-    "TAG_UM_LC_PARAM_TRANSACTION_ID": {"tagvalue": 0x0D400006, "type": "UInt16"},
-    "TAG_UM_LC_PARAM_TRANSFER_TYPE": {"tagvalue": 0x0D400007, "type": "UInt16"},
-    "TAG_UM_LC_PARAM_TRANSACTION_STATUS": {"tagvalue": 0x0D400008, "type": "UInt16"},
-    "TAG_UM_LC_PARAM_BLOCK_ID": {"tagvalue": 0x0D400009, "type": "UInt16"},
-    "TAG_UM_LC_PARAM_UPDATE_STATUS": {"tagvalue": 0x0D40000A, "type": "Bool"},
-    "TAG_UM_LC_PARAM_CHUNK": {"tagvalue": 0x0D40000B, "type": "Container"},
-    "TAG_UM_LC_PARAM_CHUNK_ID": {"tagvalue": 0x0D40000C, "type": "UChar8"},
-    "TAG_UM_LC_PARAM_CHUNK_DATA": {"tagvalue": 0x0D40000D, "type": "ByteArray"},
-    "TAG_UM_LC_PARAM_CHUNK_DATA_LENGTH": {"tagvalue": 0x0D40000E, "type": "UInt16"},
-    "TAG_UM_UPDATE_STATUS": {"tagvalue": 0x0D800001, "type": "Int32"},
-    "TAG_UM_UPDATE_DCDC": {"tagvalue": 0x0D800002, "type": "UChar8"},
-    "TAG_UM_CHECK_FOR_UPDATES": {"tagvalue": 0x0D800003, "type": "UChar8"},
-    "TAG_UM_LC_SET_START_FILE_TRANSFER": {"tagvalue": 0x0D800004, "type": "Container"},
-    "TAG_UM_LC_SET_FILE_TRANSFER": {"tagvalue": 0x0D800005, "type": "Container"},
-    "TAG_UM_LC_SET_END_FILE_TRANSFER": {"tagvalue": 0x0D800006, "type": "Container"},
-    "TAG_UM_GENERAL_ERROR": {"tagvalue": 0x0DFFFFFF, "type": "Error"},
-    "TAG_WB_REQ_NIGHT_MODE": {"tagvalue": 0x0E000000, "type": "Container"},
-    "TAG_WB_REQ_ENERGY_ALL": {"tagvalue": 0x0E000001, "type": "None"},
-    "TAG_WB_REQ_ENERGY_SOLAR": {"tagvalue": 0x0E000002, "type": "None"},
-    "TAG_WB_REQ_SOC": {"tagvalue": 0x0E000003, "type": "None"},
-    "TAG_WB_REQ_STATUS": {"tagvalue": 0x0E000004, "type": "None"},
-    "TAG_WB_REQ_ERROR_CODE": {"tagvalue": 0x0E000005, "type": "None"},
-    "TAG_WB_REQ_MODE": {"tagvalue": 0x0E000006, "type": "None"},
-    "TAG_WB_REQ_APP_SOFTWARE": {"tagvalue": 0x0E000007, "type": "None"},
-    "TAG_WB_REQ_BOOTLOADER_SOFTWARE": {"tagvalue": 0x0E000008, "type": "None"},
-    "TAG_WB_REQ_HW_VERSION": {"tagvalue": 0x0E000009, "type": "None"},
-    "TAG_WB_REQ_FLASH_VERSION": {"tagvalue": 0x0E00000A, "type": "None"},
-    "TAG_WB_REQ_DEVICE_ID": {"tagvalue": 0x0E00000B, "type": "None"},
-    "TAG_WB_REQ_PM_POWER_L1": {"tagvalue": 0x0E00000C, "type": "None"},
-    "TAG_WB_REQ_PM_POWER_L2": {"tagvalue": 0x0E00000D, "type": "None"},
-    "TAG_WB_REQ_PM_POWER_L3": {"tagvalue": 0x0E00000E, "type": "None"},
-    "TAG_WB_REQ_PM_ACTIVE_PHASES": {"tagvalue": 0x0E00000F, "type": "None"},
-    "TAG_WB_REQ_SET_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E000010, "type": "Int16"},
-    "TAG_WB_REQ_PM_MODE": {"tagvalue": 0x0E000011, "type": "None"},
-    "TAG_WB_REQ_PM_ENERGY_L1": {"tagvalue": 0x0E000012, "type": "None"},
-    "TAG_WB_REQ_PM_ENERGY_L2": {"tagvalue": 0x0E000013, "type": "None"},
-    "TAG_WB_REQ_PM_ENERGY_L3": {"tagvalue": 0x0E000014, "type": "None"},
-    "TAG_WB_REQ_PM_DEVICE_ID": {"tagvalue": 0x0E000015, "type": "None"},
-    "TAG_WB_REQ_PM_ERROR_CODE": {"tagvalue": 0x0E000016, "type": "None"},
-    "TAG_WB_REQ_PM_FIRMWARE_VERSION": {"tagvalue": 0x0E000017, "type": "None"},
-    "TAG_WB_REQ_DIAG_DEVICE_ID": {"tagvalue": 0x0E000018, "type": "None"},
-    "TAG_WB_REQ_DIAG_BAT_CAPACITY": {"tagvalue": 0x0E000019, "type": "None"},
-    "TAG_WB_REQ_DIAG_USER_PARAM": {"tagvalue": 0x0E00001A, "type": "None"},
-    "TAG_WB_REQ_DIAG_MAX_CURRENT": {"tagvalue": 0x0E00001B, "type": "None"},
-    "TAG_WB_REQ_DIAG_PHASE_VOLTAGE": {"tagvalue": 0x0E00001C, "type": "None"},
-    "TAG_WB_REQ_DIAG_DISPLAY_SPEECH": {"tagvalue": 0x0E00001D, "type": "None"},
-    "TAG_WB_REQ_DIAG_DESIGN": {"tagvalue": 0x0E00001E, "type": "None"},
-    "TAG_WB_REQ_DIAG_INFOS": {"tagvalue": 0x0E00001F, "type": "None"},
-    "TAG_WB_REQ_DIAG_WARNINGS": {"tagvalue": 0x0E000020, "type": "None"},
-    "TAG_WB_REQ_DIAG_ERRORS": {"tagvalue": 0x0E000021, "type": "None"},
-    "TAG_WB_REQ_DIAG_TEMP_1": {"tagvalue": 0x0E000022, "type": "None"},
-    "TAG_WB_REQ_DIAG_TEMP_2": {"tagvalue": 0x0E000023, "type": "None"},
-    "TAG_WB_REQ_DIAG_CP_PEGEL": {"tagvalue": 0x0E000024, "type": "None"},
-    "TAG_WB_REQ_DIAG_PP_IN_A": {"tagvalue": 0x0E000025, "type": "None"},
-    "TAG_WB_REQ_DIAG_STATUS_DIODE": {"tagvalue": 0x0E000026, "type": "None"},
-    "TAG_WB_REQ_DIAG_DIG_IN_1": {"tagvalue": 0x0E000027, "type": "None"},
-    "TAG_WB_REQ_DIAG_DIG_IN_2": {"tagvalue": 0x0E000028, "type": "None"},
-    "TAG_WB_REQ_PM_DEVICE_STATE": {"tagvalue": 0x0E000029, "type": "None"},
-    "TAG_WB_REQ_AUTH_REQUIRED": {"tagvalue": 0x0E00002A, "type": "None"},
-    "TAG_WB_REQ_SET_AUTH_REQUIRED": {"tagvalue": 0x0E00002B, "type": "Bool"},
-    "TAG_WB_REQ_SESSION": {"tagvalue": 0x0E00002C, "type": "UChar8"},
-    "TAG_WB_REQ_SET_RFID_READER_ENABLED": {"tagvalue": 0x0E00002D, "type": "Bool"},
-    "TAG_WB_REQ_RFID_READER_ENABLED": {"tagvalue": 0x0E00002E, "type": "None"},
-    "TAG_WB_REQ_FIRMWARE_VERSION": {"tagvalue": 0x0E00002F, "type": "None"},
-    "TAG_WB_REQ_SET_MODE": {"tagvalue": 0x0E000030, "type": "Container"},
-    "TAG_WB_SET_MODE": {"tagvalue": 0x0E000031, "type": "UChar8"},
-    "TAG_WB_REQ_SET_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E000033, "type": "Bool"},
-    "TAG_WB_REQ_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E000034, "type": "None"},
-    "TAG_WB_REQ_BIDI_CONTINGENT": {"tagvalue": 0x0E000035, "type": "Container"},
-    "TAG_WB_REQ_SET_BIDI_CONTINGENT": {"tagvalue": 0x0E000036, "type": "Container"},
-    "TAG_WB_REQ_ALIVE": {"tagvalue": 0x0E000037, "type": "None"},
-    "TAG_WB_REQ_SET_AUTO_PHASE_SWITCH_ENABLED": {
-        "tagvalue": 0x0E000038,
-        "type": "Bool",
-    },
-    "TAG_WB_REQ_AUTO_PHASE_SWITCH_ENABLED": {"tagvalue": 0x0E000039, "type": "None"},
-    "TAG_WB_REQ_BIDI_MIN_ENERGY_REQUEST": {"tagvalue": 0x0E00003A, "type": "None"},
-    "TAG_WB_REQ_BIDI_MAX_ENERGY_REQUEST": {"tagvalue": 0x0E00003B, "type": "None"},
-    "TAG_WB_REQ_BIDI_TARGET_ENERGY_REQUEST": {"tagvalue": 0x0E00003C, "type": "None"},
-    "TAG_WB_REQ_BIDI_ENERGY_REQUESTS": {"tagvalue": 0x0E00003D, "type": "Container"},
-    "TAG_WB_REQ_CHARGE_IN_FALLBACK_MODE_SELECTABLE": {
-        "tagvalue": 0x0E00003E,
-        "type": "None",
-    },
-    "TAG_WB_REQ_CHARGE_IN_FALLBACK_MODE_ALLOWED": {
-        "tagvalue": 0x0E00003F,
-        "type": "None",
-    },
-    "TAG_WB_REQ_PM_MAX_PHASE_POWER": {"tagvalue": 0x0E000040, "type": "None"},
-    "TAG_WB_REQ_SET_DEVICE_NAME": {"tagvalue": 0x0E000041, "type": "CString"},
-    "TAG_WB_REQ_DEVICE_NAME": {"tagvalue": 0x0E000042, "type": "None"},
-    "TAG_WB_REFRESH_LOGGEDMESSAGES": {"tagvalue": 0x0E000043, "type": "None"},
-    "TAG_WB_REQ_GET_LOGGEDMESSAGES": {"tagvalue": 0x0E000044, "type": "None"},
-    "TAG_WB_REQ_SET_CHARGE_IN_FALLBACK_MODE_ALLOWED": {
-        "tagvalue": 0x0E000045,
-        "type": "Bool",
-    },
-    "TAG_WB_REQ_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E000046, "type": "None"},
-    "TAG_WB_REQ_SET_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E000047, "type": "UInt16"},
-    "TAG_WB_REQ_SET_LED_COLOR": {"tagvalue": 0x0E000048, "type": "UChar8"},
-    "TAG_WB_REQ_DC_CHARGER_STATE": {"tagvalue": 0x0E000049, "type": "None"},
-    "TAG_WB_REQ_SET_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E00004A, "type": "Uint32"},
-    "TAG_WB_REQ_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E00004B, "type": "None"},
-    "TAG_WB_REQ_ASSIGNED_POWER": {"tagvalue": 0x0E00004C, "type": "None"},
-    "TAG_WB_REQ_CP_STATE": {"tagvalue": 0x0E00004D, "type": "None"},
-    "TAG_WB_REQ_SET_NIGHT_MODE": {"tagvalue": 0x0E00004E, "type": "Container"},
-    "TAG_WB_REQ_BIDI_SHIFT_MODE_SOC_RANGE": {"tagvalue": 0x0E00004F, "type": "None"},
-    "TAG_WB_REQ_SET_BIDI_SHIFT_MODE_SOC_RANGE": {
-        "tagvalue": 0x0E000051,
-        "type": "Container",
-    },
-    "TAG_WB_REQ_DATA": {"tagvalue": 0x0E040000, "type": "Container"},
-    "TAG_WB_INDEX": {"tagvalue": 0x0E040001, "type": "UChar8"},
-    "TAG_WB_MODE_PARAM_MODE": {"tagvalue": 0x0E040031, "type": "UChar8"},
-    "TAG_WB_MODE_PARAM_MAX_CURRENT": {"tagvalue": 0x0E040032, "type": "UChar8"},
-    "TAG_WB_REQ_AVAILABLE_SOLAR_POWER": {"tagvalue": 0x0E041000, "type": "Container"},
-    "TAG_WB_POWER": {"tagvalue": 0x0E041001, "type": "UInt16"},
-    "TAG_WB_STATUS_BIT": {"tagvalue": 0x0E041002, "type": "UChar8"},
-    "TAG_WB_REQ_SET_EXTERN": {"tagvalue": 0x0E041010, "type": "Container"},
-    "TAG_WB_REQ_EXTERN_DATA_SUN": {"tagvalue": 0x0E041011, "type": "None"},
-    "TAG_WB_REQ_EXTERN_DATA_NET": {"tagvalue": 0x0E041012, "type": "None"},
-    "TAG_WB_REQ_EXTERN_DATA_ALL": {"tagvalue": 0x0E041013, "type": "None"},
-    "TAG_WB_REQ_EXTERN_DATA_ALG": {"tagvalue": 0x0E041014, "type": "None"},
-    "TAG_WB_REQ_SET_BAT_CAPACITY": {"tagvalue": 0x0E041015, "type": "Uint32"},
-    "TAG_WB_REQ_SET_ENERGY_ALL": {"tagvalue": 0x0E041016, "type": "Uint32"},
-    "TAG_WB_REQ_SET_ENERGY_SOLAR": {"tagvalue": 0x0E041017, "type": "Uint32"},
-    "TAG_WB_REQ_SET_PARAM_1": {"tagvalue": 0x0E041018, "type": "Container"},
-    "TAG_WB_REQ_SET_PARAM_2": {"tagvalue": 0x0E041019, "type": "Container"},
-    "TAG_WB_REQ_PARAM_2": {"tagvalue": 0x0E04101A, "type": "None"},
-    "TAG_WB_REQ_PARAM_1": {"tagvalue": 0x0E04101B, "type": "None"},
-    "TAG_WB_REQ_CONNECTED_DEVICES": {"tagvalue": 0x0E04101C, "type": "None"},
-    "TAG_WB_REQ_SET_SOC": {"tagvalue": 0x0E04101D, "type": "UChar8"},
-    "TAG_WB_REQ_STATION_AVAILABLE": {"tagvalue": 0x0E04101E, "type": "None"},
-    "TAG_WB_REQ_SET_STATION_AVAILABLE": {"tagvalue": 0x0E04101F, "type": "Bool"},
-    "TAG_WB_REQ_SET_PW": {"tagvalue": 0x0E041020, "type": "Container"},
-    "TAG_WB_REQ_SET_STATION_ENABLED": {"tagvalue": 0x0E041021, "type": "Bool"},
-    "TAG_WB_REQ_MAC_ADDRESS": {"tagvalue": 0x0E041022, "type": "None"},
-    "TAG_WB_REQ_PROXIMITY_PLUG": {"tagvalue": 0x0E041023, "type": "None"},
-    "TAG_WB_REQ_PREFERRED_CHARGE_POWER": {"tagvalue": 0x0E041024, "type": "None"},
-    "TAG_WB_REQ_CHARGE_FULL": {"tagvalue": 0x0E041025, "type": "None"},
-    "TAG_WB_REQ_SET_CHARGE_FULL": {"tagvalue": 0x0E041026, "type": "Bool"},
-    "TAG_WB_REQ_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E041027, "type": "None"},
-    "TAG_WB_REQ_SET_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E041028, "type": "Int32"},
-    "TAG_WB_REQ_PARAMETER_LIST": {"tagvalue": 0x0E041029, "type": "Uint32"},
-    "TAG_WB_REQ_STATION_ENABLED": {"tagvalue": 0x0E04102A, "type": "None"},
-    "TAG_WB_REQ_SET_PARAMETER_LIST": {"tagvalue": 0x0E041030, "type": "Container"},
-    "TAG_WB_REQ_GATEWAY": {"tagvalue": 0x0E041031, "type": "None"},
-    "TAG_WB_REQ_SUBNET_MASK": {"tagvalue": 0x0E041032, "type": "None"},
-    "TAG_WB_REQ_IP_ADDR": {"tagvalue": 0x0E041033, "type": "None"},
-    "TAG_WB_REQ_DHCP_ENABLED": {"tagvalue": 0x0E041034, "type": "None"},
-    "TAG_WB_REQ_SET_DHCP_ENABLED": {"tagvalue": 0x0E041035, "type": "Bool"},
-    "TAG_WB_REQ_WALLBOX_TYPE": {"tagvalue": 0x0E041036, "type": "None"},
-    "TAG_WB_REQ_UPDATE_NETWORK_CONFIG": {"tagvalue": 0x0E041037, "type": "Container"},
-    "TAG_WB_REQ_SUN_MODE_ACTIVE": {"tagvalue": 0x0E041038, "type": "None"},
-    "TAG_WB_REQ_SET_SUN_MODE_ACTIVE": {"tagvalue": 0x0E041039, "type": "Bool"},
-    "TAG_WB_REQ_NUMBER": {"tagvalue": 0x0E04103A, "type": "None"},
-    "TAG_WB_REQ_NUMBER_PHASES": {"tagvalue": 0x0E04103B, "type": "None"},
-    "TAG_WB_REQ_SET_NUMBER_PHASES": {"tagvalue": 0x0E04103C, "type": "UChar8"},
-    "TAG_WB_REQ_ABORT_CHARGING": {"tagvalue": 0x0E04103D, "type": "None"},
-    "TAG_WB_REQ_SET_ABORT_CHARGING": {"tagvalue": 0x0E04103E, "type": "Bool"},
-    "TAG_WB_REQ_SCHUKO_AVAILABLE": {"tagvalue": 0x0E041040, "type": "None"},
-    "TAG_WB_REQ_IS_SCHUKO_LOCKED": {"tagvalue": 0x0E041041, "type": "None"},
-    "TAG_WB_REQ_SET_SCHUKO_LOCKED": {"tagvalue": 0x0E041042, "type": "Bool"},
-    "TAG_WB_REQ_MAX_POWER_PER_PHASE": {"tagvalue": 0x0E041043, "type": "None"},
-    "TAG_WB_REQ_MIN_POWER_PER_PHASE": {"tagvalue": 0x0E041044, "type": "None"},
-    "TAG_WB_REQ_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E041045, "type": "None"},
-    "TAG_WB_REQ_LOWER_CURRENT_LIMIT": {"tagvalue": 0x0E041046, "type": "None"},
-    "TAG_WB_REQ_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E041047, "type": "None"},
-    "TAG_WB_REQ_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E041048, "type": "None"},
-    "TAG_WB_REQ_SET_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E041049, "type": "Int32"},
-    "TAG_WB_REQ_SET_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E04104A, "type": "Int32"},
-    "TAG_WB_PARAM_INDEX": {"tagvalue": 0x0E04104B, "type": "Int32"},
-    "TAG_WB_REQ_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E04104C, "type": "None"},
-    "TAG_WB_REQ_SET_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E04104D, "type": "Uint32"},
-    "TAG_WB_REQ_GET_KEY_LOCK_MODE": {"tagvalue": 0x0E04104E, "type": "None"},
-    "TAG_WB_REQ_SET_KEY_LOCK_MODE": {"tagvalue": 0x0E04104F, "type": "Uint32"},
-    "TAG_WB_REQ_KEY_STATE": {"tagvalue": 0x0E041050, "type": "None"},
-    "TAG_WB_SERIAL": {"tagvalue": 0x0E041051, "type": "CString"},
-    "TAG_WB_REQ_MAX_CHARGE_POWER": {"tagvalue": 0x0E041052, "type": "None"},
-    "TAG_WB_REQ_MIN_CHARGE_POWER": {"tagvalue": 0x0E041053, "type": "None"},
-    "TAG_WB_EXTERN_DATA": {"tagvalue": 0x0E042010, "type": "ByteArray"},
-    "TAG_WB_EXTERN_DATA_LEN": {"tagvalue": 0x0E042011, "type": "UChar8"},
-    "TAG_WB_PARAM_USR": {"tagvalue": 0x0E042012, "type": "UChar8"},
-    "TAG_WB_PARAM_PW": {"tagvalue": 0x0E042013, "type": "CString"},
-    "TAG_WB_REQ_DEVICE_STATE": {"tagvalue": 0x0E060000, "type": "None"},
-    "TAG_WB_REQ_SET_BIC_MODE": {"tagvalue": 0x0E0F0001, "type": "UChar8"},
-    "TAG_WB_REQ_GET_BIC_MODE": {"tagvalue": 0x0E0F0002, "type": "None"},
-    "TAG_WB_REQ_GET_CHARGE_PLAN_TEXT": {"tagvalue": 0x0E0F0003, "type": "None"},
-    "TAG_WB_PARAM_NIGHT_MODE_ACTIVE": {"tagvalue": 0x0E400000, "type": "Bool"},
-    "TAG_WB_PARAM_NIGHT_MODE_TIME_RANGE": {"tagvalue": 0x0E400001, "type": "CString"},
-    "TAG_WB_PARAM_BIDI_SHIFT_MODE_START_SOC": {
-        "tagvalue": 0x0E400002,
-        "type": "UChar8",
-    },
-    "TAG_WB_PARAM_BIDI_SHIFT_MODE_END_SOC": {"tagvalue": 0x0E400003, "type": "UChar8"},
-    "TAG_WB_STRING_PARAMETER": {"tagvalue": 0x0E440010, "type": "CString"},
-    "TAG_WB_PREFERRED_CHARGE_POWER": {"tagvalue": 0x0E741024, "type": "Int32"},
-    "TAG_WB_SESSION_END_TIME": {"tagvalue": 0x0E741025, "type": "Uint64"},
-    "TAG_WB_SESSION_START_TIME": {"tagvalue": 0x0E741026, "type": "Uint64"},
-    "TAG_WB_SESSION_STATUS": {"tagvalue": 0x0E741027, "type": "UChar8"},
-    "TAG_WB_SESSION_ACTIVE_CHARGE_TIME": {"tagvalue": 0x0E741028, "type": "Uint64"},
-    "TAG_WB_SESSION_INACTIVE_TIME": {"tagvalue": 0x0E741029, "type": "Uint64"},
-    "TAG_WB_SESSION_CHARGED_ENERGY": {"tagvalue": 0x0E74102A, "type": "Double64"},
-    "TAG_WB_SESSION_CHARGED_SUN_ENERGY": {"tagvalue": 0x0E74102B, "type": "Double64"},
-    "TAG_WB_SESSION_METER_ENERGY_START": {"tagvalue": 0x0E74102C, "type": "Double64"},
-    "TAG_WB_SESSION_METER_ENERGY_END": {"tagvalue": 0x0E74102D, "type": "Double64"},
-    "TAG_WB_SESSION_ID": {"tagvalue": 0x0E74102E, "type": "CString"},
-    "TAG_WB_SESSION_VEHICLE_ID": {"tagvalue": 0x0E74102F, "type": "CString"},
-    "TAG_WB_SESSION_AUTH_DATA": {"tagvalue": 0x0E741030, "type": "CString"},
-    "TAG_WB_SESSION_RECEIPT_SIGNATURE": {"tagvalue": 0x0E741031, "type": "CString"},
-    "TAG_WB_SESSION_RECEIPT_DATA": {"tagvalue": 0x0E741032, "type": "CString"},
-    "TAG_WB_SESSION_AUTH_TYPE": {"tagvalue": 0x0E741033, "type": "Char8"},
-    "TAG_WB_SESSION_WALLBOX_ID": {"tagvalue": 0x0E741035, "type": "CString"},
-    "TAG_WB_BIDI_CONTINGENT_USED_KWH_YEAR": {"tagvalue": 0x0E741036, "type": "Uint32"},
-    "TAG_WB_BIDI_CONTINGENT_USED_HOURS_YEAR": {
-        "tagvalue": 0x0E741037,
-        "type": "Uint32",
-    },
-    "TAG_WB_BIDI_CONTINGENT_MAX_KWH_LIFETIME": {
-        "tagvalue": 0x0E741038,
-        "type": "Uint32",
-    },
-    "TAG_WB_BIDI_CONTINGENT_MAX_HOURS_LIFETIME": {
-        "tagvalue": 0x0E741039,
-        "type": "Uint32",
-    },
-    "TAG_WB_BIDI_CONTINGENT_MAX_HOURS_YEAR": {"tagvalue": 0x0E74103A, "type": "Uint32"},
-    "TAG_WB_BIDI_CONTINGENT_MAX_KWH_YEAR": {"tagvalue": 0x0E74103B, "type": "Uint32"},
-    "TAG_WB_BIDI_CONTINGENT_CAR_ID": {"tagvalue": 0x0E74103C, "type": "CString"},
-    "TAG_WB_BIDI_CONTINGENT_CAR_LIFETIME": {"tagvalue": 0x0E74103D, "type": "Uint32"},
-    "TAG_WB_SESSION_AUTH_DATA_SWAPPED": {"tagvalue": 0x0E74103E, "type": "Bool"},
-    "TAG_WB_SESSION_ACTIVE_DISCHARGE_TIME": {"tagvalue": 0x0E74103F, "type": "Uint64"},
-    "TAG_WB_SESSION_DISCHARGED_ENERGY": {"tagvalue": 0x0E741040, "type": "Double64"},
-    "TAG_WB_SESSION_DISCHARGE_METER_ENERGY_START": {
-        "tagvalue": 0x0E741041,
-        "type": "Double64",
-    },
-    "TAG_WB_SESSION_DISCHARGE_METER_ENERGY_STOP": {
-        "tagvalue": 0x0E741042,
-        "type": "Double64",
-    },
-    "TAG_WB_ASSIGNED_POWER_L1": {"tagvalue": 0x0E741043, "type": "Int32"},
-    "TAG_WB_ASSIGNED_POWER_L2": {"tagvalue": 0x0E741044, "type": "Int32"},
-    "TAG_WB_ASSIGNED_POWER_L3": {"tagvalue": 0x0E741045, "type": "Int32"},
-    "TAG_WB_NIGHT_MODE": {"tagvalue": 0x0E800000, "type": "Container"},
-    "TAG_WB_ENERGY_ALL": {"tagvalue": 0x0E800001, "type": "Uint32"},
-    "TAG_WB_ENERGY_SOLAR": {"tagvalue": 0x0E800002, "type": "Uint32"},
-    "TAG_WB_SOC": {"tagvalue": 0x0E800003, "type": "UInt16"},
-    "TAG_WB_STATUS": {"tagvalue": 0x0E800004, "type": "UChar8"},
-    "TAG_WB_ERROR_CODE": {"tagvalue": 0x0E800005, "type": "UChar8"},
-    "TAG_WB_MODE": {"tagvalue": 0x0E800006, "type": "UChar8"},
-    "TAG_WB_APP_SOFTWARE": {"tagvalue": 0x0E800007, "type": "UChar8"},
-    "TAG_WB_BOOTLOADER_SOFTWARE": {"tagvalue": 0x0E800008, "type": "UChar8"},
-    "TAG_WB_HW_VERSION": {"tagvalue": 0x0E800009, "type": "UChar8"},
-    "TAG_WB_FLASH_VERSION": {"tagvalue": 0x0E80000A, "type": "UChar8"},
-    "TAG_WB_DEVICE_ID": {"tagvalue": 0x0E80000B, "type": "UChar8"},
-    "TAG_WB_PM_POWER_L1": {"tagvalue": 0x0E80000C, "type": "Double64"},
-    "TAG_WB_PM_POWER_L2": {"tagvalue": 0x0E80000D, "type": "Double64"},
-    "TAG_WB_PM_POWER_L3": {"tagvalue": 0x0E80000E, "type": "Double64"},
-    "TAG_WB_PM_ACTIVE_PHASES": {"tagvalue": 0x0E80000F, "type": "UChar8"},
-    "TAG_WB_SET_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E800010, "type": "Int16"},
-    "TAG_WB_PM_MODE": {"tagvalue": 0x0E800011, "type": "UChar8"},
-    "TAG_WB_PM_ENERGY_L1": {"tagvalue": 0x0E800012, "type": "Double64"},
-    "TAG_WB_PM_ENERGY_L2": {"tagvalue": 0x0E800013, "type": "Double64"},
-    "TAG_WB_PM_ENERGY_L3": {"tagvalue": 0x0E800014, "type": "Double64"},
-    "TAG_WB_PM_DEVICE_ID": {"tagvalue": 0x0E800015, "type": "Uint32"},
-    "TAG_WB_PM_ERROR_CODE": {"tagvalue": 0x0E800016, "type": "UChar8"},
-    "TAG_WB_PM_FIRMWARE_VERSION": {"tagvalue": 0x0E800017, "type": "UChar8"},
-    "TAG_WB_DIAG_DEVICE_ID": {"tagvalue": 0x0E800018, "type": "Uint32"},
-    "TAG_WB_DIAG_BAT_CAPACITY": {"tagvalue": 0x0E800019, "type": "Uint32"},
-    "TAG_WB_DIAG_USER_PARAM": {"tagvalue": 0x0E80001A, "type": "UInt16"},
-    "TAG_WB_DIAG_MAX_CURRENT": {"tagvalue": 0x0E80001B, "type": "UChar8"},
-    "TAG_WB_DIAG_PHASE_VOLTAGE": {"tagvalue": 0x0E80001C, "type": "UChar8"},
-    "TAG_WB_DIAG_DISPLAY_SPEECH": {"tagvalue": 0x0E80001D, "type": "UChar8"},
-    "TAG_WB_DIAG_DESIGN": {"tagvalue": 0x0E80001E, "type": "UChar8"},
-    "TAG_WB_DIAG_INFOS": {"tagvalue": 0x0E80001F, "type": "UInt16"},
-    "TAG_WB_DIAG_WARNINGS": {"tagvalue": 0x0E800020, "type": "UInt16"},
-    "TAG_WB_DIAG_ERRORS": {"tagvalue": 0x0E800021, "type": "UInt16"},
-    "TAG_WB_DIAG_TEMP_1": {"tagvalue": 0x0E800022, "type": "UChar8"},
-    "TAG_WB_DIAG_TEMP_2": {"tagvalue": 0x0E800023, "type": "UChar8"},
-    "TAG_WB_DIAG_CP_PEGEL": {"tagvalue": 0x0E800024, "type": "UChar8"},
-    "TAG_WB_DIAG_PP_IN_A": {"tagvalue": 0x0E800025, "type": "UChar8"},
-    "TAG_WB_DIAG_STATUS_DIODE": {"tagvalue": 0x0E800026, "type": "UChar8"},
-    "TAG_WB_DIAG_DIG_IN_1": {"tagvalue": 0x0E800027, "type": "ByteArray"},
-    "TAG_WB_DIAG_DIG_IN_2": {"tagvalue": 0x0E800028, "type": "ByteArray"},
-    "TAG_WB_PM_DEVICE_STATE": {"tagvalue": 0x0E800029, "type": "Container"},
-    "TAG_WB_AUTH_REQUIRED": {"tagvalue": 0x0E80002A, "type": "Bool"},
-    "TAG_WB_SET_AUTH_REQUIRED": {"tagvalue": 0x0E80002B, "type": "Bool"},
-    "TAG_WB_SESSION": {"tagvalue": 0x0E80002C, "type": "Container"},
-    "TAG_WB_SET_RFID_READER_ENABLED": {"tagvalue": 0x0E80002D, "type": "Bool"},
-    "TAG_WB_RFID_READER_ENABLED": {"tagvalue": 0x0E80002E, "type": "Bool"},
-    "TAG_WB_FIRMWARE_VERSION": {"tagvalue": 0x0E80002F, "type": "CString"},
-    "TAG_WB_PM_DEVICE_STATE_CONNECTED": {"tagvalue": 0x0E800030, "type": "Bool"},
-    "TAG_WB_PM_DEVICE_STATE_WORKING": {"tagvalue": 0x0E800031, "type": "Bool"},
-    "TAG_WB_PM_DEVICE_STATE_IN_SERVICE": {"tagvalue": 0x0E800032, "type": "Bool"},
-    "TAG_WB_SET_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E800033, "type": "Bool"},
-    "TAG_WB_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E800034, "type": "Bool"},
-    "TAG_WB_BIDI_CONTINGENT": {"tagvalue": 0x0E800035, "type": "Container"},
-    "TAG_WB_SET_BIDI_CONTINGENT": {"tagvalue": 0x0E800036, "type": "Bool"},
-    "TAG_WB_ALIVE": {"tagvalue": 0x0E800037, "type": "UChar8"},
-    "TAG_WB_SET_AUTO_PHASE_SWITCH_ENABLED": {"tagvalue": 0x0E800038, "type": "Bool"},
-    "TAG_WB_AUTO_PHASE_SWITCH_ENABLED": {"tagvalue": 0x0E800039, "type": "Bool"},
-    "TAG_WB_BIDI_MIN_ENERGY_REQUEST": {"tagvalue": 0x0E80003A, "type": "Int32"},
-    "TAG_WB_BIDI_MAX_ENERGY_REQUEST": {"tagvalue": 0x0E80003B, "type": "Int32"},
-    "TAG_WB_BIDI_TARGET_ENERGY_REQUEST": {"tagvalue": 0x0E80003C, "type": "Int32"},
-    "TAG_WB_BIDI_ENERGY_REQUESTS": {"tagvalue": 0x0E80003D, "type": "Container"},
-    "TAG_WB_CHARGE_IN_FALLBACK_MODE_SELECTABLE": {
-        "tagvalue": 0x0E80003E,
-        "type": "Bool",
-    },
-    "TAG_WB_CHARGE_IN_FALLBACK_MODE_ALLOWED": {"tagvalue": 0x0E80003F, "type": "Bool"},
-    "TAG_WB_PM_MAX_PHASE_POWER": {"tagvalue": 0x0E800040, "type": "Double64"},
-    "TAG_WB_DEVICE_NAME": {"tagvalue": 0x0E800042, "type": "CString"},
-    "TAG_WB_SET_CHARGE_IN_FALLBACK_MODE_ALLOWED": {
-        "tagvalue": 0x0E800045,
-        "type": "Bool",
-    },
-    "TAG_WB_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E800046, "type": "UInt16"},
-    "TAG_WB_SET_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E800047, "type": "Bool"},
-    "TAG_WB_SET_LED_COLOR": {"tagvalue": 0x0E800048, "type": "Bool"},
-    "TAG_WB_DC_CHARGER_STATE": {"tagvalue": 0x0E800049, "type": "UChar8"},
-    "TAG_WB_SET_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E80004A, "type": "Bool"},
-    "TAG_WB_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E80004B, "type": "Uint32"},
-    "TAG_WB_ASSIGNED_POWER": {"tagvalue": 0x0E80004C, "type": "Container"},
-    "TAG_WB_CP_STATE": {"tagvalue": 0x0E80004D, "type": "CString"},
-    "TAG_WB_SET_NIGHT_MODE": {"tagvalue": 0x0E80004E, "type": "Container"},
-    "TAG_WB_BIDI_SHIFT_MODE_SOC_RANGE": {"tagvalue": 0x0E80004F, "type": "Container"},
-    "TAG_WB_SET_BIDI_SHIFT_MODE_SOC_RANGE": {
-        "tagvalue": 0x0E800051,
-        "type": "Container",
-    },
-    "TAG_WB_DATA": {"tagvalue": 0x0E840000, "type": "Container"},
-    "TAG_WB_AVAILABLE_SOLAR_POWER": {"tagvalue": 0x0E841000, "type": "Container"},
-    "TAG_WB_SET_EXTERN": {"tagvalue": 0x0E841010, "type": "None"},
-    "TAG_WB_EXTERN_DATA_SUN": {"tagvalue": 0x0E841011, "type": "Container"},
-    "TAG_WB_EXTERN_DATA_NET": {"tagvalue": 0x0E841012, "type": "Container"},
-    "TAG_WB_EXTERN_DATA_ALL": {"tagvalue": 0x0E841013, "type": "Container"},
-    "TAG_WB_EXTERN_DATA_ALG": {"tagvalue": 0x0E841014, "type": "Container"},
-    "TAG_WB_SET_BAT_CAPACITY": {"tagvalue": 0x0E841015, "type": "Uint32"},
-    "TAG_WB_SET_ENERGY_ALL": {"tagvalue": 0x0E841016, "type": "Uint32"},
-    "TAG_WB_SET_ENERGY_SOLAR": {"tagvalue": 0x0E841017, "type": "Uint32"},
-    "TAG_WB_SET_PARAM_1": {"tagvalue": 0x0E841018, "type": "Container"},
-    "TAG_WB_SET_PARAM_2": {"tagvalue": 0x0E841019, "type": "Container"},
-    "TAG_WB_RSP_PARAM_2": {"tagvalue": 0x0E84101A, "type": "Container"},
-    "TAG_WB_RSP_PARAM_1": {"tagvalue": 0x0E84101B, "type": "Container"},
-    "TAG_WB_CONNECTED_DEVICES": {"tagvalue": 0x0E84101C, "type": "Container"},
-    "TAG_WB_SET_SOC": {"tagvalue": 0x0E84101D, "type": "UChar8"},
-    "TAG_WB_STATION_AVAILABLE": {"tagvalue": 0x0E84101E, "type": "Bool"},
-    "TAG_WB_SET_STATION_AVAILABLE": {"tagvalue": 0x0E84101F, "type": "Bool"},
-    "TAG_WB_SET_PW": {"tagvalue": 0x0E841020, "type": "Container"},
-    "TAG_WB_SET_STATION_ENABLED": {"tagvalue": 0x0E841021, "type": "Bool"},
-    "TAG_WB_MAC_ADDRESS": {"tagvalue": 0x0E841022, "type": "CString"},
-    "TAG_WB_PROXIMITY_PLUG": {"tagvalue": 0x0E841023, "type": "Int32"},
-    "TAG_WB_CHARGE_FULL": {"tagvalue": 0x0E841025, "type": "Bool"},
-    "TAG_WB_SET_CHARGE_FULL": {"tagvalue": 0x0E841026, "type": "Bool"},
-    "TAG_WB_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E841027, "type": "Int32"},
-    "TAG_WB_SET_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E841028, "type": "Int32"},
-    "TAG_WB_PARAMETER_LIST": {"tagvalue": 0x0E841029, "type": "Container"},
-    "TAG_WB_STATION_ENABLED": {"tagvalue": 0x0E84102A, "type": "Bool"},
-    "TAG_WB_SET_PARAMETER_LIST": {"tagvalue": 0x0E841030, "type": "None"},
-    "TAG_WB_GATEWAY": {"tagvalue": 0x0E841031, "type": "CString"},
-    "TAG_WB_SUBNET_MASK": {"tagvalue": 0x0E841032, "type": "CString"},
-    "TAG_WB_IP_ADDR": {"tagvalue": 0x0E841033, "type": "CString"},
-    "TAG_WB_DHCP_ENABLED": {"tagvalue": 0x0E841034, "type": "Bool"},
-    "TAG_WB_SET_DHCP_ENABLED": {"tagvalue": 0x0E841035, "type": "Bool"},
-    "TAG_WB_WALLBOX_TYPE": {"tagvalue": 0x0E841036, "type": "Uint32"},
-    "TAG_WB_UPDATE_NETWORK_CONFIG": {"tagvalue": 0x0E841037, "type": "Char8"},
-    "TAG_WB_SUN_MODE_ACTIVE": {"tagvalue": 0x0E841038, "type": "Bool"},
-    "TAG_WB_SET_SUN_MODE_ACTIVE": {"tagvalue": 0x0E841039, "type": "Bool"},
-    "TAG_WB_NUMBER": {"tagvalue": 0x0E84103A, "type": "Int32"},
-    "TAG_WB_NUMBER_PHASES": {"tagvalue": 0x0E84103B, "type": "UChar8"},
-    "TAG_WB_SET_NUMBER_PHASES": {"tagvalue": 0x0E84103C, "type": "UChar8"},
-    "TAG_WB_ABORT_CHARGING": {"tagvalue": 0x0E84103D, "type": "Bool"},
-    "TAG_WB_SET_ABORT_CHARGING": {"tagvalue": 0x0E84103F, "type": "Bool"},
-    "TAG_WB_SCHUKO_AVAILABLE": {"tagvalue": 0x0E841040, "type": "Bool"},
-    "TAG_WB_IS_SCHUKO_LOCKED": {"tagvalue": 0x0E841041, "type": "Bool"},
-    "TAG_WB_SET_SCHUKO_LOCKED": {"tagvalue": 0x0E841042, "type": "Bool"},
-    "TAG_WB_MAX_POWER_PER_PHASE": {"tagvalue": 0x0E841043, "type": "Int32"},
-    "TAG_WB_MIN_POWER_PER_PHASE": {"tagvalue": 0x0E841044, "type": "Int32"},
-    "TAG_WB_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E841045, "type": "Int32"},
-    "TAG_WB_LOWER_CURRENT_LIMIT": {"tagvalue": 0x0E841046, "type": "Int32"},
-    "TAG_WB_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E841047, "type": "Int32"},
-    "TAG_WB_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E841048, "type": "Int32"},
-    "TAG_WB_SET_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E841049, "type": "Int32"},
-    "TAG_WB_SET_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E84104A, "type": "Int32"},
-    "TAG_WB_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E84104C, "type": "Uint32"},
-    "TAG_WB_SET_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E84104D, "type": "Uint32"},
-    "TAG_WB_GET_KEY_LOCK_MODE": {"tagvalue": 0x0E84104E, "type": "Uint32"},
-    "TAG_WB_SET_KEY_LOCK_MODE": {"tagvalue": 0x0E84104F, "type": "Uint32"},
-    "TAG_WB_KEY_STATE": {"tagvalue": 0x0E841050, "type": "Uint32"},
-    "TAG_WB_REQ_SERIAL": {"tagvalue": 0x0E841051, "type": "None"},
-    "TAG_WB_MAX_CHARGE_POWER": {"tagvalue": 0x0E841052, "type": "Int32"},
-    "TAG_WB_MIN_CHARGE_POWER": {"tagvalue": 0x0E841053, "type": "Int32"},
-    "TAG_WB_DEVICE_STATE": {"tagvalue": 0x0E860000, "type": "Container"},
-    "TAG_WB_DEVICE_CONNECTED": {"tagvalue": 0x0E860001, "type": "Bool"},
-    "TAG_WB_DEVICE_WORKING": {"tagvalue": 0x0E860002, "type": "Bool"},
-    "TAG_WB_DEVICE_IN_SERVICE": {"tagvalue": 0x0E860003, "type": "Bool"},
-    "TAG_WB_SET_BIC_MODE": {"tagvalue": 0x0E8F0001, "type": "Bool"},
-    "TAG_WB_GET_BIC_MODE": {"tagvalue": 0x0E8F0002, "type": "UChar8"},
-    "TAG_WB_GET_CHARGE_PLAN_TEXT": {"tagvalue": 0x0E8F0003, "type": "CString"},
-    "TAG_WB_SESSION_DATA_SAVED": {"tagvalue": 0x0E8F0004, "type": "CString"},
-    "TAG_WB_SESSION_DATA_WAIT_FOR": {"tagvalue": 0x0E8F0005, "type": "UInt16"},
-    "TAG_WB_GET_LOGGEDMESSAGES": {"tagvalue": 0x0E8F0006, "type": "CString"},
-    "TAG_WB_GENERAL_ERROR": {"tagvalue": 0x0EFFFFFF, "type": "Error"},
-    "TAG_PTDB_REQ_SET_STD_PROPS": {"tagvalue": 0x0F000001, "type": "None"},
-    "TAG_PTDB_REQ_SET_PROP": {"tagvalue": 0x0F000002, "type": "Container"},
-    "TAG_PTDB_REQ_PROP": {"tagvalue": 0x0F000003, "type": "Container"},
-    "TAG_PTDB_PARAM_TABLE": {"tagvalue": 0x0F400001, "type": "CString"},
-    "TAG_PTDB_PARAM_KEY": {"tagvalue": 0x0F400002, "type": "CString"},
-    "TAG_PTDB_PARAM_VALUE": {"tagvalue": 0x0F400003, "type": "CString"},
-    "TAG_PTDB_SET_STD_PROPS": {"tagvalue": 0x0F800001, "type": "Container"},
-    "TAG_PTDB_SET_PROP": {"tagvalue": 0x0F800002, "type": "Bool"},
-    "TAG_PTDB_PROP": {"tagvalue": 0x0F800003, "type": "Container"},
-    "TAG_LED_REQ_SET_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10000001, "type": "UChar8"},
-    "TAG_LED_REQ_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10000002, "type": "None"},
-    "TAG_LED_REQ_INTENSITY": {"tagvalue": 0x10000003, "type": "None"},
-    "TAG_LED_REQ_SET_INTENSITY": {"tagvalue": 0x10000004, "type": "Uint32"},
-    "TAG_LED_REQ_COLOR": {"tagvalue": 0x10000005, "type": "Uint32"},
-    "TAG_LED_REQ_SET_COLOR": {"tagvalue": 0x10000006, "type": "Container"},
-    "TAG_LED_REQ_HW_INFO": {"tagvalue": 0x10000007, "type": "None"},
-    "TAG_LED_REQ_STORE_CONFIG": {"tagvalue": 0x10000008, "type": "None"},
-    "TAG_LED_REQ_DEVICE_STATE": {"tagvalue": 0x10060000, "type": "None"},
-    "TAG_LED_SET_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10800001, "type": "UChar8"},
-    "TAG_LED_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10800002, "type": "UChar8"},
-    "TAG_LED_INTENSITY": {"tagvalue": 0x10800003, "type": "Uint32"},
-    "TAG_LED_SET_INTENSITY": {"tagvalue": 0x10800004, "type": "Uint32"},
-    "TAG_LED_COLOR": {"tagvalue": 0x10800005, "type": "Container"},
-    "TAG_LED_SET_COLOR": {"tagvalue": 0x10800006, "type": "Container"},
-    "TAG_LED_HW_INFO": {"tagvalue": 0x10800007, "type": "Container"},
-    "TAG_LED_CONFIG_STORED": {"tagvalue": 0x10800009, "type": "UChar8"},
-    "TAG_LED_DEVICE_STATE": {"tagvalue": 0x10860000, "type": "Container"},
-    "TAG_LED_INDEX": {"tagvalue": 0x10860001, "type": "Uint32"},
-    "TAG_LED_RED": {"tagvalue": 0x10860002, "type": "Uint32"},
-    "TAG_LED_GREEN": {"tagvalue": 0x10860003, "type": "Uint32"},
-    "TAG_LED_BLUE": {"tagvalue": 0x10860004, "type": "Uint32"},
-    "TAG_LED_FW_VERSION": {"tagvalue": 0x10860005, "type": "UInt16"},
-    "TAG_LED_BL_VERSION": {"tagvalue": 0x10860006, "type": "UInt16"},
-    "TAG_LED_DEVICE_CONNECTED": {"tagvalue": 0x10860007, "type": "Bool"},
-    "TAG_LED_DEVICE_WORKING": {"tagvalue": 0x10860008, "type": "Bool"},
-    "TAG_LED_DEVICE_IN_SERVICE": {"tagvalue": 0x10860009, "type": "Bool"},
-    "TAG_DIAG_REQ_CURRENT_ISSUES": {"tagvalue": 0x11000000, "type": "None"},
-    "TAG_DIAG_REQ_REPORTED_ISSUES": {"tagvalue": 0x11000001, "type": "None"},
-    "TAG_DIAG_CURRENT_ISSUES": {"tagvalue": 0x11800000, "type": "Container"},
-    "TAG_DIAG_REPORTED_ISSUES": {"tagvalue": 0x11800001, "type": "Container"},
-    "TAG_DIAG_ISSUE": {"tagvalue": 0x11860000, "type": "Container"},
-    "TAG_DIAG_ERR_CODE": {"tagvalue": 0x11860001, "type": "Uint32"},
-    "TAG_DIAG_ENDURE_TIME": {"tagvalue": 0x11860002, "type": "Int64"},
-    "TAG_DIAG_TIME_ARISED": {"tagvalue": 0x11860003, "type": "Int64"},
-    "TAG_DIAG_ERR_MSG": {"tagvalue": 0x11860004, "type": "CString"},
-    "TAG_SGR_REQ_STATE": {"tagvalue": 0x12000001, "type": "None"},
-    "TAG_SGR_REQ_READY_TO_USE": {"tagvalue": 0x12000002, "type": "None"},
-    "TAG_SGR_REQ_HW_PROVIDER_LIST": {"tagvalue": 0x12000003, "type": "None"},
-    "TAG_SGR_REQ_SET_AKTIV": {"tagvalue": 0x12000006, "type": "Container"},
-    "TAG_SGR_REQ_SET_COOLDOWN_START": {"tagvalue": 0x12000007, "type": "Char8"},
-    "TAG_SGR_REQ_COOLDOWN_END": {"tagvalue": 0x12000008, "type": "None"},
-    "TAG_SGR_REQ_SET_USED_POWER": {"tagvalue": 0x12000009, "type": "UInt16"},
-    "TAG_SGR_REQ_USED_POWER": {"tagvalue": 0x12000010, "type": "None"},
-    "TAG_SGR_REQ_SET_STATE": {"tagvalue": 0x12000011, "type": "UChar8"},
-    "TAG_SGR_REQ_SET_GLOBAL_OFF": {"tagvalue": 0x12000012, "type": "Bool"},
-    "TAG_SGR_REQ_GLOBAL_OFF": {"tagvalue": 0x12000013, "type": "None"},
-    "TAG_SGR_REQ_DATA": {"tagvalue": 0x12040000, "type": "Container"},
-    "TAG_SGR_INDEX": {"tagvalue": 0x12040001, "type": "UInt16"},
-    "TAG_SGR_STATE": {"tagvalue": 0x12800001, "type": "Char8", "type_variable": True},
-    # "TAG_SGR_STATE": {"tagvalue": 0x12800001, "type": "Int32"},
-    "TAG_SGR_READY_TO_USE": {"tagvalue": 0x12800002, "type": "Char8"},
-    "TAG_SGR_HW_PROVIDER_LIST": {"tagvalue": 0x12800003, "type": "Container"},
-    "TAG_SGR_HW_PROVIDER": {"tagvalue": 0x12800004, "type": "Container"},
-    "TAG_SGR_NAME": {"tagvalue": 0x12800005, "type": "CString"},
-    "TAG_SGR_AKTIV": {"tagvalue": 0x12800006, "type": "Bool"},
-    "TAG_SGR_COOLDOWN_END": {"tagvalue": 0x12800008, "type": "Timestamp"},
-    "TAG_SGR_USED_POWER": {"tagvalue": 0x12800009, "type": "UInt16"},
-    "TAG_SGR_GLOBAL_OFF": {"tagvalue": 0x12800012, "type": "Bool"},
-    "TAG_SGR_DATA": {"tagvalue": 0x12840000, "type": "Container"},
-    "TAG_MBS_REQ_MODBUS_ENABLED": {"tagvalue": 0x13000001, "type": "None"},
-    "TAG_MBS_REQ_MODBUS_CONNECTORS": {"tagvalue": 0x13000002, "type": "None"},
-    "TAG_MBS_REQ_ENABLE_CONNECTOR": {"tagvalue": 0x13000003, "type": "Int32"},
-    "TAG_MBS_REQ_DISABLE_CONNECTOR": {"tagvalue": 0x13000004, "type": "Int32"},
-    "TAG_MBS_REQ_CHANGE_SETTING": {"tagvalue": 0x13000005, "type": "Container"},
-    "TAG_MBS_REQ_SET_MODBUS_ENABLED": {"tagvalue": 0x13700001, "type": "Bool"},
-    "TAG_MBS_MODBUS_ENABLED": {"tagvalue": 0x13800001, "type": "Bool"},
-    "TAG_MBS_MODBUS_CONNECTORS": {"tagvalue": 0x13800002, "type": "Container"},
-    "TAG_MBS_CHANGE_SETTING": {"tagvalue": 0x13800005, "type": "Bool"},
-    "TAG_MBS_REQ_CHANGE_SETTING_ERR": {"tagvalue": 0x13800006, "type": "Container"},
-    "TAG_MBS_MODBUS_CONNECTOR_CONTAINER": {"tagvalue": 0x13810002, "type": "Container"},
-    "TAG_MBS_MODBUS_CONNECTOR_NAME": {"tagvalue": 0x13810003, "type": "CString"},
-    "TAG_MBS_MODBUS_CONNECTOR_ID": {"tagvalue": 0x13810004, "type": "Int32"},
-    "TAG_MBS_MODBUS_CONNECTOR_ENABLED": {"tagvalue": 0x13810005, "type": "Bool"},
-    "TAG_MBS_MODBUS_CONNECTOR_SETUP": {"tagvalue": 0x13810006, "type": "Container"},
-    "TAG_MBS_MODBUS_SETUP_NAME": {"tagvalue": 0x13810007, "type": "CString"},
-    "TAG_MBS_MODBUS_SETUP_TYPE": {"tagvalue": 0x13810008, "type": "Int32"},
-    "TAG_MBS_MODBUS_SETUP_VALUE": {"tagvalue": 0x13810009, "type": "CString"},
-    "TAG_MBS_MODBUS_SETUP_VALUES": {"tagvalue": 0x1381000A, "type": "Container"},
-    "TAG_MBS_MODBUS_SETUP_VALUE_STRING": {"tagvalue": 0x1381000B, "type": "CString"},
-    "TAG_EH_REQ_UNREPORTED_ERRORS": {"tagvalue": 0x14000001, "type": "None"},
-    "TAG_EH_REQ_MARK_REPORTED": {"tagvalue": 0x14000002, "type": "Container"},
-    "TAG_EH_REQ_GET_SAVED_ERRORS": {"tagvalue": 0x14000003, "type": "None"},
-    "TAG_EH_PARAM_ROW": {"tagvalue": 0x14040000, "type": "Container"},
-    "TAG_EH_PARAM_ROW_ID": {"tagvalue": 0x14040001, "type": "Uint64"},
-    "TAG_EH_PARAM_ROW_TIME": {"tagvalue": 0x14040002, "type": "Uint64"},
-    "TAG_EH_PARAM_ROW_CODE": {"tagvalue": 0x14040003, "type": "Uint32"},
-    "TAG_EH_PARAM_ROW_TYPE": {"tagvalue": 0x14040004, "type": "UChar8"},
-    "TAG_EH_PARAM_ROW_CLEARED": {"tagvalue": 0x14040005, "type": "Bool"},
-    "TAG_EH_PARAM_ROW_ERR_SRC": {"tagvalue": 0x14040006, "type": "CString"},
-    "TAG_EH_PARAM_ROW_MSG": {"tagvalue": 0x14040007, "type": "CString"},
-    "TAG_EH_UNREPORTED_ERRORS": {"tagvalue": 0x14800001, "type": "Container"},
-    "TAG_EH_MARKED_REPORTED": {"tagvalue": 0x14800002, "type": "Int32"},
-    "TAG_EH_GET_SAVED_ERRORS": {"tagvalue": 0x14800003, "type": "Container"},
-    "TAG_UPNPC_REQ_DEFAULT_LIST": {"tagvalue": 0x15000001, "type": "None"},
-    "TAG_UPNPC_REQ_SET_DEFAULT_LIST": {"tagvalue": 0x15000002, "type": "Container"},
-    "TAG_UPNPC_REQ_SERVICE_LIST": {"tagvalue": 0x15000003, "type": "None"},
-    "TAG_UPNPC_REQ_DEFAULT_LIST_REV": {"tagvalue": 0x15000006, "type": "None"},
-    "TAG_UPNPC_REQ_SERVICE_LIST_REV": {"tagvalue": 0x15000007, "type": "None"},
-    "TAG_UPNPC_PARAM_DEVICE_ENTRY": {"tagvalue": 0x15040000, "type": "Container"},
-    "TAG_UPNPC_PARAM_SERIALNO": {"tagvalue": 0x15040001, "type": "CString"},
-    "TAG_UPNPC_PARAM_IP_ADR": {"tagvalue": 0x15040002, "type": "CString"},
-    "TAG_UPNPC_PARAM_PORT": {"tagvalue": 0x15040003, "type": "CString"},
-    "TAG_UPNPC_PARAM_NAME": {"tagvalue": 0x15040004, "type": "CString"},
-    "TAG_UPNPC_PARAM_LOCATION": {"tagvalue": 0x15040005, "type": "CString"},
-    "TAG_UPNPC_DEFAULT_LIST": {"tagvalue": 0x15800001, "type": "Container"},
-    "TAG_UPNPC_SET_DEFAULT_LIST": {"tagvalue": 0x15800002, "type": "UInt16"},
-    "TAG_UPNPC_SERVICE_LIST": {"tagvalue": 0x15800003, "type": "Container"},
-    "TAG_UPNPC_DEFAULT_LIST_REV": {"tagvalue": 0x15800006, "type": "UInt16"},
-    "TAG_UPNPC_SERVICE_LIST_REV": {"tagvalue": 0x15800007, "type": "UInt16"},
-    "TAG_KNX_REQ_SET": {"tagvalue": 0x16000001, "type": "Container"},
-    "TAG_KNX_MAC": {"tagvalue": 0x16000002, "type": "CString"},
-    "TAG_KNX_IP": {"tagvalue": 0x16000003, "type": "CString"},
-    "TAG_KNX_SOFTWAREVERSION": {"tagvalue": 0x16000004, "type": "CString"},
-    "TAG_KNX_FIRMWAREVERSION": {"tagvalue": 0x16000005, "type": "CString"},
-    "TAG_KNX_REQ_STORED_ERRORS": {"tagvalue": 0x16000006, "type": "None"},
-    "TAG_KNX_REQ_STORE_FILTER": {"tagvalue": 0x16000007, "type": "Container"},
-    "TAG_KNX_REQ_SHOW_KNX_SCREEN": {"tagvalue": 0x16000008, "type": "Bool"},
-    "TAG_KNX_ERROR_CONTAINER": {"tagvalue": 0x16400001, "type": "Container"},
-    "TAG_KNX_ERROR_TYPE": {"tagvalue": 0x16400002, "type": "UChar8"},
-    "TAG_KNX_ERROR_SOURCE": {"tagvalue": 0x16400003, "type": "CString"},
-    "TAG_KNX_ERROR_MESSAGE": {"tagvalue": 0x16400004, "type": "CString"},
-    "TAG_KNX_ERROR_CODE": {"tagvalue": 0x16400005, "type": "Int32"},
-    "TAG_KNX_ERROR_TIMESTAMP": {"tagvalue": 0x16400006, "type": "Uint64"},
-    "TAG_KNX_STORE_FILTER": {"tagvalue": 0x16400007, "type": "Container"},
-    "TAG_KNX_FILTER_CATEGORY": {"tagvalue": 0x16400008, "type": "CString"},
-    "TAG_KNX_FILTER_ENUM": {"tagvalue": 0x16400009, "type": "Uint32"},
-    "TAG_KNX_RSP_SET": {"tagvalue": 0x16800001, "type": "Bool"},
-    "TAG_KNX_STORED_ERRORS": {"tagvalue": 0x16800002, "type": "Container"},
-    "TAG_EMSHB_REQ_HB_DATA": {"tagvalue": 0x17000001, "type": "None"},
-    "TAG_EMSHB_PARAM_VERSION": {"tagvalue": 0x17040000, "type": "UInt16"},
-    "TAG_EMSHB_PARAM_BAT_S1": {"tagvalue": 0x17040001, "type": "Int32"},
-    "TAG_EMSHB_PARAM_BAT_S2": {"tagvalue": 0x17040002, "type": "Int32"},
-    "TAG_EMSHB_PARAM_BAT_S3": {"tagvalue": 0x17040003, "type": "Int32"},
-    "TAG_EMSHB_PARAM_LM1": {"tagvalue": 0x17040004, "type": "Int32"},
-    "TAG_EMSHB_PARAM_LM2": {"tagvalue": 0x17040005, "type": "Int32"},
-    "TAG_EMSHB_PARAM_LM3": {"tagvalue": 0x17040006, "type": "Int32"},
-    "TAG_EMSHB_PARAM_AC_L1": {"tagvalue": 0x17040007, "type": "Int32"},
-    "TAG_EMSHB_PARAM_AC_L2": {"tagvalue": 0x17040008, "type": "Int32"},
-    "TAG_EMSHB_PARAM_AC_L3": {"tagvalue": 0x17040009, "type": "Int32"},
-    "TAG_EMSHB_PARAM_C_L1": {"tagvalue": 0x17040010, "type": "Int32"},
-    "TAG_EMSHB_PARAM_C_L2": {"tagvalue": 0x17040011, "type": "Int32"},
-    "TAG_EMSHB_PARAM_C_L3": {"tagvalue": 0x17040012, "type": "Int32"},
-    "TAG_EMSHB_PARAM_SOC": {"tagvalue": 0x17040013, "type": "Int32"},
-    "TAG_EMSHB_PARAM_SYS_STATUS": {"tagvalue": 0x17040014, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB": {"tagvalue": 0x17040015, "type": "Container"},
-    "TAG_EMSHB_PARAM_WB_INDEX": {"tagvalue": 0x17040016, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_L1": {"tagvalue": 0x17040017, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_L2": {"tagvalue": 0x17040018, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_L3": {"tagvalue": 0x17040019, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_L1_Active": {"tagvalue": 0x17040020, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_L2_Active": {"tagvalue": 0x17040021, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_L3_Active": {"tagvalue": 0x17040022, "type": "Int32"},
-    "TAG_EMSHB_PARAM_PV_S1": {"tagvalue": 0x17040023, "type": "Int32"},
-    "TAG_EMSHB_PARAM_PV_S2": {"tagvalue": 0x17040024, "type": "Int32"},
-    "TAG_EMSHB_PARAM_PV_S3": {"tagvalue": 0x17040025, "type": "Int32"},
-    "TAG_EMSHB_PARAM_LM": {"tagvalue": 0x17040026, "type": "Container"},
-    "TAG_EMSHB_PARAM_ID": {"tagvalue": 0x17040027, "type": "Int32"},
-    "TAG_EMSHB_PARAM_L1": {"tagvalue": 0x17040028, "type": "Int32"},
-    "TAG_EMSHB_PARAM_L2": {"tagvalue": 0x17040029, "type": "Int32"},
-    "TAG_EMSHB_PARAM_L3": {"tagvalue": 0x17040030, "type": "Int32"},
-    "TAG_EMSHB_PARAM_LM_ALIVE_FLAG": {"tagvalue": 0x17040031, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_ALIVE_FLAG": {"tagvalue": 0x17040032, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_SOLAR_L1": {"tagvalue": 0x17040033, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_SOLAR_L2": {"tagvalue": 0x17040034, "type": "Int32"},
-    "TAG_EMSHB_PARAM_WB_SOLAR_L3": {"tagvalue": 0x17040035, "type": "Int32"},
-    "TAG_EMSHB_HB_DATA": {"tagvalue": 0x17800001, "type": "Container"},
-    "TAG_MYPV_REQ_FIND_DEVICES": {"tagvalue": 0x18000003, "type": "None"},
-    "TAG_MYPV_REQ_REMOVE_DEVICES": {"tagvalue": 0x18000006, "type": "Container"},
-    "TAG_MYPV_REQ_INSTANT_BOOST": {"tagvalue": 0x18000007, "type": "Container"},
-    "TAG_MYPV_DEVICE": {"tagvalue": 0x18000100, "type": "Container"},
-    "TAG_MYPV_DEVICE_SERIAL": {"tagvalue": 0x18000101, "type": "CString"},
-    "TAG_MYPV_DEVICE_ENABLED": {"tagvalue": 0x18000102, "type": "Bool"},
-    "TAG_MYPV_DEVICE_IP": {"tagvalue": 0x18000103, "type": "CString"},
-    "TAG_MYPV_DEVICE_TEMPERATURE_CURRENT": {"tagvalue": 0x18000104, "type": "Float32"},
-    "TAG_MYPV_DEVICE_TEMPERATURE_MAXIMUM": {"tagvalue": 0x18000105, "type": "Float32"},
-    "TAG_MYPV_DEVICE_POWER": {"tagvalue": 0x18000106, "type": "Float32"},
-    "TAG_MYPV_DEVICE_STATUS": {"tagvalue": 0x18000107, "type": "UInt16"},
-    "TAG_MYPV_DEVICE_CONTROL_MODE": {"tagvalue": 0x18000108, "type": "UChar8"},
-    "TAG_MYPV_DEVICE_TYPE": {"tagvalue": 0x18000109, "type": "UChar8"},
-    "TAG_MYPV_DEVICE_TIMESPAN_IBOOST": {"tagvalue": 0x18000110, "type": "Uint32"},
-    "TAG_MYPV_DEVICE_BOOST_LIST": {"tagvalue": 0x18000200, "type": "Container"},
-    "TAG_MYPV_DEVICE_BOOST_ITEM": {"tagvalue": 0x18000300, "type": "Container"},
-    "TAG_MYPV_DEVICE_BOOST_START": {"tagvalue": 0x18000301, "type": "Uint32"},
-    "TAG_MYPV_DEVICE_BOOST_STOP": {"tagvalue": 0x18000302, "type": "Uint32"},
-    "TAG_MYPV_DEVICE_BOOST_TEMPERATURE": {"tagvalue": 0x18000303, "type": "Float32"},
-    "TAG_MYPV_DEVICE_BOOST_ACTIVE": {"tagvalue": 0x18000304, "type": "Bool"},
-    "TAG_MYPV_DEVICE_BOOST_WEEKDAYS": {"tagvalue": 0x18000305, "type": "UInt16"},
-    "TAG_MYPV_DEVICE_BOOST_NAME": {"tagvalue": 0x18000306, "type": "CString"},
-    "TAG_MYPV_REQ_LIST_DEVICES": {"tagvalue": 0x18200004, "type": "None"},
-    "TAG_MYPV_REQ_WRITE_DEVICES": {"tagvalue": 0x18300004, "type": "Container"},
-    "TAG_MYPV_RSP_FIND_DEVICES": {"tagvalue": 0x18800003, "type": "None"},
-    "TAG_MYPV_RSP_REMOVE_DEVICES": {"tagvalue": 0x18800006, "type": "UInt16"},
-    "TAG_MYPV_RSP_INSTANT_BOOST": {"tagvalue": 0x18800007, "type": "UInt16"},
-    "TAG_MYPV_RSP_LIST_DEVICES": {"tagvalue": 0x18A00004, "type": "Container"},
-    "TAG_MYPV_RSP_WRITE_DEVICES": {"tagvalue": 0x18B00004, "type": "UInt16"},
-    "TAG_GPIO_REQ_SET": {"tagvalue": 0x19000001, "type": "Container"},
-    "TAG_GPIO_REQ_GET": {"tagvalue": 0x19000002, "type": "Container"},
-    "TAG_GPIO_REQ_LIST": {"tagvalue": 0x19000003, "type": "None"},
-    "TAG_GPIO_REQ_LIST_ALIAS": {"tagvalue": 0x19000004, "type": "None"},
-    "TAG_GPIO_REQ_LIST_REAL": {"tagvalue": 0x19000005, "type": "None"},
-    "TAG_GPIO_REQ_CONNECT": {"tagvalue": 0x19000006, "type": "Container"},
-    "TAG_GPIO_REQ_CHANGECOUNTER": {"tagvalue": 0x19000007, "type": "None"},
-    "TAG_GPIO_REQ_REMOTE_EXCHANGE": {"tagvalue": 0x19000008, "type": "Container"},
-    "TAG_GPIO_RSP_SET": {"tagvalue": 0x19800001, "type": "Container"},
-    "TAG_GPIO_RSP_GET": {"tagvalue": 0x19800002, "type": "Container"},
-    "TAG_GPIO_RSP_LIST": {"tagvalue": 0x19800003, "type": "Container"},
-    "TAG_GPIO_RSP_LIST_ALIAS": {"tagvalue": 0x19800004, "type": "Container"},
-    "TAG_GPIO_RSP_LIST_REAL": {"tagvalue": 0x19800005, "type": "Container"},
-    "TAG_GPIO_RSP_CONNECT": {"tagvalue": 0x19800006, "type": "Bool"},
-    "TAG_GPIO_RSP_CHANGECOUNTER": {"tagvalue": 0x19800007, "type": "UInt16"},
-    "TAG_GPIO_RSP_REMOTE_EXCHANGE": {"tagvalue": 0x19800008, "type": "Container"},
-    "TAG_GPIO_TUPEL": {"tagvalue": 0x19860001, "type": "Container"},
-    "TAG_GPIO_NUMBER": {"tagvalue": 0x19860002, "type": "Uint32"},
-    "TAG_GPIO_NAME": {"tagvalue": 0x19860003, "type": "CString"},
-    "TAG_GPIO_VALUE": {"tagvalue": 0x19860004, "type": "UChar8"},
-    "TAG_GPIO_KEY": {"tagvalue": 0x19860005, "type": "Uint32"},
-    "TAG_GPIO_AVAILABLE": {"tagvalue": 0x19860006, "type": "Bool"},
-    "TAG_GPIO_MODE": {"tagvalue": 0x19860007, "type": "Uint32"},
-    "TAG_GPIO_SUPPORTED": {"tagvalue": 0x19860008, "type": "Uint32"},
-    "TAG_GPIO_CONNECTEDTO": {"tagvalue": 0x19860009, "type": "CString"},
-    "TAG_GPIO_USERLEVEL": {"tagvalue": 0x1986000A, "type": "UChar8"},
-    "TAG_GPIO_INACTIVE": {"tagvalue": 0x1986000B, "type": "Bool"},
-    "TAG_GPIO_SETTINGS": {"tagvalue": 0x1986000C, "type": "CString"},
-    "TAG_GPIO_REMOTE_LINKED": {"tagvalue": 0x1986000D, "type": "Bool"},
-    "TAG_FARM_REQ_CONNECTED_DEVICES": {"tagvalue": 0x1A000001, "type": "None"},
-    "TAG_FARM_REQ_CONNECTED_DEVICES_REV": {"tagvalue": 0x1A000003, "type": "None"},
-    "TAG_FARM_REQ_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x1A000004, "type": "None"},
-    "TAG_FARM_PARAM_DEVICE": {"tagvalue": 0x1A040000, "type": "Container"},
-    "TAG_FARM_PARAM_SERIALNO": {"tagvalue": 0x1A040001, "type": "CString"},
-    "TAG_FARM_PARAM_CNAME": {"tagvalue": 0x1A040002, "type": "CString"},
-    "TAG_FARM_CONNECTED_DEVICES_REV": {"tagvalue": 0x1A040003, "type": "Int32"},
-    "TAG_FARM_PARAM_SHORT_ID": {"tagvalue": 0x1A400001, "type": "CString"},
-    "TAG_FARM_CONNECTED_DEVICES": {"tagvalue": 0x1A800001, "type": "Container"},
-    "TAG_FARM_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x1A800002, "type": "Container"},
-    "TAG_SE_REQ_SE_COUNT": {"tagvalue": 0x1B000001, "type": "None"},
-    "TAG_SE_REQ_SE_DATA": {"tagvalue": 0x1B000002, "type": "Container"},
-    "TAG_SE_REQ_SET_POWER": {"tagvalue": 0x1B000003, "type": "Container"},
-    "TAG_SE_REQ_SET_DERATING": {"tagvalue": 0x1B000004, "type": "Container"},
-    "TAG_SE_REQ_SET_COUPLE_MODE": {"tagvalue": 0x1B000005, "type": "Container"},
-    "TAG_SE_REQ_COUPLE_MODE": {"tagvalue": 0x1B000006, "type": "Container"},
-    "TAG_SE_REQ_SET_BRI": {"tagvalue": 0x1B000007, "type": "Container"},
-    "TAG_SE_REQ_GET_BRI": {"tagvalue": 0x1B000008, "type": "UInt16"},
-    "TAG_SE_REQ_EP_RESERVE": {"tagvalue": 0x1B000009, "type": "Int32"},
-    "TAG_SE_REQ_GET_PROTECTION_STRATEGY": {"tagvalue": 0x1B00000A, "type": "UChar8"},
-    "TAG_SE_REQ_SET_EP_RESERVE": {"tagvalue": 0x1B000010, "type": "Container"},
-    "TAG_SE_REQ_GET_ESTIMATED_POWER_LIMIT": {
-        "tagvalue": 0x1B000011,
-        "type": "Container",
-    },
-    "TAG_SE_REQ_DESIGN_LIMIT": {"tagvalue": 0x1B000012, "type": "Container"},
-    "TAG_SE_SET_RESTART_SWITCH_TO_EP": {"tagvalue": 0x1B000013, "type": "None"},
-    "TAG_SE_EP_STATUS": {"tagvalue": 0x1B000014, "type": "None"},
-    "TAG_SE_REQ_DIAGNOSIS_ERRORS": {"tagvalue": 0x1B000015, "type": "UInt16"},
-    "TAG_SE_REQ_RESET_POWERSAVE_TIMEOUT": {"tagvalue": 0x1B000027, "type": "None"},
-    "TAG_SE_REQ_EMERGENCY_POWER_OVERLOAD_STATUS": {
-        "tagvalue": 0x1B000028,
-        "type": "Int16",
-    },
-    "TAG_SE_REQ_EMERGENCY_POWER_RETRY": {"tagvalue": 0x1B000029, "type": "Int16"},
-    "TAG_SE_REQ_IS_EMERGENCYPOWER_POSSIBLE": {"tagvalue": 0x1B000030, "type": "Uint32"},
-    "TAG_SE_REQ_SET_PROTECTION_STRATEGY": {"tagvalue": 0x1B000031, "type": "Container"},
-    "TAG_SE_REQ_SET_MIN_ENERGY_RESTART_EP": {
-        "tagvalue": 0x1B000032,
-        "type": "Container",
-    },
-    "TAG_SE_REQ_ENABLE_CHARGE_FREE_PV_POWER": {
-        "tagvalue": 0x1B000033,
-        "type": "Container",
-    },
-    "TAG_SE_REQ_GET_MIN_ENERGY_RESTART_EP": {
-        "tagvalue": 0x1B000034,
-        "type": "Container",
-    },
-    "TAG_SE_REQ_IS_CHARGE_FREE_PV_POWER_ENABLED": {
-        "tagvalue": 0x1B000035,
-        "type": "Container",
-    },
-    "TAG_SE_REQ_GET_BAT_TRAINING_SETTINGS": {"tagvalue": 0x1B000036, "type": "UInt16"},
-    "TAG_SE_REQ_SET_BAT_TRAINING_SETTINGS": {
-        "tagvalue": 0x1B000037,
-        "type": "Container",
-    },
-    "TAG_SE_REQ_GET_SE_INDEX": {"tagvalue": 0x1B000038, "type": "UInt16"},
-    "TAG_SE_PARAM_INDEX": {"tagvalue": 0x1B040000, "type": "Uint32"},
-    "TAG_SE_PARAM_INDEX_UInt16": {"tagvalue": 0x1B040000, "type": "UInt16"},
-    "TAG_SE_PARAM_DCDC_STATUS": {"tagvalue": 0x1B040001, "type": "Uint32"},
-    "TAG_SE_PARAM_BAT_STATUS": {"tagvalue": 0x1B040002, "type": "Uint32"},
-    "TAG_SE_PARAM_CTRL_STATE": {"tagvalue": 0x1B040003, "type": "CString"},
-    "TAG_SE_PARAM_PvPower": {"tagvalue": 0x1B040004, "type": "Container"},
-    "TAG_SE_PARAM_PvEnergy": {"tagvalue": 0x1B040005, "type": "Container"},
-    "TAG_SE_PARAM_BatteryPower": {"tagvalue": 0x1B040006, "type": "Container"},
-    "TAG_SE_PARAM_BatCapacity": {"tagvalue": 0x1B040007, "type": "Container"},
-    "TAG_SE_PARAM_Limits": {"tagvalue": 0x1B040008, "type": "Container"},
-    "TAG_SE_PARAM_DesiredPower": {"tagvalue": 0x1B040009, "type": "Container"},
-    "TAG_SE_PARAM_DesiredDerating": {"tagvalue": 0x1B040010, "type": "Container"},
-    "TAG_SE_PARAM_INT": {"tagvalue": 0x1B040011, "type": "Int32"},
-    "TAG_SE_PARAM_UINT": {"tagvalue": 0x1B040012, "type": "Uint32"},
-    "TAG_SE_PARAM_FLOAT": {"tagvalue": 0x1B040013, "type": "Float32"},
-    "TAG_SE_PARAM_EmergencyMode": {"tagvalue": 0x1B040014, "type": "Int32"},
-    "TAG_SE_PARAM_PVI1_STATUS": {"tagvalue": 0x1B040020, "type": "Uint32"},
-    "TAG_SE_PARAM_PVI2_STATUS": {"tagvalue": 0x1B040021, "type": "Uint32"},
-    "TAG_SE_PARAM_PVI3_STATUS": {"tagvalue": 0x1B040022, "type": "Uint32"},
-    "TAG_SE_PARAM_EP_RESERVE": {"tagvalue": 0x1B040023, "type": "Float32"},
-    "TAG_SE_PARAM_TIME_LAST_FULL": {"tagvalue": 0x1B040024, "type": "Uint64"},
-    "TAG_SE_PARAM_TIME_LAST_EMPTY": {"tagvalue": 0x1B040025, "type": "Uint64"},
-    "TAG_SE_PARAM_LAST_SOC": {"tagvalue": 0x1B040026, "type": "Float32"},
-    "TAG_SE_PARAM_EP_STATUS": {"tagvalue": 0x1B040027, "type": "Uint32"},
-    "TAG_SE_PARAM_TIME_TO_RETRY": {"tagvalue": 0x1B040030, "type": "UInt16"},
-    "TAG_SE_PARAM_NO_REMAINING_RETRY": {"tagvalue": 0x1B040031, "type": "UInt16"},
-    "TAG_SE_PARAM_EP_RESERVE_W": {"tagvalue": 0x1B040033, "type": "Float32"},
-    "TAG_SE_PARAM_EP_RESERVE_MAX_W": {"tagvalue": 0x1B040034, "type": "Float32"},
-    "TAG_SE_PARAM_BOOL": {"tagvalue": 0x1B400001, "type": "Bool"},
-    "TAG_SE_PARAM_BRI_INDEX": {"tagvalue": 0x1B400002, "type": "UChar8"},
-    "TAG_SE_PARAM_BAT_TRAINING_MODE": {"tagvalue": 0x1B400003, "type": "Uint32"},
-    "TAG_SE_PARAM_BAT_TRAINING_CHARGE_FROM_GRID": {
-        "tagvalue": 0x1B400004,
-        "type": "Bool",
-    },
-    "TAG_SE_PARAM_BAT_TRAINING_RECHARGE_EP_RESERVE_FROM_BATTERY": {
-        "tagvalue": 0x1B400005,
-        "type": "Bool",
-    },
-    "TAG_SE_SE_COUNT": {"tagvalue": 0x1B800001, "type": "Uint32"},
-    "TAG_SE_SE_DATA": {"tagvalue": 0x1B800002, "type": "Container"},
-    "TAG_SE_SET_POWER": {"tagvalue": 0x1B800003, "type": "Container"},
-    "TAG_SE_SET_DERATE": {"tagvalue": 0x1B800004, "type": "Container"},
-    "TAG_SE_SET_COUPLE_MODE": {"tagvalue": 0x1B800005, "type": "Container"},
-    "TAG_SE_COUPLE_MODE": {"tagvalue": 0x1B800006, "type": "Container"},
-    "TAG_SE_SET_BRI": {"tagvalue": 0x1B800007, "type": "Container"},
-    "TAG_SE_GET_BRI": {"tagvalue": 0x1B800008, "type": "Container"},
-    "TAG_SE_EP_RESERVE": {"tagvalue": 0x1B800009, "type": "Container"},
-    "TAG_SE_GET_PROTECTION_STRATEGY": {"tagvalue": 0x1B80000A, "type": "Container"},
-    "TAG_SE_GET_ESTIMATED_POWER_LIMIT": {"tagvalue": 0x1B800011, "type": "Container"},
-    "TAG_SE_DESIGN_LIMIT": {"tagvalue": 0x1B800012, "type": "Container"},
-    "TAG_SE_REQ_SET_RESTART_SWITCH_TO_EP": {"tagvalue": 0x1B800013, "type": "None"},
-    "TAG_SE_REQ_EP_STATUS": {"tagvalue": 0x1B800014, "type": "None"},
-    "TAG_SE_DIAGNOSIS_ERRORS": {"tagvalue": 0x1B800015, "type": "Uint32"},
-    "TAG_SE_EMERGENCY_POWER_OVERLOAD_STATUS": {
-        "tagvalue": 0x1B800028,
-        "type": "Container",
-    },
-    "TAG_SE_EMERGENCY_POWER_RETRY": {"tagvalue": 0x1B800029, "type": "Bool"},
-    "TAG_SE_IS_EMERGENCYPOWER_POSSIBLE": {"tagvalue": 0x1B800030, "type": "Bool"},
-    "TAG_SE_SET_PROTECTION_STRATEGY": {"tagvalue": 0x1B800031, "type": "Container"},
-    "TAG_SE_SET_MIN_ENERGY_RESTART_EP": {"tagvalue": 0x1B800032, "type": "Container"},
-    "TAG_SE_ENABLE_CHARGE_FREE_PV_POWER": {"tagvalue": 0x1B800033, "type": "Container"},
-    "TAG_SE_GET_MIN_ENERGY_RESTART_EP": {"tagvalue": 0x1B800034, "type": "Container"},
-    "TAG_SE_IS_CHARGE_FREE_PV_POWER_ENABLED": {
-        "tagvalue": 0x1B800035,
-        "type": "Container",
-    },
-    "TAG_SE_GET_BAT_TRAINING_SETTINGS": {"tagvalue": 0x1B800036, "type": "Container"},
-    "TAG_SE_SET_BAT_TRAINING_SETTINGS": {"tagvalue": 0x1B800037, "type": "Container"},
-    "TAG_SE_GET_SE_INDEX": {"tagvalue": 0x1B800038, "type": "Container"},
-    "TAG_QPI_REQ_INVERTER_COUNT": {"tagvalue": 0x1C000001, "type": "Int32"},
-    "TAG_QPI_REQ_INVERTER_DATA": {"tagvalue": 0x1C000002, "type": "Int32"},
-    "TAG_QPI_REQ_UPDATE_FIRMWARE": {"tagvalue": 0x1C000003, "type": "Container"},
-    "TAG_QPI_REQ_UPDATE_STATUS": {"tagvalue": 0x1C000004, "type": "None"},
-    "TAG_QPI_REQ_INVERTER_SET_VALUES": {"tagvalue": 0x1C000005, "type": "Container"},
-    "TAG_QPI_REQ_RESET_STATE_1_COUNTER": {"tagvalue": 0x1C000006, "type": "Int32"},
-    "TAG_QPI_REQ_STATE_1_COUNTER": {"tagvalue": 0x1C000007, "type": "Int32"},
-    "TAG_QPI_REQ_INVERTER_SET_POWER": {"tagvalue": 0x1C000008, "type": "Container"},
-    "TAG_QPI_REQ_SET_BAT_INFO": {"tagvalue": 0x1C000009, "type": "Container"},
-    "TAG_QPI_REQ_GET_PARAM": {"tagvalue": 0x1C00000A, "type": "Container"},
-    "TAG_QPI_REQ_SET_PARAM": {"tagvalue": 0x1C00000B, "type": "Container"},
-    "TAG_QPI_REQ_ERR_LIST": {"tagvalue": 0x1C00000C, "type": "Container"},
-    "TAG_QPI_REQ_ERR_LIST_4105": {"tagvalue": 0x1C00000D, "type": "Container"},
-    "TAG_QPI_REQ_CLEAR_ERR_HIST": {"tagvalue": 0x1C00000E, "type": "None"},
-    "TAG_QPI_REQ_STATE_0": {"tagvalue": 0x1C00000F, "type": "Int32"},
-    "TAG_QPI_REQ_DEBUG_DATA": {"tagvalue": 0x1C000010, "type": "Container"},
-    "TAG_QPI_REQ_INVERTER_COUNT_DETAIL": {"tagvalue": 0x1C000011, "type": "None"},
-    "TAG_QPI_REQ_SELECTED_INVERTER_DATA": {"tagvalue": 0x1C000012, "type": "Container"},
-    "TAG_QPI_REQ_ERR_HIST": {"tagvalue": 0x1C000013, "type": "Container"},
-    "TAG_QPI_REQ_HW_INFO": {"tagvalue": 0x1C000014, "type": "Container"},
-    "TAG_QPI_REQ_VERSION_RESET": {"tagvalue": 0x1C000015, "type": "None"},
-    "TAG_QPI_REQ_SET_DESIRED_CURRENT_FOR_EP": {
-        "tagvalue": 0x1C000016,
-        "type": "Container",
-    },
-    "TAG_QPI_REQ_GET_DESIRED_CURRENT_FOR_EP": {
-        "tagvalue": 0x1C000017,
-        "type": "Container",
-    },
-    "TAG_QPI_REQ_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C000030, "type": "None"},
-    "TAG_QPI_REQ_SET_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C00003A, "type": "Bool"},
-    "TAG_QPI_REQ_SETTINGS_VDE_2510_ENABLED": {"tagvalue": 0x1C00003B, "type": "None"},
-    "TAG_QPI_REQ_SET_SETTINGS_VDE_2510_ENABLED": {
-        "tagvalue": 0x1C00003C,
-        "type": "Bool",
-    },
-    "TAG_QPI_PARAM_INDEX": {"tagvalue": 0x1C040000, "type": "Int32"},
-    "TAG_QPI_PARAM_U_Bat": {"tagvalue": 0x1C040001, "type": "Float32"},
-    "TAG_QPI_PARAM_I_Bat": {"tagvalue": 0x1C040002, "type": "Float32"},
-    "TAG_QPI_PARAM_U_AC": {"tagvalue": 0x1C040003, "type": "Float32"},
-    "TAG_QPI_PARAM_I_AC": {"tagvalue": 0x1C040004, "type": "Float32"},
-    "TAG_QPI_PARAM_PHI": {"tagvalue": 0x1C040005, "type": "Float32"},
-    "TAG_QPI_PARAM_POWER": {"tagvalue": 0x1C040006, "type": "Float32"},
-    "TAG_QPI_PARAM_APP_POWER": {"tagvalue": 0x1C040007, "type": "Float32"},
-    "TAG_QPI_PARAM_REA_POWER": {"tagvalue": 0x1C040008, "type": "Float32"},
-    "TAG_QPI_PARAM_FILE_NAME": {"tagvalue": 0x1C040009, "type": "CString"},
-    "TAG_QPI_PARAM_PROGRESS": {"tagvalue": 0x1C040010, "type": "Float32"},
-    "TAG_QPI_PARAM_CHILD": {"tagvalue": 0x1C040011, "type": "Int32"},
-    "TAG_QPI_PARAM_POWER_L1": {"tagvalue": 0x1C040012, "type": "Float32"},
-    "TAG_QPI_PARAM_POWER_L2": {"tagvalue": 0x1C040013, "type": "Float32"},
-    "TAG_QPI_PARAM_POWER_L3": {"tagvalue": 0x1C040014, "type": "Float32"},
-    "TAG_QPI_PARAM_TIME": {"tagvalue": 0x1C040015, "type": "Uint64"},
-    "TAG_QPI_PARAM_STATE_1_COUNT": {"tagvalue": 0x1C040016, "type": "Uint64"},
-    "TAG_QPI_PARAM_CMD": {"tagvalue": 0x1C040017, "type": "Uint64"},
-    "TAG_QPI_PARAM_STATE_1_PS": {"tagvalue": 0x1C400018, "type": "Float32"},
-    "TAG_QPI_PARAM_U_MAX": {"tagvalue": 0x1C400019, "type": "Float32"},
-    "TAG_QPI_PARAM_U_MIN": {"tagvalue": 0x1C400020, "type": "Float32"},
-    "TAG_QPI_PARAM_I_MAX": {"tagvalue": 0x1C400021, "type": "Float32"},
-    "TAG_QPI_PARAM_I_MIN": {"tagvalue": 0x1C400022, "type": "Float32"},
-    "TAG_QPI_PARAM_BLOCK": {"tagvalue": 0x1C400023, "type": "UInt16"},
-    "TAG_QPI_PARAM_ITEM": {"tagvalue": 0x1C400024, "type": "UInt16"},
-    "TAG_QPI_PARAM_VALUE": {"tagvalue": 0x1C400025, "type": "Int16"},
-    "TAG_QPI_PARAM_ERR": {"tagvalue": 0x1C400030, "type": "Container"},
-    "TAG_QPI_PARAM_ERR_STR": {"tagvalue": 0x1C400031, "type": "CString"},
-    "TAG_QPI_PARAM_ERR_DATE": {"tagvalue": 0x1C400032, "type": "CString"},
-    "TAG_QPI_PARAM_ERR_CODE": {"tagvalue": 0x1C400033, "type": "CString"},
-    "TAG_QPI_PARAM_ERR_F_MIN": {"tagvalue": 0x1C400034, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_F_MAX": {"tagvalue": 0x1C400035, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_MIN": {"tagvalue": 0x1C400036, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_MAX": {"tagvalue": 0x1C400037, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_L1_PHI": {"tagvalue": 0x1C400038, "type": "Int16"},
-    "TAG_QPI_PARAM_ERR_U_L1_RMS": {"tagvalue": 0x1C400039, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_L2_PHI": {"tagvalue": 0x1C400040, "type": "Int16"},
-    "TAG_QPI_PARAM_ERR_U_L2_RMS": {"tagvalue": 0x1C400041, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_L3_PHI": {"tagvalue": 0x1C400042, "type": "Int16"},
-    "TAG_QPI_PARAM_ERR_U_L3_RMS": {"tagvalue": 0x1C400043, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_INV_PHI": {"tagvalue": 0x1C400044, "type": "Int16"},
-    "TAG_QPI_PARAM_ERR_U_INV_RMS": {"tagvalue": 0x1C400045, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_I_DCL_RMS": {"tagvalue": 0x1C400046, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_DCL": {"tagvalue": 0x1C400047, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_I_LOAD_PHI": {"tagvalue": 0x1C400048, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_I_LOAD_RMS": {"tagvalue": 0x1C400049, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_REGULATOR_OUT": {"tagvalue": 0x1C400050, "type": "Uint32"},
-    "TAG_QPI_PARAM_ERR_STATE_MASHINE_E_STATE": {
-        "tagvalue": 0x1C400051,
-        "type": "UChar8",
-    },
-    "TAG_QPI_PARAM_ERR_STATE_ACT_REG": {"tagvalue": 0x1C400052, "type": "UInt16"},
-    "TAG_QPI_PARAM_ERR_TMP_0": {"tagvalue": 0x1C400053, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_TMP_1": {"tagvalue": 0x1C400054, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_TMP_2": {"tagvalue": 0x1C400055, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_TMP_3": {"tagvalue": 0x1C400056, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_CO_PRO": {"tagvalue": 0x1C400057, "type": "UInt16"},
-    "TAG_QPI_PARAM_ERR_TREATMENT": {"tagvalue": 0x1C400058, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_I_LOAD_T0": {"tagvalue": 0x1C400059, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_U_INV_TO": {"tagvalue": 0x1C400060, "type": "Float32"},
-    "TAG_QPI_PARAM_U_AC_L1": {"tagvalue": 0x1C400061, "type": "Float32"},
-    "TAG_QPI_PARAM_U_AC_L2": {"tagvalue": 0x1C400062, "type": "Float32"},
-    "TAG_QPI_PARAM_U_AC_L3": {"tagvalue": 0x1C400063, "type": "Float32"},
-    "TAG_QPI_PARAM_I_AC_L1": {"tagvalue": 0x1C400064, "type": "Float32"},
-    "TAG_QPI_PARAM_I_AC_L2": {"tagvalue": 0x1C400065, "type": "Float32"},
-    "TAG_QPI_PARAM_I_AC_L3": {"tagvalue": 0x1C400066, "type": "Float32"},
-    "TAG_QPI_PARAM_APP_POWER_L1": {"tagvalue": 0x1C400067, "type": "Float32"},
-    "TAG_QPI_PARAM_APP_POWER_L2": {"tagvalue": 0x1C400068, "type": "Float32"},
-    "TAG_QPI_PARAM_APP_POWER_L3": {"tagvalue": 0x1C400069, "type": "Float32"},
-    "TAG_QPI_PARAM_REA_POWER_L1": {"tagvalue": 0x1C400070, "type": "Float32"},
-    "TAG_QPI_PARAM_REA_POWER_L2": {"tagvalue": 0x1C400071, "type": "Float32"},
-    "TAG_QPI_PARAM_REA_POWER_L3": {"tagvalue": 0x1C400072, "type": "Float32"},
-    "TAG_QPI_PARAM_STATE_0_STATE": {"tagvalue": 0x1C400073, "type": "UChar8"},
-    "TAG_QPI_PARAM_STATE_0_ERR_COUNT_ALL": {"tagvalue": 0x1C400074, "type": "UChar8"},
-    "TAG_QPI_PARAM_STATE_0_ERR_COUNT_ACTIVE": {
-        "tagvalue": 0x1C400075,
-        "type": "UChar8",
-    },
-    "TAG_QPI_PARAM_STATE_0_OP_STATE": {"tagvalue": 0x1C400076, "type": "Uint32"},
-    "TAG_QPI_PARAM_CONF_STATE": {"tagvalue": 0x1C400079, "type": "UChar8"},
-    "TAG_QPI_PARAM_ACTIVATED": {"tagvalue": 0x1C400080, "type": "Bool"},
-    "TAG_QPI_PARAM_INVERTER_GROUP": {"tagvalue": 0x1C400081, "type": "Char8"},
-    "TAG_QPI_PARAM_COUNT_DETAIL": {"tagvalue": 0x1C400082, "type": "Container"},
-    "TAG_QPI_PARAM_DEBUG_SM": {"tagvalue": 0x1C400083, "type": "UChar8"},
-    "TAG_QPI_PARAM_DEBUG_ACTUAL_REG": {"tagvalue": 0x1C400084, "type": "Uint32"},
-    "TAG_QPI_PARAM_DEBUG_U_DCL": {"tagvalue": 0x1C400085, "type": "UInt16"},
-    "TAG_QPI_PARAM_DEBUG_I_DCL_RMS": {"tagvalue": 0x1C400086, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_I_LOAD_RMS": {"tagvalue": 0x1C400087, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_I_LOAD_T0": {"tagvalue": 0x1C400088, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_INV_RMS": {"tagvalue": 0x1C400089, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_INV_T0": {"tagvalue": 0x1C400090, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L1_RMS": {"tagvalue": 0x1C400091, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L2_RMS": {"tagvalue": 0x1C400092, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L3_RMS": {"tagvalue": 0x1C400093, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L1_T0": {"tagvalue": 0x1C400094, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L2_T0": {"tagvalue": 0x1C400095, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L3_T0": {"tagvalue": 0x1C400096, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_TMP_0": {"tagvalue": 0x1C400097, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_TMP_1": {"tagvalue": 0x1C400098, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_TMP_2": {"tagvalue": 0x1C400099, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_TMP_3": {"tagvalue": 0x1C400100, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_F_LINE": {"tagvalue": 0x1C400101, "type": "UInt16"},
-    "TAG_QPI_PARAM_DEBUG_I_DCL_AVG": {"tagvalue": 0x1C400102, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L1_PHI": {"tagvalue": 0x1C400103, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L2_PHI": {"tagvalue": 0x1C400104, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L3_PHI": {"tagvalue": 0x1C400105, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_INV_PHI": {"tagvalue": 0x1C400106, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_I_LOAD_PHI": {"tagvalue": 0x1C400107, "type": "Int16"},
-    "TAG_QPI_PARAM_NUMBER_CHILDS": {"tagvalue": 0x1C400108, "type": "Int16"},
-    "TAG_QPI_PARAM_INVERTER_STORED_SI_GROUP": {"tagvalue": 0x1C400109, "type": "Char8"},
-    "TAG_QPI_PARAM_DEBUG_U_L1_RMS_COPRO": {"tagvalue": 0x1C40010A, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L2_RMS_COPRO": {"tagvalue": 0x1C40010B, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_U_L3_RMS_COPRO": {"tagvalue": 0x1C40010C, "type": "Int16"},
-    "TAG_QPI_PARAM_DEBUG_F_LINE_COPRO": {"tagvalue": 0x1C40010D, "type": "UInt16"},
-    "TAG_QPI_PARAM_SW_VERSION_DATE": {"tagvalue": 0x1C40010E, "type": "CString"},
-    "TAG_QPI_PARAM_SW_VERSION": {"tagvalue": 0x1C40010F, "type": "CString"},
-    "TAG_QPI_PARAM_INVERTER_EP_LINE": {"tagvalue": 0x1C400110, "type": "Char8"},
-    "TAG_QPI_PARAM_COPRO_SW_VERSION_DATE": {"tagvalue": 0x1C400111, "type": "CString"},
-    "TAG_QPI_PARAM_COPRO_SW_VERSION": {"tagvalue": 0x1C400112, "type": "CString"},
-    "TAG_QPI_PARAM_COPRO_SW_SVN": {"tagvalue": 0x1C400113, "type": "CString"},
-    "TAG_QPI_PARAM_HW_VERSION_MAIN": {"tagvalue": 0x1C400114, "type": "CString"},
-    "TAG_QPI_PARAM_HW_VERSION_COPRO": {"tagvalue": 0x1C400115, "type": "CString"},
-    "TAG_QPI_PARAM_HW_VERSION_PCB_CODE": {"tagvalue": 0x1C400116, "type": "CString"},
-    "TAG_QPI_PARAM_BOARD_SERIAL": {"tagvalue": 0x1C400117, "type": "CString"},
-    "TAG_QPI_PARAM_MODULE_SERIAL": {"tagvalue": 0x1C400118, "type": "CString"},
-    "TAG_QPI_PARAM_ERR_F_LINE": {"tagvalue": 0x1C400119, "type": "UInt16"},
-    "TAG_QPI_PARAM_ERR_OPT_STATE": {"tagvalue": 0x1C40011A, "type": "Char8"},
-    "TAG_QPI_PARAM_RT_RESULT": {"tagvalue": 0x1C40011B, "type": "UChar8"},
-    "TAG_QPI_PARAM_DOOR_SW_OPEN": {"tagvalue": 0x1C40011C, "type": "Char8"},
-    "TAG_QPI_PARAM_FAN_REQESTED": {"tagvalue": 0x1C40011D, "type": "Char8"},
-    "TAG_QPI_PARAM_DEBUG_COPRO_STATE": {"tagvalue": 0x1C40011E, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_I_DCL_T0": {"tagvalue": 0x1C40011F, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_COPRO_U_L1_RMS": {"tagvalue": 0x1C400120, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_COPRO_U_L2_RMS": {"tagvalue": 0x1C400121, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_COPRO_U_L3_RMS": {"tagvalue": 0x1C400122, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_COPRO_U_INV_RMS": {"tagvalue": 0x1C400123, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_COPRO_REL_STATE": {"tagvalue": 0x1C400124, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_COPRO_MODE": {"tagvalue": 0x1C400125, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_COPRO_F_LINE": {"tagvalue": 0x1C400126, "type": "Int16"},
-    "TAG_QPI_PARAM_ERR_COPRO_PEN_TV_STATE": {"tagvalue": 0x1C400127, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_COPRO_ERR_DATA": {"tagvalue": 0x1C400128, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_COPRO_TRIPP_LN_OUT": {"tagvalue": 0x1C400129, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_COPRO_TRIPP_LN_IN": {"tagvalue": 0x1C40012A, "type": "UChar8"},
-    "TAG_QPI_PARAM_ERR_COPRO_U_PEN_AVG": {"tagvalue": 0x1C40012B, "type": "Float32"},
-    "TAG_QPI_PARAM_ERR_I_PRIM": {"tagvalue": 0x1C40012C, "type": "Float32"},
-    "TAG_QPI_PARAM_SW_COUNTRY": {"tagvalue": 0x1C40012D, "type": "UChar8"},
-    "TAG_QPI_PARAM_SELECTEC_COUNTRY": {"tagvalue": 0x1C40012E, "type": "UChar8"},
-    "TAG_QPI_PARAM_COPRO_SW_COUNTRY": {"tagvalue": 0x1C40012F, "type": "UChar8"},
-    "TAG_QPI_PARAM_COPRO_SELECTEC_COUNTRY": {"tagvalue": 0x1C400130, "type": "UChar8"},
-    "TAG_QPI_PARAM_MAX_AC_APPARENT_POWER": {"tagvalue": 0x1C400131, "type": "Float32"},
-    "TAG_QPI_PARAM_DEBUG_U_INV_RMS_COPRO": {"tagvalue": 0x1C400132, "type": "UInt16"},
-    "TAG_QPI_PARAM_DEBUG_I_PRIM_RMS": {"tagvalue": 0x1C400133, "type": "Int16"},
-    "TAG_QPI_PARAM_SW_SVN": {"tagvalue": 0x1C400134, "type": "CString"},
-    "TAG_QPI_INVERTER_COUNT": {"tagvalue": 0x1C800001, "type": "Int32"},
-    "TAG_QPI_INVERTER_DATA": {"tagvalue": 0x1C800002, "type": "Container"},
-    "TAG_QPI_UPDATE_FIRMWARE": {"tagvalue": 0x1C800003, "type": "Container"},
-    "TAG_QPI_UPDATE_STATUS": {"tagvalue": 0x1C800004, "type": "Container"},
-    "TAG_QPI_INVERTER_SET_VALUES": {"tagvalue": 0x1C800005, "type": "Container"},
-    "TAG_QPI_RESET_STATE_1_COUNTER": {"tagvalue": 0x1C800006, "type": "Int32"},
-    "TAG_QPI_STATE_1_COUNTER": {"tagvalue": 0x1C800007, "type": "Container"},
-    "TAG_QPI_INVERTER_SET_POWER": {"tagvalue": 0x1C800008, "type": "Container"},
-    "TAG_QPI_SET_BAT_INFO": {"tagvalue": 0x1C800009, "type": "Container"},
-    "TAG_QPI_GET_PARAM": {"tagvalue": 0x1C80000A, "type": "Container"},
-    "TAG_QPI_SET_PARAM": {"tagvalue": 0x1C80000B, "type": "Container"},
-    "TAG_QPI_ERR_LIST": {"tagvalue": 0x1C80000C, "type": "Container"},
-    "TAG_QPI_ERR_LIST_4105": {"tagvalue": 0x1C80000D, "type": "Container"},
-    "TAG_QPI_CLEAR_ERR_HIST": {"tagvalue": 0x1C80000E, "type": "None"},
-    "TAG_QPI_STATE_0": {"tagvalue": 0x1C80000F, "type": "Container"},
-    "TAG_QPI_DEBUG_DATA": {"tagvalue": 0x1C800010, "type": "Container"},
-    "TAG_QPI_INVERTER_COUNT_DETAIL": {"tagvalue": 0x1C800011, "type": "Container"},
-    "TAG_QPI_SELECTED_INVERTER_DATA": {"tagvalue": 0x1C800012, "type": "Container"},
-    "TAG_QPI_ERR_HIST": {"tagvalue": 0x1C800013, "type": "Container"},
-    "TAG_QPI_HW_INFO": {"tagvalue": 0x1C800014, "type": "Container"},
-    "TAG_QPI_VERSION_RESET": {"tagvalue": 0x1C800015, "type": "None"},
-    "TAG_QPI_SET_DESIRED_CURRENT_FOR_EP": {"tagvalue": 0x1C800016, "type": "Container"},
-    "TAG_QPI_GET_DESIRED_CURRENT_FOR_EP": {"tagvalue": 0x1C800017, "type": "Container"},
-    "TAG_QPI_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C800030, "type": "Bool"},
-    "TAG_QPI_SET_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C80003A, "type": "Bool"},
-    "TAG_QPI_SETTINGS_VDE_2510_ENABLED": {"tagvalue": 0x1C80003B, "type": "Bool"},
-    "TAG_QPI_SET_SETTINGS_VDE_2510_ENABLED": {"tagvalue": 0x1C80003C, "type": "Bool"},
-    "TAG_GAPP_REQ_DEV_COUNT": {"tagvalue": 0x1D000001, "type": "None"},
-    "TAG_GAPP_REQ_SERIALNO": {"tagvalue": 0x1D000002, "type": "UChar8"},
-    "TAG_GAPP_REQ_SUPPORTED_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D000003,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_REQ_ENABLED_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D000004,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_REQ_SET_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D000005,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_SET_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
-        "tagvalue": 0x1D000006,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
-        "tagvalue": 0x1D000007,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_SUPPORTED_ACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D000008,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_REQ_ENABLED_ACTIVE_POWER_FUNCTIONS_PU": {
-        "tagvalue": 0x1D000009,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_REQ_SET_ACTIVE_POWER_FUNCTIONS_PU": {
-        "tagvalue": 0x1D00000A,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_SET_ACTIVE_POWER_FUNCTIONS_PU_PARAMETER": {
-        "tagvalue": 0x1D00000B,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_ACTIVE_POWER_FUNCTION_PU_PARAMETER": {
-        "tagvalue": 0x1D00000C,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_REACTIVE_POWER_SETTINGS_EQUAL": {
-        "tagvalue": 0x1D00000D,
-        "type": "None",
-    },
-    "TAG_GAPP_REQ_ACTIVE_POWER_SETTINGS_EQUAL": {
-        "tagvalue": 0x1D00000E,
-        "type": "None",
-    },
-    "TAG_GAPP_REQ_SUPPORTED_GRID_PROTECTION_FUNCTIONS": {
-        "tagvalue": 0x1D00000F,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_REQ_GRID_PROTECTION_FUNCTION_PARAMETER": {
-        "tagvalue": 0x1D000010,
-        "type": "Container",
-    },
-    "TAG_GAPP_REQ_SET_GRID_PROTECTION_FUNCTION_PARAMETER": {
-        "tagvalue": 0x1D000011,
-        "type": "Container",
-    },
-    "TAG_GAPP_PARAM_INDEX": {"tagvalue": 0x1D040000, "type": "UChar8"},
-    "TAG_GAPP_PARAM_SERIALNO": {"tagvalue": 0x1D040001, "type": "CString"},
-    "TAG_GAPP_PARAM_REACTIVE_POWER_FUNCTION": {
-        "tagvalue": 0x1D040002,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_PARAM_ACTIVE_POWER_FUNCTION_PU": {
-        "tagvalue": 0x1D040003,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER": {"tagvalue": 0x1D040004, "type": "Container"},
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_FUNCTION": {
-        "tagvalue": 0x1D040005,
-        "type": "Uint32",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_LIST": {
-        "tagvalue": 0x1D040006,
-        "type": "Container",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_LIST_ENTRY": {
-        "tagvalue": 0x1D040007,
-        "type": "Container",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_SCALE_FACTOR_X": {
-        "tagvalue": 0x1D040008,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_SCALE_FACTOR_Y": {
-        "tagvalue": 0x1D040009,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_MAX": {
-        "tagvalue": 0x1D040010,
-        "type": "Int16",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_MIN": {
-        "tagvalue": 0x1D040011,
-        "type": "Int16",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE": {"tagvalue": 0x1D040012, "type": "Int16"},
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_INIT": {
-        "tagvalue": 0x1D040013,
-        "type": "Int16",
-    },
-    "TAG_GAPP_PARAM_SUPPORTED_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D040014,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_PARAM_SUPPORTED_ACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D040015,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_PARAM_SUCCESS": {"tagvalue": 0x1D040016, "type": "UChar8"},
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_HAS_Y": {"tagvalue": 0x1D040017, "type": "Bool"},
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_COUNT_MIN": {
-        "tagvalue": 0x1D040018,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_COUNT_MAX": {
-        "tagvalue": 0x1D040019,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_PARAM_GAPP_PARAMETER_COUNT_USED": {
-        "tagvalue": 0x1D040020,
-        "type": "UChar8",
-    },
-    "TAG_GAPP_PARAM_SUPPORTED_GRID_PROTECTION_FUNCTIONS": {
-        "tagvalue": 0x1D040021,
-        "type": "UInt16",
-    },
-    "TAG_GAPP_DEV_COUNT": {"tagvalue": 0x1D800001, "type": "UChar8"},
-    "TAG_GAPP_SERIALNO": {"tagvalue": 0x1D800002, "type": "Container"},
-    "TAG_GAPP_SUPPORTED_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D800003,
-        "type": "Container",
-    },
-    "TAG_GAPP_ENABLED_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D800004,
-        "type": "Container",
-    },
-    "TAG_GAPP_SET_REACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D800005,
-        "type": "Container",
-    },
-    "TAG_GAPP_SET_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
-        "tagvalue": 0x1D800006,
-        "type": "Container",
-    },
-    "TAG_GAPP_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
-        "tagvalue": 0x1D800007,
-        "type": "Container",
-    },
-    "TAG_GAPP_SUPPORTED_ACTIVE_POWER_FUNCTIONS": {
-        "tagvalue": 0x1D800008,
-        "type": "Container",
-    },
-    "TAG_GAPP_ENABLED_ACTIVE_POWER_FUNCTIONS_PU": {
-        "tagvalue": 0x1D800009,
-        "type": "Container",
-    },
-    "TAG_GAPP_SET_ACTIVE_POWER_FUNCTIONS_PU": {
-        "tagvalue": 0x1D80000A,
-        "type": "Container",
-    },
-    "TAG_GAPP_SET_ACTIVE_POWER_FUNCTIONS_PU_PARAMETER": {
-        "tagvalue": 0x1D80000B,
-        "type": "Container",
-    },
-    "TAG_GAPP_ACTIVE_POWER_FUNCTION_PU_PARAMETER": {
-        "tagvalue": 0x1D80000C,
-        "type": "Container",
-    },
-    "TAG_GAPP_REACTIVE_POWER_SETTINGS_EQUAL": {"tagvalue": 0x1D80000D, "type": "Bool"},
-    "TAG_GAPP_ACTIVE_POWER_SETTINGS_EQUAL": {"tagvalue": 0x1D80000E, "type": "Bool"},
-    "TAG_GAPP_SUPPORTED_GRID_PROTECTION_FUNCTIONS": {
-        "tagvalue": 0x1D80000F,
-        "type": "Container",
-    },
-    "TAG_GAPP_GRID_PROTECTION_FUNCTION_PARAMETER": {
-        "tagvalue": 0x1D800010,
-        "type": "Container",
-    },
-    "TAG_GAPP_SET_GRID_PROTECTION_FUNCTION_PARAMETER": {
-        "tagvalue": 0x1D800011,
-        "type": "Container",
-    },
-    "TAG_EMSPR_REQ_GET_EQUATIONS": {"tagvalue": 0x1E000001, "type": "None"},
-    "TAG_EMSPR_REQ_SET_EQUATIONS": {"tagvalue": 0x1E000002, "type": "Container"},
-    "TAG_EMSPR_REQ_GET_ACTIVE": {"tagvalue": 0x1E000003, "type": "None"},
-    "TAG_EMSPR_REQ_GET_PINCOUNT": {"tagvalue": 0x1E000004, "type": "None"},
-    "TAG_EMSPR_REQ_SET_PINCOUNT": {"tagvalue": 0x1E000005, "type": "UChar8"},
-    "TAG_EMSPR_REQ_CHANGECOUNTER": {"tagvalue": 0x1E000006, "type": "None"},
-    "TAG_EMSPR_REQ_GET_INVERTERENABLING": {"tagvalue": 0x1E000007, "type": "None"},
-    "TAG_EMSPR_REQ_SET_INVERTERENABLING": {"tagvalue": 0x1E000008, "type": "Bool"},
-    "TAG_EMSPR_REQ_GET_INVERTERENABLEWAIT": {"tagvalue": 0x1E00000B, "type": "None"},
-    "TAG_EMSPR_REQ_SET_INVERTERENABLEWAIT": {"tagvalue": 0x1E00000C, "type": "UInt16"},
-    "TAG_EMSPR_RSP_GET_EQUATIONS": {"tagvalue": 0x1E800001, "type": "Container"},
-    "TAG_EMSPR_RSP_SET_EQUATIONS": {"tagvalue": 0x1E800002, "type": "Uint32"},
-    "TAG_EMSPR_RSP_GET_ACTIVE": {"tagvalue": 0x1E800003, "type": "Container"},
-    "TAG_EMSPR_RSP_GET_PINCOUNT": {"tagvalue": 0x1E800004, "type": "UChar8"},
-    "TAG_EMSPR_RSP_SET_PINCOUNT": {"tagvalue": 0x1E800005, "type": "UChar8"},
-    "TAG_EMSPR_RSP_CHANGECOUNTER": {"tagvalue": 0x1E800006, "type": "UInt16"},
-    "TAG_EMSPR_RSP_GET_INVERTERENABLING": {"tagvalue": 0x1E800007, "type": "Bool"},
-    "TAG_EMSPR_RSP_SET_INVERTERENABLING": {"tagvalue": 0x1E800008, "type": "Bool"},
-    "TAG_EMSPR_RSP_GET_INVERTERENABLEWAIT": {"tagvalue": 0x1E80000B, "type": "UInt16"},
-    "TAG_EMSPR_RSP_SET_INVERTERENABLEWAIT": {"tagvalue": 0x1E80000C, "type": "UInt16"},
-    "TAG_EMSPR_EQUATION": {"tagvalue": 0x1E860001, "type": "Container"},
-    "TAG_EMSPR_INPUT": {"tagvalue": 0x1E860002, "type": "Uint32"},
-    "TAG_EMSPR_MASK": {"tagvalue": 0x1E860003, "type": "Uint32"},
-    "TAG_EMSPR_INVALID": {"tagvalue": 0x1E860004, "type": "Uint32"},
-    "TAG_EMSPR_OUTPUT": {"tagvalue": 0x1E860005, "type": "Double64"},
-    "TAG_EMSPR_ISACTIVE": {"tagvalue": 0x1E860006, "type": "Bool"},
-    "TAG_EMSPR_FAILURESTATE": {"tagvalue": 0x1E860007, "type": "Bool"},
-    "TAG_EMSPR_INVERTERENABLED": {"tagvalue": 0x1E860008, "type": "Bool"},
-    "TAG_IOBOX_REQ_IDENTIFY": {"tagvalue": 0x1F000001, "type": "None"},
-    "TAG_IOBOX_REQ_GETCOUNT": {"tagvalue": 0x1F000002, "type": "None"},
-    "TAG_IOBOX_REQ_SEARCH": {"tagvalue": 0x1F000003, "type": "None"},
-    "TAG_IOBOX_REQ_SERIAL_NUMBER": {"tagvalue": 0x1F000004, "type": "None"},
-    "TAG_IOBOX_REQ_STATE": {"tagvalue": 0x1F000005, "type": "None"},
-    "TAG_IOBOX_REQ_LIST": {"tagvalue": 0x1F000006, "type": "None"},
-    "TAG_IOBOX_REQ_REMOVE": {"tagvalue": 0x1F000007, "type": "CString"},
-    "TAG_IOBOX_REQ_DATA": {"tagvalue": 0x1F040000, "type": "Container"},
-    "TAG_IOBOX_INDEX": {"tagvalue": 0x1F040001, "type": "UInt16"},
-    "TAG_IOBOX_ITEM": {"tagvalue": 0x1F400001, "type": "Container"},
-    "TAG_IOBOX_ITEM_INDEX": {"tagvalue": 0x1F400002, "type": "None"},
-    "TAG_IOBOX_ITEM_NAME": {"tagvalue": 0x1F400003, "type": "None"},
-    "TAG_IOBOX_ITEM_SERIAL_NUMBER": {"tagvalue": 0x1F400004, "type": "CString"},
-    "TAG_IOBOX_ITEM_STATUS": {"tagvalue": 0x1F400005, "type": "UChar8"},
-    "TAG_IOBOX_ITEM_SWVERSION": {"tagvalue": 0x1F400006, "type": "CString"},
-    "TAG_IOBOX_ITEM_ADDITIONAL_INFO": {"tagvalue": 0x1F400007, "type": "CString"},
-    "TAG_IOBOX_RSP_IDENTIFY": {"tagvalue": 0x1F800001, "type": "UChar8"},
-    "TAG_IOBOX_RSP_GETCOUNT": {"tagvalue": 0x1F800002, "type": "UChar8"},
-    "TAG_IOBOX_RSP_SEARCH": {"tagvalue": 0x1F800003, "type": "None"},
-    "TAG_IOBOX_RSP_SERIAL_NUMBER": {"tagvalue": 0x1F800004, "type": "CString"},
-    "TAG_IOBOX_RSP_STATE": {"tagvalue": 0x1F800005, "type": "UChar8"},
-    "TAG_IOBOX_LIST": {"tagvalue": 0x1F800006, "type": "Container"},
-    "TAG_IOBOX_REMOVE": {"tagvalue": 0x1F800007, "type": "None"},
-    "TAG_IOBOX_DATA": {"tagvalue": 0x1F840000, "type": "Container"},
-    "TAG_WBD_REQ_START_SCAN": {"tagvalue": 0x20000001, "type": "None"},
-    "TAG_WBD_REQ_IS_SCANNING": {"tagvalue": 0x20000002, "type": "None"},
-    "TAG_WBD_REQ_CREATE_WB": {"tagvalue": 0x20000003, "type": "CString"},
-    "TAG_WBD_REQ_CANCEL_SCAN": {"tagvalue": 0x20000004, "type": "None"},
-    "TAG_WBD_REQ_DELETE_WALLBOX": {"tagvalue": 0x20000005, "type": "Uint32"},
-    "TAG_WBD_START_SCAN": {"tagvalue": 0x20800001, "type": "Bool"},
-    "TAG_WBD_IS_SCANNING": {"tagvalue": 0x20800002, "type": "Bool"},
-    "TAG_WBD_CREATE_WB": {"tagvalue": 0x20800003, "type": "Uint32"},
-    "TAG_WBD_CANCEL_CAN": {"tagvalue": 0x20800004, "type": "None"},
-    "TAG_WBD_DELETE_WALL_BOX": {"tagvalue": 0x20800005, "type": "Uint32"},
-    "TAG_REFU_REQ_START_SCAN": {"tagvalue": 0x21000001, "type": "None"},
-    "TAG_REFU_REQ_IS_SCANNING": {"tagvalue": 0x21000002, "type": "None"},
-    "TAG_REFU_REQ_CREATE_INV": {"tagvalue": 0x21000003, "type": "CString"},
-    "TAG_REFU_REQ_CANCEL_SCAN": {"tagvalue": 0x21000004, "type": "None"},
-    "TAG_REFU_REQ_DELETE_INVERTER": {"tagvalue": 0x21000005, "type": "Uint32"},
-    "TAG_REFU_REQ_NO_INVERTERS": {"tagvalue": 0x21000006, "type": "None"},
-    "TAG_REFU_REQ_CONNECTED_DEVICES": {"tagvalue": 0x21000008, "type": "None"},
-    "TAG_REFU_PARAM_MAC": {"tagvalue": 0x21400001, "type": "CString"},
-    "TAG_REFU_PARAM_IP": {"tagvalue": 0x21400002, "type": "CString"},
-    "TAG_REFU_PARAM_ALIVE": {"tagvalue": 0x21400003, "type": "Bool"},
-    "TAG_REFU_PARAM_INDEX": {"tagvalue": 0x21400004, "type": "Uint32"},
-    "TAG_REFU_PARAM_DHCP": {"tagvalue": 0x21400005, "type": "Bool"},
-    "TAG_REFU_START_SCAN": {"tagvalue": 0x21800001, "type": "Bool"},
-    "TAG_REFU_IS_SCANNING": {"tagvalue": 0x21800002, "type": "Bool"},
-    "TAG_REFU_CREATE_INV": {"tagvalue": 0x21800003, "type": "Uint32"},
-    "TAG_REFU_CANCEL_CAN": {"tagvalue": 0x21800004, "type": "None"},
-    "TAG_REFU_DELETE_INVERTER": {"tagvalue": 0x21800005, "type": "Uint32"},
-    "TAG_REFU_NO_INVERTERS": {"tagvalue": 0x21800006, "type": "Uint32"},
-    "TAG_REFU_CONNECTED_DEVICES": {"tagvalue": 0x21800008, "type": "Container"},
-    "TAG_OVP_REQ_STATUS": {"tagvalue": 0x22000001, "type": "Container"},
-    "TAG_OVP_REQ_RESET": {"tagvalue": 0x22000002, "type": "Container"},
-    "TAG_OVP_PARAM_INDEX": {"tagvalue": 0x22400001, "type": "UChar8"},
-    "TAG_OVP_PARAM_STATUS": {"tagvalue": 0x22800001, "type": "UChar8"},
-    "TAG_OVP_PARAM_RESET": {"tagvalue": 0x22800002, "type": "Bool"},
-    "TAG_OVP_STATUS": {"tagvalue": 0x22800003, "type": "Container"},
-    "TAG_OVP_RESET": {"tagvalue": 0x22800004, "type": "Container"},
-    "TAG_NETWORK_REQ_PING": {"tagvalue": 0x23000001, "type": "CString"},
-    "TAG_NETWORK_REQ_INFO": {"tagvalue": 0x23000002, "type": "Container"},
-    "TAG_NETWORK_REQ_DIAGNOSE": {"tagvalue": 0x23000003, "type": "Container"},
-    "TAG_NETWORK_REQ_SET_IP": {"tagvalue": 0x23000004, "type": "CString"},
-    "TAG_NETWORK_REQ_SET_SUBNETMASK": {"tagvalue": 0x23000005, "type": "CString"},
-    "TAG_NETWORK_REQ_SET_GATEWAY": {"tagvalue": 0x23000006, "type": "CString"},
-    "TAG_NETWORK_REQ_SET_DNS_SERVER": {"tagvalue": 0x23000007, "type": "CString"},
-    "TAG_NETWORK_REQ_SET_DHCP": {"tagvalue": 0x23000008, "type": "Bool"},
-    "TAG_NETWORK_REQ_MAKE_INFO_FILE": {"tagvalue": 0x23000009, "type": "CString"},
-    "TAG_NETWORK_REQ_CHECK_INTERNET_SPEED": {"tagvalue": 0x2300000A, "type": "None"},
-    "TAG_NETWORK_PARAM_IP": {"tagvalue": 0x23400001, "type": "CString"},
-    "TAG_NETWORK_PARAM_SUBNETMASK": {"tagvalue": 0x23400002, "type": "CString"},
-    "TAG_NETWORK_PARAM_GATEWAY": {"tagvalue": 0x23400003, "type": "CString"},
-    "TAG_NETWORK_PARAM_DNS_SERVER": {"tagvalue": 0x23400004, "type": "CString"},
-    "TAG_NETWORK_PARAM_DHCP": {"tagvalue": 0x23400005, "type": "Bool"},
-    "TAG_NETWORK_PARAM_MAC_ADDRESS": {"tagvalue": 0x23400006, "type": "CString"},
-    "TAG_NETWORK_PARAM_E3DC_SERVER_REACHABLE": {"tagvalue": 0x23400007, "type": "Bool"},
-    "TAG_NETWORK_PARAM_DNS_SERVER_REACHABLE": {"tagvalue": 0x23400008, "type": "Bool"},
-    "TAG_NETWORK_PARAM_DNS_LOOKUP_WORKING": {"tagvalue": 0x23400009, "type": "Bool"},
-    "TAG_NETWORK_PARAM_GATEWAY_REACHABLE": {"tagvalue": 0x2340000A, "type": "Bool"},
-    "TAG_NETWORK_PARAM_SYSTEM_IP_VALID": {"tagvalue": 0x2340000B, "type": "Bool"},
-    "TAG_NETWORK_PARAM_CABLE_CONNECTED": {"tagvalue": 0x2340000C, "type": "Bool"},
-    "TAG_NETWORK_PARAM_INTERNET_SPEED": {"tagvalue": 0x2340000D, "type": "Float32"},
-    "TAG_NETWORK_PING": {"tagvalue": 0x23800001, "type": "CString"},
-    "TAG_NETWORK_INFO": {"tagvalue": 0x23800002, "type": "Container"},
-    "TAG_NETWORK_DIAGNOSE": {"tagvalue": 0x23800003, "type": "Container"},
-    "TAG_NETWORK_SET_IP": {"tagvalue": 0x23800004, "type": "Bool"},
-    "TAG_NETWORK_SET_SUBNETMASK": {"tagvalue": 0x23800005, "type": "Bool"},
-    "TAG_NETWORK_SET_GATEWAY": {"tagvalue": 0x23800006, "type": "Bool"},
-    "TAG_NETWORK_SET_DNS_SERVER": {"tagvalue": 0x23800007, "type": "Bool"},
-    "TAG_NETWORK_SET_DHCP": {"tagvalue": 0x23800008, "type": "Bool"},
-    "TAG_NETWORK_MAKE_INFO_FILE": {"tagvalue": 0x23800009, "type": "Int32"},
-    "TAG_NETWORK_CHECK_INTERNET_SPEED": {"tagvalue": 0x2380000A, "type": "Bool"},
-    "TAG_WBAUTH_REQ_VERIFY_SESSION": {"tagvalue": 0x24000000, "type": "Container"},
-    "TAG_WBAUTH_WALLBOX_ID": {"tagvalue": 0x24400001, "type": "CString"},
-    "TAG_WBAUTH_SESSION_ID": {"tagvalue": 0x24400002, "type": "CString"},
-    "TAG_WBAUTH_VERIFICATION_ENTRY": {"tagvalue": 0x24400003, "type": "Container"},
-    "TAG_WBAUTH_ENTRY_TYPE": {"tagvalue": 0x24400004, "type": "UChar8"},
-    "TAG_WBAUTH_ENTRY_DATA": {"tagvalue": 0x24400005, "type": "CString"},
-    "TAG_WBAUTH_VERIFICATION_RESULT": {"tagvalue": 0x24400006, "type": "Char8"},
-    "TAG_WBAUTH_ENTRY_SWAPPED": {"tagvalue": 0x24400007, "type": "Bool"},
-    "TAG_WBAUTH_VERIFY_SESSION": {"tagvalue": 0x24800000, "type": "Container"},
-    "TAG_PLAY_REQ_IS_REMOTE_SETPOINT_ACTIVE": {"tagvalue": 0x25000000, "type": "None"},
-    "TAG_PLAY_REQ_DATA": {"tagvalue": 0x25000001, "type": "Container"},
-    "TAG_PLAY_REQ_SET_POWER_SETPOINT": {"tagvalue": 0x25000002, "type": "Uint32"},
-    "TAG_PLAY_REQ_GET_POWER_SETPOINT": {"tagvalue": 0x25000003, "type": "None"},
-    "TAG_PLAY_SEND_TIME": {"tagvalue": 0x25400001, "type": "Uint64"},
-    "TAG_PLAY_IS_REMOTE_SETPOINT_ACTIVE": {"tagvalue": 0x25800000, "type": "Bool"},
-    "TAG_PLAY_DATA": {"tagvalue": 0x25800001, "type": "Container"},
-    "TAG_PLAY_SET_POWER_SETPOINT": {"tagvalue": 0x25800002, "type": "Bool"},
-    "TAG_PLAY_GET_POWER_SETPOINT": {"tagvalue": 0x25800003, "type": "Uint32"},
-    "TAG_GDI_KEY_2": {"tagvalue": 0x26000000, "type": "Container"},
-    "TAG_GDI_REQ_PUSH_DESC": {"tagvalue": 0x26000001, "type": "None"},
-    "TAG_GDI_PARAM_CONTENT_DESC": {"tagvalue": 0x26400001, "type": "None"},
-    "TAG_GDI_PUSH_DATA": {"tagvalue": 0x26400002, "type": "ByteArray"},
-    "TAG_GDI_PUSH_DATA_OKAY": {"tagvalue": 0x26400003, "type": "Uint32"},
-    "TAG_GDI_PARAM_CONTENT": {"tagvalue": 0x26400004, "type": "Container"},
-    "TAG_GDI_METADATA": {"tagvalue": 0x26400005, "type": "Container"},
-    "TAG_GDI_DATADESCRIPTIONS": {"tagvalue": 0x26400006, "type": "Container"},
-    "TAG_GDI_DATALOGGING": {"tagvalue": 0x26400007, "type": "Container"},
-    "TAG_GDI_LOGGINGTYPE": {"tagvalue": 0x26400008, "type": "Container"},
-    "TAG_GDI_HASHSUM": {"tagvalue": 0x26400009, "type": "ByteArray"},
-    "TAG_GDI_DATATYPE": {"tagvalue": 0x2640000A, "type": "Container"},
-    "TAG_GDI_INDEX": {"tagvalue": 0x2640000B, "type": "Uint32"},
-    "TAG_GDI_NAME": {"tagvalue": 0x2640000C, "type": "CString"},
-    "TAG_GDI_DATATYPE_BOOL": {"tagvalue": 0x26500001, "type": "Container"},
-    "TAG_GDI_DATATYPE_INT8": {"tagvalue": 0x26500002, "type": "Container"},
-    "TAG_GDI_DATATYPE_UINT8": {"tagvalue": 0x26500003, "type": "Container"},
-    "TAG_GDI_DATATYPE_INT16": {"tagvalue": 0x26500004, "type": "Container"},
-    "TAG_GDI_DATATYPE_UINT16": {"tagvalue": 0x26500005, "type": "Container"},
-    "TAG_GDI_DATATYPE_UINT32": {"tagvalue": 0x26500006, "type": "Container"},
-    "TAG_GDI_DATATYPE_INT32": {"tagvalue": 0x26500007, "type": "Container"},
-    "TAG_GDI_DATATYPE_INT64": {"tagvalue": 0x26500008, "type": "Container"},
-    "TAG_GDI_DATATYPE_UINT64": {"tagvalue": 0x26500009, "type": "Container"},
-    "TAG_GDI_DATATYPE_FLOAT32": {"tagvalue": 0x2650000A, "type": "Container"},
-    "TAG_GDI_DATATYPE_DOUBLE64": {"tagvalue": 0x2650000B, "type": "Container"},
-    "TAG_GDI_DATATYPE_BITFIELD": {"tagvalue": 0x2650000C, "type": "Container"},
-    "TAG_GDI_DATATYPE_CSTRING": {"tagvalue": 0x2650000D, "type": "Container"},
-    "TAG_GDI_CONTAINER": {"tagvalue": 0x2650000E, "type": "Container"},
-    "TAG_GDI_DATATYPE_TIMESTAMP": {"tagvalue": 0x2650000F, "type": "Container"},
-    "TAG_GDI_DATATYPE_BYTEARRAY": {"tagvalue": 0x26500010, "type": "Container"},
-    "TAG_GDI_DATATYPE_COMPRESSED_BYTEARRAY": {
-        "tagvalue": 0x26500011,
-        "type": "Container",
-    },
-    "TAG_GDI_DATA_INDEXKEY": {"tagvalue": 0x26500100, "type": "Container"},
-    "TAG_GDI_INDEXKEY": {"tagvalue": 0x26500101, "type": "Container"},
-    "TAG_GDI_LOKAL_STORING": {"tagvalue": 0x26500104, "type": "Uint32"},
-    "TAG_GDI_LOKAL_STORING_AVG": {"tagvalue": 0x26500105, "type": "Uint32"},
-    "TAG_GDI_LOKAL_STORING_MOD": {"tagvalue": 0x26500106, "type": "Uint32"},
-    "TAG_GDI_LOKAL_STORING_AVG_MOD": {"tagvalue": 0x26500107, "type": "Uint32"},
-    "TAG_GDI_PUSH_STORING": {"tagvalue": 0x26500108, "type": "Uint32"},
-    "TAG_GDI_PUSH_STORING_AVG": {"tagvalue": 0x26500109, "type": "Uint32"},
-    "TAG_GDI_PUSH_STORING_MOD": {"tagvalue": 0x2650010A, "type": "Uint32"},
-    "TAG_GDI_PUSH_STORING_AVG_MOD": {"tagvalue": 0x2650010B, "type": "Uint32"},
-    "TAG_GDI_DATA_TIMEKEY": {"tagvalue": 0x2650010C, "type": "Container"},
-    "TAG_GDI_DATA_MANIFEST": {"tagvalue": 0x2650010D, "type": "CString"},
-    "TAG_GDI_PAKET_NUMBER": {"tagvalue": 0x2650010E, "type": "Uint32"},
-    "TAG_GDI_PUSH_INTERMISSION_IN_SEC": {"tagvalue": 0x2650010F, "type": "Uint32"},
-    "TAG_GDI_DESC_VERSION": {"tagvalue": 0x26500110, "type": "Uint64"},
-    "TAG_GDI_LOGDESCRIPTIONS": {"tagvalue": 0x26500111, "type": "Container"},
-    "TAG_GDI_DIAGNOSEDESCRIPTIONS": {"tagvalue": 0x26500112, "type": "Container"},
-    "TAG_GDI_KEYS": {"tagvalue": 0x26500113, "type": "Container"},
-    "TAG_GDI_KEY_PRIMARY": {"tagvalue": 0x26500114, "type": "Container"},
-    "TAG_GDI_OFFSET": {"tagvalue": 0x26500115, "type": "Uint32"},
-    "TAG_GDI_LENGTH": {"tagvalue": 0x26500116, "type": "None"},
-    "TAG_GDI_SNAPSHOT": {"tagvalue": 0x26500117, "type": "Container"},
-    "TAG_GDI_RESOLUTION": {"tagvalue": 0x26500118, "type": "Uint64"},
-    "TAG_GDI_SIZE": {"tagvalue": 0x26500119, "type": "Container"},
-    "TAG_GDI_TRIGGER_ON_INTERVAL": {"tagvalue": 0x2650011A, "type": "Container"},
-    "TAG_GDI_TRIGGER_ON_CHANGE": {"tagvalue": 0x2650011B, "type": "Container"},
-    "TAG_GDI_DELAY": {"tagvalue": 0x2650011C, "type": "Uint64"},
-    "TAG_GDI_ENTITY_MAX": {"tagvalue": 0x2650011D, "type": "Uint32"},
-    "TAG_GDI_USE_PUSH_SERVICE": {"tagvalue": 0x2650011E, "type": "None"},
-    "TAG_GDI_DB_MAX": {"tagvalue": 0x2650011F, "type": "Int32"},
-    "TAG_GDI_USE_P_DB": {"tagvalue": 0x26500120, "type": "None"},
-    "TAG_GDI_FIX_INTERVAL": {"tagvalue": 0x26500121, "type": "Container"},
-    "TAG_GDI_TRIGGER_ON_TIME": {"tagvalue": 0x26500122, "type": "Container"},
-    "TAG_GDI_DATA_LENGTH": {"tagvalue": 0x26500123, "type": "Uint32"},
-    "TAG_GDI_TRIGGER_ON_NULL": {"tagvalue": 0x26500124, "type": "None"},
-    "TAG_GDI_USE_NP_DB": {"tagvalue": 0x26500125, "type": "None"},
-    "TAG_GDI_NO_TRIGGER_ON_NULL": {"tagvalue": 0x26500126, "type": "None"},
-    "TAG_GDI_MODIFICATIONS": {"tagvalue": 0x26500127, "type": "Container"},
-    "TAG_GDI_MODIFICATION_MIN": {"tagvalue": 0x26500128, "type": "None"},
-    "TAG_GDI_MODIFICATION_MAX": {"tagvalue": 0x26500129, "type": "None"},
-    "TAG_GDI_MODIFICATION_AVG": {"tagvalue": 0x2650012A, "type": "None"},
-    "TAG_GDI_MODIFICATION_AND": {"tagvalue": 0x2650012B, "type": "None"},
-    "TAG_GDI_MODIFICATION_OR": {"tagvalue": 0x2650012C, "type": "None"},
-    "TAG_GDI_MODIFICATION_INTEGRATE": {"tagvalue": 0x2650012D, "type": "None"},
-    "TAG_GDI_MODIFICATION_AUTOINC": {"tagvalue": 0x2650012E, "type": "None"},
-    "TAG_GDI_DESCRIPTION": {"tagvalue": 0x2650012F, "type": "Container"},
-    "TAG_GDI_DESCRIPTION_WITH_SIZE": {"tagvalue": 0x26500130, "type": "Container"},
-    "TAG_GDI_DATA_MODIFICATION": {"tagvalue": 0x26500132, "type": "Container"},
-    "TAG_GDI_PUSH_CONFIG": {"tagvalue": 0x26500133, "type": "Container"},
-    "TAG_GDI_PUSH_DELAY": {"tagvalue": 0x26500134, "type": "Uint32"},
-    "TAG_GDI_PUSH_CHANNEL": {"tagvalue": 0x26500135, "type": "Uint32"},
-    "TAG_GDI_PUSH_DESC": {"tagvalue": 0x26800001, "type": "Container"},
-    "TAG_SCM_REQ_SET_CONFIG": {"tagvalue": 0x27000001, "type": "CString"},
-    "TAG_SCM_CONFIG_PROCESSED": {"tagvalue": 0x27000002, "type": "Container"},
-    "TAG_SCM_CONFIG_PROCESSED_STATE": {"tagvalue": 0x27000003, "type": "UInt16"},
-    "TAG_SCM_REQ_CONFIG_PROCESSED_STATE": {"tagvalue": 0x27000004, "type": "Container"},
-    "TAG_SCM_REQ_ACCEPTED_CONFIG_FILE_VERSION": {
-        "tagvalue": 0x27000005,
-        "type": "None",
-    },
-    "TAG_SCM_REQ_SET_FACTORY_RESET": {"tagvalue": 0x27000006, "type": "None"},
-    "TAG_SCM_LC_REQ_GET_TYPE_MEASURE": {"tagvalue": 0x27000007, "type": "Container"},
-    "TAG_SCM_LC_REQ_GET_POWER_MGT_CONFIG": {
-        "tagvalue": 0x27000008,
-        "type": "Container",
-    },
-    "TAG_SCM_LC_REQ_SET_TYPE_MEASURE": {"tagvalue": 0x27000009, "type": "Container"},
-    "TAG_SCM_LC_REQ_SET_POWER_MGT_CONFIG": {
-        "tagvalue": 0x2700000A,
-        "type": "Container",
-    },
-    "TAG_SCM_CONFIG_ID": {"tagvalue": 0x27400001, "type": "UInt16"},
-    "TAG_SCM_CONFIG_FILE_VALID": {"tagvalue": 0x27400002, "type": "Bool"},
-    "TAG_SCM_LC_PARAM_POWER_MGT_TYPE": {"tagvalue": 0x27400003, "type": "UInt16"},
-    "TAG_SCM_LC_PARAM_TOKEN": {"tagvalue": 0x27400004, "type": "CString"},
-    "TAG_SCM_LC_PARAM_MAIN_FUSE": {"tagvalue": 0x27400005, "type": "Uint32"},
-    "TAG_SCM_LC_PARAM_MAX_CURRENT": {"tagvalue": 0x27400006, "type": "Uint32"},
-    "TAG_SCM_LC_PARAM_PHASE_COUNT": {"tagvalue": 0x27400007, "type": "UInt16"},
-    "TAG_SCM_LC_PARAM_MEASURE_TYPE": {"tagvalue": 0x27400008, "type": "UInt16"},
-    "TAG_SCM_LC_PARAM_CT_RATIO": {"tagvalue": 0x27400009, "type": "CString"},
-    "TAG_SCM_LC_PARAM_METER_ADDRESS": {"tagvalue": 0x2740000A, "type": "UInt16"},
-    "TAG_SCM_LC_PARAM_STATUS": {"tagvalue": 0x2740000B, "type": "Uint64"},
-    "TAG_SCM_LC_PARAM_MAIN_FUSE_DERATED": {"tagvalue": 0x2740000C, "type": "Uint32"},
-    "TAG_SCM_PARAM_EXT_LOAD_SHEDDING_ACTIVE": {
-        "tagvalue": 0x2740000D,
-        "type": "UChar8",
-    },
-    "TAG_SCM_PARAM_LOAD_SHEDDING_INPUT_ADDRESS": {
-        "tagvalue": 0x2740000E,
-        "type": "UInt16",
-    },
-    "TAG_SCM_SET_CONFIG": {"tagvalue": 0x27800001, "type": "Container"},
-    "TAG_SCM_ACCEPTED_CONFIG_FILE_VERSION": {"tagvalue": 0x27800002, "type": "CString"},
-    "TAG_SCM_SET_FACTORY_RESET": {"tagvalue": 0x27800006, "type": "Bool"},
-    "TAG_SCM_LC_GET_TYPE_MEASURE": {"tagvalue": 0x27800007, "type": "Container"},
-    "TAG_SCM_LC_GET_POWER_MGT_CONFIG": {"tagvalue": 0x27800008, "type": "Container"},
-    "TAG_SCM_LC_SET_TYPE_MEASURE": {"tagvalue": 0x27800009, "type": "Container"},
-    "TAG_SCM_LC_SET_POWER_MGT_CONFIG": {"tagvalue": 0x2780000A, "type": "Container"},
-    "TAG_EEBUS_REQ_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x28000001, "type": "None"},
-    "TAG_EEBUS_REQ_ASSOCIATE_DEVICE": {"tagvalue": 0x28000002, "type": "Container"},
-    "TAG_EEBUS_REQ_LIST_CONNECTED_DEVICES": {"tagvalue": 0x28000003, "type": "None"},
-    "TAG_EEBUS_REQ_SET_SEARCH_ACTIVE": {"tagvalue": 0x28000004, "type": "Bool"},
-    "TAG_EEBUS_REQ_ASSOCIATE_DEVICE_TYPE_EVCS": {
-        "tagvalue": 0x28000005,
-        "type": "Container",
-    },
-    "TAG_EEBUS_REQ_LIST_NON_PAIRED_DEVICE_TYPE_EVCS": {
-        "tagvalue": 0x28000006,
-        "type": "Container",
-    },
-    "TAG_EEBUS_REQ_APPLY_WB_PRECONFIG": {"tagvalue": 0x28000007, "type": "None"},
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_COMMUNICATION_STANDARD": {
-        "tagvalue": 0x28000008,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_REQ_GET_EVSE_LIST_USECASE": {
-        "tagvalue": 0x28010000,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_EV_LIST_USECASE": {
-        "tagvalue": 0x28010001,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_REQ_GET_EVSE_MANUFACTURER_INFO": {
-        "tagvalue": 0x28010002,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_EV_MANUFACTURER_INFO": {
-        "tagvalue": 0x28010003,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_POWER_LIMITS": {
-        "tagvalue": 0x28010004,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_IDENTIFICATION": {
-        "tagvalue": 0x28010005,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_SLEEP_MODE": {
-        "tagvalue": 0x28010006,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_ASYMMETRIC_CHARGING_SUPPORTED": {
-        "tagvalue": 0x28010007,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CURRENT_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28010010,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_POWER_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28010011,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_ENERGY_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28010012,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28010013,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_CURRENT_MEASUREMENT": {
-        "tagvalue": 0x28010014,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_POWER_MEASUREMENT": {
-        "tagvalue": 0x28010015,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_ENERGY_MEASUREMENT": {
-        "tagvalue": 0x28010017,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_MEASUREMENT": {
-        "tagvalue": 0x28010018,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_CURRENT_CONSTRAINTS": {
-        "tagvalue": 0x28010020,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_OVERLOAD_CHARGING_CURRENT_LIMIT": {
-        "tagvalue": 0x28010021,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_DATA": {
-        "tagvalue": 0x2801FFFE,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_REQ_GET_DATA": {
-        "tagvalue": 0x2801FFFF,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_DEVICE": {"tagvalue": 0x28400001, "type": "Container"},
-    "TAG_EEBUS_PARAM_SHIP_ID": {"tagvalue": 0x28400002, "type": "CString"},
-    "TAG_EEBUS_PARAM_SKI": {"tagvalue": 0x28400003, "type": "CString"},
-    "TAG_EEBUS_PARAM_DEVICE_ID": {"tagvalue": 0x28400004, "type": "Int32"},
-    "TAG_EEBUS_PARAM_EEBUS_ID": {"tagvalue": 0x28400005, "type": "CString"},
-    "TAG_EEBUS_PARAM_GENERIC_AC_PHASE": {"tagvalue": 0x28400006, "type": "UChar8"},
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO": {
-        "tagvalue": 0x28400007,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28400008,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_USECASE_NAME": {"tagvalue": 0x28400009, "type": "CString"},
-    "TAG_EEBUS_PARAM_GENERIC_USECASE_ENABLED": {"tagvalue": 0x2840000A, "type": "Bool"},
-    "TAG_EEBUS_PARAM_GENERIC_USECASE": {"tagvalue": 0x2840000B, "type": "Container"},
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_DEVICE_NAME": {
-        "tagvalue": 0x2840000C,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_DEVICE_CODE": {
-        "tagvalue": 0x2840000D,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_SERIAL_NUMBER": {
-        "tagvalue": 0x2840000E,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_HARDWARE_REVISION": {
-        "tagvalue": 0x2840000F,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_SOFTWARE_REVISION": {
-        "tagvalue": 0x28400010,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_VENDOR_NAME": {
-        "tagvalue": 0x28400011,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_VENDOR_CODE": {
-        "tagvalue": 0x28400012,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_BRAND_NAME": {
-        "tagvalue": 0x28400013,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_MANUFACTURER_LABEL": {
-        "tagvalue": 0x28400014,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_MANUFACTURER_DESCRIPTION": {
-        "tagvalue": 0x28400015,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_MANUFACTURER_NODE_IDENTIFICATION": {
-        "tagvalue": 0x28400016,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS_MIN": {
-        "tagvalue": 0x28400017,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS_MAX": {
-        "tagvalue": 0x28400018,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS_STEP_SIZE": {
-        "tagvalue": 0x28400019,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_SIGNIFICANT_NUMBER": {
-        "tagvalue": 0x2840001A,
-        "type": "Int64",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_SCALE_NUMBER": {"tagvalue": 0x2840001B, "type": "Int16"},
-    "TAG_EEBUS_PARAM_GENERIC_LOAD_LIMIT_ACTIVATED": {
-        "tagvalue": 0x2840001C,
-        "type": "Bool",
-    },
-    "TAG_EEBUS_PARAM_GENERIC_LOAD_LIMIT_VALUE": {
-        "tagvalue": 0x2840001D,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_EV_ID": {"tagvalue": 0x28410000, "type": "UChar8"},
-    "TAG_EEBUS_PARAM_EMOBILITY_EV_IDENTIFICATION_VALUE": {
-        "tagvalue": 0x28410001,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_EV_IDENTIFICATION_TYPE": {
-        "tagvalue": 0x28410002,
-        "type": "UChar8",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_POWER_LIMITS_MIN": {
-        "tagvalue": 0x28410003,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_POWER_LIMITS_MAX": {
-        "tagvalue": 0x28410004,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_POWER_LIMITS_STANDBY_POWER": {
-        "tagvalue": 0x28410005,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_MEASUREMENT_CONSTRAINT_PER_PHASE": {
-        "tagvalue": 0x28410006,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_MEASUREMENT": {
-        "tagvalue": 0x28410007,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_MEASUREMENT_PER_PHASE": {
-        "tagvalue": 0x28410008,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_MIN": {
-        "tagvalue": 0x28410009,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_MAX": {
-        "tagvalue": 0x2841000A,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_DISCRETE_VALUE": {
-        "tagvalue": 0x2841000B,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_PER_PHASE": {
-        "tagvalue": 0x2841000C,
-        "type": "Container",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_SLEEP_MODE": {"tagvalue": 0x2841000D, "type": "Bool"},
-    "TAG_EEBUS_PARAM_EMOBILITY_ASYMMETRIC_CHARGING_SUPPORTED": {
-        "tagvalue": 0x2841000E,
-        "type": "Bool",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_COMMUNICATION_STANDARD": {
-        "tagvalue": 0x2841000F,
-        "type": "CString",
-    },
-    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_LIMIT_PER_PHASE": {
-        "tagvalue": 0x28410010,
-        "type": "Container",
-    },
-    "TAG_EEBUS_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x28800001, "type": "Container"},
-    "TAG_EEBUS_LIST_CONNECTED_DEVICES": {"tagvalue": 0x28800002, "type": "Container"},
-    "TAG_EEBUS_LIST_ASSOCIATED_DEVICE": {"tagvalue": 0x28800003, "type": "None"},
-    "TAG_EEBUS_LIST_NON_PAIRED_DEVICE_TYPE_EVCS": {
-        "tagvalue": 0x28800004,
-        "type": "Container",
-    },
-    "TAG_EEBUS_SET_SEARCH_ACTIVE": {"tagvalue": 0x28800005, "type": "Bool"},
-    "TAG_EEBUS_ASSOCIATE_DEVICE_TYPE_EVCS": {
-        "tagvalue": 0x28800006,
-        "type": "Container",
-    },
-    "TAG_EEBUS_LIST_USECASE": {"tagvalue": 0x28800008, "type": "Container"},
-    "TAG_EEBUS_EMOBILITY_WB_GET_EVSE_LIST_USECASE": {
-        "tagvalue": 0x28810000,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_EV_LIST_USECASE": {
-        "tagvalue": 0x28810001,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_GET_EVSE_MANUFACTURER_INFO": {
-        "tagvalue": 0x28810002,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_EV_MANUFACTURER_INFO": {
-        "tagvalue": 0x28810003,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_POWER_LIMITS": {
-        "tagvalue": 0x28810004,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_IDENTIFICATION": {
-        "tagvalue": 0x28810005,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_SLEEP_MODE": {
-        "tagvalue": 0x28810006,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_ASYMMETRIC_CHARGING_SUPPORTED": {
-        "tagvalue": 0x28810007,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_COMMUNICATION_STANDARD": {
-        "tagvalue": 0x28810008,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CURRENT_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28810010,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_POWER_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28810011,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_ENERGY_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28810012,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_MEASUREMENT_CONSTRAINTS": {
-        "tagvalue": 0x28810013,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_CURRENT_MEASUREMENT": {
-        "tagvalue": 0x28810014,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_POWER_MEASUREMENT": {
-        "tagvalue": 0x28810015,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_ENERGY_MEASUREMENT": {
-        "tagvalue": 0x28810017,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_MEASUREMENT": {
-        "tagvalue": 0x28810018,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_CURRENT_CONSTRAINTS": {
-        "tagvalue": 0x28810020,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_OVERLOAD_CHARGING_CURRENT_LIMIT": {
-        "tagvalue": 0x28810021,
-        "type": "Container",
-    },
-    "TAG_EEBUS_EMOBILITY_WB_EV_GET_DATA": {"tagvalue": 0x2881FFFE, "type": "Container"},
-    "TAG_EEBUS_EMOBILITY_WB_GET_DATA": {"tagvalue": 0x2881FFFF, "type": "Container"},
-    "TAG_SDSA_REQ_STATUS_FILE": {"tagvalue": 0x29000001, "type": "None"},
-    "TAG_SDSA_REQ_GET_WALLBOX_LIST": {"tagvalue": 0x29000002, "type": "None"},
-    "TAG_SDSA_STATUS_FILE": {"tagvalue": 0x29800001, "type": "CString"},
-    "TAG_SDSA_GET_WALLBOX_LIST": {"tagvalue": 0x29800002, "type": "CString"},
-    "TAG_ETH_REQ_SET_SEARCH_ACTIVE": {"tagvalue": 0x2A000001, "type": "Container"},
-    "TAG_ETH_REQ_LIST_NON_CONNECTED_DEVICES": {"tagvalue": 0x2A000002, "type": "None"},
-    "TAG_ETH_REQ_CONNECT_TO_DEVICE": {"tagvalue": 0x2A000003, "type": "Container"},
-    "TAG_ETH_REQ_IS_SCANNING": {"tagvalue": 0x2A000004, "type": "None"},
-    "TAG_ETH_REQ_DISCONNECT_FROM_DEVICE": {"tagvalue": 0x2A000005, "type": "Container"},
-    "TAG_ETH_REQ_LIST_CONNECTED_DEVICES": {"tagvalue": 0x2A000006, "type": "None"},
-    "TAG_ETH_REQ_APPLY_WB_PRECONFIG": {"tagvalue": 0x2A000007, "type": "None"},
-    "TAG_ETH_PARAM_SEARCH_ACTIVE": {"tagvalue": 0x2A400001, "type": "Bool"},
-    "TAG_ETH_PARAM_AUTO_ACCEPT": {"tagvalue": 0x2A400002, "type": "Bool"},
-    "TAG_ETH_PARAM_EXTERN_CONFIGURATOR_DEVICE_ID": {
-        "tagvalue": 0x2A400003,
-        "type": "Uint32",
-    },
-    "TAG_ETH_PARAM_AUTO_ACCEPT_VALUES": {"tagvalue": 0x2A400004, "type": "Container"},
-    "TAG_ETH_PARAM_DEVICE": {"tagvalue": 0x2A400005, "type": "Container"},
-    "TAG_ETH_PARAM_DEVICE_NAME": {"tagvalue": 0x2A400006, "type": "CString"},
-    "TAG_ETH_PARAM_SERIAL_NUMBER": {"tagvalue": 0x2A400007, "type": "CString"},
-    "TAG_ETH_PARAM_LOCAL_ID": {"tagvalue": 0x2A400008, "type": "CString"},
-    "TAG_ETH_PARAM_MAC_ADDRESS": {"tagvalue": 0x2A400009, "type": "CString"},
-    "TAG_ETH_PARAM_IP_ADDRESS": {"tagvalue": 0x2A40000A, "type": "CString"},
-    "TAG_ETH_PARAM_TIMEOUT": {"tagvalue": 0x2A40000B, "type": "Uint64"},
-    "TAG_ETH_PARAM_DISCONNECTED": {"tagvalue": 0x2A40000C, "type": "Bool"},
-    "TAG_ETH_PARAM_CONNECTION_SUCCESS": {"tagvalue": 0x2A40000D, "type": "Bool"},
-    "TAG_ETH_PARAM_DEVICE_ID": {"tagvalue": 0x2A40000E, "type": "UChar8"},
-    "TAG_ETH_PARAM_NUMBER_OF_DEVICES": {"tagvalue": 0x2A40000F, "type": "UChar8"},
-    "TAG_ETH_SET_SEARCH_ACTIVE": {"tagvalue": 0x2A800001, "type": "Bool"},
-    "TAG_ETH_LIST_NON_CONNECTED_DEVICES": {"tagvalue": 0x2A800002, "type": "Container"},
-    "TAG_ETH_CONNECT_TO_DEVICE": {"tagvalue": 0x2A800003, "type": "Container"},
-    "TAG_ETH_IS_SCANNING": {"tagvalue": 0x2A800004, "type": "Bool"},
-    "TAG_ETH_DISCONNECT_FROM_DEVICE": {"tagvalue": 0x2A800005, "type": "Container"},
-    "TAG_ETH_LIST_CONNECTED_DEVICES": {"tagvalue": 0x2A800006, "type": "Container"},
-    "TAG_LCT_REQ_START_NGROK": {"tagvalue": 0x2B000001, "type": "Container"},
-    "TAG_LCT_REQ_GET_IS_NGROK_RUNNING": {"tagvalue": 0x2B000002, "type": "None"},
-    "TAG_LCT_REQ_GET_IS_GTOU_ACCEPTED": {"tagvalue": 0x2B000003, "type": "Container"},
-    "TAG_LCT_REQ_SET_GTOU_ACCEPTED": {"tagvalue": 0x2B000004, "type": "Container"},
-    "TAG_LCT_SD_REQ_GET_MEM_INFO": {"tagvalue": 0x2B000005, "type": "None"},
-    "TAG_LCT_SD_REQ_GET_MOF_HEAP": {"tagvalue": 0x2B000006, "type": "None"},
-    "TAG_LCT_SD_REQ_GET_UP_TIME": {"tagvalue": 0x2B000007, "type": "None"},
-    "TAG_LCT_LC_REQ_CONFIGURE_MODBUS_SERVER": {
-        "tagvalue": 0x2B000008,
-        "type": "Container",
-    },
-    "TAG_LCT_REQ_SET_RC_DISCONNECTED_MODE": {
-        "tagvalue": 0x2B000009,
-        "type": "Container",
-    },
-    "TAG_LCT_REQ_GET_RC_DISCONNECTED_MODE": {
-        "tagvalue": 0x2B00000A,
-        "type": "Container",
-    },
-    "TAG_LCT_PARAM_DURATION": {"tagvalue": 0x2B00000B, "type": "UInt16"},
-    "TAG_LCT_PARAM_RC_DISCONNECTED_MODE": {"tagvalue": 0x2B400000, "type": "Bool"},
-    "TAG_LCT_PARAM_STATUS": {"tagvalue": 0x2B400001, "type": "Uint64"},
-    "TAG_LCT_PARAM_NGROK_HOSTNAME": {"tagvalue": 0x2B400002, "type": "CString"},
-    "TAG_LCT_PARAM_GTOU_ACCEPTED": {"tagvalue": 0x2B400003, "type": "Bool"},
-    "TAG_LCT_PARAM_TOKEN": {"tagvalue": 0x2B400004, "type": "CString"},
-    "TAG_LCT_SD_PARAM_MEM_FREE": {"tagvalue": 0x2B400005, "type": "Uint64"},
-    "TAG_LCT_SD_PARAM_MEM_CACHED": {"tagvalue": 0x2B400006, "type": "Uint64"},
-    "TAG_LCT_SD_PARAM_MEM_WD_FREE": {"tagvalue": 0x2B400007, "type": "Uint64"},
-    "TAG_LCT_SD_PARAM_MEM_BUFFER": {"tagvalue": 0x2B400008, "type": "Uint64"},
-    "TAG_LCT_SD_PARAM_SYNC_TIME": {"tagvalue": 0x2B400009, "type": "Uint64"},
-    "TAG_LCT_SD_PARAM_LOAD_AVERAGE": {"tagvalue": 0x2B40000A, "type": "CString"},
-    "TAG_LCT_LC_PARAM_MODBUS_SERVER_ENABLE": {"tagvalue": 0x2B40000B, "type": "Bool"},
-    "TAG_LCT_START_NGROK": {"tagvalue": 0x2B800001, "type": "Container"},
-    "TAG_LCT_GET_IS_NGROK_RUNNING": {"tagvalue": 0x2B800002, "type": "Bool"},
-    "TAG_LCT_GET_IS_GTOU_ACCEPTED": {"tagvalue": 0x2B800003, "type": "Container"},
-    "TAG_LCT_SET_GTOU_ACCEPTED": {"tagvalue": 0x2B800004, "type": "Container"},
-    "TAG_LCT_SD_GET_MEM_INFO": {"tagvalue": 0x2B800005, "type": "Container"},
-    "TAG_LCT_SD_GET_MOF_HEAP": {"tagvalue": 0x2B800006, "type": "CString"},
-    "TAG_LCT_SD_GET_UP_TIME": {"tagvalue": 0x2B800007, "type": "Uint64"},
-    "TAG_LCT_LC_CONFIGURE_MODBUS_SERVER": {"tagvalue": 0x2B800008, "type": "Container"},
-    "TAG_LCT_SET_RC_DISCONNECTED_MODE": {"tagvalue": 0x2B800009, "type": "Container"},
-    "TAG_LCT_GET_RC_DISCONNECTED_MODE": {"tagvalue": 0x2B80000A, "type": "Container"},
-    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_START_SCAN": {
-        "tagvalue": 0x2C000001,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_REQ_GET_NON_CONFIGURED_HAG_EVCS": {
-        "tagvalue": 0x2C000002,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_CONFIGURE_HAG_EVCS": {
-        "tagvalue": 0x2C000003,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_CONFIGURE_ALL_HAG_EVCS": {
-        "tagvalue": 0x2C000004,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_START_AUTO_CONFIG": {
-        "tagvalue": 0x2C000005,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_REQ_GET_LLM_URI": {
-        "tagvalue": 0x2C000006,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_TOKEN": {"tagvalue": 0x2C400001, "type": "CString"},
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_STATUS": {"tagvalue": 0x2C400002, "type": "Uint64"},
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE": {
-        "tagvalue": 0x2C400003,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE_HOSTNAME": {
-        "tagvalue": 0x2C400004,
-        "type": "CString",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE_IP": {
-        "tagvalue": 0x2C400005,
-        "type": "CString",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE_STATUS": {
-        "tagvalue": 0x2C400006,
-        "type": "UInt16",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_RUN": {"tagvalue": 0x2C400007, "type": "Bool"},
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_MAX_ACCEPTED": {
-        "tagvalue": 0x2C400008,
-        "type": "Int16",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_ACCEPTED": {"tagvalue": 0x2C400009, "type": "Int16"},
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_ACCEPTED_HAGER": {
-        "tagvalue": 0x2C40000A,
-        "type": "Int16",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_UNDERWAY": {"tagvalue": 0x2C40000B, "type": "Int16"},
-    "TAG_HG_OCPP_WB_CFG_LC_PARAM_LLM_URI": {"tagvalue": 0x2C40000C, "type": "CString"},
-    "TAG_HG_OCPP_WB_CFG_LC_SET_START_SCAN": {
-        "tagvalue": 0x2C800001,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_GET_NON_CONFIGURED_HAG_EVCS": {
-        "tagvalue": 0x2C800002,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_SET_CONFIGURE_HAG_EVCS": {
-        "tagvalue": 0x2C800003,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_SET_CONFIGURE_ALL_HAG_EVCS": {
-        "tagvalue": 0x2C800004,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_SET_START_AUTO_CONFIG": {
-        "tagvalue": 0x2C800005,
-        "type": "Container",
-    },
-    "TAG_HG_OCPP_WB_CFG_LC_GET_LLM_URI": {"tagvalue": 0x2C800006, "type": "Container"},
-    "TAG_OCPP_WB_LC_REQ_SET_ACCEPTANCE_RULE": {
-        "tagvalue": 0x2D000001,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_NON_ACCEPTED_EVCS": {
-        "tagvalue": 0x2D000002,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_ACCEPTED_EVCS": {
-        "tagvalue": 0x2D000003,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_ACCEPT_EVCS": {"tagvalue": 0x2D000004, "type": "Container"},
-    "TAG_OCPP_WB_LC_REQ_SET_ACCEPT_ALL_EVCS": {
-        "tagvalue": 0x2D000005,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_BADGE_STRATEGY": {
-        "tagvalue": 0x2D000006,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_BADGE_ACQUISITION_MODE_START": {
-        "tagvalue": 0x2D000007,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_BADGE_ACQUISITION_MODE_STOP": {
-        "tagvalue": 0x2D000008,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_ACCEPTANCE_RULE": {
-        "tagvalue": 0x2D000009,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_BADGE_STRATEGY": {
-        "tagvalue": 0x2D00000A,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_ACCEPTED_EVCS_EXTENDED": {
-        "tagvalue": 0x2D00000B,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_AVAILABLE_PARAMETERS_PROFILES": {
-        "tagvalue": 0x2D00000C,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_DEVICE_ADVANCED_SETTINGS": {
-        "tagvalue": 0x2D00000D,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_EVCS_DEVICES_PARAMETERS": {
-        "tagvalue": 0x2D00000E,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_REMOVE_WB": {"tagvalue": 0x2D00000F, "type": "Container"},
-    "TAG_OCPP_WB_LC_REQ_SET_FACTORY_RESET": {
-        "tagvalue": 0x2D000010,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_WALLBOXES_COUNT": {
-        "tagvalue": 0x2D000011,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_MAX_WALLBOXES_COUNT": {
-        "tagvalue": 0x2D000012,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_AVAILABLE_CPO_LIST": {
-        "tagvalue": 0x2D000013,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_CPO_BUTTON_STATE": {
-        "tagvalue": 0x2D000014,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_CPO_BUTTON_STATE": {
-        "tagvalue": 0x2D000015,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_CLEAN_CPO_SETTINGS": {
-        "tagvalue": 0x2D000016,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_CPO_MODE": {"tagvalue": 0x2D000017, "type": "Container"},
-    "TAG_OCPP_WB_LC_REQ_SET_CPO_SETTINGS": {
-        "tagvalue": 0x2D000018,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_CPO_SETTINGS": {
-        "tagvalue": 0x2D000019,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_DEVICE_CPO_CONNECTABLE": {
-        "tagvalue": 0x2D00001A,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_EVCS_DEVICE_CPO_CONNECTABLE": {
-        "tagvalue": 0x2D00001B,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_CPO_MODE": {"tagvalue": 0x2D00001C, "type": "Container"},
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_CHARGING_SESSION_HISTORY_NB": {
-        "tagvalue": 0x2D00001D,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_CHARGING_SESSION_HISTORY": {
-        "tagvalue": 0x2D00001E,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_CHARGING_SESSIONS_ACTIVE": {
-        "tagvalue": 0x2D00001F,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_BADGES_PER_EVCS": {
-        "tagvalue": 0x2D000020,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_BADGES_PER_EVCS": {
-        "tagvalue": 0x2D000021,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_LIST_PER_BADGE": {
-        "tagvalue": 0x2D000022,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_SET_EVCS_LIST_PER_BADGE": {
-        "tagvalue": 0x2D000023,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_REQ_GET_EVCS_PRIORITY_LIST": {
-        "tagvalue": 0x2D000024,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK_DATA": {
-        "tagvalue": 0x2D400000,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_TOKEN": {"tagvalue": 0x2D400001, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_ACCEPTANCE_RULE_VAL": {
-        "tagvalue": 0x2D400002,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_STATUS": {"tagvalue": 0x2D400003, "type": "Uint64"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE": {"tagvalue": 0x2D400004, "type": "Container"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_HOSTNAME": {
-        "tagvalue": 0x2D400005,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_IP": {"tagvalue": 0x2D400006, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ID": {
-        "tagvalue": 0x2D400007,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_STATUS": {
-        "tagvalue": 0x2D400008,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_BADGE_STRATEGY": {"tagvalue": 0x2D400009, "type": "UInt16"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR": {
-        "tagvalue": 0x2D40000A,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_ID": {
-        "tagvalue": 0x2D40000B,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_PLUG_TYPE": {
-        "tagvalue": 0x2D40000C,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MAX_CURRENT_PER_PHASE": {
-        "tagvalue": 0x2D40000D,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MIN_CURRENT_PER_PHASE": {
-        "tagvalue": 0x2D40000E,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_AUTH_OFFLINE_CHARGE_SESS": {
-        "tagvalue": 0x2D40000F,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_SETTINGS": {
-        "tagvalue": 0x2D400010,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ACCEPT_UNKNOWN_OFFLINE_AUTH": {
-        "tagvalue": 0x2D400011,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_AUTHORIZATION_CACHE_ENABLED": {
-        "tagvalue": 0x2D400012,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_REMOTE_TRANSACTION_ENABLED": {
-        "tagvalue": 0x2D400013,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_BLINKS_NUMBER": {
-        "tagvalue": 0x2D400014,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CLOCK_ALIGNED_DATA_INTERVAL": {
-        "tagvalue": 0x2D400015,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTION_TIMEOUT": {
-        "tagvalue": 0x2D400016,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTOR_PHASE_ROTATION": {
-        "tagvalue": 0x2D400017,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_HEARTBEAT_INTERVAL": {
-        "tagvalue": 0x2D400018,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LIGHT_INTENSITY": {
-        "tagvalue": 0x2D400019,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_AUTHORIZE_OFFLINE": {
-        "tagvalue": 0x2D40001A,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_PRE_AUTHORIZE": {
-        "tagvalue": 0x2D40001B,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_MAX_ENERGY_ON_INVALID_ID": {
-        "tagvalue": 0x2D40001C,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING": {
-        "tagvalue": 0x2D40001D,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CLUSTER_NAME": {
-        "tagvalue": 0x2D40001E,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_NAME": {
-        "tagvalue": 0x2D40001F,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONFIG_STATUS": {
-        "tagvalue": 0x2D400020,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_PARAMETERS_PROFILE": {
-        "tagvalue": 0x2D400021,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_DEFAULT_CHARGING_PROFILE": {
-        "tagvalue": 0x2D400022,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PLUG_TYPE_PER_CONNECTOR": {
-        "tagvalue": 0x2D400023,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_ID": {"tagvalue": 0x2D400024, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_STATE": {
-        "tagvalue": 0x2D400025,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_WB_COUNT": {"tagvalue": 0x2D400026, "type": "UInt16"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_COUNT": {
-        "tagvalue": 0x2D400027,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_CPO_INFO": {"tagvalue": 0x2D400028, "type": "Container"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_NAME": {"tagvalue": 0x2D400029, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_URI": {"tagvalue": 0x2D40002A, "type": "Container"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_BUTTON": {"tagvalue": 0x2D40002B, "type": "Bool"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_MODE": {"tagvalue": 0x2D40002C, "type": "Bool"},
-    "TAG_OCPP_WB_LC_PARAM_SETTINGS": {"tagvalue": 0x2D40002D, "type": "Container"},
-    "TAG_OCPP_WB_LC_PARAM_CREDENTIALS": {"tagvalue": 0x2D40002E, "type": "Container"},
-    "TAG_OCPP_WB_LC_PARAM_LOGIN": {"tagvalue": 0x2D40002F, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_PASSWORD": {"tagvalue": 0x2D400030, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_AUTH_TYPE": {"tagvalue": 0x2D400031, "type": "UInt16"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_ADDRESS": {"tagvalue": 0x2D400032, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_PORT": {"tagvalue": 0x2D400033, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_PATH": {"tagvalue": 0x2D400034, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_CPO_UUID": {"tagvalue": 0x2D400035, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_START_DATE": {
-        "tagvalue": 0x2D400036,
-        "type": "Timestamp",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_STOP_DATE": {
-        "tagvalue": 0x2D400037,
-        "type": "Timestamp",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_HISTORY_NB": {
-        "tagvalue": 0x2D400038,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_HISTORY": {
-        "tagvalue": 0x2D400039,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_ID": {"tagvalue": 0x2D40003A, "type": "CString"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_COMMENT": {
-        "tagvalue": 0x2D40003B,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_ENERGY_CHARGED": {
-        "tagvalue": 0x2D40003C,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_END_DATE": {"tagvalue": 0x2D40003D, "type": "Timestamp"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_TRANSACTION_ID": {
-        "tagvalue": 0x2D40003E,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_IS_EVCS_CHARGING_SESSIONS_ACTIVE": {
-        "tagvalue": 0x2D40003F,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK_ID": {
-        "tagvalue": 0x2D400040,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CPO_CONFIG_STATUS": {
-        "tagvalue": 0x2D400041,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_ASSOCIATED": {
-        "tagvalue": 0x2D400042,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_BADGE": {
-        "tagvalue": 0x2D400044,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_ASSOCIATED": {
-        "tagvalue": 0x2D400045,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK": {"tagvalue": 0x2D400048, "type": "Uint64"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK_INDEX": {
-        "tagvalue": 0x2D400049,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MAX_CURRENT_PER_PHASE_LIMIT": {
-        "tagvalue": 0x2D40004A,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MIN_CURRENT_PER_PHASE_LIMIT": {
-        "tagvalue": 0x2D40004B,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT": {
-        "tagvalue": 0x2D40004C,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_ID": {
-        "tagvalue": 0x2D40004D,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_POSITION": {
-        "tagvalue": 0x2D40004E,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MODEL": {
-        "tagvalue": 0x2D400051,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_ENERGY_INDEX": {
-        "tagvalue": 0x2D400052,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_USE_WB_SPECIFIC_AUTH": {
-        "tagvalue": 0x2D400053,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_SESSION_NUMBER": {
-        "tagvalue": 0x2D400054,
-        "type": "Uint64",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_INDEX": {
-        "tagvalue": 0x2D400055,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_PRIORITY_RANK": {
-        "tagvalue": 0x2D400056,
-        "type": "Int16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_SETPOINT": {
-        "tagvalue": 0x2D400057,
-        "type": "Int32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_GET_WB_SPECIFIC_AUTH": {
-        "tagvalue": 0x2D400058,
-        "type": "Bool",
-    },
-    "TAG_OCPP_WB_LC_PARAM_BROKER_ERROR_STATUS": {
-        "tagvalue": 0x2D400059,
-        "type": "UInt16",
-    },
-    "TAG_OCPP_WB_LC_PARAM_CPO_URI_CUSTOM_ID": {
-        "tagvalue": 0x2D40005A,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_CPO_USE_CUSTOM_ID": {"tagvalue": 0x2D40005B, "type": "Bool"},
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_ID_PROPS": {
-        "tagvalue": 0x2D40005C,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_HOSTNAME_PROPS": {
-        "tagvalue": 0x2D40005D,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_IP_PROPS": {
-        "tagvalue": 0x2D40005E,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ID_PROPS": {
-        "tagvalue": 0x2D40005F,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CLUSTER_NAME_PROPS": {
-        "tagvalue": 0x2D400060,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_NAME_PROPS": {
-        "tagvalue": 0x2D400061,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONFIG_STATUS_PROPS": {
-        "tagvalue": 0x2D400062,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_PARAMETERS_PROFILE_PROPS": {
-        "tagvalue": 0x2D400063,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_DEFAULT_CHARGING_PROFILE_PROPS": {
-        "tagvalue": 0x2D400064,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PLUG_TYPE_PER_CONNECTOR_PROPS": {
-        "tagvalue": 0x2D400065,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MAX_CURRENT_PER_PHASE_LIMIT_PROPS": {
-        "tagvalue": 0x2D400066,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MIN_CURRENT_PER_PHASE_LIMIT_PROPS": {
-        "tagvalue": 0x2D400067,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ACCEPT_UNKNOWN_OFFLINE_AUTH_PROPS": {
-        "tagvalue": 0x2D400068,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_AUTHORIZATION_CACHE_ENABLED_PROPS": {
-        "tagvalue": 0x2D400069,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_REMOTE_TRANSACTION_ENABLED_PROPS": {
-        "tagvalue": 0x2D40006A,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTION_TIMEOUT_PROPS": {
-        "tagvalue": 0x2D40006B,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTOR_PHASE_ROTATION_PROPS": {
-        "tagvalue": 0x2D40006C,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_HEARTBEAT_INTERVAL_PROPS": {
-        "tagvalue": 0x2D40006D,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_AUTHORIZE_OFFLINE_PROPS": {
-        "tagvalue": 0x2D40006E,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_PRE_AUTHORIZE_PROPS": {
-        "tagvalue": 0x2D40006F,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING_PROPS": {
-        "tagvalue": 0x2D400070,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_ID_PROPS": {
-        "tagvalue": 0x2D400071,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_POSITION_PROPS": {
-        "tagvalue": 0x2D400072,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_ID_PROPS": {
-        "tagvalue": 0x2D400073,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_PLUG_TYPE_PROPS": {
-        "tagvalue": 0x2D400074,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MAX_CURRENT_PER_PHASE_PROPS": {
-        "tagvalue": 0x2D400075,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MIN_CURRENT_PER_PHASE_PROPS": {
-        "tagvalue": 0x2D400076,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_AUTH_OFFLINE_CHARGE_SESS_PROPS": {
-        "tagvalue": 0x2D400077,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING_VALID_VALUES": {
-        "tagvalue": 0x2D400078,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING_VALUE": {
-        "tagvalue": 0x2D400079,
-        "type": "UChar8",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_VALID_VALUES": {
-        "tagvalue": 0x2D40007A,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_VALUE": {
-        "tagvalue": 0x2D40007B,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_MODEL": {
-        "tagvalue": 0x2D40007C,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_DISPLAY_NAME": {
-        "tagvalue": 0x2D40007D,
-        "type": "CString",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_MODEL_PROPS": {
-        "tagvalue": 0x2D40007E,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_VALID_VALUES_PROPS": {
-        "tagvalue": 0x2D40007F,
-        "type": "Uint32",
-    },
-    "TAG_OCPP_WB_LC_SET_ACCEPTANCE_RULE": {"tagvalue": 0x2D800001, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_NON_ACCEPTED_EVCS": {
-        "tagvalue": 0x2D800002,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_ACCEPTED_EVCS": {"tagvalue": 0x2D800003, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_ACCEPT_EVCS": {"tagvalue": 0x2D800004, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_ACCEPT_ALL_EVCS": {"tagvalue": 0x2D800005, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_BADGE_STRATEGY": {"tagvalue": 0x2D800006, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_BADGE_ACQUISITION_MODE_START": {
-        "tagvalue": 0x2D800007,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_BADGE_ACQUISITION_MODE_STOP": {
-        "tagvalue": 0x2D800008,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_ACCEPTANCE_RULE": {"tagvalue": 0x2D800009, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_BADGE_STRATEGY": {"tagvalue": 0x2D80000A, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_ACCEPTED_EVCS_EXTENDED": {
-        "tagvalue": 0x2D80000B,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_EVCS_AVAILABLE_PARAMETERS_PROFILES": {
-        "tagvalue": 0x2D80000C,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_EVCS_DEVICE_ADVANCED_SETTINGS": {
-        "tagvalue": 0x2D80000D,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_EVCS_DEVICES_PARAMETERS": {
-        "tagvalue": 0x2D80000E,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_REMOVE_WB": {"tagvalue": 0x2D80000F, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_FACTORY_RESET": {"tagvalue": 0x2D800010, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_WALLBOXES_COUNT": {"tagvalue": 0x2D800011, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_MAX_WALLBOXES_COUNT": {
-        "tagvalue": 0x2D800012,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_AVAILABLE_CPO_LIST": {
-        "tagvalue": 0x2D800013,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_CPO_BUTTON_STATE": {
-        "tagvalue": 0x2D800014,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_CPO_BUTTON_STATE": {
-        "tagvalue": 0x2D800015,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_CLEAN_CPO_SETTINGS": {
-        "tagvalue": 0x2D800016,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_CPO_MODE": {"tagvalue": 0x2D800017, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_CPO_SETTINGS": {"tagvalue": 0x2D800018, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_CPO_SETTINGS": {"tagvalue": 0x2D800019, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_EVCS_DEVICE_CPO_CONNECTABLE": {
-        "tagvalue": 0x2D80001A,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_EVCS_DEVICE_CPO_CONNECTABLE": {
-        "tagvalue": 0x2D80001B,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_CPO_MODE": {"tagvalue": 0x2D80001C, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_EVCS_CHARGING_SESSION_HISTORY_NB": {
-        "tagvalue": 0x2D80001D,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_EVCS_CHARGING_SESSION_HISTORY": {
-        "tagvalue": 0x2D80001E,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_EVCS_CHARGING_SESSIONS_ACTIVE": {
-        "tagvalue": 0x2D80001F,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_BADGES_PER_EVCS": {"tagvalue": 0x2D800020, "type": "Container"},
-    "TAG_OCPP_WB_LC_SET_BADGES_PER_EVCS": {"tagvalue": 0x2D800021, "type": "Container"},
-    "TAG_OCPP_WB_LC_GET_EVCS_LIST_PER_BADGE": {
-        "tagvalue": 0x2D800022,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_SET_EVCS_LIST_PER_BADGE": {
-        "tagvalue": 0x2D800023,
-        "type": "Container",
-    },
-    "TAG_OCPP_WB_LC_GET_EVCS_PRIORITY_LIST": {
-        "tagvalue": 0x2D800024,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_REQ_SET_ADD_BADGE": {
-        "tagvalue": 0x2E000001,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_REQ_SET_REMOVE_BADGE": {
-        "tagvalue": 0x2E000002,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_REQ_GET_BADGE": {"tagvalue": 0x2E000003, "type": "Container"},
-    "TAG_WB_BADGE_MGT_LC_REQ_SET_BADGE_PARAM": {
-        "tagvalue": 0x2E000004,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_REQ_GET_BADGES_COUNT": {
-        "tagvalue": 0x2E000005,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_TOKEN": {"tagvalue": 0x2E400001, "type": "CString"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE": {"tagvalue": 0x2E400002, "type": "Container"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_ID": {"tagvalue": 0x2E400003, "type": "CString"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_ROLE": {"tagvalue": 0x2E400004, "type": "Char8"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_EXP_DATE": {
-        "tagvalue": 0x2E400005,
-        "type": "Timestamp",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_COMMENT": {
-        "tagvalue": 0x2E400006,
-        "type": "CString",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_BLOCKED": {"tagvalue": 0x2E400007, "type": "Bool"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_MAIL": {"tagvalue": 0x2E400008, "type": "CString"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_STATUS": {"tagvalue": 0x2E400009, "type": "Uint64"},
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_BLOCKED": {
-        "tagvalue": 0x2E40000A,
-        "type": "None",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_NON_BLOCKED": {
-        "tagvalue": 0x2E40000B,
-        "type": "None",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_ROLE_EQ": {
-        "tagvalue": 0x2E40000C,
-        "type": "Char8",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_ROLE_NEQ": {
-        "tagvalue": 0x2E40000D,
-        "type": "Char8",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_BADGE_ID": {
-        "tagvalue": 0x2E40000E,
-        "type": "CString",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_COMMENT": {
-        "tagvalue": 0x2E40000F,
-        "type": "CString",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_MAIL": {
-        "tagvalue": 0x2E400010,
-        "type": "CString",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_EXP_DATE_BEFORE": {
-        "tagvalue": 0x2E400011,
-        "type": "Timestamp",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_EXP_DATE_AFTER": {
-        "tagvalue": 0x2E400012,
-        "type": "Timestamp",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGES_COUNT": {
-        "tagvalue": 0x2E400013,
-        "type": "UInt16",
-    },
-    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_MASK_INDEX": {
-        "tagvalue": 0x2E400014,
-        "type": "UInt16",
-    },
-    "TAG_WB_BADGE_MGT_LC_SET_ADD_BADGE": {"tagvalue": 0x2E800001, "type": "Container"},
-    "TAG_WB_BADGE_MGT_LC_SET_REMOVE_BADGE": {
-        "tagvalue": 0x2E800002,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_GET_BADGE": {"tagvalue": 0x2E800003, "type": "Container"},
-    "TAG_WB_BADGE_MGT_LC_SET_BADGE_PARAM": {
-        "tagvalue": 0x2E800004,
-        "type": "Container",
-    },
-    "TAG_WB_BADGE_MGT_LC_GET_BADGES_COUNT": {
-        "tagvalue": 0x2E800005,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_GET_LOGIN": {"tagvalue": 0x2F000001, "type": "Container"},
-    "TAG_LC_USR_MGT_LC_REQ_GET_PROFILE_BY_TOKEN": {
-        "tagvalue": 0x2F000002,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_SET_ADD_USER_OR_CHG_PWD": {
-        "tagvalue": 0x2F000003,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_SET_UPDATE_USER_ACCOUNT": {
-        "tagvalue": 0x2F000004,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_SET_ENABLE_PUBLIC_ACCESS": {
-        "tagvalue": 0x2F000005,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_SET_DISABLE_PUBLIC_ACCESS": {
-        "tagvalue": 0x2F000006,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_SET_REMOVE_USER": {
-        "tagvalue": 0x2F000007,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_GET_PUBLIC_ACCESS_STATE": {
-        "tagvalue": 0x2F000008,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_SET_DISCONNECT_USER": {
-        "tagvalue": 0x2F000009,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_GET_USERS_LIST": {
-        "tagvalue": 0x2F00000A,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_GET_USER_RELATED_INFO": {
-        "tagvalue": 0x2F00000B,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_GET_LOGIN_PUBLIC_USER": {
-        "tagvalue": 0x2F00000C,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_REQ_GET_USERS_COUNT": {
-        "tagvalue": 0x2F00000D,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_PARAM_TOKEN": {"tagvalue": 0x2F400001, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_USER": {"tagvalue": 0x2F400002, "type": "Container"},
-    "TAG_LC_USR_MGT_LC_PARAM_LOGIN": {"tagvalue": 0x2F400003, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_PWD": {"tagvalue": 0x2F400004, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_STATUS": {"tagvalue": 0x2F400005, "type": "Uint64"},
-    "TAG_LC_USR_MGT_LC_PARAM_ROLE": {"tagvalue": 0x2F400006, "type": "UChar8"},
-    "TAG_LC_USR_MGT_LC_PARAM_NAME": {"tagvalue": 0x2F400007, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_FIRST_NAME": {"tagvalue": 0x2F400008, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_STREET": {"tagvalue": 0x2F400009, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_ZIP": {"tagvalue": 0x2F40000A, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_CITY": {"tagvalue": 0x2F40000B, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_COUNTRY": {"tagvalue": 0x2F40000C, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_EMAIL": {"tagvalue": 0x2F40000D, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_PHONE": {"tagvalue": 0x2F40000E, "type": "CString"},
-    "TAG_LC_USR_MGT_LC_PARAM_EMAIL_DISPLAYED": {"tagvalue": 0x2F40000F, "type": "Bool"},
-    "TAG_LC_USR_MGT_LC_PARAM_PHONE_DISPLAYED": {"tagvalue": 0x2F400010, "type": "Bool"},
-    "TAG_LC_USR_MGT_LC_PARAM_PUBLIC_ACCESS_STATE": {
-        "tagvalue": 0x2F400011,
-        "type": "Bool",
-    },
-    "TAG_LC_USR_MGT_LC_PARAM_USERS_COUNT": {"tagvalue": 0x2F400012, "type": "UInt16"},
-    "TAG_LC_USR_MGT_LC_GET_LOGIN": {"tagvalue": 0x2F800001, "type": "Container"},
-    "TAG_LC_USR_MGT_LC_GET_PROFILE_BY_TOKEN": {
-        "tagvalue": 0x2F800002,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_SET_ADD_USER_OR_CHG_PWD": {
-        "tagvalue": 0x2F800003,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_SET_UPDATE_USER_ACCOUNT": {
-        "tagvalue": 0x2F800004,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_SET_ENABLE_PUBLIC_ACCESS": {
-        "tagvalue": 0x2F800005,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_SET_DISABLE_PUBLIC_ACCESS": {
-        "tagvalue": 0x2F800006,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_SET_REMOVE_USER": {"tagvalue": 0x2F800007, "type": "Container"},
-    "TAG_LC_USR_MGT_LC_GET_PUBLIC_ACCESS_STATE": {
-        "tagvalue": 0x2F800008,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_SET_DISCONNECT_USER": {
-        "tagvalue": 0x2F800009,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_GET_USERS_LIST": {"tagvalue": 0x2F80000A, "type": "Container"},
-    "TAG_LC_USR_MGT_LC_GET_USER_RELATED_INFO": {
-        "tagvalue": 0x2F80000B,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_GET_LOGIN_PUBLIC_USER": {
-        "tagvalue": 0x2F80000C,
-        "type": "Container",
-    },
-    "TAG_LC_USR_MGT_LC_GET_USERS_COUNT": {"tagvalue": 0x2F80000D, "type": "Container"},
-    "TAG_DASHBOARD_LC_REQ_GET_SYSTEM_INFO": {
-        "tagvalue": 0x30000001,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_REQ_GET_CONSUMPTIONS": {
-        "tagvalue": 0x30000002,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_REQ_GET_CHARGING_SESSIONS": {
-        "tagvalue": 0x30000003,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_REQ_GET_SUPPORT_CONTACTS": {
-        "tagvalue": 0x30000004,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_REQ_GET_DATA": {"tagvalue": 0x30000005, "type": "Container"},
-    "TAG_DASHBOARD_LC_PARAM_TOKEN": {"tagvalue": 0x30400001, "type": "CString"},
-    "TAG_DASHBOARD_LC_PARAM_POWER_MGT_TYPE": {"tagvalue": 0x30400002, "type": "UInt16"},
-    "TAG_DASHBOARD_LC_PARAM_MAX_CURRENT_PER_PHASE": {
-        "tagvalue": 0x30400003,
-        "type": "UChar8",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WALLBOXES_COUNT": {
-        "tagvalue": 0x30400004,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_BADGE_STRATEGY": {"tagvalue": 0x30400005, "type": "Bool"},
-    "TAG_DASHBOARD_LC_PARAM_BADGES_COUNT": {"tagvalue": 0x30400006, "type": "UInt16"},
-    "TAG_DASHBOARD_LC_PARAM_STATUS": {"tagvalue": 0x30400007, "type": "Uint64"},
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE": {
-        "tagvalue": 0x30400008,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_PHASE_L1": {
-        "tagvalue": 0x30400009,
-        "type": "Float32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_PHASE_L2": {
-        "tagvalue": 0x3040000A,
-        "type": "Float32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_PHASE_L3": {
-        "tagvalue": 0x3040000B,
-        "type": "Float32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL": {
-        "tagvalue": 0x3040000C,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_PHASE_L1": {
-        "tagvalue": 0x3040000D,
-        "type": "Float32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_PHASE_L2": {
-        "tagvalue": 0x3040000E,
-        "type": "Float32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_PHASE_L3": {
-        "tagvalue": 0x3040000F,
-        "type": "Float32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION": {"tagvalue": 0x30400010, "type": "Container"},
-    "TAG_DASHBOARD_LC_PARAM_WB_LABEL": {"tagvalue": 0x30400011, "type": "CString"},
-    "TAG_DASHBOARD_LC_PARAM_WB_HOSTNAME": {"tagvalue": 0x30400012, "type": "CString"},
-    "TAG_DASHBOARD_LC_PARAM_WB_MAC_ADDRESS": {
-        "tagvalue": 0x30400013,
-        "type": "CString",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_STATE": {"tagvalue": 0x30400014, "type": "Bool"},
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_ACTIVE_SEC": {
-        "tagvalue": 0x30400015,
-        "type": "Uint64",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_INACTIVE_SEC": {
-        "tagvalue": 0x30400016,
-        "type": "Uint64",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_BADGE_ID": {
-        "tagvalue": 0x30400017,
-        "type": "CString",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR": {
-        "tagvalue": 0x30400018,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_ID": {
-        "tagvalue": 0x30400019,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_TYPE": {
-        "tagvalue": 0x3040001A,
-        "type": "UChar8",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_STATUS": {
-        "tagvalue": 0x3040001B,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_ERROR_MSG": {
-        "tagvalue": 0x3040001C,
-        "type": "CString",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_L1": {
-        "tagvalue": 0x3040001D,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_L2": {
-        "tagvalue": 0x3040001E,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_L3": {
-        "tagvalue": 0x3040001F,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_LIMIT": {
-        "tagvalue": 0x30400020,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_ENERGY_CHARGED": {
-        "tagvalue": 0x30400021,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONTACT": {"tagvalue": 0x30400022, "type": "Container"},
-    "TAG_DASHBOARD_LC_PARAM_CONTACT_NAME": {"tagvalue": 0x30400023, "type": "CString"},
-    "TAG_DASHBOARD_LC_PARAM_CONTACT_FIRST_NAME": {
-        "tagvalue": 0x30400024,
-        "type": "CString",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONTACT_PHONE": {"tagvalue": 0x30400025, "type": "CString"},
-    "TAG_DASHBOARD_LC_PARAM_CONTACT_EMAIL": {"tagvalue": 0x30400026, "type": "CString"},
-    "TAG_DASHBOARD_LC_PARAM_CONTACT_ROLE": {"tagvalue": 0x30400027, "type": "UInt16"},
-    "TAG_DASHBOARD_LC_PARAM_CONTACT_TYPE": {"tagvalue": 0x30400028, "type": "UInt16"},
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT": {
-        "tagvalue": 0x30400029,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT_ID": {
-        "tagvalue": 0x3040002A,
-        "type": "UChar8",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT_POSITION": {
-        "tagvalue": 0x3040002B,
-        "type": "UChar8",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_INDEX": {"tagvalue": 0x3040002C, "type": "UChar8"},
-    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT_ENERGY_INDEX": {
-        "tagvalue": 0x3040002D,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_POWER_L1": {
-        "tagvalue": 0x3040002E,
-        "type": "Double64",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_POWER_L2": {
-        "tagvalue": 0x3040002F,
-        "type": "Double64",
-    },
-    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_POWER_L3": {
-        "tagvalue": 0x30400030,
-        "type": "Double64",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_POWER_L1": {
-        "tagvalue": 0x30400031,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_POWER_L2": {
-        "tagvalue": 0x30400032,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_POWER_L3": {
-        "tagvalue": 0x30400033,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_POWER_L1": {
-        "tagvalue": 0x30400034,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_POWER_L2": {
-        "tagvalue": 0x30400035,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_POWER_L3": {
-        "tagvalue": 0x30400036,
-        "type": "Uint32",
-    },
-    "TAG_DASHBOARD_LC_PARAM_POWER_MEASURE_TYPE": {
-        "tagvalue": 0x30400037,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_PARAM_LOAD_SHEDDING_STATUS": {
-        "tagvalue": 0x30400038,
-        "type": "UInt16",
-    },
-    "TAG_DASHBOARD_LC_GET_SYSTEM_INFO": {"tagvalue": 0x30800001, "type": "Container"},
-    "TAG_DASHBOARD_LC_GET_CONSUMPTIONS": {"tagvalue": 0x30800002, "type": "Container"},
-    "TAG_DASHBOARD_LC_GET_CHARGING_SESSIONS": {
-        "tagvalue": 0x30800003,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_GET_SUPPORT_CONTACTS": {
-        "tagvalue": 0x30800004,
-        "type": "Container",
-    },
-    "TAG_DASHBOARD_LC_GET_DATA": {"tagvalue": 0x30800005, "type": "Container"},
-    "TAG_RD_REQ_DATA": {"tagvalue": 0x31000001, "type": "Container"},
-    "TAG_RD_REQ_DEVICE_NAME": {"tagvalue": 0x31000002, "type": "None"},
-    "TAG_RD_REQ_GENERAL_ERROR": {"tagvalue": 0x31000003, "type": "None"},
-    "TAG_RD_REQ_COMM_STATE": {"tagvalue": 0x31000004, "type": "None"},
-    "TAG_RD_REQ_DEVICE_ID": {"tagvalue": 0x31000005, "type": "None"},
-    "TAG_RD_REQ_FIRMWARE_VERSION": {"tagvalue": 0x31000006, "type": "None"},
-    "TAG_RD_REQ_DEVICE_WORKING": {"tagvalue": 0x31000007, "type": "None"},
-    "TAG_RD_REQ_DEVICE_IN_SERVICE": {"tagvalue": 0x31000008, "type": "None"},
-    "TAG_RD_REQ_DEVICE_CONNECTED": {"tagvalue": 0x31000009, "type": "None"},
-    "TAG_RD_REQ_DEVICE_STATE": {"tagvalue": 0x3100000A, "type": "None"},
-    "TAG_RD_REQ_CONNECTED_DEVICES": {"tagvalue": 0x3100000B, "type": "None"},
-    "TAG_RD_CONNECTED_DEVICE": {"tagvalue": 0x31400000, "type": "Container"},
-    "TAG_RD_INDEX": {"tagvalue": 0x31400001, "type": "UInt16"},
-    "TAG_RD_DATA": {"tagvalue": 0x31800001, "type": "Container"},
-    "TAG_RD_DEVICE_NAME": {"tagvalue": 0x31800002, "type": "CString"},
-    "TAG_RD_GENERAL_ERROR": {"tagvalue": 0x31800003, "type": "UChar8"},
-    "TAG_RD_COMM_STATE": {"tagvalue": 0x31800004, "type": "Container"},
-    "TAG_RD_DEVICE_ID": {"tagvalue": 0x31800005, "type": "Uint32"},
-    "TAG_RD_FIRMWARE_VERSION": {"tagvalue": 0x31800006, "type": "UChar8"},
-    "TAG_RD_DEVICE_WORKING": {"tagvalue": 0x31800007, "type": "Bool"},
-    "TAG_RD_DEVICE_IN_SERVICE": {"tagvalue": 0x31800008, "type": "Bool"},
-    "TAG_RD_DEVICE_CONNECTED": {"tagvalue": 0x31800009, "type": "Bool"},
-    "TAG_RD_DEVICE_STATE": {"tagvalue": 0x3180000A, "type": "Container"},
-    "TAG_RD_CONNECTED_DEVICES": {"tagvalue": 0x3180000B, "type": "Container"},
-    "TAG_SMGW_REQ_SET_EEBUS_ENABLED": {"tagvalue": 0x32000000, "type": "Bool"},
-    "TAG_SMGW_REQ_EEBUS_ENABLED": {"tagvalue": 0x32000001, "type": "None"},
-    "TAG_SMGW_REQ_SET_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32000002, "type": "Bool"},
-    "TAG_SMGW_REQ_EEBUS_STATUS": {"tagvalue": 0x32000003, "type": "None"},
-    "TAG_SMGW_REQ_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32000004, "type": "None"},
-    "TAG_SMGW_REQ_SET_IP_ADDRESS": {"tagvalue": 0x32000005, "type": "CString"},
-    "TAG_SMGW_EEBUS_ENABLED": {"tagvalue": 0x32800001, "type": "Bool"},
-    "TAG_SMGW_SET_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32800002, "type": "None"},
-    "TAG_SMGW_EEBUS_STATUS": {"tagvalue": 0x32800003, "type": "Char8"},
-    "TAG_SMGW_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32800004, "type": "Bool"},
-    "TAG_SMGW_SET_IP_ADDRESS": {"tagvalue": 0x32800005, "type": "None"},
-    "TAG_SMGW_SET_EEBUS_ENABLED": {"tagvalue": 0x32800010, "type": "None"},
-    "TAG_DB_SERVICE_REQ_S10_SYS_INFO": {"tagvalue": 0xFA000001, "type": "Int64"},
-    "TAG_DB_SERVICE_REQ_SET_S10_SYS_INFO": {
-        "tagvalue": 0xFA000002,
-        "type": "Container",
-    },
-    "TAG_DB_SERVICE_NOTIFY_REGISTERED": {"tagvalue": 0xFA000003, "type": "Int32"},
-    "TAG_DB_SERVICE_REQ_SET_RELEASE_LATEST": {"tagvalue": 0xFA000004, "type": "Int64"},
-    "TAG_DB_SERVICE_REQ_SYNC_CONFIG_TO_TARGET": {
-        "tagvalue": 0xFA000005,
-        "type": "None",
-    },
-    "TAG_DB_SERVICE_PARAM_SERIALNO": {"tagvalue": 0xFA00B001, "type": "Int64"},
-    "TAG_DB_SERVICE_PARAM_TIMESTAMP_INIT_CHECK": {
-        "tagvalue": 0xFA00B002,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_TIMESTAMP_FIRST_ONLINE": {
-        "tagvalue": 0xFA00B003,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_TIMESTAMP_INSTALL_DATE": {
-        "tagvalue": 0xFA00B004,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_SW_RELEASE": {"tagvalue": 0xFA00B005, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_ACC_KEY_STATUS": {"tagvalue": 0xFA00B006, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_DEVICE_TYPE": {"tagvalue": 0xFA00B007, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_COUPLING_MODE": {"tagvalue": 0xFA00B008, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_TUNNEL_PORT": {"tagvalue": 0xFA00B009, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_SW_UPDATE_DISABLED": {
-        "tagvalue": 0xFA00B010,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_HW_UPDATE_DISABLED": {
-        "tagvalue": 0xFA00B011,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_COMMENT": {"tagvalue": 0xFA00B012, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_LAST_UPDATE": {"tagvalue": 0xFA00B013, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_HIDE_FROM_DL": {"tagvalue": 0xFA00B014, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_ERR_CODE": {"tagvalue": 0xFA00B015, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_TIMESTAMP_LAST_ONLINE": {
-        "tagvalue": 0xFA00B016,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_REPORTED_SW_RELEASE": {
-        "tagvalue": 0xFA00B017,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_REPORTED_SW_RELEASE_DATE": {
-        "tagvalue": 0xFA00B018,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_SW_UPDATE_LAST_CONNECT": {
-        "tagvalue": 0xFA00B019,
-        "type": "CString",
-    },
-    "TAG_DB_SERVICE_PARAM_UPDATE_PLATFORM": {"tagvalue": 0xFA00B01A, "type": "CString"},
-    "TAG_DB_SERVICE_PARAM_HIDDEN": {"tagvalue": 0xFA00B01B, "type": "None"},
-    "TAG_DB_SERVICE_REQ_REMOVABLE_DEVICES": {"tagvalue": 0xFA00C001, "type": "Int64"},
-    "TAG_DB_SERVICE_REMOVABLE_DEVICE_NAME": {"tagvalue": 0xFA00C002, "type": "CString"},
-    "TAG_DB_SERVICE_REQ_REMOVE_DEVICE": {"tagvalue": 0xFA00C003, "type": "CString"},
-    "TAG_DB_SERVICE_REQ_TABLE_DATA": {"tagvalue": 0xFA00D001, "type": "Container"},
-    "TAG_DB_SERVICE_TABLE_NAME": {"tagvalue": 0xFA00D002, "type": "CString"},
-    "TAG_DB_SERVICE_TABLE_MAX_COLUMNS": {"tagvalue": 0xFA00D003, "type": "Int32"},
-    "TAG_DB_SERVICE_TABLE_INCLUDE_METADATA": {"tagvalue": 0xFA00D004, "type": "Bool"},
-    "TAG_DB_SERVICE_TABLE_COLUMNS": {"tagvalue": 0xFA00D005, "type": "Container"},
-    "TAG_DB_SERVICE_TABLE_COLUMN": {"tagvalue": 0xFA00D006, "type": "Container"},
-    "TAG_DB_SERVICE_TABLE_COLUMN_NAME": {"tagvalue": 0xFA00D007, "type": "CString"},
-    "TAG_DB_SERVICE_TABLE_COLUMN_TYPE": {"tagvalue": 0xFA00D008, "type": "Char8"},
-    "TAG_DB_SERVICE_TABLE_DATA_ROWS": {"tagvalue": 0xFA00D009, "type": "Int32"},
-    "TAG_DB_SERVICE_TABLE_DATA_CONTENT": {"tagvalue": 0xFA00D00A, "type": "ByteArray"},
-    "TAG_DB_SERVICE_REQ_RESYNC": {"tagvalue": 0xFA00E001, "type": "Container"},
-    "TAG_DB_SERVICE_RESYNC_FROM": {"tagvalue": 0xFA00E002, "type": "Int64"},
-    "TAG_DB_SERVICE_REQ_SYNC_CONFIG_PROPERTIES": {
-        "tagvalue": 0xFA00E003,
-        "type": "ByteArray",
-    },
-    "TAG_DB_SERVICE_PARAM_FARM_SERIAL": {"tagvalue": 0xFA400001, "type": "CString"},
-    "TAG_DB_SERVICE_S10_SYS_INFO": {"tagvalue": 0xFA800001, "type": "Container"},
-    "TAG_DB_SERVICE_SET_S10_SYS_INFO": {"tagvalue": 0xFA800002, "type": "Container"},
-    "TAG_DB_SERVICE_SET_RELEASE_LATEST": {"tagvalue": 0xFA800004, "type": "Bool"},
-    "TAG_DB_SERVICE_SYNC_CONFIG_TO_TARGET": {"tagvalue": 0xFA800005, "type": "Bool"},
-    "TAG_DB_SERVICE_REMOVABLE_DEVICES": {"tagvalue": 0xFA80C001, "type": "Container"},
-    "TAG_DB_SERVICE_REMOVE_DEVICE": {"tagvalue": 0xFA80C003, "type": "CString"},
-    "TAG_DB_SERVICE_TABLE_DATA": {"tagvalue": 0xFA80D001, "type": "Container"},
-    "TAG_DB_SERVICE_RESYNC": {"tagvalue": 0xFA80E001, "type": "None"},
-    "TAG_DB_RECOVERY_FINISH": {"tagvalue": 0xFB000000, "type": "Char8"},
-    "TAG_DB_RECOVERY_REQ_RECOVERY": {"tagvalue": 0xFB000001, "type": "Container"},
-    "TAG_DB_RECOVERY_SOURCE": {"tagvalue": 0xFB000002, "type": "Uint64"},
-    "TAG_DB_RECOVERY_TARGET": {"tagvalue": 0xFB000003, "type": "Uint64"},
-    "TAG_DB_RECOVERY_RECOVERY": {"tagvalue": 0xFB000004, "type": "Bool"},
-    "TAG_DB_RECOVERY_ERROR": {"tagvalue": 0xFB000005, "type": "CString"},
-    "TAG_DB_RECOVERY_LOG": {"tagvalue": 0xFB000006, "type": "CString"},
-    "TAG_DB_RECOVERY_REQ_RECOVERY_CONFIRM": {"tagvalue": 0xFB000007, "type": "None"},
-    "TAG_DB_RECOVERY_RECOVERY_CONFIRM": {"tagvalue": 0xFB000008, "type": "None"},
-    "TAG_DB_RECOVERY_REQ_RECOVERY_CANCEL": {"tagvalue": 0xFB000009, "type": "None"},
-    "TAG_DB_RECOVERY_REQ_CANDIDATE_LIST": {"tagvalue": 0xFB00000A, "type": "Container"},
-    "TAG_DB_RECOVERY_REQ_STATUS": {"tagvalue": 0xFB00000B, "type": "None"},
-    "TAG_DB_RECOVERY_REQ_FINISH": {"tagvalue": 0xFB00000C, "type": "None"},
-    "TAG_DB_RECOVERY_RECOVERY_CANCEL": {"tagvalue": 0xFB000010, "type": "Bool"},
-    "TAG_DB_RECOVERY_PARAM_USER": {"tagvalue": 0xFB400001, "type": "CString"},
-    "TAG_DB_RECOVERY_PARAM_PASSWORD": {"tagvalue": 0xFB400002, "type": "CString"},
-    "TAG_DB_RECOVERY_PARAM_CANDIDATE_SERIAL": {
-        "tagvalue": 0xFB400003,
-        "type": "CString",
-    },
-    "TAG_DB_RECOVERY_STATUS": {"tagvalue": 0xFB400004, "type": "CString"},
-    "TAG_DB_RECOVERY_PARAM_ID": {"tagvalue": 0xFB400005, "type": "CString"},
-    "TAG_DB_RECOVERY_CANDIDATE_LIST": {"tagvalue": 0xFB80000A, "type": "Container"},
-}
+"""Lookup of the RSCP tags by name and by code.
+
+The tags are read from the binary tag database (see RscpTagDatabase), which is built
+from the modules of the tags package. The (tag name, tag description) of a tag is
+created on its first lookup and shared afterwards, so the description is a read-only
+mapping. The complete table rscpTags and the index rscpTagsByCode are built on first
+access for compatibility.
+"""
+
+from __future__ import annotations
+
+import logging
+from types import MappingProxyType
+
+from .RscpTagDatabase import DATABASE_PATH, RscpTagDatabase, build_database
+from .tags import NAMESPACES, load_tags
+
+log = logging.getLogger(__name__)
+
+__all__ = [
+    "NAMESPACES",
+    "findTagValue",
+    "getTagByCode",
+    "getTagByName",
+    "getTagsByPrefix",
+    "rscpTags",
+    "rscpTagsByCode",
+]
+
+
+def _load_database() -> RscpTagDatabase:
+    try:
+        return RscpTagDatabase.load()
+    except (OSError, ValueError) as e:
+        log.warning("Building the tag database, %s can't be used: %s", DATABASE_PATH, e)
+        return RscpTagDatabase(build_database(load_tags()))
+
+
+_database = _load_database()
+
+# database index -> (tag name, tag description), created on first lookup
+_tagsByIndex = [None] * len(_database)
+# caches of the lookups, tag code / tag name -> (tag name, tag description)
+_tagsByCode = {}
+_tagsByName = {}
+
+
+def _tag(index: int) -> tuple[str, MappingProxyType]:
+    tag = _tagsByIndex[index]
+    if tag is None:
+        tag = (_database.name(index), MappingProxyType(_database.description(index)))
+        _tagsByIndex[index] = tag
+    return tag
+
+
+def getTagByCode(tag_code: int) -> tuple[str, MappingProxyType] | None:
+    """Returns (tag name, tag description) for a tag code, or None if the code is unknown.
+
+    Codes defined twice (e.g. TAG_SE_PARAM_INDEX) return the first definition.
+    """
+    tag = _tagsByCode.get(tag_code)
+    if tag is None:
+        index = _database.find_code(tag_code)
+        if index is None:
+            return None
+        tag = _tagsByCode[tag_code] = _tag(index)
+    return tag
+
+
+def getTagByName(tag_name: str) -> tuple[str, MappingProxyType] | None:
+    """Returns (tag name, tag description) for a tag name, or None if the name is unknown."""
+    tag = _tagsByName.get(tag_name)
+    if tag is None:
+        index = _database.find_name(tag_name)
+        if index is None:
+            return None
+        tag = _tagsByName[tag_name] = _tag(index)
+    return tag
+
+
+def getTagsByPrefix(prefix: str) -> dict[str, MappingProxyType]:
+    """Returns tag name -> tag description of all tags starting with prefix, e.g. TAG_EMS_."""
+    return dict(_tag(index) for index in _database.find_prefix(prefix))
 
 
 def findTagValue(searchValue: int):
-    for key, value in rscpTags.items():
-        if value["tagvalue"] == searchValue:
-            return {key: value}
-    return None
+    tag = getTagByCode(searchValue)
+    if tag is None:
+        return None
+    return {tag[0]: tag[1]}
+
+
+def __getattr__(name: str):
+    # the complete tables are built on first access and stay module attributes
+    if name == "rscpTags":
+        # sorted by code, duplicated codes in the order of definition
+        value = dict(_tag(index) for index in range(len(_database)))
+    elif name == "rscpTagsByCode":
+        # reverse index of all tags: tag code -> (tag name, tag description)
+        index = {}
+        for x in range(len(_database)):
+            index.setdefault(_database.code(x), _tag(x))
+        value = MappingProxyType(index)
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    globals()[name] = value
+    return value
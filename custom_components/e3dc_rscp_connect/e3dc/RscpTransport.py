@@ -0,0 +1,163 @@
+import asyncio
+from abc import ABC, abstractmethod
+import logging
+import socket
+
+log = logging.getLogger(__name__)
+
+# TCP keepalive as (idle seconds before the first probe, seconds between the probes,
+# number of probes), a dead peer is noticed after idle + interval * count seconds
+KEEPALIVE = (10, 5, 3)
+
+
+def set_keepalive(sock, idle: int, interval: int, count: int) -> None:
+    "Enables TCP keepalive on sock, options unknown on the platform are skipped."
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+    # TCP_KEEPALIVE is the name of TCP_KEEPIDLE on macOS
+    idle_option = getattr(
+        socket, "TCP_KEEPIDLE", getattr(socket, "TCP_KEEPALIVE", None)
+    )
+    for option, value in (
+        (idle_option, idle),
+        (getattr(socket, "TCP_KEEPINTVL", None), interval),
+        (getattr(socket, "TCP_KEEPCNT", None), count),
+    ):
+        if option is not None:
+            sock.setsockopt(socket.IPPROTO_TCP, option, value)
+
+
+class RscpTransport(ABC):
+    """The byte stream used by a RscpConnection.
+
+    Errors are raised as OSError (or subclasses), timeouts are handled by the connection.
+    """
+
+    @abstractmethod
+    async def open(self, host: str, port: int) -> None:
+        """Opens the connection to the device."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Closes the connection, it can be opened again afterwards."""
+
+    @abstractmethod
+    def is_open(self) -> bool:
+        """Returns True if the connection is open."""
+
+    @abstractmethod
+    async def write(self, data: bytes) -> None:
+        """Writes data to the device."""
+
+    @abstractmethod
+    async def read(self) -> bytes:
+        """Reads the next received data, an empty result means the peer closed the connection."""
+
+
+class RscpSocketTransport(RscpTransport):
+    """Transport using a non-blocking socket with the sock_* functions of the event loop.
+
+    Every read is a separate recv call of at most read_size bytes. keepalive are the
+    TCP keepalive settings, see KEEPALIVE, None disables keepalive.
+    """
+
+    def __init__(
+        self,
+        read_size: int = 4096,
+        keepalive: tuple[int, int, int] | None = KEEPALIVE,
+    ):
+        self.__socket = None
+        self.__read_size = read_size
+        self.__keepalive = keepalive
+
+    async def open(self, host: str, port: int) -> None:
+        client_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+        client_socket.setblocking(False)
+        try:
+            await asyncio.get_running_loop().sock_connect(client_socket, (host, port))
+            if self.__keepalive is not None:
+                set_keepalive(client_socket, *self.__keepalive)
+        except BaseException:
+            client_socket.close()
+            raise
+        self.__socket = client_socket
+
+    def close(self) -> None:
+        if self.__socket is not None:
+            self.__socket.close()
+            self.__socket = None
+
+    def is_open(self) -> bool:
+        return self.__socket is not None
+
+    async def write(self, data: bytes) -> None:
+        await asyncio.get_running_loop().sock_sendall(self.__socket, data)
+
+    async def read(self) -> bytes:
+        return await asyncio.get_running_loop().sock_recv(
+            self.__socket, self.__read_size
+        )
+
+
+class RscpStreamTransport(RscpTransport):
+    """Transport using asyncio streams, which are buffered by the event loop.
+
+    The event loop reads all available data with a single call and wakes up the
+    connection only once per chunk. Backpressure is applied in both directions:
+    write waits while more than write_limit bytes are queued for sending, and the
+    event loop pauses reading from the socket while more than twice read_limit bytes
+    are buffered but not yet read. keepalive are the TCP keepalive settings, see
+    KEEPALIVE, None disables keepalive.
+    """
+
+    def __init__(
+        self,
+        read_limit: int = 2**16,
+        write_limit: int = 2**16,
+        keepalive: tuple[int, int, int] | None = KEEPALIVE,
+    ):
+        self.__reader: asyncio.StreamReader | None = None
+        self.__writer: asyncio.StreamWriter | None = None
+        self.__read_limit = read_limit
+        self.__write_limit = write_limit
+        self.__keepalive = keepalive
+
+    async def open(self, host: str, port: int) -> None:
+        self.__reader, self.__writer = await asyncio.open_connection(
+            host, port, limit=self.__read_limit
+        )
+        self.__writer.transport.set_write_buffer_limits(high=self.__write_limit)
+        if self.__keepalive is not None:
+            set_keepalive(self.__writer.get_extra_info("socket"), *self.__keepalive)
+
+    def close(self) -> None:
+        if self.__writer is not None:
+            self.__writer.close()
+            self.__reader = None
+            self.__writer = None
+
+    def is_open(self) -> bool:
+        return self.__writer is not None
+
+    @property
+    def write_buffer_size(self) -> int:
+        "Number of bytes queued for sending."
+        if self.__writer is None:
+            return 0
+        return self.__writer.transport.get_write_buffer_size()
+
+    @property
+    def write_limit(self) -> int:
+        "write waits while more bytes than this are queued for sending."
+        return self.__write_limit
+
+    @property
+    def read_limit(self) -> int:
+        "Maximum number of bytes returned by read, receiving pauses at twice this size."
+        return self.__read_limit
+
+    async def write(self, data: bytes) -> None:
+        self.__writer.write(data)
+        await self.__writer.drain()
+
+    async def read(self) -> bytes:
+        return await self.__reader.read(self.__read_limit)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
+from array import array
 import logging
-import re
 import struct
+from types import MappingProxyType
+from typing import NamedTuple
 
-from . import RscpTags
+from . import RscpTagCodes, RscpTags
+from .RscpPathQuery import compile_path
 
 log_error_tags = False
 
@@ -58,6 +61,55 @@ RscpTypes = {
     },  # this is the correct error value!
 }
 
+
+class RscpTypeCodec(NamedTuple):
+    """Precompiled structs to encode and decode a RSCP data type.
+
+    data packs the data of fixed width types, value packs header and data in one go.
+    Both are None for types without data or with a variable data length.
+    """
+
+    name: str
+    identifier: int
+    variable_length: bool
+    data: struct.Struct | None
+    value: struct.Struct | None
+
+
+def _create_codec(rscp_type: dict) -> RscpTypeCodec:
+    fmt = rscp_type["fmt"]
+    data = value = None
+    if fmt not in ("", "s"):
+        data = struct.Struct(f"<{fmt}")
+        value = struct.Struct(f"<IBH{fmt}")
+    return RscpTypeCodec(
+        rscp_type["name"],
+        rscp_type["identifier"],
+        rscp_type.get("variable_length", False),
+        data,
+        value,
+    )
+
+
+_codecsByName = {name: _create_codec(x) for name, x in RscpTypes.items()}
+
+# codecs by the type identifier used in the value header
+RscpTypeCodecs = MappingProxyType(
+    {x.identifier: x for x in _codecsByName.values() if x.identifier != 0xFF}
+)
+# both error types use identifier 0xFF, they can only be distinguished by their length
+RscpErrorCodecs = MappingProxyType(
+    {x.data.size: x for x in (_codecsByName["Error8"], _codecsByName["Error32"])}
+)
+
+_VALUE_HEADER = struct.Struct("<IBH")
+_EMPTY_VALUE_HEADER = bytes(_VALUE_HEADER.size)
+_CONTAINER = RscpTypeCodecs[0x0E]
+_CSTRING = RscpTypeCodecs[0x0D]
+_INT32 = RscpTypeCodecs[0x06]
+
+_TAG_RSCP_AUTHENTICATION = RscpTagCodes.TAG_RSCP_AUTHENTICATION
+
 log = logging.getLogger(__name__)
 log.setLevel(logging.DEBUG)
 
@@ -69,66 +121,58 @@ class RscpValue:
 
     rscpValueHeaderFmt = "IBH"
 
+    # replies can contain thousands of values, slots keep them small
+    __slots__ = (
+        "__tag",
+        "__tag_code",
+        "__codec",
+        "__value",
+        "__packed_size",
+        "__child_offsets",
+        "__buffer",
+        "isError",
+    )
+
+    def __init__(self):
+        # size of the value in frame format, known for decoded values only
+        self.__packed_size = None
+        # offset and tag code of each child of a lazy container which is not decoded yet
+        self.__child_offsets = None
+        self.isError = False
+
     @classmethod
     def getDataLength(self, buffer):
         return self.readHeader(buffer)[0]
 
     @classmethod
-    def readHeader(self, buffer):
-        header_size = self.getHeaderSize()
-        tag_code, type, data_length = struct.unpack(
-            "<{}".format(self.rscpValueHeaderFmt), buffer[0:header_size]
-        )
+    def readHeader(self, buffer, offset: int = 0):
+        tag_code, type, data_length = _VALUE_HEADER.unpack_from(buffer, offset)
         return tag_code, type, data_length
 
     @classmethod
     def getHeaderSize(self):
-        return struct.calcsize(f"<{self.rscpValueHeaderFmt}")
+        return _VALUE_HEADER.size
 
     @staticmethod
-    def construct_rscp_value(tag_name, value) -> RscpValue:
-        """Helper function to construct a rscp container value from nested lists."""
+    def construct_rscp_value(tag: str | int, value) -> RscpValue:
+        """Helper function to construct a rscp container value from nested lists.
+
+        Tags can be given by name or by code.
+        """
         if isinstance(value, list):
-            rscp_value = []
-            for _value in value:
-                rscp_value.append(RscpValue.construct_rscp_value(_value[0], _value[1]))
-            return RscpValue().withTagName(tag_name, rscp_value)
+            value = [RscpValue.construct_rscp_value(x[0], x[1]) for x in value]
 
-        return RscpValue().withTagName(tag_name, value)
+        if isinstance(tag, int):
+            return RscpValue().withTagCode(tag, value)
+        return RscpValue().withTagName(tag, value)
 
     @staticmethod
     def get_RscpValue_by_filter(_values, filter_string):
-        # check if filter_string contains a tag, filtered by a subtag, eg. TAG_PVI_DATA(TAG_PVI_INDEX==0)
-        log.debug("filtering for %s", filter_string)
-        _re = re.compile(r"(.*)\((.*)==(.*)\)")
-        match = _re.findall(filter_string)
-        if match:
-            interested_tag, filter_tag, filter_value = match[0]
-            log.debug(
-                "searching for %s, %s, %s", interested_tag, filter_tag, filter_value
-            )
-            for x in _values:
-                log.debug(
-                    f"searching tag name {interested_tag}, current:{x.getTagName()} "
-                )
-                if x.getTagName() == interested_tag:
-                    log.debug(f"found matching tag: {x.getTagName()}")
-                    for y in x.getValue():
-                        log.debug(
-                            f"searching filter tag: {filter_tag}, current: {y.getTagName()}"
-                        )
-                        if (
-                            y.getTagName() == filter_tag
-                            and str(y.getValue()) == filter_value
-                        ):
-                            log.debug("found filter tag, with matching value!")
-                            return x
-        else:
-            if isinstance(_values, list):
-                for x in _values:
-                    if x.getTagName() == filter_string:
-                        return x
-        return None
+        """Returns the first value in _values which matches a single path segment.
+
+        See get_tag_by_path for the format of filter_string.
+        """
+        return RscpValue.get_tag_by_path(_values, filter_string)
 
     @staticmethod
     def get_tag_by_path(_value, filter_string_complete) -> RscpValue:
@@ -142,219 +186,296 @@ class RscpValue:
         TAG_1(TAG_INDEX==3)/TAG_2(TAG_INDEX==1)/TAG_3": The path can also be chained! This example will return
             TAG_3 which is a container named TAG_2 which contains also a TAG_INDEX with value 1 and is in a container
             TAG_1 which also contains a TAG_INDEX tag with value 3.
+
+        Filter values are compared typed, 1 matches 1.0 and True. The path is compiled
+        once and cached, see RscpPathQuery. Paths with unknown tags are never found.
         """
-        searched_rscp_value = None
-        splitted_filter_string = filter_string_complete.split("/")
-        search_values = _value
-        for x, filter_string in enumerate(splitted_filter_string):
-            found_tag = RscpValue.get_RscpValue_by_filter(search_values, filter_string)
-            if found_tag:
-                if x == len(splitted_filter_string) - 1:
-                    searched_rscp_value = found_tag
-                    break
-                search_values = found_tag.getValue()
-
-        return searched_rscp_value
+        try:
+            query = compile_path(filter_string_complete)
+        except ValueError as e:
+            log.debug("%s", e)
+            return None
+        return query.find(_value)
 
     def withTagName(self, tagname, value):
-        self.__tagname = tagname
+        tag = RscpTags.getTagByName(tagname)
+        if tag is None:
+            raise KeyError(tagname)
+        self.__tag = tag
+        self.__tag_code = self.__tag[1]["tagvalue"]
+        self.__value = value
+        self.__codec = _codecsByName[self.__tag[1]["type"]]
+        self.__packed_size = None
+        return self
+
+    def withTagCode(self, tag_code: int, value):
+        tag = RscpTags.getTagByCode(tag_code)
+        if tag is None:
+            raise KeyError(f"Tag 0x{tag_code:08X} not found!")
+        self.__tag = tag
+        self.__tag_code = tag[1]["tagvalue"]
         self.__value = value
-        self.__tag_description = RscpTags.rscpTags[tagname]
-        self.__type = self.__tag_description["type"]
+        self.__codec = _codecsByName[tag[1]["type"]]
+        self.__packed_size = None
         return self
 
-    def withBuffer(self, buffer):
-        self.unpack(buffer)
+    def withBuffer(self, buffer, offset: int = 0, lazy: bool = False):
+        self.unpack(buffer, offset, lazy)
         return self
 
     def getTagName(self):
-        return self.__tagname
+        return self.__tag[0]
+
+    def getTagCode(self) -> int:
+        return self.__tag_code
 
-    def isTag(self, tagname):
-        return self.__tagname == tagname
+    def isTag(self, tag: str | int):
+        "Checks the tag by code (see RscpTagCodes) or by name."
+        if tag.__class__ is int:
+            return self.__tag_code == tag
+        return self.__tag[0] == tag
 
     def is_container(self):
         "Returns true if this RscpValue is a container."
-        return self.__type == "Container"
+        return self.__codec is _CONTAINER
 
-    def has_child_tag(self, tag_name: str) -> bool:
-        "Checks if this tag has a child of name tag_name."
-        if self.__type != "Container":
+    def has_child_tag(self, tag: str | int) -> bool:
+        "Checks if this tag has a child with the tag code or name tag."
+        if self.__codec is not _CONTAINER:
             return False
 
-        return any(x.isTag(tag_name) for x in self.getValue())
+        return self.get_child(tag) is not None
 
-    def get_child(self, tag_name) -> RscpValue | None:
-        "Returns the first found child of tag_name in the container!"
-        if not self.is_container():
+    def get_child(self, tag: str | int) -> RscpValue | None:
+        "Returns the first found child with the tag code or name tag in the container!"
+        if self.__codec is not _CONTAINER:
             return None
 
-        for x in self.getValue():
-            if x.isTag(tag_name):
-                return x
+        for x in self.__findChilds(tag):
+            return x
         return None
 
-    def get_childs(self, tag_name) -> list[RscpValue]:
-        "Returns all found childs of tag_name in the container!"
-        if not self.is_container():
+    def get_childs(self, tag: str | int) -> list[RscpValue]:
+        "Returns all found childs with the tag code or name tag in the container!"
+        if self.__codec is not _CONTAINER:
             return []
 
-        return [x for x in self.getValue() if x.isTag(tag_name)]
+        return list(self.__findChilds(tag))
+
+    def get_child_tag_codes(self) -> list[int]:
+        "Returns the tag codes of the childs of a container, lazy childs aren't decoded."
+        if self.__codec is not _CONTAINER:
+            return []
+        if self.__child_offsets is not None:
+            return self.__child_offsets[1::2].tolist()
+        return [x.__tag_code for x in self.__value]
 
     def getValue(self):
+        if self.__child_offsets is not None:
+            # decode the remaining childs of a lazy container
+            self.__value = [
+                self.__lazyChild(index) for index in range(len(self.__value))
+            ]
+            self.__child_offsets = None
+            self.__buffer = None
         return self.__value
 
+    def __lazyChild(self, index: int) -> RscpValue:
+        child = self.__value[index]
+        if child is None:
+            child = RscpValue().withBuffer(
+                self.__buffer, self.__child_offsets[2 * index], lazy=True
+            )
+            self.__value[index] = child
+        return child
+
+    def __findChilds(self, tag: str | int):
+        "Yields the childs with the tag code or name tag, childs of lazy containers are decoded."
+        tag_name = None
+        if tag.__class__ is not int:
+            tag_name = tag
+            tag = RscpTags.getTagByName(tag_name)
+            if tag is None:
+                return
+            tag = tag[1]["tagvalue"]
+
+        if self.__child_offsets is None:
+            childs = (x for x in self.__value if x.__tag_code == tag)
+        else:
+            childs = (
+                self.__lazyChild(index)
+                for index, child_code in enumerate(self.__child_offsets[1::2])
+                if child_code == tag
+            )
+
+        for child in childs:
+            # codes defined twice are decoded with the name of the first definition
+            if tag_name is None or child.__tag[0] == tag_name:
+                yield child
+
     def getPackedDataSize(self) -> int:
-        """will return the length the data would have if it is packed to frame format"""
+        """will return the length the data would have if it is packed to frame format
+
+        For decoded values this is the length consumed in the received buffer, which is
+        known from the header and returned without walking through nested containers.
+        """
+        if self.__packed_size is not None:
+            return self.__packed_size
 
-        header_size = self.getHeaderSize()
-        data_size = 0
-        if self.__type == "Container":
+        codec = self.__codec
+        if codec is _CONTAINER:
             # container needs special handling, because it has nested RscpValues!
-            for x in self.__value:
-                data_size += x.getPackedDataSize()
+            data_size = sum(x.getPackedDataSize() for x in self.getValue())
+        elif codec is _CSTRING:
+            data_size = len(self.__value.encode())
+        elif codec.variable_length:
+            data_size = len(self.__value)
+        elif codec.data is not None:
+            data_size = codec.data.size
         else:
-            data_fmt = RscpTypes[self.__type]["fmt"]
-            if data_fmt == "s":
-                # if the data format is a string, we need to calculate the string length
-                data_fmt = f"{len(self.__value)}s"
-            data_size = struct.calcsize(data_fmt)
+            data_size = 0
 
-        return header_size + data_size
+        return _VALUE_HEADER.size + data_size
 
     def pack(self) -> bytes:
         """packs the data to raw bytes so that it can be transferred over the line"""
-        tag_type = RscpTypes[self.__tag_description["type"]]
-        type_identifier = tag_type["identifier"]
-        type_name = tag_type["name"]
-        tag_code = self.__tag_description["tagvalue"]
-
-        data_fmt = tag_type["fmt"]
-        if data_fmt == "":
-            data_length = 0
-            data = tag_code, type_identifier, data_length
-        elif data_fmt == "s":
-            if type_name == "CString":
-                data_length = len(self.__value)
-                data_fmt = "{}s".format(data_length)
-                data = tag_code, type_identifier, data_length, self.__value.encode()
-            elif type_name == "Container":
-                if not isinstance(self.__value, list):
-                    raise ValueError("container requires list of RscpValues as value")
-
-                containerdata = b""
-                for value in self.__value:
-                    data = value.pack()
-                    containerdata += data
-
-                data_length = len(containerdata)
-                data_fmt = "{}s".format(data_length)
-                data = tag_code, type_identifier, data_length, containerdata
-            else:
-                raise NotImplementedError(f"{type_name} support not yet finished")
+        buffer = bytearray()
+        self.pack_into(buffer)
+        return bytes(buffer)
+
+    def pack_into(self, buffer: bytearray) -> None:
+        """packs the data and appends it to buffer.
+
+        Nested values are written directly into the same buffer, the length of a container
+        is patched into its header after all childs have been written.
+        """
+        codec = self.__codec
+        tag_code = self.__tag_code
+
+        if codec.value is not None:
+            buffer += codec.value.pack(
+                tag_code, codec.identifier, codec.data.size, self.__value
+            )
+        elif codec is _CONTAINER:
+            values = self.getValue()
+            if not isinstance(values, list):
+                raise ValueError("container requires list of RscpValues as value")
+
+            header_position = len(buffer)
+            buffer += _EMPTY_VALUE_HEADER
+            for value in values:
+                value.pack_into(buffer)
+
+            data_length = len(buffer) - header_position - _VALUE_HEADER.size
+            _VALUE_HEADER.pack_into(
+                buffer, header_position, tag_code, codec.identifier, data_length
+            )
+        elif codec is _CSTRING:
+            data = self.__value.encode()
+            buffer += _VALUE_HEADER.pack(tag_code, codec.identifier, len(data))
+            buffer += data
+        elif not codec.variable_length:
+            buffer += _VALUE_HEADER.pack(tag_code, codec.identifier, 0)
         else:
-            data_length = struct.calcsize(data_fmt)
-            data = tag_code, type_identifier, data_length, self.__value
+            raise NotImplementedError(f"{codec.name} support not yet finished")
+
+    def unpack(self, buffer, offset: int = 0, lazy: bool = False):
+        """unpacks a raw bytes stream and constructs an RscpValue
 
-        # concat value header fmt and data fmt
-        fmt = "<{}{}".format(self.rscpValueHeaderFmt, data_fmt)
-        return struct.pack(fmt, *data)
+        The value is read at offset. The buffer is accessed through a memoryview, so
+        neither the buffer nor the data of nested containers is copied while decoding.
+
+        If lazy is set, only the headers of the childs of a container are scanned. A child
+        is decoded when it is accessed by get_child, get_childs or getValue, the buffer
+        is kept until all childs have been decoded.
+        """
+        if not isinstance(buffer, memoryview):
+            buffer = memoryview(buffer)
 
-    def unpack(self, buffer):
-        """unpacks a raw bytes stream and constructs an RscpValue"""
         self.isError = False
 
-        header_size = struct.calcsize(self.rscpValueHeaderFmt)
-        tag_code, type, data_length = self.readHeader(buffer)
+        tag_code, type, data_length = _VALUE_HEADER.unpack_from(buffer, offset)
+        data_position = offset + _VALUE_HEADER.size
+        self.__packed_size = _VALUE_HEADER.size + data_length
 
-        tag = RscpTags.findTagValue(tag_code)
+        tag = RscpTags.getTagByCode(tag_code)
         if tag is None:
             raise ValueError(f"Tag 0x{tag_code:08X} not found!")
 
-        self.__tagname = list(tag.keys())[0]
-        self.__tag_description = tag[self.__tagname]
+        self.__tag = tag
+        tag_description = tag[1]
+        # share the int of the tag table instead of keeping one per value
+        self.__tag_code = tag_description["tagvalue"]
 
         if type == 0xFF:
             # special error type handling
-            if data_length == 1:
-                self.__type = "Error8"
-            elif data_length == 4:
-                self.__type = "Error32"
-            else:
+            codec = RscpErrorCodecs.get(data_length)
+            if codec is None:
                 raise ValueError(f"unknown length ({data_length}) of error tag!")
             if log_error_tags:
-                log.error(f"received ERROR Tag: {tag_code:08X} {self.__tagname}!")
-            expected_tag_type = RscpTypes[self.__type]
+                log.error(f"received ERROR Tag: {tag_code:08X} {tag[0]}!")
             self.isError = True
         else:
-            try:
-                expected_tag_type = RscpTypes[self.__tag_description["type"]]
-            except KeyError:
+            codec = RscpTypeCodecs.get(type)
+            if codec is None:
+                raise ValueError(f"received an unknown rscp type: 0x{type:02X}")
+            # special workaround for TAG_RSCP_AUTHENTICATION:
+            # if authentifaction fails, the level is send back as Int32 value
+            if (
+                codec.name != tag_description["type"]
+                and not tag_description.get("type_variable", False)
+                and not (tag_code == _TAG_RSCP_AUTHENTICATION and codec is _INT32)
+            ):
                 raise ValueError(
-                    f"received an unknown rscp type: {self.__tag_description['type']}"
+                    f"Data Type identifier not matching for tag: {tag[0]} (0x{tag_code:08X})! ({codec.name} != {tag_description['type']})"
                 )
 
-        # special workaround for TAG_RSCP_AUTHENTICATION:
-        # if authentifaction fails, the level is send back as Int32 value
-        if (
-            tag_code == RscpTags.rscpTags["TAG_RSCP_AUTHENTICATION"]["tagvalue"]
-            and type == 0x06
-        ):
-            expected_tag_type = RscpTypes["Int32"]
-
-        type_variable = self.__tag_description.get("type_variable", False)
-        if type_variable == False:
-            if type != expected_tag_type["identifier"]:
-                raise ValueError(
-                    f"Data Type identifier not matching for tag: {self.__tagname} (0x{tag_code:08X})! ({type} != {expected_tag_type['identifier']})"
+        self.__codec = codec
+        if codec.data is not None:
+            self.__value = codec.data.unpack_from(buffer, data_position)[0]
+        elif codec is _CONTAINER:
+            if lazy:
+                self.__child_offsets = self.__scanContainer(
+                    buffer, data_position, data_position + data_length
                 )
-        else:
-            # search correct expected format:
-            for key, value in RscpTypes.items():
-                if value["identifier"] == type:
-                    expected_tag_type = value
-
-        data_fmt = "{}".format(expected_tag_type["fmt"])
-        data_type_name = expected_tag_type["name"]
-        if data_fmt == "":
-            self.__value = None
-            return
-        elif data_fmt == "s":
-            if data_type_name == "CString":
-                data_fmt = f"{data_length}s"
-                # if data_length + header_size > len(buffer):
-                #    raise ValueError("corrupt datalength field!")
-            elif data_type_name == "Container":
-                self.__type = data_type_name
+                self.__value = [None] * (len(self.__child_offsets) // 2)
+                self.__buffer = buffer
+            else:
                 self.__value = self.__unpackContainer(
-                    buffer[header_size - 1 : header_size - 1 + data_length]
+                    buffer, data_position, data_position + data_length
                 )
-                return
-            else:
-                raise NotImplementedError(f"{data_type_name} support not yet finished")
+        elif codec is _CSTRING:
+            # if data_length + header_size > len(buffer):
+            #    raise ValueError("corrupt datalength field!")
+            self.__value = str(
+                buffer[data_position : data_position + data_length], "utf-8"
+            )
+        elif not codec.variable_length:
+            self.__value = None
         else:
-            # add endian
-            data_fmt = f"<{data_fmt}"
-
-        data_size = struct.calcsize(data_fmt)
-
-        self.__value = struct.unpack(
-            data_fmt, buffer[header_size - 1 : header_size - 1 + data_size]
-        )[0]
-
-        if data_type_name == "CString":
-            self.__value = self.__value.decode()
-
-        self.__type = data_type_name
+            raise NotImplementedError(f"{codec.name} support not yet finished")
 
         if self.isError and log_error_tags:
             log.error(f"Error Data {self.__value}")
 
-    def __unpackContainer(self, buffer):
+    @staticmethod
+    def __scanContainer(buffer: memoryview, start: int, end: int) -> array:
+        "Returns the offset and tag code of each child in one flat array."
+        child_offsets = array("I")
+        data_position = start
+        while data_position < end:
+            tag_code, _, data_length = _VALUE_HEADER.unpack_from(buffer, data_position)
+            child_offsets.append(data_position)
+            child_offsets.append(tag_code)
+            data_position += _VALUE_HEADER.size + data_length
+
+        return child_offsets
+
+    def __unpackContainer(self, buffer: memoryview, start: int, end: int):
         values = []
-        data_position = 0
-        while data_position < len(buffer):
-            value = RscpValue().withBuffer(buffer[data_position:])
+        data_position = start
+        while data_position < end:
+            value = RscpValue().withBuffer(buffer, data_position)
             values.append(value)
             data_position += value.getPackedDataSize()
 
@@ -362,21 +483,21 @@ class RscpValue:
 
     def toString(self, prefix=""):
         retVal: str = ""
-        if self.__type == "Container":
-            retVal = "{} {}: ==>>\n".format(prefix, self.__tagname)
+        if self.__codec is _CONTAINER:
+            retVal = "{} {}: ==>>\n".format(prefix, self.getTagName())
             prefix = "+" + prefix
-            for x in self.__value:
+            for x in self.getValue():
                 retVal += x.toString(prefix) + "\n"
             return retVal
 
-        retVal = "{} {}: {}".format(prefix, self.__tagname, self.__value)
+        retVal = "{} {}: {}".format(prefix, self.getTagName(), self.__value)
         return retVal
 
     def print(self):
-        if self.__type == "Container":
-            print(f"Container: {self.__tagname}")
-            for x in self.__value:
+        if self.__codec is _CONTAINER:
+            print(f"Container: {self.getTagName()}")
+            for x in self.getValue():
                 x.print()
             return
 
-        print("{}: {}".format(self.__tagname, self.__value))
+        print("{}: {}".format(self.getTagName(), self.__value))
@@ -0,0 +1,85 @@
+"""Definitions of the RSCP tags, one module per namespace.
+
+The modules are the source of the tag database rscp_tags.bin, see RscpTagDatabase.
+Lookups only read the database, the modules are imported to build it. After a change
+of a module, rebuild the database from the repository root with:
+
+    python -m custom_components.e3dc_rscp_connect.e3dc.tags
+"""
+
+import importlib
+from types import MappingProxyType
+
+# high byte of the tag code -> name prefix of the tags (TAG_<prefix>_...)
+NAMESPACES = MappingProxyType(
+    {
+        0x00: "RSCP",
+        0x01: "EMS",
+        0x02: "PVI",
+        0x03: "BAT",
+        0x04: "DCDC",
+        0x05: "PM",
+        0x06: "DB",
+        0x08: "SRV",
+        0x09: "HA",
+        0x0A: "INFO",
+        0x0B: "EP",
+        0x0C: "SYS",
+        0x0D: "UM",
+        0x0E: "WB",
+        0x0F: "PTDB",
+        0x10: "LED",
+        0x11: "DIAG",
+        0x12: "SGR",
+        0x13: "MBS",
+        0x14: "EH",
+        0x15: "UPNPC",
+        0x16: "KNX",
+        0x17: "EMSHB",
+        0x18: "MYPV",
+        0x19: "GPIO",
+        0x1A: "FARM",
+        0x1B: "SE",
+        0x1C: "QPI",
+        0x1D: "GAPP",
+        0x1E: "EMSPR",
+        0x1F: "IOBOX",
+        0x20: "WBD",
+        0x21: "REFU",
+        0x22: "OVP",
+        0x23: "NETWORK",
+        0x24: "WBAUTH",
+        0x25: "PLAY",
+        0x26: "GDI",
+        0x27: "SCM",
+        0x28: "EEBUS",
+        0x29: "SDSA",
+        0x2A: "ETH",
+        0x2B: "LCT",
+        0x2C: "HG",
+        0x2D: "OCPP",
+        0x2E: "WB",
+        0x2F: "LC",
+        0x30: "DASHBOARD",
+        0x31: "RD",
+        0x32: "SMGW",
+        0xFA: "DB",
+        0xFB: "DB",
+    }
+)
+
+
+def load_namespace(high_byte: int) -> dict:
+    "Imports the module of a namespace and returns tag name -> tag description."
+    module = importlib.import_module(
+        f".{NAMESPACES[high_byte].lower()}_{high_byte:02x}", __name__
+    )
+    return module.TAGS
+
+
+def load_tags() -> dict:
+    "Returns tag name -> tag description of all namespaces, in the order of definition."
+    tags = {}
+    for high_byte in NAMESPACES:
+        tags.update(load_namespace(high_byte))
+    return tags
@@ -0,0 +1,8 @@
+"Builds the tag database rscp_tags.bin from the modules of the tags package."
+
+from ..RscpTagDatabase import DATABASE_PATH, RscpTagDatabase, build_database
+from . import load_tags
+
+data = build_database(load_tags())
+DATABASE_PATH.write_bytes(data)
+print(f"{len(RscpTagDatabase(data))} tags, {len(data)} bytes: {DATABASE_PATH}")
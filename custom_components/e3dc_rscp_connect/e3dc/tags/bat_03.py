@@ -0,0 +1,234 @@
+"RSCP tags of the BAT namespace, tag codes 0x03xxxxxx."
+
+TAGS = {
+    "TAG_BAT_REQ_RSOC": {"tagvalue": 0x03000001, "type": "None"},
+    "TAG_BAT_REQ_MODULE_VOLTAGE": {"tagvalue": 0x03000002, "type": "None"},
+    "TAG_BAT_REQ_CURRENT": {"tagvalue": 0x03000003, "type": "None"},
+    "TAG_BAT_REQ_MAX_BAT_VOLTAGE": {"tagvalue": 0x03000004, "type": "None"},
+    "TAG_BAT_REQ_MAX_CHARGE_CURRENT": {"tagvalue": 0x03000005, "type": "None"},
+    "TAG_BAT_REQ_EOD_VOLTAGE": {"tagvalue": 0x03000006, "type": "None"},
+    "TAG_BAT_REQ_MAX_DISCHARGE_CURRENT": {"tagvalue": 0x03000007, "type": "None"},
+    "TAG_BAT_REQ_CHARGE_CYCLES": {"tagvalue": 0x03000008, "type": "None"},
+    "TAG_BAT_REQ_TERMINAL_VOLTAGE": {"tagvalue": 0x03000009, "type": "None"},
+    "TAG_BAT_REQ_STATUS_CODE": {"tagvalue": 0x0300000A, "type": "None"},
+    "TAG_BAT_REQ_ERROR_CODE": {"tagvalue": 0x0300000B, "type": "None"},
+    "TAG_BAT_REQ_DEVICE_NAME": {"tagvalue": 0x0300000C, "type": "None"},
+    "TAG_BAT_REQ_DCB_COUNT": {"tagvalue": 0x0300000D, "type": "None"},
+    "TAG_BAT_REQ_RSOC_REAL": {"tagvalue": 0x0300000E, "type": "None"},
+    "TAG_BAT_REQ_ASOC": {"tagvalue": 0x0300000F, "type": "None"},
+    "TAG_BAT_REQ_FCC": {"tagvalue": 0x03000010, "type": "None"},
+    "TAG_BAT_REQ_RC": {"tagvalue": 0x03000011, "type": "None"},
+    "TAG_BAT_REQ_MAX_DCB_CELL_CURRENT": {"tagvalue": 0x03000012, "type": "None"},
+    "TAG_BAT_REQ_MIN_DCB_CELL_CURRENT": {"tagvalue": 0x03000013, "type": "None"},
+    "TAG_BAT_REQ_MAX_DCB_CELL_VOLTAGE": {"tagvalue": 0x03000014, "type": "None"},
+    "TAG_BAT_REQ_MIN_DCB_CELL_VOLTAGE": {"tagvalue": 0x03000015, "type": "None"},
+    "TAG_BAT_REQ_MAX_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03000016, "type": "None"},
+    "TAG_BAT_REQ_MIN_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03000017, "type": "None"},
+    "TAG_BAT_REQ_DCB_ALL_CELL_TEMPERATURES": {"tagvalue": 0x03000018, "type": "UChar8"},
+    "TAG_BAT_REQ_DCB_ALL_CELL_VOLTAGES": {"tagvalue": 0x0300001A, "type": "UChar8"},
+    "TAG_BAT_REQ_OPEN_BREAKER": {"tagvalue": 0x0300001C, "type": "None"},
+    "TAG_BAT_REQ_OPEN_BREAKER_CONFIRM": {"tagvalue": 0x0300001D, "type": "None"},
+    "TAG_BAT_REQ_READY_FOR_SHUTDOWN": {"tagvalue": 0x0300001E, "type": "None"},
+    "TAG_BAT_REQ_FIRMWARE_VERSION": {"tagvalue": 0x0300001F, "type": "None"},
+    "TAG_BAT_REQ_INFO": {"tagvalue": 0x03000020, "type": "None"},
+    "TAG_BAT_REQ_TRAINING_MODE": {"tagvalue": 0x03000021, "type": "None"},
+    "TAG_BAT_REQ_UPDATE_STATUS": {"tagvalue": 0x03000022, "type": "None"},
+    "TAG_BAT_REQ_SET_TRAINING_MODE": {"tagvalue": 0x03000023, "type": "UChar8"},
+    "TAG_BAT_REQ_TIME_LAST_RESPONSE": {"tagvalue": 0x03000024, "type": "None"},
+    "TAG_BAT_REQ_MANUFACTURER_NAME": {"tagvalue": 0x03000025, "type": "None"},
+    "TAG_BAT_REQ_USABLE_CAPACITY": {"tagvalue": 0x03000026, "type": "None"},
+    "TAG_BAT_REQ_USABLE_REMAINING_CAPACITY": {"tagvalue": 0x03000027, "type": "None"},
+    "TAG_BAT_REQ_SET_A1_DATA": {"tagvalue": 0x03000028, "type": "Container"},
+    "TAG_BAT_REQ_SET_A1_MODE": {"tagvalue": 0x03000029, "type": "UChar8"},
+    "TAG_BAT_REQ_DELETE_DCB_TYPE": {"tagvalue": 0x0300002A, "type": "None"},
+    "TAG_BAT_REQ_DCB_TYPE": {"tagvalue": 0x0300002B, "type": "None"},
+    "TAG_BAT_REQ_PV_CHARGE_MODE": {"tagvalue": 0x0300002C, "type": "None"},
+    "TAG_BAT_REQ_SET_PV_CHARGE_MODE": {"tagvalue": 0x0300002D, "type": "Bool"},
+    "TAG_BAT_REQ_SET_A1_VOLTAGE": {"tagvalue": 0x03000030, "type": "Float32"},
+    "TAG_BAT_REQ_SET_A1_CURRENT": {"tagvalue": 0x03000031, "type": "Float32"},
+    "TAG_BAT_REQ_CONTROL_CODE": {"tagvalue": 0x03000032, "type": "None"},
+    "TAG_BAT_REQ_BPM_STATUS": {"tagvalue": 0x03000033, "type": "None"},
+    "TAG_BAT_REQ_DCB_ERROR_LIST": {"tagvalue": 0x03000034, "type": "None"},
+    "TAG_BAT_REQ_DCB_INFO": {"tagvalue": 0x03000042, "type": "Uint32"},
+    "TAG_BAT_REQ_SPECIFICATION": {"tagvalue": 0x03000043, "type": "Container"},
+    "TAG_BAT_REQ_INTERNALS": {"tagvalue": 0x03000044, "type": "Container"},
+    "TAG_BAT_REQ_DESIGN_CAPACITY": {"tagvalue": 0x03000045, "type": "None"},
+    "TAG_BAT_REQ_DESIGN_VOLTAGE": {"tagvalue": 0x03000046, "type": "None"},
+    "TAG_BAT_REQ_CHARGE_HIGH_TEMP": {"tagvalue": 0x03000047, "type": "None"},
+    "TAG_BAT_REQ_CHARGE_LOW_TEMP": {"tagvalue": 0x03000048, "type": "None"},
+    "TAG_BAT_REQ_MANUFACTURE_DATE": {"tagvalue": 0x03000049, "type": "None"},
+    "TAG_BAT_REQ_SERIALNO": {"tagvalue": 0x03000050, "type": "None"},
+    "TAG_BAT_REQ_DATA_TABLE_VERSION": {"tagvalue": 0x03000051, "type": "None"},
+    "TAG_BAT_REQ_PROTOCOL_VERSION": {"tagvalue": 0x03000052, "type": "None"},
+    "TAG_BAT_REQ_PCB_VERSION": {"tagvalue": 0x03000053, "type": "None"},
+    "TAG_BAT_REQ_TOTAL_USE_TIME": {"tagvalue": 0x03000054, "type": "None"},
+    "TAG_BAT_REQ_TOTAL_DISCHARGE_TIME": {"tagvalue": 0x03000055, "type": "None"},
+    "TAG_BAT_REQ_AVAILABLE_BATTERIES": {"tagvalue": 0x03000056, "type": "None"},
+    "TAG_BAT_REQ_OPEN_FET": {"tagvalue": 0x03000060, "type": "Bool"},
+    "TAG_BAT_REQ_FET_STATE": {"tagvalue": 0x03000061, "type": "None"},
+    "TAG_BAT_REQ_BATTERY_SOFT_ON": {"tagvalue": 0x03000062, "type": "None"},
+    "TAG_BAT_REQ_SET_BAT_VOLT_ADJUSTMENT": {
+        "tagvalue": 0x03000063,
+        "type": "Container",
+    },
+    "TAG_BAT_REQ_BAT_VOLT_ADJUSTMENT": {"tagvalue": 0x03000064, "type": "Container"},
+    "TAG_BAT_REQ_BAT_VOLT_ADJ_READY_INDEX": {"tagvalue": 0x03000065, "type": "None"},
+    "TAG_BAT_REQ_DISCHARGE_UNTIL_EMPTY_STATE": {"tagvalue": 0x03000092, "type": "None"},
+    "TAG_BAT_REQ_SET_DISCHARGE_UNTIL_EMPTY": {"tagvalue": 0x03000094, "type": "Int32"},
+    "TAG_BAT_REQ_CONTROL_STATE": {"tagvalue": 0x03000095, "type": "None"},
+    "TAG_BAT_REQ_INTERNAL_STATE": {"tagvalue": 0x03000096, "type": "None"},
+    "TAG_BAT_REQ_IS_BREAKER_OPEN": {"tagvalue": 0x03000097, "type": "None"},
+    "TAG_BAT_REQ_CLOSE_BREAKER": {"tagvalue": 0x03000098, "type": "None"},
+    "TAG_BAT_REQ_DATA": {"tagvalue": 0x03040000, "type": "Container"},
+    "TAG_BAT_INDEX": {"tagvalue": 0x03040001, "type": "UInt16"},
+    "TAG_BAT_REQ_DEVICE_STATE": {"tagvalue": 0x03060000, "type": "None"},
+    "TAG_BAT_PARAM_BAT_VOLT_STATUS": {"tagvalue": 0x03400001, "type": "Int32"},
+    "TAG_BAT_PARAM_BAT_VOLT_TARGET_VALUE": {"tagvalue": 0x03400002, "type": "Float32"},
+    "TAG_BAT_PARAM_BAT_VOLT_MIN_VOLTAGE": {"tagvalue": 0x03400003, "type": "Float32"},
+    "TAG_BAT_PARAM_BAT_VOLT_MAX_VOLTAGE": {"tagvalue": 0x03400004, "type": "Float32"},
+    "TAG_BAT_PARAM_BAT_VOLT_ENABLED": {"tagvalue": 0x03400005, "type": "Bool"},
+    "TAG_BAT_PARAM_BAT_NUMBER": {"tagvalue": 0x03400006, "type": "Int32"},
+    "TAG_BAT_PARAM_RACK_NUMBER": {"tagvalue": 0x03400007, "type": "Int32"},
+    "TAG_BAT_RSOC": {"tagvalue": 0x03800001, "type": "Float32"},
+    "TAG_BAT_MODULE_VOLTAGE": {"tagvalue": 0x03800002, "type": "Float32"},
+    "TAG_BAT_CURRENT": {"tagvalue": 0x03800003, "type": "Float32"},
+    "TAG_BAT_MAX_BAT_VOLTAGE": {"tagvalue": 0x03800004, "type": "Float32"},
+    "TAG_BAT_MAX_CHARGE_CURRENT": {"tagvalue": 0x03800005, "type": "Float32"},
+    "TAG_BAT_EOD_VOLTAGE": {"tagvalue": 0x03800006, "type": "Float32"},
+    "TAG_BAT_MAX_DISCHARGE_CURRENT": {"tagvalue": 0x03800007, "type": "Float32"},
+    "TAG_BAT_CHARGE_CYCLES": {"tagvalue": 0x03800008, "type": "Uint32"},
+    "TAG_BAT_TERMINAL_VOLTAGE": {"tagvalue": 0x03800009, "type": "Float32"},
+    "TAG_BAT_STATUS_CODE": {"tagvalue": 0x0380000A, "type": "Bitfield"},
+    "TAG_BAT_ERROR_CODE": {"tagvalue": 0x0380000B, "type": "Bitfield"},
+    "TAG_BAT_DEVICE_NAME": {"tagvalue": 0x0380000C, "type": "CString"},
+    "TAG_BAT_DCB_COUNT": {"tagvalue": 0x0380000D, "type": "UChar8"},
+    "TAG_BAT_RSOC_REAL": {"tagvalue": 0x0380000E, "type": "Float32"},
+    "TAG_BAT_ASOC": {"tagvalue": 0x0380000F, "type": "Float32"},
+    "TAG_BAT_FCC": {"tagvalue": 0x03800010, "type": "Float32"},
+    "TAG_BAT_RC": {"tagvalue": 0x03800011, "type": "Float32"},
+    "TAG_BAT_MAX_DCB_CELL_CURRENT": {"tagvalue": 0x03800012, "type": "Float32"},
+    "TAG_BAT_MIN_DCB_CELL_CURRENT": {"tagvalue": 0x03800013, "type": "Float32"},
+    "TAG_BAT_MAX_DCB_CELL_VOLTAGE": {"tagvalue": 0x03800014, "type": "Float32"},
+    "TAG_BAT_MIN_DCB_CELL_VOLTAGE": {"tagvalue": 0x03800015, "type": "Float32"},
+    "TAG_BAT_MAX_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03800016, "type": "Float32"},
+    "TAG_BAT_MIN_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03800017, "type": "Float32"},
+    "TAG_BAT_DCB_ALL_CELL_TEMPERATURES": {"tagvalue": 0x03800018, "type": "Container"},
+    "TAG_BAT_DCB_CELL_TEMPERATURE": {"tagvalue": 0x03800019, "type": "Float32"},
+    "TAG_BAT_DCB_ALL_CELL_VOLTAGES": {"tagvalue": 0x0380001A, "type": "Container"},
+    "TAG_BAT_DCB_CELL_VOLTAGE": {"tagvalue": 0x0380001B, "type": "Float32"},
+    "TAG_BAT_OPEN_BREAKER": {"tagvalue": 0x0380001C, "type": "Bool"},
+    "TAG_BAT_OPEN_BREAKER_CONFIRM": {"tagvalue": 0x0380001D, "type": "Bool"},
+    "TAG_BAT_READY_FOR_SHUTDOWN": {"tagvalue": 0x0380001E, "type": "Bool"},
+    "TAG_BAT_FIRMWARE_VERSION": {"tagvalue": 0x0380001F, "type": "UInt16"},
+    "TAG_BAT_INFO": {"tagvalue": 0x03800020, "type": "Container"},
+    "TAG_BAT_TRAINING_MODE": {"tagvalue": 0x03800021, "type": "UChar8"},
+    "TAG_BAT_UPDATE_STATUS": {"tagvalue": 0x03800022, "type": "UInt16"},
+    "TAG_BAT_TIME_LAST_RESPONSE": {"tagvalue": 0x03800024, "type": "Uint64"},
+    "TAG_BAT_MANUFACTURER_NAME": {"tagvalue": 0x03800025, "type": "CString"},
+    "TAG_BAT_USABLE_CAPACITY": {"tagvalue": 0x03800026, "type": "Float32"},
+    "TAG_BAT_USABLE_REMAINING_CAPACITY": {"tagvalue": 0x03800027, "type": "Float32"},
+    "TAG_BAT_SET_A1_DATA": {"tagvalue": 0x03800028, "type": "Bool"},
+    "TAG_BAT_DELETE_DCB_TYPE": {"tagvalue": 0x0380002A, "type": "Bool"},
+    "TAG_BAT_DCB_TYPE": {"tagvalue": 0x0380002B, "type": "CString"},
+    "TAG_BAT_PV_CHARGE_MODE": {"tagvalue": 0x0380002C, "type": "Bool"},
+    "TAG_BAT_CONTROL_CODE": {"tagvalue": 0x03800032, "type": "Uint32"},
+    "TAG_BAT_BPM_STATUS": {"tagvalue": 0x03800033, "type": "UInt16"},
+    "TAG_BAT_DCB_ERROR_LIST": {"tagvalue": 0x03800034, "type": "UInt16"},
+    "TAG_BAT_DCB_INFO": {"tagvalue": 0x03800042, "type": "Container"},
+    "TAG_BAT_SPECIFICATION": {"tagvalue": 0x03800043, "type": "Container"},
+    "TAG_BAT_INTERNALS": {"tagvalue": 0x03800044, "type": "Container"},
+    "TAG_BAT_DESIGN_CAPACITY": {"tagvalue": 0x03800045, "type": "Double64"},
+    "TAG_BAT_DESIGN_VOLTAGE": {"tagvalue": 0x03800046, "type": "Double64"},
+    "TAG_BAT_CHARGE_HIGH_TEMP": {"tagvalue": 0x03800047, "type": "Int32"},
+    "TAG_BAT_CHARGE_LOW_TEMP": {"tagvalue": 0x03800048, "type": "Int32"},
+    "TAG_BAT_MANUFACTURE_DATE": {"tagvalue": 0x03800049, "type": "Int32"},
+    "TAG_BAT_SERIALNO": {"tagvalue": 0x03800050, "type": "Int32"},
+    "TAG_BAT_DATA_TABLE_VERSION": {"tagvalue": 0x03800051, "type": "Int32"},
+    "TAG_BAT_PROTOCOL_VERSION": {"tagvalue": 0x03800052, "type": "Int32"},
+    "TAG_BAT_PCB_VERSION": {"tagvalue": 0x03800053, "type": "Int32"},
+    "TAG_BAT_TOTAL_USE_TIME": {"tagvalue": 0x03800054, "type": "Int32"},
+    "TAG_BAT_TOTAL_DISCHARGE_TIME": {"tagvalue": 0x03800055, "type": "Int32"},
+    "TAG_BAT_AVAILABLE_BATTERIES": {"tagvalue": 0x03800057, "type": "Container"},
+    "TAG_BAT_BATTERY_SPEC": {"tagvalue": 0x03800058, "type": "Container"},
+    "TAG_BAT_INSTANCE_DESCRIPTOR": {"tagvalue": 0x03800059, "type": "CString"},
+    "TAG_BAT_FET_STATE": {"tagvalue": 0x03800061, "type": "Bool"},
+    "TAG_BAT_BATTERY_SOFT_ON": {"tagvalue": 0x03800062, "type": "UChar8"},
+    "TAG_BAT_SET_BAT_VOLT_ADJUSTMENT": {"tagvalue": 0x03800063, "type": "Container"},
+    "TAG_BAT_BAT_VOLT_ADJUSTMENT": {"tagvalue": 0x03800064, "type": "Container"},
+    "TAG_BAT_BAT_VOLT_ADJ_READY_INDEX": {"tagvalue": 0x03800065, "type": "Int32"},
+    "TAG_BAT_DISCHARGE_UNTIL_EMPTY_STATE": {"tagvalue": 0x03800092, "type": "Int32"},
+    "TAG_BAT_SET_DISCHARGE_UNTIL_EMPTY": {"tagvalue": 0x03800094, "type": "Int32"},
+    "TAG_BAT_CONTROL_STATE": {"tagvalue": 0x03800095, "type": "Uint32"},
+    "TAG_BAT_INTERNAL_STATE": {"tagvalue": 0x03800096, "type": "Uint32"},
+    "TAG_BAT_IS_BREAKER_OPEN": {"tagvalue": 0x03800097, "type": "Bool"},
+    "TAG_BAT_CLOSE_BREAKER": {"tagvalue": 0x03800098, "type": "Uint32"},
+    "TAG_BAT_DCB_INDEX": {"tagvalue": 0x03800100, "type": "UInt16"},
+    "TAG_BAT_DCB_LAST_MESSAGE_TIMESTAMP": {"tagvalue": 0x03800101, "type": "Uint64"},
+    "TAG_BAT_DCB_MAX_CHARGE_VOLTAGE": {"tagvalue": 0x03800102, "type": "Float32"},
+    "TAG_BAT_DCB_MAX_CHARGE_CURRENT": {"tagvalue": 0x03800103, "type": "Float32"},
+    "TAG_BAT_DCB_END_OF_DISCHARGE": {"tagvalue": 0x03800104, "type": "Float32"},
+    "TAG_BAT_DCB_MAX_DISCHARGE_CURRENT": {"tagvalue": 0x03800105, "type": "Float32"},
+    "TAG_BAT_DCB_FULL_CHARGE_CAPACITY": {"tagvalue": 0x03800106, "type": "Float32"},
+    "TAG_BAT_DCB_REMAINING_CAPACITY": {"tagvalue": 0x03800107, "type": "Float32"},
+    "TAG_BAT_DCB_SOC": {"tagvalue": 0x03800108, "type": "Float32"},
+    "TAG_BAT_DCB_SOH": {"tagvalue": 0x03800109, "type": "Float32"},
+    "TAG_BAT_DCB_CYCLE_COUNT": {"tagvalue": 0x03800110, "type": "Uint32"},
+    "TAG_BAT_DCB_CURRENT": {"tagvalue": 0x03800111, "type": "Float32"},
+    "TAG_BAT_DCB_VOLTAGE": {"tagvalue": 0x03800112, "type": "Float32"},
+    "TAG_BAT_DCB_CURRENT_AVG_30S": {"tagvalue": 0x03800113, "type": "Float32"},
+    "TAG_BAT_DCB_VOLTAGE_AVG_30S": {"tagvalue": 0x03800114, "type": "Float32"},
+    "TAG_BAT_DCB_DESIGN_CAPACITY": {"tagvalue": 0x03800115, "type": "Float32"},
+    "TAG_BAT_DCB_DESIGN_VOLTAGE": {"tagvalue": 0x03800116, "type": "Float32"},
+    "TAG_BAT_DCB_CHARGE_LOW_TEMPERATURE": {"tagvalue": 0x03800117, "type": "Float32"},
+    "TAG_BAT_DCB_CHARGE_HIGH_TEMPERATURE": {"tagvalue": 0x03800118, "type": "Float32"},
+    "TAG_BAT_DCB_MANUFACTURE_DATE": {"tagvalue": 0x03800119, "type": "Uint32"},
+    "TAG_BAT_DCB_SERIALNO": {"tagvalue": 0x03800120, "type": "Uint32"},
+    "TAG_BAT_DCB_PROTOCOL_VERSION": {"tagvalue": 0x03800121, "type": "Uint32"},
+    "TAG_BAT_DCB_FW_VERSION": {"tagvalue": 0x03800122, "type": "Uint32"},
+    "TAG_BAT_DCB_DATA_TABLE_VERSION": {"tagvalue": 0x03800123, "type": "Uint32"},
+    "TAG_BAT_DCB_PCB_VERSION": {"tagvalue": 0x03800124, "type": "Uint32"},
+    "TAG_BAT_SPECIFIED_CAPACITY": {"tagvalue": 0x03800125, "type": "Int32"},
+    "TAG_BAT_SPECIFIED_DSCHARGE_POWER": {"tagvalue": 0x03800126, "type": "Int32"},
+    "TAG_BAT_SPECIFIED_CHARGE_POWER": {"tagvalue": 0x03800127, "type": "Int32"},
+    "TAG_BAT_SPECIFIED_MAX_DCB_COUNT": {"tagvalue": 0x03800128, "type": "Int32"},
+    "TAG_BAT_ROLE": {"tagvalue": 0x03800129, "type": "Int32"},
+    "TAG_BAT_INTERNAL_CURRENT_AVG30": {"tagvalue": 0x03800130, "type": "Double64"},
+    "TAG_BAT_INTERNAL_MTV_AVG30": {"tagvalue": 0x03800131, "type": "Double64"},
+    "TAG_BAT_INTERNAL_MAX_CHARGE_CURRENT": {"tagvalue": 0x03800132, "type": "Double64"},
+    "TAG_BAT_INTERNAL_MAX_DISCHARGE_CURRENT": {
+        "tagvalue": 0x03800133,
+        "type": "Double64",
+    },
+    "TAG_BAT_INTERNAL_MAX_CHARGE_CURR_PER_DCB": {
+        "tagvalue": 0x03800134,
+        "type": "Double64",
+    },
+    "TAG_BAT_INTERNAL_MAX_DISCHARGE_CURR_PER_DCB": {
+        "tagvalue": 0x03800135,
+        "type": "Double64",
+    },
+    "TAG_BAT_INTERNAL_MAX_CHARGE_CURR_DATA_LOG": {
+        "tagvalue": 0x03800136,
+        "type": "Double64",
+    },
+    "TAG_BAT_INTERNAL_MAX_DISCHARGE_CURR_DATA_LOG": {
+        "tagvalue": 0x03800137,
+        "type": "Double64",
+    },
+    "TAG_BAT_DCB_NR_SERIES_CELL": {"tagvalue": 0x03800300, "type": "Uint32"},
+    "TAG_BAT_DCB_NR_PARALLEL_CELL": {"tagvalue": 0x03800301, "type": "Uint32"},
+    "TAG_BAT_DCB_MANUFACTURE_NAME": {"tagvalue": 0x03800302, "type": "CString"},
+    "TAG_BAT_DCB_DEVICE_NAME": {"tagvalue": 0x03800303, "type": "CString"},
+    "TAG_BAT_DCB_SERIALCODE": {"tagvalue": 0x03800304, "type": "CString"},
+    "TAG_BAT_DCB_NR_SENSOR": {"tagvalue": 0x03800305, "type": "Uint32"},
+    "TAG_BAT_DCB_STATUS": {"tagvalue": 0x03800306, "type": "UInt16"},
+    "TAG_BAT_DCB_WARNING": {"tagvalue": 0x03800307, "type": "UInt16"},
+    "TAG_BAT_DCB_ALARM": {"tagvalue": 0x03800308, "type": "UInt16"},
+    "TAG_BAT_DCB_ERROR": {"tagvalue": 0x03800309, "type": "UInt16"},
+    "TAG_BAT_DATA": {"tagvalue": 0x03840000, "type": "Container"},
+    "TAG_BAT_DEVICE_STATE": {"tagvalue": 0x03860000, "type": "Container"},
+    "TAG_BAT_DEVICE_CONNECTED": {"tagvalue": 0x03860001, "type": "Bool"},
+    "TAG_BAT_DEVICE_WORKING": {"tagvalue": 0x03860002, "type": "Bool"},
+    "TAG_BAT_DEVICE_IN_SERVICE": {"tagvalue": 0x03860003, "type": "Bool"},
+    "TAG_BAT_GENERAL_ERROR": {"tagvalue": 0x03FFFFFF, "type": "Error"},
+}
@@ -0,0 +1,208 @@
+"RSCP tags of the DASHBOARD namespace, tag codes 0x30xxxxxx."
+
+TAGS = {
+    "TAG_DASHBOARD_LC_REQ_GET_SYSTEM_INFO": {
+        "tagvalue": 0x30000001,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_REQ_GET_CONSUMPTIONS": {
+        "tagvalue": 0x30000002,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_REQ_GET_CHARGING_SESSIONS": {
+        "tagvalue": 0x30000003,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_REQ_GET_SUPPORT_CONTACTS": {
+        "tagvalue": 0x30000004,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_REQ_GET_DATA": {"tagvalue": 0x30000005, "type": "Container"},
+    "TAG_DASHBOARD_LC_PARAM_TOKEN": {"tagvalue": 0x30400001, "type": "CString"},
+    "TAG_DASHBOARD_LC_PARAM_POWER_MGT_TYPE": {"tagvalue": 0x30400002, "type": "UInt16"},
+    "TAG_DASHBOARD_LC_PARAM_MAX_CURRENT_PER_PHASE": {
+        "tagvalue": 0x30400003,
+        "type": "UChar8",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WALLBOXES_COUNT": {
+        "tagvalue": 0x30400004,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_BADGE_STRATEGY": {"tagvalue": 0x30400005, "type": "Bool"},
+    "TAG_DASHBOARD_LC_PARAM_BADGES_COUNT": {"tagvalue": 0x30400006, "type": "UInt16"},
+    "TAG_DASHBOARD_LC_PARAM_STATUS": {"tagvalue": 0x30400007, "type": "Uint64"},
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE": {
+        "tagvalue": 0x30400008,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_PHASE_L1": {
+        "tagvalue": 0x30400009,
+        "type": "Float32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_PHASE_L2": {
+        "tagvalue": 0x3040000A,
+        "type": "Float32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_PHASE_L3": {
+        "tagvalue": 0x3040000B,
+        "type": "Float32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL": {
+        "tagvalue": 0x3040000C,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_PHASE_L1": {
+        "tagvalue": 0x3040000D,
+        "type": "Float32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_PHASE_L2": {
+        "tagvalue": 0x3040000E,
+        "type": "Float32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_PHASE_L3": {
+        "tagvalue": 0x3040000F,
+        "type": "Float32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION": {"tagvalue": 0x30400010, "type": "Container"},
+    "TAG_DASHBOARD_LC_PARAM_WB_LABEL": {"tagvalue": 0x30400011, "type": "CString"},
+    "TAG_DASHBOARD_LC_PARAM_WB_HOSTNAME": {"tagvalue": 0x30400012, "type": "CString"},
+    "TAG_DASHBOARD_LC_PARAM_WB_MAC_ADDRESS": {
+        "tagvalue": 0x30400013,
+        "type": "CString",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_STATE": {"tagvalue": 0x30400014, "type": "Bool"},
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_ACTIVE_SEC": {
+        "tagvalue": 0x30400015,
+        "type": "Uint64",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_INACTIVE_SEC": {
+        "tagvalue": 0x30400016,
+        "type": "Uint64",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_BADGE_ID": {
+        "tagvalue": 0x30400017,
+        "type": "CString",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR": {
+        "tagvalue": 0x30400018,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_ID": {
+        "tagvalue": 0x30400019,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_TYPE": {
+        "tagvalue": 0x3040001A,
+        "type": "UChar8",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_STATUS": {
+        "tagvalue": 0x3040001B,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_ERROR_MSG": {
+        "tagvalue": 0x3040001C,
+        "type": "CString",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_L1": {
+        "tagvalue": 0x3040001D,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_L2": {
+        "tagvalue": 0x3040001E,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_L3": {
+        "tagvalue": 0x3040001F,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_PHASE_LIMIT": {
+        "tagvalue": 0x30400020,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_ENERGY_CHARGED": {
+        "tagvalue": 0x30400021,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONTACT": {"tagvalue": 0x30400022, "type": "Container"},
+    "TAG_DASHBOARD_LC_PARAM_CONTACT_NAME": {"tagvalue": 0x30400023, "type": "CString"},
+    "TAG_DASHBOARD_LC_PARAM_CONTACT_FIRST_NAME": {
+        "tagvalue": 0x30400024,
+        "type": "CString",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONTACT_PHONE": {"tagvalue": 0x30400025, "type": "CString"},
+    "TAG_DASHBOARD_LC_PARAM_CONTACT_EMAIL": {"tagvalue": 0x30400026, "type": "CString"},
+    "TAG_DASHBOARD_LC_PARAM_CONTACT_ROLE": {"tagvalue": 0x30400027, "type": "UInt16"},
+    "TAG_DASHBOARD_LC_PARAM_CONTACT_TYPE": {"tagvalue": 0x30400028, "type": "UInt16"},
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT": {
+        "tagvalue": 0x30400029,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT_ID": {
+        "tagvalue": 0x3040002A,
+        "type": "UChar8",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT_POSITION": {
+        "tagvalue": 0x3040002B,
+        "type": "UChar8",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_INDEX": {"tagvalue": 0x3040002C, "type": "UChar8"},
+    "TAG_DASHBOARD_LC_PARAM_WB_SESSION_CHARGEPOINT_ENERGY_INDEX": {
+        "tagvalue": 0x3040002D,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_POWER_L1": {
+        "tagvalue": 0x3040002E,
+        "type": "Double64",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_POWER_L2": {
+        "tagvalue": 0x3040002F,
+        "type": "Double64",
+    },
+    "TAG_DASHBOARD_LC_PARAM_WB_CONNECTOR_POWER_L3": {
+        "tagvalue": 0x30400030,
+        "type": "Double64",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_POWER_L1": {
+        "tagvalue": 0x30400031,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_POWER_L2": {
+        "tagvalue": 0x30400032,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_TOTAL_EVSE_POWER_L3": {
+        "tagvalue": 0x30400033,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_POWER_L1": {
+        "tagvalue": 0x30400034,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_POWER_L2": {
+        "tagvalue": 0x30400035,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_CONSUMPTION_OVERALL_POWER_L3": {
+        "tagvalue": 0x30400036,
+        "type": "Uint32",
+    },
+    "TAG_DASHBOARD_LC_PARAM_POWER_MEASURE_TYPE": {
+        "tagvalue": 0x30400037,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_PARAM_LOAD_SHEDDING_STATUS": {
+        "tagvalue": 0x30400038,
+        "type": "UInt16",
+    },
+    "TAG_DASHBOARD_LC_GET_SYSTEM_INFO": {"tagvalue": 0x30800001, "type": "Container"},
+    "TAG_DASHBOARD_LC_GET_CONSUMPTIONS": {"tagvalue": 0x30800002, "type": "Container"},
+    "TAG_DASHBOARD_LC_GET_CHARGING_SESSIONS": {
+        "tagvalue": 0x30800003,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_GET_SUPPORT_CONTACTS": {
+        "tagvalue": 0x30800004,
+        "type": "Container",
+    },
+    "TAG_DASHBOARD_LC_GET_DATA": {"tagvalue": 0x30800005, "type": "Container"},
+}
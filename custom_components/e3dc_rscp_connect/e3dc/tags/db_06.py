@@ -0,0 +1,154 @@
+"RSCP tags of the DB namespace, tag codes 0x06xxxxxx."
+
+TAGS = {
+    "TAG_DB_REQ_TEC_ALL": {"tagvalue": 0x0600000F, "type": "Container"},
+    "TAG_DB_REQ_TEC_WALLBOX_VALUES": {"tagvalue": 0x06000016, "type": "None"},
+    "TAG_DB_REQ_TEC_ROOT_EM_VALUE": {"tagvalue": 0x06000017, "type": "None"},
+    "TAG_DB_REQ_TEC_EM_VALUES": {"tagvalue": 0x06000018, "type": "None"},
+    "TAG_DB_REQ_TEC_BAT": {"tagvalue": 0x06000027, "type": "None"},
+    "TAG_DB_REQ_TEC_PRODUCTION": {"tagvalue": 0x06000028, "type": "None"},
+    "TAG_DB_REQ_TEC_CONSUMPTION": {"tagvalue": 0x06000029, "type": "None"},
+    "TAG_DB_REQ_TEC_DC_POWER": {"tagvalue": 0x0600002A, "type": "None"},
+    "TAG_DB_REQ_HISTORY_DATA_DAY": {"tagvalue": 0x06000100, "type": "Container"},
+    "TAG_DB_REQ_HISTORY_TIME_START": {"tagvalue": 0x06000101, "type": "Timestamp"},
+    "TAG_DB_REQ_HISTORY_TIME_INTERVAL": {"tagvalue": 0x06000102, "type": "Timestamp"},
+    "TAG_DB_REQ_HISTORY_TIME_SPAN": {"tagvalue": 0x06000103, "type": "Timestamp"},
+    "TAG_DB_REQ_HISTORY_UTC_TIME_START": {"tagvalue": 0x06000104, "type": "Timestamp"},
+    "TAG_DB_REQ_ENERGY_COUNTERS": {"tagvalue": 0x06000105, "type": "None"},
+    "TAG_DB_REQ_SET_IDLE": {"tagvalue": 0x0600010A, "type": "Bool"},
+    "TAG_DB_REQ_IS_IDLE": {"tagvalue": 0x0600010B, "type": "Bool"},
+    "TAG_DB_REQ_HISTORY_DATA_WEEK": {"tagvalue": 0x06000200, "type": "Container"},
+    "TAG_DB_REQ_HISTORY_DATA_MONTH": {"tagvalue": 0x06000300, "type": "Container"},
+    "TAG_DB_REQ_HISTORY_DATA_YEAR": {"tagvalue": 0x06000400, "type": "Container"},
+    "TAG_DB_REQ_SYNC_HIST": {"tagvalue": 0x06000500, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_HIST": {"tagvalue": 0x06000501, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_BPU": {"tagvalue": 0x06000502, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_BPU": {"tagvalue": 0x06000503, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_DCB": {"tagvalue": 0x06000504, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_DBC": {"tagvalue": 0x06000505, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_BPU_CONF": {"tagvalue": 0x06000506, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_BPU_CONF": {"tagvalue": 0x06000507, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_DCB_CONF": {"tagvalue": 0x06000508, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_DBC_CONF": {"tagvalue": 0x06000509, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_WALLBOX": {"tagvalue": 0x0600050A, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_WALLBOX": {"tagvalue": 0x0600050B, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_PV_DEBUG": {"tagvalue": 0x0600050C, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_PV_DEBUG": {"tagvalue": 0x0600050D, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_CONFIG": {"tagvalue": 0x0600050E, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_CONFIG": {"tagvalue": 0x0600050F, "type": "Uint64"},
+    "TAG_DB_REQ_SET_SYNC_TIME": {"tagvalue": 0x06000510, "type": "Uint64"},
+    "TAG_DB_REQ_PVI_DIAL_RECORDINGS": {"tagvalue": 0x06000511, "type": "None"},
+    "TAG_DB_REQ_SYNC_BAT_DIAGNOSE": {"tagvalue": 0x06000512, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_BAT_DIAGNOSE": {"tagvalue": 0x06000513, "type": "Uint64"},
+    "TAG_DB_REQ_SYNC_EXT_LG": {"tagvalue": 0x06000514, "type": "Container"},
+    "TAG_DB_REQ_VACUUM_EXT_LG": {"tagvalue": 0x06000515, "type": "Uint64"},
+    "TAG_DB_REQ_CLEAN_DATABASE": {"tagvalue": 0x06000516, "type": "None"},
+    "TAG_DB_REQ_SYNC_ALL": {"tagvalue": 0x06000517, "type": "Container"},
+    "TAG_DB_REQ_RESET_TIMESTAMP": {"tagvalue": 0x06000518, "type": "Container"},
+    "TAG_DB_TEC_WALLBOX_VALUE": {"tagvalue": 0x06400001, "type": "Container"},
+    "TAG_DB_TEC_WALLBOX_ENERGYALL": {"tagvalue": 0x06400002, "type": "Uint32"},
+    "TAG_DB_TEC_WALLBOX_WB_ENERGY_SOLAR": {"tagvalue": 0x06400003, "type": "Uint32"},
+    "TAG_DB_TEC_WALLBOX_INDEX": {"tagvalue": 0x06400004, "type": "Uint32"},
+    "TAG_DB_TEC_EM_VALUE": {"tagvalue": 0x06400005, "type": "Container"},
+    "TAG_DB_TEC_EM_ENERGY_L1": {"tagvalue": 0x06400006, "type": "Double64"},
+    "TAG_DB_TEC_EM_ENERGY_L2": {"tagvalue": 0x06400007, "type": "Double64"},
+    "TAG_DB_TEC_EM_ENERGY_L3": {"tagvalue": 0x06400008, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_IN_L1": {"tagvalue": 0x06400009, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_IN_L2": {"tagvalue": 0x0640000A, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_IN_L3": {"tagvalue": 0x0640000B, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_OUT_L1": {"tagvalue": 0x0640000C, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_OUT_L2": {"tagvalue": 0x0640000D, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_OUT_L3": {"tagvalue": 0x0640000E, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_IN": {"tagvalue": 0x0640000F, "type": "Double64"},
+    "TAG_DB_TEC_EM_NET_OUT": {"tagvalue": 0x06400010, "type": "Double64"},
+    "TAG_DB_TEC_EM_INDEX": {"tagvalue": 0x06400011, "type": "Uint32"},
+    "TAG_DB_GRAPH_INDEX": {"tagvalue": 0x06800001, "type": "Float32"},
+    "TAG_DB_BAT_POWER_IN": {"tagvalue": 0x06800002, "type": "Float32"},
+    "TAG_DB_BAT_POWER_OUT": {"tagvalue": 0x06800003, "type": "Float32"},
+    "TAG_DB_DC_POWER": {"tagvalue": 0x06800004, "type": "Float32"},
+    "TAG_DB_GRID_POWER_IN": {"tagvalue": 0x06800005, "type": "Float32"},
+    "TAG_DB_GRID_POWER_OUT": {"tagvalue": 0x06800006, "type": "Float32"},
+    "TAG_DB_CONSUMPTION": {"tagvalue": 0x06800007, "type": "Float32"},
+    "TAG_DB_PM_0_POWER": {"tagvalue": 0x06800008, "type": "Float32"},
+    "TAG_DB_PM_1_POWER": {"tagvalue": 0x06800009, "type": "Float32"},
+    "TAG_DB_BAT_CHARGE_LEVEL": {"tagvalue": 0x0680000A, "type": "Float32"},
+    "TAG_DB_BAT_CYCLE_COUNT": {"tagvalue": 0x0680000B, "type": "Float32"},
+    "TAG_DB_CONSUMED_PRODUCTION": {"tagvalue": 0x0680000C, "type": "Float32"},
+    "TAG_DB_AUTARKY": {"tagvalue": 0x0680000D, "type": "Float32"},
+    "TAG_DB_PRODUCTION_POWER": {"tagvalue": 0x0680000E, "type": "Float32"},
+    "TAG_DB_TEC_ALL": {"tagvalue": 0x0680000F, "type": "Container"},
+    "TAG_DB_SUM_CONTAINER": {"tagvalue": 0x06800010, "type": "Container"},
+    "TAG_DB_TEC_BAT_POWER_IN": {"tagvalue": 0x06800011, "type": "Double64"},
+    "TAG_DB_TEC_BAT_POWER_OUT": {"tagvalue": 0x06800012, "type": "Double64"},
+    "TAG_DB_TEC_PRODUCTION_L1": {"tagvalue": 0x06800013, "type": "Double64"},
+    "TAG_DB_TEC_PRODUCTION_L2": {"tagvalue": 0x06800014, "type": "Double64"},
+    "TAG_DB_TEC_PRODUCTION_L3": {"tagvalue": 0x06800015, "type": "Double64"},
+    "TAG_DB_TEC_WALLBOX_VALUES": {"tagvalue": 0x06800016, "type": "Container"},
+    "TAG_DB_TEC_ROOT_EM_VALUE": {"tagvalue": 0x06800017, "type": "Container"},
+    "TAG_DB_TEC_EM_VALUES": {"tagvalue": 0x06800018, "type": "Container"},
+    "TAG_DB_TEC_BAT_CHARGE_LEVEL": {"tagvalue": 0x06800019, "type": "Double64"},
+    "TAG_DB_TEC_BAT_CURRENT_IN": {"tagvalue": 0x0680001A, "type": "Double64"},
+    "TAG_DB_TEC_BAT_CURRENT_OUT": {"tagvalue": 0x0680001B, "type": "Double64"},
+    "TAG_DB_TEC_CONSUMPTION_L1": {"tagvalue": 0x0680001C, "type": "Double64"},
+    "TAG_DB_TEC_CONSUMPTION_L2": {"tagvalue": 0x0680001D, "type": "Double64"},
+    "TAG_DB_TEC_CONSUMPTION_L3": {"tagvalue": 0x0680001E, "type": "Double64"},
+    "TAG_DB_TEC_DC_POWER_S1": {"tagvalue": 0x0680001F, "type": "Double64"},
+    "TAG_DB_VALUE_CONTAINER": {"tagvalue": 0x06800020, "type": "Container"},
+    "TAG_DB_TEC_DC_POWER_S2": {"tagvalue": 0x06800021, "type": "Double64"},
+    "TAG_DB_TEC_DC_POWER_S3": {"tagvalue": 0x06800022, "type": "Double64"},
+    "TAG_DB_TEC_ACCURACY": {"tagvalue": 0x06800023, "type": "Double64"},
+    "TAG_DB_TEC_ACCURACY_LM": {"tagvalue": 0x06800024, "type": "Double64"},
+    "TAG_DB_TEC_ACCURACY_WB": {"tagvalue": 0x06800025, "type": "Double64"},
+    "TAG_DB_TEC_BAT_ASOC_CHARGE_LEVEL": {"tagvalue": 0x06800026, "type": "Double64"},
+    "TAG_DB_TEC_BAT": {"tagvalue": 0x06800027, "type": "Container"},
+    "TAG_DB_TEC_PRODUCTION": {"tagvalue": 0x06800028, "type": "Container"},
+    "TAG_DB_TEC_CONSUMPTION": {"tagvalue": 0x06800029, "type": "Container"},
+    "TAG_DB_TEC_DC_POWER": {"tagvalue": 0x0680002A, "type": "Container"},
+    "TAG_DB_HISTORY_DATA_DAY": {"tagvalue": 0x06800100, "type": "Container"},
+    "TAG_DB_ENERGY_COUNTERS": {"tagvalue": 0x06800105, "type": "Container"},
+    "TAG_DB_SET_IDLE": {"tagvalue": 0x0680010A, "type": "Bool"},
+    "TAG_DB_IS_IDLE": {"tagvalue": 0x0680010B, "type": "Bool"},
+    "TAG_DB_HISTORY_DATA_WEEK": {"tagvalue": 0x06800200, "type": "Container"},
+    "TAG_DB_HISTORY_DATA_MONTH": {"tagvalue": 0x06800300, "type": "Container"},
+    "TAG_DB_HISTORY_DATA_YEAR": {"tagvalue": 0x06800400, "type": "Container"},
+    "TAG_DB_SYNC_HIST": {"tagvalue": 0x06800500, "type": "Container"},
+    "TAG_DB_VACUUM_HIST": {"tagvalue": 0x06800501, "type": "Uint64"},
+    "TAG_DB_SYNC_BPU": {"tagvalue": 0x06800502, "type": "Container"},
+    "TAG_DB_VACUUM_BPU": {"tagvalue": 0x06800503, "type": "Uint64"},
+    "TAG_DB_SYNC_DCB": {"tagvalue": 0x06800504, "type": "Container"},
+    "TAG_DB_VACUUM_DCB": {"tagvalue": 0x06800505, "type": "Uint64"},
+    "TAG_DB_SYNC_BPU_CONF": {"tagvalue": 0x06800506, "type": "Container"},
+    "TAG_DB_VACUUM_BPU_CONF": {"tagvalue": 0x06800507, "type": "Uint64"},
+    "TAG_DB_SYNC_DCB_CONF": {"tagvalue": 0x06800508, "type": "Container"},
+    "TAG_DB_VACUUM_DCB_CONF": {"tagvalue": 0x06800509, "type": "Uint64"},
+    "TAG_DB_SYNC_WALLBOX": {"tagvalue": 0x0680050A, "type": "Container"},
+    "TAG_DB_VACUUM_WALLBOX": {"tagvalue": 0x0680050B, "type": "Uint64"},
+    "TAG_DB_SYNC_PV_DEBUG": {"tagvalue": 0x0680050C, "type": "Container"},
+    "TAG_DB_VACUUM_PV_DEBUG": {"tagvalue": 0x0680050D, "type": "Uint64"},
+    "TAG_DB_SYNC_CONFIG": {"tagvalue": 0x0680050E, "type": "Container"},
+    "TAG_DB_VACUUM_CONFIG": {"tagvalue": 0x0680050F, "type": "Uint64"},
+    "TAG_DB_SET_SYNC_TIME": {"tagvalue": 0x06800510, "type": "Uint64"},
+    "TAG_DB_PVI_DIAL_RECORDINGS": {"tagvalue": 0x06800511, "type": "Container"},
+    "TAG_DB_SYNC_BAT_DIAGNOSE": {"tagvalue": 0x06800512, "type": "Container"},
+    "TAG_DB_VACUUM_BAT_DIAGNOSE": {"tagvalue": 0x06800513, "type": "Uint64"},
+    "TAG_DB_SYNC_EXT_LG": {"tagvalue": 0x06800514, "type": "Container"},
+    "TAG_DB_VACUUM_EXT_LG": {"tagvalue": 0x06800515, "type": "Uint64"},
+    "TAG_DB_SYNC_ALL": {"tagvalue": 0x06800517, "type": "Container"},
+    "TAG_DB_RESET_TIMESTAMP": {"tagvalue": 0x06800518, "type": "Container"},
+    "TAG_DB_PAR_TIME_MIN": {"tagvalue": 0x06B00000, "type": "Uint64"},
+    "TAG_DB_PAR_TIME_MAX": {"tagvalue": 0x06B00001, "type": "Uint64"},
+    "TAG_DB_PARAM_ROW": {"tagvalue": 0x06B00002, "type": "Container"},
+    "TAG_DB_PARAM_COLUMN": {"tagvalue": 0x06B00003, "type": "Container"},
+    "TAG_DB_PARAM_INDEX": {"tagvalue": 0x06B00004, "type": "Uint32"},
+    "TAG_DB_PARAM_VALUE": {"tagvalue": 0x06B00005, "type": "CString"},
+    "TAG_DB_PARAM_MAX_ROWS": {"tagvalue": 0x06B00006, "type": "Uint32"},
+    "TAG_DB_PARAM_TIME": {"tagvalue": 0x06B00007, "type": "Uint64"},
+    "TAG_DB_PARAM_VERSION": {"tagvalue": 0x06B00008, "type": "CString"},
+    "TAG_DB_PARAM_HEADER": {"tagvalue": 0x06B00009, "type": "Container"},
+    "TAG_DB_PARAM_PRODUCTION_L1": {"tagvalue": 0x06B00010, "type": "Double64"},
+    "TAG_DB_PARAM_PRODUCTION_L2": {"tagvalue": 0x06B00011, "type": "Double64"},
+    "TAG_DB_PARAM_PRODUCTION_L3": {"tagvalue": 0x06B00012, "type": "Double64"},
+    "TAG_DB_PARAM_DC_POWER_S1": {"tagvalue": 0x06B00013, "type": "Double64"},
+    "TAG_DB_PARAM_DC_POWER_S2": {"tagvalue": 0x06B00014, "type": "Double64"},
+    "TAG_DB_PARAM_DC_POWER_S3": {"tagvalue": 0x06B00015, "type": "Double64"},
+}
@@ -0,0 +1,91 @@
+"RSCP tags of the DB namespace, tag codes 0xFAxxxxxx."
+
+TAGS = {
+    "TAG_DB_SERVICE_REQ_S10_SYS_INFO": {"tagvalue": 0xFA000001, "type": "Int64"},
+    "TAG_DB_SERVICE_REQ_SET_S10_SYS_INFO": {
+        "tagvalue": 0xFA000002,
+        "type": "Container",
+    },
+    "TAG_DB_SERVICE_NOTIFY_REGISTERED": {"tagvalue": 0xFA000003, "type": "Int32"},
+    "TAG_DB_SERVICE_REQ_SET_RELEASE_LATEST": {"tagvalue": 0xFA000004, "type": "Int64"},
+    "TAG_DB_SERVICE_REQ_SYNC_CONFIG_TO_TARGET": {
+        "tagvalue": 0xFA000005,
+        "type": "None",
+    },
+    "TAG_DB_SERVICE_PARAM_SERIALNO": {"tagvalue": 0xFA00B001, "type": "Int64"},
+    "TAG_DB_SERVICE_PARAM_TIMESTAMP_INIT_CHECK": {
+        "tagvalue": 0xFA00B002,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_TIMESTAMP_FIRST_ONLINE": {
+        "tagvalue": 0xFA00B003,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_TIMESTAMP_INSTALL_DATE": {
+        "tagvalue": 0xFA00B004,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_SW_RELEASE": {"tagvalue": 0xFA00B005, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_ACC_KEY_STATUS": {"tagvalue": 0xFA00B006, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_DEVICE_TYPE": {"tagvalue": 0xFA00B007, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_COUPLING_MODE": {"tagvalue": 0xFA00B008, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_TUNNEL_PORT": {"tagvalue": 0xFA00B009, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_SW_UPDATE_DISABLED": {
+        "tagvalue": 0xFA00B010,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_HW_UPDATE_DISABLED": {
+        "tagvalue": 0xFA00B011,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_COMMENT": {"tagvalue": 0xFA00B012, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_LAST_UPDATE": {"tagvalue": 0xFA00B013, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_HIDE_FROM_DL": {"tagvalue": 0xFA00B014, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_ERR_CODE": {"tagvalue": 0xFA00B015, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_TIMESTAMP_LAST_ONLINE": {
+        "tagvalue": 0xFA00B016,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_REPORTED_SW_RELEASE": {
+        "tagvalue": 0xFA00B017,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_REPORTED_SW_RELEASE_DATE": {
+        "tagvalue": 0xFA00B018,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_SW_UPDATE_LAST_CONNECT": {
+        "tagvalue": 0xFA00B019,
+        "type": "CString",
+    },
+    "TAG_DB_SERVICE_PARAM_UPDATE_PLATFORM": {"tagvalue": 0xFA00B01A, "type": "CString"},
+    "TAG_DB_SERVICE_PARAM_HIDDEN": {"tagvalue": 0xFA00B01B, "type": "None"},
+    "TAG_DB_SERVICE_REQ_REMOVABLE_DEVICES": {"tagvalue": 0xFA00C001, "type": "Int64"},
+    "TAG_DB_SERVICE_REMOVABLE_DEVICE_NAME": {"tagvalue": 0xFA00C002, "type": "CString"},
+    "TAG_DB_SERVICE_REQ_REMOVE_DEVICE": {"tagvalue": 0xFA00C003, "type": "CString"},
+    "TAG_DB_SERVICE_REQ_TABLE_DATA": {"tagvalue": 0xFA00D001, "type": "Container"},
+    "TAG_DB_SERVICE_TABLE_NAME": {"tagvalue": 0xFA00D002, "type": "CString"},
+    "TAG_DB_SERVICE_TABLE_MAX_COLUMNS": {"tagvalue": 0xFA00D003, "type": "Int32"},
+    "TAG_DB_SERVICE_TABLE_INCLUDE_METADATA": {"tagvalue": 0xFA00D004, "type": "Bool"},
+    "TAG_DB_SERVICE_TABLE_COLUMNS": {"tagvalue": 0xFA00D005, "type": "Container"},
+    "TAG_DB_SERVICE_TABLE_COLUMN": {"tagvalue": 0xFA00D006, "type": "Container"},
+    "TAG_DB_SERVICE_TABLE_COLUMN_NAME": {"tagvalue": 0xFA00D007, "type": "CString"},
+    "TAG_DB_SERVICE_TABLE_COLUMN_TYPE": {"tagvalue": 0xFA00D008, "type": "Char8"},
+    "TAG_DB_SERVICE_TABLE_DATA_ROWS": {"tagvalue": 0xFA00D009, "type": "Int32"},
+    "TAG_DB_SERVICE_TABLE_DATA_CONTENT": {"tagvalue": 0xFA00D00A, "type": "ByteArray"},
+    "TAG_DB_SERVICE_REQ_RESYNC": {"tagvalue": 0xFA00E001, "type": "Container"},
+    "TAG_DB_SERVICE_RESYNC_FROM": {"tagvalue": 0xFA00E002, "type": "Int64"},
+    "TAG_DB_SERVICE_REQ_SYNC_CONFIG_PROPERTIES": {
+        "tagvalue": 0xFA00E003,
+        "type": "ByteArray",
+    },
+    "TAG_DB_SERVICE_PARAM_FARM_SERIAL": {"tagvalue": 0xFA400001, "type": "CString"},
+    "TAG_DB_SERVICE_S10_SYS_INFO": {"tagvalue": 0xFA800001, "type": "Container"},
+    "TAG_DB_SERVICE_SET_S10_SYS_INFO": {"tagvalue": 0xFA800002, "type": "Container"},
+    "TAG_DB_SERVICE_SET_RELEASE_LATEST": {"tagvalue": 0xFA800004, "type": "Bool"},
+    "TAG_DB_SERVICE_SYNC_CONFIG_TO_TARGET": {"tagvalue": 0xFA800005, "type": "Bool"},
+    "TAG_DB_SERVICE_REMOVABLE_DEVICES": {"tagvalue": 0xFA80C001, "type": "Container"},
+    "TAG_DB_SERVICE_REMOVE_DEVICE": {"tagvalue": 0xFA80C003, "type": "CString"},
+    "TAG_DB_SERVICE_TABLE_DATA": {"tagvalue": 0xFA80D001, "type": "Container"},
+    "TAG_DB_SERVICE_RESYNC": {"tagvalue": 0xFA80E001, "type": "None"},
+}
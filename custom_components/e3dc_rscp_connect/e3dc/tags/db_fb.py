@@ -0,0 +1,27 @@
+"RSCP tags of the DB namespace, tag codes 0xFBxxxxxx."
+
+TAGS = {
+    "TAG_DB_RECOVERY_FINISH": {"tagvalue": 0xFB000000, "type": "Char8"},
+    "TAG_DB_RECOVERY_REQ_RECOVERY": {"tagvalue": 0xFB000001, "type": "Container"},
+    "TAG_DB_RECOVERY_SOURCE": {"tagvalue": 0xFB000002, "type": "Uint64"},
+    "TAG_DB_RECOVERY_TARGET": {"tagvalue": 0xFB000003, "type": "Uint64"},
+    "TAG_DB_RECOVERY_RECOVERY": {"tagvalue": 0xFB000004, "type": "Bool"},
+    "TAG_DB_RECOVERY_ERROR": {"tagvalue": 0xFB000005, "type": "CString"},
+    "TAG_DB_RECOVERY_LOG": {"tagvalue": 0xFB000006, "type": "CString"},
+    "TAG_DB_RECOVERY_REQ_RECOVERY_CONFIRM": {"tagvalue": 0xFB000007, "type": "None"},
+    "TAG_DB_RECOVERY_RECOVERY_CONFIRM": {"tagvalue": 0xFB000008, "type": "None"},
+    "TAG_DB_RECOVERY_REQ_RECOVERY_CANCEL": {"tagvalue": 0xFB000009, "type": "None"},
+    "TAG_DB_RECOVERY_REQ_CANDIDATE_LIST": {"tagvalue": 0xFB00000A, "type": "Container"},
+    "TAG_DB_RECOVERY_REQ_STATUS": {"tagvalue": 0xFB00000B, "type": "None"},
+    "TAG_DB_RECOVERY_REQ_FINISH": {"tagvalue": 0xFB00000C, "type": "None"},
+    "TAG_DB_RECOVERY_RECOVERY_CANCEL": {"tagvalue": 0xFB000010, "type": "Bool"},
+    "TAG_DB_RECOVERY_PARAM_USER": {"tagvalue": 0xFB400001, "type": "CString"},
+    "TAG_DB_RECOVERY_PARAM_PASSWORD": {"tagvalue": 0xFB400002, "type": "CString"},
+    "TAG_DB_RECOVERY_PARAM_CANDIDATE_SERIAL": {
+        "tagvalue": 0xFB400003,
+        "type": "CString",
+    },
+    "TAG_DB_RECOVERY_STATUS": {"tagvalue": 0xFB400004, "type": "CString"},
+    "TAG_DB_RECOVERY_PARAM_ID": {"tagvalue": 0xFB400005, "type": "CString"},
+    "TAG_DB_RECOVERY_CANDIDATE_LIST": {"tagvalue": 0xFB80000A, "type": "Container"},
+}
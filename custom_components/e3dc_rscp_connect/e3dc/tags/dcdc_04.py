@@ -0,0 +1,213 @@
+"RSCP tags of the DCDC namespace, tag codes 0x04xxxxxx."
+
+TAGS = {
+    "TAG_DCDC_REQ_SET_BAT_CONNECTED": {"tagvalue": 0x04000000, "type": "Bool"},
+    "TAG_DCDC_REQ_I_BAT": {"tagvalue": 0x04000001, "type": "None"},
+    "TAG_DCDC_REQ_U_BAT": {"tagvalue": 0x04000002, "type": "None"},
+    "TAG_DCDC_REQ_P_BAT": {"tagvalue": 0x04000003, "type": "None"},
+    "TAG_DCDC_REQ_I_DCL": {"tagvalue": 0x04000004, "type": "None"},
+    "TAG_DCDC_REQ_U_DCL": {"tagvalue": 0x04000005, "type": "None"},
+    "TAG_DCDC_REQ_P_DCL": {"tagvalue": 0x04000006, "type": "None"},
+    "TAG_DCDC_REQ_SELF_TEST": {"tagvalue": 0x04000007, "type": "Bool"},
+    "TAG_DCDC_REQ_FIRMWARE_VERSION": {"tagvalue": 0x04000008, "type": "None"},
+    "TAG_DCDC_REQ_FPGA_FIRMWARE": {"tagvalue": 0x04000009, "type": "None"},
+    "TAG_DCDC_REQ_SERIAL_NUMBER": {"tagvalue": 0x0400000A, "type": "None"},
+    "TAG_DCDC_REQ_BOARD_VERSION": {"tagvalue": 0x0400000B, "type": "None"},
+    "TAG_DCDC_REQ_FLASH_FILE_LIST": {"tagvalue": 0x0400000C, "type": "None"},
+    "TAG_DCDC_REQ_IS_FLASHING": {"tagvalue": 0x0400000E, "type": "None"},
+    "TAG_DCDC_REQ_FLASH": {"tagvalue": 0x0400000F, "type": "CString"},
+    "TAG_DCDC_REQ_STATUS": {"tagvalue": 0x04000010, "type": "None"},
+    "TAG_DCDC_REQ_STATUS_AS_STRING": {"tagvalue": 0x04000013, "type": "None"},
+    "TAG_DCDC_REQ_GET_BAT_CONNECTED": {"tagvalue": 0x04000016, "type": "None"},
+    "TAG_DCDC_REQ_SET_ZK_SYM_ACTIVE": {"tagvalue": 0x04000017, "type": "Bool"},
+    "TAG_DCDC_REQ_GET_ZK_SYM_ACTIVE": {"tagvalue": 0x04000018, "type": "None"},
+    "TAG_DCDC_REQ_SET_ISO_TEST_REQUESTED": {"tagvalue": 0x04000019, "type": "Bool"},
+    "TAG_DCDC_REQ_GET_ISO_TEST_REQUESTED": {"tagvalue": 0x0400001A, "type": "Bool"},
+    "TAG_DCDC_REQ_GET_ISO_TEST_SUCCESSFULLY_DONE": {
+        "tagvalue": 0x0400001B,
+        "type": "None",
+    },
+    "TAG_DCDC_REQ_GET_BAT_ON": {"tagvalue": 0x0400001C, "type": "None"},
+    "TAG_DCDC_REQ_GET_ZK_SYM_ON": {"tagvalue": 0x0400001D, "type": "None"},
+    "TAG_DCDC_REQ_GET_ISO_ACTIVE": {"tagvalue": 0x0400001E, "type": "None"},
+    "TAG_DCDC_REQ_GET_RELAYS_ON": {"tagvalue": 0x0400001F, "type": "None"},
+    "TAG_DCDC_REQ_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
+        "tagvalue": 0x04000020,
+        "type": "Float32",
+    },
+    "TAG_DCDC_REQ_VERIFY_CORTEX": {"tagvalue": 0x04000021, "type": "CString"},
+    "TAG_DCDC_REQ_FLASH_FPGA": {"tagvalue": 0x04000022, "type": "Container"},
+    "TAG_DCDC_REQ_FLASH_FPGA_FILE_LIST": {"tagvalue": 0x04000023, "type": "None"},
+    "TAG_DCDC_REQ_SELF_TEST_RESULT": {"tagvalue": 0x04000024, "type": "None"},
+    "TAG_DCDC_REQ_FLASH_STATUS": {"tagvalue": 0x04000025, "type": "None"},
+    "TAG_DCDC_REQ_GET_PARAMETER": {"tagvalue": 0x04000026, "type": "Container"},
+    "TAG_DCDC_REQ_SET_PARAMETER": {"tagvalue": 0x04000027, "type": "Container"},
+    "TAG_DCDC_REQ_SET_PID_DEBUG": {"tagvalue": 0x04000028, "type": "Bool"},
+    "TAG_DCDC_REQ_COPY_RING_BUFFER": {"tagvalue": 0x04000029, "type": "None"},
+    "TAG_DCDC_REQ_GET_PID_DEBUG": {"tagvalue": 0x0400002A, "type": "None"},
+    "TAG_DCDC_REQ_PID_DEBUG_DATA": {"tagvalue": 0x0400002B, "type": "None"},
+    "TAG_DCDC_REQ_GET_LAST_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
+        "tagvalue": 0x0400002C,
+        "type": "None",
+    },
+    "TAG_DCDC_REQ_GET_DESIRED_IC": {"tagvalue": 0x0400002D, "type": "None"},
+    "TAG_DCDC_REQ_GET_ISO_VALUE": {"tagvalue": 0x0400002E, "type": "None"},
+    "TAG_DCDC_REQ_BROADCAST_BAT_LIMITS": {"tagvalue": 0x0400002F, "type": "None"},
+    "TAG_DCDC_REQ_RING_BUFFER": {"tagvalue": 0x04000030, "type": "Container"},
+    "TAG_DCDC_REQ_FREE_RING_BUFFER": {"tagvalue": 0x04000031, "type": "None"},
+    "TAG_DCDC_REQ_UNICAST_BAT_LIMITS": {"tagvalue": 0x04000032, "type": "None"},
+    "TAG_DCDC_REQ_SET_POWERSAVE": {"tagvalue": 0x04000033, "type": "Bool"},
+    "TAG_DCDC_REQ_GET_POWERSAVE": {"tagvalue": 0x04000034, "type": "None"},
+    "TAG_DCDC_REQ_GET_HW_CHARACTERISTIC": {"tagvalue": 0x04000035, "type": "UInt16"},
+    "TAG_DCDC_REQ_U_DCL_DIFF": {"tagvalue": 0x04000036, "type": "None"},
+    "TAG_DCDC_REQ_DERATING": {"tagvalue": 0x04000037, "type": "None"},
+    "TAG_DCDC_REQ_DERATING_VALUE": {"tagvalue": 0x04000038, "type": "None"},
+    "TAG_DCDC_REQ_TARGET_POWER": {"tagvalue": 0x04000039, "type": "None"},
+    "TAG_DCDC_REQ_DCL_OPERATION_VOLTAGE": {"tagvalue": 0x04000050, "type": "Uint32"},
+    "TAG_DCDC_REQ_SET_DCL_OPERATION_VOLTAGE": {
+        "tagvalue": 0x04000051,
+        "type": "Container",
+    },
+    "TAG_DCDC_REQ_SET_POWER": {"tagvalue": 0x04000071, "type": "Double64"},
+    "TAG_DCDC_REQ_SET_IDLE": {"tagvalue": 0x04000072, "type": "None"},
+    "TAG_DCDC_REQ_HANDLE_ERRORS": {"tagvalue": 0x04000073, "type": "None"},
+    "TAG_DCDC_REQ_CLEAR_ERRORS": {"tagvalue": 0x04000074, "type": "None"},
+    "TAG_DCDC_REQ_SEND_COMMAND": {"tagvalue": 0x04000075, "type": "None"},
+    "TAG_DCDC_REQ_BROADCAST_COMMAND": {"tagvalue": 0x04000076, "type": "None"},
+    "TAG_DCDC_REQ_ERROR_PENDING": {"tagvalue": 0x04000077, "type": "None"},
+    "TAG_DCDC_REQ_SET_PVI_TYPE": {"tagvalue": 0x04000078, "type": "Int32"},
+    "TAG_DCDC_REQ_PVI_TYPE": {"tagvalue": 0x04000079, "type": "None"},
+    "TAG_DCDC_REQ_ON_GRID": {"tagvalue": 0x04000080, "type": "None"},
+    "TAG_DCDC_REQ_SET_ON_GRID": {"tagvalue": 0x04000081, "type": "Bool"},
+    "TAG_DCDC_REQ_NEXT_SLAVE_STATE": {"tagvalue": 0x04000082, "type": "None"},
+    "TAG_DCDC_REQ_ENABLE_NEXT_SLAVE": {"tagvalue": 0x04000083, "type": "Bool"},
+    "TAG_DCDC_REQ_DCDC_TYPE": {"tagvalue": 0x04000084, "type": "None"},
+    "TAG_DCDC_REQ_SEND_KICKSTART": {"tagvalue": 0x04000085, "type": "Bool"},
+    "TAG_DCDC_REQ_IS_HEALTHY": {"tagvalue": 0x04000086, "type": "None"},
+    "TAG_DCDC_REQ_SET_IS_MULTI_GC": {"tagvalue": 0x04000087, "type": "Char8"},
+    "TAG_DCDC_REQ_SEND_STARTUP_TYPE": {"tagvalue": 0x04000089, "type": "None"},
+    "TAG_DCDC_REQ_SEND_BAT_CHARGING_STATE": {"tagvalue": 0x0400008A, "type": "None"},
+    "TAG_DCDC_REQ_SEND_STANDBY_RELEASE": {"tagvalue": 0x0400008B, "type": "None"},
+    "TAG_DCDC_REQ_DATA": {"tagvalue": 0x04040000, "type": "Container"},
+    "TAG_DCDC_INDEX": {"tagvalue": 0x04040001, "type": "UInt16"},
+    "TAG_DCDC_PARAM_FLASH_PROGRESS": {"tagvalue": 0x04040010, "type": "Double64"},
+    "TAG_DCDC_PARAM_FLASH_TYPE": {"tagvalue": 0x04040011, "type": "Uint32"},
+    "TAG_DCDC_PARAM_FLASHING_ACTIVE": {"tagvalue": 0x04040012, "type": "Bool"},
+    "TAG_DCDC_PARAM_FLASH_MODE": {"tagvalue": 0x04040013, "type": "UChar8"},
+    "TAG_DCDC_PARAM_FLASH_FILE": {"tagvalue": 0x04040014, "type": "CString"},
+    "TAG_DCDC_PARAM_CRC": {"tagvalue": 0x04040015, "type": "Uint32"},
+    "TAG_DCDC_PARAM_PARAMETER_BLOCK": {"tagvalue": 0x04040016, "type": "UChar8"},
+    "TAG_DCDC_PARAM_PARAMETER_INDEX_FROM": {"tagvalue": 0x04040017, "type": "UChar8"},
+    "TAG_DCDC_PARAM_PARAMETER_INDEX_UNTIL": {"tagvalue": 0x04040018, "type": "UChar8"},
+    "TAG_DCDC_PARAM_PARAMETER_VALUE": {"tagvalue": 0x04040019, "type": "UInt16"},
+    "TAG_DCDC_PARAM_RING_BUFFER_ELEMENT": {"tagvalue": 0x04040030, "type": "Container"},
+    "TAG_DCDC_PARAM_RB_ID": {"tagvalue": 0x04040031, "type": "UChar8"},
+    "TAG_DCDC_PARAM_RB_TIME": {"tagvalue": 0x04040032, "type": "Uint64"},
+    "TAG_DCDC_PARAM_RB_I_BAT": {"tagvalue": 0x04040033, "type": "Double64"},
+    "TAG_DCDC_PARAM_RB_U_BAT": {"tagvalue": 0x04040034, "type": "Double64"},
+    "TAG_DCDC_PARAM_RB_I_DCL": {"tagvalue": 0x04040035, "type": "Double64"},
+    "TAG_DCDC_PARAM_RB_U_DCL": {"tagvalue": 0x04040036, "type": "Double64"},
+    "TAG_DCDC_PARAM_RB_MODE": {"tagvalue": 0x04040037, "type": "UChar8"},
+    "TAG_DCDC_PARAM_RB_SUBSTATE": {"tagvalue": 0x04040038, "type": "UChar8"},
+    "TAG_DCDC_PARAM_RB_SETPOINT": {"tagvalue": 0x04040039, "type": "Float32"},
+    "TAG_DCDC_PARAM_RB_INDEX_DCDC": {"tagvalue": 0x04040040, "type": "UChar8"},
+    "TAG_DCDC_PARAM_RB_INDEX_FROM": {"tagvalue": 0x04040041, "type": "Uint32"},
+    "TAG_DCDC_PARAM_RB_INDEX_UNTIL": {"tagvalue": 0x04040042, "type": "Uint32"},
+    "TAG_DCDC_PARAM_DCL_OV_UPPER_VOLTAGE": {"tagvalue": 0x04040050, "type": "Float32"},
+    "TAG_DCDC_PARAM_DCL_OV_LOWER_VOLTAGE": {"tagvalue": 0x04040051, "type": "Float32"},
+    "TAG_DCDC_PARAM_DCL_OV_INDEX": {"tagvalue": 0x04040052, "type": "Uint32"},
+    "TAG_DCDC_REQ_COUNT_HW_CONTROLLER": {"tagvalue": 0x04040060, "type": "None"},
+    "TAG_DCDC_REQ_ENABLE_FAN_TEST": {"tagvalue": 0x04040061, "type": "None"},
+    "TAG_DCDC_REQ_DISABLE_FAN_TEST": {"tagvalue": 0x04040062, "type": "None"},
+    "TAG_DCDC_REQ_DEVICE_STATE": {"tagvalue": 0x04060000, "type": "None"},
+    "TAG_DCDC_SET_BAT_CONNECTED": {"tagvalue": 0x04800000, "type": "Bool"},
+    "TAG_DCDC_I_BAT": {"tagvalue": 0x04800001, "type": "Float32"},
+    "TAG_DCDC_U_BAT": {"tagvalue": 0x04800002, "type": "Float32"},
+    "TAG_DCDC_P_BAT": {"tagvalue": 0x04800003, "type": "Float32"},
+    "TAG_DCDC_I_DCL": {"tagvalue": 0x04800004, "type": "Float32"},
+    "TAG_DCDC_U_DCL": {"tagvalue": 0x04800005, "type": "Float32"},
+    "TAG_DCDC_P_DCL": {"tagvalue": 0x04800006, "type": "Float32"},
+    "TAG_DCDC_SELF_TEST": {"tagvalue": 0x04800007, "type": "Int32"},
+    "TAG_DCDC_FIRMWARE_VERSION": {"tagvalue": 0x04800008, "type": "CString"},
+    "TAG_DCDC_FPGA_FIRMWARE": {"tagvalue": 0x04800009, "type": "CString"},
+    "TAG_DCDC_SERIAL_NUMBER": {"tagvalue": 0x0480000A, "type": "CString"},
+    "TAG_DCDC_BOARD_VERSION": {"tagvalue": 0x0480000B, "type": "UChar8"},
+    "TAG_DCDC_FLASH_FILE_LIST": {"tagvalue": 0x0480000C, "type": "Container"},
+    "TAG_DCDC_FLASH_FILE": {"tagvalue": 0x0480000D, "type": "CString"},
+    "TAG_DCDC_IS_FLASHING": {"tagvalue": 0x0480000E, "type": "Bool"},
+    "TAG_DCDC_FLASH": {"tagvalue": 0x0480000F, "type": "Bool"},
+    "TAG_DCDC_STATUS": {"tagvalue": 0x04800010, "type": "Container"},
+    "TAG_DCDC_STATE": {"tagvalue": 0x04800011, "type": "UChar8"},
+    "TAG_DCDC_SUBSTATE": {"tagvalue": 0x04800012, "type": "UChar8"},
+    "TAG_DCDC_STATUS_AS_STRING": {"tagvalue": 0x04800013, "type": "Container"},
+    "TAG_DCDC_STATE_AS_STRING": {"tagvalue": 0x04800014, "type": "CString"},
+    "TAG_DCDC_SUBSTATE_AS_STRING": {"tagvalue": 0x04800015, "type": "CString"},
+    "TAG_DCDC_GET_BAT_CONNECTED": {"tagvalue": 0x04800016, "type": "Bool"},
+    "TAG_DCDC_SET_ZK_SYM_ACTIVE": {"tagvalue": 0x04800017, "type": "Bool"},
+    "TAG_DCDC_GET_ZK_SYM_ACTIVE": {"tagvalue": 0x04800018, "type": "Bool"},
+    "TAG_DCDC_SET_ISO_TEST_REQUESTED": {"tagvalue": 0x04800019, "type": "None"},
+    "TAG_DCDC_GET_ISO_TEST_REQUESTED": {"tagvalue": 0x0480001A, "type": "Bool"},
+    "TAG_DCDC_GET_ISO_TEST_SUCCESSFULLY_DONE": {"tagvalue": 0x0480001B, "type": "Bool"},
+    "TAG_DCDC_GET_BAT_ON": {"tagvalue": 0x0480001C, "type": "Bool"},
+    "TAG_DCDC_GET_ZK_SYM_ON": {"tagvalue": 0x0480001D, "type": "Bool"},
+    "TAG_DCDC_GET_ISO_ACTIVE": {"tagvalue": 0x0480001E, "type": "Bool"},
+    "TAG_DCDC_GET_RELAYS_ON": {"tagvalue": 0x0480001F, "type": "Bool"},
+    "TAG_DCDC_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
+        "tagvalue": 0x04800020,
+        "type": "Float32",
+    },
+    "TAG_DCDC_VERIFY_CORTEX": {"tagvalue": 0x04800021, "type": "Bool"},
+    "TAG_DCDC_FLASH_FPGA": {"tagvalue": 0x04800022, "type": "Bool"},
+    "TAG_DCDC_FLASH_FPGA_FILE_LIST": {"tagvalue": 0x04800023, "type": "Container"},
+    "TAG_DCDC_SELF_TEST_RESULT": {"tagvalue": 0x04800024, "type": "Uint64"},
+    "TAG_DCDC_FLASH_STATUS": {"tagvalue": 0x04800025, "type": "Container"},
+    "TAG_DCDC_GET_PARAMETER": {"tagvalue": 0x04800026, "type": "Container"},
+    "TAG_DCDC_SET_PARAMETER": {"tagvalue": 0x04800027, "type": "Container"},
+    "TAG_DCDC_COPY_RING_BUFFER": {"tagvalue": 0x04800029, "type": "Uint32"},
+    "TAG_DCDC_GET_PID_DEBUG": {"tagvalue": 0x0480002A, "type": "Bool"},
+    "TAG_DCDC_PID_DEBUG_DATA": {"tagvalue": 0x0480002B, "type": "ByteArray"},
+    "TAG_DCDC_GET_LAST_SET_ACTIVE_BAT_PRECHARGE_GOAL": {
+        "tagvalue": 0x0480002C,
+        "type": "Float32",
+    },
+    "TAG_DCDC_GET_DESIRED_IC": {"tagvalue": 0x0480002D, "type": "Float32"},
+    "TAG_DCDC_GET_ISO_VALUE": {"tagvalue": 0x0480002E, "type": "Float32"},
+    "TAG_DCDC_BROADCAST_BAT_LIMITS": {"tagvalue": 0x0480002F, "type": "None"},
+    "TAG_DCDC_RING_BUFFER": {"tagvalue": 0x04800030, "type": "Container"},
+    "TAG_DCDC_FREED_RING_BUFFER": {"tagvalue": 0x04800031, "type": "None"},
+    "TAG_DCDC_UNICAST_BAT_LIMITS": {"tagvalue": 0x04800032, "type": "None"},
+    "TAG_DCDC_SET_POWERSAVE": {"tagvalue": 0x04800033, "type": "Bool"},
+    "TAG_DCDC_GET_POWERSAVE": {"tagvalue": 0x04800034, "type": "Bool"},
+    "TAG_DCDC_GET_HW_CHARACTERISTIC": {"tagvalue": 0x04800035, "type": "UInt16"},
+    "TAG_DCDC_U_DCL_DIFF": {"tagvalue": 0x04800036, "type": "Float32"},
+    "TAG_DCDC_DERATING": {"tagvalue": 0x04800037, "type": "Bool"},
+    "TAG_DCDC_DERATING_VALUE": {"tagvalue": 0x04800038, "type": "Float32"},
+    "TAG_DCDC_TARGET_POWER": {"tagvalue": 0x04800039, "type": "Float32"},
+    "TAG_DCDC_DCL_OPERATION_VOLTAGE": {"tagvalue": 0x04800051, "type": "Container"},
+    "TAG_DCDC_SET_POWER": {"tagvalue": 0x04800071, "type": "Double64"},
+    "TAG_DCDC_SET_IDLE": {"tagvalue": 0x04800072, "type": "None"},
+    "TAG_DCDC_HANDLE_ERRORS": {"tagvalue": 0x04800073, "type": "None"},
+    "TAG_DCDC_CLEAR_ERRORS": {"tagvalue": 0x04800074, "type": "None"},
+    "TAG_DCDC_SEND_COMMAND": {"tagvalue": 0x04800075, "type": "Bool"},
+    "TAG_DCDC_BROADCAST_COMMAND": {"tagvalue": 0x04800076, "type": "Bool"},
+    "TAG_DCDC_ERROR_PENDING": {"tagvalue": 0x04800077, "type": "Bool"},
+    "TAG_DCDC_PVI_TYPE": {"tagvalue": 0x04800079, "type": "Bool"},
+    "TAG_DCDC_ON_GRID": {"tagvalue": 0x04800080, "type": "Bool"},
+    "TAG_DCDC_NEXT_SLAVE_STATE": {"tagvalue": 0x04800082, "type": "Bool"},
+    "TAG_DCDC_DCDC_TYPE": {"tagvalue": 0x04800084, "type": "UChar8"},
+    "TAG_DCDC_SEND_KICKSTART": {"tagvalue": 0x04800085, "type": "Bool"},
+    "TAG_DCDC_IS_HEALTHY": {"tagvalue": 0x04800086, "type": "Bool"},
+    "TAG_DCDC_REQ_GET_IS_MULTI_GC": {"tagvalue": 0x04800087, "type": "None"},
+    "TAG_DCDC_SEND_STARTUP_TYPE": {"tagvalue": 0x04800089, "type": "UChar8"},
+    "TAG_DCDC_SEND_BAT_CHARGING_STATE": {"tagvalue": 0x0480008A, "type": "UChar8"},
+    "TAG_DCDC_SEND_STANDBY_RELEASE": {"tagvalue": 0x0480008B, "type": "Char8"},
+    "TAG_DCDC_DATA": {"tagvalue": 0x04840000, "type": "Container"},
+    "TAG_DCDC_COUNT_HW_CONTROLLER": {"tagvalue": 0x04840060, "type": "Uint32"},
+    "TAG_DCDC_DEVICE_STATE": {"tagvalue": 0x04860000, "type": "Container"},
+    "TAG_DCDC_DEVICE_CONNECTED": {"tagvalue": 0x04860001, "type": "Bool"},
+    "TAG_DCDC_DEVICE_WORKING": {"tagvalue": 0x04860002, "type": "Bool"},
+    "TAG_DCDC_DEVICE_IN_SERVICE": {"tagvalue": 0x04860003, "type": "Bool"},
+    "TAG_DCDC_GET_IS_MULTI_GC": {"tagvalue": 0x04860004, "type": "Char8"},
+    "TAG_DCDC_SET_IS_MULTI_GC": {"tagvalue": 0x04860005, "type": "Char8"},
+    "TAG_DCDC_GENERAL_ERROR": {"tagvalue": 0x04FFFFFF, "type": "Error"},
+}
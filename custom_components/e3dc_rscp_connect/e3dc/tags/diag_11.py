@@ -0,0 +1,13 @@
+"RSCP tags of the DIAG namespace, tag codes 0x11xxxxxx."
+
+TAGS = {
+    "TAG_DIAG_REQ_CURRENT_ISSUES": {"tagvalue": 0x11000000, "type": "None"},
+    "TAG_DIAG_REQ_REPORTED_ISSUES": {"tagvalue": 0x11000001, "type": "None"},
+    "TAG_DIAG_CURRENT_ISSUES": {"tagvalue": 0x11800000, "type": "Container"},
+    "TAG_DIAG_REPORTED_ISSUES": {"tagvalue": 0x11800001, "type": "Container"},
+    "TAG_DIAG_ISSUE": {"tagvalue": 0x11860000, "type": "Container"},
+    "TAG_DIAG_ERR_CODE": {"tagvalue": 0x11860001, "type": "Uint32"},
+    "TAG_DIAG_ENDURE_TIME": {"tagvalue": 0x11860002, "type": "Int64"},
+    "TAG_DIAG_TIME_ARISED": {"tagvalue": 0x11860003, "type": "Int64"},
+    "TAG_DIAG_ERR_MSG": {"tagvalue": 0x11860004, "type": "CString"},
+}
@@ -0,0 +1,340 @@
+"RSCP tags of the EEBUS namespace, tag codes 0x28xxxxxx."
+
+TAGS = {
+    "TAG_EEBUS_REQ_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x28000001, "type": "None"},
+    "TAG_EEBUS_REQ_ASSOCIATE_DEVICE": {"tagvalue": 0x28000002, "type": "Container"},
+    "TAG_EEBUS_REQ_LIST_CONNECTED_DEVICES": {"tagvalue": 0x28000003, "type": "None"},
+    "TAG_EEBUS_REQ_SET_SEARCH_ACTIVE": {"tagvalue": 0x28000004, "type": "Bool"},
+    "TAG_EEBUS_REQ_ASSOCIATE_DEVICE_TYPE_EVCS": {
+        "tagvalue": 0x28000005,
+        "type": "Container",
+    },
+    "TAG_EEBUS_REQ_LIST_NON_PAIRED_DEVICE_TYPE_EVCS": {
+        "tagvalue": 0x28000006,
+        "type": "Container",
+    },
+    "TAG_EEBUS_REQ_APPLY_WB_PRECONFIG": {"tagvalue": 0x28000007, "type": "None"},
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_COMMUNICATION_STANDARD": {
+        "tagvalue": 0x28000008,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_REQ_GET_EVSE_LIST_USECASE": {
+        "tagvalue": 0x28010000,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_EV_LIST_USECASE": {
+        "tagvalue": 0x28010001,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_REQ_GET_EVSE_MANUFACTURER_INFO": {
+        "tagvalue": 0x28010002,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_EV_MANUFACTURER_INFO": {
+        "tagvalue": 0x28010003,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_POWER_LIMITS": {
+        "tagvalue": 0x28010004,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_IDENTIFICATION": {
+        "tagvalue": 0x28010005,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_SLEEP_MODE": {
+        "tagvalue": 0x28010006,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_ASYMMETRIC_CHARGING_SUPPORTED": {
+        "tagvalue": 0x28010007,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CURRENT_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28010010,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_POWER_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28010011,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_ENERGY_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28010012,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28010013,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_CURRENT_MEASUREMENT": {
+        "tagvalue": 0x28010014,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_POWER_MEASUREMENT": {
+        "tagvalue": 0x28010015,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_ENERGY_MEASUREMENT": {
+        "tagvalue": 0x28010017,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_MEASUREMENT": {
+        "tagvalue": 0x28010018,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_CHARGING_CURRENT_CONSTRAINTS": {
+        "tagvalue": 0x28010020,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_OVERLOAD_CHARGING_CURRENT_LIMIT": {
+        "tagvalue": 0x28010021,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_REQ_GET_DATA": {
+        "tagvalue": 0x2801FFFE,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_REQ_GET_DATA": {
+        "tagvalue": 0x2801FFFF,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_DEVICE": {"tagvalue": 0x28400001, "type": "Container"},
+    "TAG_EEBUS_PARAM_SHIP_ID": {"tagvalue": 0x28400002, "type": "CString"},
+    "TAG_EEBUS_PARAM_SKI": {"tagvalue": 0x28400003, "type": "CString"},
+    "TAG_EEBUS_PARAM_DEVICE_ID": {"tagvalue": 0x28400004, "type": "Int32"},
+    "TAG_EEBUS_PARAM_EEBUS_ID": {"tagvalue": 0x28400005, "type": "CString"},
+    "TAG_EEBUS_PARAM_GENERIC_AC_PHASE": {"tagvalue": 0x28400006, "type": "UChar8"},
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO": {
+        "tagvalue": 0x28400007,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28400008,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_USECASE_NAME": {"tagvalue": 0x28400009, "type": "CString"},
+    "TAG_EEBUS_PARAM_GENERIC_USECASE_ENABLED": {"tagvalue": 0x2840000A, "type": "Bool"},
+    "TAG_EEBUS_PARAM_GENERIC_USECASE": {"tagvalue": 0x2840000B, "type": "Container"},
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_DEVICE_NAME": {
+        "tagvalue": 0x2840000C,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_DEVICE_CODE": {
+        "tagvalue": 0x2840000D,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_SERIAL_NUMBER": {
+        "tagvalue": 0x2840000E,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_HARDWARE_REVISION": {
+        "tagvalue": 0x2840000F,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_SOFTWARE_REVISION": {
+        "tagvalue": 0x28400010,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_VENDOR_NAME": {
+        "tagvalue": 0x28400011,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_VENDOR_CODE": {
+        "tagvalue": 0x28400012,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_BRAND_NAME": {
+        "tagvalue": 0x28400013,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_MANUFACTURER_LABEL": {
+        "tagvalue": 0x28400014,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_MANUFACTURER_DESCRIPTION": {
+        "tagvalue": 0x28400015,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MANUFACTURER_INFO_MANUFACTURER_NODE_IDENTIFICATION": {
+        "tagvalue": 0x28400016,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS_MIN": {
+        "tagvalue": 0x28400017,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS_MAX": {
+        "tagvalue": 0x28400018,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_MEASUREMENT_CONSTRAINTS_STEP_SIZE": {
+        "tagvalue": 0x28400019,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_SIGNIFICANT_NUMBER": {
+        "tagvalue": 0x2840001A,
+        "type": "Int64",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_SCALE_NUMBER": {"tagvalue": 0x2840001B, "type": "Int16"},
+    "TAG_EEBUS_PARAM_GENERIC_LOAD_LIMIT_ACTIVATED": {
+        "tagvalue": 0x2840001C,
+        "type": "Bool",
+    },
+    "TAG_EEBUS_PARAM_GENERIC_LOAD_LIMIT_VALUE": {
+        "tagvalue": 0x2840001D,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_EV_ID": {"tagvalue": 0x28410000, "type": "UChar8"},
+    "TAG_EEBUS_PARAM_EMOBILITY_EV_IDENTIFICATION_VALUE": {
+        "tagvalue": 0x28410001,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_EV_IDENTIFICATION_TYPE": {
+        "tagvalue": 0x28410002,
+        "type": "UChar8",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_POWER_LIMITS_MIN": {
+        "tagvalue": 0x28410003,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_POWER_LIMITS_MAX": {
+        "tagvalue": 0x28410004,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_POWER_LIMITS_STANDBY_POWER": {
+        "tagvalue": 0x28410005,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_MEASUREMENT_CONSTRAINT_PER_PHASE": {
+        "tagvalue": 0x28410006,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_MEASUREMENT": {
+        "tagvalue": 0x28410007,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_MEASUREMENT_PER_PHASE": {
+        "tagvalue": 0x28410008,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_MIN": {
+        "tagvalue": 0x28410009,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_MAX": {
+        "tagvalue": 0x2841000A,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_DISCRETE_VALUE": {
+        "tagvalue": 0x2841000B,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_CONSTRAINTS_PER_PHASE": {
+        "tagvalue": 0x2841000C,
+        "type": "Container",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_SLEEP_MODE": {"tagvalue": 0x2841000D, "type": "Bool"},
+    "TAG_EEBUS_PARAM_EMOBILITY_ASYMMETRIC_CHARGING_SUPPORTED": {
+        "tagvalue": 0x2841000E,
+        "type": "Bool",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_COMMUNICATION_STANDARD": {
+        "tagvalue": 0x2841000F,
+        "type": "CString",
+    },
+    "TAG_EEBUS_PARAM_EMOBILITY_CHARGING_CURRENT_LIMIT_PER_PHASE": {
+        "tagvalue": 0x28410010,
+        "type": "Container",
+    },
+    "TAG_EEBUS_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x28800001, "type": "Container"},
+    "TAG_EEBUS_LIST_CONNECTED_DEVICES": {"tagvalue": 0x28800002, "type": "Container"},
+    "TAG_EEBUS_LIST_ASSOCIATED_DEVICE": {"tagvalue": 0x28800003, "type": "None"},
+    "TAG_EEBUS_LIST_NON_PAIRED_DEVICE_TYPE_EVCS": {
+        "tagvalue": 0x28800004,
+        "type": "Container",
+    },
+    "TAG_EEBUS_SET_SEARCH_ACTIVE": {"tagvalue": 0x28800005, "type": "Bool"},
+    "TAG_EEBUS_ASSOCIATE_DEVICE_TYPE_EVCS": {
+        "tagvalue": 0x28800006,
+        "type": "Container",
+    },
+    "TAG_EEBUS_LIST_USECASE": {"tagvalue": 0x28800008, "type": "Container"},
+    "TAG_EEBUS_EMOBILITY_WB_GET_EVSE_LIST_USECASE": {
+        "tagvalue": 0x28810000,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_EV_LIST_USECASE": {
+        "tagvalue": 0x28810001,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_GET_EVSE_MANUFACTURER_INFO": {
+        "tagvalue": 0x28810002,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_EV_MANUFACTURER_INFO": {
+        "tagvalue": 0x28810003,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_POWER_LIMITS": {
+        "tagvalue": 0x28810004,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_IDENTIFICATION": {
+        "tagvalue": 0x28810005,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_SLEEP_MODE": {
+        "tagvalue": 0x28810006,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_ASYMMETRIC_CHARGING_SUPPORTED": {
+        "tagvalue": 0x28810007,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_COMMUNICATION_STANDARD": {
+        "tagvalue": 0x28810008,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CURRENT_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28810010,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_POWER_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28810011,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_ENERGY_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28810012,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_MEASUREMENT_CONSTRAINTS": {
+        "tagvalue": 0x28810013,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_CURRENT_MEASUREMENT": {
+        "tagvalue": 0x28810014,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_POWER_MEASUREMENT": {
+        "tagvalue": 0x28810015,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_ENERGY_MEASUREMENT": {
+        "tagvalue": 0x28810017,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_MEASUREMENT": {
+        "tagvalue": 0x28810018,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_CHARGING_CURRENT_CONSTRAINTS": {
+        "tagvalue": 0x28810020,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_OVERLOAD_CHARGING_CURRENT_LIMIT": {
+        "tagvalue": 0x28810021,
+        "type": "Container",
+    },
+    "TAG_EEBUS_EMOBILITY_WB_EV_GET_DATA": {"tagvalue": 0x2881FFFE, "type": "Container"},
+    "TAG_EEBUS_EMOBILITY_WB_GET_DATA": {"tagvalue": 0x2881FFFF, "type": "Container"},
+}
@@ -0,0 +1,18 @@
+"RSCP tags of the EH namespace, tag codes 0x14xxxxxx."
+
+TAGS = {
+    "TAG_EH_REQ_UNREPORTED_ERRORS": {"tagvalue": 0x14000001, "type": "None"},
+    "TAG_EH_REQ_MARK_REPORTED": {"tagvalue": 0x14000002, "type": "Container"},
+    "TAG_EH_REQ_GET_SAVED_ERRORS": {"tagvalue": 0x14000003, "type": "None"},
+    "TAG_EH_PARAM_ROW": {"tagvalue": 0x14040000, "type": "Container"},
+    "TAG_EH_PARAM_ROW_ID": {"tagvalue": 0x14040001, "type": "Uint64"},
+    "TAG_EH_PARAM_ROW_TIME": {"tagvalue": 0x14040002, "type": "Uint64"},
+    "TAG_EH_PARAM_ROW_CODE": {"tagvalue": 0x14040003, "type": "Uint32"},
+    "TAG_EH_PARAM_ROW_TYPE": {"tagvalue": 0x14040004, "type": "UChar8"},
+    "TAG_EH_PARAM_ROW_CLEARED": {"tagvalue": 0x14040005, "type": "Bool"},
+    "TAG_EH_PARAM_ROW_ERR_SRC": {"tagvalue": 0x14040006, "type": "CString"},
+    "TAG_EH_PARAM_ROW_MSG": {"tagvalue": 0x14040007, "type": "CString"},
+    "TAG_EH_UNREPORTED_ERRORS": {"tagvalue": 0x14800001, "type": "Container"},
+    "TAG_EH_MARKED_REPORTED": {"tagvalue": 0x14800002, "type": "Int32"},
+    "TAG_EH_GET_SAVED_ERRORS": {"tagvalue": 0x14800003, "type": "Container"},
+}
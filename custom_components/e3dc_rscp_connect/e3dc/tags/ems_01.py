@@ -0,0 +1,567 @@
+"RSCP tags of the EMS namespace, tag codes 0x01xxxxxx."
+
+TAGS = {
+    "TAG_EMS_REQ_SMGW_USE_CASES": {"tagvalue": 0x01000000, "type": "None"},
+    "TAG_EMS_REQ_POWER_PV": {"tagvalue": 0x01000001, "type": "None"},
+    "TAG_EMS_REQ_POWER_BAT": {"tagvalue": 0x01000002, "type": "None"},
+    "TAG_EMS_REQ_POWER_HOME": {"tagvalue": 0x01000003, "type": "None"},
+    "TAG_EMS_REQ_POWER_GRID": {"tagvalue": 0x01000004, "type": "None"},
+    "TAG_EMS_REQ_POWER_ADD": {"tagvalue": 0x01000005, "type": "None"},
+    "TAG_EMS_REQ_AUTARKY": {"tagvalue": 0x01000006, "type": "None"},
+    "TAG_EMS_REQ_SELF_CONSUMPTION": {"tagvalue": 0x01000007, "type": "None"},
+    "TAG_EMS_REQ_BAT_SOC": {"tagvalue": 0x01000008, "type": "None"},
+    "TAG_EMS_REQ_COUPLING_MODE": {"tagvalue": 0x01000009, "type": "None"},
+    "TAG_EMS_REQ_STORED_ERRORS": {"tagvalue": 0x0100000A, "type": "None"},
+    "TAG_EMS_REQ_MODE": {"tagvalue": 0x01000011, "type": "None"},
+    "TAG_EMS_REQ_BALANCED_PHASES": {"tagvalue": 0x01000012, "type": "None"},
+    "TAG_EMS_REQ_INSTALLED_PEAK_POWER": {"tagvalue": 0x01000013, "type": "None"},
+    "TAG_EMS_REQ_DERATE_AT_PERCENT_VALUE": {"tagvalue": 0x01000014, "type": "None"},
+    "TAG_EMS_REQ_DERATE_AT_POWER_VALUE": {"tagvalue": 0x01000015, "type": "None"},
+    "TAG_EMS_REQ_ERROR_BUZZER_ENABLED": {"tagvalue": 0x01000016, "type": "None"},
+    "TAG_EMS_REQ_SET_BALANCED_PHASES": {"tagvalue": 0x01000017, "type": "UChar8"},
+    "TAG_EMS_REQ_SET_INSTALLED_PEAK_POWER": {"tagvalue": 0x01000018, "type": "Uint32"},
+    "TAG_EMS_REQ_SET_DERATE_PERCENT": {"tagvalue": 0x01000019, "type": "Float32"},
+    "TAG_EMS_REQ_SET_ERROR_BUZZER_ENABLED": {"tagvalue": 0x0100001A, "type": "Bool"},
+    "TAG_EMS_REQ_START_ADJUST_BATTERY_VOLTAGE": {
+        "tagvalue": 0x0100001B,
+        "type": "Float32",
+    },
+    "TAG_EMS_REQ_CANCEL_ADJUST_BATTERY_VOLTAGE": {
+        "tagvalue": 0x0100001C,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_ADJUST_BATTERY_VOLTAGE_STATUS": {
+        "tagvalue": 0x0100001D,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_CONFIRM_ERRORS": {"tagvalue": 0x0100001E, "type": "None"},
+    "TAG_EMS_REQ_POWER_WB_ALL": {"tagvalue": 0x0100001F, "type": "None"},
+    "TAG_EMS_REQ_POWER_WB_SOLAR": {"tagvalue": 0x01000020, "type": "None"},
+    "TAG_EMS_REQ_EXT_SRC_AVAILABLE": {"tagvalue": 0x01000021, "type": "None"},
+    "TAG_EMS_REQ_RESCUE_BAT_MODE": {"tagvalue": 0x01000022, "type": "None"},
+    "TAG_EMS_REQ_SET_RESCUE_BAT_MODE": {"tagvalue": 0x01000023, "type": "Bool"},
+    "TAG_EMS_REQ_IS_PV_DERATING": {"tagvalue": 0x01000024, "type": "None"},
+    "TAG_EMS_REQ_AC_POWER_LIMIT": {"tagvalue": 0x01000025, "type": "None"},
+    "TAG_EMS_REQ_POWER_ADD_SINKS": {"tagvalue": 0x01000026, "type": "None"},
+    "TAG_EMS_REQ_SET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01000027, "type": "Bool"},
+    "TAG_EMS_REQ_GET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01000028, "type": "None"},
+    "TAG_EMS_REQ_SET_MAX_EP_WALLBOX_POWER_W": {
+        "tagvalue": 0x01000029,
+        "type": "Uint32",
+    },
+    "TAG_EMS_REQ_GET_MAX_EP_WALLBOX_POWER_W": {"tagvalue": 0x0100002A, "type": "None"},
+    "TAG_EMS_REQ_GET_MIN_EP_WALLBOX_POWER_W": {"tagvalue": 0x0100002B, "type": "None"},
+    "TAG_EMS_REQ_SET_MIN_EP_WALLBOX_POWER_W": {
+        "tagvalue": 0x0100002C,
+        "type": "Uint32",
+    },
+    "TAG_EMS_REQ_SET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0100002D, "type": "Uint32"},
+    "TAG_EMS_REQ_GET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0100002E, "type": "None"},
+    "TAG_EMS_REQ_SET_IDLE_PERIODS_2": {"tagvalue": 0x0100002F, "type": "Container"},
+    "TAG_EMS_REQ_SET_POWER": {"tagvalue": 0x01000030, "type": "Container"},
+    "TAG_EMS_REQ_SET_POWER_MODE": {"tagvalue": 0x01000031, "type": "UChar8"},
+    "TAG_EMS_REQ_SET_POWER_VALUE": {"tagvalue": 0x01000032, "type": "Int32"},
+    "TAG_EMS_REQ_GET_IDLE_PERIODS_2": {"tagvalue": 0x01000033, "type": "None"},
+    "TAG_EMS_REQ_SET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01000034, "type": "Bool"},
+    "TAG_EMS_REQ_GET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01000035, "type": "None"},
+    "TAG_EMS_REQ_DPP_GET_DATA": {"tagvalue": 0x01000036, "type": "Container"},
+    "TAG_EMS_REQ_DPP_SET_DATA": {"tagvalue": 0x01000037, "type": "Container"},
+    "TAG_EMS_REQ_SET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01000038, "type": "UChar8"},
+    "TAG_EMS_REQ_GET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01000039, "type": "None"},
+    "TAG_EMS_REQ_MANIPULATOR_COLLECTION": {"tagvalue": 0x0100003B, "type": "Container"},
+    "TAG_EMS_REQ_MANIPULATOR_EVENT_TOTAL_COUNT": {
+        "tagvalue": 0x0100003C,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_STATUS": {"tagvalue": 0x01000040, "type": "None"},
+    "TAG_EMS_REQ_USED_CHARGE_LIMIT": {"tagvalue": 0x01000041, "type": "None"},
+    "TAG_EMS_REQ_BAT_CHARGE_LIMIT": {"tagvalue": 0x01000042, "type": "None"},
+    "TAG_EMS_REQ_DCDC_CHARGE_LIMIT": {"tagvalue": 0x01000043, "type": "None"},
+    "TAG_EMS_REQ_USER_CHARGE_LIMIT": {"tagvalue": 0x01000044, "type": "None"},
+    "TAG_EMS_REQ_USED_DISCHARGE_LIMIT": {"tagvalue": 0x01000045, "type": "None"},
+    "TAG_EMS_REQ_BAT_DISCHARGE_LIMIT": {"tagvalue": 0x01000046, "type": "None"},
+    "TAG_EMS_REQ_DCDC_DISCHARGE_LIMIT": {"tagvalue": 0x01000047, "type": "None"},
+    "TAG_EMS_REQ_USER_DISCHARGE_LIMIT": {"tagvalue": 0x01000048, "type": "None"},
+    "TAG_EMS_REQ_SET_POWER_CONTROL_OFFSET": {"tagvalue": 0x01000060, "type": "Int32"},
+    "TAG_EMS_REQ_REMAINING_BAT_CHARGE_POWER": {"tagvalue": 0x01000071, "type": "None"},
+    "TAG_EMS_REQ_REMAINING_BAT_DISCHARGE_POWER": {
+        "tagvalue": 0x01000072,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_EMERGENCY_POWER_STATUS": {"tagvalue": 0x01000073, "type": "None"},
+    "TAG_EMS_REQ_SET_EMERGENCY_POWER": {"tagvalue": 0x01000074, "type": "UChar8"},
+    "TAG_EMS_REQ_SET_OVERRIDE_AVAILABLE_POWER": {
+        "tagvalue": 0x01000075,
+        "type": "Int32",
+    },
+    "TAG_EMS_REQ_SET_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01000076, "type": "UChar8"},
+    "TAG_EMS_REQ_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01000077, "type": "UChar8"},
+    "TAG_EMS_REQ_SET_BATTERY_BEFORE_CAR_MODE": {
+        "tagvalue": 0x01000078,
+        "type": "UChar8",
+    },
+    "TAG_EMS_REQ_BATTERY_BEFORE_CAR_MODE": {"tagvalue": 0x01000079, "type": "UChar8"},
+    "TAG_EMS_REQ_GET_IDLE_PERIODS": {"tagvalue": 0x01000080, "type": "None"},
+    "TAG_EMS_REQ_SET_IDLE_PERIODS": {"tagvalue": 0x01000081, "type": "Container"},
+    "TAG_EMS_IDLE_PERIOD": {"tagvalue": 0x01000082, "type": "Container"},
+    "TAG_EMS_IDLE_PERIOD_TYPE": {"tagvalue": 0x01000083, "type": "UChar8"},
+    "TAG_EMS_IDLE_PERIOD_DAY": {"tagvalue": 0x01000084, "type": "UChar8"},
+    "TAG_EMS_IDLE_PERIOD_START": {"tagvalue": 0x01000085, "type": "Container"},
+    "TAG_EMS_IDLE_PERIOD_END": {"tagvalue": 0x01000086, "type": "Container"},
+    "TAG_EMS_IDLE_PERIOD_HOUR": {"tagvalue": 0x01000087, "type": "UChar8"},
+    "TAG_EMS_IDLE_PERIOD_MINUTE": {"tagvalue": 0x01000088, "type": "UChar8"},
+    "TAG_EMS_IDLE_PERIOD_ACTIVE": {"tagvalue": 0x01000089, "type": "Bool"},
+    "TAG_EMS_REQ_IDLE_PERIOD_CHANGE_MARKER": {"tagvalue": 0x0100008A, "type": "None"},
+    "TAG_EMS_REQ_GET_POWER_SETTINGS": {"tagvalue": 0x0100008B, "type": "None"},
+    "TAG_EMS_REQ_SET_POWER_SETTINGS": {"tagvalue": 0x0100008C, "type": "Container"},
+    "TAG_EMS_REQ_SETTINGS_CHANGE_MARKER": {"tagvalue": 0x0100008D, "type": "None"},
+    "TAG_EMS_REQ_GET_MANUAL_CHARGE": {"tagvalue": 0x0100008E, "type": "None"},
+    "TAG_EMS_REQ_START_MANUAL_CHARGE": {"tagvalue": 0x0100008F, "type": "Uint32"},
+    "TAG_EMS_REQ_START_EMERGENCYPOWER_TEST": {"tagvalue": 0x01000090, "type": "Bool"},
+    "TAG_EMS_REQ_GET_GENERATOR_STATE": {"tagvalue": 0x01000091, "type": "None"},
+    "TAG_EMS_REQ_SET_GENERATOR_MODE": {"tagvalue": 0x01000092, "type": "UChar8"},
+    "TAG_EMS_REQ_EMERGENCYPOWER_TEST_STATUS": {"tagvalue": 0x01000093, "type": "None"},
+    "TAG_EMS_EPTEST_NEXT_TESTSTART": {"tagvalue": 0x01000094, "type": "Timestamp"},
+    "TAG_EMS_EPTEST_START_COUNTER": {"tagvalue": 0x01000095, "type": "Uint32"},
+    "TAG_EMS_EPTEST_RUNNING": {"tagvalue": 0x01000096, "type": "Bool"},
+    "TAG_EMS_REQ_GET_SYS_SPECS": {"tagvalue": 0x01000097, "type": "None"},
+    "TAG_EMS_REQ_SYS_STATUS": {"tagvalue": 0x01000098, "type": "None"},
+    "TAG_EMS_SYS_SPEC": {"tagvalue": 0x01000099, "type": "Container"},
+    "TAG_EMS_SYS_SPEC_INDEX": {"tagvalue": 0x0100009A, "type": "Int32"},
+    "TAG_EMS_SYS_SPEC_NAME": {"tagvalue": 0x0100009B, "type": "CString"},
+    "TAG_EMS_SYS_SPEC_VALUE_INT": {"tagvalue": 0x0100009C, "type": "Int32"},
+    "TAG_EMS_SYS_SPEC_VALUE_STRING": {"tagvalue": 0x0100009D, "type": "CString"},
+    "TAG_EMS_SYS_STATUS": {"tagvalue": 0x0100009E, "type": "None"},
+    "TAG_EMS_POWER_LIMITS_USED": {"tagvalue": 0x01000100, "type": "Bool"},
+    "TAG_EMS_MAX_CHARGE_POWER": {"tagvalue": 0x01000101, "type": "Uint32"},
+    "TAG_EMS_MAX_DISCHARGE_POWER": {"tagvalue": 0x01000102, "type": "Uint32"},
+    "TAG_EMS_DISCHARGE_START_POWER": {"tagvalue": 0x01000103, "type": "Uint32"},
+    "TAG_EMS_POWERSAVE_ENABLED": {"tagvalue": 0x01000104, "type": "UChar8"},
+    "TAG_EMS_WEATHER_REGULATED_CHARGE_ENABLED": {
+        "tagvalue": 0x01000105,
+        "type": "UChar8",
+    },
+    "TAG_EMS_WEATHER_FORECAST_MODE": {"tagvalue": 0x01000106, "type": "UChar8"},
+    "TAG_EMS_POWERSAVE_TIMEOUT": {"tagvalue": 0x01000107, "type": "Uint32"},
+    "TAG_EMS_MANUAL_CHARGE_START_COUNTER": {"tagvalue": 0x01000150, "type": "Uint32"},
+    "TAG_EMS_MANUAL_CHARGE_ACTIVE": {"tagvalue": 0x01000151, "type": "Bool"},
+    "TAG_EMS_MANUAL_CHARGE_ENERGY_COUNTER": {"tagvalue": 0x01000152, "type": "Uint32"},
+    "TAG_EMS_MANUAL_CHARGE_LASTSTART": {"tagvalue": 0x01000153, "type": "Timestamp"},
+    "TAG_EMS_REQ_REMOTE_CONTROL ": {"tagvalue": 0x01000200, "type": "Container"},
+    "TAG_EMS_REQ_DEACTIVATE_REMOTE_CONTROL": {"tagvalue": 0x01000201, "type": "None"},
+    "TAG_EMS_REQ_IP_REMOTE_CONTROL": {"tagvalue": 0x01000202, "type": "None"},
+    "TAG_EMS_REQ_EP_DELAY": {"tagvalue": 0x01000203, "type": "None"},
+    "TAG_EMS_REQ_SET_EP_DELAY": {"tagvalue": 0x01000204, "type": "UChar8"},
+    "TAG_EMS_REQ_REMOTE_CONTROL_STATUS": {"tagvalue": 0x01000205, "type": "None"},
+    "TAG_EMS_REQ_IDLE_PERIOD_MIN_SOC_UCB": {"tagvalue": 0x01000206, "type": "None"},
+    "TAG_EMS_REQ_IDLE_PERIOD_MAX_SOC_UCB": {"tagvalue": 0x01000207, "type": "None"},
+    "TAG_EMS_REQ_SET_IDLE_PERIOD_MIN_SOC_UCB": {
+        "tagvalue": 0x01000208,
+        "type": "UChar8",
+    },
+    "TAG_EMS_REQ_SET_IDLE_PERIOD_MAX_SOC_UCB": {
+        "tagvalue": 0x01000209,
+        "type": "UChar8",
+    },
+    "TAG_EMS_REQ_REGULATOR_MODE": {"tagvalue": 0x01000210, "type": "None"},
+    "TAG_EMS_REQ_SET_REGULATOR_MODE": {"tagvalue": 0x01000211, "type": "UChar8"},
+    "TAG_EMS_REQ_SUPPORTED_REGULATOR_MODES": {"tagvalue": 0x01000212, "type": "None"},
+    "TAG_EMS_REQ_EMERGENCY_POWER_OVERLOAD_STATUS": {
+        "tagvalue": 0x01000213,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_EMERGENCY_POWER_RETRY": {"tagvalue": 0x01000214, "type": "None"},
+    "TAG_EMS_REQ_DETECT_PHASE_OFFSET": {"tagvalue": 0x01000217, "type": "None"},
+    "TAG_EMS_REQ_PHASE_DETECTION_STATUS": {"tagvalue": 0x01000218, "type": "None"},
+    "TAG_EMS_REQ_PHASE_OFFSET": {"tagvalue": 0x01000219, "type": "None"},
+    "TAG_EMS_REQ_ABORT_PHASE_DETECTION": {"tagvalue": 0x01000220, "type": "None"},
+    "TAG_EMS_REQ_REGULATOR_STRATEGY": {"tagvalue": 0x01000221, "type": "None"},
+    "TAG_EMS_REQ_SET_REGULATOR_STRATEGY": {"tagvalue": 0x01000222, "type": "UChar8"},
+    "TAG_EMS_REQ_POWER_PV_AC_OUT": {"tagvalue": 0x01000223, "type": "None"},
+    "TAG_EMS_REQ_PV_ENERGY": {"tagvalue": 0x01000224, "type": "None"},
+    "TAG_EMS_REQ_ENERGY_STORAGE_MODEL": {"tagvalue": 0x01000228, "type": "None"},
+    "TAG_EMS_REQ_SPECIFICATION_VALUES": {"tagvalue": 0x01000234, "type": "None"},
+    "TAG_EMS_REQ_EP_RESERVE": {"tagvalue": 0x01000242, "type": "None"},
+    "TAG_EMS_REQ_SEC_LIMITS": {"tagvalue": 0x01000243, "type": "None"},
+    "TAG_EMS_REQ_SEC_DEVICE_STATUS": {"tagvalue": 0x01000252, "type": "None"},
+    "TAG_EMS_REQ_BAT_CURRENT_IN": {"tagvalue": 0x01000258, "type": "None"},
+    "TAG_EMS_REQ_BAT_CURRENT_OUT": {"tagvalue": 0x01000259, "type": "None"},
+    "TAG_EMS_REQ_MAX_DC_POWER": {"tagvalue": 0x01000260, "type": "None"},
+    "TAG_EMS_REQ_AC_REACTIVE_POWER": {"tagvalue": 0x01000261, "type": "None"},
+    "TAG_EMS_REQ_SET_EP_PARTIAL_GRID": {"tagvalue": 0x01000262, "type": "Bool"},
+    "TAG_EMS_REQ_GET_PARTIAL_GRID": {"tagvalue": 0x01000263, "type": "None"},
+    "TAG_EMS_REQ_ESTIMATED_POWER_LIMITS": {"tagvalue": 0x01000264, "type": "None"},
+    "TAG_EMS_REQ_DESIGN_POWER_LIMITS": {"tagvalue": 0x01000265, "type": "None"},
+    "TAG_EMS_REQ_SET_CAN_ID_FEED_IN_REDUCTION": {
+        "tagvalue": 0x01000266,
+        "type": "Int32",
+    },
+    "TAG_EMS_REQ_CAN_ID_FEED_IN_REDUCTION": {"tagvalue": 0x01000267, "type": "None"},
+    "TAG_EMS_REQ_SET_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01000268, "type": "Int32"},
+    "TAG_EMS_REQ_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01000269, "type": "None"},
+    "TAG_EMS_REQ_SET_WALLBOX_MODE": {"tagvalue": 0x01000270, "type": "UChar8"},
+    "TAG_EMS_REQ_GET_WALLBOX_MODE": {"tagvalue": 0x01000271, "type": "None"},
+    "TAG_EMS_REQ_SET_MAX_FUSE_POWER": {"tagvalue": 0x01000272, "type": "Uint32"},
+    "TAG_EMS_REQ_GET_MAX_FUSE_POWER": {"tagvalue": 0x01000273, "type": "None"},
+    "TAG_EMS_REQ_SET_CONNECTED_POWER": {"tagvalue": 0x01000274, "type": "Uint32"},
+    "TAG_EMS_REQ_GET_CONNECTED_POWER ": {"tagvalue": 0x01000275, "type": "None"},
+    "TAG_EMS_REQ_DERATE_AT_CONNECTED_POWER": {"tagvalue": 0x01000276, "type": "None"},
+    "TAG_EMS_REQ_SET_DERATE_AT_CONNECTED_POWER": {
+        "tagvalue": 0x01000277,
+        "type": "Bool",
+    },
+    "TAG_EMS_REQ_SET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
+        "tagvalue": 0x0100027A,
+        "type": "Bool",
+    },
+    "TAG_EMS_REQ_GET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
+        "tagvalue": 0x0100027B,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_SET_WB_DISCHARGE_BAT_UNTIL": {
+        "tagvalue": 0x0100027C,
+        "type": "UChar8",
+    },
+    "TAG_EMS_REQ_GET_WB_DISCHARGE_BAT_UNTIL": {"tagvalue": 0x0100027D, "type": "None"},
+    "TAG_EMS_REQ_WB_AVAILABLE": {"tagvalue": 0x01000280, "type": "None"},
+    "TAG_EMS_REQ_WB_PREFERRED_CHARGE_POWER": {"tagvalue": 0x01000281, "type": "None"},
+    "TAG_EMS_REQ_SET_PEAK_SHAVING_POWER": {"tagvalue": 0x01000282, "type": "Uint32"},
+    "TAG_EMS_REQ_GET_PEAK_SHAVING_POWER": {"tagvalue": 0x01000283, "type": "None"},
+    "TAG_EMS_REQ_GET_RUNSCREENVALUES": {"tagvalue": 0x01000284, "type": "None"},
+    "TAG_EMS_REQ_SET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01000286, "type": "Container"},
+    "TAG_EMS_REQ_GET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01000287, "type": "None"},
+    "TAG_EMS_REQ_SET_LIST_ACTOR": {"tagvalue": 0x01000288, "type": "Container"},
+    "TAG_EMS_REQ_GET_LIST_ACTOR": {"tagvalue": 0x01000289, "type": "None"},
+    "TAG_EMS_REQ_WB_BIC_LOAD_PRICE_POWER_TABLE": {
+        "tagvalue": 0x01000307,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_WB_BIC_PRICE_POWER_TABLE_STATUS": {
+        "tagvalue": 0x01000308,
+        "type": "None",
+    },
+    "TAG_EMS_REQ_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01000309, "type": "Container"},
+    "TAG_EMS_REQ_SET_OVERRIDE_DERATE_FEEDIN": {
+        "tagvalue": 0x0100030A,
+        "type": "Container",
+    },
+    "TAG_EMS_REQ_GET_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x0100030B, "type": "None"},
+    "TAG_EMS_PARAM_DERATE_POWER_VALUE": {"tagvalue": 0x01040001, "type": "Float32"},
+    "TAG_EMS_PARAM_AVAILABLE_POWER": {"tagvalue": 0x01040002, "type": "Int32"},
+    "TAG_EMS_PARAM_IP_REMOTE_CONTROL": {"tagvalue": 0x01040004, "type": "CString"},
+    "TAG_EMS_PARAM_POWEROFFSET_VALUE": {"tagvalue": 0x01040005, "type": "Int32"},
+    "TAG_EMS_PARAM_POWER_VALUE_L1": {"tagvalue": 0x01040006, "type": "Int32"},
+    "TAG_EMS_PARAM_POWER_VALUE_L2": {"tagvalue": 0x01040007, "type": "Int32"},
+    "TAG_EMS_PARAM_POWER_VALUE_L3": {"tagvalue": 0x01040008, "type": "Int32"},
+    "TAG_EMS_PARAM_SET_POINT": {"tagvalue": 0x01040009, "type": "Int32"},
+    "TAG_EMS_PARAM_DERATE_POWER_VALUE_L1": {"tagvalue": 0x01040010, "type": "Float32"},
+    "TAG_EMS_PARAM_DERATE_POWER_VALUE_L2": {"tagvalue": 0x01040011, "type": "Float32"},
+    "TAG_EMS_PARAM_DERATE_POWER_VALUE_L3": {"tagvalue": 0x01040012, "type": "Float32"},
+    "TAG_EMS_PARAM_REMOTE_CONTROL_ACTIVE": {"tagvalue": 0x01040013, "type": "Bool"},
+    "TAG_EMS_PARAM_TIME_TO_RETRY": {"tagvalue": 0x01040014, "type": "UInt16"},
+    "TAG_EMS_PARAM_NO_REMAINING_RETRY": {"tagvalue": 0x01040015, "type": "UInt16"},
+    "TAG_EMS_PARAM_INDEX": {"tagvalue": 0x01040016, "type": "Int16"},
+    "TAG_EMS_PARAM_WALLBOX_SETPOINT_L1": {"tagvalue": 0x01040017, "type": "Int32"},
+    "TAG_EMS_PARAM_WALLBOX_SETPOINT_L2": {"tagvalue": 0x01040018, "type": "Int32"},
+    "TAG_EMS_PARAM_WALLBOX_SETPOINT_L3": {"tagvalue": 0x01040019, "type": "Int32"},
+    "TAG_EMS_PARAM_REGULATOR_MODE": {"tagvalue": 0x01040113, "type": "UChar8"},
+    "TAG_EMS_PARAM_REGULATOR_STRATEGY": {"tagvalue": 0x01040114, "type": "UChar8"},
+    "TAG_EMS_PARAM_DEACTIVATE_SURPLUS_ACTOR": {
+        "tagvalue": 0x01040115,
+        "type": "UChar8",
+    },
+    "TAG_EMS_PARAM_POWER_GRID_OFFSET_L1": {"tagvalue": 0x01040294, "type": "Uint32"},
+    "TAG_EMS_PARAM_POWER_GRID_OFFSET_L2": {"tagvalue": 0x01040295, "type": "Uint32"},
+    "TAG_EMS_PARAM_POWER_GRID_OFFSET_L3": {"tagvalue": 0x01040296, "type": "Uint32"},
+    "TAG_EMS_PARAM_POWER_GRID_OVERRIDE_L1": {"tagvalue": 0x01040297, "type": "Uint32"},
+    "TAG_EMS_PARAM_POWER_GRID_OVERRIDE_L2": {"tagvalue": 0x01040298, "type": "Uint32"},
+    "TAG_EMS_PARAM_POWER_GRID_OVERRIDE_L3": {"tagvalue": 0x01040299, "type": "Uint32"},
+    "TAG_EMS_REQ_ALIVE": {"tagvalue": 0x01050000, "type": "Bool"},
+    "TAG_EMS_PARAM_MANIPULATOR_STATUS": {"tagvalue": 0x01400000, "type": "Char8"},
+    "TAG_EMS_MANIPULATOR_EVENT": {"tagvalue": 0x01400001, "type": "Container"},
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_MAX_ROWS": {
+        "tagvalue": 0x01400002,
+        "type": "Int16",
+    },
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_TIME_START": {
+        "tagvalue": 0x01400003,
+        "type": "Uint64",
+    },
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_TIME_END": {
+        "tagvalue": 0x01400004,
+        "type": "Uint64",
+    },
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_POWER": {"tagvalue": 0x01400005, "type": "Int32"},
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_TYPE": {"tagvalue": 0x01400006, "type": "Int32"},
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_SOURCE": {
+        "tagvalue": 0x01400007,
+        "type": "CString",
+    },
+    "TAG_EMS_PARAM_MANIPULATOR_EVENT_ID": {"tagvalue": 0x01400008, "type": "CString"},
+    "TAG_EMS_MANIPULATOR_EVENT_PUSH_DATA_SAVED": {
+        "tagvalue": 0x01400009,
+        "type": "CString",
+    },
+    "TAG_EMS_MANIPULATOR_EVENT_PUSH_WAIT_FOR": {
+        "tagvalue": 0x0140000A,
+        "type": "UInt16",
+    },
+    "TAG_EMS_DPP_PROTOCOL_MAJOR_VERSION": {"tagvalue": 0x0140000B, "type": "UInt16"},
+    "TAG_EMS_DPP_PROTOCOL_MINOR_VERSION": {"tagvalue": 0x0140000C, "type": "UInt16"},
+    "TAG_EMS_DPP_ERROR_CODE": {"tagvalue": 0x0140000D, "type": "Int16"},
+    "TAG_EMS_DPP_ERROR_MESSAGE": {"tagvalue": 0x0140000E, "type": "CString"},
+    "TAG_EMS_DPP_CONSTRAINT_SERIAL_NO": {"tagvalue": 0x0140000F, "type": "CString"},
+    "TAG_EMS_DPP_CONSTRAINT_INSTALLATION_ID": {
+        "tagvalue": 0x01400010,
+        "type": "CString",
+    },
+    "TAG_EMS_DPP_CONSTRAINT_START_TIMESTAMP": {
+        "tagvalue": 0x01400011,
+        "type": "Uint64",
+    },
+    "TAG_EMS_DPP_CONSTRAINT_DURATION_MS": {"tagvalue": 0x01400012, "type": "Uint64"},
+    "TAG_EMS_DPP_ENERGY_PRICES_DATA": {"tagvalue": 0x01400013, "type": "Container"},
+    "TAG_EMS_DPP_GRID_CONSUMPTION_DATA": {"tagvalue": 0x01400014, "type": "Container"},
+    "TAG_EMS_DPP_CONSTRAINT_START_OFFSET_MS": {
+        "tagvalue": 0x01400015,
+        "type": "Uint64",
+    },
+    "TAG_EMS_DPP_PRICES": {"tagvalue": 0x01400016, "type": "Container"},
+    "TAG_EMS_DPP_PRICE_LOWER_BORDER": {"tagvalue": 0x01400017, "type": "Int64"},
+    "TAG_EMS_DPP_PRICE_VALUE": {"tagvalue": 0x01400018, "type": "Float32"},
+    "TAG_EMS_DPP_GRID_FEED_IN_DATA": {"tagvalue": 0x01400019, "type": "Container"},
+    "TAG_EMS_PARAM_LIMITS_TOTAL_MAX": {"tagvalue": 0x01400265, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_TOTAL_MIN": {"tagvalue": 0x01400266, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_PHASE_MAX_L1": {"tagvalue": 0x01400267, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_PHASE_MAX_L2": {"tagvalue": 0x01400268, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_PHASE_MAX_L3": {"tagvalue": 0x01400269, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_PHASE_MIN_L1": {"tagvalue": 0x01400270, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_PHASE_MIN_L2": {"tagvalue": 0x01400271, "type": "Int32"},
+    "TAG_EMS_PARAM_LIMITS_PHASE_MIN_L3": {"tagvalue": 0x01400272, "type": "Int32"},
+    "TAG_EMS_PARAM_CURR_CHARGED_ENERGY_EP_RESERVE": {
+        "tagvalue": 0x01400278,
+        "type": "Float32",
+    },
+    "TAG_EMS_REQ_SET_TOTAL_EP_RESERVE_W": {"tagvalue": 0x01400279, "type": "Float32"},
+    "TAG_EMS_IDLE_PERIOD_2": {"tagvalue": 0x0140027A, "type": "Container"},
+    "TAG_EMS_DERATE_TO_PERCENT": {"tagvalue": 0x0140027B, "type": "UChar8"},
+    "TAG_EMS_DERATE_TO_POWER": {"tagvalue": 0x0140027C, "type": "Uint32"},
+    "TAG_EMS_DERATE_UNTIL_TIMESTAMP_MS": {"tagvalue": 0x0140027D, "type": "Uint64"},
+    "TAG_EMS_SMGW_USE_CASES": {"tagvalue": 0x01800000, "type": "Container"},
+    "TAG_EMS_POWER_PV": {"tagvalue": 0x01800001, "type": "Int32"},
+    "TAG_EMS_POWER_BAT": {"tagvalue": 0x01800002, "type": "Int32"},
+    "TAG_EMS_POWER_HOME": {"tagvalue": 0x01800003, "type": "Int32"},
+    "TAG_EMS_POWER_GRID": {"tagvalue": 0x01800004, "type": "Int32"},
+    "TAG_EMS_POWER_ADD": {"tagvalue": 0x01800005, "type": "Int32"},
+    "TAG_EMS_AUTARKY": {"tagvalue": 0x01800006, "type": "Float32"},
+    "TAG_EMS_SELF_CONSUMPTION": {"tagvalue": 0x01800007, "type": "Float32"},
+    "TAG_EMS_BAT_SOC": {"tagvalue": 0x01800008, "type": "UChar8"},
+    "TAG_EMS_COUPLING_MODE": {"tagvalue": 0x01800009, "type": "UChar8"},
+    "TAG_EMS_STORED_ERRORS": {"tagvalue": 0x0180000A, "type": "Container"},
+    "TAG_EMS_ERROR_CONTAINER": {"tagvalue": 0x0180000B, "type": "Container"},
+    "TAG_EMS_ERROR_TYPE": {"tagvalue": 0x0180000C, "type": "UChar8"},
+    "TAG_EMS_ERROR_SOURCE": {"tagvalue": 0x0180000D, "type": "CString"},
+    "TAG_EMS_ERROR_MESSAGE": {"tagvalue": 0x0180000E, "type": "CString"},
+    "TAG_EMS_ERROR_CODE": {"tagvalue": 0x0180000F, "type": "Int32"},
+    "TAG_EMS_ERROR_TIMESTAMP": {"tagvalue": 0x01800010, "type": "Uint64"},
+    "TAG_EMS_MODE": {"tagvalue": 0x01800011, "type": "UChar8"},
+    "TAG_EMS_BALANCED_PHASES": {"tagvalue": 0x01800012, "type": "UChar8"},
+    "TAG_EMS_INSTALLED_PEAK_POWER": {"tagvalue": 0x01800013, "type": "Uint32"},
+    "TAG_EMS_DERATE_AT_PERCENT_VALUE": {"tagvalue": 0x01800014, "type": "Float32"},
+    "TAG_EMS_DERATE_AT_POWER_VALUE": {"tagvalue": 0x01800015, "type": "Float32"},
+    "TAG_EMS_ERROR_BUZZER_ENABLED": {"tagvalue": 0x01800016, "type": "Bool"},
+    "TAG_EMS_SET_BALANCED_PHASES": {"tagvalue": 0x01800017, "type": "Bool"},
+    "TAG_EMS_SET_INSTALLED_PEAK_POWER": {"tagvalue": 0x01800018, "type": "Bool"},
+    "TAG_EMS_SET_DERATE_PERCENT": {"tagvalue": 0x01800019, "type": "Bool"},
+    "TAG_EMS_SET_ERROR_BUZZER_ENABLED": {"tagvalue": 0x0180001A, "type": "Bool"},
+    "TAG_EMS_START_ADJUST_BATTERY_VOLTAGE": {"tagvalue": 0x0180001B, "type": "Bool"},
+    "TAG_EMS_CANCEL_ADJUST_BATTERY_VOLTAGE": {"tagvalue": 0x0180001C, "type": "Bool"},
+    "TAG_EMS_ADJUST_BATTERY_VOLTAGE_STATUS": {"tagvalue": 0x0180001D, "type": "Uint32"},
+    "TAG_EMS_CONFIRM_ERRORS": {"tagvalue": 0x0180001E, "type": "Bool"},
+    "TAG_EMS_POWER_WB_ALL": {"tagvalue": 0x0180001F, "type": "Int32"},
+    "TAG_EMS_POWER_WB_SOLAR": {"tagvalue": 0x01800020, "type": "Int32"},
+    "TAG_EMS_EXT_SRC_AVAILABLE": {"tagvalue": 0x01800021, "type": "Char8"},
+    "TAG_EMS_RESCUE_BAT_MODE": {"tagvalue": 0x01800022, "type": "Bool"},
+    "TAG_EMS_IS_PV_DERATING": {"tagvalue": 0x01800024, "type": "Bool"},
+    "TAG_EMS_AC_POWER_LIMIT": {"tagvalue": 0x01800025, "type": "Container"},
+    "TAG_EMS_POWER_ADD_SINKS": {"tagvalue": 0x01800026, "type": "Int32"},
+    "TAG_EMS_SET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01800027, "type": "Bool"},
+    "TAG_EMS_GET_EP_WALLBOX_ALLOW": {"tagvalue": 0x01800028, "type": "Bool"},
+    "TAG_EMS_SET_MAX_EP_WALLBOX_POWER_W": {"tagvalue": 0x01800029, "type": "Uint32"},
+    "TAG_EMS_GET_MAX_EP_WALLBOX_POWER_W": {"tagvalue": 0x0180002A, "type": "Uint32"},
+    "TAG_EMS_GET_MIN_EP_WALLBOX_POWER_W": {"tagvalue": 0x0180002B, "type": "Uint32"},
+    "TAG_EMS_SET_MIN_EP_WALLBOX_POWER_W": {"tagvalue": 0x0180002C, "type": "Uint32"},
+    "TAG_EMS_SET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0180002D, "type": "Uint32"},
+    "TAG_EMS_GET_EP_WALLBOX_ENERGY": {"tagvalue": 0x0180002E, "type": "Uint32"},
+    "TAG_EMS_SET_IDLE_PERIODS_2": {"tagvalue": 0x0180002F, "type": "UChar8"},
+    "TAG_EMS_SET_POWER": {"tagvalue": 0x01800030, "type": "Int32"},
+    "TAG_EMS_GET_IDLE_PERIODS_2": {"tagvalue": 0x01800033, "type": "Container"},
+    "TAG_EMS_SET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01800034, "type": "Bool"},
+    "TAG_EMS_GET_IDLE_PERIODS_ENABLE": {"tagvalue": 0x01800035, "type": "Bool"},
+    "TAG_EMS_SET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01800038, "type": "Bool"},
+    "TAG_EMS_GET_WB_CHARGE_BAT_UNTIL": {"tagvalue": 0x01800039, "type": "UChar8"},
+    "TAG_EMS_MANIPULATOR_COLLECTION": {"tagvalue": 0x0180003B, "type": "Container"},
+    "TAG_EMS_MANIPULATOR_EVENT_TOTAL_COUNT": {"tagvalue": 0x0180003C, "type": "Int32"},
+    "TAG_EMS_STATUS": {"tagvalue": 0x01800040, "type": "UChar8"},
+    "TAG_EMS_USED_CHARGE_LIMIT": {"tagvalue": 0x01800041, "type": "Int32"},
+    "TAG_EMS_BAT_CHARGE_LIMIT": {"tagvalue": 0x01800042, "type": "Int32"},
+    "TAG_EMS_DCDC_CHARGE_LIMIT": {"tagvalue": 0x01800043, "type": "Int32"},
+    "TAG_EMS_USER_CHARGE_LIMIT": {"tagvalue": 0x01800044, "type": "Int32"},
+    "TAG_EMS_USED_DISCHARGE_LIMIT": {"tagvalue": 0x01800045, "type": "Int32"},
+    "TAG_EMS_BAT_DISCHARGE_LIMIT": {"tagvalue": 0x01800046, "type": "Int32"},
+    "TAG_EMS_DCDC_DISCHARGE_LIMIT": {"tagvalue": 0x01800047, "type": "Int32"},
+    "TAG_EMS_USER_DISCHARGE_LIMIT": {"tagvalue": 0x01800048, "type": "Int32"},
+    "TAG_EMS_SET_POWER_CONTROL_OFFSET": {"tagvalue": 0x01800060, "type": "Int32"},
+    "TAG_EMS_REMAINING_BAT_CHARGE_POWER": {"tagvalue": 0x01800071, "type": "Uint32"},
+    "TAG_EMS_REMAINING_BAT_DISCHARGE_POWER": {"tagvalue": 0x01800072, "type": "Uint32"},
+    "TAG_EMS_EMERGENCY_POWER_STATUS": {"tagvalue": 0x01800073, "type": "UChar8"},
+    "TAG_EMS_SET_EMERGENCY_POWER": {"tagvalue": 0x01800074, "type": "Bool"},
+    "TAG_EMS_SET_OVERRIDE_AVAILABLE_POWER": {"tagvalue": 0x01800075, "type": "Bool"},
+    "TAG_EMS_SET_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01800076, "type": "UChar8"},
+    "TAG_EMS_BATTERY_TO_CAR_MODE": {"tagvalue": 0x01800077, "type": "UChar8"},
+    "TAG_EMS_SET_BATTERY_BEFORE_CAR_MODE": {"tagvalue": 0x01800078, "type": "UChar8"},
+    "TAG_EMS_BATTERY_BEFORE_CAR_MODE": {"tagvalue": 0x01800079, "type": "UChar8"},
+    "TAG_EMS_GET_IDLE_PERIODS": {"tagvalue": 0x01800080, "type": "Container"},
+    "TAG_EMS_SET_IDLE_PERIODS": {"tagvalue": 0x01800081, "type": "UChar8"},
+    "TAG_EMS_IDLE_PERIOD_CHANGE_MARKER": {"tagvalue": 0x0180008A, "type": "UChar8"},
+    "TAG_EMS_GET_POWER_SETTINGS": {"tagvalue": 0x0180008B, "type": "Container"},
+    "TAG_EMS_SET_POWER_SETTINGS": {"tagvalue": 0x0180008C, "type": "Container"},
+    "TAG_EMS_SETTINGS_CHANGE_MARKER": {"tagvalue": 0x0180008D, "type": "UChar8"},
+    "TAG_EMS_GET_MANUAL_CHARGE": {"tagvalue": 0x0180008E, "type": "Container"},
+    "TAG_EMS_START_MANUAL_CHARGE": {"tagvalue": 0x0180008F, "type": "Bool"},
+    "TAG_EMS_START_EMERGENCYPOWER_TEST": {"tagvalue": 0x01800090, "type": "UChar8"},
+    "TAG_EMS_GET_GENERATOR_STATE": {"tagvalue": 0x01800091, "type": "UChar8"},
+    "TAG_EMS_SET_GENERATOR_MODE": {"tagvalue": 0x01800092, "type": "UChar8"},
+    "TAG_EMS_EMERGENCYPOWER_TEST_STATUS": {"tagvalue": 0x01800093, "type": "Container"},
+    "TAG_EMS_GET_SYS_SPECS": {"tagvalue": 0x01800098, "type": "Container"},
+    "TAG_EMS_RES_POWER_LIMITS_USED": {"tagvalue": 0x01800100, "type": "Char8"},
+    "TAG_EMS_RES_MAX_CHARGE_POWER": {"tagvalue": 0x01800101, "type": "Char8"},
+    "TAG_EMS_RES_MAX_DISCHARGE_POWER": {"tagvalue": 0x01800102, "type": "Char8"},
+    "TAG_EMS_RES_DISCHARGE_START_POWER": {"tagvalue": 0x01800103, "type": "Char8"},
+    "TAG_EMS_RES_POWERSAVE_ENABLED": {"tagvalue": 0x01800104, "type": "Char8"},
+    "TAG_EMS_RES_WEATHER_REGULATED_CHARGE_ENABLED": {
+        "tagvalue": 0x01800105,
+        "type": "Char8",
+    },
+    "TAG_EMS_RES_WEATHER_FORECAST_MODE": {"tagvalue": 0x01800106, "type": "Char8"},
+    "TAG_EMS_RES_POWERSAVE_TIMEOUT": {"tagvalue": 0x01800107, "type": "Uint32"},
+    "TAG_EMS_REMOTE_CONTROL ": {"tagvalue": 0x01800200, "type": "UChar8"},
+    "TAG_EMS_DEACTIVATE_REMOTE_CONTROL": {"tagvalue": 0x01800201, "type": "UChar8"},
+    "TAG_EMS_IP_REMOTE_CONTROL": {"tagvalue": 0x01800202, "type": "CString"},
+    "TAG_EMS_EP_DELAY": {"tagvalue": 0x01800203, "type": "UChar8"},
+    "TAG_EMS_SET_EP_DELAY": {"tagvalue": 0x01800204, "type": "UChar8"},
+    "TAG_EMS_REMOTE_CONTROL_STATUS": {"tagvalue": 0x01800205, "type": "Container"},
+    "TAG_EMS_IDLE_PERIOD_MIN_SOC_UCB": {"tagvalue": 0x01800206, "type": "UChar8"},
+    "TAG_EMS_IDLE_PERIOD_MAX_SOC_UCB": {"tagvalue": 0x01800207, "type": "UChar8"},
+    "TAG_EMS_SET_IDLE_PERIOD_MIN_SOC_UCB": {"tagvalue": 0x01800208, "type": "UChar8"},
+    "TAG_EMS_SET_IDLE_PERIOD_MAX_SOC_UCB": {"tagvalue": 0x01800209, "type": "UChar8"},
+    "TAG_EMS_REGULATOR_MODE": {"tagvalue": 0x01800210, "type": "UChar8"},
+    "TAG_EMS_SET_REGULATOR_MODE": {"tagvalue": 0x01800211, "type": "UChar8"},
+    "TAG_EMS_SUPPORTED_REGULATOR_MODES": {"tagvalue": 0x01800212, "type": "UChar8"},
+    "TAG_EMS_EMERGENCY_POWER_OVERLOAD_STATUS": {
+        "tagvalue": 0x01800213,
+        "type": "Container",
+    },
+    "TAG_EMS_EMERGENCY_POWER_RETRY": {"tagvalue": 0x01800214, "type": "Bool"},
+    "TAG_EMS_DETECT_PHASE_OFFSET": {"tagvalue": 0x01800217, "type": "UChar8"},
+    "TAG_EMS_PHASE_DETECTION_STATUS": {"tagvalue": 0x01800218, "type": "UChar8"},
+    "TAG_EMS_PHASE_OFFSET": {"tagvalue": 0x01800219, "type": "UChar8"},
+    "TAG_EMS_ABORT_PHASE_DETECTION": {"tagvalue": 0x01800220, "type": "UChar8"},
+    "TAG_EMS_REGULATOR_STRATEGY": {"tagvalue": 0x01800221, "type": "UChar8"},
+    "TAG_EMS_SET_REGULATOR_STRATEGY": {"tagvalue": 0x01800222, "type": "UChar8"},
+    "TAG_EMS_POWER_PV_AC_OUT": {"tagvalue": 0x01800223, "type": "Container"},
+    "TAG_EMS_PV_ENERGY": {"tagvalue": 0x01800224, "type": "Container"},
+    "TAG_EMS_PARAM_AC_ENERGY_OUT": {"tagvalue": 0x01800225, "type": "UInt16"},
+    "TAG_EMS_PARAM_AC_ENERGY_IN": {"tagvalue": 0x01800226, "type": "UInt16"},
+    "TAG_EMS_PARAM_DC_IN": {"tagvalue": 0x01800227, "type": "UInt16"},
+    "TAG_EMS_ENERGY_STORAGE_MODEL": {"tagvalue": 0x01800228, "type": "Container"},
+    "TAG_EMS_PARAM_CURR_CHARGED_ENERGY": {"tagvalue": 0x01800229, "type": "Float32"},
+    "TAG_EMS_PARAM_FULL_CHARGED_ENERGY_EP_RESERVE": {
+        "tagvalue": 0x01800230,
+        "type": "Float32",
+    },
+    "TAG_EMS_PARAM_DESIGN_ENERGY": {"tagvalue": 0x01800231, "type": "Float32"},
+    "TAG_EMS_PARAM_FULL_CHARGED_ENERGY": {"tagvalue": 0x01800232, "type": "Float32"},
+    "TAG_EMS_PARAM_USED_CAPACITY": {"tagvalue": 0x01800233, "type": "Float32"},
+    "TAG_EMS_SPECIFICATION_VALUES": {"tagvalue": 0x01800234, "type": "Container"},
+    "TAG_EMS_PARAM_MAX_CHARGE_POWER": {"tagvalue": 0x01800235, "type": "Int32"},
+    "TAG_EMS_PARAM_MAX_DISCHARGE_POWER": {"tagvalue": 0x01800236, "type": "Int32"},
+    "TAG_EMS_PARAM_MAX_PV_POWER": {"tagvalue": 0x01800237, "type": "Int32"},
+    "TAG_EMS_PARAM_MAX_AC_POWER": {"tagvalue": 0x01800238, "type": "Int32"},
+    "TAG_EMS_PARAM_INSTALLED_BAT_CAP": {"tagvalue": 0x01800239, "type": "Int32"},
+    "TAG_EMS_PARAM_HYBRIT_SUPPORTED": {"tagvalue": 0x01800240, "type": "Bool"},
+    "TAG_EMS_PARAM_INIT_STATUS": {"tagvalue": 0x01800241, "type": "Int32"},
+    "TAG_EMS_EP_RESERVE": {"tagvalue": 0x01800242, "type": "Float32"},
+    "TAG_EMS_SEC_LIMITS": {"tagvalue": 0x01800243, "type": "Container"},
+    "TAG_EMS_PARAM_SEL_TOTAL_MAX": {"tagvalue": 0x01800244, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_TOTAL_MIN": {"tagvalue": 0x01800245, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_PHASE_MAX_L1": {"tagvalue": 0x01800246, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_PHASE_MAX_L2": {"tagvalue": 0x01800247, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_PHASE_MAX_L3": {"tagvalue": 0x01800248, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_PHASE_MIN_L1": {"tagvalue": 0x01800249, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_PHASE_MIN_L2": {"tagvalue": 0x01800250, "type": "Int32"},
+    "TAG_EMS_PARAM_SEL_PHASE_MIN_L3": {"tagvalue": 0x01800251, "type": "Int32"},
+    "TAG_EMS_SEC_DEVICE_STATUS": {"tagvalue": 0x01800252, "type": "Container"},
+    "TAG_EMS_PARAM_PVI_1": {"tagvalue": 0x01800253, "type": "Uint32"},
+    "TAG_EMS_PARAM_PVI_2": {"tagvalue": 0x01800254, "type": "Uint32"},
+    "TAG_EMS_PARAM_PVI_3": {"tagvalue": 0x01800255, "type": "Uint32"},
+    "TAG_EMS_PARAM_DCDC": {"tagvalue": 0x01800256, "type": "Uint32"},
+    "TAG_EMS_PARAM_BAT": {"tagvalue": 0x01800257, "type": "Uint32"},
+    "TAG_EMS_BAT_CURRENT_IN": {"tagvalue": 0x01800258, "type": "Float32"},
+    "TAG_EMS_BAT_CURRENT_OUT": {"tagvalue": 0x01800259, "type": "Float32"},
+    "TAG_EMS_MAX_DC_POWER": {"tagvalue": 0x01800260, "type": "Container"},
+    "TAG_EMS_AC_REACTIVE_POWER": {"tagvalue": 0x01800261, "type": "Container"},
+    "TAG_EMS_GET_PARTIAL_GRID": {"tagvalue": 0x01800263, "type": "Bool"},
+    "TAG_EMS_ESTIMATED_POWER_LIMITS": {"tagvalue": 0x01800264, "type": "Container"},
+    "TAG_EMS_DESIGN_POWER_LIMITS": {"tagvalue": 0x01800265, "type": "Container"},
+    "TAG_EMS_SET_CAN_ID_FEED_IN_REDUCTION": {"tagvalue": 0x01800266, "type": "Int32"},
+    "TAG_EMS_CAN_ID_FEED_IN_REDUCTION": {"tagvalue": 0x01800267, "type": "Int32"},
+    "TAG_EMS_SET_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01800268, "type": "Int32"},
+    "TAG_EMS_CAN_ID_UNBALANCED_LOAD": {"tagvalue": 0x01800269, "type": "Int32"},
+    "TAG_EMS_SET_WALLBOX_MODE": {"tagvalue": 0x01800270, "type": "UChar8"},
+    "TAG_EMS_GET_WALLBOX_MODE": {"tagvalue": 0x01800271, "type": "UChar8"},
+    "TAG_EMS_SET_MAX_FUSE_POWER": {"tagvalue": 0x01800272, "type": "Uint32"},
+    "TAG_EMS_GET_MAX_FUSE_POWER": {"tagvalue": 0x01800273, "type": "Uint32"},
+    "TAG_EMS_SET_CONNECTED_POWER": {"tagvalue": 0x01800274, "type": "Uint32"},
+    "TAG_EMS_GET_CONNECTED_POWER": {"tagvalue": 0x01800275, "type": "Uint32"},
+    "TAG_EMS_DERATE_AT_CONNECTED_POWER": {"tagvalue": 0x01800276, "type": "Bool"},
+    "TAG_EMS_SET_DERATE_AT_CONNECTED_POWER": {"tagvalue": 0x01800277, "type": "Bool"},
+    "TAG_EMS_SET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
+        "tagvalue": 0x0180027A,
+        "type": "Bool",
+    },
+    "TAG_EMS_GET_WALLBOX_ENFORCE_POWER_ASSIGNMENT": {
+        "tagvalue": 0x0180027B,
+        "type": "Bool",
+    },
+    "TAG_EMS_SET_WB_DISCHARGE_BAT_UNTIL": {"tagvalue": 0x0180027C, "type": "Bool"},
+    "TAG_EMS_GET_WB_DISCHARGE_BAT_UNTIL": {"tagvalue": 0x0180027D, "type": "UChar8"},
+    "TAG_EMS_WB_AVAILABLE": {"tagvalue": 0x01800280, "type": "Bool"},
+    "TAG_EMS_WB_PREFERRED_CHARGE_POWER": {"tagvalue": 0x01800281, "type": "Int32"},
+    "TAG_EMS_SET_PEAK_SHAVING_POWER": {"tagvalue": 0x01800282, "type": "None"},
+    "TAG_EMS_GET_PEAK_SHAVING_POWER": {"tagvalue": 0x01800283, "type": "Uint32"},
+    "TAG_EMS_GET_RUNSCREENVALUES": {"tagvalue": 0x01800284, "type": "Container"},
+    "TAG_EMS_SET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01800286, "type": "UInt16"},
+    "TAG_EMS_GET_PEAK_SHAVING_TIMES": {"tagvalue": 0x01800287, "type": "Container"},
+    "TAG_EMS_SET_LIST_ACTOR": {"tagvalue": 0x01800288, "type": "UInt16"},
+    "TAG_EMS_GET_LIST_ACTOR": {"tagvalue": 0x01800289, "type": "Container"},
+    "TAG_EMS_ACTOR_ITEM": {"tagvalue": 0x01800290, "type": "Container"},
+    "TAG_EMS_ACTOR_ID": {"tagvalue": 0x01800291, "type": "CString"},
+    "TAG_EMS_ACTOR_NAME": {"tagvalue": 0x01800292, "type": "CString"},
+    "TAG_EMS_ACTOR_PRIORITY": {"tagvalue": 0x01800293, "type": "Uint32"},
+    "TAG_EMS_PERIOD_ITEM": {"tagvalue": 0x01800300, "type": "Container"},
+    "TAG_EMS_PERIOD_ACTIVE": {"tagvalue": 0x01800301, "type": "Bool"},
+    "TAG_EMS_PERIOD_NAME": {"tagvalue": 0x01800302, "type": "CString"},
+    "TAG_EMS_PERIOD_WEEKDAYS": {"tagvalue": 0x01800303, "type": "UChar8"},
+    "TAG_EMS_PERIOD_START": {"tagvalue": 0x01800304, "type": "Uint32"},
+    "TAG_EMS_PERIOD_STOP": {"tagvalue": 0x01800305, "type": "Uint32"},
+    "TAG_EMS_PERIOD_POWER": {"tagvalue": 0x01800306, "type": "Int32"},
+    "TAG_EMS_WB_BIC_LOAD_PRICE_POWER_TABLE": {"tagvalue": 0x01800307, "type": "Bool"},
+    "TAG_EMS_WB_BIC_PRICE_POWER_TABLE_STATUS": {"tagvalue": 0x01800308, "type": "None"},
+    "TAG_EMS_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01800309, "type": "Bool"},
+    "TAG_EMS_ALIVE": {"tagvalue": 0x01850000, "type": "None"},
+    "TAG_EMS_SET_TOTAL_EP_RESERVE_W": {"tagvalue": 0x01C00279, "type": "Bool"},
+    "TAG_EMS_SET_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01C0027A, "type": "Bool"},
+    "TAG_EMS_GET_OVERRIDE_DERATE_FEEDIN": {"tagvalue": 0x01C0027B, "type": "Container"},
+    "TAG_EMS_GENERAL_ERROR": {"tagvalue": 0x01FFFFFF, "type": "Error"},
+}
@@ -0,0 +1,42 @@
+"RSCP tags of the EMSHB namespace, tag codes 0x17xxxxxx."
+
+TAGS = {
+    "TAG_EMSHB_REQ_HB_DATA": {"tagvalue": 0x17000001, "type": "None"},
+    "TAG_EMSHB_PARAM_VERSION": {"tagvalue": 0x17040000, "type": "UInt16"},
+    "TAG_EMSHB_PARAM_BAT_S1": {"tagvalue": 0x17040001, "type": "Int32"},
+    "TAG_EMSHB_PARAM_BAT_S2": {"tagvalue": 0x17040002, "type": "Int32"},
+    "TAG_EMSHB_PARAM_BAT_S3": {"tagvalue": 0x17040003, "type": "Int32"},
+    "TAG_EMSHB_PARAM_LM1": {"tagvalue": 0x17040004, "type": "Int32"},
+    "TAG_EMSHB_PARAM_LM2": {"tagvalue": 0x17040005, "type": "Int32"},
+    "TAG_EMSHB_PARAM_LM3": {"tagvalue": 0x17040006, "type": "Int32"},
+    "TAG_EMSHB_PARAM_AC_L1": {"tagvalue": 0x17040007, "type": "Int32"},
+    "TAG_EMSHB_PARAM_AC_L2": {"tagvalue": 0x17040008, "type": "Int32"},
+    "TAG_EMSHB_PARAM_AC_L3": {"tagvalue": 0x17040009, "type": "Int32"},
+    "TAG_EMSHB_PARAM_C_L1": {"tagvalue": 0x17040010, "type": "Int32"},
+    "TAG_EMSHB_PARAM_C_L2": {"tagvalue": 0x17040011, "type": "Int32"},
+    "TAG_EMSHB_PARAM_C_L3": {"tagvalue": 0x17040012, "type": "Int32"},
+    "TAG_EMSHB_PARAM_SOC": {"tagvalue": 0x17040013, "type": "Int32"},
+    "TAG_EMSHB_PARAM_SYS_STATUS": {"tagvalue": 0x17040014, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB": {"tagvalue": 0x17040015, "type": "Container"},
+    "TAG_EMSHB_PARAM_WB_INDEX": {"tagvalue": 0x17040016, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_L1": {"tagvalue": 0x17040017, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_L2": {"tagvalue": 0x17040018, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_L3": {"tagvalue": 0x17040019, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_L1_Active": {"tagvalue": 0x17040020, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_L2_Active": {"tagvalue": 0x17040021, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_L3_Active": {"tagvalue": 0x17040022, "type": "Int32"},
+    "TAG_EMSHB_PARAM_PV_S1": {"tagvalue": 0x17040023, "type": "Int32"},
+    "TAG_EMSHB_PARAM_PV_S2": {"tagvalue": 0x17040024, "type": "Int32"},
+    "TAG_EMSHB_PARAM_PV_S3": {"tagvalue": 0x17040025, "type": "Int32"},
+    "TAG_EMSHB_PARAM_LM": {"tagvalue": 0x17040026, "type": "Container"},
+    "TAG_EMSHB_PARAM_ID": {"tagvalue": 0x17040027, "type": "Int32"},
+    "TAG_EMSHB_PARAM_L1": {"tagvalue": 0x17040028, "type": "Int32"},
+    "TAG_EMSHB_PARAM_L2": {"tagvalue": 0x17040029, "type": "Int32"},
+    "TAG_EMSHB_PARAM_L3": {"tagvalue": 0x17040030, "type": "Int32"},
+    "TAG_EMSHB_PARAM_LM_ALIVE_FLAG": {"tagvalue": 0x17040031, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_ALIVE_FLAG": {"tagvalue": 0x17040032, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_SOLAR_L1": {"tagvalue": 0x17040033, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_SOLAR_L2": {"tagvalue": 0x17040034, "type": "Int32"},
+    "TAG_EMSHB_PARAM_WB_SOLAR_L3": {"tagvalue": 0x17040035, "type": "Int32"},
+    "TAG_EMSHB_HB_DATA": {"tagvalue": 0x17800001, "type": "Container"},
+}
@@ -0,0 +1,32 @@
+"RSCP tags of the EMSPR namespace, tag codes 0x1Exxxxxx."
+
+TAGS = {
+    "TAG_EMSPR_REQ_GET_EQUATIONS": {"tagvalue": 0x1E000001, "type": "None"},
+    "TAG_EMSPR_REQ_SET_EQUATIONS": {"tagvalue": 0x1E000002, "type": "Container"},
+    "TAG_EMSPR_REQ_GET_ACTIVE": {"tagvalue": 0x1E000003, "type": "None"},
+    "TAG_EMSPR_REQ_GET_PINCOUNT": {"tagvalue": 0x1E000004, "type": "None"},
+    "TAG_EMSPR_REQ_SET_PINCOUNT": {"tagvalue": 0x1E000005, "type": "UChar8"},
+    "TAG_EMSPR_REQ_CHANGECOUNTER": {"tagvalue": 0x1E000006, "type": "None"},
+    "TAG_EMSPR_REQ_GET_INVERTERENABLING": {"tagvalue": 0x1E000007, "type": "None"},
+    "TAG_EMSPR_REQ_SET_INVERTERENABLING": {"tagvalue": 0x1E000008, "type": "Bool"},
+    "TAG_EMSPR_REQ_GET_INVERTERENABLEWAIT": {"tagvalue": 0x1E00000B, "type": "None"},
+    "TAG_EMSPR_REQ_SET_INVERTERENABLEWAIT": {"tagvalue": 0x1E00000C, "type": "UInt16"},
+    "TAG_EMSPR_RSP_GET_EQUATIONS": {"tagvalue": 0x1E800001, "type": "Container"},
+    "TAG_EMSPR_RSP_SET_EQUATIONS": {"tagvalue": 0x1E800002, "type": "Uint32"},
+    "TAG_EMSPR_RSP_GET_ACTIVE": {"tagvalue": 0x1E800003, "type": "Container"},
+    "TAG_EMSPR_RSP_GET_PINCOUNT": {"tagvalue": 0x1E800004, "type": "UChar8"},
+    "TAG_EMSPR_RSP_SET_PINCOUNT": {"tagvalue": 0x1E800005, "type": "UChar8"},
+    "TAG_EMSPR_RSP_CHANGECOUNTER": {"tagvalue": 0x1E800006, "type": "UInt16"},
+    "TAG_EMSPR_RSP_GET_INVERTERENABLING": {"tagvalue": 0x1E800007, "type": "Bool"},
+    "TAG_EMSPR_RSP_SET_INVERTERENABLING": {"tagvalue": 0x1E800008, "type": "Bool"},
+    "TAG_EMSPR_RSP_GET_INVERTERENABLEWAIT": {"tagvalue": 0x1E80000B, "type": "UInt16"},
+    "TAG_EMSPR_RSP_SET_INVERTERENABLEWAIT": {"tagvalue": 0x1E80000C, "type": "UInt16"},
+    "TAG_EMSPR_EQUATION": {"tagvalue": 0x1E860001, "type": "Container"},
+    "TAG_EMSPR_INPUT": {"tagvalue": 0x1E860002, "type": "Uint32"},
+    "TAG_EMSPR_MASK": {"tagvalue": 0x1E860003, "type": "Uint32"},
+    "TAG_EMSPR_INVALID": {"tagvalue": 0x1E860004, "type": "Uint32"},
+    "TAG_EMSPR_OUTPUT": {"tagvalue": 0x1E860005, "type": "Double64"},
+    "TAG_EMSPR_ISACTIVE": {"tagvalue": 0x1E860006, "type": "Bool"},
+    "TAG_EMSPR_FAILURESTATE": {"tagvalue": 0x1E860007, "type": "Bool"},
+    "TAG_EMSPR_INVERTERENABLED": {"tagvalue": 0x1E860008, "type": "Bool"},
+}
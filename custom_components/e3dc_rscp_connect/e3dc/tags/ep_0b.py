@@ -0,0 +1,26 @@
+"RSCP tags of the EP namespace, tag codes 0x0Bxxxxxx."
+
+TAGS = {
+    "TAG_EP_REQ_SWITCH_TO_GRID": {"tagvalue": 0x0B000001, "type": "None"},
+    "TAG_EP_REQ_SWITCH_TO_ISLAND": {"tagvalue": 0x0B000002, "type": "None"},
+    "TAG_EP_REQ_IS_READY_FOR_SWITCH": {"tagvalue": 0x0B000003, "type": "None"},
+    "TAG_EP_REQ_IS_GRID_CONNECTED": {"tagvalue": 0x0B000004, "type": "None"},
+    "TAG_EP_REQ_IS_ISLAND_GRID": {"tagvalue": 0x0B000005, "type": "None"},
+    "TAG_EP_REQ_IS_INVALID_STATE": {"tagvalue": 0x0B000006, "type": "None"},
+    "TAG_EP_REQ_IS_POSSIBLE": {"tagvalue": 0x0B000007, "type": "None"},
+    "TAG_EP_REQ_LEAVE_INVALID_STATE_TO_ISLAND": {
+        "tagvalue": 0x0B000008,
+        "type": "None",
+    },
+    "TAG_EP_REQ_LEAVE_INVALID_STATE_TO_GRID": {"tagvalue": 0x0B000009, "type": "None"},
+    "TAG_EP_SWITCH_TO_GRID": {"tagvalue": 0x0B800001, "type": "Bool"},
+    "TAG_EP_SWITCH_TO_ISLAND": {"tagvalue": 0x0B800002, "type": "Bool"},
+    "TAG_EP_IS_READY_FOR_SWITCH": {"tagvalue": 0x0B800003, "type": "Bool"},
+    "TAG_EP_IS_GRID_CONNECTED": {"tagvalue": 0x0B800004, "type": "Bool"},
+    "TAG_EP_IS_ISLAND_GRID": {"tagvalue": 0x0B800005, "type": "Bool"},
+    "TAG_EP_IS_INVALID_STATE": {"tagvalue": 0x0B800006, "type": "Bool"},
+    "TAG_EP_IS_POSSIBLE": {"tagvalue": 0x0B800007, "type": "Bool"},
+    "TAG_EP_LEAVE_INVALID_STATE_TO_ISLAND": {"tagvalue": 0x0B800008, "type": "Bool"},
+    "TAG_EP_LEAVE_INVALID_STATE_TO_GRID": {"tagvalue": 0x0B800009, "type": "Bool"},
+    "TAG_EP_GENERAL_ERROR": {"tagvalue": 0x0BFFFFFF, "type": "Container"},
+}
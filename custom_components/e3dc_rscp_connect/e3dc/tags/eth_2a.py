@@ -0,0 +1,35 @@
+"RSCP tags of the ETH namespace, tag codes 0x2Axxxxxx."
+
+TAGS = {
+    "TAG_ETH_REQ_SET_SEARCH_ACTIVE": {"tagvalue": 0x2A000001, "type": "Container"},
+    "TAG_ETH_REQ_LIST_NON_CONNECTED_DEVICES": {"tagvalue": 0x2A000002, "type": "None"},
+    "TAG_ETH_REQ_CONNECT_TO_DEVICE": {"tagvalue": 0x2A000003, "type": "Container"},
+    "TAG_ETH_REQ_IS_SCANNING": {"tagvalue": 0x2A000004, "type": "None"},
+    "TAG_ETH_REQ_DISCONNECT_FROM_DEVICE": {"tagvalue": 0x2A000005, "type": "Container"},
+    "TAG_ETH_REQ_LIST_CONNECTED_DEVICES": {"tagvalue": 0x2A000006, "type": "None"},
+    "TAG_ETH_REQ_APPLY_WB_PRECONFIG": {"tagvalue": 0x2A000007, "type": "None"},
+    "TAG_ETH_PARAM_SEARCH_ACTIVE": {"tagvalue": 0x2A400001, "type": "Bool"},
+    "TAG_ETH_PARAM_AUTO_ACCEPT": {"tagvalue": 0x2A400002, "type": "Bool"},
+    "TAG_ETH_PARAM_EXTERN_CONFIGURATOR_DEVICE_ID": {
+        "tagvalue": 0x2A400003,
+        "type": "Uint32",
+    },
+    "TAG_ETH_PARAM_AUTO_ACCEPT_VALUES": {"tagvalue": 0x2A400004, "type": "Container"},
+    "TAG_ETH_PARAM_DEVICE": {"tagvalue": 0x2A400005, "type": "Container"},
+    "TAG_ETH_PARAM_DEVICE_NAME": {"tagvalue": 0x2A400006, "type": "CString"},
+    "TAG_ETH_PARAM_SERIAL_NUMBER": {"tagvalue": 0x2A400007, "type": "CString"},
+    "TAG_ETH_PARAM_LOCAL_ID": {"tagvalue": 0x2A400008, "type": "CString"},
+    "TAG_ETH_PARAM_MAC_ADDRESS": {"tagvalue": 0x2A400009, "type": "CString"},
+    "TAG_ETH_PARAM_IP_ADDRESS": {"tagvalue": 0x2A40000A, "type": "CString"},
+    "TAG_ETH_PARAM_TIMEOUT": {"tagvalue": 0x2A40000B, "type": "Uint64"},
+    "TAG_ETH_PARAM_DISCONNECTED": {"tagvalue": 0x2A40000C, "type": "Bool"},
+    "TAG_ETH_PARAM_CONNECTION_SUCCESS": {"tagvalue": 0x2A40000D, "type": "Bool"},
+    "TAG_ETH_PARAM_DEVICE_ID": {"tagvalue": 0x2A40000E, "type": "UChar8"},
+    "TAG_ETH_PARAM_NUMBER_OF_DEVICES": {"tagvalue": 0x2A40000F, "type": "UChar8"},
+    "TAG_ETH_SET_SEARCH_ACTIVE": {"tagvalue": 0x2A800001, "type": "Bool"},
+    "TAG_ETH_LIST_NON_CONNECTED_DEVICES": {"tagvalue": 0x2A800002, "type": "Container"},
+    "TAG_ETH_CONNECT_TO_DEVICE": {"tagvalue": 0x2A800003, "type": "Container"},
+    "TAG_ETH_IS_SCANNING": {"tagvalue": 0x2A800004, "type": "Bool"},
+    "TAG_ETH_DISCONNECT_FROM_DEVICE": {"tagvalue": 0x2A800005, "type": "Container"},
+    "TAG_ETH_LIST_CONNECTED_DEVICES": {"tagvalue": 0x2A800006, "type": "Container"},
+}
@@ -0,0 +1,14 @@
+"RSCP tags of the FARM namespace, tag codes 0x1Axxxxxx."
+
+TAGS = {
+    "TAG_FARM_REQ_CONNECTED_DEVICES": {"tagvalue": 0x1A000001, "type": "None"},
+    "TAG_FARM_REQ_CONNECTED_DEVICES_REV": {"tagvalue": 0x1A000003, "type": "None"},
+    "TAG_FARM_REQ_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x1A000004, "type": "None"},
+    "TAG_FARM_PARAM_DEVICE": {"tagvalue": 0x1A040000, "type": "Container"},
+    "TAG_FARM_PARAM_SERIALNO": {"tagvalue": 0x1A040001, "type": "CString"},
+    "TAG_FARM_PARAM_CNAME": {"tagvalue": 0x1A040002, "type": "CString"},
+    "TAG_FARM_CONNECTED_DEVICES_REV": {"tagvalue": 0x1A040003, "type": "Int32"},
+    "TAG_FARM_PARAM_SHORT_ID": {"tagvalue": 0x1A400001, "type": "CString"},
+    "TAG_FARM_CONNECTED_DEVICES": {"tagvalue": 0x1A800001, "type": "Container"},
+    "TAG_FARM_LIST_AVAILABLE_DEVICES": {"tagvalue": 0x1A800002, "type": "Container"},
+}
@@ -0,0 +1,192 @@
+"RSCP tags of the GAPP namespace, tag codes 0x1Dxxxxxx."
+
+TAGS = {
+    "TAG_GAPP_REQ_DEV_COUNT": {"tagvalue": 0x1D000001, "type": "None"},
+    "TAG_GAPP_REQ_SERIALNO": {"tagvalue": 0x1D000002, "type": "UChar8"},
+    "TAG_GAPP_REQ_SUPPORTED_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D000003,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_REQ_ENABLED_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D000004,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_REQ_SET_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D000005,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_SET_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
+        "tagvalue": 0x1D000006,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
+        "tagvalue": 0x1D000007,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_SUPPORTED_ACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D000008,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_REQ_ENABLED_ACTIVE_POWER_FUNCTIONS_PU": {
+        "tagvalue": 0x1D000009,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_REQ_SET_ACTIVE_POWER_FUNCTIONS_PU": {
+        "tagvalue": 0x1D00000A,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_SET_ACTIVE_POWER_FUNCTIONS_PU_PARAMETER": {
+        "tagvalue": 0x1D00000B,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_ACTIVE_POWER_FUNCTION_PU_PARAMETER": {
+        "tagvalue": 0x1D00000C,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_REACTIVE_POWER_SETTINGS_EQUAL": {
+        "tagvalue": 0x1D00000D,
+        "type": "None",
+    },
+    "TAG_GAPP_REQ_ACTIVE_POWER_SETTINGS_EQUAL": {
+        "tagvalue": 0x1D00000E,
+        "type": "None",
+    },
+    "TAG_GAPP_REQ_SUPPORTED_GRID_PROTECTION_FUNCTIONS": {
+        "tagvalue": 0x1D00000F,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_REQ_GRID_PROTECTION_FUNCTION_PARAMETER": {
+        "tagvalue": 0x1D000010,
+        "type": "Container",
+    },
+    "TAG_GAPP_REQ_SET_GRID_PROTECTION_FUNCTION_PARAMETER": {
+        "tagvalue": 0x1D000011,
+        "type": "Container",
+    },
+    "TAG_GAPP_PARAM_INDEX": {"tagvalue": 0x1D040000, "type": "UChar8"},
+    "TAG_GAPP_PARAM_SERIALNO": {"tagvalue": 0x1D040001, "type": "CString"},
+    "TAG_GAPP_PARAM_REACTIVE_POWER_FUNCTION": {
+        "tagvalue": 0x1D040002,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_PARAM_ACTIVE_POWER_FUNCTION_PU": {
+        "tagvalue": 0x1D040003,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER": {"tagvalue": 0x1D040004, "type": "Container"},
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_FUNCTION": {
+        "tagvalue": 0x1D040005,
+        "type": "Uint32",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_LIST": {
+        "tagvalue": 0x1D040006,
+        "type": "Container",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_LIST_ENTRY": {
+        "tagvalue": 0x1D040007,
+        "type": "Container",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_SCALE_FACTOR_X": {
+        "tagvalue": 0x1D040008,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_SCALE_FACTOR_Y": {
+        "tagvalue": 0x1D040009,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_MAX": {
+        "tagvalue": 0x1D040010,
+        "type": "Int16",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_MIN": {
+        "tagvalue": 0x1D040011,
+        "type": "Int16",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE": {"tagvalue": 0x1D040012, "type": "Int16"},
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_VALUE_INIT": {
+        "tagvalue": 0x1D040013,
+        "type": "Int16",
+    },
+    "TAG_GAPP_PARAM_SUPPORTED_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D040014,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_PARAM_SUPPORTED_ACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D040015,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_PARAM_SUCCESS": {"tagvalue": 0x1D040016, "type": "UChar8"},
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_HAS_Y": {"tagvalue": 0x1D040017, "type": "Bool"},
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_COUNT_MIN": {
+        "tagvalue": 0x1D040018,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_COUNT_MAX": {
+        "tagvalue": 0x1D040019,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_PARAM_GAPP_PARAMETER_COUNT_USED": {
+        "tagvalue": 0x1D040020,
+        "type": "UChar8",
+    },
+    "TAG_GAPP_PARAM_SUPPORTED_GRID_PROTECTION_FUNCTIONS": {
+        "tagvalue": 0x1D040021,
+        "type": "UInt16",
+    },
+    "TAG_GAPP_DEV_COUNT": {"tagvalue": 0x1D800001, "type": "UChar8"},
+    "TAG_GAPP_SERIALNO": {"tagvalue": 0x1D800002, "type": "Container"},
+    "TAG_GAPP_SUPPORTED_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D800003,
+        "type": "Container",
+    },
+    "TAG_GAPP_ENABLED_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D800004,
+        "type": "Container",
+    },
+    "TAG_GAPP_SET_REACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D800005,
+        "type": "Container",
+    },
+    "TAG_GAPP_SET_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
+        "tagvalue": 0x1D800006,
+        "type": "Container",
+    },
+    "TAG_GAPP_REACTIVE_POWER_FUNCTIONS_PARAMETER": {
+        "tagvalue": 0x1D800007,
+        "type": "Container",
+    },
+    "TAG_GAPP_SUPPORTED_ACTIVE_POWER_FUNCTIONS": {
+        "tagvalue": 0x1D800008,
+        "type": "Container",
+    },
+    "TAG_GAPP_ENABLED_ACTIVE_POWER_FUNCTIONS_PU": {
+        "tagvalue": 0x1D800009,
+        "type": "Container",
+    },
+    "TAG_GAPP_SET_ACTIVE_POWER_FUNCTIONS_PU": {
+        "tagvalue": 0x1D80000A,
+        "type": "Container",
+    },
+    "TAG_GAPP_SET_ACTIVE_POWER_FUNCTIONS_PU_PARAMETER": {
+        "tagvalue": 0x1D80000B,
+        "type": "Container",
+    },
+    "TAG_GAPP_ACTIVE_POWER_FUNCTION_PU_PARAMETER": {
+        "tagvalue": 0x1D80000C,
+        "type": "Container",
+    },
+    "TAG_GAPP_REACTIVE_POWER_SETTINGS_EQUAL": {"tagvalue": 0x1D80000D, "type": "Bool"},
+    "TAG_GAPP_ACTIVE_POWER_SETTINGS_EQUAL": {"tagvalue": 0x1D80000E, "type": "Bool"},
+    "TAG_GAPP_SUPPORTED_GRID_PROTECTION_FUNCTIONS": {
+        "tagvalue": 0x1D80000F,
+        "type": "Container",
+    },
+    "TAG_GAPP_GRID_PROTECTION_FUNCTION_PARAMETER": {
+        "tagvalue": 0x1D800010,
+        "type": "Container",
+    },
+    "TAG_GAPP_SET_GRID_PROTECTION_FUNCTION_PARAMETER": {
+        "tagvalue": 0x1D800011,
+        "type": "Container",
+    },
+}
@@ -0,0 +1,90 @@
+"RSCP tags of the GDI namespace, tag codes 0x26xxxxxx."
+
+TAGS = {
+    "TAG_GDI_KEY_2": {"tagvalue": 0x26000000, "type": "Container"},
+    "TAG_GDI_REQ_PUSH_DESC": {"tagvalue": 0x26000001, "type": "None"},
+    "TAG_GDI_PARAM_CONTENT_DESC": {"tagvalue": 0x26400001, "type": "None"},
+    "TAG_GDI_PUSH_DATA": {"tagvalue": 0x26400002, "type": "ByteArray"},
+    "TAG_GDI_PUSH_DATA_OKAY": {"tagvalue": 0x26400003, "type": "Uint32"},
+    "TAG_GDI_PARAM_CONTENT": {"tagvalue": 0x26400004, "type": "Container"},
+    "TAG_GDI_METADATA": {"tagvalue": 0x26400005, "type": "Container"},
+    "TAG_GDI_DATADESCRIPTIONS": {"tagvalue": 0x26400006, "type": "Container"},
+    "TAG_GDI_DATALOGGING": {"tagvalue": 0x26400007, "type": "Container"},
+    "TAG_GDI_LOGGINGTYPE": {"tagvalue": 0x26400008, "type": "Container"},
+    "TAG_GDI_HASHSUM": {"tagvalue": 0x26400009, "type": "ByteArray"},
+    "TAG_GDI_DATATYPE": {"tagvalue": 0x2640000A, "type": "Container"},
+    "TAG_GDI_INDEX": {"tagvalue": 0x2640000B, "type": "Uint32"},
+    "TAG_GDI_NAME": {"tagvalue": 0x2640000C, "type": "CString"},
+    "TAG_GDI_DATATYPE_BOOL": {"tagvalue": 0x26500001, "type": "Container"},
+    "TAG_GDI_DATATYPE_INT8": {"tagvalue": 0x26500002, "type": "Container"},
+    "TAG_GDI_DATATYPE_UINT8": {"tagvalue": 0x26500003, "type": "Container"},
+    "TAG_GDI_DATATYPE_INT16": {"tagvalue": 0x26500004, "type": "Container"},
+    "TAG_GDI_DATATYPE_UINT16": {"tagvalue": 0x26500005, "type": "Container"},
+    "TAG_GDI_DATATYPE_UINT32": {"tagvalue": 0x26500006, "type": "Container"},
+    "TAG_GDI_DATATYPE_INT32": {"tagvalue": 0x26500007, "type": "Container"},
+    "TAG_GDI_DATATYPE_INT64": {"tagvalue": 0x26500008, "type": "Container"},
+    "TAG_GDI_DATATYPE_UINT64": {"tagvalue": 0x26500009, "type": "Container"},
+    "TAG_GDI_DATATYPE_FLOAT32": {"tagvalue": 0x2650000A, "type": "Container"},
+    "TAG_GDI_DATATYPE_DOUBLE64": {"tagvalue": 0x2650000B, "type": "Container"},
+    "TAG_GDI_DATATYPE_BITFIELD": {"tagvalue": 0x2650000C, "type": "Container"},
+    "TAG_GDI_DATATYPE_CSTRING": {"tagvalue": 0x2650000D, "type": "Container"},
+    "TAG_GDI_CONTAINER": {"tagvalue": 0x2650000E, "type": "Container"},
+    "TAG_GDI_DATATYPE_TIMESTAMP": {"tagvalue": 0x2650000F, "type": "Container"},
+    "TAG_GDI_DATATYPE_BYTEARRAY": {"tagvalue": 0x26500010, "type": "Container"},
+    "TAG_GDI_DATATYPE_COMPRESSED_BYTEARRAY": {
+        "tagvalue": 0x26500011,
+        "type": "Container",
+    },
+    "TAG_GDI_DATA_INDEXKEY": {"tagvalue": 0x26500100, "type": "Container"},
+    "TAG_GDI_INDEXKEY": {"tagvalue": 0x26500101, "type": "Container"},
+    "TAG_GDI_LOKAL_STORING": {"tagvalue": 0x26500104, "type": "Uint32"},
+    "TAG_GDI_LOKAL_STORING_AVG": {"tagvalue": 0x26500105, "type": "Uint32"},
+    "TAG_GDI_LOKAL_STORING_MOD": {"tagvalue": 0x26500106, "type": "Uint32"},
+    "TAG_GDI_LOKAL_STORING_AVG_MOD": {"tagvalue": 0x26500107, "type": "Uint32"},
+    "TAG_GDI_PUSH_STORING": {"tagvalue": 0x26500108, "type": "Uint32"},
+    "TAG_GDI_PUSH_STORING_AVG": {"tagvalue": 0x26500109, "type": "Uint32"},
+    "TAG_GDI_PUSH_STORING_MOD": {"tagvalue": 0x2650010A, "type": "Uint32"},
+    "TAG_GDI_PUSH_STORING_AVG_MOD": {"tagvalue": 0x2650010B, "type": "Uint32"},
+    "TAG_GDI_DATA_TIMEKEY": {"tagvalue": 0x2650010C, "type": "Container"},
+    "TAG_GDI_DATA_MANIFEST": {"tagvalue": 0x2650010D, "type": "CString"},
+    "TAG_GDI_PAKET_NUMBER": {"tagvalue": 0x2650010E, "type": "Uint32"},
+    "TAG_GDI_PUSH_INTERMISSION_IN_SEC": {"tagvalue": 0x2650010F, "type": "Uint32"},
+    "TAG_GDI_DESC_VERSION": {"tagvalue": 0x26500110, "type": "Uint64"},
+    "TAG_GDI_LOGDESCRIPTIONS": {"tagvalue": 0x26500111, "type": "Container"},
+    "TAG_GDI_DIAGNOSEDESCRIPTIONS": {"tagvalue": 0x26500112, "type": "Container"},
+    "TAG_GDI_KEYS": {"tagvalue": 0x26500113, "type": "Container"},
+    "TAG_GDI_KEY_PRIMARY": {"tagvalue": 0x26500114, "type": "Container"},
+    "TAG_GDI_OFFSET": {"tagvalue": 0x26500115, "type": "Uint32"},
+    "TAG_GDI_LENGTH": {"tagvalue": 0x26500116, "type": "None"},
+    "TAG_GDI_SNAPSHOT": {"tagvalue": 0x26500117, "type": "Container"},
+    "TAG_GDI_RESOLUTION": {"tagvalue": 0x26500118, "type": "Uint64"},
+    "TAG_GDI_SIZE": {"tagvalue": 0x26500119, "type": "Container"},
+    "TAG_GDI_TRIGGER_ON_INTERVAL": {"tagvalue": 0x2650011A, "type": "Container"},
+    "TAG_GDI_TRIGGER_ON_CHANGE": {"tagvalue": 0x2650011B, "type": "Container"},
+    "TAG_GDI_DELAY": {"tagvalue": 0x2650011C, "type": "Uint64"},
+    "TAG_GDI_ENTITY_MAX": {"tagvalue": 0x2650011D, "type": "Uint32"},
+    "TAG_GDI_USE_PUSH_SERVICE": {"tagvalue": 0x2650011E, "type": "None"},
+    "TAG_GDI_DB_MAX": {"tagvalue": 0x2650011F, "type": "Int32"},
+    "TAG_GDI_USE_P_DB": {"tagvalue": 0x26500120, "type": "None"},
+    "TAG_GDI_FIX_INTERVAL": {"tagvalue": 0x26500121, "type": "Container"},
+    "TAG_GDI_TRIGGER_ON_TIME": {"tagvalue": 0x26500122, "type": "Container"},
+    "TAG_GDI_DATA_LENGTH": {"tagvalue": 0x26500123, "type": "Uint32"},
+    "TAG_GDI_TRIGGER_ON_NULL": {"tagvalue": 0x26500124, "type": "None"},
+    "TAG_GDI_USE_NP_DB": {"tagvalue": 0x26500125, "type": "None"},
+    "TAG_GDI_NO_TRIGGER_ON_NULL": {"tagvalue": 0x26500126, "type": "None"},
+    "TAG_GDI_MODIFICATIONS": {"tagvalue": 0x26500127, "type": "Container"},
+    "TAG_GDI_MODIFICATION_MIN": {"tagvalue": 0x26500128, "type": "None"},
+    "TAG_GDI_MODIFICATION_MAX": {"tagvalue": 0x26500129, "type": "None"},
+    "TAG_GDI_MODIFICATION_AVG": {"tagvalue": 0x2650012A, "type": "None"},
+    "TAG_GDI_MODIFICATION_AND": {"tagvalue": 0x2650012B, "type": "None"},
+    "TAG_GDI_MODIFICATION_OR": {"tagvalue": 0x2650012C, "type": "None"},
+    "TAG_GDI_MODIFICATION_INTEGRATE": {"tagvalue": 0x2650012D, "type": "None"},
+    "TAG_GDI_MODIFICATION_AUTOINC": {"tagvalue": 0x2650012E, "type": "None"},
+    "TAG_GDI_DESCRIPTION": {"tagvalue": 0x2650012F, "type": "Container"},
+    "TAG_GDI_DESCRIPTION_WITH_SIZE": {"tagvalue": 0x26500130, "type": "Container"},
+    "TAG_GDI_DATA_MODIFICATION": {"tagvalue": 0x26500132, "type": "Container"},
+    "TAG_GDI_PUSH_CONFIG": {"tagvalue": 0x26500133, "type": "Container"},
+    "TAG_GDI_PUSH_DELAY": {"tagvalue": 0x26500134, "type": "Uint32"},
+    "TAG_GDI_PUSH_CHANNEL": {"tagvalue": 0x26500135, "type": "Uint32"},
+    "TAG_GDI_PUSH_DESC": {"tagvalue": 0x26800001, "type": "Container"},
+}
@@ -0,0 +1,33 @@
+"RSCP tags of the GPIO namespace, tag codes 0x19xxxxxx."
+
+TAGS = {
+    "TAG_GPIO_REQ_SET": {"tagvalue": 0x19000001, "type": "Container"},
+    "TAG_GPIO_REQ_GET": {"tagvalue": 0x19000002, "type": "Container"},
+    "TAG_GPIO_REQ_LIST": {"tagvalue": 0x19000003, "type": "None"},
+    "TAG_GPIO_REQ_LIST_ALIAS": {"tagvalue": 0x19000004, "type": "None"},
+    "TAG_GPIO_REQ_LIST_REAL": {"tagvalue": 0x19000005, "type": "None"},
+    "TAG_GPIO_REQ_CONNECT": {"tagvalue": 0x19000006, "type": "Container"},
+    "TAG_GPIO_REQ_CHANGECOUNTER": {"tagvalue": 0x19000007, "type": "None"},
+    "TAG_GPIO_REQ_REMOTE_EXCHANGE": {"tagvalue": 0x19000008, "type": "Container"},
+    "TAG_GPIO_RSP_SET": {"tagvalue": 0x19800001, "type": "Container"},
+    "TAG_GPIO_RSP_GET": {"tagvalue": 0x19800002, "type": "Container"},
+    "TAG_GPIO_RSP_LIST": {"tagvalue": 0x19800003, "type": "Container"},
+    "TAG_GPIO_RSP_LIST_ALIAS": {"tagvalue": 0x19800004, "type": "Container"},
+    "TAG_GPIO_RSP_LIST_REAL": {"tagvalue": 0x19800005, "type": "Container"},
+    "TAG_GPIO_RSP_CONNECT": {"tagvalue": 0x19800006, "type": "Bool"},
+    "TAG_GPIO_RSP_CHANGECOUNTER": {"tagvalue": 0x19800007, "type": "UInt16"},
+    "TAG_GPIO_RSP_REMOTE_EXCHANGE": {"tagvalue": 0x19800008, "type": "Container"},
+    "TAG_GPIO_TUPEL": {"tagvalue": 0x19860001, "type": "Container"},
+    "TAG_GPIO_NUMBER": {"tagvalue": 0x19860002, "type": "Uint32"},
+    "TAG_GPIO_NAME": {"tagvalue": 0x19860003, "type": "CString"},
+    "TAG_GPIO_VALUE": {"tagvalue": 0x19860004, "type": "UChar8"},
+    "TAG_GPIO_KEY": {"tagvalue": 0x19860005, "type": "Uint32"},
+    "TAG_GPIO_AVAILABLE": {"tagvalue": 0x19860006, "type": "Bool"},
+    "TAG_GPIO_MODE": {"tagvalue": 0x19860007, "type": "Uint32"},
+    "TAG_GPIO_SUPPORTED": {"tagvalue": 0x19860008, "type": "Uint32"},
+    "TAG_GPIO_CONNECTEDTO": {"tagvalue": 0x19860009, "type": "CString"},
+    "TAG_GPIO_USERLEVEL": {"tagvalue": 0x1986000A, "type": "UChar8"},
+    "TAG_GPIO_INACTIVE": {"tagvalue": 0x1986000B, "type": "Bool"},
+    "TAG_GPIO_SETTINGS": {"tagvalue": 0x1986000C, "type": "CString"},
+    "TAG_GPIO_REMOTE_LINKED": {"tagvalue": 0x1986000D, "type": "Bool"},
+}
@@ -0,0 +1,45 @@
+"RSCP tags of the HA namespace, tag codes 0x09xxxxxx."
+
+TAGS = {
+    "TAG_HA_REQ_DATAPOINT_LIST": {"tagvalue": 0x09000001, "type": "None"},
+    "TAG_HA_REQ_ACTUATOR_STATES": {"tagvalue": 0x09000010, "type": "None"},
+    "TAG_HA_REQ_ADD_ACTUATOR": {"tagvalue": 0x09000020, "type": "Container"},
+    "TAG_HA_REQ_REMOVE_ACTUATOR": {"tagvalue": 0x09000030, "type": "UInt16"},
+    "TAG_HA_REQ_COMMAND_ACTUATOR": {"tagvalue": 0x09000040, "type": "Container"},
+    "TAG_HA_REQ_COMMAND": {"tagvalue": 0x09000041, "type": "CString"},
+    "TAG_HA_REQ_DESCRIPTIONS_CHANGE": {"tagvalue": 0x09000050, "type": "Container"},
+    "TAG_HA_REQ_CONFIGURATION_CHANGE_COUNTER": {"tagvalue": 0x09000060, "type": "None"},
+    "TAG_HA_REQ_POSSIBLE_POWER_METERS": {"tagvalue": 0x09000070, "type": "None"},
+    "TAG_HA_REQ_POSSIBLE_ANALOG_MODES": {"tagvalue": 0x09000080, "type": "None"},
+    "TAG_HA_REQ_DEVICE_STATE": {"tagvalue": 0x09060000, "type": "None"},
+    "TAG_HA_DATAPOINT_LIST": {"tagvalue": 0x09800001, "type": "Container"},
+    "TAG_HA_DATAPOINT": {"tagvalue": 0x09800002, "type": "Container"},
+    "TAG_HA_DATAPOINT_INDEX": {"tagvalue": 0x09800003, "type": "UInt16"},
+    "TAG_HA_DATAPOINT_TYPE": {"tagvalue": 0x09800004, "type": "Uint32"},
+    "TAG_HA_DATAPOINT_NAME": {"tagvalue": 0x09800005, "type": "CString"},
+    "TAG_HA_DATAPOINT_DESCRIPTIONS": {"tagvalue": 0x09800006, "type": "Container"},
+    "TAG_HA_DATAPOINT_DESCRIPTION": {"tagvalue": 0x09800007, "type": "Container"},
+    "TAG_HA_DATAPOINT_DESCRIPTION_NAME": {"tagvalue": 0x09800008, "type": "CString"},
+    "TAG_HA_DATAPOINT_DESCRIPTION_VALUE": {"tagvalue": 0x09800009, "type": "Int32"},
+    "TAG_HA_ACTUATOR_STATES": {"tagvalue": 0x09800010, "type": "Container"},
+    "TAG_HA_DATAPOINT_STATE": {"tagvalue": 0x09800011, "type": "Char8"},
+    "TAG_HA_DATAPOINT_MODE": {"tagvalue": 0x09800012, "type": "Char8"},
+    "TAG_HA_DATAPOINT_STATE_TIMESTAMP": {"tagvalue": 0x09800013, "type": "Uint64"},
+    "TAG_HA_DATAPOINT_STATE_VALUE": {"tagvalue": 0x09800014, "type": "Char8"},
+    "TAG_HA_DATAPOINT_SUPPLY_QUALITY": {"tagvalue": 0x09800015, "type": "Char8"},
+    "TAG_HA_DATAPOINT_SIGNAL_QUALITY": {"tagvalue": 0x09800016, "type": "Char8"},
+    "TAG_HA_ADD_ACTUATOR": {"tagvalue": 0x09800020, "type": "Bool"},
+    "TAG_HA_REMOVE_ACTUATOR": {"tagvalue": 0x09800030, "type": "Bool"},
+    "TAG_HA_COMMAND_ACTUATOR": {"tagvalue": 0x09800040, "type": "Bool"},
+    "TAG_HA_DESCRIPTIONS_CHANGE": {"tagvalue": 0x09800050, "type": "Bool"},
+    "TAG_HA_CONFIGURATION_CHANGE_COUNTER": {"tagvalue": 0x09800060, "type": "Uint32"},
+    "TAG_HA_POSSIBLE_POWER_METERS": {"tagvalue": 0x09800070, "type": "Container"},
+    "TAG_HA_POSSIBLE_POWER_METER": {"tagvalue": 0x09800071, "type": "CString"},
+    "TAG_HA_POSSIBLE_ANALOG_MODES": {"tagvalue": 0x09800080, "type": "Container"},
+    "TAG_HA_POSSIBLE_ANALOG_MODE": {"tagvalue": 0x09800081, "type": "CString"},
+    "TAG_HA_DEVICE_STATE": {"tagvalue": 0x09860000, "type": "Container"},
+    "TAG_HA_DEVICE_CONNECTED": {"tagvalue": 0x09860001, "type": "Bool"},
+    "TAG_HA_DEVICE_WORKING": {"tagvalue": 0x09860002, "type": "Bool"},
+    "TAG_HA_DEVICE_IN_SERVICE": {"tagvalue": 0x09860003, "type": "Bool"},
+    "TAG_HA_GENERAL_ERROR": {"tagvalue": 0x09FFFFFF, "type": "Error"},
+}
@@ -0,0 +1,79 @@
+"RSCP tags of the HG namespace, tag codes 0x2Cxxxxxx."
+
+TAGS = {
+    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_START_SCAN": {
+        "tagvalue": 0x2C000001,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_REQ_GET_NON_CONFIGURED_HAG_EVCS": {
+        "tagvalue": 0x2C000002,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_CONFIGURE_HAG_EVCS": {
+        "tagvalue": 0x2C000003,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_CONFIGURE_ALL_HAG_EVCS": {
+        "tagvalue": 0x2C000004,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_REQ_SET_START_AUTO_CONFIG": {
+        "tagvalue": 0x2C000005,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_REQ_GET_LLM_URI": {
+        "tagvalue": 0x2C000006,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_TOKEN": {"tagvalue": 0x2C400001, "type": "CString"},
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_STATUS": {"tagvalue": 0x2C400002, "type": "Uint64"},
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE": {
+        "tagvalue": 0x2C400003,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE_HOSTNAME": {
+        "tagvalue": 0x2C400004,
+        "type": "CString",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE_IP": {
+        "tagvalue": 0x2C400005,
+        "type": "CString",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_EVCS_DEVICE_STATUS": {
+        "tagvalue": 0x2C400006,
+        "type": "UInt16",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_RUN": {"tagvalue": 0x2C400007, "type": "Bool"},
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_MAX_ACCEPTED": {
+        "tagvalue": 0x2C400008,
+        "type": "Int16",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_ACCEPTED": {"tagvalue": 0x2C400009, "type": "Int16"},
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_ACCEPTED_HAGER": {
+        "tagvalue": 0x2C40000A,
+        "type": "Int16",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_UNDERWAY": {"tagvalue": 0x2C40000B, "type": "Int16"},
+    "TAG_HG_OCPP_WB_CFG_LC_PARAM_LLM_URI": {"tagvalue": 0x2C40000C, "type": "CString"},
+    "TAG_HG_OCPP_WB_CFG_LC_SET_START_SCAN": {
+        "tagvalue": 0x2C800001,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_GET_NON_CONFIGURED_HAG_EVCS": {
+        "tagvalue": 0x2C800002,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_SET_CONFIGURE_HAG_EVCS": {
+        "tagvalue": 0x2C800003,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_SET_CONFIGURE_ALL_HAG_EVCS": {
+        "tagvalue": 0x2C800004,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_SET_START_AUTO_CONFIG": {
+        "tagvalue": 0x2C800005,
+        "type": "Container",
+    },
+    "TAG_HG_OCPP_WB_CFG_LC_GET_LLM_URI": {"tagvalue": 0x2C800006, "type": "Container"},
+}
@@ -0,0 +1,144 @@
+"RSCP tags of the INFO namespace, tag codes 0x0Axxxxxx."
+
+TAGS = {
+    "TAG_INFO_REQ_SERIAL_NUMBER": {"tagvalue": 0x0A000001, "type": "None"},
+    "TAG_INFO_REQ_PRODUCTION_DATE": {"tagvalue": 0x0A000002, "type": "None"},
+    "TAG_INFO_REQ_MODULES_SW_VERSIONS": {"tagvalue": 0x0A000003, "type": "None"},
+    "TAG_INFO_REQ_A35_SERIAL_NUMBER": {"tagvalue": 0x0A000007, "type": "None"},
+    "TAG_INFO_REQ_IP_ADDRESS": {"tagvalue": 0x0A000008, "type": "None"},
+    "TAG_INFO_REQ_SUBNET_MASK": {"tagvalue": 0x0A000009, "type": "None"},
+    "TAG_INFO_REQ_MAC_ADDRESS": {"tagvalue": 0x0A00000A, "type": "None"},
+    "TAG_INFO_REQ_GATEWAY": {"tagvalue": 0x0A00000B, "type": "None"},
+    "TAG_INFO_REQ_DNS": {"tagvalue": 0x0A00000C, "type": "None"},
+    "TAG_INFO_REQ_DHCP_STATUS": {"tagvalue": 0x0A00000D, "type": "None"},
+    "TAG_INFO_REQ_TIME": {"tagvalue": 0x0A00000E, "type": "None"},
+    "TAG_INFO_REQ_UTC_TIME": {"tagvalue": 0x0A00000F, "type": "None"},
+    "TAG_INFO_REQ_TIME_ZONE": {"tagvalue": 0x0A000010, "type": "None"},
+    "TAG_INFO_REQ_INFO": {"tagvalue": 0x0A000011, "type": "None"},
+    "TAG_INFO_REQ_SET_IP_ADDRESS": {"tagvalue": 0x0A000012, "type": "CString"},
+    "TAG_INFO_REQ_SET_SUBNET_MASK": {"tagvalue": 0x0A000013, "type": "CString"},
+    "TAG_INFO_REQ_SET_DHCP_STATUS": {"tagvalue": 0x0A000014, "type": "Bool"},
+    "TAG_INFO_REQ_SET_GATEWAY": {"tagvalue": 0x0A000015, "type": "CString"},
+    "TAG_INFO_REQ_SET_DNS": {"tagvalue": 0x0A000016, "type": "CString"},
+    "TAG_INFO_REQ_SET_TIME_ZONE": {"tagvalue": 0x0A000018, "type": "CString"},
+    "TAG_INFO_REQ_SW_RELEASE": {"tagvalue": 0x0A000019, "type": "None"},
+    "TAG_INFO_REQ_SET_GUI_TARGET": {"tagvalue": 0x0A00001A, "type": "UChar8"},
+    "TAG_INFO_REQ_GUI_TARGET": {"tagvalue": 0x0A00001B, "type": "None"},
+    "TAG_INFO_REQ_PLATFORM_TYPE": {"tagvalue": 0x0A00001C, "type": "None"},
+    "TAG_INFO_REQ_IS_CALIBRATED": {"tagvalue": 0x0A00001D, "type": "None"},
+    "TAG_INFO_REQ_CALIBRATION_CHECK": {"tagvalue": 0x0A00001E, "type": "UChar8"},
+    "TAG_INFO_REQ_RESET_CALIBRATION": {"tagvalue": 0x0A00001F, "type": "None"},
+    "TAG_INFO_REQ_HW_TIME": {"tagvalue": 0x0A000020, "type": "None"},
+    "TAG_INFO_REQ_SET_TIME_UTC": {"tagvalue": 0x0A000021, "type": "Timestamp"},
+    "TAG_INFO_REQ_SET_HW_TIME": {"tagvalue": 0x0A000022, "type": "Timestamp"},
+    "TAG_INFO_REQ_SET_FACILITY": {"tagvalue": 0x0A000023, "type": "Container"},
+    "TAG_INFO_REQ_GET_FACILITY": {"tagvalue": 0x0A000024, "type": "None"},
+    "TAG_INFO_REQ_GET_FS_USAGE": {"tagvalue": 0x0A000025, "type": "None"},
+    "TAG_INFO_REQ_UPNP_STATUS": {"tagvalue": 0x0A000037, "type": "None"},
+    "TAG_INFO_REQ_SET_UPNP_STATUS": {"tagvalue": 0x0A000038, "type": "Bool"},
+    "TAG_INFO_REQ_IS_OVP_POSSIBLE": {"tagvalue": 0x0A000039, "type": "None"},
+    "TAG_INFO_REQ_IS_RSCP_PASSWORD_SET": {"tagvalue": 0x0A00003A, "type": "None"},
+    "TAG_INFO_REQ_SET_EULA_VERSION": {"tagvalue": 0x0A00003B, "type": "CString"},
+    "TAG_INFO_REQ_SET_EULA_CHECKSUM": {"tagvalue": 0x0A00003C, "type": "CString"},
+    "TAG_INFO_REQ_SET_WAIT_FOR_EULA": {"tagvalue": 0x0A00003D, "type": "Bool"},
+    "TAG_INFO_REQ_ASSEMBLY_SERIAL_NUMBER": {"tagvalue": 0x0A00003E, "type": "None"},
+    "TAG_INFO_REQ_SET_UUID": {"tagvalue": 0x0A00003F, "type": "CString"},
+    "TAG_INFO_REQ_GET_UUID": {"tagvalue": 0x0A000040, "type": "None"},
+    "TAG_INFO_REQ_GET_SUID": {"tagvalue": 0x0A000041, "type": "None"},
+    "TAG_INFO_REQ_IS_OVP2_POSSIBLE": {"tagvalue": 0x0A000042, "type": "None"},
+    "TAG_INFO_LC_REQ_SET_TIME": {"tagvalue": 0x0A000043, "type": "Container"},
+    "TAG_INFO_LC_REQ_GET_IS_TIME_SYNCHRO": {
+        "tagvalue": 0x0A000044,
+        "type": "Container",
+    },
+    "TAG_INFO_LC_REQ_GET_SYSTEM_TIME": {"tagvalue": 0x0A000045, "type": "Container"},
+    "TAG_INFO_LC_REQ_GET_TIME_TIMEZONE": {"tagvalue": 0x0A000046, "type": "Container"},
+    "TAG_INFO_REQ_GET_IS_MULTI_GC_POSSIBLE": {"tagvalue": 0x0A000047, "type": "None"},
+    "TAG_INFO_REQ_GET_VALUES_PRESENTATION_SETTINGS": {
+        "tagvalue": 0x0A000048,
+        "type": "None",
+    },
+    "TAG_INFO_LC_PARAM_TOKEN": {"tagvalue": 0x0A400001, "type": "CString"},
+    "TAG_INFO_LC_PARAM_STATUS": {"tagvalue": 0x0A400002, "type": "Uint64"},
+    "TAG_INFO_LC_PARAM_TIME_SYSTEM": {"tagvalue": 0x0A400003, "type": "Timestamp"},
+    "TAG_INFO_LC_PARAM_TIMEZONE": {"tagvalue": 0x0A400004, "type": "CString"},
+    "TAG_INFO_LC_PARAM_TIME_DIFF": {"tagvalue": 0x0A400005, "type": "Timestamp"},
+    "TAG_INFO_LC_PARAM_TIME_BROWSER": {"tagvalue": 0x0A400006, "type": "Timestamp"},
+    "TAG_INFO_LC_PARAM_TIME_SYNCHRO_STATE": {"tagvalue": 0x0A400007, "type": "Bool"},
+    "TAG_INFO_SERIAL_NUMBER": {"tagvalue": 0x0A800001, "type": "CString"},
+    "TAG_INFO_PRODUCTION_DATE": {"tagvalue": 0x0A800002, "type": "CString"},
+    "TAG_INFO_MODULES_SW_VERSIONS": {"tagvalue": 0x0A800003, "type": "Container"},
+    "TAG_INFO_MODULE_SW_VERSION": {"tagvalue": 0x0A800004, "type": "Container"},
+    "TAG_INFO_MODULE": {"tagvalue": 0x0A800005, "type": "CString"},
+    "TAG_INFO_VERSION": {"tagvalue": 0x0A800006, "type": "CString"},
+    "TAG_INFO_A35_SERIAL_NUMBER": {"tagvalue": 0x0A800007, "type": "CString"},
+    "TAG_INFO_IP_ADDRESS": {"tagvalue": 0x0A800008, "type": "CString"},
+    "TAG_INFO_SUBNET_MASK": {"tagvalue": 0x0A800009, "type": "CString"},
+    "TAG_INFO_MAC_ADDRESS": {"tagvalue": 0x0A80000A, "type": "CString"},
+    "TAG_INFO_GATEWAY": {"tagvalue": 0x0A80000B, "type": "CString"},
+    "TAG_INFO_DNS": {"tagvalue": 0x0A80000C, "type": "CString"},
+    "TAG_INFO_DHCP_STATUS": {"tagvalue": 0x0A80000D, "type": "Bool"},
+    "TAG_INFO_TIME": {"tagvalue": 0x0A80000E, "type": "Timestamp"},
+    "TAG_INFO_UTC_TIME": {"tagvalue": 0x0A80000F, "type": "Timestamp"},
+    "TAG_INFO_TIME_ZONE": {"tagvalue": 0x0A800010, "type": "CString"},
+    "TAG_INFO_INFO": {"tagvalue": 0x0A800011, "type": "Container"},
+    "TAG_INFO_SET_IP_ADDRESS": {"tagvalue": 0x0A800012, "type": "CString"},
+    "TAG_INFO_SET_SUBNET_MASK": {"tagvalue": 0x0A800013, "type": "CString"},
+    "TAG_INFO_SET_DHCP_STATUS": {"tagvalue": 0x0A800014, "type": "Bool"},
+    "TAG_INFO_SET_GATEWAY": {"tagvalue": 0x0A800015, "type": "CString"},
+    "TAG_INFO_SET_DNS": {"tagvalue": 0x0A800016, "type": "CString"},
+    "TAG_INFO_SET_TIME": {"tagvalue": 0x0A800017, "type": "Timestamp"},
+    "TAG_INFO_SET_TIME_ZONE": {"tagvalue": 0x0A800018, "type": "CString"},
+    "TAG_INFO_SW_RELEASE": {"tagvalue": 0x0A800019, "type": "CString"},
+    "TAG_INFO_SET_GUI_TARGET": {"tagvalue": 0x0A80001A, "type": "UChar8"},
+    "TAG_INFO_GUI_TARGET": {"tagvalue": 0x0A80001B, "type": "UChar8"},
+    "TAG_INFO_PLATFORM_TYPE": {"tagvalue": 0x0A80001C, "type": "CString"},
+    "TAG_INFO_IS_CALIBRATED": {"tagvalue": 0x0A80001D, "type": "Bool"},
+    "TAG_INFO_CALIBRATION_CHECK": {"tagvalue": 0x0A80001E, "type": "UChar8"},
+    "TAG_INFO_RESET_CALIBRATION": {"tagvalue": 0x0A80001F, "type": "UChar8"},
+    "TAG_INFO_HW_TIME": {"tagvalue": 0x0A800020, "type": "Timestamp"},
+    "TAG_INFO_SET_TIME_UTC": {"tagvalue": 0x0A800021, "type": "UChar8"},
+    "TAG_INFO_SET_HW_TIME": {"tagvalue": 0x0A800022, "type": "UChar8"},
+    "TAG_INFO_SET_FACILITY": {"tagvalue": 0x0A800023, "type": "UChar8"},
+    "TAG_INFO_GET_FACILITY": {"tagvalue": 0x0A800024, "type": "Container"},
+    "TAG_INFO_NAME": {"tagvalue": 0x0A800025, "type": "CString"},
+    "TAG_INFO_STREET": {"tagvalue": 0x0A800026, "type": "CString"},
+    "TAG_INFO_STREET_NO": {"tagvalue": 0x0A800027, "type": "CString"},
+    "TAG_INFO_POSTCODE": {"tagvalue": 0x0A800028, "type": "CString"},
+    "TAG_INFO_CITY": {"tagvalue": 0x0A800029, "type": "CString"},
+    "TAG_INFO_FON": {"tagvalue": 0x0A80002A, "type": "CString"},
+    "TAG_INFO_E_MAIL": {"tagvalue": 0x0A80002B, "type": "CString"},
+    "TAG_INFO_COUNTRY": {"tagvalue": 0x0A80002C, "type": "CString"},
+    "TAG_INFO_GET_FS_USAGE": {"tagvalue": 0x0A80002D, "type": "Container"},
+    "TAG_INFO_FS_SIZE": {"tagvalue": 0x0A80002E, "type": "CString"},
+    "TAG_INFO_FS_USED": {"tagvalue": 0x0A80002F, "type": "CString"},
+    "TAG_INFO_FS_AVAILABLE": {"tagvalue": 0x0A800030, "type": "CString"},
+    "TAG_INFO_FS_USE_PERCENT": {"tagvalue": 0x0A800031, "type": "CString"},
+    "TAG_INFO_INODES": {"tagvalue": 0x0A800032, "type": "CString"},
+    "TAG_INFO_INODES_USED": {"tagvalue": 0x0A800033, "type": "CString"},
+    "TAG_INFO_INODES_AVAILABLE": {"tagvalue": 0x0A800034, "type": "CString"},
+    "TAG_INFO_INODES_USE_PERCENT": {"tagvalue": 0x0A800035, "type": "CString"},
+    "TAG_INFO_SURNAME": {"tagvalue": 0x0A800036, "type": "CString"},
+    "TAG_INFO_UPNP_STATUS": {"tagvalue": 0x0A800037, "type": "Bool"},
+    "TAG_INFO_SET_UPNP_STATUS": {"tagvalue": 0x0A800038, "type": "Bool"},
+    "TAG_INFO_IS_OVP_POSSIBLE": {"tagvalue": 0x0A800039, "type": "Bool"},
+    "TAG_INFO_IS_RSCP_PASSWORD_SET": {"tagvalue": 0x0A80003A, "type": "None"},
+    "TAG_INFO_SET_EULA_VERSION": {"tagvalue": 0x0A80003B, "type": "Bool"},
+    "TAG_INFO_SET_EULA_CHECKSUM": {"tagvalue": 0x0A80003C, "type": "Bool"},
+    "TAG_INFO_SET_WAIT_FOR_EULA": {"tagvalue": 0x0A80003D, "type": "Bool"},
+    "TAG_INFO_ASSEMBLY_SERIAL_NUMBER": {"tagvalue": 0x0A80003E, "type": "CString"},
+    "TAG_INFO_SET_UUID": {"tagvalue": 0x0A80003F, "type": "Bool"},
+    "TAG_INFO_GET_UUID": {"tagvalue": 0x0A800040, "type": "CString"},
+    "TAG_INFO_GET_SUID": {"tagvalue": 0x0A800041, "type": "CString"},
+    "TAG_INFO_IS_OVP2_POSSIBLE": {"tagvalue": 0x0A800042, "type": "Bool"},
+    "TAG_INFO_LC_SET_TIME": {"tagvalue": 0x0A800043, "type": "Container"},
+    "TAG_INFO_LC_GET_IS_TIME_SYNCHRO": {"tagvalue": 0x0A800044, "type": "Container"},
+    "TAG_INFO_LC_GET_SYSTEM_TIME": {"tagvalue": 0x0A800045, "type": "Container"},
+    "TAG_INFO_LC_GET_TIME_TIMEZONE": {"tagvalue": 0x0A800046, "type": "Container"},
+    "TAG_INFO_GET_IS_MULTI_GC_POSSIBLE": {"tagvalue": 0x0A800047, "type": "Bool"},
+    "TAG_INFO_GET_VALUES_PRESENTATION_SETTINGS": {
+        "tagvalue": 0x0A800048,
+        "type": "CString",
+    },
+    "TAG_INFO_GENERAL_ERROR": {"tagvalue": 0x0AFFFFFF, "type": "Error"},
+}
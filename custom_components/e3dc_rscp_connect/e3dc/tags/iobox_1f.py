@@ -0,0 +1,28 @@
+"RSCP tags of the IOBOX namespace, tag codes 0x1Fxxxxxx."
+
+TAGS = {
+    "TAG_IOBOX_REQ_IDENTIFY": {"tagvalue": 0x1F000001, "type": "None"},
+    "TAG_IOBOX_REQ_GETCOUNT": {"tagvalue": 0x1F000002, "type": "None"},
+    "TAG_IOBOX_REQ_SEARCH": {"tagvalue": 0x1F000003, "type": "None"},
+    "TAG_IOBOX_REQ_SERIAL_NUMBER": {"tagvalue": 0x1F000004, "type": "None"},
+    "TAG_IOBOX_REQ_STATE": {"tagvalue": 0x1F000005, "type": "None"},
+    "TAG_IOBOX_REQ_LIST": {"tagvalue": 0x1F000006, "type": "None"},
+    "TAG_IOBOX_REQ_REMOVE": {"tagvalue": 0x1F000007, "type": "CString"},
+    "TAG_IOBOX_REQ_DATA": {"tagvalue": 0x1F040000, "type": "Container"},
+    "TAG_IOBOX_INDEX": {"tagvalue": 0x1F040001, "type": "UInt16"},
+    "TAG_IOBOX_ITEM": {"tagvalue": 0x1F400001, "type": "Container"},
+    "TAG_IOBOX_ITEM_INDEX": {"tagvalue": 0x1F400002, "type": "None"},
+    "TAG_IOBOX_ITEM_NAME": {"tagvalue": 0x1F400003, "type": "None"},
+    "TAG_IOBOX_ITEM_SERIAL_NUMBER": {"tagvalue": 0x1F400004, "type": "CString"},
+    "TAG_IOBOX_ITEM_STATUS": {"tagvalue": 0x1F400005, "type": "UChar8"},
+    "TAG_IOBOX_ITEM_SWVERSION": {"tagvalue": 0x1F400006, "type": "CString"},
+    "TAG_IOBOX_ITEM_ADDITIONAL_INFO": {"tagvalue": 0x1F400007, "type": "CString"},
+    "TAG_IOBOX_RSP_IDENTIFY": {"tagvalue": 0x1F800001, "type": "UChar8"},
+    "TAG_IOBOX_RSP_GETCOUNT": {"tagvalue": 0x1F800002, "type": "UChar8"},
+    "TAG_IOBOX_RSP_SEARCH": {"tagvalue": 0x1F800003, "type": "None"},
+    "TAG_IOBOX_RSP_SERIAL_NUMBER": {"tagvalue": 0x1F800004, "type": "CString"},
+    "TAG_IOBOX_RSP_STATE": {"tagvalue": 0x1F800005, "type": "UChar8"},
+    "TAG_IOBOX_LIST": {"tagvalue": 0x1F800006, "type": "Container"},
+    "TAG_IOBOX_REMOVE": {"tagvalue": 0x1F800007, "type": "None"},
+    "TAG_IOBOX_DATA": {"tagvalue": 0x1F840000, "type": "Container"},
+}
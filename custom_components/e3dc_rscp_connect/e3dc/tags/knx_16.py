@@ -0,0 +1,23 @@
+"RSCP tags of the KNX namespace, tag codes 0x16xxxxxx."
+
+TAGS = {
+    "TAG_KNX_REQ_SET": {"tagvalue": 0x16000001, "type": "Container"},
+    "TAG_KNX_MAC": {"tagvalue": 0x16000002, "type": "CString"},
+    "TAG_KNX_IP": {"tagvalue": 0x16000003, "type": "CString"},
+    "TAG_KNX_SOFTWAREVERSION": {"tagvalue": 0x16000004, "type": "CString"},
+    "TAG_KNX_FIRMWAREVERSION": {"tagvalue": 0x16000005, "type": "CString"},
+    "TAG_KNX_REQ_STORED_ERRORS": {"tagvalue": 0x16000006, "type": "None"},
+    "TAG_KNX_REQ_STORE_FILTER": {"tagvalue": 0x16000007, "type": "Container"},
+    "TAG_KNX_REQ_SHOW_KNX_SCREEN": {"tagvalue": 0x16000008, "type": "Bool"},
+    "TAG_KNX_ERROR_CONTAINER": {"tagvalue": 0x16400001, "type": "Container"},
+    "TAG_KNX_ERROR_TYPE": {"tagvalue": 0x16400002, "type": "UChar8"},
+    "TAG_KNX_ERROR_SOURCE": {"tagvalue": 0x16400003, "type": "CString"},
+    "TAG_KNX_ERROR_MESSAGE": {"tagvalue": 0x16400004, "type": "CString"},
+    "TAG_KNX_ERROR_CODE": {"tagvalue": 0x16400005, "type": "Int32"},
+    "TAG_KNX_ERROR_TIMESTAMP": {"tagvalue": 0x16400006, "type": "Uint64"},
+    "TAG_KNX_STORE_FILTER": {"tagvalue": 0x16400007, "type": "Container"},
+    "TAG_KNX_FILTER_CATEGORY": {"tagvalue": 0x16400008, "type": "CString"},
+    "TAG_KNX_FILTER_ENUM": {"tagvalue": 0x16400009, "type": "Uint32"},
+    "TAG_KNX_RSP_SET": {"tagvalue": 0x16800001, "type": "Bool"},
+    "TAG_KNX_STORED_ERRORS": {"tagvalue": 0x16800002, "type": "Container"},
+}
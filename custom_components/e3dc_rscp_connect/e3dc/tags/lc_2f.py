@@ -0,0 +1,114 @@
+"RSCP tags of the LC namespace, tag codes 0x2Fxxxxxx."
+
+TAGS = {
+    "TAG_LC_USR_MGT_LC_REQ_GET_LOGIN": {"tagvalue": 0x2F000001, "type": "Container"},
+    "TAG_LC_USR_MGT_LC_REQ_GET_PROFILE_BY_TOKEN": {
+        "tagvalue": 0x2F000002,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_SET_ADD_USER_OR_CHG_PWD": {
+        "tagvalue": 0x2F000003,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_SET_UPDATE_USER_ACCOUNT": {
+        "tagvalue": 0x2F000004,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_SET_ENABLE_PUBLIC_ACCESS": {
+        "tagvalue": 0x2F000005,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_SET_DISABLE_PUBLIC_ACCESS": {
+        "tagvalue": 0x2F000006,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_SET_REMOVE_USER": {
+        "tagvalue": 0x2F000007,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_GET_PUBLIC_ACCESS_STATE": {
+        "tagvalue": 0x2F000008,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_SET_DISCONNECT_USER": {
+        "tagvalue": 0x2F000009,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_GET_USERS_LIST": {
+        "tagvalue": 0x2F00000A,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_GET_USER_RELATED_INFO": {
+        "tagvalue": 0x2F00000B,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_GET_LOGIN_PUBLIC_USER": {
+        "tagvalue": 0x2F00000C,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_REQ_GET_USERS_COUNT": {
+        "tagvalue": 0x2F00000D,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_PARAM_TOKEN": {"tagvalue": 0x2F400001, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_USER": {"tagvalue": 0x2F400002, "type": "Container"},
+    "TAG_LC_USR_MGT_LC_PARAM_LOGIN": {"tagvalue": 0x2F400003, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_PWD": {"tagvalue": 0x2F400004, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_STATUS": {"tagvalue": 0x2F400005, "type": "Uint64"},
+    "TAG_LC_USR_MGT_LC_PARAM_ROLE": {"tagvalue": 0x2F400006, "type": "UChar8"},
+    "TAG_LC_USR_MGT_LC_PARAM_NAME": {"tagvalue": 0x2F400007, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_FIRST_NAME": {"tagvalue": 0x2F400008, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_STREET": {"tagvalue": 0x2F400009, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_ZIP": {"tagvalue": 0x2F40000A, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_CITY": {"tagvalue": 0x2F40000B, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_COUNTRY": {"tagvalue": 0x2F40000C, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_EMAIL": {"tagvalue": 0x2F40000D, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_PHONE": {"tagvalue": 0x2F40000E, "type": "CString"},
+    "TAG_LC_USR_MGT_LC_PARAM_EMAIL_DISPLAYED": {"tagvalue": 0x2F40000F, "type": "Bool"},
+    "TAG_LC_USR_MGT_LC_PARAM_PHONE_DISPLAYED": {"tagvalue": 0x2F400010, "type": "Bool"},
+    "TAG_LC_USR_MGT_LC_PARAM_PUBLIC_ACCESS_STATE": {
+        "tagvalue": 0x2F400011,
+        "type": "Bool",
+    },
+    "TAG_LC_USR_MGT_LC_PARAM_USERS_COUNT": {"tagvalue": 0x2F400012, "type": "UInt16"},
+    "TAG_LC_USR_MGT_LC_GET_LOGIN": {"tagvalue": 0x2F800001, "type": "Container"},
+    "TAG_LC_USR_MGT_LC_GET_PROFILE_BY_TOKEN": {
+        "tagvalue": 0x2F800002,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_SET_ADD_USER_OR_CHG_PWD": {
+        "tagvalue": 0x2F800003,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_SET_UPDATE_USER_ACCOUNT": {
+        "tagvalue": 0x2F800004,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_SET_ENABLE_PUBLIC_ACCESS": {
+        "tagvalue": 0x2F800005,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_SET_DISABLE_PUBLIC_ACCESS": {
+        "tagvalue": 0x2F800006,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_SET_REMOVE_USER": {"tagvalue": 0x2F800007, "type": "Container"},
+    "TAG_LC_USR_MGT_LC_GET_PUBLIC_ACCESS_STATE": {
+        "tagvalue": 0x2F800008,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_SET_DISCONNECT_USER": {
+        "tagvalue": 0x2F800009,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_GET_USERS_LIST": {"tagvalue": 0x2F80000A, "type": "Container"},
+    "TAG_LC_USR_MGT_LC_GET_USER_RELATED_INFO": {
+        "tagvalue": 0x2F80000B,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_GET_LOGIN_PUBLIC_USER": {
+        "tagvalue": 0x2F80000C,
+        "type": "Container",
+    },
+    "TAG_LC_USR_MGT_LC_GET_USERS_COUNT": {"tagvalue": 0x2F80000D, "type": "Container"},
+}
@@ -0,0 +1,46 @@
+"RSCP tags of the LCT namespace, tag codes 0x2Bxxxxxx."
+
+TAGS = {
+    "TAG_LCT_REQ_START_NGROK": {"tagvalue": 0x2B000001, "type": "Container"},
+    "TAG_LCT_REQ_GET_IS_NGROK_RUNNING": {"tagvalue": 0x2B000002, "type": "None"},
+    "TAG_LCT_REQ_GET_IS_GTOU_ACCEPTED": {"tagvalue": 0x2B000003, "type": "Container"},
+    "TAG_LCT_REQ_SET_GTOU_ACCEPTED": {"tagvalue": 0x2B000004, "type": "Container"},
+    "TAG_LCT_SD_REQ_GET_MEM_INFO": {"tagvalue": 0x2B000005, "type": "None"},
+    "TAG_LCT_SD_REQ_GET_MOF_HEAP": {"tagvalue": 0x2B000006, "type": "None"},
+    "TAG_LCT_SD_REQ_GET_UP_TIME": {"tagvalue": 0x2B000007, "type": "None"},
+    "TAG_LCT_LC_REQ_CONFIGURE_MODBUS_SERVER": {
+        "tagvalue": 0x2B000008,
+        "type": "Container",
+    },
+    "TAG_LCT_REQ_SET_RC_DISCONNECTED_MODE": {
+        "tagvalue": 0x2B000009,
+        "type": "Container",
+    },
+    "TAG_LCT_REQ_GET_RC_DISCONNECTED_MODE": {
+        "tagvalue": 0x2B00000A,
+        "type": "Container",
+    },
+    "TAG_LCT_PARAM_DURATION": {"tagvalue": 0x2B00000B, "type": "UInt16"},
+    "TAG_LCT_PARAM_RC_DISCONNECTED_MODE": {"tagvalue": 0x2B400000, "type": "Bool"},
+    "TAG_LCT_PARAM_STATUS": {"tagvalue": 0x2B400001, "type": "Uint64"},
+    "TAG_LCT_PARAM_NGROK_HOSTNAME": {"tagvalue": 0x2B400002, "type": "CString"},
+    "TAG_LCT_PARAM_GTOU_ACCEPTED": {"tagvalue": 0x2B400003, "type": "Bool"},
+    "TAG_LCT_PARAM_TOKEN": {"tagvalue": 0x2B400004, "type": "CString"},
+    "TAG_LCT_SD_PARAM_MEM_FREE": {"tagvalue": 0x2B400005, "type": "Uint64"},
+    "TAG_LCT_SD_PARAM_MEM_CACHED": {"tagvalue": 0x2B400006, "type": "Uint64"},
+    "TAG_LCT_SD_PARAM_MEM_WD_FREE": {"tagvalue": 0x2B400007, "type": "Uint64"},
+    "TAG_LCT_SD_PARAM_MEM_BUFFER": {"tagvalue": 0x2B400008, "type": "Uint64"},
+    "TAG_LCT_SD_PARAM_SYNC_TIME": {"tagvalue": 0x2B400009, "type": "Uint64"},
+    "TAG_LCT_SD_PARAM_LOAD_AVERAGE": {"tagvalue": 0x2B40000A, "type": "CString"},
+    "TAG_LCT_LC_PARAM_MODBUS_SERVER_ENABLE": {"tagvalue": 0x2B40000B, "type": "Bool"},
+    "TAG_LCT_START_NGROK": {"tagvalue": 0x2B800001, "type": "Container"},
+    "TAG_LCT_GET_IS_NGROK_RUNNING": {"tagvalue": 0x2B800002, "type": "Bool"},
+    "TAG_LCT_GET_IS_GTOU_ACCEPTED": {"tagvalue": 0x2B800003, "type": "Container"},
+    "TAG_LCT_SET_GTOU_ACCEPTED": {"tagvalue": 0x2B800004, "type": "Container"},
+    "TAG_LCT_SD_GET_MEM_INFO": {"tagvalue": 0x2B800005, "type": "Container"},
+    "TAG_LCT_SD_GET_MOF_HEAP": {"tagvalue": 0x2B800006, "type": "CString"},
+    "TAG_LCT_SD_GET_UP_TIME": {"tagvalue": 0x2B800007, "type": "Uint64"},
+    "TAG_LCT_LC_CONFIGURE_MODBUS_SERVER": {"tagvalue": 0x2B800008, "type": "Container"},
+    "TAG_LCT_SET_RC_DISCONNECTED_MODE": {"tagvalue": 0x2B800009, "type": "Container"},
+    "TAG_LCT_GET_RC_DISCONNECTED_MODE": {"tagvalue": 0x2B80000A, "type": "Container"},
+}
@@ -0,0 +1,31 @@
+"RSCP tags of the LED namespace, tag codes 0x10xxxxxx."
+
+TAGS = {
+    "TAG_LED_REQ_SET_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10000001, "type": "UChar8"},
+    "TAG_LED_REQ_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10000002, "type": "None"},
+    "TAG_LED_REQ_INTENSITY": {"tagvalue": 0x10000003, "type": "None"},
+    "TAG_LED_REQ_SET_INTENSITY": {"tagvalue": 0x10000004, "type": "Uint32"},
+    "TAG_LED_REQ_COLOR": {"tagvalue": 0x10000005, "type": "Uint32"},
+    "TAG_LED_REQ_SET_COLOR": {"tagvalue": 0x10000006, "type": "Container"},
+    "TAG_LED_REQ_HW_INFO": {"tagvalue": 0x10000007, "type": "None"},
+    "TAG_LED_REQ_STORE_CONFIG": {"tagvalue": 0x10000008, "type": "None"},
+    "TAG_LED_REQ_DEVICE_STATE": {"tagvalue": 0x10060000, "type": "None"},
+    "TAG_LED_SET_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10800001, "type": "UChar8"},
+    "TAG_LED_BAR_SWITCHED_ON_STATE": {"tagvalue": 0x10800002, "type": "UChar8"},
+    "TAG_LED_INTENSITY": {"tagvalue": 0x10800003, "type": "Uint32"},
+    "TAG_LED_SET_INTENSITY": {"tagvalue": 0x10800004, "type": "Uint32"},
+    "TAG_LED_COLOR": {"tagvalue": 0x10800005, "type": "Container"},
+    "TAG_LED_SET_COLOR": {"tagvalue": 0x10800006, "type": "Container"},
+    "TAG_LED_HW_INFO": {"tagvalue": 0x10800007, "type": "Container"},
+    "TAG_LED_CONFIG_STORED": {"tagvalue": 0x10800009, "type": "UChar8"},
+    "TAG_LED_DEVICE_STATE": {"tagvalue": 0x10860000, "type": "Container"},
+    "TAG_LED_INDEX": {"tagvalue": 0x10860001, "type": "Uint32"},
+    "TAG_LED_RED": {"tagvalue": 0x10860002, "type": "Uint32"},
+    "TAG_LED_GREEN": {"tagvalue": 0x10860003, "type": "Uint32"},
+    "TAG_LED_BLUE": {"tagvalue": 0x10860004, "type": "Uint32"},
+    "TAG_LED_FW_VERSION": {"tagvalue": 0x10860005, "type": "UInt16"},
+    "TAG_LED_BL_VERSION": {"tagvalue": 0x10860006, "type": "UInt16"},
+    "TAG_LED_DEVICE_CONNECTED": {"tagvalue": 0x10860007, "type": "Bool"},
+    "TAG_LED_DEVICE_WORKING": {"tagvalue": 0x10860008, "type": "Bool"},
+    "TAG_LED_DEVICE_IN_SERVICE": {"tagvalue": 0x10860009, "type": "Bool"},
+}
@@ -0,0 +1,24 @@
+"RSCP tags of the MBS namespace, tag codes 0x13xxxxxx."
+
+TAGS = {
+    "TAG_MBS_REQ_MODBUS_ENABLED": {"tagvalue": 0x13000001, "type": "None"},
+    "TAG_MBS_REQ_MODBUS_CONNECTORS": {"tagvalue": 0x13000002, "type": "None"},
+    "TAG_MBS_REQ_ENABLE_CONNECTOR": {"tagvalue": 0x13000003, "type": "Int32"},
+    "TAG_MBS_REQ_DISABLE_CONNECTOR": {"tagvalue": 0x13000004, "type": "Int32"},
+    "TAG_MBS_REQ_CHANGE_SETTING": {"tagvalue": 0x13000005, "type": "Container"},
+    "TAG_MBS_REQ_SET_MODBUS_ENABLED": {"tagvalue": 0x13700001, "type": "Bool"},
+    "TAG_MBS_MODBUS_ENABLED": {"tagvalue": 0x13800001, "type": "Bool"},
+    "TAG_MBS_MODBUS_CONNECTORS": {"tagvalue": 0x13800002, "type": "Container"},
+    "TAG_MBS_CHANGE_SETTING": {"tagvalue": 0x13800005, "type": "Bool"},
+    "TAG_MBS_REQ_CHANGE_SETTING_ERR": {"tagvalue": 0x13800006, "type": "Container"},
+    "TAG_MBS_MODBUS_CONNECTOR_CONTAINER": {"tagvalue": 0x13810002, "type": "Container"},
+    "TAG_MBS_MODBUS_CONNECTOR_NAME": {"tagvalue": 0x13810003, "type": "CString"},
+    "TAG_MBS_MODBUS_CONNECTOR_ID": {"tagvalue": 0x13810004, "type": "Int32"},
+    "TAG_MBS_MODBUS_CONNECTOR_ENABLED": {"tagvalue": 0x13810005, "type": "Bool"},
+    "TAG_MBS_MODBUS_CONNECTOR_SETUP": {"tagvalue": 0x13810006, "type": "Container"},
+    "TAG_MBS_MODBUS_SETUP_NAME": {"tagvalue": 0x13810007, "type": "CString"},
+    "TAG_MBS_MODBUS_SETUP_TYPE": {"tagvalue": 0x13810008, "type": "Int32"},
+    "TAG_MBS_MODBUS_SETUP_VALUE": {"tagvalue": 0x13810009, "type": "CString"},
+    "TAG_MBS_MODBUS_SETUP_VALUES": {"tagvalue": 0x1381000A, "type": "Container"},
+    "TAG_MBS_MODBUS_SETUP_VALUE_STRING": {"tagvalue": 0x1381000B, "type": "CString"},
+}
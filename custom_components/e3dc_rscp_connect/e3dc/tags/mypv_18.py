@@ -0,0 +1,33 @@
+"RSCP tags of the MYPV namespace, tag codes 0x18xxxxxx."
+
+TAGS = {
+    "TAG_MYPV_REQ_FIND_DEVICES": {"tagvalue": 0x18000003, "type": "None"},
+    "TAG_MYPV_REQ_REMOVE_DEVICES": {"tagvalue": 0x18000006, "type": "Container"},
+    "TAG_MYPV_REQ_INSTANT_BOOST": {"tagvalue": 0x18000007, "type": "Container"},
+    "TAG_MYPV_DEVICE": {"tagvalue": 0x18000100, "type": "Container"},
+    "TAG_MYPV_DEVICE_SERIAL": {"tagvalue": 0x18000101, "type": "CString"},
+    "TAG_MYPV_DEVICE_ENABLED": {"tagvalue": 0x18000102, "type": "Bool"},
+    "TAG_MYPV_DEVICE_IP": {"tagvalue": 0x18000103, "type": "CString"},
+    "TAG_MYPV_DEVICE_TEMPERATURE_CURRENT": {"tagvalue": 0x18000104, "type": "Float32"},
+    "TAG_MYPV_DEVICE_TEMPERATURE_MAXIMUM": {"tagvalue": 0x18000105, "type": "Float32"},
+    "TAG_MYPV_DEVICE_POWER": {"tagvalue": 0x18000106, "type": "Float32"},
+    "TAG_MYPV_DEVICE_STATUS": {"tagvalue": 0x18000107, "type": "UInt16"},
+    "TAG_MYPV_DEVICE_CONTROL_MODE": {"tagvalue": 0x18000108, "type": "UChar8"},
+    "TAG_MYPV_DEVICE_TYPE": {"tagvalue": 0x18000109, "type": "UChar8"},
+    "TAG_MYPV_DEVICE_TIMESPAN_IBOOST": {"tagvalue": 0x18000110, "type": "Uint32"},
+    "TAG_MYPV_DEVICE_BOOST_LIST": {"tagvalue": 0x18000200, "type": "Container"},
+    "TAG_MYPV_DEVICE_BOOST_ITEM": {"tagvalue": 0x18000300, "type": "Container"},
+    "TAG_MYPV_DEVICE_BOOST_START": {"tagvalue": 0x18000301, "type": "Uint32"},
+    "TAG_MYPV_DEVICE_BOOST_STOP": {"tagvalue": 0x18000302, "type": "Uint32"},
+    "TAG_MYPV_DEVICE_BOOST_TEMPERATURE": {"tagvalue": 0x18000303, "type": "Float32"},
+    "TAG_MYPV_DEVICE_BOOST_ACTIVE": {"tagvalue": 0x18000304, "type": "Bool"},
+    "TAG_MYPV_DEVICE_BOOST_WEEKDAYS": {"tagvalue": 0x18000305, "type": "UInt16"},
+    "TAG_MYPV_DEVICE_BOOST_NAME": {"tagvalue": 0x18000306, "type": "CString"},
+    "TAG_MYPV_REQ_LIST_DEVICES": {"tagvalue": 0x18200004, "type": "None"},
+    "TAG_MYPV_REQ_WRITE_DEVICES": {"tagvalue": 0x18300004, "type": "Container"},
+    "TAG_MYPV_RSP_FIND_DEVICES": {"tagvalue": 0x18800003, "type": "None"},
+    "TAG_MYPV_RSP_REMOVE_DEVICES": {"tagvalue": 0x18800006, "type": "UInt16"},
+    "TAG_MYPV_RSP_INSTANT_BOOST": {"tagvalue": 0x18800007, "type": "UInt16"},
+    "TAG_MYPV_RSP_LIST_DEVICES": {"tagvalue": 0x18A00004, "type": "Container"},
+    "TAG_MYPV_RSP_WRITE_DEVICES": {"tagvalue": 0x18B00004, "type": "UInt16"},
+}
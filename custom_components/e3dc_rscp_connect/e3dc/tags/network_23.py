@@ -0,0 +1,37 @@
+"RSCP tags of the NETWORK namespace, tag codes 0x23xxxxxx."
+
+TAGS = {
+    "TAG_NETWORK_REQ_PING": {"tagvalue": 0x23000001, "type": "CString"},
+    "TAG_NETWORK_REQ_INFO": {"tagvalue": 0x23000002, "type": "Container"},
+    "TAG_NETWORK_REQ_DIAGNOSE": {"tagvalue": 0x23000003, "type": "Container"},
+    "TAG_NETWORK_REQ_SET_IP": {"tagvalue": 0x23000004, "type": "CString"},
+    "TAG_NETWORK_REQ_SET_SUBNETMASK": {"tagvalue": 0x23000005, "type": "CString"},
+    "TAG_NETWORK_REQ_SET_GATEWAY": {"tagvalue": 0x23000006, "type": "CString"},
+    "TAG_NETWORK_REQ_SET_DNS_SERVER": {"tagvalue": 0x23000007, "type": "CString"},
+    "TAG_NETWORK_REQ_SET_DHCP": {"tagvalue": 0x23000008, "type": "Bool"},
+    "TAG_NETWORK_REQ_MAKE_INFO_FILE": {"tagvalue": 0x23000009, "type": "CString"},
+    "TAG_NETWORK_REQ_CHECK_INTERNET_SPEED": {"tagvalue": 0x2300000A, "type": "None"},
+    "TAG_NETWORK_PARAM_IP": {"tagvalue": 0x23400001, "type": "CString"},
+    "TAG_NETWORK_PARAM_SUBNETMASK": {"tagvalue": 0x23400002, "type": "CString"},
+    "TAG_NETWORK_PARAM_GATEWAY": {"tagvalue": 0x23400003, "type": "CString"},
+    "TAG_NETWORK_PARAM_DNS_SERVER": {"tagvalue": 0x23400004, "type": "CString"},
+    "TAG_NETWORK_PARAM_DHCP": {"tagvalue": 0x23400005, "type": "Bool"},
+    "TAG_NETWORK_PARAM_MAC_ADDRESS": {"tagvalue": 0x23400006, "type": "CString"},
+    "TAG_NETWORK_PARAM_E3DC_SERVER_REACHABLE": {"tagvalue": 0x23400007, "type": "Bool"},
+    "TAG_NETWORK_PARAM_DNS_SERVER_REACHABLE": {"tagvalue": 0x23400008, "type": "Bool"},
+    "TAG_NETWORK_PARAM_DNS_LOOKUP_WORKING": {"tagvalue": 0x23400009, "type": "Bool"},
+    "TAG_NETWORK_PARAM_GATEWAY_REACHABLE": {"tagvalue": 0x2340000A, "type": "Bool"},
+    "TAG_NETWORK_PARAM_SYSTEM_IP_VALID": {"tagvalue": 0x2340000B, "type": "Bool"},
+    "TAG_NETWORK_PARAM_CABLE_CONNECTED": {"tagvalue": 0x2340000C, "type": "Bool"},
+    "TAG_NETWORK_PARAM_INTERNET_SPEED": {"tagvalue": 0x2340000D, "type": "Float32"},
+    "TAG_NETWORK_PING": {"tagvalue": 0x23800001, "type": "CString"},
+    "TAG_NETWORK_INFO": {"tagvalue": 0x23800002, "type": "Container"},
+    "TAG_NETWORK_DIAGNOSE": {"tagvalue": 0x23800003, "type": "Container"},
+    "TAG_NETWORK_SET_IP": {"tagvalue": 0x23800004, "type": "Bool"},
+    "TAG_NETWORK_SET_SUBNETMASK": {"tagvalue": 0x23800005, "type": "Bool"},
+    "TAG_NETWORK_SET_GATEWAY": {"tagvalue": 0x23800006, "type": "Bool"},
+    "TAG_NETWORK_SET_DNS_SERVER": {"tagvalue": 0x23800007, "type": "Bool"},
+    "TAG_NETWORK_SET_DHCP": {"tagvalue": 0x23800008, "type": "Bool"},
+    "TAG_NETWORK_MAKE_INFO_FILE": {"tagvalue": 0x23800009, "type": "Int32"},
+    "TAG_NETWORK_CHECK_INTERNET_SPEED": {"tagvalue": 0x2380000A, "type": "Bool"},
+}
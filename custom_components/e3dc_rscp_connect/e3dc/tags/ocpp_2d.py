@@ -0,0 +1,649 @@
+"RSCP tags of the OCPP namespace, tag codes 0x2Dxxxxxx."
+
+TAGS = {
+    "TAG_OCPP_WB_LC_REQ_SET_ACCEPTANCE_RULE": {
+        "tagvalue": 0x2D000001,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_NON_ACCEPTED_EVCS": {
+        "tagvalue": 0x2D000002,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_ACCEPTED_EVCS": {
+        "tagvalue": 0x2D000003,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_ACCEPT_EVCS": {"tagvalue": 0x2D000004, "type": "Container"},
+    "TAG_OCPP_WB_LC_REQ_SET_ACCEPT_ALL_EVCS": {
+        "tagvalue": 0x2D000005,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_BADGE_STRATEGY": {
+        "tagvalue": 0x2D000006,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_BADGE_ACQUISITION_MODE_START": {
+        "tagvalue": 0x2D000007,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_BADGE_ACQUISITION_MODE_STOP": {
+        "tagvalue": 0x2D000008,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_ACCEPTANCE_RULE": {
+        "tagvalue": 0x2D000009,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_BADGE_STRATEGY": {
+        "tagvalue": 0x2D00000A,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_ACCEPTED_EVCS_EXTENDED": {
+        "tagvalue": 0x2D00000B,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_AVAILABLE_PARAMETERS_PROFILES": {
+        "tagvalue": 0x2D00000C,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_DEVICE_ADVANCED_SETTINGS": {
+        "tagvalue": 0x2D00000D,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_EVCS_DEVICES_PARAMETERS": {
+        "tagvalue": 0x2D00000E,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_REMOVE_WB": {"tagvalue": 0x2D00000F, "type": "Container"},
+    "TAG_OCPP_WB_LC_REQ_SET_FACTORY_RESET": {
+        "tagvalue": 0x2D000010,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_WALLBOXES_COUNT": {
+        "tagvalue": 0x2D000011,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_MAX_WALLBOXES_COUNT": {
+        "tagvalue": 0x2D000012,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_AVAILABLE_CPO_LIST": {
+        "tagvalue": 0x2D000013,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_CPO_BUTTON_STATE": {
+        "tagvalue": 0x2D000014,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_CPO_BUTTON_STATE": {
+        "tagvalue": 0x2D000015,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_CLEAN_CPO_SETTINGS": {
+        "tagvalue": 0x2D000016,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_CPO_MODE": {"tagvalue": 0x2D000017, "type": "Container"},
+    "TAG_OCPP_WB_LC_REQ_SET_CPO_SETTINGS": {
+        "tagvalue": 0x2D000018,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_CPO_SETTINGS": {
+        "tagvalue": 0x2D000019,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_DEVICE_CPO_CONNECTABLE": {
+        "tagvalue": 0x2D00001A,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_EVCS_DEVICE_CPO_CONNECTABLE": {
+        "tagvalue": 0x2D00001B,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_CPO_MODE": {"tagvalue": 0x2D00001C, "type": "Container"},
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_CHARGING_SESSION_HISTORY_NB": {
+        "tagvalue": 0x2D00001D,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_CHARGING_SESSION_HISTORY": {
+        "tagvalue": 0x2D00001E,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_CHARGING_SESSIONS_ACTIVE": {
+        "tagvalue": 0x2D00001F,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_BADGES_PER_EVCS": {
+        "tagvalue": 0x2D000020,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_BADGES_PER_EVCS": {
+        "tagvalue": 0x2D000021,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_LIST_PER_BADGE": {
+        "tagvalue": 0x2D000022,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_SET_EVCS_LIST_PER_BADGE": {
+        "tagvalue": 0x2D000023,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_REQ_GET_EVCS_PRIORITY_LIST": {
+        "tagvalue": 0x2D000024,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK_DATA": {
+        "tagvalue": 0x2D400000,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_TOKEN": {"tagvalue": 0x2D400001, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_ACCEPTANCE_RULE_VAL": {
+        "tagvalue": 0x2D400002,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_STATUS": {"tagvalue": 0x2D400003, "type": "Uint64"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE": {"tagvalue": 0x2D400004, "type": "Container"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_HOSTNAME": {
+        "tagvalue": 0x2D400005,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_IP": {"tagvalue": 0x2D400006, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ID": {
+        "tagvalue": 0x2D400007,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_STATUS": {
+        "tagvalue": 0x2D400008,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_BADGE_STRATEGY": {"tagvalue": 0x2D400009, "type": "UInt16"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR": {
+        "tagvalue": 0x2D40000A,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_ID": {
+        "tagvalue": 0x2D40000B,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_PLUG_TYPE": {
+        "tagvalue": 0x2D40000C,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MAX_CURRENT_PER_PHASE": {
+        "tagvalue": 0x2D40000D,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MIN_CURRENT_PER_PHASE": {
+        "tagvalue": 0x2D40000E,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_AUTH_OFFLINE_CHARGE_SESS": {
+        "tagvalue": 0x2D40000F,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_SETTINGS": {
+        "tagvalue": 0x2D400010,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ACCEPT_UNKNOWN_OFFLINE_AUTH": {
+        "tagvalue": 0x2D400011,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_AUTHORIZATION_CACHE_ENABLED": {
+        "tagvalue": 0x2D400012,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_REMOTE_TRANSACTION_ENABLED": {
+        "tagvalue": 0x2D400013,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_BLINKS_NUMBER": {
+        "tagvalue": 0x2D400014,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CLOCK_ALIGNED_DATA_INTERVAL": {
+        "tagvalue": 0x2D400015,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTION_TIMEOUT": {
+        "tagvalue": 0x2D400016,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTOR_PHASE_ROTATION": {
+        "tagvalue": 0x2D400017,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_HEARTBEAT_INTERVAL": {
+        "tagvalue": 0x2D400018,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LIGHT_INTENSITY": {
+        "tagvalue": 0x2D400019,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_AUTHORIZE_OFFLINE": {
+        "tagvalue": 0x2D40001A,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_PRE_AUTHORIZE": {
+        "tagvalue": 0x2D40001B,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_MAX_ENERGY_ON_INVALID_ID": {
+        "tagvalue": 0x2D40001C,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING": {
+        "tagvalue": 0x2D40001D,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CLUSTER_NAME": {
+        "tagvalue": 0x2D40001E,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_NAME": {
+        "tagvalue": 0x2D40001F,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONFIG_STATUS": {
+        "tagvalue": 0x2D400020,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_PARAMETERS_PROFILE": {
+        "tagvalue": 0x2D400021,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_DEFAULT_CHARGING_PROFILE": {
+        "tagvalue": 0x2D400022,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PLUG_TYPE_PER_CONNECTOR": {
+        "tagvalue": 0x2D400023,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_ID": {"tagvalue": 0x2D400024, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_STATE": {
+        "tagvalue": 0x2D400025,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_WB_COUNT": {"tagvalue": 0x2D400026, "type": "UInt16"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_COUNT": {
+        "tagvalue": 0x2D400027,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_CPO_INFO": {"tagvalue": 0x2D400028, "type": "Container"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_NAME": {"tagvalue": 0x2D400029, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_URI": {"tagvalue": 0x2D40002A, "type": "Container"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_BUTTON": {"tagvalue": 0x2D40002B, "type": "Bool"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_MODE": {"tagvalue": 0x2D40002C, "type": "Bool"},
+    "TAG_OCPP_WB_LC_PARAM_SETTINGS": {"tagvalue": 0x2D40002D, "type": "Container"},
+    "TAG_OCPP_WB_LC_PARAM_CREDENTIALS": {"tagvalue": 0x2D40002E, "type": "Container"},
+    "TAG_OCPP_WB_LC_PARAM_LOGIN": {"tagvalue": 0x2D40002F, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_PASSWORD": {"tagvalue": 0x2D400030, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_AUTH_TYPE": {"tagvalue": 0x2D400031, "type": "UInt16"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_ADDRESS": {"tagvalue": 0x2D400032, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_PORT": {"tagvalue": 0x2D400033, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_PATH": {"tagvalue": 0x2D400034, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_CPO_UUID": {"tagvalue": 0x2D400035, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_START_DATE": {
+        "tagvalue": 0x2D400036,
+        "type": "Timestamp",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_STOP_DATE": {
+        "tagvalue": 0x2D400037,
+        "type": "Timestamp",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_HISTORY_NB": {
+        "tagvalue": 0x2D400038,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_CHARGING_SESSION_HISTORY": {
+        "tagvalue": 0x2D400039,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_ID": {"tagvalue": 0x2D40003A, "type": "CString"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_COMMENT": {
+        "tagvalue": 0x2D40003B,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_ENERGY_CHARGED": {
+        "tagvalue": 0x2D40003C,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_END_DATE": {"tagvalue": 0x2D40003D, "type": "Timestamp"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_TRANSACTION_ID": {
+        "tagvalue": 0x2D40003E,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_IS_EVCS_CHARGING_SESSIONS_ACTIVE": {
+        "tagvalue": 0x2D40003F,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK_ID": {
+        "tagvalue": 0x2D400040,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CPO_CONFIG_STATUS": {
+        "tagvalue": 0x2D400041,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_ASSOCIATED": {
+        "tagvalue": 0x2D400042,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_BADGE": {
+        "tagvalue": 0x2D400044,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_ASSOCIATED": {
+        "tagvalue": 0x2D400045,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK": {"tagvalue": 0x2D400048, "type": "Uint64"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_BADGE_MASK_INDEX": {
+        "tagvalue": 0x2D400049,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MAX_CURRENT_PER_PHASE_LIMIT": {
+        "tagvalue": 0x2D40004A,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MIN_CURRENT_PER_PHASE_LIMIT": {
+        "tagvalue": 0x2D40004B,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT": {
+        "tagvalue": 0x2D40004C,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_ID": {
+        "tagvalue": 0x2D40004D,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_POSITION": {
+        "tagvalue": 0x2D40004E,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MODEL": {
+        "tagvalue": 0x2D400051,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_ENERGY_INDEX": {
+        "tagvalue": 0x2D400052,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_USE_WB_SPECIFIC_AUTH": {
+        "tagvalue": 0x2D400053,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_SESSION_NUMBER": {
+        "tagvalue": 0x2D400054,
+        "type": "Uint64",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_INDEX": {
+        "tagvalue": 0x2D400055,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_PRIORITY_RANK": {
+        "tagvalue": 0x2D400056,
+        "type": "Int16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_SETPOINT": {
+        "tagvalue": 0x2D400057,
+        "type": "Int32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_GET_WB_SPECIFIC_AUTH": {
+        "tagvalue": 0x2D400058,
+        "type": "Bool",
+    },
+    "TAG_OCPP_WB_LC_PARAM_BROKER_ERROR_STATUS": {
+        "tagvalue": 0x2D400059,
+        "type": "UInt16",
+    },
+    "TAG_OCPP_WB_LC_PARAM_CPO_URI_CUSTOM_ID": {
+        "tagvalue": 0x2D40005A,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_CPO_USE_CUSTOM_ID": {"tagvalue": 0x2D40005B, "type": "Bool"},
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_ID_PROPS": {
+        "tagvalue": 0x2D40005C,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_HOSTNAME_PROPS": {
+        "tagvalue": 0x2D40005D,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_IP_PROPS": {
+        "tagvalue": 0x2D40005E,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ID_PROPS": {
+        "tagvalue": 0x2D40005F,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CLUSTER_NAME_PROPS": {
+        "tagvalue": 0x2D400060,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_NAME_PROPS": {
+        "tagvalue": 0x2D400061,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONFIG_STATUS_PROPS": {
+        "tagvalue": 0x2D400062,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_PARAMETERS_PROFILE_PROPS": {
+        "tagvalue": 0x2D400063,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_DEFAULT_CHARGING_PROFILE_PROPS": {
+        "tagvalue": 0x2D400064,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PLUG_TYPE_PER_CONNECTOR_PROPS": {
+        "tagvalue": 0x2D400065,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MAX_CURRENT_PER_PHASE_LIMIT_PROPS": {
+        "tagvalue": 0x2D400066,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_MIN_CURRENT_PER_PHASE_LIMIT_PROPS": {
+        "tagvalue": 0x2D400067,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_ACCEPT_UNKNOWN_OFFLINE_AUTH_PROPS": {
+        "tagvalue": 0x2D400068,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_AUTHORIZATION_CACHE_ENABLED_PROPS": {
+        "tagvalue": 0x2D400069,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_REMOTE_TRANSACTION_ENABLED_PROPS": {
+        "tagvalue": 0x2D40006A,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTION_TIMEOUT_PROPS": {
+        "tagvalue": 0x2D40006B,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_CONNECTOR_PHASE_ROTATION_PROPS": {
+        "tagvalue": 0x2D40006C,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_HEARTBEAT_INTERVAL_PROPS": {
+        "tagvalue": 0x2D40006D,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_AUTHORIZE_OFFLINE_PROPS": {
+        "tagvalue": 0x2D40006E,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_OCPP_LOCAL_PRE_AUTHORIZE_PROPS": {
+        "tagvalue": 0x2D40006F,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING_PROPS": {
+        "tagvalue": 0x2D400070,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_ID_PROPS": {
+        "tagvalue": 0x2D400071,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CHARGEPOINT_POSITION_PROPS": {
+        "tagvalue": 0x2D400072,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_ID_PROPS": {
+        "tagvalue": 0x2D400073,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_PLUG_TYPE_PROPS": {
+        "tagvalue": 0x2D400074,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MAX_CURRENT_PER_PHASE_PROPS": {
+        "tagvalue": 0x2D400075,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_MIN_CURRENT_PER_PHASE_PROPS": {
+        "tagvalue": 0x2D400076,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_CONNECTOR_AUTH_OFFLINE_CHARGE_SESS_PROPS": {
+        "tagvalue": 0x2D400077,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING_VALID_VALUES": {
+        "tagvalue": 0x2D400078,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_PHASE_MAPPING_VALUE": {
+        "tagvalue": 0x2D400079,
+        "type": "UChar8",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_VALID_VALUES": {
+        "tagvalue": 0x2D40007A,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_VALUE": {
+        "tagvalue": 0x2D40007B,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_MODEL": {
+        "tagvalue": 0x2D40007C,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_DISPLAY_NAME": {
+        "tagvalue": 0x2D40007D,
+        "type": "CString",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_MODEL_PROPS": {
+        "tagvalue": 0x2D40007E,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_PARAM_EVCS_DEVICE_SUBMETER_VALID_VALUES_PROPS": {
+        "tagvalue": 0x2D40007F,
+        "type": "Uint32",
+    },
+    "TAG_OCPP_WB_LC_SET_ACCEPTANCE_RULE": {"tagvalue": 0x2D800001, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_NON_ACCEPTED_EVCS": {
+        "tagvalue": 0x2D800002,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_ACCEPTED_EVCS": {"tagvalue": 0x2D800003, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_ACCEPT_EVCS": {"tagvalue": 0x2D800004, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_ACCEPT_ALL_EVCS": {"tagvalue": 0x2D800005, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_BADGE_STRATEGY": {"tagvalue": 0x2D800006, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_BADGE_ACQUISITION_MODE_START": {
+        "tagvalue": 0x2D800007,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_BADGE_ACQUISITION_MODE_STOP": {
+        "tagvalue": 0x2D800008,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_ACCEPTANCE_RULE": {"tagvalue": 0x2D800009, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_BADGE_STRATEGY": {"tagvalue": 0x2D80000A, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_ACCEPTED_EVCS_EXTENDED": {
+        "tagvalue": 0x2D80000B,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_EVCS_AVAILABLE_PARAMETERS_PROFILES": {
+        "tagvalue": 0x2D80000C,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_EVCS_DEVICE_ADVANCED_SETTINGS": {
+        "tagvalue": 0x2D80000D,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_EVCS_DEVICES_PARAMETERS": {
+        "tagvalue": 0x2D80000E,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_REMOVE_WB": {"tagvalue": 0x2D80000F, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_FACTORY_RESET": {"tagvalue": 0x2D800010, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_WALLBOXES_COUNT": {"tagvalue": 0x2D800011, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_MAX_WALLBOXES_COUNT": {
+        "tagvalue": 0x2D800012,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_AVAILABLE_CPO_LIST": {
+        "tagvalue": 0x2D800013,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_CPO_BUTTON_STATE": {
+        "tagvalue": 0x2D800014,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_CPO_BUTTON_STATE": {
+        "tagvalue": 0x2D800015,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_CLEAN_CPO_SETTINGS": {
+        "tagvalue": 0x2D800016,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_CPO_MODE": {"tagvalue": 0x2D800017, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_CPO_SETTINGS": {"tagvalue": 0x2D800018, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_CPO_SETTINGS": {"tagvalue": 0x2D800019, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_EVCS_DEVICE_CPO_CONNECTABLE": {
+        "tagvalue": 0x2D80001A,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_EVCS_DEVICE_CPO_CONNECTABLE": {
+        "tagvalue": 0x2D80001B,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_CPO_MODE": {"tagvalue": 0x2D80001C, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_EVCS_CHARGING_SESSION_HISTORY_NB": {
+        "tagvalue": 0x2D80001D,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_EVCS_CHARGING_SESSION_HISTORY": {
+        "tagvalue": 0x2D80001E,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_EVCS_CHARGING_SESSIONS_ACTIVE": {
+        "tagvalue": 0x2D80001F,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_BADGES_PER_EVCS": {"tagvalue": 0x2D800020, "type": "Container"},
+    "TAG_OCPP_WB_LC_SET_BADGES_PER_EVCS": {"tagvalue": 0x2D800021, "type": "Container"},
+    "TAG_OCPP_WB_LC_GET_EVCS_LIST_PER_BADGE": {
+        "tagvalue": 0x2D800022,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_SET_EVCS_LIST_PER_BADGE": {
+        "tagvalue": 0x2D800023,
+        "type": "Container",
+    },
+    "TAG_OCPP_WB_LC_GET_EVCS_PRIORITY_LIST": {
+        "tagvalue": 0x2D800024,
+        "type": "Container",
+    },
+}
@@ -0,0 +1,11 @@
+"RSCP tags of the OVP namespace, tag codes 0x22xxxxxx."
+
+TAGS = {
+    "TAG_OVP_REQ_STATUS": {"tagvalue": 0x22000001, "type": "Container"},
+    "TAG_OVP_REQ_RESET": {"tagvalue": 0x22000002, "type": "Container"},
+    "TAG_OVP_PARAM_INDEX": {"tagvalue": 0x22400001, "type": "UChar8"},
+    "TAG_OVP_PARAM_STATUS": {"tagvalue": 0x22800001, "type": "UChar8"},
+    "TAG_OVP_PARAM_RESET": {"tagvalue": 0x22800002, "type": "Bool"},
+    "TAG_OVP_STATUS": {"tagvalue": 0x22800003, "type": "Container"},
+    "TAG_OVP_RESET": {"tagvalue": 0x22800004, "type": "Container"},
+}
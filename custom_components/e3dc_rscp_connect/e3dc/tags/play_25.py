@@ -0,0 +1,13 @@
+"RSCP tags of the PLAY namespace, tag codes 0x25xxxxxx."
+
+TAGS = {
+    "TAG_PLAY_REQ_IS_REMOTE_SETPOINT_ACTIVE": {"tagvalue": 0x25000000, "type": "None"},
+    "TAG_PLAY_REQ_DATA": {"tagvalue": 0x25000001, "type": "Container"},
+    "TAG_PLAY_REQ_SET_POWER_SETPOINT": {"tagvalue": 0x25000002, "type": "Uint32"},
+    "TAG_PLAY_REQ_GET_POWER_SETPOINT": {"tagvalue": 0x25000003, "type": "None"},
+    "TAG_PLAY_SEND_TIME": {"tagvalue": 0x25400001, "type": "Uint64"},
+    "TAG_PLAY_IS_REMOTE_SETPOINT_ACTIVE": {"tagvalue": 0x25800000, "type": "Bool"},
+    "TAG_PLAY_DATA": {"tagvalue": 0x25800001, "type": "Container"},
+    "TAG_PLAY_SET_POWER_SETPOINT": {"tagvalue": 0x25800002, "type": "Bool"},
+    "TAG_PLAY_GET_POWER_SETPOINT": {"tagvalue": 0x25800003, "type": "Uint32"},
+}
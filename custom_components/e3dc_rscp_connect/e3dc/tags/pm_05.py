@@ -0,0 +1,95 @@
+"RSCP tags of the PM namespace, tag codes 0x05xxxxxx."
+
+TAGS = {
+    "TAG_PM_REQ_POWER_L1": {"tagvalue": 0x05000001, "type": "None"},
+    "TAG_PM_REQ_POWER_L2": {"tagvalue": 0x05000002, "type": "None"},
+    "TAG_PM_REQ_POWER_L3": {"tagvalue": 0x05000003, "type": "None"},
+    "TAG_PM_REQ_ACTIVE_PHASES": {"tagvalue": 0x05000004, "type": "None"},
+    "TAG_PM_REQ_MODE": {"tagvalue": 0x05000005, "type": "None"},
+    "TAG_PM_REQ_ENERGY_L1": {"tagvalue": 0x05000006, "type": "None"},
+    "TAG_PM_REQ_ENERGY_L2": {"tagvalue": 0x05000007, "type": "None"},
+    "TAG_PM_REQ_ENERGY_L3": {"tagvalue": 0x05000008, "type": "None"},
+    "TAG_PM_REQ_DEVICE_ID": {"tagvalue": 0x05000009, "type": "None"},
+    "TAG_PM_REQ_ERROR_CODE": {"tagvalue": 0x0500000A, "type": "None"},
+    "TAG_PM_REQ_SET_PHASE_ELIMINATION": {"tagvalue": 0x0500000B, "type": "UChar8"},
+    "TAG_PM_REQ_FIRMWARE_VERSION": {"tagvalue": 0x0500000C, "type": "None"},
+    "TAG_PM_REQ_SET_FOR_EMERGENCY_TEST": {"tagvalue": 0x0500000D, "type": "None"},
+    "TAG_PM_REQ_IS_CAN_SILENCE": {"tagvalue": 0x0500000E, "type": "None"},
+    "TAG_PM_REQ_MAX_PHASE_POWER": {"tagvalue": 0x0500000F, "type": "None"},
+    "TAG_PM_REQ_GET_EXTERN_LOAD": {"tagvalue": 0x05000010, "type": "None"},
+    "TAG_PM_REQ_VOLTAGE_L1": {"tagvalue": 0x05000011, "type": "None"},
+    "TAG_PM_REQ_VOLTAGE_L2": {"tagvalue": 0x05000012, "type": "None"},
+    "TAG_PM_REQ_VOLTAGE_L3": {"tagvalue": 0x05000013, "type": "None"},
+    "TAG_PM_REQ_TYPE": {"tagvalue": 0x05000014, "type": "None"},
+    "TAG_PM_REQ_SET_TYPE": {"tagvalue": 0x05000015, "type": "Uint32"},
+    "TAG_PM_REQ_SET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05000016, "type": "Uint32"},
+    "TAG_PM_REQ_GET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05000017, "type": "None"},
+    "TAG_PM_REQ_GET_PHASE_ELIMINATION": {"tagvalue": 0x05000018, "type": "None"},
+    "TAG_PM_REQ_GET_CURRENT_SENSOR_TYPE_STRING": {
+        "tagvalue": 0x05000019,
+        "type": "None",
+    },
+    "TAG_PM_REQ_COMM_STATE": {"tagvalue": 0x05000050, "type": "None"},
+    "TAG_PM_REQ_CONNECTED_DEVICES": {"tagvalue": 0x050000A0, "type": "None"},
+    "TAG_PM_REQ_SET_DEVICE_NAME": {"tagvalue": 0x050000B0, "type": "CString"},
+    "TAG_PM_REQ_DEVICE_NAME": {"tagvalue": 0x050000B1, "type": "None"},
+    "TAG_PM_REQ_SET_EXTERN_LOAD": {"tagvalue": 0x050000B3, "type": "Container"},
+    "TAG_PM_REQ_INJECT_DATA": {"tagvalue": 0x050000B4, "type": "Container"},
+    "TAG_PM_REQ_SET_CAN_ID": {"tagvalue": 0x050000B5, "type": "Container"},
+    "TAG_PM_REQ_DATA": {"tagvalue": 0x05040000, "type": "Container"},
+    "TAG_PM_INDEX": {"tagvalue": 0x05040001, "type": "UInt16"},
+    "TAG_PM_REQ_DEVICE_STATE": {"tagvalue": 0x05060000, "type": "None"},
+    "TAG_PM_ID1": {"tagvalue": 0x05400001, "type": "CString"},
+    "TAG_PM_ID2": {"tagvalue": 0x05400002, "type": "CString"},
+    "TAG_PM_ID3": {"tagvalue": 0x05400003, "type": "CString"},
+    "TAG_PM_POWER_L1": {"tagvalue": 0x05800001, "type": "Double64"},
+    "TAG_PM_POWER_L2": {"tagvalue": 0x05800002, "type": "Double64"},
+    "TAG_PM_POWER_L3": {"tagvalue": 0x05800003, "type": "Double64"},
+    "TAG_PM_ACTIVE_PHASES": {"tagvalue": 0x05800004, "type": "UChar8"},
+    "TAG_PM_MODE": {"tagvalue": 0x05800005, "type": "UChar8"},
+    "TAG_PM_ENERGY_L1": {"tagvalue": 0x05800006, "type": "Double64"},
+    "TAG_PM_ENERGY_L2": {"tagvalue": 0x05800007, "type": "Double64"},
+    "TAG_PM_ENERGY_L3": {"tagvalue": 0x05800008, "type": "Double64"},
+    "TAG_PM_DEVICE_ID": {"tagvalue": 0x05800009, "type": "Uint32"},
+    "TAG_PM_ERROR_CODE": {"tagvalue": 0x0580000A, "type": "UChar8"},
+    "TAG_PM_SET_PHASE_ELIMINATION": {"tagvalue": 0x0580000B, "type": "Bool"},
+    "TAG_PM_FIRMWARE_VERSION": {"tagvalue": 0x0580000C, "type": "UChar8"},
+    "TAG_PM_SET_FOR_EMERGENCY_TEST": {"tagvalue": 0x0580000D, "type": "Bool"},
+    "TAG_PM_IS_CAN_SILENCE": {"tagvalue": 0x0580000E, "type": "Bool"},
+    "TAG_PM_MAX_PHASE_POWER": {"tagvalue": 0x0580000F, "type": "Double64"},
+    "TAG_PM_GET_EXTERN_LOAD": {"tagvalue": 0x05800010, "type": "Container"},
+    "TAG_PM_VOLTAGE_L1": {"tagvalue": 0x05800011, "type": "Float32"},
+    "TAG_PM_VOLTAGE_L2": {"tagvalue": 0x05800012, "type": "Float32"},
+    "TAG_PM_VOLTAGE_L3": {"tagvalue": 0x05800013, "type": "Float32"},
+    "TAG_PM_TYPE": {"tagvalue": 0x05800014, "type": "UInt16"},
+    "TAG_PM_SET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05800016, "type": "Bool"},
+    "TAG_PM_GET_CURRENT_SENSOR_TYPE": {"tagvalue": 0x05800017, "type": "Uint32"},
+    "TAG_PM_GET_PHASE_ELIMINATION": {"tagvalue": 0x05800018, "type": "UChar8"},
+    "TAG_PM_GET_CURRENT_SENSOR_TYPE_STRING": {
+        "tagvalue": 0x05800019,
+        "type": "CString",
+    },
+    "TAG_PM_COMM_STATE": {"tagvalue": 0x05800050, "type": "Container"},
+    "TAG_PM_CS_START_TIME": {"tagvalue": 0x05800051, "type": "Uint64"},
+    "TAG_PM_CS_LAST_TIME": {"tagvalue": 0x05800052, "type": "Uint64"},
+    "TAG_PM_CS_SUCC_FRAMES_ALL": {"tagvalue": 0x05800053, "type": "Uint64"},
+    "TAG_PM_CS_SUCC_FRAMES_100": {"tagvalue": 0x05800054, "type": "Uint64"},
+    "TAG_PM_CS_EXP_FRAMES_ALL": {"tagvalue": 0x05800055, "type": "Uint64"},
+    "TAG_PM_CS_EXP_FRAMES_100": {"tagvalue": 0x05800056, "type": "Uint64"},
+    "TAG_PM_CS_ERR_FRAMES_ALL": {"tagvalue": 0x05800057, "type": "Uint64"},
+    "TAG_PM_CS_ERR_FRAMES_100": {"tagvalue": 0x05800058, "type": "Uint64"},
+    "TAG_PM_CS_UNK_FRAMES": {"tagvalue": 0x05800059, "type": "Uint64"},
+    "TAG_PM_CS_ERR_FRAME": {"tagvalue": 0x0580005A, "type": "Uint64"},
+    "TAG_PM_CONNECTED_DEVICES": {"tagvalue": 0x058000A0, "type": "Container"},
+    "TAG_PM_CONNECTED_DEVICE": {"tagvalue": 0x058000A1, "type": "Container"},
+    "TAG_PM_DEVICE_NAME": {"tagvalue": 0x058000B1, "type": "CString"},
+    "TAG_PM_SET_EXTERN_LOAD": {"tagvalue": 0x058000B3, "type": "Container"},
+    "TAG_PM_INJECT_DATA": {"tagvalue": 0x058000B4, "type": "Container"},
+    "TAG_PM_SET_CAN_ID": {"tagvalue": 0x058000B5, "type": "Bool"},
+    "TAG_PM_DATA": {"tagvalue": 0x05840000, "type": "Container"},
+    "TAG_PM_DEVICE_STATE": {"tagvalue": 0x05860000, "type": "Container"},
+    "TAG_PM_DEVICE_CONNECTED": {"tagvalue": 0x05860001, "type": "Bool"},
+    "TAG_PM_DEVICE_WORKING": {"tagvalue": 0x05860002, "type": "Bool"},
+    "TAG_PM_DEVICE_IN_SERVICE": {"tagvalue": 0x05860003, "type": "Bool"},
+    "TAG_PM_GENERAL_ERROR": {"tagvalue": 0x05FFFFFF, "type": "Error"},
+}
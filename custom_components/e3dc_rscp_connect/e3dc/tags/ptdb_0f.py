@@ -0,0 +1,13 @@
+"RSCP tags of the PTDB namespace, tag codes 0x0Fxxxxxx."
+
+TAGS = {
+    "TAG_PTDB_REQ_SET_STD_PROPS": {"tagvalue": 0x0F000001, "type": "None"},
+    "TAG_PTDB_REQ_SET_PROP": {"tagvalue": 0x0F000002, "type": "Container"},
+    "TAG_PTDB_REQ_PROP": {"tagvalue": 0x0F000003, "type": "Container"},
+    "TAG_PTDB_PARAM_TABLE": {"tagvalue": 0x0F400001, "type": "CString"},
+    "TAG_PTDB_PARAM_KEY": {"tagvalue": 0x0F400002, "type": "CString"},
+    "TAG_PTDB_PARAM_VALUE": {"tagvalue": 0x0F400003, "type": "CString"},
+    "TAG_PTDB_SET_STD_PROPS": {"tagvalue": 0x0F800001, "type": "Container"},
+    "TAG_PTDB_SET_PROP": {"tagvalue": 0x0F800002, "type": "Bool"},
+    "TAG_PTDB_PROP": {"tagvalue": 0x0F800003, "type": "Container"},
+}
@@ -0,0 +1,212 @@
+"RSCP tags of the PVI namespace, tag codes 0x02xxxxxx."
+
+TAGS = {
+    "TAG_PVI_REQ_GET_POSSIBLE_ELETRICAL_SYSTEM_TYPES": {
+        "tagvalue": 0x02000000,
+        "type": "None",
+    },
+    "TAG_PVI_REQ_ON_GRID": {"tagvalue": 0x02000001, "type": "None"},
+    "TAG_PVI_REQ_STATE": {"tagvalue": 0x02000002, "type": "None"},
+    "TAG_PVI_REQ_LAST_ERROR": {"tagvalue": 0x02000003, "type": "None"},
+    "TAG_PVI_REQ_IS_FLASHING": {"tagvalue": 0x02000004, "type": "None"},
+    "TAG_PVI_REQ_START_FLASHING": {"tagvalue": 0x02000005, "type": "CString"},
+    "TAG_PVI_REQ_FLASH_FILE_LIST": {"tagvalue": 0x02000006, "type": "None"},
+    "TAG_PVI_REQ_SERVICE_PROGRESS_STATE": {"tagvalue": 0x02000008, "type": "None"},
+    "TAG_PVI_REQ_TYPE": {"tagvalue": 0x02000009, "type": "None"},
+    "TAG_PVI_REQ_GET_GAPP_LAST_CHANGE_TIME": {"tagvalue": 0x0200000A, "type": "None"},
+    "TAG_PVI_REQ_GET_GAPP_SYNC_TIME": {"tagvalue": 0x0200000B, "type": "None"},
+    "TAG_PVI_REQ_SET_GAPP_SYNC_TIME": {"tagvalue": 0x0200000C, "type": "Int64"},
+    "TAG_PVI_REQ_SET_TYPE_OF_ELECTRICAL_SYSTEM": {
+        "tagvalue": 0x0200000D,
+        "type": "Char8",
+    },
+    "TAG_PVI_REQ_GET_TYPE_OF_ELECTRICAL_SYSTEM": {
+        "tagvalue": 0x0200000E,
+        "type": "None",
+    },
+    "TAG_PVI_REQ_LAND_CODE": {"tagvalue": 0x02000010, "type": "None"},
+    "TAG_PVI_REQ_LAND_CODE_LIST": {"tagvalue": 0x02000011, "type": "None"},
+    "TAG_PVI_REQ_SET_LAND_CODE": {"tagvalue": 0x02000012, "type": "CString"},
+    "TAG_PVI_REQ_ERROR_LIST": {"tagvalue": 0x02000013, "type": "None"},
+    "TAG_PVI_ERROR_LIST": {"tagvalue": 0x02000014, "type": "Container"},
+    "TAG_PVI_REQ_STATUS_LIST": {"tagvalue": 0x02000015, "type": "None"},
+    "TAG_PVI_STATUS_LIST": {"tagvalue": 0x02000016, "type": "Container"},
+    "TAG_PVI_REQ_SET_DEVICE_SILENCE": {"tagvalue": 0x02000017, "type": "Bool"},
+    "TAG_PVI_REQ_DEVICE_SILENCE": {"tagvalue": 0x02000018, "type": "None"},
+    "TAG_PVI_REQ_SELF_TEST": {"tagvalue": 0x02000019, "type": "UChar8"},
+    "TAG_PVI_REQ_SET_FREE_INVERTER": {"tagvalue": 0x02000020, "type": "None"},
+    "TAG_PVI_REQ_SET_BLOCK_INVERTER": {"tagvalue": 0x02000021, "type": "None"},
+    "TAG_PVI_REQ_UZK_VOLTAGE": {"tagvalue": 0x02000050, "type": "None"},
+    "TAG_PVI_REQ_COS_PHI": {"tagvalue": 0x02000060, "type": "None"},
+    "TAG_PVI_REQ_SET_COS_PHI": {"tagvalue": 0x02000061, "type": "Container"},
+    "TAG_PVI_COS_PHI_VALUE": {"tagvalue": 0x02000062, "type": "Float32"},
+    "TAG_PVI_COS_PHI_IS_AKTIV": {"tagvalue": 0x02000063, "type": "Bool"},
+    "TAG_PVI_COS_PHI_EXCITED": {"tagvalue": 0x02000064, "type": "UChar8"},
+    "TAG_PVI_REQ_VOLTAGE_MONITORING": {"tagvalue": 0x02000070, "type": "None"},
+    "TAG_PVI_REQ_SET_VOLTAGE_MONITORING": {"tagvalue": 0x02000071, "type": "Container"},
+    "TAG_PVI_VOLTAGE_MONITORING_THRESHOLD_TOP": {
+        "tagvalue": 0x02000072,
+        "type": "Float32",
+    },
+    "TAG_PVI_VOLTAGE_MONITORING_THRESHOLD_BOTTOM": {
+        "tagvalue": 0x02000073,
+        "type": "Float32",
+    },
+    "TAG_PVI_VOLTAGE_MONITORING_SLOPE_UP": {"tagvalue": 0x02000074, "type": "Float32"},
+    "TAG_PVI_VOLTAGE_MONITORING_SLOPE_DOWN": {
+        "tagvalue": 0x02000075,
+        "type": "Float32",
+    },
+    "TAG_PVI_REQ_FREQUENCY_UNDER_OVER": {"tagvalue": 0x02000080, "type": "None"},
+    "TAG_PVI_REQ_SET_FREQUENCY_UNDER_OVER": {
+        "tagvalue": 0x02000081,
+        "type": "Container",
+    },
+    "TAG_PVI_FREQUENCY_UNDER": {"tagvalue": 0x02000082, "type": "Float32"},
+    "TAG_PVI_FREQUENCY_OVER": {"tagvalue": 0x02000083, "type": "Float32"},
+    "TAG_PVI_REQ_SET_SYSTEM_MODE": {"tagvalue": 0x02000084, "type": "UChar8"},
+    "TAG_PVI_REQ_SYSTEM_MODE": {"tagvalue": 0x02000085, "type": "None"},
+    "TAG_PVI_REQ_SET_POWER_MODE": {"tagvalue": 0x02000086, "type": "UChar8"},
+    "TAG_PVI_REQ_POWER_MODE": {"tagvalue": 0x02000087, "type": "None"},
+    "TAG_PVI_REQ_USED_STRING_COUNT": {"tagvalue": 0x02000090, "type": "None"},
+    "TAG_PVI_REQ_SET_USED_STRING_COUNT": {"tagvalue": 0x02000091, "type": "UChar8"},
+    "TAG_PVI_REQ_DERATE_TO_POWER": {"tagvalue": 0x02000092, "type": "Float32"},
+    "TAG_PVI_REQ_TEMPERATURE": {"tagvalue": 0x02000100, "type": "UChar8"},
+    "TAG_PVI_REQ_TEMPERATURE_COUNT": {"tagvalue": 0x02000101, "type": "UChar8"},
+    "TAG_PVI_REQ_MAX_TEMPERATURE": {"tagvalue": 0x02000102, "type": "UChar8"},
+    "TAG_PVI_REQ_MIN_TEMPERATURE": {"tagvalue": 0x02000103, "type": "UChar8"},
+    "TAG_PVI_REQ_CT_TAR_USV_BOX": {"tagvalue": 0x02000104, "type": "None"},
+    "TAG_PVI_REQ_ROTARY_FIELD_DIRECTION": {"tagvalue": 0x02000105, "type": "None"},
+    "TAG_PVI_REQ_DATA": {"tagvalue": 0x02040000, "type": "Container"},
+    "TAG_PVI_INDEX": {"tagvalue": 0x02040001, "type": "UInt16"},
+    "TAG_PVI_VALUE": {"tagvalue": 0x02040005, "type": "None", "type_variable": True},
+    "TAG_PVI_REQ_DEVICE_STATE": {"tagvalue": 0x02060000, "type": "None"},
+    "TAG_PVI_REQ_SERIAL_NUMBER": {"tagvalue": 0x020ABC01, "type": "None"},
+    "TAG_PVI_REQ_VERSION": {"tagvalue": 0x020ABC02, "type": "None"},
+    "TAG_PVI_VERSION_MAIN": {"tagvalue": 0x020ABC03, "type": "CString"},
+    "TAG_PVI_VERSION_PIC": {"tagvalue": 0x020ABC04, "type": "CString"},
+    "TAG_PVI_VERSION_ALL": {"tagvalue": 0x020ABC05, "type": "CString"},
+    "TAG_PVI_REQ_GAPP_JSON": {"tagvalue": 0x020ABC13, "type": "None"},
+    "TAG_PVI_REQ_GAPP_JSON_MD5": {"tagvalue": 0x020ABC14, "type": "None"},
+    "TAG_PVI_REQ_SET_RESET_GPIO": {"tagvalue": 0x020ABC50, "type": "Bool"},
+    "TAG_PVI_REQ_SET_POWEROFF_GPIO": {"tagvalue": 0x020ABC51, "type": "Bool"},
+    "TAG_PVI_REQ_SET_NIGHTSWITCH_GPIO": {"tagvalue": 0x020ABC52, "type": "Bool"},
+    "TAG_PVI_REQ_SET_PRE_GRID_CHARGE": {"tagvalue": 0x020ABC60, "type": "None"},
+    "TAG_PVI_REQ_AC_MAX_PHASE_COUNT": {"tagvalue": 0x020AC000, "type": "None"},
+    "TAG_PVI_REQ_AC_POWER": {"tagvalue": 0x020AC001, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_VOLTAGE": {"tagvalue": 0x020AC002, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_CURRENT": {"tagvalue": 0x020AC003, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_APPARENTPOWER": {"tagvalue": 0x020AC004, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_REACTIVEPOWER": {"tagvalue": 0x020AC005, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_ENERGY_ALL": {"tagvalue": 0x020AC006, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_MAX_APPARENTPOWER": {"tagvalue": 0x020AC007, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_ENERGY_DAY": {"tagvalue": 0x020AC008, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_ENERGY_GRID_CONSUMPTION": {
+        "tagvalue": 0x020AC009,
+        "type": "UChar8",
+    },
+    "TAG_PVI_REQ_AC_FREQUENCY": {"tagvalue": 0x020AC00A, "type": "UChar8"},
+    "TAG_PVI_REQ_INVERTER_COUNT": {"tagvalue": 0x020CCCC9, "type": "None"},
+    "TAG_PVI_REQ_DC_MAX_STRING_COUNT": {"tagvalue": 0x020DC000, "type": "None"},
+    "TAG_PVI_REQ_DC_POWER": {"tagvalue": 0x020DC001, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_VOLTAGE": {"tagvalue": 0x020DC002, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_CURRENT": {"tagvalue": 0x020DC003, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_MAX_POWER": {"tagvalue": 0x020DC004, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_MAX_VOLTAGE": {"tagvalue": 0x020DC005, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_MIN_VOLTAGE": {"tagvalue": 0x020DC006, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_MAX_CURRENT": {"tagvalue": 0x020DC007, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_MIN_CURRENT": {"tagvalue": 0x020DC008, "type": "UChar8"},
+    "TAG_PVI_REQ_DC_STRING_ENERGY_ALL": {"tagvalue": 0x020DC009, "type": "UChar8"},
+    "TAG_PVI_REQ_AC_ENERGY_PRODUCED_L1": {"tagvalue": 0x020DC00A, "type": "None"},
+    "TAG_PVI_REQ_AC_ENERGY_PRODUCED_L2": {"tagvalue": 0x020DC00B, "type": "None"},
+    "TAG_PVI_REQ_AC_ENERGY_PRODUCED_L3": {"tagvalue": 0x020DC00C, "type": "None"},
+    "TAG_PVI_REQ_AC_ENERGY_CONSUMED_L1": {"tagvalue": 0x020DC00D, "type": "None"},
+    "TAG_PVI_REQ_AC_ENERGY_CONSUMED_L2": {"tagvalue": 0x020DC00E, "type": "None"},
+    "TAG_PVI_REQ_AC_ENERGY_CONSUMED_L3": {"tagvalue": 0x020DC00F, "type": "None"},
+    "TAG_PVI_REQ_ENABLE_FAN_TEST": {"tagvalue": 0x020DC010, "type": "None"},
+    "TAG_PVI_REQ_DISABLE_FAN_TEST": {"tagvalue": 0x020DC011, "type": "None"},
+    "TAG_PVI_REQ_RESET_LAND_NORM": {"tagvalue": 0x020DC012, "type": "None"},
+    "TAG_PVI_REQ_IS_FAN_INSTALLED": {"tagvalue": 0x020DC013, "type": "None"},
+    "TAG_PVI_GET_POSSIBLE_ELETRICAL_SYSTEM_TYPES": {
+        "tagvalue": 0x02800000,
+        "type": "UChar8",
+    },
+    "TAG_PVI_ON_GRID": {"tagvalue": 0x02800001, "type": "Bool"},
+    "TAG_PVI_STATE": {"tagvalue": 0x02800002, "type": "CString"},
+    "TAG_PVI_LAST_ERROR": {"tagvalue": 0x02800003, "type": "CString"},
+    "TAG_PVI_IS_FLASHING": {"tagvalue": 0x02800004, "type": "Bool"},
+    "TAG_PVI_FLASH_FILE_LIST": {"tagvalue": 0x02800006, "type": "Container"},
+    "TAG_PVI_FLASH_FILE": {"tagvalue": 0x02800007, "type": "CString"},
+    "TAG_PVI_SERVICE_PROGRESS_STATE": {"tagvalue": 0x02800008, "type": "Float32"},
+    "TAG_PVI_TYPE": {"tagvalue": 0x02800009, "type": "UChar8"},
+    "TAG_PVI_GET_GAPP_LAST_CHANGE_TIME": {"tagvalue": 0x0280000A, "type": "Int64"},
+    "TAG_PVI_GET_GAPP_SYNC_TIME": {"tagvalue": 0x0280000B, "type": "Int64"},
+    "TAG_PVI_SET_GAPP_SYNC_TIME": {"tagvalue": 0x0280000C, "type": "None"},
+    "TAG_PVI_SET_TYPE_OF_ELECTRICAL_SYSTEM": {"tagvalue": 0x0280000D, "type": "Char8"},
+    "TAG_PVI_GET_TYPE_OF_ELECTRICAL_SYSTEM": {"tagvalue": 0x0280000E, "type": "Char8"},
+    "TAG_PVI_LAND_CODE": {"tagvalue": 0x02800010, "type": "CString"},
+    "TAG_PVI_LAND_CODE_LIST": {"tagvalue": 0x02800011, "type": "Container"},
+    "TAG_PVI_ERROR_STRING": {"tagvalue": 0x02800013, "type": "CString"},
+    "TAG_PVI_STATUS_STRING": {"tagvalue": 0x02800015, "type": "CString"},
+    "TAG_PVI_DEVICE_SILENCE": {"tagvalue": 0x02800018, "type": "Bool"},
+    "TAG_PVI_SELF_TEST": {"tagvalue": 0x02800019, "type": "UChar8"},
+    "TAG_PVI_SET_FREE_INVERTER": {"tagvalue": 0x02800020, "type": "Bool"},
+    "TAG_PVI_SET_BLOCK_INVERTER": {"tagvalue": 0x02800021, "type": "Bool"},
+    "TAG_PVI_UZK_VOLTAGE": {"tagvalue": 0x02800050, "type": "Float32"},
+    "TAG_PVI_COS_PHI": {"tagvalue": 0x02800060, "type": "Container"},
+    "TAG_PVI_VOLTAGE_MONITORING": {"tagvalue": 0x02800070, "type": "Container"},
+    "TAG_PVI_FREQUENCY_UNDER_OVER": {"tagvalue": 0x02800080, "type": "Container"},
+    "TAG_PVI_SET_FREQUENCY_UNDER_OVER": {"tagvalue": 0x02800081, "type": "Bool"},
+    "TAG_PVI_SET_SYSTEM_MODE": {"tagvalue": 0x02800084, "type": "UChar8"},
+    "TAG_PVI_SYSTEM_MODE": {"tagvalue": 0x02800085, "type": "UChar8"},
+    "TAG_PVI_SET_POWER_MODE": {"tagvalue": 0x02800086, "type": "UChar8"},
+    "TAG_PVI_POWER_MODE": {"tagvalue": 0x02800087, "type": "UChar8"},
+    "TAG_PVI_USED_STRING_COUNT": {"tagvalue": 0x02800090, "type": "UChar8"},
+    "TAG_PVI_DERATE_TO_POWER": {"tagvalue": 0x02800092, "type": "UChar8"},
+    "TAG_PVI_TEMPERATURE": {"tagvalue": 0x02800100, "type": "Container"},
+    "TAG_PVI_TEMPERATURE_COUNT": {"tagvalue": 0x02800101, "type": "None"},
+    "TAG_PVI_MAX_TEMPERATURE": {"tagvalue": 0x02800102, "type": "Float32"},
+    "TAG_PVI_MIN_TEMPERATURE": {"tagvalue": 0x02800103, "type": "Float32"},
+    "TAG_PVI_CT_TAR_USV_BOX": {"tagvalue": 0x02800104, "type": "UChar8"},
+    "TAG_PVI_ROTARY_FIELD_DIRECTION": {"tagvalue": 0x02800105, "type": "Int16"},
+    "TAG_PVI_DATA": {"tagvalue": 0x02840000, "type": "Container"},
+    "TAG_PVI_DEVICE_STATE": {"tagvalue": 0x02860000, "type": "Container"},
+    "TAG_PVI_DEVICE_CONNECTED": {"tagvalue": 0x02860001, "type": "Bool"},
+    "TAG_PVI_DEVICE_WORKING": {"tagvalue": 0x02860002, "type": "Bool"},
+    "TAG_PVI_DEVICE_IN_SERVICE": {"tagvalue": 0x02860003, "type": "Bool"},
+    "TAG_PVI_SERIAL_NUMBER": {"tagvalue": 0x028ABC01, "type": "CString"},
+    "TAG_PVI_VERSION": {"tagvalue": 0x028ABC02, "type": "Container"},
+    "TAG_PVI_GAPP_JSON": {"tagvalue": 0x028ABC13, "type": "CString"},
+    "TAG_PVI_GAPP_JSON_MD5": {"tagvalue": 0x028ABC14, "type": "CString"},
+    "TAG_PVI_AC_MAX_PHASE_COUNT": {"tagvalue": 0x028AC000, "type": "UChar8"},
+    "TAG_PVI_AC_POWER": {"tagvalue": 0x028AC001, "type": "Container"},
+    "TAG_PVI_AC_VOLTAGE": {"tagvalue": 0x028AC002, "type": "Container"},
+    "TAG_PVI_AC_CURRENT": {"tagvalue": 0x028AC003, "type": "Container"},
+    "TAG_PVI_AC_APPARENTPOWER": {"tagvalue": 0x028AC004, "type": "Container"},
+    "TAG_PVI_AC_REACTIVEPOWER": {"tagvalue": 0x028AC005, "type": "Container"},
+    "TAG_PVI_AC_ENERGY_ALL": {"tagvalue": 0x028AC006, "type": "Container"},
+    "TAG_PVI_AC_MAX_APPARENTPOWER": {"tagvalue": 0x028AC007, "type": "Container"},
+    "TAG_PVI_AC_ENERGY_DAY": {"tagvalue": 0x028AC008, "type": "Container"},
+    "TAG_PVI_AC_ENERGY_GRID_CONSUMPTION": {"tagvalue": 0x028AC009, "type": "Container"},
+    "TAG_PVI_AC_FREQUENCY": {"tagvalue": 0x028AC00A, "type": "Container"},
+    "TAG_PVI_INVERTER_COUNT": {"tagvalue": 0x028CCCC9, "type": "UInt16"},
+    "TAG_PVI_DC_MAX_STRING_COUNT": {"tagvalue": 0x028DC000, "type": "UChar8"},
+    "TAG_PVI_DC_POWER": {"tagvalue": 0x028DC001, "type": "Container"},
+    "TAG_PVI_DC_VOLTAGE": {"tagvalue": 0x028DC002, "type": "Container"},
+    "TAG_PVI_DC_CURRENT": {"tagvalue": 0x028DC003, "type": "Container"},
+    "TAG_PVI_DC_MAX_POWER": {"tagvalue": 0x028DC004, "type": "Container"},
+    "TAG_PVI_DC_MAX_VOLTAGE": {"tagvalue": 0x028DC005, "type": "Container"},
+    "TAG_PVI_DC_MIN_VOLTAGE": {"tagvalue": 0x028DC006, "type": "Container"},
+    "TAG_PVI_DC_MAX_CURRENT": {"tagvalue": 0x028DC007, "type": "Container"},
+    "TAG_PVI_DC_MIN_CURRENT": {"tagvalue": 0x028DC008, "type": "Container"},
+    "TAG_PVI_DC_STRING_ENERGY_ALL": {"tagvalue": 0x028DC009, "type": "Container"},
+    "TAG_PVI_AC_ENERGY_PRODUCED_L1": {"tagvalue": 0x028DC00A, "type": "Double64"},
+    "TAG_PVI_AC_ENERGY_PRODUCED_L2": {"tagvalue": 0x028DC00B, "type": "Double64"},
+    "TAG_PVI_AC_ENERGY_PRODUCED_L3": {"tagvalue": 0x028DC00C, "type": "Double64"},
+    "TAG_PVI_AC_ENERGY_CONSUMED_L1": {"tagvalue": 0x028DC00D, "type": "Double64"},
+    "TAG_PVI_AC_ENERGY_CONSUMED_L2": {"tagvalue": 0x028DC00E, "type": "Double64"},
+    "TAG_PVI_AC_ENERGY_CONSUMED_L3": {"tagvalue": 0x028DC00F, "type": "Double64"},
+    "TAG_PVI_RESET_LAND_NORM": {"tagvalue": 0x028DC012, "type": "Bool"},
+    "TAG_PVI_IS_FAN_INSTALLED": {"tagvalue": 0x028DC013, "type": "Bool"},
+    "TAG_PVI_GENERAL_ERROR": {"tagvalue": 0x02FFFFFF, "type": "Error"},
+}
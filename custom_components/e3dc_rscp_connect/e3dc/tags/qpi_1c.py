@@ -0,0 +1,220 @@
+"RSCP tags of the QPI namespace, tag codes 0x1Cxxxxxx."
+
+TAGS = {
+    "TAG_QPI_REQ_INVERTER_COUNT": {"tagvalue": 0x1C000001, "type": "Int32"},
+    "TAG_QPI_REQ_INVERTER_DATA": {"tagvalue": 0x1C000002, "type": "Int32"},
+    "TAG_QPI_REQ_UPDATE_FIRMWARE": {"tagvalue": 0x1C000003, "type": "Container"},
+    "TAG_QPI_REQ_UPDATE_STATUS": {"tagvalue": 0x1C000004, "type": "None"},
+    "TAG_QPI_REQ_INVERTER_SET_VALUES": {"tagvalue": 0x1C000005, "type": "Container"},
+    "TAG_QPI_REQ_RESET_STATE_1_COUNTER": {"tagvalue": 0x1C000006, "type": "Int32"},
+    "TAG_QPI_REQ_STATE_1_COUNTER": {"tagvalue": 0x1C000007, "type": "Int32"},
+    "TAG_QPI_REQ_INVERTER_SET_POWER": {"tagvalue": 0x1C000008, "type": "Container"},
+    "TAG_QPI_REQ_SET_BAT_INFO": {"tagvalue": 0x1C000009, "type": "Container"},
+    "TAG_QPI_REQ_GET_PARAM": {"tagvalue": 0x1C00000A, "type": "Container"},
+    "TAG_QPI_REQ_SET_PARAM": {"tagvalue": 0x1C00000B, "type": "Container"},
+    "TAG_QPI_REQ_ERR_LIST": {"tagvalue": 0x1C00000C, "type": "Container"},
+    "TAG_QPI_REQ_ERR_LIST_4105": {"tagvalue": 0x1C00000D, "type": "Container"},
+    "TAG_QPI_REQ_CLEAR_ERR_HIST": {"tagvalue": 0x1C00000E, "type": "None"},
+    "TAG_QPI_REQ_STATE_0": {"tagvalue": 0x1C00000F, "type": "Int32"},
+    "TAG_QPI_REQ_DEBUG_DATA": {"tagvalue": 0x1C000010, "type": "Container"},
+    "TAG_QPI_REQ_INVERTER_COUNT_DETAIL": {"tagvalue": 0x1C000011, "type": "None"},
+    "TAG_QPI_REQ_SELECTED_INVERTER_DATA": {"tagvalue": 0x1C000012, "type": "Container"},
+    "TAG_QPI_REQ_ERR_HIST": {"tagvalue": 0x1C000013, "type": "Container"},
+    "TAG_QPI_REQ_HW_INFO": {"tagvalue": 0x1C000014, "type": "Container"},
+    "TAG_QPI_REQ_VERSION_RESET": {"tagvalue": 0x1C000015, "type": "None"},
+    "TAG_QPI_REQ_SET_DESIRED_CURRENT_FOR_EP": {
+        "tagvalue": 0x1C000016,
+        "type": "Container",
+    },
+    "TAG_QPI_REQ_GET_DESIRED_CURRENT_FOR_EP": {
+        "tagvalue": 0x1C000017,
+        "type": "Container",
+    },
+    "TAG_QPI_REQ_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C000030, "type": "None"},
+    "TAG_QPI_REQ_SET_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C00003A, "type": "Bool"},
+    "TAG_QPI_REQ_SETTINGS_VDE_2510_ENABLED": {"tagvalue": 0x1C00003B, "type": "None"},
+    "TAG_QPI_REQ_SET_SETTINGS_VDE_2510_ENABLED": {
+        "tagvalue": 0x1C00003C,
+        "type": "Bool",
+    },
+    "TAG_QPI_PARAM_INDEX": {"tagvalue": 0x1C040000, "type": "Int32"},
+    "TAG_QPI_PARAM_U_Bat": {"tagvalue": 0x1C040001, "type": "Float32"},
+    "TAG_QPI_PARAM_I_Bat": {"tagvalue": 0x1C040002, "type": "Float32"},
+    "TAG_QPI_PARAM_U_AC": {"tagvalue": 0x1C040003, "type": "Float32"},
+    "TAG_QPI_PARAM_I_AC": {"tagvalue": 0x1C040004, "type": "Float32"},
+    "TAG_QPI_PARAM_PHI": {"tagvalue": 0x1C040005, "type": "Float32"},
+    "TAG_QPI_PARAM_POWER": {"tagvalue": 0x1C040006, "type": "Float32"},
+    "TAG_QPI_PARAM_APP_POWER": {"tagvalue": 0x1C040007, "type": "Float32"},
+    "TAG_QPI_PARAM_REA_POWER": {"tagvalue": 0x1C040008, "type": "Float32"},
+    "TAG_QPI_PARAM_FILE_NAME": {"tagvalue": 0x1C040009, "type": "CString"},
+    "TAG_QPI_PARAM_PROGRESS": {"tagvalue": 0x1C040010, "type": "Float32"},
+    "TAG_QPI_PARAM_CHILD": {"tagvalue": 0x1C040011, "type": "Int32"},
+    "TAG_QPI_PARAM_POWER_L1": {"tagvalue": 0x1C040012, "type": "Float32"},
+    "TAG_QPI_PARAM_POWER_L2": {"tagvalue": 0x1C040013, "type": "Float32"},
+    "TAG_QPI_PARAM_POWER_L3": {"tagvalue": 0x1C040014, "type": "Float32"},
+    "TAG_QPI_PARAM_TIME": {"tagvalue": 0x1C040015, "type": "Uint64"},
+    "TAG_QPI_PARAM_STATE_1_COUNT": {"tagvalue": 0x1C040016, "type": "Uint64"},
+    "TAG_QPI_PARAM_CMD": {"tagvalue": 0x1C040017, "type": "Uint64"},
+    "TAG_QPI_PARAM_STATE_1_PS": {"tagvalue": 0x1C400018, "type": "Float32"},
+    "TAG_QPI_PARAM_U_MAX": {"tagvalue": 0x1C400019, "type": "Float32"},
+    "TAG_QPI_PARAM_U_MIN": {"tagvalue": 0x1C400020, "type": "Float32"},
+    "TAG_QPI_PARAM_I_MAX": {"tagvalue": 0x1C400021, "type": "Float32"},
+    "TAG_QPI_PARAM_I_MIN": {"tagvalue": 0x1C400022, "type": "Float32"},
+    "TAG_QPI_PARAM_BLOCK": {"tagvalue": 0x1C400023, "type": "UInt16"},
+    "TAG_QPI_PARAM_ITEM": {"tagvalue": 0x1C400024, "type": "UInt16"},
+    "TAG_QPI_PARAM_VALUE": {"tagvalue": 0x1C400025, "type": "Int16"},
+    "TAG_QPI_PARAM_ERR": {"tagvalue": 0x1C400030, "type": "Container"},
+    "TAG_QPI_PARAM_ERR_STR": {"tagvalue": 0x1C400031, "type": "CString"},
+    "TAG_QPI_PARAM_ERR_DATE": {"tagvalue": 0x1C400032, "type": "CString"},
+    "TAG_QPI_PARAM_ERR_CODE": {"tagvalue": 0x1C400033, "type": "CString"},
+    "TAG_QPI_PARAM_ERR_F_MIN": {"tagvalue": 0x1C400034, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_F_MAX": {"tagvalue": 0x1C400035, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_MIN": {"tagvalue": 0x1C400036, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_MAX": {"tagvalue": 0x1C400037, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_L1_PHI": {"tagvalue": 0x1C400038, "type": "Int16"},
+    "TAG_QPI_PARAM_ERR_U_L1_RMS": {"tagvalue": 0x1C400039, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_L2_PHI": {"tagvalue": 0x1C400040, "type": "Int16"},
+    "TAG_QPI_PARAM_ERR_U_L2_RMS": {"tagvalue": 0x1C400041, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_L3_PHI": {"tagvalue": 0x1C400042, "type": "Int16"},
+    "TAG_QPI_PARAM_ERR_U_L3_RMS": {"tagvalue": 0x1C400043, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_INV_PHI": {"tagvalue": 0x1C400044, "type": "Int16"},
+    "TAG_QPI_PARAM_ERR_U_INV_RMS": {"tagvalue": 0x1C400045, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_I_DCL_RMS": {"tagvalue": 0x1C400046, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_DCL": {"tagvalue": 0x1C400047, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_I_LOAD_PHI": {"tagvalue": 0x1C400048, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_I_LOAD_RMS": {"tagvalue": 0x1C400049, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_REGULATOR_OUT": {"tagvalue": 0x1C400050, "type": "Uint32"},
+    "TAG_QPI_PARAM_ERR_STATE_MASHINE_E_STATE": {
+        "tagvalue": 0x1C400051,
+        "type": "UChar8",
+    },
+    "TAG_QPI_PARAM_ERR_STATE_ACT_REG": {"tagvalue": 0x1C400052, "type": "UInt16"},
+    "TAG_QPI_PARAM_ERR_TMP_0": {"tagvalue": 0x1C400053, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_TMP_1": {"tagvalue": 0x1C400054, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_TMP_2": {"tagvalue": 0x1C400055, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_TMP_3": {"tagvalue": 0x1C400056, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_CO_PRO": {"tagvalue": 0x1C400057, "type": "UInt16"},
+    "TAG_QPI_PARAM_ERR_TREATMENT": {"tagvalue": 0x1C400058, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_I_LOAD_T0": {"tagvalue": 0x1C400059, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_U_INV_TO": {"tagvalue": 0x1C400060, "type": "Float32"},
+    "TAG_QPI_PARAM_U_AC_L1": {"tagvalue": 0x1C400061, "type": "Float32"},
+    "TAG_QPI_PARAM_U_AC_L2": {"tagvalue": 0x1C400062, "type": "Float32"},
+    "TAG_QPI_PARAM_U_AC_L3": {"tagvalue": 0x1C400063, "type": "Float32"},
+    "TAG_QPI_PARAM_I_AC_L1": {"tagvalue": 0x1C400064, "type": "Float32"},
+    "TAG_QPI_PARAM_I_AC_L2": {"tagvalue": 0x1C400065, "type": "Float32"},
+    "TAG_QPI_PARAM_I_AC_L3": {"tagvalue": 0x1C400066, "type": "Float32"},
+    "TAG_QPI_PARAM_APP_POWER_L1": {"tagvalue": 0x1C400067, "type": "Float32"},
+    "TAG_QPI_PARAM_APP_POWER_L2": {"tagvalue": 0x1C400068, "type": "Float32"},
+    "TAG_QPI_PARAM_APP_POWER_L3": {"tagvalue": 0x1C400069, "type": "Float32"},
+    "TAG_QPI_PARAM_REA_POWER_L1": {"tagvalue": 0x1C400070, "type": "Float32"},
+    "TAG_QPI_PARAM_REA_POWER_L2": {"tagvalue": 0x1C400071, "type": "Float32"},
+    "TAG_QPI_PARAM_REA_POWER_L3": {"tagvalue": 0x1C400072, "type": "Float32"},
+    "TAG_QPI_PARAM_STATE_0_STATE": {"tagvalue": 0x1C400073, "type": "UChar8"},
+    "TAG_QPI_PARAM_STATE_0_ERR_COUNT_ALL": {"tagvalue": 0x1C400074, "type": "UChar8"},
+    "TAG_QPI_PARAM_STATE_0_ERR_COUNT_ACTIVE": {
+        "tagvalue": 0x1C400075,
+        "type": "UChar8",
+    },
+    "TAG_QPI_PARAM_STATE_0_OP_STATE": {"tagvalue": 0x1C400076, "type": "Uint32"},
+    "TAG_QPI_PARAM_CONF_STATE": {"tagvalue": 0x1C400079, "type": "UChar8"},
+    "TAG_QPI_PARAM_ACTIVATED": {"tagvalue": 0x1C400080, "type": "Bool"},
+    "TAG_QPI_PARAM_INVERTER_GROUP": {"tagvalue": 0x1C400081, "type": "Char8"},
+    "TAG_QPI_PARAM_COUNT_DETAIL": {"tagvalue": 0x1C400082, "type": "Container"},
+    "TAG_QPI_PARAM_DEBUG_SM": {"tagvalue": 0x1C400083, "type": "UChar8"},
+    "TAG_QPI_PARAM_DEBUG_ACTUAL_REG": {"tagvalue": 0x1C400084, "type": "Uint32"},
+    "TAG_QPI_PARAM_DEBUG_U_DCL": {"tagvalue": 0x1C400085, "type": "UInt16"},
+    "TAG_QPI_PARAM_DEBUG_I_DCL_RMS": {"tagvalue": 0x1C400086, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_I_LOAD_RMS": {"tagvalue": 0x1C400087, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_I_LOAD_T0": {"tagvalue": 0x1C400088, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_INV_RMS": {"tagvalue": 0x1C400089, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_INV_T0": {"tagvalue": 0x1C400090, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L1_RMS": {"tagvalue": 0x1C400091, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L2_RMS": {"tagvalue": 0x1C400092, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L3_RMS": {"tagvalue": 0x1C400093, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L1_T0": {"tagvalue": 0x1C400094, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L2_T0": {"tagvalue": 0x1C400095, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L3_T0": {"tagvalue": 0x1C400096, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_TMP_0": {"tagvalue": 0x1C400097, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_TMP_1": {"tagvalue": 0x1C400098, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_TMP_2": {"tagvalue": 0x1C400099, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_TMP_3": {"tagvalue": 0x1C400100, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_F_LINE": {"tagvalue": 0x1C400101, "type": "UInt16"},
+    "TAG_QPI_PARAM_DEBUG_I_DCL_AVG": {"tagvalue": 0x1C400102, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L1_PHI": {"tagvalue": 0x1C400103, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L2_PHI": {"tagvalue": 0x1C400104, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L3_PHI": {"tagvalue": 0x1C400105, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_INV_PHI": {"tagvalue": 0x1C400106, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_I_LOAD_PHI": {"tagvalue": 0x1C400107, "type": "Int16"},
+    "TAG_QPI_PARAM_NUMBER_CHILDS": {"tagvalue": 0x1C400108, "type": "Int16"},
+    "TAG_QPI_PARAM_INVERTER_STORED_SI_GROUP": {"tagvalue": 0x1C400109, "type": "Char8"},
+    "TAG_QPI_PARAM_DEBUG_U_L1_RMS_COPRO": {"tagvalue": 0x1C40010A, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L2_RMS_COPRO": {"tagvalue": 0x1C40010B, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_U_L3_RMS_COPRO": {"tagvalue": 0x1C40010C, "type": "Int16"},
+    "TAG_QPI_PARAM_DEBUG_F_LINE_COPRO": {"tagvalue": 0x1C40010D, "type": "UInt16"},
+    "TAG_QPI_PARAM_SW_VERSION_DATE": {"tagvalue": 0x1C40010E, "type": "CString"},
+    "TAG_QPI_PARAM_SW_VERSION": {"tagvalue": 0x1C40010F, "type": "CString"},
+    "TAG_QPI_PARAM_INVERTER_EP_LINE": {"tagvalue": 0x1C400110, "type": "Char8"},
+    "TAG_QPI_PARAM_COPRO_SW_VERSION_DATE": {"tagvalue": 0x1C400111, "type": "CString"},
+    "TAG_QPI_PARAM_COPRO_SW_VERSION": {"tagvalue": 0x1C400112, "type": "CString"},
+    "TAG_QPI_PARAM_COPRO_SW_SVN": {"tagvalue": 0x1C400113, "type": "CString"},
+    "TAG_QPI_PARAM_HW_VERSION_MAIN": {"tagvalue": 0x1C400114, "type": "CString"},
+    "TAG_QPI_PARAM_HW_VERSION_COPRO": {"tagvalue": 0x1C400115, "type": "CString"},
+    "TAG_QPI_PARAM_HW_VERSION_PCB_CODE": {"tagvalue": 0x1C400116, "type": "CString"},
+    "TAG_QPI_PARAM_BOARD_SERIAL": {"tagvalue": 0x1C400117, "type": "CString"},
+    "TAG_QPI_PARAM_MODULE_SERIAL": {"tagvalue": 0x1C400118, "type": "CString"},
+    "TAG_QPI_PARAM_ERR_F_LINE": {"tagvalue": 0x1C400119, "type": "UInt16"},
+    "TAG_QPI_PARAM_ERR_OPT_STATE": {"tagvalue": 0x1C40011A, "type": "Char8"},
+    "TAG_QPI_PARAM_RT_RESULT": {"tagvalue": 0x1C40011B, "type": "UChar8"},
+    "TAG_QPI_PARAM_DOOR_SW_OPEN": {"tagvalue": 0x1C40011C, "type": "Char8"},
+    "TAG_QPI_PARAM_FAN_REQESTED": {"tagvalue": 0x1C40011D, "type": "Char8"},
+    "TAG_QPI_PARAM_DEBUG_COPRO_STATE": {"tagvalue": 0x1C40011E, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_I_DCL_T0": {"tagvalue": 0x1C40011F, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_COPRO_U_L1_RMS": {"tagvalue": 0x1C400120, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_COPRO_U_L2_RMS": {"tagvalue": 0x1C400121, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_COPRO_U_L3_RMS": {"tagvalue": 0x1C400122, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_COPRO_U_INV_RMS": {"tagvalue": 0x1C400123, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_COPRO_REL_STATE": {"tagvalue": 0x1C400124, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_COPRO_MODE": {"tagvalue": 0x1C400125, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_COPRO_F_LINE": {"tagvalue": 0x1C400126, "type": "Int16"},
+    "TAG_QPI_PARAM_ERR_COPRO_PEN_TV_STATE": {"tagvalue": 0x1C400127, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_COPRO_ERR_DATA": {"tagvalue": 0x1C400128, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_COPRO_TRIPP_LN_OUT": {"tagvalue": 0x1C400129, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_COPRO_TRIPP_LN_IN": {"tagvalue": 0x1C40012A, "type": "UChar8"},
+    "TAG_QPI_PARAM_ERR_COPRO_U_PEN_AVG": {"tagvalue": 0x1C40012B, "type": "Float32"},
+    "TAG_QPI_PARAM_ERR_I_PRIM": {"tagvalue": 0x1C40012C, "type": "Float32"},
+    "TAG_QPI_PARAM_SW_COUNTRY": {"tagvalue": 0x1C40012D, "type": "UChar8"},
+    "TAG_QPI_PARAM_SELECTEC_COUNTRY": {"tagvalue": 0x1C40012E, "type": "UChar8"},
+    "TAG_QPI_PARAM_COPRO_SW_COUNTRY": {"tagvalue": 0x1C40012F, "type": "UChar8"},
+    "TAG_QPI_PARAM_COPRO_SELECTEC_COUNTRY": {"tagvalue": 0x1C400130, "type": "UChar8"},
+    "TAG_QPI_PARAM_MAX_AC_APPARENT_POWER": {"tagvalue": 0x1C400131, "type": "Float32"},
+    "TAG_QPI_PARAM_DEBUG_U_INV_RMS_COPRO": {"tagvalue": 0x1C400132, "type": "UInt16"},
+    "TAG_QPI_PARAM_DEBUG_I_PRIM_RMS": {"tagvalue": 0x1C400133, "type": "Int16"},
+    "TAG_QPI_PARAM_SW_SVN": {"tagvalue": 0x1C400134, "type": "CString"},
+    "TAG_QPI_INVERTER_COUNT": {"tagvalue": 0x1C800001, "type": "Int32"},
+    "TAG_QPI_INVERTER_DATA": {"tagvalue": 0x1C800002, "type": "Container"},
+    "TAG_QPI_UPDATE_FIRMWARE": {"tagvalue": 0x1C800003, "type": "Container"},
+    "TAG_QPI_UPDATE_STATUS": {"tagvalue": 0x1C800004, "type": "Container"},
+    "TAG_QPI_INVERTER_SET_VALUES": {"tagvalue": 0x1C800005, "type": "Container"},
+    "TAG_QPI_RESET_STATE_1_COUNTER": {"tagvalue": 0x1C800006, "type": "Int32"},
+    "TAG_QPI_STATE_1_COUNTER": {"tagvalue": 0x1C800007, "type": "Container"},
+    "TAG_QPI_INVERTER_SET_POWER": {"tagvalue": 0x1C800008, "type": "Container"},
+    "TAG_QPI_SET_BAT_INFO": {"tagvalue": 0x1C800009, "type": "Container"},
+    "TAG_QPI_GET_PARAM": {"tagvalue": 0x1C80000A, "type": "Container"},
+    "TAG_QPI_SET_PARAM": {"tagvalue": 0x1C80000B, "type": "Container"},
+    "TAG_QPI_ERR_LIST": {"tagvalue": 0x1C80000C, "type": "Container"},
+    "TAG_QPI_ERR_LIST_4105": {"tagvalue": 0x1C80000D, "type": "Container"},
+    "TAG_QPI_CLEAR_ERR_HIST": {"tagvalue": 0x1C80000E, "type": "None"},
+    "TAG_QPI_STATE_0": {"tagvalue": 0x1C80000F, "type": "Container"},
+    "TAG_QPI_DEBUG_DATA": {"tagvalue": 0x1C800010, "type": "Container"},
+    "TAG_QPI_INVERTER_COUNT_DETAIL": {"tagvalue": 0x1C800011, "type": "Container"},
+    "TAG_QPI_SELECTED_INVERTER_DATA": {"tagvalue": 0x1C800012, "type": "Container"},
+    "TAG_QPI_ERR_HIST": {"tagvalue": 0x1C800013, "type": "Container"},
+    "TAG_QPI_HW_INFO": {"tagvalue": 0x1C800014, "type": "Container"},
+    "TAG_QPI_VERSION_RESET": {"tagvalue": 0x1C800015, "type": "None"},
+    "TAG_QPI_SET_DESIRED_CURRENT_FOR_EP": {"tagvalue": 0x1C800016, "type": "Container"},
+    "TAG_QPI_GET_DESIRED_CURRENT_FOR_EP": {"tagvalue": 0x1C800017, "type": "Container"},
+    "TAG_QPI_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C800030, "type": "Bool"},
+    "TAG_QPI_SET_SETTINGS_EP_ENABLED": {"tagvalue": 0x1C80003A, "type": "Bool"},
+    "TAG_QPI_SETTINGS_VDE_2510_ENABLED": {"tagvalue": 0x1C80003B, "type": "Bool"},
+    "TAG_QPI_SET_SETTINGS_VDE_2510_ENABLED": {"tagvalue": 0x1C80003C, "type": "Bool"},
+}
@@ -0,0 +1,28 @@
+"RSCP tags of the RD namespace, tag codes 0x31xxxxxx."
+
+TAGS = {
+    "TAG_RD_REQ_DATA": {"tagvalue": 0x31000001, "type": "Container"},
+    "TAG_RD_REQ_DEVICE_NAME": {"tagvalue": 0x31000002, "type": "None"},
+    "TAG_RD_REQ_GENERAL_ERROR": {"tagvalue": 0x31000003, "type": "None"},
+    "TAG_RD_REQ_COMM_STATE": {"tagvalue": 0x31000004, "type": "None"},
+    "TAG_RD_REQ_DEVICE_ID": {"tagvalue": 0x31000005, "type": "None"},
+    "TAG_RD_REQ_FIRMWARE_VERSION": {"tagvalue": 0x31000006, "type": "None"},
+    "TAG_RD_REQ_DEVICE_WORKING": {"tagvalue": 0x31000007, "type": "None"},
+    "TAG_RD_REQ_DEVICE_IN_SERVICE": {"tagvalue": 0x31000008, "type": "None"},
+    "TAG_RD_REQ_DEVICE_CONNECTED": {"tagvalue": 0x31000009, "type": "None"},
+    "TAG_RD_REQ_DEVICE_STATE": {"tagvalue": 0x3100000A, "type": "None"},
+    "TAG_RD_REQ_CONNECTED_DEVICES": {"tagvalue": 0x3100000B, "type": "None"},
+    "TAG_RD_CONNECTED_DEVICE": {"tagvalue": 0x31400000, "type": "Container"},
+    "TAG_RD_INDEX": {"tagvalue": 0x31400001, "type": "UInt16"},
+    "TAG_RD_DATA": {"tagvalue": 0x31800001, "type": "Container"},
+    "TAG_RD_DEVICE_NAME": {"tagvalue": 0x31800002, "type": "CString"},
+    "TAG_RD_GENERAL_ERROR": {"tagvalue": 0x31800003, "type": "UChar8"},
+    "TAG_RD_COMM_STATE": {"tagvalue": 0x31800004, "type": "Container"},
+    "TAG_RD_DEVICE_ID": {"tagvalue": 0x31800005, "type": "Uint32"},
+    "TAG_RD_FIRMWARE_VERSION": {"tagvalue": 0x31800006, "type": "UChar8"},
+    "TAG_RD_DEVICE_WORKING": {"tagvalue": 0x31800007, "type": "Bool"},
+    "TAG_RD_DEVICE_IN_SERVICE": {"tagvalue": 0x31800008, "type": "Bool"},
+    "TAG_RD_DEVICE_CONNECTED": {"tagvalue": 0x31800009, "type": "Bool"},
+    "TAG_RD_DEVICE_STATE": {"tagvalue": 0x3180000A, "type": "Container"},
+    "TAG_RD_CONNECTED_DEVICES": {"tagvalue": 0x3180000B, "type": "Container"},
+}
@@ -0,0 +1,23 @@
+"RSCP tags of the REFU namespace, tag codes 0x21xxxxxx."
+
+TAGS = {
+    "TAG_REFU_REQ_START_SCAN": {"tagvalue": 0x21000001, "type": "None"},
+    "TAG_REFU_REQ_IS_SCANNING": {"tagvalue": 0x21000002, "type": "None"},
+    "TAG_REFU_REQ_CREATE_INV": {"tagvalue": 0x21000003, "type": "CString"},
+    "TAG_REFU_REQ_CANCEL_SCAN": {"tagvalue": 0x21000004, "type": "None"},
+    "TAG_REFU_REQ_DELETE_INVERTER": {"tagvalue": 0x21000005, "type": "Uint32"},
+    "TAG_REFU_REQ_NO_INVERTERS": {"tagvalue": 0x21000006, "type": "None"},
+    "TAG_REFU_REQ_CONNECTED_DEVICES": {"tagvalue": 0x21000008, "type": "None"},
+    "TAG_REFU_PARAM_MAC": {"tagvalue": 0x21400001, "type": "CString"},
+    "TAG_REFU_PARAM_IP": {"tagvalue": 0x21400002, "type": "CString"},
+    "TAG_REFU_PARAM_ALIVE": {"tagvalue": 0x21400003, "type": "Bool"},
+    "TAG_REFU_PARAM_INDEX": {"tagvalue": 0x21400004, "type": "Uint32"},
+    "TAG_REFU_PARAM_DHCP": {"tagvalue": 0x21400005, "type": "Bool"},
+    "TAG_REFU_START_SCAN": {"tagvalue": 0x21800001, "type": "Bool"},
+    "TAG_REFU_IS_SCANNING": {"tagvalue": 0x21800002, "type": "Bool"},
+    "TAG_REFU_CREATE_INV": {"tagvalue": 0x21800003, "type": "Uint32"},
+    "TAG_REFU_CANCEL_CAN": {"tagvalue": 0x21800004, "type": "None"},
+    "TAG_REFU_DELETE_INVERTER": {"tagvalue": 0x21800005, "type": "Uint32"},
+    "TAG_REFU_NO_INVERTERS": {"tagvalue": 0x21800006, "type": "Uint32"},
+    "TAG_REFU_CONNECTED_DEVICES": {"tagvalue": 0x21800008, "type": "Container"},
+}
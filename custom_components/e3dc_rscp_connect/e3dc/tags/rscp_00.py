@@ -0,0 +1,43 @@
+"RSCP tags of the RSCP namespace, tag codes 0x00xxxxxx."
+
+TAGS = {
+    "TAG_RSCP_REQ_LIST_NON_PAIRED_DEVICE_TYPE_EVCS": {
+        "tagvalue": 0x00000000,
+        "type": "Container",
+    },
+    "TAG_RSCP_REQ_AUTHENTICATION": {"tagvalue": 0x00000001, "type": "Container"},
+    "TAG_RSCP_AUTHENTICATION_USER": {"tagvalue": 0x00000002, "type": "CString"},
+    "TAG_RSCP_AUTHENTICATION_PASSWORD": {"tagvalue": 0x00000003, "type": "CString"},
+    "TAG_RSCP_REQ_USER_LEVEL": {"tagvalue": 0x00000004, "type": "None"},
+    "TAG_RSCP_REQ_SET_ENCRYPTION_PASSPHRASE": {
+        "tagvalue": 0x00000005,
+        "type": "CString",
+    },
+    "TAG_RSCP_REQ_AUTH_CHALLENGE": {"tagvalue": 0x00000006, "type": "None"},
+    "TAG_RSCP_AUTH_CHALLENGE_INDEX": {"tagvalue": 0x00000007, "type": "UChar8"},
+    "TAG_RSCP_AUTH_CHALLENGE_DATA": {"tagvalue": 0x00000008, "type": "ByteArray"},
+    "TAG_RSCP_REQ_SET_PROTOCOL_VERSION": {"tagvalue": 0x00000009, "type": "UChar8"},
+    "TAG_RSCP_REQ_SUPPORTED_PROTOCOL_VERSIONS": {
+        "tagvalue": 0x0000000A,
+        "type": "None",
+    },
+    "TAG_RSCP_REQ_TEST": {"tagvalue": 0x0000000C, "type": "None"},
+    "TAG_RSCP_REQ_TRIGGER_FRAME_DUMP": {"tagvalue": 0x0000000D, "type": "Uint32"},
+    "TAG_RSCP_AUTHENTICATION_TYPE": {"tagvalue": 0x00000815, "type": "UChar8"},
+    "TAG_RSCP_CONFIG_PROCESSED_STATE": {"tagvalue": 0x00400001, "type": "Int16"},
+    "TAG_RSCP_AUTHENTICATION": {"tagvalue": 0x00800001, "type": "UChar8"},
+    "TAG_RSCP_USER_LEVEL": {"tagvalue": 0x00800004, "type": "UChar8"},
+    "TAG_RSCP_SET_ENCRYPTION_PASSPHRASE": {"tagvalue": 0x00800005, "type": "Bool"},
+    "TAG_RSCP_AUTH_CHALLENGE": {"tagvalue": 0x00800006, "type": "Container"},
+    "TAG_RSCP_SET_PROTOCOL_VERSION": {"tagvalue": 0x00800009, "type": "UChar8"},
+    "TAG_RSCP_SUPPORTED_PROTOCOL_VERSIONS": {"tagvalue": 0x0080000A, "type": "UInt16"},
+    "TAG_RSCP_SET_POWER_SETPOINT": {"tagvalue": 0x0080000B, "type": "Bool"},
+    "TAG_RSCP_TRIGGER_FRAME_DUMP": {"tagvalue": 0x0080000D, "type": "Bool"},
+    "TAG_RSCP_TAG_AVAHIB_RESPONSE_PLAY": {"tagvalue": 0x0080000E, "type": "Bool"},
+    "TAG_RSCP_TEST_1": {"tagvalue": 0x0080000F, "type": "Char8"},
+    "TAG_RSCP_EMOBILITY_GET_OVERLOAD_CHARGING_CURRENT_LIMIT_PER_PHASE": {
+        "tagvalue": 0x00810021,
+        "type": "None",
+    },
+    "TAG_RSCP_GENERAL_ERROR": {"tagvalue": 0x00FFFFFF, "type": "Error"},
+}
@@ -0,0 +1,50 @@
+"RSCP tags of the SCM namespace, tag codes 0x27xxxxxx."
+
+TAGS = {
+    "TAG_SCM_REQ_SET_CONFIG": {"tagvalue": 0x27000001, "type": "CString"},
+    "TAG_SCM_CONFIG_PROCESSED": {"tagvalue": 0x27000002, "type": "Container"},
+    "TAG_SCM_CONFIG_PROCESSED_STATE": {"tagvalue": 0x27000003, "type": "UInt16"},
+    "TAG_SCM_REQ_CONFIG_PROCESSED_STATE": {"tagvalue": 0x27000004, "type": "Container"},
+    "TAG_SCM_REQ_ACCEPTED_CONFIG_FILE_VERSION": {
+        "tagvalue": 0x27000005,
+        "type": "None",
+    },
+    "TAG_SCM_REQ_SET_FACTORY_RESET": {"tagvalue": 0x27000006, "type": "None"},
+    "TAG_SCM_LC_REQ_GET_TYPE_MEASURE": {"tagvalue": 0x27000007, "type": "Container"},
+    "TAG_SCM_LC_REQ_GET_POWER_MGT_CONFIG": {
+        "tagvalue": 0x27000008,
+        "type": "Container",
+    },
+    "TAG_SCM_LC_REQ_SET_TYPE_MEASURE": {"tagvalue": 0x27000009, "type": "Container"},
+    "TAG_SCM_LC_REQ_SET_POWER_MGT_CONFIG": {
+        "tagvalue": 0x2700000A,
+        "type": "Container",
+    },
+    "TAG_SCM_CONFIG_ID": {"tagvalue": 0x27400001, "type": "UInt16"},
+    "TAG_SCM_CONFIG_FILE_VALID": {"tagvalue": 0x27400002, "type": "Bool"},
+    "TAG_SCM_LC_PARAM_POWER_MGT_TYPE": {"tagvalue": 0x27400003, "type": "UInt16"},
+    "TAG_SCM_LC_PARAM_TOKEN": {"tagvalue": 0x27400004, "type": "CString"},
+    "TAG_SCM_LC_PARAM_MAIN_FUSE": {"tagvalue": 0x27400005, "type": "Uint32"},
+    "TAG_SCM_LC_PARAM_MAX_CURRENT": {"tagvalue": 0x27400006, "type": "Uint32"},
+    "TAG_SCM_LC_PARAM_PHASE_COUNT": {"tagvalue": 0x27400007, "type": "UInt16"},
+    "TAG_SCM_LC_PARAM_MEASURE_TYPE": {"tagvalue": 0x27400008, "type": "UInt16"},
+    "TAG_SCM_LC_PARAM_CT_RATIO": {"tagvalue": 0x27400009, "type": "CString"},
+    "TAG_SCM_LC_PARAM_METER_ADDRESS": {"tagvalue": 0x2740000A, "type": "UInt16"},
+    "TAG_SCM_LC_PARAM_STATUS": {"tagvalue": 0x2740000B, "type": "Uint64"},
+    "TAG_SCM_LC_PARAM_MAIN_FUSE_DERATED": {"tagvalue": 0x2740000C, "type": "Uint32"},
+    "TAG_SCM_PARAM_EXT_LOAD_SHEDDING_ACTIVE": {
+        "tagvalue": 0x2740000D,
+        "type": "UChar8",
+    },
+    "TAG_SCM_PARAM_LOAD_SHEDDING_INPUT_ADDRESS": {
+        "tagvalue": 0x2740000E,
+        "type": "UInt16",
+    },
+    "TAG_SCM_SET_CONFIG": {"tagvalue": 0x27800001, "type": "Container"},
+    "TAG_SCM_ACCEPTED_CONFIG_FILE_VERSION": {"tagvalue": 0x27800002, "type": "CString"},
+    "TAG_SCM_SET_FACTORY_RESET": {"tagvalue": 0x27800006, "type": "Bool"},
+    "TAG_SCM_LC_GET_TYPE_MEASURE": {"tagvalue": 0x27800007, "type": "Container"},
+    "TAG_SCM_LC_GET_POWER_MGT_CONFIG": {"tagvalue": 0x27800008, "type": "Container"},
+    "TAG_SCM_LC_SET_TYPE_MEASURE": {"tagvalue": 0x27800009, "type": "Container"},
+    "TAG_SCM_LC_SET_POWER_MGT_CONFIG": {"tagvalue": 0x2780000A, "type": "Container"},
+}
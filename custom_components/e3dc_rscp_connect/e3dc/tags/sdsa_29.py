@@ -0,0 +1,8 @@
+"RSCP tags of the SDSA namespace, tag codes 0x29xxxxxx."
+
+TAGS = {
+    "TAG_SDSA_REQ_STATUS_FILE": {"tagvalue": 0x29000001, "type": "None"},
+    "TAG_SDSA_REQ_GET_WALLBOX_LIST": {"tagvalue": 0x29000002, "type": "None"},
+    "TAG_SDSA_STATUS_FILE": {"tagvalue": 0x29800001, "type": "CString"},
+    "TAG_SDSA_GET_WALLBOX_LIST": {"tagvalue": 0x29800002, "type": "CString"},
+}
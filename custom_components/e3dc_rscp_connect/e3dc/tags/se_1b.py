@@ -0,0 +1,124 @@
+"RSCP tags of the SE namespace, tag codes 0x1Bxxxxxx."
+
+TAGS = {
+    "TAG_SE_REQ_SE_COUNT": {"tagvalue": 0x1B000001, "type": "None"},
+    "TAG_SE_REQ_SE_DATA": {"tagvalue": 0x1B000002, "type": "Container"},
+    "TAG_SE_REQ_SET_POWER": {"tagvalue": 0x1B000003, "type": "Container"},
+    "TAG_SE_REQ_SET_DERATING": {"tagvalue": 0x1B000004, "type": "Container"},
+    "TAG_SE_REQ_SET_COUPLE_MODE": {"tagvalue": 0x1B000005, "type": "Container"},
+    "TAG_SE_REQ_COUPLE_MODE": {"tagvalue": 0x1B000006, "type": "Container"},
+    "TAG_SE_REQ_SET_BRI": {"tagvalue": 0x1B000007, "type": "Container"},
+    "TAG_SE_REQ_GET_BRI": {"tagvalue": 0x1B000008, "type": "UInt16"},
+    "TAG_SE_REQ_EP_RESERVE": {"tagvalue": 0x1B000009, "type": "Int32"},
+    "TAG_SE_REQ_GET_PROTECTION_STRATEGY": {"tagvalue": 0x1B00000A, "type": "UChar8"},
+    "TAG_SE_REQ_SET_EP_RESERVE": {"tagvalue": 0x1B000010, "type": "Container"},
+    "TAG_SE_REQ_GET_ESTIMATED_POWER_LIMIT": {
+        "tagvalue": 0x1B000011,
+        "type": "Container",
+    },
+    "TAG_SE_REQ_DESIGN_LIMIT": {"tagvalue": 0x1B000012, "type": "Container"},
+    "TAG_SE_SET_RESTART_SWITCH_TO_EP": {"tagvalue": 0x1B000013, "type": "None"},
+    "TAG_SE_EP_STATUS": {"tagvalue": 0x1B000014, "type": "None"},
+    "TAG_SE_REQ_DIAGNOSIS_ERRORS": {"tagvalue": 0x1B000015, "type": "UInt16"},
+    "TAG_SE_REQ_RESET_POWERSAVE_TIMEOUT": {"tagvalue": 0x1B000027, "type": "None"},
+    "TAG_SE_REQ_EMERGENCY_POWER_OVERLOAD_STATUS": {
+        "tagvalue": 0x1B000028,
+        "type": "Int16",
+    },
+    "TAG_SE_REQ_EMERGENCY_POWER_RETRY": {"tagvalue": 0x1B000029, "type": "Int16"},
+    "TAG_SE_REQ_IS_EMERGENCYPOWER_POSSIBLE": {"tagvalue": 0x1B000030, "type": "Uint32"},
+    "TAG_SE_REQ_SET_PROTECTION_STRATEGY": {"tagvalue": 0x1B000031, "type": "Container"},
+    "TAG_SE_REQ_SET_MIN_ENERGY_RESTART_EP": {
+        "tagvalue": 0x1B000032,
+        "type": "Container",
+    },
+    "TAG_SE_REQ_ENABLE_CHARGE_FREE_PV_POWER": {
+        "tagvalue": 0x1B000033,
+        "type": "Container",
+    },
+    "TAG_SE_REQ_GET_MIN_ENERGY_RESTART_EP": {
+        "tagvalue": 0x1B000034,
+        "type": "Container",
+    },
+    "TAG_SE_REQ_IS_CHARGE_FREE_PV_POWER_ENABLED": {
+        "tagvalue": 0x1B000035,
+        "type": "Container",
+    },
+    "TAG_SE_REQ_GET_BAT_TRAINING_SETTINGS": {"tagvalue": 0x1B000036, "type": "UInt16"},
+    "TAG_SE_REQ_SET_BAT_TRAINING_SETTINGS": {
+        "tagvalue": 0x1B000037,
+        "type": "Container",
+    },
+    "TAG_SE_REQ_GET_SE_INDEX": {"tagvalue": 0x1B000038, "type": "UInt16"},
+    "TAG_SE_PARAM_INDEX": {"tagvalue": 0x1B040000, "type": "Uint32"},
+    "TAG_SE_PARAM_INDEX_UInt16": {"tagvalue": 0x1B040000, "type": "UInt16"},
+    "TAG_SE_PARAM_DCDC_STATUS": {"tagvalue": 0x1B040001, "type": "Uint32"},
+    "TAG_SE_PARAM_BAT_STATUS": {"tagvalue": 0x1B040002, "type": "Uint32"},
+    "TAG_SE_PARAM_CTRL_STATE": {"tagvalue": 0x1B040003, "type": "CString"},
+    "TAG_SE_PARAM_PvPower": {"tagvalue": 0x1B040004, "type": "Container"},
+    "TAG_SE_PARAM_PvEnergy": {"tagvalue": 0x1B040005, "type": "Container"},
+    "TAG_SE_PARAM_BatteryPower": {"tagvalue": 0x1B040006, "type": "Container"},
+    "TAG_SE_PARAM_BatCapacity": {"tagvalue": 0x1B040007, "type": "Container"},
+    "TAG_SE_PARAM_Limits": {"tagvalue": 0x1B040008, "type": "Container"},
+    "TAG_SE_PARAM_DesiredPower": {"tagvalue": 0x1B040009, "type": "Container"},
+    "TAG_SE_PARAM_DesiredDerating": {"tagvalue": 0x1B040010, "type": "Container"},
+    "TAG_SE_PARAM_INT": {"tagvalue": 0x1B040011, "type": "Int32"},
+    "TAG_SE_PARAM_UINT": {"tagvalue": 0x1B040012, "type": "Uint32"},
+    "TAG_SE_PARAM_FLOAT": {"tagvalue": 0x1B040013, "type": "Float32"},
+    "TAG_SE_PARAM_EmergencyMode": {"tagvalue": 0x1B040014, "type": "Int32"},
+    "TAG_SE_PARAM_PVI1_STATUS": {"tagvalue": 0x1B040020, "type": "Uint32"},
+    "TAG_SE_PARAM_PVI2_STATUS": {"tagvalue": 0x1B040021, "type": "Uint32"},
+    "TAG_SE_PARAM_PVI3_STATUS": {"tagvalue": 0x1B040022, "type": "Uint32"},
+    "TAG_SE_PARAM_EP_RESERVE": {"tagvalue": 0x1B040023, "type": "Float32"},
+    "TAG_SE_PARAM_TIME_LAST_FULL": {"tagvalue": 0x1B040024, "type": "Uint64"},
+    "TAG_SE_PARAM_TIME_LAST_EMPTY": {"tagvalue": 0x1B040025, "type": "Uint64"},
+    "TAG_SE_PARAM_LAST_SOC": {"tagvalue": 0x1B040026, "type": "Float32"},
+    "TAG_SE_PARAM_EP_STATUS": {"tagvalue": 0x1B040027, "type": "Uint32"},
+    "TAG_SE_PARAM_TIME_TO_RETRY": {"tagvalue": 0x1B040030, "type": "UInt16"},
+    "TAG_SE_PARAM_NO_REMAINING_RETRY": {"tagvalue": 0x1B040031, "type": "UInt16"},
+    "TAG_SE_PARAM_EP_RESERVE_W": {"tagvalue": 0x1B040033, "type": "Float32"},
+    "TAG_SE_PARAM_EP_RESERVE_MAX_W": {"tagvalue": 0x1B040034, "type": "Float32"},
+    "TAG_SE_PARAM_BOOL": {"tagvalue": 0x1B400001, "type": "Bool"},
+    "TAG_SE_PARAM_BRI_INDEX": {"tagvalue": 0x1B400002, "type": "UChar8"},
+    "TAG_SE_PARAM_BAT_TRAINING_MODE": {"tagvalue": 0x1B400003, "type": "Uint32"},
+    "TAG_SE_PARAM_BAT_TRAINING_CHARGE_FROM_GRID": {
+        "tagvalue": 0x1B400004,
+        "type": "Bool",
+    },
+    "TAG_SE_PARAM_BAT_TRAINING_RECHARGE_EP_RESERVE_FROM_BATTERY": {
+        "tagvalue": 0x1B400005,
+        "type": "Bool",
+    },
+    "TAG_SE_SE_COUNT": {"tagvalue": 0x1B800001, "type": "Uint32"},
+    "TAG_SE_SE_DATA": {"tagvalue": 0x1B800002, "type": "Container"},
+    "TAG_SE_SET_POWER": {"tagvalue": 0x1B800003, "type": "Container"},
+    "TAG_SE_SET_DERATE": {"tagvalue": 0x1B800004, "type": "Container"},
+    "TAG_SE_SET_COUPLE_MODE": {"tagvalue": 0x1B800005, "type": "Container"},
+    "TAG_SE_COUPLE_MODE": {"tagvalue": 0x1B800006, "type": "Container"},
+    "TAG_SE_SET_BRI": {"tagvalue": 0x1B800007, "type": "Container"},
+    "TAG_SE_GET_BRI": {"tagvalue": 0x1B800008, "type": "Container"},
+    "TAG_SE_EP_RESERVE": {"tagvalue": 0x1B800009, "type": "Container"},
+    "TAG_SE_GET_PROTECTION_STRATEGY": {"tagvalue": 0x1B80000A, "type": "Container"},
+    "TAG_SE_GET_ESTIMATED_POWER_LIMIT": {"tagvalue": 0x1B800011, "type": "Container"},
+    "TAG_SE_DESIGN_LIMIT": {"tagvalue": 0x1B800012, "type": "Container"},
+    "TAG_SE_REQ_SET_RESTART_SWITCH_TO_EP": {"tagvalue": 0x1B800013, "type": "None"},
+    "TAG_SE_REQ_EP_STATUS": {"tagvalue": 0x1B800014, "type": "None"},
+    "TAG_SE_DIAGNOSIS_ERRORS": {"tagvalue": 0x1B800015, "type": "Uint32"},
+    "TAG_SE_EMERGENCY_POWER_OVERLOAD_STATUS": {
+        "tagvalue": 0x1B800028,
+        "type": "Container",
+    },
+    "TAG_SE_EMERGENCY_POWER_RETRY": {"tagvalue": 0x1B800029, "type": "Bool"},
+    "TAG_SE_IS_EMERGENCYPOWER_POSSIBLE": {"tagvalue": 0x1B800030, "type": "Bool"},
+    "TAG_SE_SET_PROTECTION_STRATEGY": {"tagvalue": 0x1B800031, "type": "Container"},
+    "TAG_SE_SET_MIN_ENERGY_RESTART_EP": {"tagvalue": 0x1B800032, "type": "Container"},
+    "TAG_SE_ENABLE_CHARGE_FREE_PV_POWER": {"tagvalue": 0x1B800033, "type": "Container"},
+    "TAG_SE_GET_MIN_ENERGY_RESTART_EP": {"tagvalue": 0x1B800034, "type": "Container"},
+    "TAG_SE_IS_CHARGE_FREE_PV_POWER_ENABLED": {
+        "tagvalue": 0x1B800035,
+        "type": "Container",
+    },
+    "TAG_SE_GET_BAT_TRAINING_SETTINGS": {"tagvalue": 0x1B800036, "type": "Container"},
+    "TAG_SE_SET_BAT_TRAINING_SETTINGS": {"tagvalue": 0x1B800037, "type": "Container"},
+    "TAG_SE_GET_SE_INDEX": {"tagvalue": 0x1B800038, "type": "Container"},
+}
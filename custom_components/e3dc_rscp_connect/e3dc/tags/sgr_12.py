@@ -0,0 +1,28 @@
+"RSCP tags of the SGR namespace, tag codes 0x12xxxxxx."
+
+TAGS = {
+    "TAG_SGR_REQ_STATE": {"tagvalue": 0x12000001, "type": "None"},
+    "TAG_SGR_REQ_READY_TO_USE": {"tagvalue": 0x12000002, "type": "None"},
+    "TAG_SGR_REQ_HW_PROVIDER_LIST": {"tagvalue": 0x12000003, "type": "None"},
+    "TAG_SGR_REQ_SET_AKTIV": {"tagvalue": 0x12000006, "type": "Container"},
+    "TAG_SGR_REQ_SET_COOLDOWN_START": {"tagvalue": 0x12000007, "type": "Char8"},
+    "TAG_SGR_REQ_COOLDOWN_END": {"tagvalue": 0x12000008, "type": "None"},
+    "TAG_SGR_REQ_SET_USED_POWER": {"tagvalue": 0x12000009, "type": "UInt16"},
+    "TAG_SGR_REQ_USED_POWER": {"tagvalue": 0x12000010, "type": "None"},
+    "TAG_SGR_REQ_SET_STATE": {"tagvalue": 0x12000011, "type": "UChar8"},
+    "TAG_SGR_REQ_SET_GLOBAL_OFF": {"tagvalue": 0x12000012, "type": "Bool"},
+    "TAG_SGR_REQ_GLOBAL_OFF": {"tagvalue": 0x12000013, "type": "None"},
+    "TAG_SGR_REQ_DATA": {"tagvalue": 0x12040000, "type": "Container"},
+    "TAG_SGR_INDEX": {"tagvalue": 0x12040001, "type": "UInt16"},
+    "TAG_SGR_STATE": {"tagvalue": 0x12800001, "type": "Char8", "type_variable": True},
+    # "TAG_SGR_STATE": {"tagvalue": 0x12800001, "type": "Int32"},
+    "TAG_SGR_READY_TO_USE": {"tagvalue": 0x12800002, "type": "Char8"},
+    "TAG_SGR_HW_PROVIDER_LIST": {"tagvalue": 0x12800003, "type": "Container"},
+    "TAG_SGR_HW_PROVIDER": {"tagvalue": 0x12800004, "type": "Container"},
+    "TAG_SGR_NAME": {"tagvalue": 0x12800005, "type": "CString"},
+    "TAG_SGR_AKTIV": {"tagvalue": 0x12800006, "type": "Bool"},
+    "TAG_SGR_COOLDOWN_END": {"tagvalue": 0x12800008, "type": "Timestamp"},
+    "TAG_SGR_USED_POWER": {"tagvalue": 0x12800009, "type": "UInt16"},
+    "TAG_SGR_GLOBAL_OFF": {"tagvalue": 0x12800012, "type": "Bool"},
+    "TAG_SGR_DATA": {"tagvalue": 0x12840000, "type": "Container"},
+}
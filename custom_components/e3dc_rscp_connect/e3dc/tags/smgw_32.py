@@ -0,0 +1,16 @@
+"RSCP tags of the SMGW namespace, tag codes 0x32xxxxxx."
+
+TAGS = {
+    "TAG_SMGW_REQ_SET_EEBUS_ENABLED": {"tagvalue": 0x32000000, "type": "Bool"},
+    "TAG_SMGW_REQ_EEBUS_ENABLED": {"tagvalue": 0x32000001, "type": "None"},
+    "TAG_SMGW_REQ_SET_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32000002, "type": "Bool"},
+    "TAG_SMGW_REQ_EEBUS_STATUS": {"tagvalue": 0x32000003, "type": "None"},
+    "TAG_SMGW_REQ_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32000004, "type": "None"},
+    "TAG_SMGW_REQ_SET_IP_ADDRESS": {"tagvalue": 0x32000005, "type": "CString"},
+    "TAG_SMGW_EEBUS_ENABLED": {"tagvalue": 0x32800001, "type": "Bool"},
+    "TAG_SMGW_SET_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32800002, "type": "None"},
+    "TAG_SMGW_EEBUS_STATUS": {"tagvalue": 0x32800003, "type": "Char8"},
+    "TAG_SMGW_HEARTBEAT_AVAILABLE": {"tagvalue": 0x32800004, "type": "Bool"},
+    "TAG_SMGW_SET_IP_ADDRESS": {"tagvalue": 0x32800005, "type": "None"},
+    "TAG_SMGW_SET_EEBUS_ENABLED": {"tagvalue": 0x32800010, "type": "None"},
+}
@@ -0,0 +1,24 @@
+"RSCP tags of the SRV namespace, tag codes 0x08xxxxxx."
+
+TAGS = {
+    "TAG_SRV_REQ_IS_ONLINE": {"tagvalue": 0x08000001, "type": "None"},
+    "TAG_SRV_REQ_ADD_USER": {"tagvalue": 0x08000002, "type": "CString"},
+    "TAG_SRV_REQ_SET_LOCAL_USER": {"tagvalue": 0x08000003, "type": "CString"},
+    "TAG_SRV_REQ_CREATE_USER": {"tagvalue": 0x08000004, "type": "Container"},
+    "TAG_SRV_REQ_CREATE_USER_STATUS": {"tagvalue": 0x08000005, "type": "None"},
+    "TAG_SRV_NAME": {"tagvalue": 0x08400001, "type": "CString"},
+    "TAG_SRV_STREET": {"tagvalue": 0x08400002, "type": "CString"},
+    "TAG_SRV_STREET_NO": {"tagvalue": 0x08400003, "type": "CString"},
+    "TAG_SRV_POSTCODE": {"tagvalue": 0x08400004, "type": "CString"},
+    "TAG_SRV_CITY": {"tagvalue": 0x08400005, "type": "CString"},
+    "TAG_SRV_COUNTRY": {"tagvalue": 0x08400006, "type": "CString"},
+    "TAG_SRV_FON": {"tagvalue": 0x08400007, "type": "CString"},
+    "TAG_SRV_E_MAIL": {"tagvalue": 0x08400008, "type": "CString"},
+    "TAG_SRV_SURNAME": {"tagvalue": 0x08400009, "type": "CString"},
+    "TAG_SRV_IS_ONLINE": {"tagvalue": 0x08800001, "type": "Bool"},
+    "TAG_SRV_ADD_USER": {"tagvalue": 0x08800002, "type": "Bool"},
+    "TAG_SRV_SET_LOCAL_USER": {"tagvalue": 0x08800003, "type": "Bool"},
+    "TAG_SRV_CREATE_USER": {"tagvalue": 0x08800004, "type": "Int32"},
+    "TAG_SRV_CREATE_USER_STATUS": {"tagvalue": 0x08800005, "type": "Int32"},
+    "TAG_SRV_GENERAL_ERROR": {"tagvalue": 0x08FFFFFF, "type": "Container"},
+}
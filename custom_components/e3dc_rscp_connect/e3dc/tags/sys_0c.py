@@ -0,0 +1,25 @@
+"RSCP tags of the SYS namespace, tag codes 0x0Cxxxxxx."
+
+TAGS = {
+    "TAG_SYS_REQ_SYSTEM_REBOOT": {"tagvalue": 0x0C000001, "type": "None"},
+    "TAG_SYS_REQ_IS_SYSTEM_REBOOTING": {"tagvalue": 0x0C000002, "type": "None"},
+    "TAG_SYS_REQ_RESTART_APPLICATION": {"tagvalue": 0x0C000003, "type": "None"},
+    "TAG_SYS_REQ_SCRIPT_FILE_LIST": {"tagvalue": 0x0C000010, "type": "CString"},
+    "TAG_SYS_REQ_EXECUTE_SCRIPT": {"tagvalue": 0x0C000015, "type": "CString"},
+    "TAG_SYS_REQ_SYSTEM_SHUTDOWN": {"tagvalue": 0x0C000016, "type": "None"},
+    "TAG_SYS_REQ_IS_SYSTEM_SHUTTING_DOWN": {"tagvalue": 0x0C000017, "type": "None"},
+    "TAG_SYS_REQ_GUI_PASSWD_RESET": {"tagvalue": 0x0C000018, "type": "None"},
+    "TAG_SYS_REQ_IS_GUI_PASSWD_RESET": {"tagvalue": 0x0C000019, "type": "None"},
+    "TAG_SYS_REQ_GUI_PASSWD_RESET_PERFORMED": {"tagvalue": 0x0C000020, "type": "None"},
+    "TAG_SYS_SYSTEM_REBOOT": {"tagvalue": 0x0C800001, "type": "Int32"},
+    "TAG_SYS_IS_SYSTEM_REBOOTING": {"tagvalue": 0x0C800002, "type": "Bool"},
+    "TAG_SYS_RESTART_APPLICATION": {"tagvalue": 0x0C800003, "type": "Bool"},
+    "TAG_SYS_SCRIPT_FILE_LIST": {"tagvalue": 0x0C800010, "type": "Container"},
+    "TAG_SYS_SCRIPT_FILE": {"tagvalue": 0x0C800011, "type": "CString"},
+    "TAG_SYS_EXECUTE_SCRIPT": {"tagvalue": 0x0C800015, "type": "Bool"},
+    "TAG_SYS_IS_SYSTEM_SHUTING_DOWN": {"tagvalue": 0x0C800017, "type": "Bool"},
+    "TAG_SYS_GUI_PASSWD_RESET": {"tagvalue": 0x0C800018, "type": "Bool"},
+    "TAG_SYS_IS_GUI_PASSWD_RESET": {"tagvalue": 0x0C800019, "type": "Bool"},
+    "TAG_SYS_GUI_PASSWD_RESET_PERFORMED": {"tagvalue": 0x0C800020, "type": "Bool"},
+    "TAG_SYS_GENERAL_ERROR": {"tagvalue": 0x0CFFFFFF, "type": "Container"},
+}
@@ -0,0 +1,37 @@
+"RSCP tags of the UM namespace, tag codes 0x0Dxxxxxx."
+
+TAGS = {
+    "TAG_UM_REQ_UPDATE_STATUS": {"tagvalue": 0x0D000001, "type": "None"},
+    "TAG_UM_REQ_UPDATE_DCDC": {"tagvalue": 0x0D000002, "type": "CString"},
+    "TAG_UM_REQ_CHECK_FOR_UPDATES": {"tagvalue": 0x0D000003, "type": "None"},
+    "TAG_UM_LC_REQ_SET_START_FILE_TRANSFER": {
+        "tagvalue": 0x0D000004,
+        "type": "Container",
+    },
+    "TAG_UM_LC_REQ_SET_FILE_TRANSFER": {"tagvalue": 0x0D000005, "type": "Container"},
+    "TAG_UM_LC_REQ_SET_END_FILE_TRANSFER": {
+        "tagvalue": 0x0D000006,
+        "type": "Container",
+    },
+    "TAG_UM_LC_PARAM_TOKEN": {"tagvalue": 0x0D400001, "type": "CString"},
+    "TAG_UM_LC_PARAM_STATUS": {"tagvalue": 0x0D400002, "type": "Uint64"},
+    "TAG_UM_LC_PARAM_FILE_NAME": {"tagvalue": 0x0D400003, "type": "CString"},
+    "TAG_UM_LC_PARAM_FILE_SIZE": {"tagvalue": 0x0D400004, "type": "Uint32"},
+    "TAG_UM_LC_PARAM_FILE_CHECKSUM": {"tagvalue": 0x0D400005, "type": "CString"},
+    "TAG_UM_LC_PARAM_TRANSACTION_ID": {"tagvalue": 0x0D400006, "type": "UInt16"},
+    "TAG_UM_LC_PARAM_TRANSFER_TYPE": {"tagvalue": 0x0D400007, "type": "UInt16"},
+    "TAG_UM_LC_PARAM_TRANSACTION_STATUS": {"tagvalue": 0x0D400008, "type": "UInt16"},
+    "TAG_UM_LC_PARAM_BLOCK_ID": {"tagvalue": 0x0D400009, "type": "UInt16"},
+    "TAG_UM_LC_PARAM_UPDATE_STATUS": {"tagvalue": 0x0D40000A, "type": "Bool"},
+    "TAG_UM_LC_PARAM_CHUNK": {"tagvalue": 0x0D40000B, "type": "Container"},
+    "TAG_UM_LC_PARAM_CHUNK_ID": {"tagvalue": 0x0D40000C, "type": "UChar8"},
+    "TAG_UM_LC_PARAM_CHUNK_DATA": {"tagvalue": 0x0D40000D, "type": "ByteArray"},
+    "TAG_UM_LC_PARAM_CHUNK_DATA_LENGTH": {"tagvalue": 0x0D40000E, "type": "UInt16"},
+    "TAG_UM_UPDATE_STATUS": {"tagvalue": 0x0D800001, "type": "Int32"},
+    "TAG_UM_UPDATE_DCDC": {"tagvalue": 0x0D800002, "type": "UChar8"},
+    "TAG_UM_CHECK_FOR_UPDATES": {"tagvalue": 0x0D800003, "type": "UChar8"},
+    "TAG_UM_LC_SET_START_FILE_TRANSFER": {"tagvalue": 0x0D800004, "type": "Container"},
+    "TAG_UM_LC_SET_FILE_TRANSFER": {"tagvalue": 0x0D800005, "type": "Container"},
+    "TAG_UM_LC_SET_END_FILE_TRANSFER": {"tagvalue": 0x0D800006, "type": "Container"},
+    "TAG_UM_GENERAL_ERROR": {"tagvalue": 0x0DFFFFFF, "type": "Error"},
+}
@@ -0,0 +1,20 @@
+"RSCP tags of the UPNPC namespace, tag codes 0x15xxxxxx."
+
+TAGS = {
+    "TAG_UPNPC_REQ_DEFAULT_LIST": {"tagvalue": 0x15000001, "type": "None"},
+    "TAG_UPNPC_REQ_SET_DEFAULT_LIST": {"tagvalue": 0x15000002, "type": "Container"},
+    "TAG_UPNPC_REQ_SERVICE_LIST": {"tagvalue": 0x15000003, "type": "None"},
+    "TAG_UPNPC_REQ_DEFAULT_LIST_REV": {"tagvalue": 0x15000006, "type": "None"},
+    "TAG_UPNPC_REQ_SERVICE_LIST_REV": {"tagvalue": 0x15000007, "type": "None"},
+    "TAG_UPNPC_PARAM_DEVICE_ENTRY": {"tagvalue": 0x15040000, "type": "Container"},
+    "TAG_UPNPC_PARAM_SERIALNO": {"tagvalue": 0x15040001, "type": "CString"},
+    "TAG_UPNPC_PARAM_IP_ADR": {"tagvalue": 0x15040002, "type": "CString"},
+    "TAG_UPNPC_PARAM_PORT": {"tagvalue": 0x15040003, "type": "CString"},
+    "TAG_UPNPC_PARAM_NAME": {"tagvalue": 0x15040004, "type": "CString"},
+    "TAG_UPNPC_PARAM_LOCATION": {"tagvalue": 0x15040005, "type": "CString"},
+    "TAG_UPNPC_DEFAULT_LIST": {"tagvalue": 0x15800001, "type": "Container"},
+    "TAG_UPNPC_SET_DEFAULT_LIST": {"tagvalue": 0x15800002, "type": "UInt16"},
+    "TAG_UPNPC_SERVICE_LIST": {"tagvalue": 0x15800003, "type": "Container"},
+    "TAG_UPNPC_DEFAULT_LIST_REV": {"tagvalue": 0x15800006, "type": "UInt16"},
+    "TAG_UPNPC_SERVICE_LIST_REV": {"tagvalue": 0x15800007, "type": "UInt16"},
+}
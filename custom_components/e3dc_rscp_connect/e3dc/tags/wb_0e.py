@@ -0,0 +1,392 @@
+"RSCP tags of the WB namespace, tag codes 0x0Exxxxxx."
+
+TAGS = {
+    "TAG_WB_REQ_NIGHT_MODE": {"tagvalue": 0x0E000000, "type": "Container"},
+    "TAG_WB_REQ_ENERGY_ALL": {"tagvalue": 0x0E000001, "type": "None"},
+    "TAG_WB_REQ_ENERGY_SOLAR": {"tagvalue": 0x0E000002, "type": "None"},
+    "TAG_WB_REQ_SOC": {"tagvalue": 0x0E000003, "type": "None"},
+    "TAG_WB_REQ_STATUS": {"tagvalue": 0x0E000004, "type": "None"},
+    "TAG_WB_REQ_ERROR_CODE": {"tagvalue": 0x0E000005, "type": "None"},
+    "TAG_WB_REQ_MODE": {"tagvalue": 0x0E000006, "type": "None"},
+    "TAG_WB_REQ_APP_SOFTWARE": {"tagvalue": 0x0E000007, "type": "None"},
+    "TAG_WB_REQ_BOOTLOADER_SOFTWARE": {"tagvalue": 0x0E000008, "type": "None"},
+    "TAG_WB_REQ_HW_VERSION": {"tagvalue": 0x0E000009, "type": "None"},
+    "TAG_WB_REQ_FLASH_VERSION": {"tagvalue": 0x0E00000A, "type": "None"},
+    "TAG_WB_REQ_DEVICE_ID": {"tagvalue": 0x0E00000B, "type": "None"},
+    "TAG_WB_REQ_PM_POWER_L1": {"tagvalue": 0x0E00000C, "type": "None"},
+    "TAG_WB_REQ_PM_POWER_L2": {"tagvalue": 0x0E00000D, "type": "None"},
+    "TAG_WB_REQ_PM_POWER_L3": {"tagvalue": 0x0E00000E, "type": "None"},
+    "TAG_WB_REQ_PM_ACTIVE_PHASES": {"tagvalue": 0x0E00000F, "type": "None"},
+    "TAG_WB_REQ_SET_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E000010, "type": "Int16"},
+    "TAG_WB_REQ_PM_MODE": {"tagvalue": 0x0E000011, "type": "None"},
+    "TAG_WB_REQ_PM_ENERGY_L1": {"tagvalue": 0x0E000012, "type": "None"},
+    "TAG_WB_REQ_PM_ENERGY_L2": {"tagvalue": 0x0E000013, "type": "None"},
+    "TAG_WB_REQ_PM_ENERGY_L3": {"tagvalue": 0x0E000014, "type": "None"},
+    "TAG_WB_REQ_PM_DEVICE_ID": {"tagvalue": 0x0E000015, "type": "None"},
+    "TAG_WB_REQ_PM_ERROR_CODE": {"tagvalue": 0x0E000016, "type": "None"},
+    "TAG_WB_REQ_PM_FIRMWARE_VERSION": {"tagvalue": 0x0E000017, "type": "None"},
+    "TAG_WB_REQ_DIAG_DEVICE_ID": {"tagvalue": 0x0E000018, "type": "None"},
+    "TAG_WB_REQ_DIAG_BAT_CAPACITY": {"tagvalue": 0x0E000019, "type": "None"},
+    "TAG_WB_REQ_DIAG_USER_PARAM": {"tagvalue": 0x0E00001A, "type": "None"},
+    "TAG_WB_REQ_DIAG_MAX_CURRENT": {"tagvalue": 0x0E00001B, "type": "None"},
+    "TAG_WB_REQ_DIAG_PHASE_VOLTAGE": {"tagvalue": 0x0E00001C, "type": "None"},
+    "TAG_WB_REQ_DIAG_DISPLAY_SPEECH": {"tagvalue": 0x0E00001D, "type": "None"},
+    "TAG_WB_REQ_DIAG_DESIGN": {"tagvalue": 0x0E00001E, "type": "None"},
+    "TAG_WB_REQ_DIAG_INFOS": {"tagvalue": 0x0E00001F, "type": "None"},
+    "TAG_WB_REQ_DIAG_WARNINGS": {"tagvalue": 0x0E000020, "type": "None"},
+    "TAG_WB_REQ_DIAG_ERRORS": {"tagvalue": 0x0E000021, "type": "None"},
+    "TAG_WB_REQ_DIAG_TEMP_1": {"tagvalue": 0x0E000022, "type": "None"},
+    "TAG_WB_REQ_DIAG_TEMP_2": {"tagvalue": 0x0E000023, "type": "None"},
+    "TAG_WB_REQ_DIAG_CP_PEGEL": {"tagvalue": 0x0E000024, "type": "None"},
+    "TAG_WB_REQ_DIAG_PP_IN_A": {"tagvalue": 0x0E000025, "type": "None"},
+    "TAG_WB_REQ_DIAG_STATUS_DIODE": {"tagvalue": 0x0E000026, "type": "None"},
+    "TAG_WB_REQ_DIAG_DIG_IN_1": {"tagvalue": 0x0E000027, "type": "None"},
+    "TAG_WB_REQ_DIAG_DIG_IN_2": {"tagvalue": 0x0E000028, "type": "None"},
+    "TAG_WB_REQ_PM_DEVICE_STATE": {"tagvalue": 0x0E000029, "type": "None"},
+    "TAG_WB_REQ_AUTH_REQUIRED": {"tagvalue": 0x0E00002A, "type": "None"},
+    "TAG_WB_REQ_SET_AUTH_REQUIRED": {"tagvalue": 0x0E00002B, "type": "Bool"},
+    "TAG_WB_REQ_SESSION": {"tagvalue": 0x0E00002C, "type": "UChar8"},
+    "TAG_WB_REQ_SET_RFID_READER_ENABLED": {"tagvalue": 0x0E00002D, "type": "Bool"},
+    "TAG_WB_REQ_RFID_READER_ENABLED": {"tagvalue": 0x0E00002E, "type": "None"},
+    "TAG_WB_REQ_FIRMWARE_VERSION": {"tagvalue": 0x0E00002F, "type": "None"},
+    "TAG_WB_REQ_SET_MODE": {"tagvalue": 0x0E000030, "type": "Container"},
+    "TAG_WB_SET_MODE": {"tagvalue": 0x0E000031, "type": "UChar8"},
+    "TAG_WB_REQ_SET_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E000033, "type": "Bool"},
+    "TAG_WB_REQ_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E000034, "type": "None"},
+    "TAG_WB_REQ_BIDI_CONTINGENT": {"tagvalue": 0x0E000035, "type": "Container"},
+    "TAG_WB_REQ_SET_BIDI_CONTINGENT": {"tagvalue": 0x0E000036, "type": "Container"},
+    "TAG_WB_REQ_ALIVE": {"tagvalue": 0x0E000037, "type": "None"},
+    "TAG_WB_REQ_SET_AUTO_PHASE_SWITCH_ENABLED": {
+        "tagvalue": 0x0E000038,
+        "type": "Bool",
+    },
+    "TAG_WB_REQ_AUTO_PHASE_SWITCH_ENABLED": {"tagvalue": 0x0E000039, "type": "None"},
+    "TAG_WB_REQ_BIDI_MIN_ENERGY_REQUEST": {"tagvalue": 0x0E00003A, "type": "None"},
+    "TAG_WB_REQ_BIDI_MAX_ENERGY_REQUEST": {"tagvalue": 0x0E00003B, "type": "None"},
+    "TAG_WB_REQ_BIDI_TARGET_ENERGY_REQUEST": {"tagvalue": 0x0E00003C, "type": "None"},
+    "TAG_WB_REQ_BIDI_ENERGY_REQUESTS": {"tagvalue": 0x0E00003D, "type": "Container"},
+    "TAG_WB_REQ_CHARGE_IN_FALLBACK_MODE_SELECTABLE": {
+        "tagvalue": 0x0E00003E,
+        "type": "None",
+    },
+    "TAG_WB_REQ_CHARGE_IN_FALLBACK_MODE_ALLOWED": {
+        "tagvalue": 0x0E00003F,
+        "type": "None",
+    },
+    "TAG_WB_REQ_PM_MAX_PHASE_POWER": {"tagvalue": 0x0E000040, "type": "None"},
+    "TAG_WB_REQ_SET_DEVICE_NAME": {"tagvalue": 0x0E000041, "type": "CString"},
+    "TAG_WB_REQ_DEVICE_NAME": {"tagvalue": 0x0E000042, "type": "None"},
+    "TAG_WB_REFRESH_LOGGEDMESSAGES": {"tagvalue": 0x0E000043, "type": "None"},
+    "TAG_WB_REQ_GET_LOGGEDMESSAGES": {"tagvalue": 0x0E000044, "type": "None"},
+    "TAG_WB_REQ_SET_CHARGE_IN_FALLBACK_MODE_ALLOWED": {
+        "tagvalue": 0x0E000045,
+        "type": "Bool",
+    },
+    "TAG_WB_REQ_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E000046, "type": "None"},
+    "TAG_WB_REQ_SET_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E000047, "type": "UInt16"},
+    "TAG_WB_REQ_SET_LED_COLOR": {"tagvalue": 0x0E000048, "type": "UChar8"},
+    "TAG_WB_REQ_DC_CHARGER_STATE": {"tagvalue": 0x0E000049, "type": "None"},
+    "TAG_WB_REQ_SET_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E00004A, "type": "Uint32"},
+    "TAG_WB_REQ_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E00004B, "type": "None"},
+    "TAG_WB_REQ_ASSIGNED_POWER": {"tagvalue": 0x0E00004C, "type": "None"},
+    "TAG_WB_REQ_CP_STATE": {"tagvalue": 0x0E00004D, "type": "None"},
+    "TAG_WB_REQ_SET_NIGHT_MODE": {"tagvalue": 0x0E00004E, "type": "Container"},
+    "TAG_WB_REQ_BIDI_SHIFT_MODE_SOC_RANGE": {"tagvalue": 0x0E00004F, "type": "None"},
+    "TAG_WB_REQ_SET_BIDI_SHIFT_MODE_SOC_RANGE": {
+        "tagvalue": 0x0E000051,
+        "type": "Container",
+    },
+    "TAG_WB_REQ_DATA": {"tagvalue": 0x0E040000, "type": "Container"},
+    "TAG_WB_INDEX": {"tagvalue": 0x0E040001, "type": "UChar8"},
+    "TAG_WB_MODE_PARAM_MODE": {"tagvalue": 0x0E040031, "type": "UChar8"},
+    "TAG_WB_MODE_PARAM_MAX_CURRENT": {"tagvalue": 0x0E040032, "type": "UChar8"},
+    "TAG_WB_REQ_AVAILABLE_SOLAR_POWER": {"tagvalue": 0x0E041000, "type": "Container"},
+    "TAG_WB_POWER": {"tagvalue": 0x0E041001, "type": "UInt16"},
+    "TAG_WB_STATUS_BIT": {"tagvalue": 0x0E041002, "type": "UChar8"},
+    "TAG_WB_REQ_SET_EXTERN": {"tagvalue": 0x0E041010, "type": "Container"},
+    "TAG_WB_REQ_EXTERN_DATA_SUN": {"tagvalue": 0x0E041011, "type": "None"},
+    "TAG_WB_REQ_EXTERN_DATA_NET": {"tagvalue": 0x0E041012, "type": "None"},
+    "TAG_WB_REQ_EXTERN_DATA_ALL": {"tagvalue": 0x0E041013, "type": "None"},
+    "TAG_WB_REQ_EXTERN_DATA_ALG": {"tagvalue": 0x0E041014, "type": "None"},
+    "TAG_WB_REQ_SET_BAT_CAPACITY": {"tagvalue": 0x0E041015, "type": "Uint32"},
+    "TAG_WB_REQ_SET_ENERGY_ALL": {"tagvalue": 0x0E041016, "type": "Uint32"},
+    "TAG_WB_REQ_SET_ENERGY_SOLAR": {"tagvalue": 0x0E041017, "type": "Uint32"},
+    "TAG_WB_REQ_SET_PARAM_1": {"tagvalue": 0x0E041018, "type": "Container"},
+    "TAG_WB_REQ_SET_PARAM_2": {"tagvalue": 0x0E041019, "type": "Container"},
+    "TAG_WB_REQ_PARAM_2": {"tagvalue": 0x0E04101A, "type": "None"},
+    "TAG_WB_REQ_PARAM_1": {"tagvalue": 0x0E04101B, "type": "None"},
+    "TAG_WB_REQ_CONNECTED_DEVICES": {"tagvalue": 0x0E04101C, "type": "None"},
+    "TAG_WB_REQ_SET_SOC": {"tagvalue": 0x0E04101D, "type": "UChar8"},
+    "TAG_WB_REQ_STATION_AVAILABLE": {"tagvalue": 0x0E04101E, "type": "None"},
+    "TAG_WB_REQ_SET_STATION_AVAILABLE": {"tagvalue": 0x0E04101F, "type": "Bool"},
+    "TAG_WB_REQ_SET_PW": {"tagvalue": 0x0E041020, "type": "Container"},
+    "TAG_WB_REQ_SET_STATION_ENABLED": {"tagvalue": 0x0E041021, "type": "Bool"},
+    "TAG_WB_REQ_MAC_ADDRESS": {"tagvalue": 0x0E041022, "type": "None"},
+    "TAG_WB_REQ_PROXIMITY_PLUG": {"tagvalue": 0x0E041023, "type": "None"},
+    "TAG_WB_REQ_PREFERRED_CHARGE_POWER": {"tagvalue": 0x0E041024, "type": "None"},
+    "TAG_WB_REQ_CHARGE_FULL": {"tagvalue": 0x0E041025, "type": "None"},
+    "TAG_WB_REQ_SET_CHARGE_FULL": {"tagvalue": 0x0E041026, "type": "Bool"},
+    "TAG_WB_REQ_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E041027, "type": "None"},
+    "TAG_WB_REQ_SET_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E041028, "type": "Int32"},
+    "TAG_WB_REQ_PARAMETER_LIST": {"tagvalue": 0x0E041029, "type": "Uint32"},
+    "TAG_WB_REQ_STATION_ENABLED": {"tagvalue": 0x0E04102A, "type": "None"},
+    "TAG_WB_REQ_SET_PARAMETER_LIST": {"tagvalue": 0x0E041030, "type": "Container"},
+    "TAG_WB_REQ_GATEWAY": {"tagvalue": 0x0E041031, "type": "None"},
+    "TAG_WB_REQ_SUBNET_MASK": {"tagvalue": 0x0E041032, "type": "None"},
+    "TAG_WB_REQ_IP_ADDR": {"tagvalue": 0x0E041033, "type": "None"},
+    "TAG_WB_REQ_DHCP_ENABLED": {"tagvalue": 0x0E041034, "type": "None"},
+    "TAG_WB_REQ_SET_DHCP_ENABLED": {"tagvalue": 0x0E041035, "type": "Bool"},
+    "TAG_WB_REQ_WALLBOX_TYPE": {"tagvalue": 0x0E041036, "type": "None"},
+    "TAG_WB_REQ_UPDATE_NETWORK_CONFIG": {"tagvalue": 0x0E041037, "type": "Container"},
+    "TAG_WB_REQ_SUN_MODE_ACTIVE": {"tagvalue": 0x0E041038, "type": "None"},
+    "TAG_WB_REQ_SET_SUN_MODE_ACTIVE": {"tagvalue": 0x0E041039, "type": "Bool"},
+    "TAG_WB_REQ_NUMBER": {"tagvalue": 0x0E04103A, "type": "None"},
+    "TAG_WB_REQ_NUMBER_PHASES": {"tagvalue": 0x0E04103B, "type": "None"},
+    "TAG_WB_REQ_SET_NUMBER_PHASES": {"tagvalue": 0x0E04103C, "type": "UChar8"},
+    "TAG_WB_REQ_ABORT_CHARGING": {"tagvalue": 0x0E04103D, "type": "None"},
+    "TAG_WB_REQ_SET_ABORT_CHARGING": {"tagvalue": 0x0E04103E, "type": "Bool"},
+    "TAG_WB_REQ_SCHUKO_AVAILABLE": {"tagvalue": 0x0E041040, "type": "None"},
+    "TAG_WB_REQ_IS_SCHUKO_LOCKED": {"tagvalue": 0x0E041041, "type": "None"},
+    "TAG_WB_REQ_SET_SCHUKO_LOCKED": {"tagvalue": 0x0E041042, "type": "Bool"},
+    "TAG_WB_REQ_MAX_POWER_PER_PHASE": {"tagvalue": 0x0E041043, "type": "None"},
+    "TAG_WB_REQ_MIN_POWER_PER_PHASE": {"tagvalue": 0x0E041044, "type": "None"},
+    "TAG_WB_REQ_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E041045, "type": "None"},
+    "TAG_WB_REQ_LOWER_CURRENT_LIMIT": {"tagvalue": 0x0E041046, "type": "None"},
+    "TAG_WB_REQ_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E041047, "type": "None"},
+    "TAG_WB_REQ_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E041048, "type": "None"},
+    "TAG_WB_REQ_SET_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E041049, "type": "Int32"},
+    "TAG_WB_REQ_SET_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E04104A, "type": "Int32"},
+    "TAG_WB_PARAM_INDEX": {"tagvalue": 0x0E04104B, "type": "Int32"},
+    "TAG_WB_REQ_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E04104C, "type": "None"},
+    "TAG_WB_REQ_SET_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E04104D, "type": "Uint32"},
+    "TAG_WB_REQ_GET_KEY_LOCK_MODE": {"tagvalue": 0x0E04104E, "type": "None"},
+    "TAG_WB_REQ_SET_KEY_LOCK_MODE": {"tagvalue": 0x0E04104F, "type": "Uint32"},
+    "TAG_WB_REQ_KEY_STATE": {"tagvalue": 0x0E041050, "type": "None"},
+    "TAG_WB_SERIAL": {"tagvalue": 0x0E041051, "type": "CString"},
+    "TAG_WB_REQ_MAX_CHARGE_POWER": {"tagvalue": 0x0E041052, "type": "None"},
+    "TAG_WB_REQ_MIN_CHARGE_POWER": {"tagvalue": 0x0E041053, "type": "None"},
+    "TAG_WB_EXTERN_DATA": {"tagvalue": 0x0E042010, "type": "ByteArray"},
+    "TAG_WB_EXTERN_DATA_LEN": {"tagvalue": 0x0E042011, "type": "UChar8"},
+    "TAG_WB_PARAM_USR": {"tagvalue": 0x0E042012, "type": "UChar8"},
+    "TAG_WB_PARAM_PW": {"tagvalue": 0x0E042013, "type": "CString"},
+    "TAG_WB_REQ_DEVICE_STATE": {"tagvalue": 0x0E060000, "type": "None"},
+    "TAG_WB_REQ_SET_BIC_MODE": {"tagvalue": 0x0E0F0001, "type": "UChar8"},
+    "TAG_WB_REQ_GET_BIC_MODE": {"tagvalue": 0x0E0F0002, "type": "None"},
+    "TAG_WB_REQ_GET_CHARGE_PLAN_TEXT": {"tagvalue": 0x0E0F0003, "type": "None"},
+    "TAG_WB_PARAM_NIGHT_MODE_ACTIVE": {"tagvalue": 0x0E400000, "type": "Bool"},
+    "TAG_WB_PARAM_NIGHT_MODE_TIME_RANGE": {"tagvalue": 0x0E400001, "type": "CString"},
+    "TAG_WB_PARAM_BIDI_SHIFT_MODE_START_SOC": {
+        "tagvalue": 0x0E400002,
+        "type": "UChar8",
+    },
+    "TAG_WB_PARAM_BIDI_SHIFT_MODE_END_SOC": {"tagvalue": 0x0E400003, "type": "UChar8"},
+    "TAG_WB_STRING_PARAMETER": {"tagvalue": 0x0E440010, "type": "CString"},
+    "TAG_WB_PREFERRED_CHARGE_POWER": {"tagvalue": 0x0E741024, "type": "Int32"},
+    "TAG_WB_SESSION_END_TIME": {"tagvalue": 0x0E741025, "type": "Uint64"},
+    "TAG_WB_SESSION_START_TIME": {"tagvalue": 0x0E741026, "type": "Uint64"},
+    "TAG_WB_SESSION_STATUS": {"tagvalue": 0x0E741027, "type": "UChar8"},
+    "TAG_WB_SESSION_ACTIVE_CHARGE_TIME": {"tagvalue": 0x0E741028, "type": "Uint64"},
+    "TAG_WB_SESSION_INACTIVE_TIME": {"tagvalue": 0x0E741029, "type": "Uint64"},
+    "TAG_WB_SESSION_CHARGED_ENERGY": {"tagvalue": 0x0E74102A, "type": "Double64"},
+    "TAG_WB_SESSION_CHARGED_SUN_ENERGY": {"tagvalue": 0x0E74102B, "type": "Double64"},
+    "TAG_WB_SESSION_METER_ENERGY_START": {"tagvalue": 0x0E74102C, "type": "Double64"},
+    "TAG_WB_SESSION_METER_ENERGY_END": {"tagvalue": 0x0E74102D, "type": "Double64"},
+    "TAG_WB_SESSION_ID": {"tagvalue": 0x0E74102E, "type": "CString"},
+    "TAG_WB_SESSION_VEHICLE_ID": {"tagvalue": 0x0E74102F, "type": "CString"},
+    "TAG_WB_SESSION_AUTH_DATA": {"tagvalue": 0x0E741030, "type": "CString"},
+    "TAG_WB_SESSION_RECEIPT_SIGNATURE": {"tagvalue": 0x0E741031, "type": "CString"},
+    "TAG_WB_SESSION_RECEIPT_DATA": {"tagvalue": 0x0E741032, "type": "CString"},
+    "TAG_WB_SESSION_AUTH_TYPE": {"tagvalue": 0x0E741033, "type": "Char8"},
+    "TAG_WB_SESSION_WALLBOX_ID": {"tagvalue": 0x0E741035, "type": "CString"},
+    "TAG_WB_BIDI_CONTINGENT_USED_KWH_YEAR": {"tagvalue": 0x0E741036, "type": "Uint32"},
+    "TAG_WB_BIDI_CONTINGENT_USED_HOURS_YEAR": {
+        "tagvalue": 0x0E741037,
+        "type": "Uint32",
+    },
+    "TAG_WB_BIDI_CONTINGENT_MAX_KWH_LIFETIME": {
+        "tagvalue": 0x0E741038,
+        "type": "Uint32",
+    },
+    "TAG_WB_BIDI_CONTINGENT_MAX_HOURS_LIFETIME": {
+        "tagvalue": 0x0E741039,
+        "type": "Uint32",
+    },
+    "TAG_WB_BIDI_CONTINGENT_MAX_HOURS_YEAR": {"tagvalue": 0x0E74103A, "type": "Uint32"},
+    "TAG_WB_BIDI_CONTINGENT_MAX_KWH_YEAR": {"tagvalue": 0x0E74103B, "type": "Uint32"},
+    "TAG_WB_BIDI_CONTINGENT_CAR_ID": {"tagvalue": 0x0E74103C, "type": "CString"},
+    "TAG_WB_BIDI_CONTINGENT_CAR_LIFETIME": {"tagvalue": 0x0E74103D, "type": "Uint32"},
+    "TAG_WB_SESSION_AUTH_DATA_SWAPPED": {"tagvalue": 0x0E74103E, "type": "Bool"},
+    "TAG_WB_SESSION_ACTIVE_DISCHARGE_TIME": {"tagvalue": 0x0E74103F, "type": "Uint64"},
+    "TAG_WB_SESSION_DISCHARGED_ENERGY": {"tagvalue": 0x0E741040, "type": "Double64"},
+    "TAG_WB_SESSION_DISCHARGE_METER_ENERGY_START": {
+        "tagvalue": 0x0E741041,
+        "type": "Double64",
+    },
+    "TAG_WB_SESSION_DISCHARGE_METER_ENERGY_STOP": {
+        "tagvalue": 0x0E741042,
+        "type": "Double64",
+    },
+    "TAG_WB_ASSIGNED_POWER_L1": {"tagvalue": 0x0E741043, "type": "Int32"},
+    "TAG_WB_ASSIGNED_POWER_L2": {"tagvalue": 0x0E741044, "type": "Int32"},
+    "TAG_WB_ASSIGNED_POWER_L3": {"tagvalue": 0x0E741045, "type": "Int32"},
+    "TAG_WB_NIGHT_MODE": {"tagvalue": 0x0E800000, "type": "Container"},
+    "TAG_WB_ENERGY_ALL": {"tagvalue": 0x0E800001, "type": "Uint32"},
+    "TAG_WB_ENERGY_SOLAR": {"tagvalue": 0x0E800002, "type": "Uint32"},
+    "TAG_WB_SOC": {"tagvalue": 0x0E800003, "type": "UInt16"},
+    "TAG_WB_STATUS": {"tagvalue": 0x0E800004, "type": "UChar8"},
+    "TAG_WB_ERROR_CODE": {"tagvalue": 0x0E800005, "type": "UChar8"},
+    "TAG_WB_MODE": {"tagvalue": 0x0E800006, "type": "UChar8"},
+    "TAG_WB_APP_SOFTWARE": {"tagvalue": 0x0E800007, "type": "UChar8"},
+    "TAG_WB_BOOTLOADER_SOFTWARE": {"tagvalue": 0x0E800008, "type": "UChar8"},
+    "TAG_WB_HW_VERSION": {"tagvalue": 0x0E800009, "type": "UChar8"},
+    "TAG_WB_FLASH_VERSION": {"tagvalue": 0x0E80000A, "type": "UChar8"},
+    "TAG_WB_DEVICE_ID": {"tagvalue": 0x0E80000B, "type": "UChar8"},
+    "TAG_WB_PM_POWER_L1": {"tagvalue": 0x0E80000C, "type": "Double64"},
+    "TAG_WB_PM_POWER_L2": {"tagvalue": 0x0E80000D, "type": "Double64"},
+    "TAG_WB_PM_POWER_L3": {"tagvalue": 0x0E80000E, "type": "Double64"},
+    "TAG_WB_PM_ACTIVE_PHASES": {"tagvalue": 0x0E80000F, "type": "UChar8"},
+    "TAG_WB_SET_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E800010, "type": "Int16"},
+    "TAG_WB_PM_MODE": {"tagvalue": 0x0E800011, "type": "UChar8"},
+    "TAG_WB_PM_ENERGY_L1": {"tagvalue": 0x0E800012, "type": "Double64"},
+    "TAG_WB_PM_ENERGY_L2": {"tagvalue": 0x0E800013, "type": "Double64"},
+    "TAG_WB_PM_ENERGY_L3": {"tagvalue": 0x0E800014, "type": "Double64"},
+    "TAG_WB_PM_DEVICE_ID": {"tagvalue": 0x0E800015, "type": "Uint32"},
+    "TAG_WB_PM_ERROR_CODE": {"tagvalue": 0x0E800016, "type": "UChar8"},
+    "TAG_WB_PM_FIRMWARE_VERSION": {"tagvalue": 0x0E800017, "type": "UChar8"},
+    "TAG_WB_DIAG_DEVICE_ID": {"tagvalue": 0x0E800018, "type": "Uint32"},
+    "TAG_WB_DIAG_BAT_CAPACITY": {"tagvalue": 0x0E800019, "type": "Uint32"},
+    "TAG_WB_DIAG_USER_PARAM": {"tagvalue": 0x0E80001A, "type": "UInt16"},
+    "TAG_WB_DIAG_MAX_CURRENT": {"tagvalue": 0x0E80001B, "type": "UChar8"},
+    "TAG_WB_DIAG_PHASE_VOLTAGE": {"tagvalue": 0x0E80001C, "type": "UChar8"},
+    "TAG_WB_DIAG_DISPLAY_SPEECH": {"tagvalue": 0x0E80001D, "type": "UChar8"},
+    "TAG_WB_DIAG_DESIGN": {"tagvalue": 0x0E80001E, "type": "UChar8"},
+    "TAG_WB_DIAG_INFOS": {"tagvalue": 0x0E80001F, "type": "UInt16"},
+    "TAG_WB_DIAG_WARNINGS": {"tagvalue": 0x0E800020, "type": "UInt16"},
+    "TAG_WB_DIAG_ERRORS": {"tagvalue": 0x0E800021, "type": "UInt16"},
+    "TAG_WB_DIAG_TEMP_1": {"tagvalue": 0x0E800022, "type": "UChar8"},
+    "TAG_WB_DIAG_TEMP_2": {"tagvalue": 0x0E800023, "type": "UChar8"},
+    "TAG_WB_DIAG_CP_PEGEL": {"tagvalue": 0x0E800024, "type": "UChar8"},
+    "TAG_WB_DIAG_PP_IN_A": {"tagvalue": 0x0E800025, "type": "UChar8"},
+    "TAG_WB_DIAG_STATUS_DIODE": {"tagvalue": 0x0E800026, "type": "UChar8"},
+    "TAG_WB_DIAG_DIG_IN_1": {"tagvalue": 0x0E800027, "type": "ByteArray"},
+    "TAG_WB_DIAG_DIG_IN_2": {"tagvalue": 0x0E800028, "type": "ByteArray"},
+    "TAG_WB_PM_DEVICE_STATE": {"tagvalue": 0x0E800029, "type": "Container"},
+    "TAG_WB_AUTH_REQUIRED": {"tagvalue": 0x0E80002A, "type": "Bool"},
+    "TAG_WB_SET_AUTH_REQUIRED": {"tagvalue": 0x0E80002B, "type": "Bool"},
+    "TAG_WB_SESSION": {"tagvalue": 0x0E80002C, "type": "Container"},
+    "TAG_WB_SET_RFID_READER_ENABLED": {"tagvalue": 0x0E80002D, "type": "Bool"},
+    "TAG_WB_RFID_READER_ENABLED": {"tagvalue": 0x0E80002E, "type": "Bool"},
+    "TAG_WB_FIRMWARE_VERSION": {"tagvalue": 0x0E80002F, "type": "CString"},
+    "TAG_WB_PM_DEVICE_STATE_CONNECTED": {"tagvalue": 0x0E800030, "type": "Bool"},
+    "TAG_WB_PM_DEVICE_STATE_WORKING": {"tagvalue": 0x0E800031, "type": "Bool"},
+    "TAG_WB_PM_DEVICE_STATE_IN_SERVICE": {"tagvalue": 0x0E800032, "type": "Bool"},
+    "TAG_WB_SET_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E800033, "type": "Bool"},
+    "TAG_WB_BIDI_MODE_ACTIVE": {"tagvalue": 0x0E800034, "type": "Bool"},
+    "TAG_WB_BIDI_CONTINGENT": {"tagvalue": 0x0E800035, "type": "Container"},
+    "TAG_WB_SET_BIDI_CONTINGENT": {"tagvalue": 0x0E800036, "type": "Bool"},
+    "TAG_WB_ALIVE": {"tagvalue": 0x0E800037, "type": "UChar8"},
+    "TAG_WB_SET_AUTO_PHASE_SWITCH_ENABLED": {"tagvalue": 0x0E800038, "type": "Bool"},
+    "TAG_WB_AUTO_PHASE_SWITCH_ENABLED": {"tagvalue": 0x0E800039, "type": "Bool"},
+    "TAG_WB_BIDI_MIN_ENERGY_REQUEST": {"tagvalue": 0x0E80003A, "type": "Int32"},
+    "TAG_WB_BIDI_MAX_ENERGY_REQUEST": {"tagvalue": 0x0E80003B, "type": "Int32"},
+    "TAG_WB_BIDI_TARGET_ENERGY_REQUEST": {"tagvalue": 0x0E80003C, "type": "Int32"},
+    "TAG_WB_BIDI_ENERGY_REQUESTS": {"tagvalue": 0x0E80003D, "type": "Container"},
+    "TAG_WB_CHARGE_IN_FALLBACK_MODE_SELECTABLE": {
+        "tagvalue": 0x0E80003E,
+        "type": "Bool",
+    },
+    "TAG_WB_CHARGE_IN_FALLBACK_MODE_ALLOWED": {"tagvalue": 0x0E80003F, "type": "Bool"},
+    "TAG_WB_PM_MAX_PHASE_POWER": {"tagvalue": 0x0E800040, "type": "Double64"},
+    "TAG_WB_DEVICE_NAME": {"tagvalue": 0x0E800042, "type": "CString"},
+    "TAG_WB_SET_CHARGE_IN_FALLBACK_MODE_ALLOWED": {
+        "tagvalue": 0x0E800045,
+        "type": "Bool",
+    },
+    "TAG_WB_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E800046, "type": "UInt16"},
+    "TAG_WB_SET_MAX_CURRENT_FALLBACK": {"tagvalue": 0x0E800047, "type": "Bool"},
+    "TAG_WB_SET_LED_COLOR": {"tagvalue": 0x0E800048, "type": "Bool"},
+    "TAG_WB_DC_CHARGER_STATE": {"tagvalue": 0x0E800049, "type": "UChar8"},
+    "TAG_WB_SET_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E80004A, "type": "Bool"},
+    "TAG_WB_RFID_READER_BAUD_RATE": {"tagvalue": 0x0E80004B, "type": "Uint32"},
+    "TAG_WB_ASSIGNED_POWER": {"tagvalue": 0x0E80004C, "type": "Container"},
+    "TAG_WB_CP_STATE": {"tagvalue": 0x0E80004D, "type": "CString"},
+    "TAG_WB_SET_NIGHT_MODE": {"tagvalue": 0x0E80004E, "type": "Container"},
+    "TAG_WB_BIDI_SHIFT_MODE_SOC_RANGE": {"tagvalue": 0x0E80004F, "type": "Container"},
+    "TAG_WB_SET_BIDI_SHIFT_MODE_SOC_RANGE": {
+        "tagvalue": 0x0E800051,
+        "type": "Container",
+    },
+    "TAG_WB_DATA": {"tagvalue": 0x0E840000, "type": "Container"},
+    "TAG_WB_AVAILABLE_SOLAR_POWER": {"tagvalue": 0x0E841000, "type": "Container"},
+    "TAG_WB_SET_EXTERN": {"tagvalue": 0x0E841010, "type": "None"},
+    "TAG_WB_EXTERN_DATA_SUN": {"tagvalue": 0x0E841011, "type": "Container"},
+    "TAG_WB_EXTERN_DATA_NET": {"tagvalue": 0x0E841012, "type": "Container"},
+    "TAG_WB_EXTERN_DATA_ALL": {"tagvalue": 0x0E841013, "type": "Container"},
+    "TAG_WB_EXTERN_DATA_ALG": {"tagvalue": 0x0E841014, "type": "Container"},
+    "TAG_WB_SET_BAT_CAPACITY": {"tagvalue": 0x0E841015, "type": "Uint32"},
+    "TAG_WB_SET_ENERGY_ALL": {"tagvalue": 0x0E841016, "type": "Uint32"},
+    "TAG_WB_SET_ENERGY_SOLAR": {"tagvalue": 0x0E841017, "type": "Uint32"},
+    "TAG_WB_SET_PARAM_1": {"tagvalue": 0x0E841018, "type": "Container"},
+    "TAG_WB_SET_PARAM_2": {"tagvalue": 0x0E841019, "type": "Container"},
+    "TAG_WB_RSP_PARAM_2": {"tagvalue": 0x0E84101A, "type": "Container"},
+    "TAG_WB_RSP_PARAM_1": {"tagvalue": 0x0E84101B, "type": "Container"},
+    "TAG_WB_CONNECTED_DEVICES": {"tagvalue": 0x0E84101C, "type": "Container"},
+    "TAG_WB_SET_SOC": {"tagvalue": 0x0E84101D, "type": "UChar8"},
+    "TAG_WB_STATION_AVAILABLE": {"tagvalue": 0x0E84101E, "type": "Bool"},
+    "TAG_WB_SET_STATION_AVAILABLE": {"tagvalue": 0x0E84101F, "type": "Bool"},
+    "TAG_WB_SET_PW": {"tagvalue": 0x0E841020, "type": "Container"},
+    "TAG_WB_SET_STATION_ENABLED": {"tagvalue": 0x0E841021, "type": "Bool"},
+    "TAG_WB_MAC_ADDRESS": {"tagvalue": 0x0E841022, "type": "CString"},
+    "TAG_WB_PROXIMITY_PLUG": {"tagvalue": 0x0E841023, "type": "Int32"},
+    "TAG_WB_CHARGE_FULL": {"tagvalue": 0x0E841025, "type": "Bool"},
+    "TAG_WB_SET_CHARGE_FULL": {"tagvalue": 0x0E841026, "type": "Bool"},
+    "TAG_WB_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E841027, "type": "Int32"},
+    "TAG_WB_SET_ACTIVE_CHARGE_STRATEGY": {"tagvalue": 0x0E841028, "type": "Int32"},
+    "TAG_WB_PARAMETER_LIST": {"tagvalue": 0x0E841029, "type": "Container"},
+    "TAG_WB_STATION_ENABLED": {"tagvalue": 0x0E84102A, "type": "Bool"},
+    "TAG_WB_SET_PARAMETER_LIST": {"tagvalue": 0x0E841030, "type": "None"},
+    "TAG_WB_GATEWAY": {"tagvalue": 0x0E841031, "type": "CString"},
+    "TAG_WB_SUBNET_MASK": {"tagvalue": 0x0E841032, "type": "CString"},
+    "TAG_WB_IP_ADDR": {"tagvalue": 0x0E841033, "type": "CString"},
+    "TAG_WB_DHCP_ENABLED": {"tagvalue": 0x0E841034, "type": "Bool"},
+    "TAG_WB_SET_DHCP_ENABLED": {"tagvalue": 0x0E841035, "type": "Bool"},
+    "TAG_WB_WALLBOX_TYPE": {"tagvalue": 0x0E841036, "type": "Uint32"},
+    "TAG_WB_UPDATE_NETWORK_CONFIG": {"tagvalue": 0x0E841037, "type": "Char8"},
+    "TAG_WB_SUN_MODE_ACTIVE": {"tagvalue": 0x0E841038, "type": "Bool"},
+    "TAG_WB_SET_SUN_MODE_ACTIVE": {"tagvalue": 0x0E841039, "type": "Bool"},
+    "TAG_WB_NUMBER": {"tagvalue": 0x0E84103A, "type": "Int32"},
+    "TAG_WB_NUMBER_PHASES": {"tagvalue": 0x0E84103B, "type": "UChar8"},
+    "TAG_WB_SET_NUMBER_PHASES": {"tagvalue": 0x0E84103C, "type": "UChar8"},
+    "TAG_WB_ABORT_CHARGING": {"tagvalue": 0x0E84103D, "type": "Bool"},
+    "TAG_WB_SET_ABORT_CHARGING": {"tagvalue": 0x0E84103F, "type": "Bool"},
+    "TAG_WB_SCHUKO_AVAILABLE": {"tagvalue": 0x0E841040, "type": "Bool"},
+    "TAG_WB_IS_SCHUKO_LOCKED": {"tagvalue": 0x0E841041, "type": "Bool"},
+    "TAG_WB_SET_SCHUKO_LOCKED": {"tagvalue": 0x0E841042, "type": "Bool"},
+    "TAG_WB_MAX_POWER_PER_PHASE": {"tagvalue": 0x0E841043, "type": "Int32"},
+    "TAG_WB_MIN_POWER_PER_PHASE": {"tagvalue": 0x0E841044, "type": "Int32"},
+    "TAG_WB_UPPER_CURRENT_LIMIT": {"tagvalue": 0x0E841045, "type": "Int32"},
+    "TAG_WB_LOWER_CURRENT_LIMIT": {"tagvalue": 0x0E841046, "type": "Int32"},
+    "TAG_WB_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E841047, "type": "Int32"},
+    "TAG_WB_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E841048, "type": "Int32"},
+    "TAG_WB_SET_MAX_CHARGE_CURRENT": {"tagvalue": 0x0E841049, "type": "Int32"},
+    "TAG_WB_SET_MIN_CHARGE_CURRENT": {"tagvalue": 0x0E84104A, "type": "Int32"},
+    "TAG_WB_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E84104C, "type": "Uint32"},
+    "TAG_WB_SET_CHARGE_STOP_HYSTERESIS": {"tagvalue": 0x0E84104D, "type": "Uint32"},
+    "TAG_WB_GET_KEY_LOCK_MODE": {"tagvalue": 0x0E84104E, "type": "Uint32"},
+    "TAG_WB_SET_KEY_LOCK_MODE": {"tagvalue": 0x0E84104F, "type": "Uint32"},
+    "TAG_WB_KEY_STATE": {"tagvalue": 0x0E841050, "type": "Uint32"},
+    "TAG_WB_REQ_SERIAL": {"tagvalue": 0x0E841051, "type": "None"},
+    "TAG_WB_MAX_CHARGE_POWER": {"tagvalue": 0x0E841052, "type": "Int32"},
+    "TAG_WB_MIN_CHARGE_POWER": {"tagvalue": 0x0E841053, "type": "Int32"},
+    "TAG_WB_DEVICE_STATE": {"tagvalue": 0x0E860000, "type": "Container"},
+    "TAG_WB_DEVICE_CONNECTED": {"tagvalue": 0x0E860001, "type": "Bool"},
+    "TAG_WB_DEVICE_WORKING": {"tagvalue": 0x0E860002, "type": "Bool"},
+    "TAG_WB_DEVICE_IN_SERVICE": {"tagvalue": 0x0E860003, "type": "Bool"},
+    "TAG_WB_SET_BIC_MODE": {"tagvalue": 0x0E8F0001, "type": "Bool"},
+    "TAG_WB_GET_BIC_MODE": {"tagvalue": 0x0E8F0002, "type": "UChar8"},
+    "TAG_WB_GET_CHARGE_PLAN_TEXT": {"tagvalue": 0x0E8F0003, "type": "CString"},
+    "TAG_WB_SESSION_DATA_SAVED": {"tagvalue": 0x0E8F0004, "type": "CString"},
+    "TAG_WB_SESSION_DATA_WAIT_FOR": {"tagvalue": 0x0E8F0005, "type": "UInt16"},
+    "TAG_WB_GET_LOGGEDMESSAGES": {"tagvalue": 0x0E8F0006, "type": "CString"},
+    "TAG_WB_GENERAL_ERROR": {"tagvalue": 0x0EFFFFFF, "type": "Error"},
+}
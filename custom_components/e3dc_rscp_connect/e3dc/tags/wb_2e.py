@@ -0,0 +1,94 @@
+"RSCP tags of the WB namespace, tag codes 0x2Exxxxxx."
+
+TAGS = {
+    "TAG_WB_BADGE_MGT_LC_REQ_SET_ADD_BADGE": {
+        "tagvalue": 0x2E000001,
+        "type": "Container",
+    },
+    "TAG_WB_BADGE_MGT_LC_REQ_SET_REMOVE_BADGE": {
+        "tagvalue": 0x2E000002,
+        "type": "Container",
+    },
+    "TAG_WB_BADGE_MGT_LC_REQ_GET_BADGE": {"tagvalue": 0x2E000003, "type": "Container"},
+    "TAG_WB_BADGE_MGT_LC_REQ_SET_BADGE_PARAM": {
+        "tagvalue": 0x2E000004,
+        "type": "Container",
+    },
+    "TAG_WB_BADGE_MGT_LC_REQ_GET_BADGES_COUNT": {
+        "tagvalue": 0x2E000005,
+        "type": "Container",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_TOKEN": {"tagvalue": 0x2E400001, "type": "CString"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE": {"tagvalue": 0x2E400002, "type": "Container"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_ID": {"tagvalue": 0x2E400003, "type": "CString"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_ROLE": {"tagvalue": 0x2E400004, "type": "Char8"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_EXP_DATE": {
+        "tagvalue": 0x2E400005,
+        "type": "Timestamp",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_COMMENT": {
+        "tagvalue": 0x2E400006,
+        "type": "CString",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_BLOCKED": {"tagvalue": 0x2E400007, "type": "Bool"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_MAIL": {"tagvalue": 0x2E400008, "type": "CString"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_STATUS": {"tagvalue": 0x2E400009, "type": "Uint64"},
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_BLOCKED": {
+        "tagvalue": 0x2E40000A,
+        "type": "None",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_NON_BLOCKED": {
+        "tagvalue": 0x2E40000B,
+        "type": "None",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_ROLE_EQ": {
+        "tagvalue": 0x2E40000C,
+        "type": "Char8",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_ROLE_NEQ": {
+        "tagvalue": 0x2E40000D,
+        "type": "Char8",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_BADGE_ID": {
+        "tagvalue": 0x2E40000E,
+        "type": "CString",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_COMMENT": {
+        "tagvalue": 0x2E40000F,
+        "type": "CString",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_MAIL": {
+        "tagvalue": 0x2E400010,
+        "type": "CString",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_EXP_DATE_BEFORE": {
+        "tagvalue": 0x2E400011,
+        "type": "Timestamp",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_FILTER_EXP_DATE_AFTER": {
+        "tagvalue": 0x2E400012,
+        "type": "Timestamp",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGES_COUNT": {
+        "tagvalue": 0x2E400013,
+        "type": "UInt16",
+    },
+    "TAG_WB_BADGE_MGT_LC_PARAM_BADGE_MASK_INDEX": {
+        "tagvalue": 0x2E400014,
+        "type": "UInt16",
+    },
+    "TAG_WB_BADGE_MGT_LC_SET_ADD_BADGE": {"tagvalue": 0x2E800001, "type": "Container"},
+    "TAG_WB_BADGE_MGT_LC_SET_REMOVE_BADGE": {
+        "tagvalue": 0x2E800002,
+        "type": "Container",
+    },
+    "TAG_WB_BADGE_MGT_LC_GET_BADGE": {"tagvalue": 0x2E800003, "type": "Container"},
+    "TAG_WB_BADGE_MGT_LC_SET_BADGE_PARAM": {
+        "tagvalue": 0x2E800004,
+        "type": "Container",
+    },
+    "TAG_WB_BADGE_MGT_LC_GET_BADGES_COUNT": {
+        "tagvalue": 0x2E800005,
+        "type": "Container",
+    },
+}
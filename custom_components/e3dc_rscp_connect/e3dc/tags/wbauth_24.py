@@ -0,0 +1,13 @@
+"RSCP tags of the WBAUTH namespace, tag codes 0x24xxxxxx."
+
+TAGS = {
+    "TAG_WBAUTH_REQ_VERIFY_SESSION": {"tagvalue": 0x24000000, "type": "Container"},
+    "TAG_WBAUTH_WALLBOX_ID": {"tagvalue": 0x24400001, "type": "CString"},
+    "TAG_WBAUTH_SESSION_ID": {"tagvalue": 0x24400002, "type": "CString"},
+    "TAG_WBAUTH_VERIFICATION_ENTRY": {"tagvalue": 0x24400003, "type": "Container"},
+    "TAG_WBAUTH_ENTRY_TYPE": {"tagvalue": 0x24400004, "type": "UChar8"},
+    "TAG_WBAUTH_ENTRY_DATA": {"tagvalue": 0x24400005, "type": "CString"},
+    "TAG_WBAUTH_VERIFICATION_RESULT": {"tagvalue": 0x24400006, "type": "Char8"},
+    "TAG_WBAUTH_ENTRY_SWAPPED": {"tagvalue": 0x24400007, "type": "Bool"},
+    "TAG_WBAUTH_VERIFY_SESSION": {"tagvalue": 0x24800000, "type": "Container"},
+}
@@ -0,0 +1,14 @@
+"RSCP tags of the WBD namespace, tag codes 0x20xxxxxx."
+
+TAGS = {
+    "TAG_WBD_REQ_START_SCAN": {"tagvalue": 0x20000001, "type": "None"},
+    "TAG_WBD_REQ_IS_SCANNING": {"tagvalue": 0x20000002, "type": "None"},
+    "TAG_WBD_REQ_CREATE_WB": {"tagvalue": 0x20000003, "type": "CString"},
+    "TAG_WBD_REQ_CANCEL_SCAN": {"tagvalue": 0x20000004, "type": "None"},
+    "TAG_WBD_REQ_DELETE_WALLBOX": {"tagvalue": 0x20000005, "type": "Uint32"},
+    "TAG_WBD_START_SCAN": {"tagvalue": 0x20800001, "type": "Bool"},
+    "TAG_WBD_IS_SCANNING": {"tagvalue": 0x20800002, "type": "Bool"},
+    "TAG_WBD_CREATE_WB": {"tagvalue": 0x20800003, "type": "Uint32"},
+    "TAG_WBD_CANCEL_CAN": {"tagvalue": 0x20800004, "type": "None"},
+    "TAG_WBD_DELETE_WALL_BOX": {"tagvalue": 0x20800005, "type": "Uint32"},
+}
@@ -5,6 +5,7 @@ from .device_state_sensor import DeviceStateSensor
 from .device_update_state_sensor import DeviceUpdateStateSensor
 from .emergency_power_sensor import EmergencyPowerSensor
 from .energy_sensor import EnergySensor
+from .poll_interval_sensor import PollIntervalSensor
 from .power_sensor import PowerSensor
 from .sg_ready_sensor import SGReadySensor
 from .state_of_charge_sensor import StateOfChargeSensor
@@ -17,6 +18,7 @@ __all__ = [
     "DeviceUpdateStateSensor",
     "EmergencyPowerSensor",
     "EnergySensor",
+    "PollIntervalSensor",
     "PowerSensor",
     "SGReadySensor",
     "StateOfChargeSensor",
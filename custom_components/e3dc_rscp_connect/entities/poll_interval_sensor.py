@@ -0,0 +1,38 @@
+"""Implements the diagnostic sensor of the adaptive update interval."""
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.const import EntityCategory, UnitOfTime
+
+from ..coordinator import E3dcRscpCoordinator  # noqa: TID252
+from .entity import E3dcConnectEntity
+
+
+class PollIntervalSensor(E3dcConnectEntity, SensorEntity):
+    """This sensor shows the update interval chosen by the coordinator."""
+
+    def __init__(self, coordinator: E3dcRscpCoordinator, entry) -> None:
+        "Init the sensor."
+        super().__init__(coordinator, entry)
+
+        self._attr_name = "Poll Interval"
+        serial = coordinator.storage.serial.lower().replace("-", "_")
+        self._attr_unique_id = f"{serial}_poll_interval"
+
+        self._attr_native_unit_of_measurement = UnitOfTime.SECONDS
+        self._attr_device_class = SensorDeviceClass.DURATION
+        self._attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    @property
+    def native_value(self):
+        "Get the data."
+        return self.coordinator.update_interval.total_seconds()
+
+    @property
+    def extra_state_attributes(self):
+        "The bounds of the interval and the change of the last poll."
+        poll_interval = self.coordinator.poll_interval
+        return {
+            "minimum": poll_interval.minimum,
+            "maximum": poll_interval.maximum,
+            "change": round(poll_interval.change, 2),
+        }
@@ -60,6 +60,3 @@ class SunModeSensor(SelectEntity, E3dcConnectEntity):
             await self.coordinator.set_sun_mode(self._sub_device_index, True)
         elif option == "Mischmodus":
             await self.coordinator.set_sun_mode(self._sub_device_index, False)
-
-        # refresh data after sending
-        await self.coordinator.async_request_refresh()
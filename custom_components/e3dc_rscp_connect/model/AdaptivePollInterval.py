@@ -0,0 +1,78 @@
+"This file contains the AdaptivePollInterval, which chooses the poll interval from the changes of the polled data."
+
+from __future__ import annotations
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+class AdaptivePollInterval:
+    """Chooses the poll interval from the changes between two polls.
+
+    After each poll a snapshot of the watched values is passed to update. Numbers
+    change when they differ by at least their threshold, other values when they are
+    not equal. The change is the largest difference relative to its threshold, a
+    changed state counts as 1.
+
+    A change of 1 or more is a transient, the interval drops to the minimum at once.
+    After steady_polls polls without such a change, the interval grows by growth up
+    to the maximum.
+    """
+
+    def __init__(
+        self,
+        interval: float,
+        minimum: float,
+        maximum: float,
+        thresholds: dict[str, float] | None = None,
+        default_threshold: float = 100,
+        steady_polls: int = 3,
+        growth: float = 1.5,
+    ) -> None:
+        "Inits the poll interval in seconds, the interval is kept within minimum and maximum."
+        if minimum <= 0 or maximum < minimum:
+            raise ValueError(f"Invalid poll interval bounds: {minimum} - {maximum}")
+        self.minimum = minimum
+        self.maximum = maximum
+        self.interval = min(max(interval, minimum), maximum)
+        self.thresholds = thresholds or {}
+        self.default_threshold = default_threshold
+        self.steady_polls = steady_polls
+        self.growth = growth
+        self.change = 0.0
+        self.__steady = 0
+        self.__snapshot = None
+
+    def update(self, snapshot: dict) -> float:
+        "Compares snapshot with the former snapshot and returns the new interval."
+        self.change = self.__change(self.__snapshot, snapshot)
+        self.__snapshot = snapshot
+
+        if self.change >= 1:
+            self.__steady = 0
+            self.interval = self.minimum
+        else:
+            self.__steady += 1
+            if self.__steady >= self.steady_polls:
+                self.__steady = 0
+                self.interval = min(self.interval * self.growth, self.maximum)
+        return self.interval
+
+    def __change(self, former: dict | None, snapshot: dict) -> float:
+        if former is None:
+            return 0.0
+
+        change = 0.0
+        for key in former.keys() | snapshot.keys():
+            old = former.get(key)
+            new = snapshot.get(key)
+            if old == new:
+                continue
+            if _is_number(old) and _is_number(new):
+                threshold = self.thresholds.get(key, self.default_threshold)
+                change = max(change, abs(new - old) / threshold)
+            else:
+                # a changed state or a value which appeared or disappeared
+                change = max(change, 1.0)
+        return change
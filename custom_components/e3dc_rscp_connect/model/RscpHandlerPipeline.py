@@ -2,41 +2,282 @@
 
 import logging  # noqa: I001
 from .RscpModelInterface import RscpModelInterface
+from ..e3dc import RscpTags  # noqa: TID252
+from ..e3dc.RscpFrame import RscpFrame  # noqa: TID252
 from ..e3dc.RscpValue import RscpValue  # noqa: TID252
 
 _LOGGER = logging.getLogger(__name__)
 
 
+class _IndexedRoute:
+    "Routes containers of one tag by the value of their index child."
+
+    def __init__(self, index_tag: str):
+        self.index_tag = index_tag
+        self.handlers = {}
+
+    def get_handlers(self, container: RscpValue) -> list:
+        index = container.get_child(self.index_tag)
+        if index is None:
+            # let the handlers report the missing index
+            return [x for handlers in self.handlers.values() for x in handlers]
+        return self.handlers.get(index.getValue(), [])
+
+
+def _route_codes(route: str | int) -> list[int]:
+    "Returns the tag codes of a tag code, a tag name or a namespace like TAG_EMS_*."
+    if isinstance(route, int):
+        if RscpTags.getTagByCode(route) is None:
+            raise ValueError(f"Unknown tag in route: 0x{route:08X}")
+        return [route]
+
+    if route.endswith("*"):
+        tags = RscpTags.getTagsByPrefix(route[:-1])
+        return [description["tagvalue"] for description in tags.values()]
+
+    tag = RscpTags.getTagByName(route)
+    if tag is None:
+        raise ValueError(f"Unknown tag in route: {route}")
+    return [tag[1]["tagvalue"]]
+
+
+POLL_FAST = "fast"
+POLL_NORMAL = "normal"
+POLL_SLOW = "slow"
+
+# poll group -> function of the handler which returns the tags of the group
+_POLL_GROUPS = {
+    POLL_FAST: "get_rscp_tags_fast",
+    POLL_NORMAL: "get_rscp_tags",
+    POLL_SLOW: "get_rscp_tags_slow",
+}
+
+# poll group -> period in poll cycles
+DEFAULT_POLL_PERIODS = {POLL_FAST: 1, POLL_NORMAL: 3, POLL_SLOW: 30}
+
+
 class RscpHandlerPipeline:
-    def __init__(self):
+    def __init__(self, poll_periods: dict[str, int] | None = None):
         self._handlers = []
+        # tag code -> handlers or _IndexedRoute
+        self._routes = {}
+        # handlers without routes, they get offered all values not handled by a route
+        self._unrouted = []
+        # handler -> (tags revision, {poll group: packed tags})
+        self._request_cache = {}
+        # due (handler, poll group) keys -> packed frame
+        self._request_frames = {}
+        self._poll_periods = dict(DEFAULT_POLL_PERIODS)
+        self._poll_cycle = 0
+        # (handler, poll group) -> poll cycle when the group is due next
+        self._next_poll = {}
+        # (handler, poll group) -> former next poll cycle of the groups in the last
+        # collected frame, see poll_failed
+        self._last_polls = {}
+        if poll_periods is not None:
+            self.set_poll_periods(poll_periods)
+
+    @property
+    def poll_periods(self) -> dict[str, int]:
+        "The period of each poll group in poll cycles."
+        return dict(self._poll_periods)
+
+    def set_poll_periods(self, poll_periods: dict[str, int]) -> None:
+        """Changes the periods of the poll groups, a period is given in poll cycles.
+
+        Groups which are not in poll_periods keep their period. Each group is due
+        again one period after it was polled last. The cycles until the pending polls
+        are scaled to the new periods, so a group keeps the time until its next poll
+        when the poll interval changes together with the periods.
+        """
+        for group, period in poll_periods.items():
+            if group not in _POLL_GROUPS:
+                raise ValueError(f"Unknown poll group: {group}")
+            if period < 1:
+                raise ValueError(f"Invalid period for poll group {group}: {period}")
+
+        former_periods = self._poll_periods
+        self._poll_periods = {**former_periods, **poll_periods}
+        for key, next_poll in self._next_poll.items():
+            former, period = former_periods[key[1]], self._poll_periods[key[1]]
+            if former != period:
+                remaining = max(0, next_poll - self._poll_cycle)
+                self._next_poll[key] = self._poll_cycle + min(
+                    period, round(remaining * period / former)
+                )
 
     def add_handler(self, handler: RscpModelInterface):
         self._handlers.append(handler)
 
+        routes = handler.get_rscp_routes()
+        if routes is None:
+            self._unrouted.append(handler)
+            return
+
+        for route in routes:
+            if isinstance(route, tuple):
+                tag_name, index_tag, index = route
+                (tag_code,) = _route_codes(tag_name)
+                indexed = self._routes.setdefault(tag_code, _IndexedRoute(index_tag))
+                if not isinstance(indexed, _IndexedRoute):
+                    raise ValueError(f"{tag_name} is already routed without index")
+                indexed.handlers.setdefault(index, []).append(handler)
+                continue
+
+            for tag_code in _route_codes(route):
+                handlers = self._routes.setdefault(tag_code, [])
+                if isinstance(handlers, _IndexedRoute):
+                    raise ValueError(f"{route} is already routed by index")
+                handlers.append(handler)
+
+    def remove_handler(self, handler: RscpModelInterface):
+        """Removes a handler, it gets no values and polls no tags anymore."""
+        self._handlers.remove(handler)
+        self._unrouted = [x for x in self._unrouted if x is not handler]
+
+        for tag_code, route in list(self._routes.items()):
+            if isinstance(route, _IndexedRoute):
+                for index, handlers in list(route.handlers.items()):
+                    handlers = [x for x in handlers if x is not handler]
+                    if handlers:
+                        route.handlers[index] = handlers
+                    else:
+                        del route.handlers[index]
+                if not route.handlers:
+                    del self._routes[tag_code]
+                continue
+
+            handlers = [x for x in route if x is not handler]
+            if handlers:
+                self._routes[tag_code] = handlers
+            else:
+                del self._routes[tag_code]
+
+        self._request_cache.pop(handler, None)
+        for group in _POLL_GROUPS:
+            self._next_poll.pop((handler, group), None)
+            self._last_polls.pop((handler, group), None)
+        self._request_frames.clear()
+
     async def process(self, values):
-        """Process a list of RSCP values."""
+        """Process a list of RSCP values.
+
+        Each value is passed to the handlers routed for its tag code, values without a
+        route or not handled by the routed handlers are offered to the handlers without
+        routes.
+        """
         if values is None:
             _LOGGER.warning("Values is None, no data to process!")
             return
 
+        routes = self._routes
         for value in values:
             handled = False
 
-            for handler in self._handlers:
-                if handler.handle_rscp_data(value):
-                    handled = True
-                    break
+            route = routes.get(value.getTagCode())
+            if route is not None:
+                if isinstance(route, _IndexedRoute):
+                    route = route.get_handlers(value)
+                for handler in route:
+                    if handler.handle_rscp_data(value):
+                        handled = True
+                        break
+
+            if not handled:
+                for handler in self._unrouted:
+                    if handler.handle_rscp_data(value):
+                        handled = True
+                        break
 
             if not handled:
                 _LOGGER.warning("Unhandled RSCP tag: %s", value.getTagName())
 
     async def collect_tags(self) -> list[RscpValue]:
-        """Collect rscp tags from all registered handlers."""
+        """Collect the rscp tags of all poll groups from all registered handlers."""
 
         all_tags = []
         for handler in self._handlers:
-            tags = handler.get_rscp_tags()
-            all_tags.extend(tags)
+            for function in _POLL_GROUPS.values():
+                all_tags.extend(getattr(handler, function)())
 
         return all_tags
+
+    async def collect_frame(self, commands: list[RscpValue] | None = None) -> bytes:
+        """Returns a packed request frame with the rscp tags which are due in this cycle.
+
+        Each call is one poll cycle. A poll group of a handler is due in the first
+        cycle after the handler has been added and then every period of the group.
+        The packed tags of each handler are cached and only rebuilt when the handler
+        reports a new tags revision. If the same tags are due as in a former cycle,
+        only the time of the frame is updated.
+
+        commands are sent in front of the tags of the handlers, they are not cached.
+        If the frame isn't answered, poll_failed has to be called.
+        """
+        for handler in self._handlers:
+            revision = handler.get_rscp_tags_revision()
+            cached = self._request_cache.get(handler)
+            if cached is None or cached[0] != revision:
+                groups = {}
+                for group, function in _POLL_GROUPS.items():
+                    data = bytearray()
+                    for tag in getattr(handler, function)():
+                        tag.pack_into(data)
+                    groups[group] = bytes(data)
+                self._request_cache[handler] = (revision, groups)
+                self._request_frames.clear()
+
+        due = self.__due_groups()
+        if commands:
+            data = bytearray()
+            for command in commands:
+                command.pack_into(data)
+            for handler, group in due:
+                data += self._request_cache[handler][1][group]
+            return bytes(RscpFrame.packFrameData(bytes(data)))
+
+        frame = self._request_frames.get(due)
+        if frame is None:
+            _LOGGER.debug("Rebuilding request frame for %d poll groups", len(due))
+            frame = RscpFrame.packFrameData(
+                b"".join(
+                    self._request_cache[handler][1][group] for handler, group in due
+                )
+            )
+            self._request_frames[due] = frame
+        else:
+            RscpFrame.updateFrameTime(frame)
+
+        return bytes(frame)
+
+    def __due_groups(self) -> tuple:
+        "Returns the (handler, poll group) keys with tags which are due, starts the next cycle."
+        cycle = self._poll_cycle
+        self._poll_cycle += 1
+
+        due = []
+        self._last_polls = {}
+        for handler in self._handlers:
+            groups = self._request_cache[handler][1]
+            for group in _POLL_GROUPS:
+                if not groups[group]:
+                    continue
+                key = (handler, group)
+                next_poll = self._next_poll.get(key)
+                if next_poll is None or next_poll <= cycle:
+                    self._last_polls[key] = next_poll
+                    self._next_poll[key] = cycle + self._poll_periods[group]
+                    due.append(key)
+        return tuple(due)
+
+    def poll_failed(self) -> None:
+        """Reschedules the poll groups of the last collected frame, if it wasn't answered.
+
+        The groups are due again in the next cycle instead of one period later.
+        """
+        for key, next_poll in self._last_polls.items():
+            if next_poll is None:
+                self._next_poll.pop(key, None)
+            else:
+                self._next_poll[key] = next_poll
+        self._last_polls = {}
@@ -29,17 +29,49 @@ class RscpModelInterface(ABC):
         """Returns all tags used to get informations from device!
 
         The client will call this funciton to get the tags, send them out and passes the
-        answer into handle_rscp_data where it is extracted.
+        answer into handle_rscp_data where it is extracted. The tags are sent with the
+        normal period of the pipeline.
         """
 
+    def get_rscp_tags_fast(self) -> list[RscpValue]:
+        """This function is equivalent to the get_rscp_tags.
+
+        The tags returned in this function represent fast changing data, like powers.
+        They are sent with the fast period of the pipeline, by default in every poll.
+        """
+        return []
+
+    def get_rscp_tags_revision(self) -> int:
+        """Returns a number which changes whenever a get_rscp_tags* function would return other tags.
+
+        The pipeline packs the tags of all get_rscp_tags* functions once and reuses them
+        until the revision changes. It is read before the functions are called.
+        """
+        return 0
+
     @abstractmethod
     def get_rscp_tags_slow(self) -> list[RscpValue]:
         """This function is equivalent to the get_rscp_tags.
 
         The slightly different focus is, that the tags returned in this function
         represents slow changing data! The client will use this function only from time
-        to time.
+        to time, with the slow period of the pipeline.
+        """
+
+    def get_rscp_routes(self) -> list[str | int | tuple] | None:
+        """Returns the received tags which shall be passed to handle_rscp_data.
+
+        A route is one of:
+        - a tag code or name, e.g. RscpTagCodes.TAG_PVI_DATA or "TAG_PVI_DATA"
+        - a namespace as tag name prefix with a trailing "*", e.g. "TAG_EMS_*"
+        - a container with a given index child as (tag, index tag, index),
+          e.g. (RscpTagCodes.TAG_WB_DATA, RscpTagCodes.TAG_WB_INDEX, 0)
+
+        None (the default) means, that the handler gets offered all values which are not
+        handled by a routed handler. The routes are read when the handler is added to
+        the pipeline.
         """
+        return None
 
     @abstractmethod
     def handle_rscp_data(self, container: RscpValue) -> bool:
@@ -2,6 +2,7 @@
 
 import logging
 
+from ..e3dc import RscpTagCodes  # noqa: TID252
 from ..e3dc.RscpValue import RscpValue  # noqa: TID252
 from .RscpModelInterface import RscpModelInterface
 from .SgReadyDataModel import SgReadyDataModel
@@ -33,10 +34,10 @@ class SgReadyRscpModel(RscpModelInterface):
     def identify(container: RscpValue) -> RscpModelInterface | None:
         """Identify if rscp client speaks SGR namespace."""
 
-        if container.getTagName() != "TAG_SGR_DATA":
+        if container.getTagCode() != RscpTagCodes.TAG_SGR_DATA:
             return None
 
-        sgr_index = container.get_child("TAG_SGR_INDEX")
+        sgr_index = container.get_child(RscpTagCodes.TAG_SGR_INDEX)
 
         if sgr_index.getValue() == 0xFF:
             model = SgReadyRscpModel()
@@ -58,16 +59,20 @@ class SgReadyRscpModel(RscpModelInterface):
         """
         return []
 
+    def get_rscp_routes(self) -> list[int]:
+        """Returns the received tags which shall be passed to handle_rscp_data."""
+        return [RscpTagCodes.TAG_SGR_DATA]
+
     def handle_rscp_data(self, container: RscpValue) -> bool:
         """This function is used to retrieve data from a rscp tag!"""
-        if container.getTagName() != "TAG_SGR_DATA":
+        if container.getTagCode() != RscpTagCodes.TAG_SGR_DATA:
             return False
 
-        sgr_index = container.get_child("TAG_SGR_INDEX")
+        sgr_index = container.get_child(RscpTagCodes.TAG_SGR_INDEX)
         # we need the overall SG Ready state and this is coded inside
         # index = 0xff:
         if sgr_index.getValue() == 0xFF:
-            state = container.get_child("TAG_SGR_STATE")
+            state = container.get_child(RscpTagCodes.TAG_SGR_STATE)
             self.__model.state = state.getValue() if state is not None else None
             return True
         return False
@@ -2,12 +2,17 @@
 
 import logging
 
+from ..e3dc import RscpTagCodes  # noqa: TID252
 from ..e3dc.RscpValue import RscpValue  # noqa: TID252
 from .RscpModelInterface import RscpModelInterface
 from .StorageDataModel import PvInverterData, StorageDataModel, DeviceState
 
 logger = logging.getLogger(__name__)
 
+# indexes which are probed for inverters and batteries
+INVERTER_INDEXES = range(7)
+BATTERY_INDEXES = range(2)
+
 
 class StorageRscpModel(RscpModelInterface):
     """The implemetation of the class to communicate with a storage system."""
@@ -26,7 +31,10 @@ class StorageRscpModel(RscpModelInterface):
             mac_addr=mac_addr,
             sw_version=sw_version,
         )
-        self.__pvi_identified = False
+        # indexes which are polled until the device answers, if they exist
+        self.__probe_inverters = set(INVERTER_INDEXES)
+        self.__probe_batteries = set(BATTERY_INDEXES)
+        self.__tags_revision = 0
 
     def get_model(self):
         "Returns the model data."
@@ -58,6 +66,39 @@ class StorageRscpModel(RscpModelInterface):
 
         return requests
 
+    @staticmethod
+    def get_verification_tags() -> list[RscpValue]:
+        """Returns the tags to verify the identity of a known storage, see verify."""
+        return [
+            RscpValue().withTagName("TAG_INFO_REQ_SERIAL_NUMBER", None),
+            RscpValue().withTagName("TAG_INFO_REQ_SW_RELEASE", None),
+        ]
+
+    def verify(self, value: RscpValue) -> bool:
+        """Checks a reply to the verification tags.
+
+        Returns False if the serial number belongs to another storage, a new software
+        release is taken over.
+        """
+        if value.isError:
+            return True
+        if value.getTagCode() == RscpTagCodes.TAG_INFO_SERIAL_NUMBER:
+            return value.getValue() == self.__model.serial
+        if value.getTagCode() == RscpTagCodes.TAG_INFO_SW_RELEASE:
+            self.__model.sw_version = value.getValue()
+        return True
+
+    def probe_devices(self) -> None:
+        """Probes the inverter and battery indexes which are not known with the next polls.
+
+        The probe of an index is repeated until the device answers it.
+        """
+        self.__probe_inverters = set(INVERTER_INDEXES) - self.__model.inverters.keys()
+        self.__probe_batteries = (
+            set(BATTERY_INDEXES) - self.__model.device_states.battery.keys()
+        )
+        self.__tags_revision += 1
+
     @staticmethod
     def identify(container: RscpValue) -> RscpModelInterface | None:
         """This function is used to identify a device with the passed data.
@@ -65,16 +106,16 @@ class StorageRscpModel(RscpModelInterface):
         If the identification was successful, the function returns an object
         of the implementing class. If not None is returned.
         """
-        if container.getTagName() == "TAG_INFO_SERIAL_NUMBER":
+        if container.getTagCode() == RscpTagCodes.TAG_INFO_SERIAL_NUMBER:
             StorageRscpModel.ident_serial = container.getValue()
 
-        elif container.getTagName() == "TAG_INFO_ASSEMBLY_SERIAL_NUMBER":
+        elif container.getTagCode() == RscpTagCodes.TAG_INFO_ASSEMBLY_SERIAL_NUMBER:
             StorageRscpModel.ident_assembly_serial = container.getValue()
 
-        elif container.getTagName() == "TAG_INFO_MAC_ADDRESS":
+        elif container.getTagCode() == RscpTagCodes.TAG_INFO_MAC_ADDRESS:
             StorageRscpModel.ident_mac_addr = container.getValue()
 
-        elif container.getTagName() == "TAG_INFO_SW_RELEASE":
+        elif container.getTagCode() == RscpTagCodes.TAG_INFO_SW_RELEASE:
             StorageRscpModel.ident_sw_version = container.getValue()
         else:
             return None
@@ -94,30 +135,26 @@ class StorageRscpModel(RscpModelInterface):
             )
         return None
 
-    def __get_ident_tags_for_pvi(self):
-        _list = []
-        for index in range(7):
-            _list.extend(self.__create_rscp_tags_for_inverter(index))
-        return _list
-
     def get_rscp_tags(self) -> list[RscpValue]:
         """Returns all tags used to get informations from device!
 
         The client will call this funciton to get the tags, send them out and passes the
         answer into handle_rscp_data where it is extracted.
         """
-        tags = []
-
-        tags.extend(self.__create_rscp_tags_for_ems())
-        if not self.__pvi_identified:
-            tags.extend(self.__get_ident_tags_for_pvi())
-            self.__pvi_identified = True
-        else:
-            for x in self.__model.inverters:
-                tags.extend(self.__create_rscp_tags_for_inverter(x))
-        tags.extend(self.__get_rscp_tags_for_battery())
+        return [RscpValue().withTagName("TAG_EMS_REQ_EMERGENCY_POWER_STATUS", None)]
+
+    def get_rscp_tags_fast(self) -> list[RscpValue]:
+        """Returns the tags of the powers, the SOC and the inverter DC powers."""
+        tags = self.__create_rscp_tags_for_ems()
+        tags.append(RscpValue().withTagName("TAG_EMS_REQ_BAT_SOC", None))
+        for index in sorted(self.__model.inverters.keys() | self.__probe_inverters):
+            tags.extend(self.__create_rscp_tags_for_inverter(index))
         return tags
 
+    def get_rscp_tags_revision(self) -> int:
+        """Changes whenever a probed inverter or battery index has been answered."""
+        return self.__tags_revision
+
     def get_rscp_tags_slow(self) -> list[RscpValue]:
         """This function is equivalent to the get_rscp_tags.
 
@@ -125,7 +162,11 @@ class StorageRscpModel(RscpModelInterface):
         represents slow changing data! The client will use this function only from time
         to time.
         """
-        return []
+        return self.__get_rscp_tags_for_battery()
+
+    def get_rscp_routes(self) -> list[str | int]:
+        """Returns the received tags which shall be passed to handle_rscp_data."""
+        return ["TAG_EMS_*", RscpTagCodes.TAG_PVI_DATA, RscpTagCodes.TAG_BAT_DATA]
 
     def handle_rscp_data(self, container: RscpValue) -> bool:
         """This function is used to retrieve data from a rscp tag!
@@ -134,13 +175,12 @@ class StorageRscpModel(RscpModelInterface):
         processed. If the data is not interesting for the implementing class,
         False should be returned.
         """
-        if container.getTagName().startswith("TAG_EMS_"):
-            return self.__handle_rcsp_tags_for_ems(container)
-        if container.getTagName() == "TAG_PVI_DATA":
+        tag_code = container.getTagCode()
+        if tag_code == RscpTagCodes.TAG_PVI_DATA:
             return self.__hanlde_rscp_tags_for_pvi(container)
-        if container.getTagName() == "TAG_BAT_DATA":
+        if tag_code == RscpTagCodes.TAG_BAT_DATA:
             return self.__handle_rscp_tags_for_battery(container)
-        return False
+        return self.__handle_rcsp_tags_for_ems(container)
 
     def __create_rscp_tags_for_ems(self):
         requests = []
@@ -151,44 +191,32 @@ class StorageRscpModel(RscpModelInterface):
         requests.append(RscpValue().withTagName("TAG_EMS_REQ_POWER_ADD", None))
         requests.append(RscpValue().withTagName("TAG_EMS_REQ_POWER_WB_ALL", None))
         requests.append(RscpValue().withTagName("TAG_EMS_REQ_POWER_WB_SOLAR", None))
-        requests.append(RscpValue().withTagName("TAG_EMS_REQ_BAT_SOC", None))
-        requests.append(
-            RscpValue().withTagName("TAG_EMS_REQ_EMERGENCY_POWER_STATUS", None)
-        )
         return requests
 
+    # EMS tag -> (attribute path in StorageDataModel, attribute name)
+    __ems_attributes = {
+        RscpTagCodes.TAG_EMS_BAT_SOC: ("", "bat_soc"),
+        RscpTagCodes.TAG_EMS_POWER_HOME: ("powers", "home"),
+        RscpTagCodes.TAG_EMS_POWER_BAT: ("powers", "battery"),
+        RscpTagCodes.TAG_EMS_POWER_GRID: ("powers", "grid"),
+        RscpTagCodes.TAG_EMS_POWER_PV: ("powers", "pv"),
+        RscpTagCodes.TAG_EMS_POWER_ADD: ("powers", "additional"),
+        RscpTagCodes.TAG_EMS_POWER_WB_ALL: ("powers", "wallbox"),
+        RscpTagCodes.TAG_EMS_POWER_WB_SOLAR: ("powers", "wallbox_pv"),
+        RscpTagCodes.TAG_EMS_EMERGENCY_POWER_STATUS: ("", "emergency_power_state"),
+    }
+
     def __handle_rcsp_tags_for_ems(self, value: RscpValue):
-        if value.getTagName() == "TAG_EMS_BAT_SOC":
-            self.__model.bat_soc = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_HOME":
-            self.__model.powers.home = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_BAT":
-            self.__model.powers.battery = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_GRID":
-            self.__model.powers.grid = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_PV":
-            self.__model.powers.pv = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_ADD":
-            self.__model.powers.additional = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_WB_ALL":
-            self.__model.powers.wallbox = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_POWER_WB_SOLAR":
-            self.__model.powers.wallbox_pv = value.getValue()
-            return True
-        if value.getTagName() == "TAG_EMS_EMERGENCY_POWER_STATUS":
-            self.__model.emergency_power_state = value.getValue()
-            return True
+        attribute = StorageRscpModel.__ems_attributes.get(value.getTagCode())
+        if attribute is None:
+            # _LOGGER.warning("Received unknown EMS tag: %s", value.getTagName())
+            return False
 
-        return False
-        # else:
-        #    _LOGGER.warning("Received unknown EMS tag: %s", value.getTagName())
+        path, name = attribute
+        target = getattr(self.__model, path) if path else self.__model
+        # an error clears the value, so a stale value isn't reported as current
+        setattr(target, name, None if value.isError else value.getValue())
+        return True
 
     def __create_rscp_tags_for_inverter(self, index: int) -> list[RscpValue]:
         return [
@@ -210,11 +238,11 @@ class StorageRscpModel(RscpModelInterface):
         ]
 
     def __hanlde_rscp_tags_for_pvi(self, container: RscpValue) -> bool:
-        pvi_index = container.get_child("TAG_PVI_INDEX")
+        pvi_index = container.get_child(RscpTagCodes.TAG_PVI_INDEX)
         if pvi_index is None:
             # check if we ever run into this area!!
 
-            value = container.get_child("TAG_PVI_REQ_INDEX")
+            value = container.get_child(RscpTagCodes.TAG_PVI_REQ_INDEX)
             if value is not None:
                 logger.critical(
                     "No TAG_PVI_REQ_INDEX in container, errorcode: %d", value.getValue()
@@ -222,14 +250,20 @@ class StorageRscpModel(RscpModelInterface):
             return False
 
         pvi_index = pvi_index.getValue()
+        if pvi_index in self.__probe_inverters:
+            self.__probe_inverters.discard(pvi_index)
+            self.__tags_revision += 1
 
-        error = container.get_child("TAG_PVI_REQ_DATA")
+        error = container.get_child(RscpTagCodes.TAG_PVI_REQ_DATA)
         if error is not None:
             logger.warning(
                 "No data for inverter: %d, errorcode: %d",
                 pvi_index,
                 error.getValue(),
             )
+            inverter = self.__model.inverters.get(pvi_index)
+            if inverter is not None:
+                inverter.power_mppt = dict.fromkeys(inverter.power_mppt)
             # even if we detected an error, means we handled this tag ;)
             return True
 
@@ -241,42 +275,38 @@ class StorageRscpModel(RscpModelInterface):
             self.__model.inverters[pvi_index] = inverter
             logger.warning("Added inverter on index %d to storage", pvi_index)
 
-        dc_power_tags = container.get_childs("TAG_PVI_DC_POWER")
+        dc_power_tags = container.get_childs(RscpTagCodes.TAG_PVI_DC_POWER)
         for tag in dc_power_tags:
-            mppt_index = tag.get_child("TAG_PVI_INDEX")
+            mppt_index = tag.get_child(RscpTagCodes.TAG_PVI_INDEX)
             if mppt_index is not None:
                 mppt_index = mppt_index.getValue()
-                power_value = tag.get_child("TAG_PVI_VALUE")
+                power_value = tag.get_child(RscpTagCodes.TAG_PVI_VALUE)
                 inverter.power_mppt[mppt_index] = (
-                    power_value.getValue() if power_value is not None else None
+                    power_value.getValue()
+                    if power_value is not None and not power_value.isError
+                    else None
                 )
 
         return True
 
     def __get_rscp_tags_for_battery(self) -> list[RscpValue]:
-        value = RscpValue.construct_rscp_value(
-            "TAG_BAT_REQ_DATA",
-            [
-                ("TAG_BAT_INDEX", 0),
-                ("TAG_BAT_REQ_DEVICE_STATE", None),
-            ],
-        )
+        indexes = self.__model.device_states.battery.keys() | self.__probe_batteries
         return [
-            value,
             RscpValue.construct_rscp_value(
                 "TAG_BAT_REQ_DATA",
                 [
-                    ("TAG_BAT_INDEX", 1),
+                    ("TAG_BAT_INDEX", index),
                     ("TAG_BAT_REQ_DEVICE_STATE", None),
                 ],
-            ),
+            )
+            for index in sorted(indexes)
         ]
 
     def __handle_rscp_tags_for_battery(self, container: RscpValue) -> bool:
         """hanlde all the rscp tags for the battery."""
 
-        if container.getTagName() == "TAG_BAT_DATA":
-            index = container.get_child("TAG_BAT_INDEX")
+        if container.getTagCode() == RscpTagCodes.TAG_BAT_DATA:
+            index = container.get_child(RscpTagCodes.TAG_BAT_INDEX)
 
             if index is None:
                 return False
@@ -286,15 +316,28 @@ class StorageRscpModel(RscpModelInterface):
                 logger.warning("no index found in TAG_BAT_DATA, can't handle data")
                 return False
 
-            states = container.get_child("TAG_BAT_DEVICE_STATE")
+            if index in self.__probe_batteries:
+                self.__probe_batteries.discard(index)
+                self.__tags_revision += 1
+
+            error = container.get_child(RscpTagCodes.TAG_BAT_REQ_DATA)
+            if error is not None:
+                logger.debug(
+                    "No data for battery: %d, errorcode: %d", index, error.getValue()
+                )
+                if index in self.__model.device_states.battery:
+                    self.__model.device_states.battery[index] = DeviceState()
+                return True
+
+            states = container.get_child(RscpTagCodes.TAG_BAT_DEVICE_STATE)
             if states is None:
                 logger.warning(
                     "no TAG_BAT_DEVICE_STATE found for bat %d",
                     index,
                 )
                 return False
-            connected = states.get_child("TAG_BAT_DEVICE_CONNECTED")
-            working = states.get_child("TAG_BAT_DEVICE_WORKING")
+            connected = states.get_child(RscpTagCodes.TAG_BAT_DEVICE_CONNECTED)
+            working = states.get_child(RscpTagCodes.TAG_BAT_DEVICE_WORKING)
 
             if connected is None or working is None:
                 logger.warning(
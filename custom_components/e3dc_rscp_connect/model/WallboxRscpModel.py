@@ -1,13 +1,23 @@
 "This file contains WallboxRscpModel. A class to communicate with the wallboxes through RSCP over an storage system."
 
+from collections.abc import Iterable
 import logging
 
+from ..e3dc import RscpTagCodes  # noqa: TID252
 from ..e3dc.RscpValue import RscpValue  # noqa: TID252
 from .RscpModelInterface import RscpModelInterface
 from .WallboxDataModel import WallboxDataModel
 
 logger = logging.getLogger(__name__)
 
+# tags of the replies to the normal and slow poll groups and to commands
+_OTHER_REPLY_TAGS = {
+    RscpTagCodes.TAG_WB_ACTIVE_CHARGE_STRATEGY,
+    RscpTagCodes.TAG_WB_DEVICE_STATE,
+    RscpTagCodes.TAG_WB_PARAMETER_LIST,
+    RscpTagCodes.TAG_WB_SET_SUN_MODE_ACTIVE,
+}
+
 
 class WallboxRscpModel(RscpModelInterface):
     "This class represents the RSCP communication with a wallbox and stores the data in a WallboxDataModel."
@@ -35,8 +45,8 @@ class WallboxRscpModel(RscpModelInterface):
         return self.__index
 
     @staticmethod
-    def get_identification_tags() -> list[RscpValue]:
-        """Returns a list of RscpTags to identify wallboxes!"""
+    def get_identification_tags(indexes: Iterable[int] = range(7)) -> list[RscpValue]:
+        """Returns a list of RscpTags to identify the wallboxes on indexes!"""
         return [
             RscpValue.construct_rscp_value(
                 "TAG_WB_REQ_DATA",
@@ -47,19 +57,19 @@ class WallboxRscpModel(RscpModelInterface):
                     ("TAG_WB_REQ_FIRMWARE_VERSION", None),
                 ],
             )
-            for index in range(7)
+            for index in indexes
         ]
 
     @staticmethod
     def identify(container: RscpValue) -> RscpModelInterface | None:
         """Tries to identify the wallbox. Input should be a container of type: TAG_WB_DATA."""
-        if container.getTagName() != "TAG_WB_DATA":
+        if container.getTagCode() != RscpTagCodes.TAG_WB_DATA:
             return None
 
-        index = container.get_child("TAG_WB_INDEX")
-        serial = container.get_child("TAG_WB_SERIAL")
-        device_name = container.get_child("TAG_WB_DEVICE_NAME")
-        firmware_version = container.get_child("TAG_WB_FIRMWARE_VERSION")
+        index = container.get_child(RscpTagCodes.TAG_WB_INDEX)
+        serial = container.get_child(RscpTagCodes.TAG_WB_SERIAL)
+        device_name = container.get_child(RscpTagCodes.TAG_WB_DEVICE_NAME)
+        firmware_version = container.get_child(RscpTagCodes.TAG_WB_FIRMWARE_VERSION)
         # if we received a serial, then we found an valid wallbox
         if serial:
             index = index.getValue()
@@ -71,21 +81,30 @@ class WallboxRscpModel(RscpModelInterface):
             )
         return None
 
-    def get_rscp_tags(self) -> list[RscpValue]:
-        "Returns all tags used to get informations from device!"
+    def get_rscp_tags_fast(self) -> list[RscpValue]:
+        "Returns the tags of the charging state and power."
         return [
             RscpValue.construct_rscp_value(
                 "TAG_WB_REQ_DATA",
                 [
                     ("TAG_WB_INDEX", self.__index),
                     ("TAG_WB_REQ_CP_STATE", None),
-                    ("TAG_WB_REQ_PARAMETER_LIST", 0),
-                    ("TAG_WB_REQ_PARAMETER_LIST", 1),
-                    ("TAG_WB_REQ_ACTIVE_CHARGE_STRATEGY", None),
                     ("TAG_WB_REQ_ASSIGNED_POWER", None),
                     # ("TAG_WB_REQ_POWER", None),
-                    ("TAG_WB_REQ_DEVICE_STATE", None),
                     ("TAG_WB_REQ_SUN_MODE_ACTIVE", None),
+                ],
+            )
+        ]
+
+    def get_rscp_tags(self) -> list[RscpValue]:
+        "Returns all tags used to get informations from device!"
+        return [
+            RscpValue.construct_rscp_value(
+                "TAG_WB_REQ_DATA",
+                [
+                    ("TAG_WB_INDEX", self.__index),
+                    ("TAG_WB_REQ_ACTIVE_CHARGE_STRATEGY", None),
+                    ("TAG_WB_REQ_DEVICE_STATE", None),
                     # "TAG_WB_REQ_SET_ABORT_CHARGING"
                     # "TAG_WB_REQ_SET_STATION_ENABLED"
                     # "TAG_WB_REQ_SET_STATION_AVAILABLE",
@@ -93,22 +112,39 @@ class WallboxRscpModel(RscpModelInterface):
             )
         ]
 
-    def get_rscp_tags_slow(self):
-        pass
+    def get_rscp_tags_slow(self) -> list[RscpValue]:
+        "Returns the tags of the parameter lists."
+        return [
+            RscpValue.construct_rscp_value(
+                "TAG_WB_REQ_DATA",
+                [
+                    ("TAG_WB_INDEX", self.__index),
+                    ("TAG_WB_REQ_PARAMETER_LIST", 0),
+                    ("TAG_WB_REQ_PARAMETER_LIST", 1),
+                ],
+            )
+        ]
+
+    def get_rscp_routes(self) -> list[tuple[str, str, int]]:
+        "Returns the TAG_WB_DATA container of this wallbox."
+        return [(RscpTagCodes.TAG_WB_DATA, RscpTagCodes.TAG_WB_INDEX, self.__index)]
 
     # def __extract_wallbox_data(self, container: RscpValue):
     def handle_rscp_data(self, container: RscpValue) -> bool:
         "This function is used to retrieve data from a rscp tag!"
 
-        if container.getTagName() != "TAG_WB_DATA":
+        if container.getTagCode() != RscpTagCodes.TAG_WB_DATA:
             return False
 
-        wb_index = container.get_child("TAG_WB_INDEX")
+        wb_index = container.get_child(RscpTagCodes.TAG_WB_INDEX)
         if wb_index is None:
-            value = container.get_child("TAG_WB_REQ_INDEX")
-            logger.warning(
-                "No TAG_WB_INDEX in container, errorcode: %d", value.getValue()
-            )
+            # an unknown wallbox index is answered with an error instead of a container
+            if container.isError:
+                logger.warning(
+                    "No TAG_WB_INDEX in container, errorcode: %d", container.getValue()
+                )
+            else:
+                logger.warning("No TAG_WB_INDEX in container")
             return False
 
         wb_index = wb_index.getValue()
@@ -116,37 +152,52 @@ class WallboxRscpModel(RscpModelInterface):
         if wb_index != self.__index:
             return False
 
-        self.__model.reset_state_data()
-
-        value = container.get_child("TAG_WB_CP_STATE")
-        if value is None:
-            logger.warning("CP State value is None for wb_index: %d", wb_index)
-            self.__model.cp_state = None
-        else:
-            logger.debug("CP State: %s", value.toString())
+        # the poll groups are answered in separate containers, the state data is
+        # reset by the reply of the fast group, so values which are left out or
+        # answered with an error aren't reported anymore
+        tags = set(container.get_child_tag_codes())
+        tags.discard(RscpTagCodes.TAG_WB_INDEX)
+        if not tags or tags - _OTHER_REPLY_TAGS:
+            self.__model.reset_state_data()
+
+        value = container.get_child(RscpTagCodes.TAG_WB_CP_STATE)
+        if value is not None and not value.isError:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("CP State: %s", value.toString())
             self.__model.cp_state = str(value.getValue())
 
-        assigned_power_container = container.get_child("TAG_WB_ASSIGNED_POWER")
-        if assigned_power_container:
+        assigned_power_container = container.get_child(
+            RscpTagCodes.TAG_WB_ASSIGNED_POWER
+        )
+        if assigned_power_container and not assigned_power_container.isError:
             self.__model.assigned_power = sum(
                 x.getValue() for x in assigned_power_container.getValue()
             )
 
-        power_container = container.get_child("TAG_WB_POWER")
-        if power_container:
-            logger.debug("WB POWER: %s", power_container.toString())
+        power_container = container.get_child(RscpTagCodes.TAG_WB_POWER)
+        if power_container and not power_container.isError:
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("WB POWER: %s", power_container.toString())
             self.__model.power = sum(x.getValue() for x in power_container.getValue())
 
-        value = container.get_child("TAG_WB_SUN_MODE_ACTIVE")
-        self.__model.sun_mode = value.getValue() if value is not None else None
+        value = container.get_child(RscpTagCodes.TAG_WB_SUN_MODE_ACTIVE)
+        if value is not None and not value.isError:
+            self.__model.sun_mode = value.getValue()
 
-        return True
+        # reply of get_sun_mode_request
+        value = container.get_child(RscpTagCodes.TAG_WB_SET_SUN_MODE_ACTIVE)
+        if value is not None and not value.isError:
+            self.__model.sun_mode = value.getValue()
 
-    async def get_sun_mode_request(self, value: bool, send_and_receive):
-        """Sends a sun mode set request to the storage."""
+        return True
 
-        request = RscpValue.construct_rscp_value(
+    def get_sun_mode_request(self, value: bool) -> RscpValue:
+        """Returns the request to change the sun mode."""
+        return RscpValue.construct_rscp_value(
             "TAG_WB_REQ_DATA",
             [("TAG_WB_INDEX", self.__index), ("TAG_WB_REQ_SET_SUN_MODE_ACTIVE", value)],
         )
-        await send_and_receive(request)
+
+    def get_sun_mode_reply_path(self) -> str:
+        """Returns the path of the reply to get_sun_mode_request, see RscpValue.get_tag_by_path."""
+        return f"TAG_WB_DATA(TAG_WB_INDEX=={self.__index})/TAG_WB_SET_SUN_MODE_ACTIVE"
@@ -13,6 +13,7 @@ from .entities import (
     DeviceUpdateStateSensor,
     EmergencyPowerSensor,
     EnergySensor,
+    PollIntervalSensor,
     PowerSensor,
     SGReadySensor,
     StateOfChargeSensor,
@@ -198,6 +199,7 @@ async def async_setup_entry(
         # ),
         StateOfChargeSensor(coordinator, config_entry),
         SGReadySensor(coordinator, config_entry),
+        PollIntervalSensor(coordinator, config_entry),
         *[
             CpStateSensor(coordinator, config_entry, wallbox.index, wallbox)
             for wallbox in coordinator.wallboxes
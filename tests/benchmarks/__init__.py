@@ -0,0 +1,10 @@
+"Benchmarks of the E3DC RSCP connection."
+
+from pathlib import Path
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
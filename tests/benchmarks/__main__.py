@@ -0,0 +1,99 @@
+"""Runs the benchmarks and writes the results as JSON.
+
+Run with: python -m tests.benchmarks [--output results.json] [bench_codec ...]
+
+Without names all benchmarks are run. The JSON contains the environment, the results
+returned by run() of each benchmark and the time each benchmark took:
+
+    {"environment": {...}, "results": {"bench_codec": {...}}, "seconds": {...}}
+"""
+
+import argparse
+from datetime import datetime, timezone
+import importlib
+import json
+import logging
+from pathlib import Path
+import pkgutil
+import platform
+import subprocess
+import sys
+import time
+
+import e3dc_rscp_connect
+
+
+def benchmark_names() -> list[str]:
+    "Returns the names of all benchmark modules."
+    return sorted(
+        module.name
+        for module in pkgutil.iter_modules([str(Path(__file__).parent)])
+        if module.name.startswith("bench_")
+    )
+
+
+def _git_revision() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def environment() -> dict:
+    "Returns the version of the integration and the environment of the run."
+    manifest = Path(e3dc_rscp_connect.__file__).parent / "manifest.json"
+    return {
+        "time": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "version": json.loads(manifest.read_text())["version"],
+        "revision": _git_revision(),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_benchmarks(names: list[str]) -> dict:
+    "Runs the benchmarks and returns the report."
+    report = {"environment": environment(), "results": {}, "seconds": {}}
+    for name in names:
+        module = importlib.import_module(f".{name}", __package__)
+        print(f"running {name}", file=sys.stderr)
+        start = time.perf_counter()
+        report["results"][name] = module.run()
+        report["seconds"][name] = time.perf_counter() - start
+    return report
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(prog="python -m tests.benchmarks")
+    parser.add_argument("benchmarks", nargs="*", help="benchmarks to run, default: all")
+    parser.add_argument("-o", "--output", help="file for the JSON report")
+    args = parser.parse_args()
+
+    names = args.benchmarks or benchmark_names()
+    unknown = set(names) - set(benchmark_names())
+    if unknown:
+        parser.error(f"unknown benchmarks: {', '.join(sorted(unknown))}")
+
+    # the models log unhandled and missing data, this isn't part of the results
+    handler = logging.StreamHandler()
+    handler.setLevel(logging.ERROR)
+    logging.basicConfig(handlers=[handler])
+    report = run_benchmarks(names)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""Benchmark for encoding and decoding RscpValues and RscpFrames.
+
+Run with: python -m tests.benchmarks.bench_codec
+"""
+
+import timeit
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+
+from . import frames
+
+
+def _count(values: list[RscpValue]) -> int:
+    count = 0
+    for value in values:
+        count += 1
+        if value.is_container():
+            count += _count(value.getValue())
+    return count
+
+
+def run(number: int = 200) -> dict:
+    """Returns the encoded and decoded values and frames per second for the golden poll reply.
+
+    The values are packed and unpacked one by one, the frames as a whole.
+    """
+    buffer = frames.golden("poll_reply")
+    frame = RscpFrame()
+    frame.unpack(buffer)
+    values = frame.getRscpValues()
+    value_count = _count(values)
+
+    offsets = []
+    offset = RscpFrame.frame_header.size
+    for value in values:
+        offsets.append(offset)
+        offset += value.getPackedDataSize()
+
+    def pack_values():
+        for value in values:
+            value.pack()
+
+    def unpack_values():
+        for offset in offsets:
+            RscpValue().unpack(buffer, offset)
+
+    pack_seconds = timeit.timeit(pack_values, number=number)
+    unpack_seconds = timeit.timeit(unpack_values, number=number)
+    pack_frame_seconds = timeit.timeit(
+        lambda: RscpFrame().packFrame(values), number=number
+    )
+    unpack_frame_seconds = timeit.timeit(
+        lambda: RscpFrame().unpack(buffer), number=number
+    )
+
+    return {
+        "frame_size": len(buffer),
+        "values_per_frame": value_count,
+        "pack_values_per_s": value_count * number / pack_seconds,
+        "unpack_values_per_s": value_count * number / unpack_seconds,
+        "pack_frames_per_s": number / pack_frame_seconds,
+        "unpack_frames_per_s": number / unpack_frame_seconds,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.0f}")
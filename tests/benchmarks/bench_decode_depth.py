@@ -0,0 +1,51 @@
+"""Regression benchmark for encoding and decoding deeply nested containers.
+
+Run with: python -m tests.benchmarks.bench_decode_depth
+"""
+
+import timeit
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+
+from . import frames
+
+
+def _depth(value: RscpValue) -> int:
+    if not value.is_container():
+        return 0
+    return 1 + max((_depth(x) for x in value.getValue()), default=0)
+
+
+def run(number: int = 50) -> dict:
+    "Runs the benchmark on a 5 level deep container frame."
+    constructed = frames.deep_container(depth=5)
+    buffer = frames.pack(constructed)
+
+    frame = RscpFrame()
+    frame.unpack(buffer)
+    (decoded,) = frame.getRscpValues()
+    assert _depth(decoded) == 5
+
+    decode_seconds = timeit.timeit(lambda: RscpFrame().unpack(buffer), number=number)
+    encode_seconds = timeit.timeit(
+        lambda: RscpFrame().packFrame(constructed), number=number
+    )
+    # the size of a constructed tree is computed recursively, for a decoded tree it is cached
+    computed_size_seconds = timeit.timeit(
+        constructed[0].getPackedDataSize, number=number
+    )
+    cached_size_seconds = timeit.timeit(decoded.getPackedDataSize, number=number)
+
+    return {
+        "frame_size": len(buffer),
+        "decode_frames_per_s": number / decode_seconds,
+        "encode_frames_per_s": number / encode_seconds,
+        "computed_size_us": computed_size_seconds / number * 1e6,
+        "cached_size_us": cached_size_seconds / number * 1e6,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
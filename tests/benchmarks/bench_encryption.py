@@ -0,0 +1,39 @@
+"""Benchmark for the cipher backends of RscpEncryption.
+
+Run with: python -m tests.benchmarks.bench_encryption
+"""
+
+import timeit
+
+from e3dc_rscp_connect.e3dc.RscpEncryption import RscpEncryption
+
+from . import frames
+
+
+def run(number: int = 20) -> dict:
+    "Returns the encryption and decryption time per KB of the golden frames for each backend."
+    request = frames.golden("poll_request")
+    reply = frames.golden("poll_reply_large")
+    reply += bytes(-len(reply) % RscpEncryption.BLOCK_SIZE)
+
+    result = {"request_size": len(request), "reply_size": len(reply)}
+    for backend in RscpEncryption.BACKENDS:
+        encryption = RscpEncryption("secret key", backend=backend)
+        encrypt_seconds = timeit.timeit(
+            lambda: encryption.encrypt(request), number=number
+        )
+        decrypt_seconds = timeit.timeit(
+            lambda: encryption.decrypt(reply), number=number
+        )
+        result[f"{backend}_encrypt_us_per_kb"] = (
+            encrypt_seconds / number / len(request) * 1024 * 1e6
+        )
+        result[f"{backend}_decrypt_us_per_kb"] = (
+            decrypt_seconds / number / len(reply) * 1024 * 1e6
+        )
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.0f}")
@@ -0,0 +1,61 @@
+"""Benchmark for the complete polling path of RscpClient.fetch_data.
+
+The client polls a FakeE3dc on the loopback interface, so the results include building
+the request, encryption, the transport, decryption, decoding and the models.
+
+Run with: python -m tests.benchmarks.bench_fetch_data
+"""
+
+import asyncio
+import statistics
+import time
+
+from e3dc_rscp_connect.client import RscpClient
+
+from ..fake_e3dc import FakeBattery, FakeE3dc, FakeWallbox
+
+
+async def _poll(number: int, wallboxes: int, parameters: int) -> dict:
+    async with FakeE3dc() as device:
+        device.batteries[1] = FakeBattery()
+        device.wallboxes = {
+            index: FakeWallbox(serial=f"WB-{index:08d}", parameters=parameters)
+            for index in range(wallboxes)
+        }
+        client = RscpClient(
+            "127.0.0.1", device.port, device.username, device.password, "secret key"
+        )
+        await client.identify_device()
+        # the first poll probes the inverters
+        await client.fetch_data()
+
+        bytes_sent = device.bytes_sent
+        durations = []
+        for _ in range(number):
+            start = time.perf_counter()
+            await client.fetch_data()
+            durations.append(time.perf_counter() - start)
+        reply_size = (device.bytes_sent - bytes_sent) / number
+        client.client.disconnect()
+
+    durations.sort()
+    return {
+        "polls_per_s": number / sum(durations),
+        "median_ms": statistics.median(durations) * 1000,
+        "p95_ms": durations[int(0.95 * (number - 1))] * 1000,
+        "reply_size": reply_size,
+    }
+
+
+def run(number: int = 200) -> dict:
+    "Returns the polls per second and the latency of a small and a large device."
+    result = {}
+    for name, wallboxes, parameters in (("small", 2, 20), ("large", 4, 200)):
+        for key, value in asyncio.run(_poll(number, wallboxes, parameters)).items():
+            result[f"{name}_{key}"] = value
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
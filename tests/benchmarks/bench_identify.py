@@ -0,0 +1,65 @@
+"""Benchmark for the cached device topology of the RscpClient.
+
+A client identifies a FakeE3dc with two wallboxes, polls it and identifies it again
+like the coordinator does every few minutes. The results are the request and reply
+sizes of the first and the repeated identification and of the polls after them.
+
+Run with: python -m tests.benchmarks.bench_identify
+"""
+
+import asyncio
+
+from e3dc_rscp_connect.client import RscpClient
+from e3dc_rscp_connect.model.RscpHandlerPipeline import POLL_NORMAL, POLL_SLOW
+
+from ..fake_e3dc import FakeE3dc, FakeWallbox
+
+
+async def _identify(probe_interval: float) -> dict:
+    sizes = [0, 0]
+    async with FakeE3dc() as device:
+        device.wallboxes[1] = FakeWallbox(serial="WB-00000002")
+        answer_frame = device.answer_frame
+
+        def record(frame, session):
+            reply = answer_frame(frame, session)
+            sizes[0] += len(frame)
+            sizes[1] += len(reply)
+            return reply
+
+        device.answer_frame = record
+        client = RscpClient(
+            "127.0.0.1",
+            device.port,
+            device.username,
+            device.password,
+            "secret key",
+            poll_periods={POLL_NORMAL: 1, POLL_SLOW: 1},
+            probe_interval=probe_interval,
+        )
+
+        result = {}
+        for name in ("first", "again"):
+            sizes[:] = [0, 0]
+            await client.identify_device()
+            result[f"{name}_identify_request_size"] = sizes[0]
+            result[f"{name}_identify_reply_size"] = sizes[1]
+            sizes[:] = [0, 0]
+            await client.fetch_data()
+            result[f"{name}_poll_request_size"] = sizes[0]
+        client.client.disconnect()
+    return result
+
+
+def run() -> dict:
+    "Returns the sizes with the cached topology and with probing every identification."
+    result = {}
+    for name, probe_interval in (("cached", 3600), ("probed", 0)):
+        for key, value in asyncio.run(_identify(probe_interval)).items():
+            result[f"{name}_{key}"] = value
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
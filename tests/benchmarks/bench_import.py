@@ -0,0 +1,64 @@
+"""Benchmark for the import time of the integration, as seen by Home Assistant startup.
+
+Each measurement runs in a fresh interpreter. The Home Assistant modules are imported
+before the measurement, they are loaded by Home Assistant anyway.
+
+Run with: python -m tests.benchmarks.bench_import
+"""
+
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+_CHILD = """
+import json, sys, time
+import homeassistant.config_entries, homeassistant.core, homeassistant.exceptions
+import homeassistant.helpers.update_coordinator
+
+start = time.perf_counter()
+import e3dc_rscp_connect
+import_s = time.perf_counter() - start
+
+from e3dc_rscp_connect.e3dc import RscpTags
+
+start = time.perf_counter()
+RscpTags.getTagByName("TAG_EMS_BAT_SOC")
+RscpTags.getTagByCode(0x0E840000)
+first_lookup_s = time.perf_counter() - start
+
+start = time.perf_counter()
+tag_count = len(RscpTags.rscpTags)
+full_table_s = time.perf_counter() - start
+
+print(json.dumps([import_s, first_lookup_s, full_table_s, tag_count]))
+"""
+
+
+def _measure() -> list:
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(sys.path))
+    output = subprocess.run(
+        [sys.executable, "-c", _CHILD],
+        env=env,
+        capture_output=True,
+        check=True,
+        text=True,
+    ).stdout
+    return json.loads(output)
+
+
+def run(number: int = 5) -> dict:
+    "Returns the median import time and the time to load the full tag table in ms."
+    results = [_measure() for _ in range(number)]
+    return {
+        "import_ms": statistics.median(x[0] for x in results) * 1000,
+        "first_lookup_ms": statistics.median(x[1] for x in results) * 1000,
+        "full_table_ms": statistics.median(x[2] for x in results) * 1000,
+        "tags": results[0][3],
+    }
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
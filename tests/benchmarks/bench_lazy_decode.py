@@ -0,0 +1,52 @@
+"""Benchmark for eager and lazy decoding of a poll reply.
+
+The decoded values are accessed like the handlers of the models access them.
+
+Run with: python -m tests.benchmarks.bench_lazy_decode
+"""
+
+import timeit
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+
+from . import frames
+
+
+def _consume(values) -> None:
+    for value in values:
+        if value.isTag("TAG_WB_DATA"):
+            value.get_child("TAG_WB_INDEX").getValue()
+            value.get_child("TAG_WB_CP_STATE").getValue()
+            value.get_child("TAG_WB_SUN_MODE_ACTIVE").getValue()
+        elif value.isTag("TAG_PVI_DATA"):
+            value.get_child("TAG_PVI_INDEX").getValue()
+            for dc_power in value.get_childs("TAG_PVI_DC_POWER"):
+                dc_power.get_child("TAG_PVI_INDEX").getValue()
+                dc_power.get_child("TAG_PVI_VALUE").getValue()
+        else:
+            value.getValue()
+
+
+def _decode(buffer: bytes, lazy: bool) -> None:
+    frame = RscpFrame()
+    frame.unpack(buffer, lazy=lazy)
+    _consume(frame.getRscpValues())
+
+
+def run(number: int = 500) -> dict:
+    "Returns the decoded and consumed poll replies per second."
+    buffer = frames.pack(frames.poll_reply())
+
+    eager_seconds = timeit.timeit(lambda: _decode(buffer, False), number=number)
+    lazy_seconds = timeit.timeit(lambda: _decode(buffer, True), number=number)
+
+    return {
+        "frame_size": len(buffer),
+        "eager_frames_per_s": number / eager_seconds,
+        "lazy_frames_per_s": number / lazy_seconds,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.0f}")
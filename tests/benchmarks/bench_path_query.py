@@ -0,0 +1,42 @@
+"""Benchmark for extracting values by path from a poll reply.
+
+Run with: python -m tests.benchmarks.bench_path_query
+"""
+
+import logging
+import timeit
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+
+from . import frames
+
+PATHS = [
+    "TAG_EMS_POWER_PV",
+    "TAG_EMS_BAT_SOC",
+    "TAG_PVI_DATA(TAG_PVI_INDEX==0)/TAG_PVI_DC_POWER(TAG_PVI_INDEX==2)/TAG_PVI_VALUE",
+    "TAG_WB_DATA(TAG_WB_INDEX==1)/TAG_WB_CP_STATE",
+    "TAG_WB_DATA(TAG_WB_INDEX==1)/TAG_WB_DEVICE_STATE/TAG_WB_DEVICE_WORKING",
+]
+
+
+def run(number: int = 200, sensors: int = 200) -> dict:
+    "Returns the path lookups per second, for sensors paths per poll."
+    frame = RscpFrame()
+    frame.unpack(frames.pack(frames.poll_reply()))
+    values = frame.getRscpValues()
+    paths = [PATHS[index % len(PATHS)] for index in range(sensors)]
+
+    def poll():
+        for path in paths:
+            RscpValue.get_tag_by_path(values, path)
+
+    # the lookups log on debug level, like in the integration this is disabled
+    logging.getLogger("e3dc_rscp_connect").setLevel(logging.INFO)
+    seconds = timeit.timeit(poll, number=number)
+    return {"lookups_per_s": sensors * number / seconds}
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.0f}")
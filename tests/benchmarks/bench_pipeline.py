@@ -0,0 +1,58 @@
+"""Benchmark for processing a poll with the RscpHandlerPipeline and the models.
+
+Run with: python -m tests.benchmarks.bench_pipeline
+"""
+
+import asyncio
+import time
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.model.RscpHandlerPipeline import RscpHandlerPipeline
+from e3dc_rscp_connect.model.SgReadyRscpModel import SgReadyRscpModel
+from e3dc_rscp_connect.model.StorageRscpModel import StorageRscpModel
+from e3dc_rscp_connect.model.WallboxRscpModel import WallboxRscpModel
+
+from . import frames
+
+
+def _pipeline() -> RscpHandlerPipeline:
+    "Returns a pipeline with the models of the device of the golden frames."
+    pipeline = RscpHandlerPipeline()
+    pipeline.add_handler(StorageRscpModel("S10-123456789012"))
+    pipeline.add_handler(WallboxRscpModel(0))
+    pipeline.add_handler(WallboxRscpModel(1))
+    pipeline.add_handler(SgReadyRscpModel())
+    return pipeline
+
+
+async def _run(number: int) -> dict:
+    pipeline = _pipeline()
+    reply = frames.golden("poll_reply")
+
+    start = time.perf_counter()
+    for _ in range(number):
+        frame = RscpFrame()
+        frame.unpack(reply, lazy=True)
+        await pipeline.process(frame.getRscpValues())
+    process_seconds = time.perf_counter() - start
+
+    start = time.perf_counter()
+    for _ in range(number):
+        await pipeline.collect_frame()
+    collect_seconds = time.perf_counter() - start
+
+    return {
+        "process_polls_per_s": number / process_seconds,
+        "process_us_per_poll": process_seconds / number * 1e6,
+        "collect_frame_us": collect_seconds / number * 1e6,
+    }
+
+
+def run(number: int = 1000) -> dict:
+    "Returns the time to decode and process the golden poll reply and to build a request."
+    return asyncio.run(_run(number))
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.1f}")
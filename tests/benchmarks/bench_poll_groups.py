@@ -0,0 +1,78 @@
+"""Benchmark for the poll groups of the RscpHandlerPipeline.
+
+A client polls a FakeE3dc for one slow period, once with all tags in every cycle and
+once with the default periods of the poll groups. The results are the average
+request size, reply size and duration of a cycle.
+
+Run with: python -m tests.benchmarks.bench_poll_groups
+"""
+
+import asyncio
+import time
+
+from e3dc_rscp_connect.client import RscpClient
+from e3dc_rscp_connect.model.RscpHandlerPipeline import (
+    DEFAULT_POLL_PERIODS,
+    POLL_NORMAL,
+    POLL_SLOW,
+)
+
+from ..fake_e3dc import FakeBattery, FakeE3dc, FakeWallbox
+
+
+async def _poll(poll_periods: dict[str, int], wallboxes: int, parameters: int) -> dict:
+    cycles = DEFAULT_POLL_PERIODS[POLL_SLOW]
+    sizes = [0, 0]
+    async with FakeE3dc() as device:
+        device.batteries[1] = FakeBattery()
+        device.wallboxes = {
+            index: FakeWallbox(serial=f"WB-{index:08d}", parameters=parameters)
+            for index in range(wallboxes)
+        }
+        answer_frame = device.answer_frame
+
+        def record(frame, session):
+            reply = answer_frame(frame, session)
+            sizes[0] += len(frame)
+            sizes[1] += len(reply)
+            return reply
+
+        client = RscpClient(
+            "127.0.0.1",
+            device.port,
+            device.username,
+            device.password,
+            "secret key",
+            poll_periods=poll_periods,
+        )
+        await client.identify_device()
+        device.answer_frame = record
+
+        start = time.perf_counter()
+        for _ in range(cycles):
+            await client.fetch_data()
+        duration = time.perf_counter() - start
+        client.client.disconnect()
+
+    return {
+        "request_size": sizes[0] / cycles,
+        "reply_size": sizes[1] / cycles,
+        "ms_per_cycle": duration / cycles * 1000,
+    }
+
+
+def run() -> dict:
+    "Returns the average sizes and durations of a cycle with and without poll groups."
+    result = {}
+    for name, poll_periods in (
+        ("all", {POLL_NORMAL: 1, POLL_SLOW: 1}),
+        ("grouped", DEFAULT_POLL_PERIODS),
+    ):
+        for key, value in asyncio.run(_poll(poll_periods, 4, 200)).items():
+            result[f"{name}_{key}"] = value
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
@@ -0,0 +1,98 @@
+"""Benchmark for routing received values to the handlers of the pipeline.
+
+Compares the tag code routes with offering every value to every handler in turn, for
+a growing number of wallboxes and inverters.
+
+Run with: python -m tests.benchmarks.bench_routing
+"""
+
+import asyncio
+import logging
+import time
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.model.RscpHandlerPipeline import RscpHandlerPipeline
+from e3dc_rscp_connect.model.SgReadyRscpModel import SgReadyRscpModel
+from e3dc_rscp_connect.model.StorageRscpModel import StorageRscpModel
+from e3dc_rscp_connect.model.WallboxRscpModel import WallboxRscpModel
+
+from . import frames
+
+
+class _Unrouted:
+    "Hides the routes of a handler, so it is offered all values."
+
+    def __init__(self, handler):
+        self.handler = handler
+
+    def get_rscp_routes(self):
+        return None
+
+    def handle_rscp_data(self, container) -> bool:
+        return self.handler.handle_rscp_data(container)
+
+
+def _pipeline(devices: int, routed: bool, calls: list) -> RscpHandlerPipeline:
+    handlers = [StorageRscpModel("S10-123"), SgReadyRscpModel()]
+    handlers += [WallboxRscpModel(index) for index in range(devices)]
+    pipeline = RscpHandlerPipeline()
+    for handler in handlers:
+        _count_calls(handler, calls)
+        pipeline.add_handler(handler if routed else _Unrouted(handler))
+    return pipeline
+
+
+def _count_calls(handler, calls: list) -> None:
+    handle_rscp_data = handler.handle_rscp_data
+
+    def counting(container) -> bool:
+        calls.append(None)
+        return handle_rscp_data(container)
+
+    handler.handle_rscp_data = counting
+
+
+def _reply(devices: int):
+    values = frames.ems_reply()
+    for index in range(devices):
+        values += frames.pvi_reply(index) + frames.wallbox_reply(index)
+    frame = RscpFrame()
+    frame.unpack(frames.pack(values))
+    return frame.getRscpValues()
+
+
+async def _process(pipeline: RscpHandlerPipeline, values, number: int) -> float:
+    start = time.perf_counter()
+    for _ in range(number):
+        await pipeline.process(values)
+    return time.perf_counter() - start
+
+
+def run(number: int = 500, device_counts=(1, 4, 16)) -> dict:
+    """Returns the handler calls and the processing time per received value.
+
+    The time includes the work of the handlers, which is the same for both variants.
+    """
+    # unhandled values are logged as warnings
+    logging.disable(logging.WARNING)
+    result = {}
+    for devices in device_counts:
+        values = _reply(devices)
+        for routed in (False, True):
+            calls = []
+            pipeline = _pipeline(devices, routed, calls)
+            seconds = asyncio.run(_process(pipeline, values, number))
+            name = "routed" if routed else "linear"
+            result[f"{name}_{devices}_devices_handler_calls_per_value"] = len(calls) / (
+                number * len(values)
+            )
+            result[f"{name}_{devices}_devices_us_per_value"] = (
+                seconds / number / len(values) * 1e6
+            )
+    logging.disable(logging.NOTSET)
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
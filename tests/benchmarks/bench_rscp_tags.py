@@ -0,0 +1,47 @@
+"""Micro-benchmark for the tag code lookup used while decoding frames.
+
+Run with: python -m tests.benchmarks.bench_rscp_tags
+"""
+
+import timeit
+from unittest.mock import patch
+
+from e3dc_rscp_connect.e3dc import RscpTags
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+
+from . import frames
+
+
+def _linear_get_tag_by_code(tag_code: int):
+    "The lookup as it was done before the code index existed."
+    for key, value in RscpTags.rscpTags.items():
+        if value["tagvalue"] == tag_code:
+            return key, value
+    return None
+
+
+def _decode_rate(buffer: bytes, number: int) -> float:
+    "Returns the decoded frames per second."
+    seconds = timeit.timeit(lambda: RscpFrame().unpack(buffer), number=number)
+    return number / seconds
+
+
+def run(number: int = 200) -> dict:
+    "Runs the benchmark and returns the decoded frames per second."
+    buffer = frames.pack(frames.poll_reply())
+
+    with patch.object(RscpTags, "getTagByCode", _linear_get_tag_by_code):
+        linear = _decode_rate(buffer, number)
+    indexed = _decode_rate(buffer, number)
+
+    return {
+        "frame_size": len(buffer),
+        "linear_scan_frames_per_s": linear,
+        "code_index_frames_per_s": indexed,
+        "speedup": indexed / linear,
+    }
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.1f}")
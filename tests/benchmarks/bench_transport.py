@@ -0,0 +1,110 @@
+"""Benchmark for the transports of a RscpConnection.
+
+A local server answers every request with a large, unencrypted reply frame.
+
+Run with: python -m tests.benchmarks.bench_transport
+"""
+
+import asyncio
+import time
+
+from e3dc_rscp_connect.e3dc.RscpConnection import RscpConnection
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpTransport import (
+    RscpSocketTransport,
+    RscpStreamTransport,
+    RscpTransport,
+)
+
+from . import frames
+
+
+class _CountingTransport(RscpTransport):
+    "Counts the reads of the wrapped transport."
+
+    def __init__(self, transport: RscpTransport):
+        self.transport = transport
+        self.reads = 0
+
+    async def open(self, host: str, port: int) -> None:
+        await self.transport.open(host, port)
+
+    def close(self) -> None:
+        self.transport.close()
+
+    def is_open(self) -> bool:
+        return self.transport.is_open()
+
+    async def write(self, data: bytes) -> None:
+        await self.transport.write(data)
+
+    async def read(self) -> bytes:
+        self.reads += 1
+        return await self.transport.read()
+
+
+async def _serve(reply: bytes):
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                header = await reader.read(RscpFrame.frame_header.size)
+                if not header:
+                    break
+                await reader.readexactly(RscpFrame.getFrameLength(header) - len(header))
+                writer.write(reply)
+                await writer.drain()
+        except (asyncio.CancelledError, ConnectionError):
+            pass
+        finally:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def _round_trips(transport: RscpTransport, port: int, request: bytes, number):
+    counting = _CountingTransport(transport)
+    connection = RscpConnection("127.0.0.1", port, transport=counting)
+    await connection.connect()
+    try:
+        start = time.perf_counter()
+        for _ in range(number):
+            await connection.send(request)
+            await connection.receive()
+        seconds = time.perf_counter() - start
+    finally:
+        connection.disconnect()
+    return number / seconds, counting.reads / number
+
+
+async def _run(number: int, wallboxes: int) -> dict:
+    values = []
+    for index in range(wallboxes):
+        values.extend(frames.wallbox_reply(index, parameters=200))
+    reply = frames.pack(values)
+    request = RscpFrame().packFrame(frames.ems_reply())
+
+    server = await _serve(reply)
+    port = server.sockets[0].getsockname()[1]
+    result = {"reply_size": len(reply)}
+    try:
+        for name, transport in (
+            ("socket", RscpSocketTransport()),
+            ("stream", RscpStreamTransport()),
+        ):
+            per_s, reads = await _round_trips(transport, port, request, number)
+            result[f"{name}_round_trips_per_s"] = per_s
+            result[f"{name}_reads_per_frame"] = reads
+    finally:
+        server.close()
+        await server.wait_closed()
+    return result
+
+
+def run(number: int = 200, wallboxes: int = 8) -> dict:
+    "Returns round trips per second and reads per reply frame for each transport."
+    return asyncio.run(_run(number, wallboxes))
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.2f}")
@@ -0,0 +1,56 @@
+"""Benchmark for the memory used by decoded RscpValues.
+
+Run with: python -m tests.benchmarks.bench_value_memory
+"""
+
+import gc
+import tracemalloc
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+
+from . import frames
+
+
+def _count(values: list[RscpValue]) -> int:
+    count = 0
+    for value in values:
+        count += 1
+        if value.is_container():
+            count += _count(value.getValue())
+    return count
+
+
+def _measure(buffer: bytes, lazy: bool) -> tuple[int, int]:
+    "Returns the allocated bytes of the decoded values and the number of values."
+    gc.collect()
+    tracemalloc.start()
+    frame = RscpFrame()
+    frame.unpack(buffer, lazy=lazy)
+    values = frame.getRscpValues()
+    # decode all childs of lazy containers
+    value_count = _count(values)
+    allocated = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return allocated, value_count
+
+
+def run() -> dict:
+    "Returns the bytes per decoded value for a parameter list reply and a deep tree."
+    result = {}
+    for name, values in (
+        ("wallbox", frames.wallbox_reply(parameters=2000)),
+        ("deep", frames.deep_container(depth=5)),
+    ):
+        buffer = frames.pack(values)
+        for lazy in (False, True):
+            allocated, value_count = _measure(buffer, lazy)
+            mode = "lazy" if lazy else "eager"
+            result[f"{name}_{mode}_values"] = value_count
+            result[f"{name}_{mode}_bytes_per_value"] = allocated / value_count
+    return result
+
+
+if __name__ == "__main__":
+    for key, value in run().items():
+        print(f"{key}: {value:.1f}")
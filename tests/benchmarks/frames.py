@@ -0,0 +1,176 @@
+"""This file contains synthetic RSCP frames used by the benchmarks.
+
+The golden frames in the golden directory are plaintext frames recorded from a RscpClient
+polling a FakeE3dc. They stay fixed, so results of different releases are comparable:
+
+poll_request: the request of a storage with an inverter, two batteries, two wallboxes
+    and SG Ready.
+poll_reply: the reply of the device to poll_request.
+poll_reply_large: the reply of a device with four wallboxes with 200 parameters each.
+
+Only rewrite them with python -m tests.benchmarks.frames if the protocol changes.
+"""
+
+import asyncio
+from pathlib import Path
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+
+
+def wallbox_reply(index: int = 0, parameters: int = 20) -> list[RscpValue]:
+    "Returns a TAG_WB_DATA reply like the one received for WallboxRscpModel.get_rscp_tags."
+    parameter_list = [("TAG_WB_PARAM_INDEX", x) for x in range(parameters)] + [
+        ("TAG_WB_PARAM_NIGHT_MODE_TIME_RANGE", "22:00-06:00")
+    ]
+    return [
+        RscpValue.construct_rscp_value(
+            "TAG_WB_DATA",
+            [
+                ("TAG_WB_INDEX", index),
+                ("TAG_WB_CP_STATE", "C"),
+                ("TAG_WB_PARAMETER_LIST", parameter_list),
+                ("TAG_WB_PARAMETER_LIST", parameter_list),
+                ("TAG_WB_ACTIVE_CHARGE_STRATEGY", 1),
+                (
+                    "TAG_WB_DEVICE_STATE",
+                    [
+                        ("TAG_WB_DEVICE_CONNECTED", True),
+                        ("TAG_WB_DEVICE_WORKING", True),
+                        ("TAG_WB_DEVICE_IN_SERVICE", False),
+                    ],
+                ),
+                ("TAG_WB_SUN_MODE_ACTIVE", True),
+            ],
+        )
+    ]
+
+
+def pvi_reply(index: int = 0, mppts: int = 3) -> list[RscpValue]:
+    "Returns a TAG_PVI_DATA reply like the one received for StorageRscpModel.get_rscp_tags."
+    return [
+        RscpValue.construct_rscp_value(
+            "TAG_PVI_DATA",
+            [("TAG_PVI_INDEX", index)]
+            + [
+                (
+                    "TAG_PVI_DC_POWER",
+                    [("TAG_PVI_INDEX", mppt), ("TAG_PVI_VALUE", None)],
+                )
+                for mppt in range(mppts)
+            ],
+        )
+    ]
+
+
+def ems_reply() -> list[RscpValue]:
+    "Returns the EMS values received for StorageRscpModel.get_rscp_tags."
+    return [
+        RscpValue().withTagName("TAG_EMS_POWER_HOME", 512),
+        RscpValue().withTagName("TAG_EMS_POWER_BAT", -1200),
+        RscpValue().withTagName("TAG_EMS_POWER_GRID", 25),
+        RscpValue().withTagName("TAG_EMS_POWER_PV", 3400),
+        RscpValue().withTagName("TAG_EMS_POWER_ADD", 0),
+        RscpValue().withTagName("TAG_EMS_POWER_WB_ALL", 11000),
+        RscpValue().withTagName("TAG_EMS_POWER_WB_SOLAR", 3000),
+        RscpValue().withTagName("TAG_EMS_BAT_SOC", 87),
+        RscpValue().withTagName("TAG_EMS_EMERGENCY_POWER_STATUS", 2),
+    ]
+
+
+def deep_container(depth: int = 5, fanout: int = 4, leaves: int = 8) -> list[RscpValue]:
+    "Returns a synthetic container with depth levels of nested containers."
+    return [
+        RscpValue.construct_rscp_value(
+            "TAG_WB_PARAMETER_LIST", _nested_items(depth, fanout, leaves)
+        )
+    ]
+
+
+def _nested_items(depth: int, fanout: int, leaves: int) -> list:
+    if depth == 1:
+        return [("TAG_WB_PARAM_INDEX", x) for x in range(leaves)]
+    return [
+        ("TAG_WB_PARAMETER_LIST", _nested_items(depth - 1, fanout, leaves))
+        for _ in range(fanout)
+    ]
+
+
+def poll_reply() -> list[RscpValue]:
+    "Returns the values of a complete poll reply of a storage with two wallboxes."
+    return ems_reply() + pvi_reply(0) + wallbox_reply(0) + wallbox_reply(1)
+
+
+def pack(values: list[RscpValue]) -> bytes:
+    "Packs the values into a frame."
+    return RscpFrame().packFrame(values)
+
+
+GOLDEN_PATH = Path(__file__).parent / "golden"
+GOLDEN_FRAMES = ("poll_request", "poll_reply", "poll_reply_large")
+GOLDEN_FRAME_TIME = 1700000000
+
+
+def golden(name: str) -> bytes:
+    "Returns the golden frame name."
+    return (GOLDEN_PATH / f"{name}.bin").read_bytes()
+
+
+async def _record_poll(wallboxes: int, parameters: int) -> tuple[bytes, bytes]:
+    "Returns the last request and reply frame of a client polling all tags of a FakeE3dc."
+    from e3dc_rscp_connect.client import RscpClient
+    from e3dc_rscp_connect.model.RscpHandlerPipeline import POLL_NORMAL, POLL_SLOW
+
+    from ..fake_e3dc import FakeBattery, FakeE3dc, FakeWallbox
+
+    recorded = []
+    async with FakeE3dc() as device:
+        device.wallboxes = {
+            index: FakeWallbox(serial=f"WB-{index:08d}", parameters=parameters)
+            for index in range(wallboxes)
+        }
+        device.batteries[1] = FakeBattery()
+        answer_frame = device.answer_frame
+
+        def record(frame, session):
+            reply = answer_frame(frame, session)
+            recorded.append((frame, reply))
+            return reply
+
+        device.answer_frame = record
+        client = RscpClient(
+            "127.0.0.1",
+            device.port,
+            device.username,
+            device.password,
+            "secret key",
+            poll_periods={POLL_NORMAL: 1, POLL_SLOW: 1},
+        )
+        await client.identify_device()
+        # the first poll probes the inverters
+        await client.fetch_data()
+        await client.fetch_data()
+        client.client.disconnect()
+
+    request, reply = recorded[-1]
+    return _fixed_time(request), _fixed_time(reply)
+
+
+def _fixed_time(frame: bytes) -> bytes:
+    buffer = bytearray(frame)
+    RscpFrame.frame_time.pack_into(buffer, 4, GOLDEN_FRAME_TIME, 0)
+    return bytes(buffer)
+
+
+def write_golden_frames() -> None:
+    "Records the golden frames again."
+    request, reply = asyncio.run(_record_poll(wallboxes=2, parameters=20))
+    _, reply_large = asyncio.run(_record_poll(wallboxes=4, parameters=200))
+    GOLDEN_PATH.mkdir(exist_ok=True)
+    for name, frame in zip(GOLDEN_FRAMES, (request, reply, reply_large)):
+        (GOLDEN_PATH / f"{name}.bin").write_bytes(frame)
+        print(f"{name}: {len(frame)} bytes")
+
+
+if __name__ == "__main__":
+    write_golden_frames()
@@ -0,0 +1,413 @@
+"""A simulated E3DC device which speaks RSCP over TCP, for tests and benchmarks.
+
+FakeE3dc answers the requests of the models (INFO, EMS, PVI, BAT, WB and SGR) from its
+state. The connection is encrypted and authorized like on a real device. Replies can be
+delayed, split into fragments and inflated with more wallbox parameters.
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from pathlib import Path
+import struct
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc import RscpTags
+from e3dc_rscp_connect.e3dc.RscpEncryption import RscpEncryption
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpFrameReader import RscpFrameReader
+from e3dc_rscp_connect.e3dc.RscpValue import RscpTypes, RscpValue
+
+_VALUE_HEADER = struct.Struct("<IBH")
+
+# error codes of the RSCP protocol
+ERROR_NOT_HANDLED = 0x01
+ERROR_ACCESS_DENIED = 0x02
+ERROR_FORMAT = 0x03
+ERROR_AGAIN = 0x04
+ERROR_OUT_OF_BOUNDS = 0x05
+ERROR_NOT_AVAILABLE = 0x06
+ERROR_UNKNOWN_TAG = 0x07
+ERROR_ALREADY_IN_USE = 0x08
+
+AUTH_LEVEL = 10
+
+
+def _raw_value(tag_name: str, type_identifier: int, data: bytes) -> bytes:
+    tag_code = RscpTags.getTagByName(tag_name)[1]["tagvalue"]
+    return _VALUE_HEADER.pack(tag_code, type_identifier, len(data)) + data
+
+
+def value(tag_name: str, data) -> bytes:
+    "Packs a value with the type of the tag table."
+    return RscpValue().withTagName(tag_name, data).pack()
+
+
+def typed_value(tag_name: str, type_name: str, data) -> bytes:
+    "Packs a value with another type, e.g. for tags with a variable type."
+    rscp_type = RscpTypes[type_name]
+    packed = struct.pack("<" + rscp_type["fmt"], data)
+    return _raw_value(tag_name, rscp_type["identifier"], packed)
+
+
+def error_value(tag_name: str, error: int) -> bytes:
+    "Packs an error reply of a tag."
+    return _raw_value(
+        tag_name, RscpTypes["Error32"]["identifier"], struct.pack("<I", error)
+    )
+
+
+def container(tag_name: str, *childs: bytes) -> bytes:
+    "Packs a container of already packed childs."
+    return _raw_value(tag_name, RscpTypes["Container"]["identifier"], b"".join(childs))
+
+
+def _response_name(request_name: str) -> str:
+    "TAG_EMS_REQ_POWER_PV is answered with TAG_EMS_POWER_PV."
+    response_name = request_name.replace("_REQ_", "_", 1)
+    if RscpTags.getTagByName(response_name) is None:
+        return request_name
+    return response_name
+
+
+@dataclass
+class FakeInverter:
+    "State of a simulated PV inverter."
+
+    mppt_power: list[float] = field(default_factory=lambda: [1200.0, 800.0, 0.0])
+
+
+@dataclass
+class FakeBattery:
+    "State of a simulated battery."
+
+    connected: bool = True
+    working: bool = True
+    in_service: bool = False
+
+
+@dataclass
+class FakeWallbox:
+    "State of a simulated wallbox."
+
+    serial: str = "WB-00000001"
+    device_name: str = "Wallbox easy connect"
+    firmware_version: str = "2.0.1"
+    cp_state: str = "C"
+    active_charge_strategy: int = 1
+    assigned_power: tuple[int, int, int] = (3680, 3680, 3680)
+    sun_mode: bool = True
+    connected: bool = True
+    working: bool = True
+    in_service: bool = False
+    # entries of each TAG_WB_PARAMETER_LIST, sets the size of the replies
+    parameters: int = 20
+
+
+class _Session:
+    "State of one client connection."
+
+    def __init__(self, rscp_key: str):
+        self.encryption = RscpEncryption(rscp_key)
+        self.reader = RscpFrameReader(self.encryption)
+        self.auth_level = 0
+
+
+class FakeE3dc:
+    """A simulated E3DC storage with inverters, batteries, wallboxes and SG Ready.
+
+    The state can be changed at any time, the next reply contains the new values.
+    latency delays every reply (in seconds). If fragment_size is set, replies are sent
+    in fragments of this size with fragment_delay seconds in between.
+    """
+
+    def __init__(
+        self,
+        rscp_key: str = "secret key",
+        username: str = "user",
+        password: str = "password",
+        latency: float = 0,
+        fragment_size: int | None = None,
+        fragment_delay: float = 0,
+    ):
+        self.rscp_key = rscp_key
+        self.username = username
+        self.password = password
+        self.latency = latency
+        self.fragment_size = fragment_size
+        self.fragment_delay = fragment_delay
+
+        # values of the simple requests, by name of the reply tag
+        self.values = {
+            "TAG_INFO_SERIAL_NUMBER": "S10-123456789012",
+            "TAG_INFO_ASSEMBLY_SERIAL_NUMBER": "AS-123456789012",
+            "TAG_INFO_MAC_ADDRESS": "00:11:22:33:44:55",
+            "TAG_INFO_SW_RELEASE": "S10_2024_04",
+            "TAG_EMS_POWER_HOME": 512,
+            "TAG_EMS_POWER_BAT": -1200,
+            "TAG_EMS_POWER_GRID": 25,
+            "TAG_EMS_POWER_PV": 3400,
+            "TAG_EMS_POWER_ADD": 0,
+            "TAG_EMS_POWER_WB_ALL": 11000,
+            "TAG_EMS_POWER_WB_SOLAR": 3000,
+            "TAG_EMS_BAT_SOC": 87,
+            "TAG_EMS_EMERGENCY_POWER_STATUS": 2,
+        }
+        self.inverters = {0: FakeInverter()}
+        self.batteries = {0: FakeBattery()}
+        self.wallboxes = {0: FakeWallbox()}
+        # None if SG Ready isn't available
+        self.sg_ready_state: int | None = 1
+        # an unresponsive device receives frames but doesn't answer them
+        self.unresponsive = False
+
+        self.connections = 0
+        self.frames_received = 0
+        self.frames_sent = 0
+        self.bytes_sent = 0
+        self.last_request: list[RscpValue] = []
+
+        self.__server = None
+        self.__writers = set()
+
+    @property
+    def port(self) -> int:
+        "The port of the running server."
+        return self.__server.sockets[0].getsockname()[1]
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        "Starts the server and returns its port."
+        self.__server = await asyncio.start_server(self.__handle, host, port)
+        return self.port
+
+    def disconnect_clients(self) -> None:
+        "Closes all client connections, the server keeps running."
+        for writer in list(self.__writers):
+            writer.close()
+
+    async def close(self) -> None:
+        "Stops the server and closes all client connections."
+        if self.__server is None:
+            return
+        self.__server.close()
+        self.disconnect_clients()
+        await self.__server.wait_closed()
+        self.__server = None
+
+    async def __aenter__(self):
+        await self.start()
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def __handle(
+        self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter
+    ) -> None:
+        self.connections += 1
+        self.__writers.add(writer)
+        session = _Session(self.rscp_key)
+        try:
+            while data := await reader.read(65536):
+                session.reader.feed(data)
+                while (frame := session.reader.next_frame()) is not None:
+                    if self.unresponsive:
+                        continue
+                    reply = self.answer_frame(frame, session)
+                    if self.latency:
+                        await asyncio.sleep(self.latency)
+                    await self.__send(writer, session.encryption.encrypt(reply))
+        except (ConnectionError, asyncio.CancelledError):
+            pass
+        finally:
+            self.__writers.discard(writer)
+            writer.close()
+
+    async def __send(self, writer: asyncio.StreamWriter, data: bytes) -> None:
+        size = self.fragment_size or len(data)
+        for start in range(0, len(data), size):
+            if start and self.fragment_delay:
+                await asyncio.sleep(self.fragment_delay)
+            writer.write(data[start : start + size])
+            await writer.drain()
+        self.frames_sent += 1
+        self.bytes_sent += len(data)
+
+    def answer_frame(self, frame: bytes, session: _Session) -> bytes:
+        "Returns the plaintext reply frame for a received request frame."
+        request = RscpFrame()
+        request.unpack(frame)
+        self.frames_received += 1
+        self.last_request = request.getRscpValues()
+
+        data = b"".join(self.__answer(x, session) for x in self.last_request)
+        return bytes(RscpFrame.packFrameData(data))
+
+    def __answer(self, request: RscpValue, session: _Session) -> bytes:
+        if request.isTag("TAG_RSCP_REQ_AUTHENTICATION"):
+            user = request.get_child("TAG_RSCP_AUTHENTICATION_USER")
+            password = request.get_child("TAG_RSCP_AUTHENTICATION_PASSWORD")
+            if (
+                user is not None
+                and password is not None
+                and user.getValue() == self.username
+                and password.getValue() == self.password
+            ):
+                session.auth_level = AUTH_LEVEL
+                return value("TAG_RSCP_AUTHENTICATION", AUTH_LEVEL)
+            # a failed authentication is answered with an Int32 level
+            session.auth_level = 0
+            return typed_value("TAG_RSCP_AUTHENTICATION", "Int32", 0)
+
+        if request.isTag("TAG_RSCP_REQ_USER_LEVEL"):
+            return value("TAG_RSCP_USER_LEVEL", session.auth_level)
+
+        response_name = _response_name(request.getTagName())
+        if not session.auth_level:
+            return error_value(response_name, ERROR_ACCESS_DENIED)
+
+        if request.isTag("TAG_PVI_REQ_DATA"):
+            return self.__inverter_data(request)
+        if request.isTag("TAG_BAT_REQ_DATA"):
+            return self.__battery_data(request)
+        if request.isTag("TAG_WB_REQ_DATA"):
+            return self.__wallbox_data(request)
+        if request.isTag("TAG_SGR_REQ_DATA"):
+            return self.__sg_ready_data(request)
+
+        if response_name in self.values:
+            return value(response_name, self.values[response_name])
+        return error_value(response_name, ERROR_NOT_HANDLED)
+
+    @staticmethod
+    def __index(request: RscpValue, index_tag: str) -> int | None:
+        index = request.get_child(index_tag)
+        return None if index is None else index.getValue()
+
+    def __inverter_data(self, request: RscpValue) -> bytes:
+        index = self.__index(request, "TAG_PVI_INDEX")
+        childs = [value("TAG_PVI_INDEX", index)]
+        inverter = self.inverters.get(index)
+        if inverter is None:
+            childs.append(error_value("TAG_PVI_REQ_DATA", ERROR_NOT_AVAILABLE))
+            return container("TAG_PVI_DATA", *childs)
+
+        for child in request.getValue():
+            if child.isTag("TAG_PVI_REQ_DC_POWER"):
+                mppt = child.getValue()
+                if mppt < len(inverter.mppt_power):
+                    childs.append(
+                        container(
+                            "TAG_PVI_DC_POWER",
+                            value("TAG_PVI_INDEX", mppt),
+                            typed_value(
+                                "TAG_PVI_VALUE", "Float32", inverter.mppt_power[mppt]
+                            ),
+                        )
+                    )
+                else:
+                    childs.append(error_value("TAG_PVI_DC_POWER", ERROR_OUT_OF_BOUNDS))
+            elif not child.isTag("TAG_PVI_INDEX"):
+                childs.append(
+                    error_value(_response_name(child.getTagName()), ERROR_NOT_HANDLED)
+                )
+        return container("TAG_PVI_DATA", *childs)
+
+    def __battery_data(self, request: RscpValue) -> bytes:
+        index = self.__index(request, "TAG_BAT_INDEX")
+        childs = [value("TAG_BAT_INDEX", index)]
+        battery = self.batteries.get(index)
+        if battery is None:
+            childs.append(error_value("TAG_BAT_REQ_DATA", ERROR_NOT_AVAILABLE))
+            return container("TAG_BAT_DATA", *childs)
+
+        for child in request.getValue():
+            if child.isTag("TAG_BAT_REQ_DEVICE_STATE"):
+                childs.append(
+                    container(
+                        "TAG_BAT_DEVICE_STATE",
+                        value("TAG_BAT_DEVICE_CONNECTED", battery.connected),
+                        value("TAG_BAT_DEVICE_WORKING", battery.working),
+                        value("TAG_BAT_DEVICE_IN_SERVICE", battery.in_service),
+                    )
+                )
+            elif not child.isTag("TAG_BAT_INDEX"):
+                childs.append(
+                    error_value(_response_name(child.getTagName()), ERROR_NOT_HANDLED)
+                )
+        return container("TAG_BAT_DATA", *childs)
+
+    def __wallbox_data(self, request: RscpValue) -> bytes:
+        index = self.__index(request, "TAG_WB_INDEX")
+        wallbox = self.wallboxes.get(index)
+        if wallbox is None:
+            return error_value("TAG_WB_DATA", ERROR_NOT_AVAILABLE)
+
+        childs = [value("TAG_WB_INDEX", index)]
+        for child in request.getValue():
+            if not child.isTag("TAG_WB_INDEX"):
+                childs.append(self.__wallbox_value(wallbox, child))
+        return container("TAG_WB_DATA", *childs)
+
+    @staticmethod
+    def __wallbox_value(wallbox: FakeWallbox, request: RscpValue) -> bytes:
+        name = request.getTagName()
+        if name == "TAG_WB_REQ_SERIAL":
+            return value("TAG_WB_SERIAL", wallbox.serial)
+        if name == "TAG_WB_REQ_DEVICE_NAME":
+            return value("TAG_WB_DEVICE_NAME", wallbox.device_name)
+        if name == "TAG_WB_REQ_FIRMWARE_VERSION":
+            return value("TAG_WB_FIRMWARE_VERSION", wallbox.firmware_version)
+        if name == "TAG_WB_REQ_CP_STATE":
+            return value("TAG_WB_CP_STATE", wallbox.cp_state)
+        if name == "TAG_WB_REQ_ACTIVE_CHARGE_STRATEGY":
+            return value(
+                "TAG_WB_ACTIVE_CHARGE_STRATEGY", wallbox.active_charge_strategy
+            )
+        if name == "TAG_WB_REQ_SUN_MODE_ACTIVE":
+            return value("TAG_WB_SUN_MODE_ACTIVE", wallbox.sun_mode)
+        if name == "TAG_WB_REQ_SET_SUN_MODE_ACTIVE":
+            wallbox.sun_mode = request.getValue()
+            return value("TAG_WB_SET_SUN_MODE_ACTIVE", wallbox.sun_mode)
+        if name == "TAG_WB_REQ_ASSIGNED_POWER":
+            return container(
+                "TAG_WB_ASSIGNED_POWER",
+                *(
+                    value(f"TAG_WB_ASSIGNED_POWER_L{phase + 1}", power)
+                    for phase, power in enumerate(wallbox.assigned_power)
+                ),
+            )
+        if name == "TAG_WB_REQ_DEVICE_STATE":
+            return container(
+                "TAG_WB_DEVICE_STATE",
+                value("TAG_WB_DEVICE_CONNECTED", wallbox.connected),
+                value("TAG_WB_DEVICE_WORKING", wallbox.working),
+                value("TAG_WB_DEVICE_IN_SERVICE", wallbox.in_service),
+            )
+        if name == "TAG_WB_REQ_PARAMETER_LIST":
+            return container(
+                "TAG_WB_PARAMETER_LIST",
+                *(value("TAG_WB_PARAM_INDEX", x) for x in range(wallbox.parameters)),
+                value("TAG_WB_PARAM_NIGHT_MODE_TIME_RANGE", "22:00-06:00"),
+            )
+        return error_value(_response_name(name), ERROR_NOT_HANDLED)
+
+    def __sg_ready_data(self, request: RscpValue) -> bytes:
+        index = self.__index(request, "TAG_SGR_INDEX")
+        childs = [value("TAG_SGR_INDEX", index)]
+        for child in request.getValue():
+            if child.isTag("TAG_SGR_REQ_STATE"):
+                if self.sg_ready_state is None:
+                    childs.append(error_value("TAG_SGR_STATE", ERROR_NOT_AVAILABLE))
+                else:
+                    childs.append(value("TAG_SGR_STATE", self.sg_ready_state))
+            elif not child.isTag("TAG_SGR_INDEX"):
+                childs.append(
+                    error_value(_response_name(child.getTagName()), ERROR_NOT_HANDLED)
+                )
+        return container("TAG_SGR_DATA", *childs)
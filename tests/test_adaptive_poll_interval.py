@@ -0,0 +1,62 @@
+"This file defines tests for the AdaptivePollInterval."
+
+from pathlib import Path
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.model.AdaptivePollInterval import AdaptivePollInterval
+import pytest
+
+
+def test_interval_grows_while_steady() -> None:
+    """Without changes the interval grows after the steady polls up to the maximum."""
+    interval = AdaptivePollInterval(10, 5, 20, steady_polls=2, growth=1.5)
+
+    intervals = [interval.update({"power_pv": 1000}) for _ in range(8)]
+
+    assert intervals == [10, 15, 15, 20, 20, 20, 20, 20]
+
+
+def test_interval_drops_on_transient() -> None:
+    """A change above the threshold sets the minimum interval at once."""
+    interval = AdaptivePollInterval(30, 5, 60, thresholds={"power_pv": 200})
+    interval.update({"power_pv": 1000, "cp_state": "A"})
+
+    assert interval.update({"power_pv": 1150, "cp_state": "A"}) == 30
+    assert interval.change == pytest.approx(0.75)
+    assert interval.update({"power_pv": 1400, "cp_state": "A"}) == 5
+    assert interval.change == pytest.approx(1.25)
+
+
+@pytest.mark.parametrize(
+    ("former", "snapshot"),
+    [
+        ({"cp_state": "A"}, {"cp_state": "C"}),
+        ({"sun_mode": False}, {"sun_mode": True}),
+        ({"power_home": None}, {"power_home": 300}),
+        ({}, {"sg_ready_state": 2}),
+    ],
+)
+def test_changed_states_are_transients(former, snapshot) -> None:
+    """Changed states and values which appear are transients."""
+    interval = AdaptivePollInterval(30, 5, 60)
+    interval.update(former)
+
+    assert interval.update(snapshot) == 5
+    assert interval.change == 1
+
+
+def test_interval_is_kept_within_bounds() -> None:
+    """The start interval is limited to the bounds, invalid bounds are rejected."""
+    assert AdaptivePollInterval(1, 5, 60).interval == 5
+    assert AdaptivePollInterval(100, 5, 60).interval == 60
+
+    with pytest.raises(ValueError):
+        AdaptivePollInterval(10, 30, 20)
+    with pytest.raises(ValueError):
+        AdaptivePollInterval(10, 0, 20)
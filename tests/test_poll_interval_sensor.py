@@ -0,0 +1,37 @@
+"Tests the poll interval sensor!"
+
+from datetime import timedelta
+from pathlib import Path
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+
+from unittest.mock import Mock
+
+from e3dc_rscp_connect.entities import PollIntervalSensor
+from e3dc_rscp_connect.model.AdaptivePollInterval import AdaptivePollInterval
+
+
+def test_poll_interval_sensor_value() -> None:
+    """Test that PollIntervalSensor returns the update interval of the coordinator."""
+    entry = type("MockEntry", (), {"entry_id": "test_entry_id"})
+    coordinator = Mock()
+    coordinator.storage.serial = "S10-123"
+    coordinator.update_interval = timedelta(seconds=15)
+    coordinator.poll_interval = AdaptivePollInterval(15, 5, 60)
+
+    sensor = PollIntervalSensor(coordinator, entry)
+
+    assert sensor.native_value == 15
+    assert sensor.extra_state_attributes == {
+        "minimum": 5,
+        "maximum": 60,
+        "change": 0,
+    }
+    assert sensor._attr_unique_id == "s10_123_poll_interval"
+    assert sensor._attr_entity_category.value == "diagnostic"
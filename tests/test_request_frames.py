@@ -0,0 +1,170 @@
+"""Golden byte tests for the request frames generated by the RSCP models."""
+
+from pathlib import Path
+import struct
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+from e3dc_rscp_connect.model.SgReadyRscpModel import SgReadyRscpModel
+from e3dc_rscp_connect.model.StorageRscpModel import StorageRscpModel
+from e3dc_rscp_connect.model.WallboxRscpModel import WallboxRscpModel
+import pytest
+
+from .fake_e3dc import ERROR_NOT_AVAILABLE, container, error_value, value
+
+# frame data (without frame header) as it was generated by the former encoder
+GOLDEN_FRAME_DATA = {
+    "storage_ident": "0100000a0000000a00000a0000001900000a0000003e00000a000000",
+    "wallbox_ident": (
+        "0000040e0e1d000100040e030100005110840e0000004200000e0000002f00000e000000"
+        "0000040e0e1d000100040e030100015110840e0000004200000e0000002f00000e000000"
+        "0000040e0e1d000100040e030100025110840e0000004200000e0000002f00000e000000"
+        "0000040e0e1d000100040e030100035110840e0000004200000e0000002f00000e000000"
+        "0000040e0e1d000100040e030100045110840e0000004200000e0000002f00000e000000"
+        "0000040e0e1d000100040e030100055110840e0000004200000e0000002f00000e000000"
+        "0000040e0e1d000100040e030100065110840e0000004200000e0000002f00000e000000"
+    ),
+    "sgr_ident": "000004120e100001000412050200ff0001000012000000",
+    "storage_first": (
+        "03000001000000020000010000000400000100000001000001000000050000010000001f"
+        "0000010000002000000100000008000001000000000004020e2100010004020502000000"
+        "01c00d020301000001c00d020301000101c00d0203010002000004020e21000100040205"
+        "0200010001c00d020301000001c00d020301000101c00d0203010002000004020e210001"
+        "000402050200020001c00d020301000001c00d020301000101c00d020301000200000402"
+        "0e210001000402050200030001c00d020301000001c00d020301000101c00d0203010002"
+        "000004020e210001000402050200040001c00d020301000001c00d020301000101c00d02"
+        "03010002000004020e210001000402050200050001c00d020301000001c00d0203010001"
+        "01c00d0203010002000004020e210001000402050200060001c00d020301000001c00d02"
+        "0301000101c00d020301000273000001000000000004030e100001000403050200000000"
+        "000603000000000004030e100001000403050200010000000603000000"
+    ),
+    "storage_with_inverter": (
+        "03000001000000020000010000000400000100000001000001000000050000010000001f"
+        "0000010000002000000100000008000001000000000004020e2100010004020502000000"
+        "01c00d020301000001c00d020301000101c00d020301000273000001000000000004030e"
+        "100001000403050200000000000603000000"
+    ),
+    "wallbox": (
+        "0000040e0e1d000100040e030100024d00000e0000004c00000e0000003810040e000000"
+        "0000040e0e16000100040e030100022710040e0000000000060e0000000000040e0e1e00"
+        "0100040e030100022910040e070400000000002910040e07040001000000"
+    ),
+    "sgr": "000004120e100001000412050200ff0001000012000000",
+    "sun_mode": "0000040e0e10000100040e030100013910040e01010001",
+    "auth": "010000000e1400020000000d040075736572030000000d02007077",
+}
+
+
+def _not_available(namespace: str, index: int) -> bytes:
+    "Returns the packed error reply for a device index which doesn't exist."
+    return container(
+        f"{namespace}_DATA",
+        value(f"{namespace}_INDEX", index),
+        error_value(f"{namespace}_REQ_DATA", ERROR_NOT_AVAILABLE),
+    )
+
+
+def _unpacked(data: bytes) -> RscpValue:
+    result = RscpValue()
+    result.unpack(data)
+    return result
+
+
+def _poll_tags(model) -> list[RscpValue]:
+    "Returns the tags of all poll groups of a model."
+    return (
+        model.get_rscp_tags_fast() + model.get_rscp_tags() + model.get_rscp_tags_slow()
+    )
+
+
+def _storage_requests() -> dict[str, list[RscpValue]]:
+    storage = StorageRscpModel("S10-123", "A-123", "00:11:22:33:44:55", "S10_2024_01")
+    requests = {"storage_first": _poll_tags(storage)}
+    storage.handle_rscp_data(
+        RscpValue.construct_rscp_value(
+            "TAG_PVI_DATA",
+            [
+                ("TAG_PVI_INDEX", 0),
+                ("TAG_PVI_DC_POWER", [("TAG_PVI_INDEX", 0), ("TAG_PVI_VALUE", None)]),
+            ],
+        )
+    )
+    storage.handle_rscp_data(
+        RscpValue.construct_rscp_value(
+            "TAG_BAT_DATA",
+            [
+                ("TAG_BAT_INDEX", 0),
+                (
+                    "TAG_BAT_DEVICE_STATE",
+                    [
+                        ("TAG_BAT_DEVICE_CONNECTED", True),
+                        ("TAG_BAT_DEVICE_WORKING", True),
+                    ],
+                ),
+            ],
+        )
+    )
+    # the other probed indexes are answered with errors
+    for index in range(1, 7):
+        storage.handle_rscp_data(_unpacked(_not_available("TAG_PVI", index)))
+    storage.handle_rscp_data(_unpacked(_not_available("TAG_BAT", 1)))
+    requests["storage_with_inverter"] = _poll_tags(storage)
+    return requests
+
+
+def _model_requests() -> dict:
+    requests = {
+        "storage_ident": StorageRscpModel.get_identification_tags(),
+        "wallbox_ident": WallboxRscpModel.get_identification_tags(),
+        "sgr_ident": SgReadyRscpModel.get_identification_tags(),
+        "wallbox": _poll_tags(WallboxRscpModel(2)),
+        "sgr": SgReadyRscpModel().get_rscp_tags(),
+        "sun_mode": WallboxRscpModel(1).get_sun_mode_request(True),
+        "auth": RscpValue().withTagName(
+            "TAG_RSCP_REQ_AUTHENTICATION",
+            [
+                RscpValue().withTagName("TAG_RSCP_AUTHENTICATION_USER", "user"),
+                RscpValue().withTagName("TAG_RSCP_AUTHENTICATION_PASSWORD", "pw"),
+            ],
+        ),
+    }
+    requests.update(_storage_requests())
+    return requests
+
+
+MODEL_REQUESTS = _model_requests()
+
+
+@pytest.mark.parametrize("name", sorted(GOLDEN_FRAME_DATA))
+def test_request_frame_golden_bytes(name) -> None:
+    """The frames of all model requests are byte identical to the golden frames."""
+    frame = RscpFrame().packFrame(MODEL_REQUESTS[name])
+    expected = bytes.fromhex(GOLDEN_FRAME_DATA[name])
+
+    header_size = RscpFrame.frame_header.size
+    magic, ctrl, _seconds, nanoseconds, data_length = struct.unpack_from(
+        "<HHQIH", frame
+    )
+    assert (magic, ctrl, nanoseconds) == (0xDCE3, 0x0100, 0)
+    assert data_length == len(expected)
+    assert frame[header_size:] == expected
+
+
+@pytest.mark.parametrize("name", sorted(GOLDEN_FRAME_DATA))
+def test_pack_into_appends(name) -> None:
+    """pack_into appends to the buffer and matches pack."""
+    values = MODEL_REQUESTS[name]
+    if isinstance(values, RscpValue):
+        values = [values]
+
+    buffer = bytearray(b"\xaa")
+    for value in values:
+        value.pack_into(buffer)
+    assert buffer == b"\xaa" + b"".join(value.pack() for value in values)
@@ -0,0 +1,359 @@
+"This file defines end to end tests of the RscpClient against a simulated device."
+
+import asyncio
+import sys
+from pathlib import Path
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.client import RscpClient, RscpCommandError
+from e3dc_rscp_connect.coordinator import supervisor_probe_interval
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+from e3dc_rscp_connect.model.RscpHandlerPipeline import POLL_NORMAL, POLL_SLOW
+import pytest
+
+from .fake_e3dc import FakeE3dc, FakeWallbox
+
+
+def create_client(device: FakeE3dc, password: str = "password", **kwargs) -> RscpClient:
+    "Returns a client for the simulated device."
+    return RscpClient(
+        "127.0.0.1", device.port, device.username, password, device.rscp_key, **kwargs
+    )
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    ("fragment_size", "latency"), [(None, 0), (7, 0), (1000, 0.01)]
+)
+async def test_identify_and_fetch(fragment_size, latency):
+    "Test that the models are identified and updated by polling."
+    async with FakeE3dc(fragment_size=fragment_size, latency=latency) as device:
+        device.wallboxes[1] = FakeWallbox(serial="WB-00000002", parameters=200)
+        client = create_client(device)
+
+        await client.identify_device()
+        assert client.storage.serial == "S10-123456789012"
+        assert [x.serial for x in client.wallboxes] == ["WB-00000001", "WB-00000002"]
+        assert client.sg_ready.state == 1
+
+        # the first poll probes the inverters
+        await client.fetch_data()
+        await client.fetch_data()
+        assert client.storage.powers.pv == 3400
+        assert client.storage.bat_soc == 87
+        assert list(client.storage.inverters) == [0]
+        assert client.storage.inverters[0].power_mppt == {0: 1200, 1: 800, 2: 0}
+        assert client.storage.device_states.battery[0].working
+        assert client.get_wallbox(1).cp_state == "C"
+        assert client.get_wallbox(1).assigned_power == 3 * 3680
+
+        device.values["TAG_EMS_POWER_PV"] = 5000
+        device.wallboxes[0].cp_state = "A"
+        await client.fetch_data()
+        assert client.storage.powers.pv == 5000
+        assert client.get_wallbox(0).cp_state == "A"
+
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_identify_again_verifies_known_devices():
+    "Test that a second identification only verifies the known devices."
+    async with FakeE3dc() as device:
+        client = create_client(device, poll_periods={POLL_NORMAL: 1, POLL_SLOW: 1})
+        await client.identify_device()
+        await client.fetch_data()
+        await client.fetch_data()
+        assert client.topology == {
+            "wallboxes": [0],
+            "inverters": [0],
+            "batteries": [0],
+            "sg_ready": True,
+        }
+        wallbox = client.get_wallbox(0)
+
+        device.values["TAG_INFO_SW_RELEASE"] = "S10_2025_01"
+        device.wallboxes[1] = FakeWallbox(serial="WB-00000002")
+        await client.identify_device()
+        assert [x.getTagName() for x in device.last_request] == [
+            "TAG_INFO_REQ_SERIAL_NUMBER",
+            "TAG_INFO_REQ_SW_RELEASE",
+            "TAG_WB_REQ_DATA",
+        ]
+        assert client.storage.sw_version == "S10_2025_01"
+        # the wallbox keeps its model, the new one is found with the next probe
+        assert client.get_wallbox(0) is wallbox
+        assert [x.serial for x in client.wallboxes] == ["WB-00000001"]
+
+        # the polls carry no probes and no duplicated wallbox requests
+        await client.fetch_data()
+        requests = [x.getTagName() for x in device.last_request]
+        assert requests.count("TAG_PVI_REQ_DATA") == 1
+        assert requests.count("TAG_BAT_REQ_DATA") == 1
+        # one request for each poll group of the wallbox
+        assert requests.count("TAG_WB_REQ_DATA") == 3
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_identify_probes_absent_devices():
+    "Test that the absent devices are probed after the probe interval."
+    async with FakeE3dc() as device:
+        client = create_client(device, probe_interval=0)
+        await client.identify_device()
+        wallbox = client.get_wallbox(0)
+
+        device.wallboxes[3] = FakeWallbox(serial="WB-00000004")
+        await client.identify_device()
+        assert client.get_wallbox(0) is wallbox
+        assert client.topology["wallboxes"] == [0, 3]
+
+        del device.wallboxes[0]
+        await client.identify_device()
+        assert client.topology["wallboxes"] == [3]
+
+        await client.fetch_data()
+        requests = [x for x in device.last_request if x.isTag("TAG_WB_REQ_DATA")]
+        assert {x.get_child("TAG_WB_INDEX").getValue() for x in requests} == {3}
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_command_in_poll_frame():
+    "Test that a queued command is sent with the next poll and answered."
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        await client.identify_device()
+        await client.fetch_data()
+        frames_received = device.frames_received
+
+        command = client.queue_set_sun_mode_request(0, False)
+        assert not command.done()
+        await client.fetch_data()
+
+        assert (await command).getValue() is False
+        assert device.frames_received == frames_received + 1
+        assert not device.wallboxes[0].sun_mode
+        assert client.get_wallbox(0).sun_mode is False
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_command_errors():
+    "Test that unanswered commands and failed frames are passed to the futures."
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        await client.identify_device()
+
+        unknown = client.queue_command(
+            RscpValue.construct_rscp_value(
+                "TAG_WB_REQ_DATA",
+                [("TAG_WB_INDEX", 5), ("TAG_WB_REQ_SET_SUN_MODE_ACTIVE", True)],
+            ),
+            "TAG_WB_DATA(TAG_WB_INDEX==5)/TAG_WB_SET_SUN_MODE_ACTIVE",
+        )
+        await client.fetch_data()
+        with pytest.raises(RscpCommandError):
+            await unknown
+
+        with pytest.raises(ValueError):
+            client.queue_set_sun_mode_request(5, True)
+
+        device.disconnect_clients()
+        lost = client.queue_set_sun_mode_request(0, False)
+        with pytest.raises(Exception):
+            await client.fetch_data()
+        with pytest.raises(Exception):
+            await lost
+        assert device.wallboxes[0].sun_mode
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_failed_poll_is_repeated():
+    "Test that the groups of a failed poll are sent with the next poll."
+    async with FakeE3dc() as device:
+        client = create_client(device, poll_periods={POLL_NORMAL: 2, POLL_SLOW: 3})
+        await client.identify_device()
+        for _ in range(3):
+            await client.fetch_data()
+
+        # the slow group with the battery states is due in this cycle
+        device.disconnect_clients()
+        with pytest.raises(Exception):
+            await client.fetch_data()
+
+        await client.fetch_data()
+        requests = [x.getTagName() for x in device.last_request]
+        assert "TAG_BAT_REQ_DATA" in requests
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_cancel_command():
+    "Test that a cancelled command is taken out of the queue and not sent."
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        await client.identify_device()
+
+        command = client.queue_set_sun_mode_request(0, False)
+        client.cancel_command(command)
+        assert command.cancelled()
+        await client.fetch_data()
+
+        requests = [x for x in device.last_request if x.isTag("TAG_WB_REQ_DATA")]
+        assert not any(x.get_child("TAG_WB_REQ_SET_SUN_MODE_ACTIVE") for x in requests)
+        assert device.wallboxes[0].sun_mode
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_wrong_password():
+    "Test that a failed authentication is reported."
+    async with FakeE3dc() as device:
+        client = create_client(device, password="wrong")
+        with pytest.raises(Exception):
+            await client.identify_device()
+        assert not client.client.is_authorized()
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_reconnect_after_disconnect():
+    "Test that the client connects again after the device closed the connection."
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        await client.identify_device()
+
+        device.disconnect_clients()
+        with pytest.raises(Exception):
+            await client.fetch_data()
+        assert not client.client.is_connected()
+
+        await client.fetch_data()
+        assert device.connections == 2
+        client.client.disconnect()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_requests():
+    "Test that concurrent polls, identification and commands share one connection."
+    async with FakeE3dc(latency=0.01) as device:
+        client = create_client(device)
+        await client.identify_device()
+        await client.fetch_data()
+
+        command = client.queue_set_sun_mode_request(0, False)
+        await asyncio.gather(
+            client.fetch_data(),
+            client.fetch_data(),
+            client.identify_device(),
+            client.fetch_data(),
+        )
+
+        assert (await command).getValue() is False
+        assert device.connections == 1
+        assert client.client.is_connected()
+        client.client.disconnect()
+
+
+def start_supervisor(client: RscpClient):
+    "Starts a supervisor with short intervals for the tests."
+    return client.start_supervisor(
+        probe_interval=0.05,
+        probe_timeout=0.05,
+        min_backoff=0.01,
+        max_backoff=0.04,
+        connect_timeout=0.1,
+    )
+
+
+@pytest.mark.asyncio
+async def test_supervisor_reconnects_in_background():
+    "Test that a closed connection is noticed by a probe and connected again."
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        supervisor = start_supervisor(client)
+        assert await supervisor.wait_ready(1)
+        await client.identify_device()
+        await client.fetch_data()
+
+        device.disconnect_clients()
+        await asyncio.sleep(0.2)
+        assert supervisor.is_ready()
+        assert supervisor.reconnects == 1
+        assert device.connections == 2
+
+        await client.fetch_data()
+        assert client.storage.powers.pv == 3400
+        await client.close()
+        assert not supervisor.running
+
+
+@pytest.mark.asyncio
+async def test_supervisor_detects_unresponsive_device():
+    "Test that a device which doesn't answer the probes is disconnected."
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        supervisor = start_supervisor(client)
+        assert await supervisor.wait_ready(1)
+
+        device.unresponsive = True
+        await asyncio.sleep(0.15)
+        assert supervisor.failed_probes >= 1
+        assert not supervisor.is_ready()
+        # polls fail at once, while the supervisor reconnects
+        with pytest.raises(Exception):
+            await client.fetch_data()
+
+        device.unresponsive = False
+        assert await supervisor.wait_ready(1)
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_doesnt_probe_polled_connection():
+    "Test that a connection polled every maximum update interval gets no probes."
+    maximum = 0.05
+    async with FakeE3dc() as device:
+        client = create_client(device)
+        supervisor = client.start_supervisor(
+            probe_interval=supervisor_probe_interval(maximum, margin=0.05)
+        )
+        assert await supervisor.wait_ready(1)
+        await client.identify_device()
+
+        for _ in range(10):
+            await client.fetch_data()
+            await asyncio.sleep(maximum)
+        assert supervisor.probes == 0
+
+        # without polls the connection is probed
+        await asyncio.sleep(0.2)
+        assert supervisor.probes >= 1
+        await client.close()
+
+
+@pytest.mark.asyncio
+async def test_supervisor_backoff():
+    "Test that failed reconnects are repeated until the device is back."
+    device = FakeE3dc()
+    port = await device.start()
+    client = create_client(device)
+    supervisor = start_supervisor(client)
+    assert await supervisor.wait_ready(1)
+
+    await device.close()
+    await asyncio.sleep(0.2)
+    assert supervisor.failed_attempts >= 3
+    assert not await supervisor.wait_ready(0.01)
+
+    await device.start(port=port)
+    assert await supervisor.wait_ready(1)
+    await client.close()
+    await device.close()
@@ -0,0 +1,278 @@
+"This file defines tests for the RscpConnection and its transports."
+
+import asyncio
+from pathlib import Path
+import socket
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc.RscpConnection import (
+    RscpConnection,
+    RscpConnectionException,
+)
+from e3dc_rscp_connect.e3dc.RscpCryptoWorker import RscpCryptoWorker
+from e3dc_rscp_connect.e3dc.RscpEncryption import RscpEncryption
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpRequestScheduler import (
+    PRIORITY_BULK,
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+)
+from e3dc_rscp_connect.e3dc.RscpTransport import (
+    RscpSocketTransport,
+    RscpStreamTransport,
+    set_keepalive,
+)
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+import pytest
+
+FRAME = RscpFrame().packFrame(
+    [RscpValue().withTagName("TAG_INFO_SERIAL_NUMBER", "S10-" + "9" * 5000)]
+)
+
+TRANSPORTS = [RscpSocketTransport, RscpStreamTransport]
+
+
+async def start_server(reply: bytes):
+    "Starts a server which sends reply in two parts after it received any data."
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.read(1024)
+        writer.write(reply[:100])
+        await writer.drain()
+        await asyncio.sleep(0.01)
+        writer.write(reply[100:])
+        await writer.drain()
+        await reader.read(1024)
+        writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", TRANSPORTS)
+async def test_receive_frame(transport):
+    "Test that a frame which arrives in several parts is received completely."
+    server = await start_server(FRAME)
+    port = server.sockets[0].getsockname()[1]
+    connection = RscpConnection("127.0.0.1", port, transport=transport())
+
+    await connection.connect()
+    assert connection.is_connected()
+    await connection.send(b"request")
+    assert await connection.receive() == FRAME
+
+    connection.disconnect()
+    assert not connection.is_connected()
+    server.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", TRANSPORTS)
+async def test_receive_timeout(transport):
+    "Test that the connection is closed if a frame is not complete in time."
+    server = await start_server(FRAME[:-1])
+    port = server.sockets[0].getsockname()[1]
+    connection = RscpConnection("127.0.0.1", port, transport=transport())
+
+    await connection.connect()
+    await connection.send(b"request")
+    with pytest.raises(RscpConnectionException):
+        await connection.receive(timeout=0.1)
+    assert not connection.is_connected()
+    server.close()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("transport", TRANSPORTS)
+async def test_connect_refused(transport):
+    "Test that a refused connection raises a RscpConnectionException."
+    server = await asyncio.start_server(lambda r, w: None, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    server.close()
+    await server.wait_closed()
+
+    connection = RscpConnection("127.0.0.1", port, transport=transport())
+    with pytest.raises(RscpConnectionException):
+        await connection.connect()
+    assert not connection.is_connected()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("threshold", [0, 1 << 20])
+async def test_receive_encrypted(threshold):
+    "Test that encrypted frames are decrypted on the event loop or in the executor."
+    server_encryption = RscpEncryption("secret key")
+    server = await start_server(
+        server_encryption.encrypt(FRAME) + server_encryption.encrypt(FRAME)
+    )
+    port = server.sockets[0].getsockname()[1]
+    connection = RscpConnection(
+        "127.0.0.1",
+        port,
+        RscpEncryption("secret key"),
+        crypto_offload_threshold=threshold,
+    )
+
+    await connection.connect()
+    await connection.send(b"request")
+    assert await connection.receive() == FRAME
+    assert await connection.receive() == FRAME
+
+    stats = connection.crypto_stats
+    assert stats.encrypted_bytes == len(b"request")
+    assert stats.decrypted_bytes == 2 * (len(FRAME) + -len(FRAME) % 32)
+    if threshold:
+        assert stats.offloaded_calls == 0
+        assert stats.executor_seconds == 0
+        assert stats.loop_seconds > 0
+    else:
+        assert stats.offloaded_calls == stats.calls
+        assert stats.executor_seconds > 0
+
+    connection.disconnect()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_crypto_worker_order():
+    "Test that concurrent offloaded encryptions continue the CBC chain in call order."
+    messages = [bytes([index]) * 5000 for index in range(8)]
+    reference = RscpEncryption("secret key")
+    expected = [reference.encrypt(message) for message in messages]
+
+    worker = RscpCryptoWorker(RscpEncryption("secret key"), offload_threshold=0)
+    results = await asyncio.gather(*(worker.encrypt(m) for m in messages))
+    assert results == expected
+    assert worker.stats.offloaded_calls == len(messages)
+
+
+def serial_frame(serial: str) -> bytes:
+    "Returns a frame with a serial number."
+    return RscpFrame().packFrame(
+        [RscpValue().withTagName("TAG_INFO_SERIAL_NUMBER", serial)]
+    )
+
+
+async def start_echo_server(delay: float, requests: list):
+    "Starts a server which records each frame and sends it back after delay seconds."
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                header = await reader.readexactly(RscpFrame.frame_header.size)
+                frame = header + await reader.readexactly(
+                    RscpFrame.getFrameLength(header) - len(header)
+                )
+                requests.append(frame)
+                await asyncio.sleep(delay)
+                writer.write(frame)
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    return await asyncio.start_server(handle, "127.0.0.1", 0)
+
+
+async def connect_echo_server(delay: float, requests: list):
+    "Returns the server and a connection to an echo server."
+    server = await start_echo_server(delay, requests)
+    connection = RscpConnection("127.0.0.1", server.sockets[0].getsockname()[1])
+    await connection.connect()
+    return server, connection
+
+
+@pytest.mark.asyncio
+async def test_exchange_by_priority():
+    "Test that concurrent requests are exchanged one at a time by priority."
+    requests = []
+    server, connection = await connect_echo_server(0.02, requests)
+
+    frames = {name: serial_frame(name) for name in ("first", "bulk", "poll", "cmd")}
+    first = asyncio.create_task(connection.exchange(frames["first"], PRIORITY_BULK))
+    await asyncio.sleep(0)
+    waiting = [
+        connection.exchange(frames["bulk"], PRIORITY_BULK),
+        connection.exchange(frames["poll"], PRIORITY_POLL),
+        connection.exchange(frames["cmd"], PRIORITY_COMMAND),
+    ]
+    replies = await asyncio.gather(first, *waiting)
+
+    assert replies == [frames[x] for x in ("first", "bulk", "poll", "cmd")]
+    assert requests == [frames[x] for x in ("first", "cmd", "poll", "bulk")]
+    assert not connection.scheduler.busy
+    connection.disconnect()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_exchange_deadline_and_cancellation():
+    "Test that waiting requests leave the queue without disturbing the connection."
+    requests = []
+    server, connection = await connect_echo_server(0.1, requests)
+    loop = asyncio.get_running_loop()
+
+    # the frames contain the time, so they are built once
+    running_frame = serial_frame("running")
+    next_frame = serial_frame("next")
+    running = asyncio.create_task(connection.exchange(running_frame))
+    await asyncio.sleep(0)
+    cancelled = asyncio.create_task(connection.exchange(serial_frame("cancelled")))
+    await asyncio.sleep(0)
+    cancelled.cancel()
+    with pytest.raises(RscpConnectionException):
+        await connection.exchange(serial_frame("late"), deadline=loop.time() + 0.02)
+    with pytest.raises(asyncio.CancelledError):
+        await cancelled
+
+    assert await running == running_frame
+    assert await connection.exchange(next_frame) == next_frame
+    assert requests == [running_frame, next_frame]
+    assert connection.is_connected()
+    connection.disconnect()
+    server.close()
+
+
+@pytest.mark.asyncio
+async def test_exchange_cancelled_while_receiving():
+    "Test that the connection is closed, if the reply of a request is not received."
+    requests = []
+    server, connection = await connect_echo_server(0.1, requests)
+
+    task = asyncio.create_task(connection.exchange(serial_frame("running")))
+    await asyncio.sleep(0.02)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert not connection.is_connected()
+    assert not connection.scheduler.busy
+    server.close()
+
+
+def test_set_keepalive():
+    "Test that TCP keepalive is enabled on a socket."
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as sock:
+        set_keepalive(sock, 7, 3, 2)
+        assert sock.getsockopt(socket.SOL_SOCKET, socket.SO_KEEPALIVE)
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPIDLE) == 7
+            assert sock.getsockopt(socket.IPPROTO_TCP, socket.TCP_KEEPCNT) == 2
+
+
+@pytest.mark.asyncio
+async def test_probe():
+    "Test that a probe of an echo server fails and closes the connection."
+    requests = []
+    server, connection = await connect_echo_server(0, requests)
+
+    # the echo server answers with the request instead of the user level
+    assert not await connection.probe(timeout=0.1)
+    assert not connection.is_connected()
+    assert len(requests) == 1
+    server.close()
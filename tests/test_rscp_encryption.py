@@ -0,0 +1,114 @@
+"This file defines tests for the RscpEncryption and its cipher backends."
+
+import os
+from pathlib import Path
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc.RscpEncryption import RscpEncryption
+from e3dc_rscp_connect.e3dc.RscpRijndael import (
+    _INV_SBOX,
+    _SBOX,
+    _TD,
+    _TE,
+    Rijndael256Cbc,
+    expand_key,
+)
+import py3rijndael
+from py3rijndael import constants
+import pytest
+
+KEY = os.urandom(32)
+IV = os.urandom(32)
+
+# message lengths around the block size, as they are encrypted one after another
+MESSAGES = [os.urandom(length) for length in (0, 1, 31, 32, 33, 64, 100, 1000)]
+
+
+def test_tables():
+    "Test that the computed tables match the tables of py3rijndael."
+    assert list(_SBOX) == constants.S
+    assert list(_INV_SBOX) == constants.Si
+    assert [list(table) for table in _TE] == [
+        constants.T1,
+        constants.T2,
+        constants.T3,
+        constants.T4,
+    ]
+    assert [list(table) for table in _TD] == [
+        constants.T5,
+        constants.T6,
+        constants.T7,
+        constants.T8,
+    ]
+
+
+def test_expand_key():
+    "Test that the round keys match the key schedule of py3rijndael."
+    reference = py3rijndael.Rijndael(KEY, block_size=32)
+    encryption_keys, decryption_keys = expand_key(KEY)
+    assert [list(keys) for keys in encryption_keys] == reference.Ke
+    assert [list(keys) for keys in decryption_keys] == reference.Kd
+
+
+@pytest.mark.parametrize("length", [0, 16, 33])
+def test_invalid_sizes(length):
+    "Test that keys and IVs of the wrong size are rejected."
+    with pytest.raises(ValueError):
+        Rijndael256Cbc(os.urandom(length), IV)
+    with pytest.raises(ValueError):
+        Rijndael256Cbc(KEY, os.urandom(length))
+
+
+def test_cbc_chain():
+    "Test that consecutive messages continue the CBC chain like py3rijndael."
+    cipher = Rijndael256Cbc(KEY, IV)
+    iv = IV
+    for message in MESSAGES:
+        expected = py3rijndael.RijndaelCbc(
+            KEY, iv, padding=py3rijndael.ZeroPadding(32), block_size=32
+        ).encrypt(message)
+        assert cipher.encrypt(message) == expected
+        iv = expected[-32:] if expected else iv
+
+    cipher.reset(IV)
+    decrypted = Rijndael256Cbc(KEY, IV)
+    for message in MESSAGES:
+        plaintext = decrypted.decrypt(cipher.encrypt(message))
+        assert plaintext == message + bytes(-len(message) % 32)
+
+
+def test_decrypt_partial_block():
+    "Test that only whole blocks can be decrypted."
+    with pytest.raises(ValueError):
+        Rijndael256Cbc(KEY, IV).decrypt(bytes(33))
+
+
+@pytest.mark.parametrize("key", ["", "secret key", "k" * 32])
+def test_backends(key):
+    "Test that both backends of RscpEncryption produce the same stream."
+    table = RscpEncryption(key)
+    reference = RscpEncryption(key, backend="py3rijndael")
+    assert table.backend == "rijndael256"
+    assert reference.backend == "py3rijndael"
+
+    # py3rijndael loses the IV after an empty message, RSCP never sends one
+    for message in MESSAGES[1:]:
+        ciphertext = table.encrypt(message)
+        assert ciphertext == reference.encrypt(message)
+        assert table.decrypt(ciphertext) == reference.decrypt(ciphertext)
+
+    table.reset()
+    reference.reset()
+    assert table.encrypt(MESSAGES[-1]) == reference.encrypt(MESSAGES[-1])
+
+
+def test_unknown_backend():
+    "Test that an unknown backend is rejected."
+    with pytest.raises(ValueError):
+        RscpEncryption("secret key", backend="aes")
@@ -0,0 +1,89 @@
+"This file defines tests for the RscpFrameReader."
+
+from pathlib import Path
+import struct
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc.RscpEncryption import RscpEncryption
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpFrameReader import RscpFrameReader
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+import pytest
+
+KEY = "secret key"
+
+
+def create_frame(serial: str) -> bytes:
+    "Creates a frame with a serial number of variable length."
+    return RscpFrame().packFrame(
+        [RscpValue().withTagName("TAG_INFO_SERIAL_NUMBER", serial)]
+    )
+
+
+FRAMES = [create_frame("S10-1"), create_frame("S10-" + "9" * 200), create_frame("")]
+
+
+def encrypt_frames(frames: list[bytes]) -> bytes:
+    "Encrypts each frame as separate message, like the device does."
+    encryption = RscpEncryption(KEY)
+    return b"".join(encryption.encrypt(frame) for frame in frames)
+
+
+def read_frames(reader: RscpFrameReader, data: bytes, chunk_size: int) -> list:
+    "Feeds data in chunks to the reader and collects all frames."
+    frames = []
+    for position in range(0, len(data), chunk_size):
+        reader.feed(data[position : position + chunk_size])
+        while (frame := reader.next_frame()) is not None:
+            frames.append(frame)
+    return frames
+
+
+@pytest.mark.parametrize("chunk_size", [1, 7, 32, 33, 4096])
+def test_read_plain_frames(chunk_size) -> None:
+    """Frames are reassembled from chunks of any size."""
+    reader = RscpFrameReader()
+    assert read_frames(reader, b"".join(FRAMES), chunk_size) == FRAMES
+
+
+@pytest.mark.parametrize("chunk_size", [1, 31, 32, 50, 4096])
+def test_read_encrypted_frames(chunk_size) -> None:
+    """Encrypted frames are decrypted block by block and the padding is dropped."""
+    reader = RscpFrameReader(RscpEncryption(KEY))
+    assert read_frames(reader, encrypt_frames(FRAMES), chunk_size) == FRAMES
+
+
+def test_incomplete_frame_is_kept() -> None:
+    """An incomplete frame is returned once the rest has been received."""
+    reader = RscpFrameReader()
+    frame = FRAMES[1]
+    reader.feed(frame[:20])
+    assert reader.next_frame() is None
+    reader.feed(frame[20:] + FRAMES[0][:5])
+    assert reader.next_frame() == frame
+    assert reader.next_frame() is None
+    reader.feed(FRAMES[0][5:])
+    assert reader.next_frame() == FRAMES[0]
+
+
+def test_reset_drops_data() -> None:
+    """After a reset no old data is returned."""
+    reader = RscpFrameReader()
+    reader.feed(FRAMES[0][:-1])
+    reader.reset()
+    reader.feed(FRAMES[2])
+    assert reader.next_frame() == FRAMES[2]
+
+
+def test_invalid_data() -> None:
+    """Data which isn't a frame raises a ValueError."""
+    reader = RscpFrameReader()
+    reader.feed(struct.pack("<HHQIH", 0x1234, 0, 0, 0, 0))
+    with pytest.raises(ValueError):
+        reader.next_frame()
@@ -0,0 +1,463 @@
+"This file defines tests for the RscpHandlerPipeline."
+
+from pathlib import Path
+import struct
+import sys
+from unittest.mock import patch
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpValue import RscpValue
+from e3dc_rscp_connect.model.RscpHandlerPipeline import (
+    POLL_FAST,
+    POLL_NORMAL,
+    POLL_SLOW,
+    RscpHandlerPipeline,
+)
+from e3dc_rscp_connect.model.SgReadyRscpModel import SgReadyRscpModel
+from e3dc_rscp_connect.model.StorageRscpModel import StorageRscpModel
+from e3dc_rscp_connect.model.WallboxRscpModel import WallboxRscpModel
+import pytest
+
+from .fake_e3dc import ERROR_NOT_AVAILABLE, container, error_value, value
+
+HEADER_SIZE = RscpFrame.frame_header.size
+
+EVERY_CYCLE = {POLL_FAST: 1, POLL_NORMAL: 1, POLL_SLOW: 1}
+
+
+def frame_data(frame: bytes) -> bytes:
+    "Returns the frame without header."
+    return frame[HEADER_SIZE:]
+
+
+def unpacked(data: bytes) -> RscpValue:
+    "Returns the unpacked value."
+    result = RscpValue()
+    result.unpack(data)
+    return result
+
+
+def packed(tags: list[RscpValue]) -> bytes:
+    "Returns the packed tags."
+    return b"".join(x.pack() for x in tags)
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_matches_collect_tags() -> None:
+    """The cached frame contains the same data as a frame of collect_tags."""
+    pipeline = RscpHandlerPipeline()
+    pipeline.add_handler(WallboxRscpModel(0))
+    pipeline.add_handler(SgReadyRscpModel())
+
+    frame = await pipeline.collect_frame()
+    expected = RscpFrame().packFrame(await pipeline.collect_tags())
+
+    assert frame_data(frame) == frame_data(expected)
+    assert RscpFrame.getFrameLength(frame) == len(expected)
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_reuses_packed_tags() -> None:
+    """The tags of a handler are only collected once, while the revision is unchanged."""
+    pipeline = RscpHandlerPipeline(EVERY_CYCLE)
+    wallbox = WallboxRscpModel(0)
+    pipeline.add_handler(wallbox)
+
+    with patch.object(
+        wallbox, "get_rscp_tags", wraps=wallbox.get_rscp_tags
+    ) as get_rscp_tags:
+        first = await pipeline.collect_frame()
+        second = await pipeline.collect_frame()
+
+    assert get_rscp_tags.call_count == 1
+    assert frame_data(first) == frame_data(second)
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_updates_time() -> None:
+    """Only the time is updated in a cached frame."""
+    pipeline = RscpHandlerPipeline(EVERY_CYCLE)
+    pipeline.add_handler(SgReadyRscpModel())
+
+    with patch("time.time", return_value=1000):
+        first = await pipeline.collect_frame()
+    with patch("time.time", return_value=2000):
+        second = await pipeline.collect_frame()
+
+    assert RscpFrame.frame_time.unpack_from(first, 4) == (1000, 0)
+    assert RscpFrame.frame_time.unpack_from(second, 4) == (2000, 0)
+    assert first[:4] == second[:4]
+    assert first[16:] == second[16:]
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_invalidated_by_new_handler() -> None:
+    """Adding a handler adds its tags to the frame."""
+    pipeline = RscpHandlerPipeline(EVERY_CYCLE)
+    pipeline.add_handler(SgReadyRscpModel())
+    first = await pipeline.collect_frame()
+
+    pipeline.add_handler(WallboxRscpModel(1))
+    second = await pipeline.collect_frame()
+
+    wallbox = WallboxRscpModel(1)
+    wallbox_data = packed(
+        wallbox.get_rscp_tags_fast()
+        + wallbox.get_rscp_tags()
+        + wallbox.get_rscp_tags_slow()
+    )
+    assert frame_data(second) == frame_data(first) + wallbox_data
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_invalidated_by_inverter_discovery() -> None:
+    """The storage probes are repeated until answered, then only inverter 0 is polled."""
+    pipeline = RscpHandlerPipeline(EVERY_CYCLE)
+    storage = StorageRscpModel("S10-123")
+    pipeline.add_handler(storage)
+
+    probe = await pipeline.collect_frame()
+    assert frame_data(await pipeline.collect_frame()) == frame_data(probe)
+
+    storage.handle_rscp_data(
+        RscpValue.construct_rscp_value(
+            "TAG_PVI_DATA",
+            [
+                ("TAG_PVI_INDEX", 0),
+                ("TAG_PVI_DC_POWER", [("TAG_PVI_INDEX", 0), ("TAG_PVI_VALUE", None)]),
+            ],
+        )
+    )
+    for index in range(1, 7):
+        storage.handle_rscp_data(
+            unpacked(
+                container(
+                    "TAG_PVI_DATA",
+                    value("TAG_PVI_INDEX", index),
+                    error_value("TAG_PVI_REQ_DATA", ERROR_NOT_AVAILABLE),
+                )
+            )
+        )
+    with_inverter = await pipeline.collect_frame()
+    assert frame_data(with_inverter) == packed(
+        storage.get_rscp_tags_fast()
+        + storage.get_rscp_tags()
+        + storage.get_rscp_tags_slow()
+    )
+    assert len(with_inverter) < len(probe)
+
+    # a new probe only asks for the absent indexes
+    storage.probe_devices()
+    assert frame_data(await pipeline.collect_frame()) == frame_data(probe)
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_polls_due_groups() -> None:
+    """Each poll group is only in the frames of the cycles where it is due."""
+    pipeline = RscpHandlerPipeline({POLL_NORMAL: 2, POLL_SLOW: 4})
+    wallbox = WallboxRscpModel(0)
+    pipeline.add_handler(wallbox)
+
+    fast = packed(wallbox.get_rscp_tags_fast())
+    normal = packed(wallbox.get_rscp_tags())
+    slow = packed(wallbox.get_rscp_tags_slow())
+    expected = [
+        fast + normal + slow,
+        fast,
+        fast + normal,
+        fast,
+        fast + normal + slow,
+        fast,
+    ]
+    frames = [frame_data(await pipeline.collect_frame()) for _ in expected]
+
+    assert frames == expected
+
+
+async def slow_poll_cycles(pipeline: RscpHandlerPipeline, cycles: int) -> list[int]:
+    "Collects frames for cycles and returns the cycles with the slow wallbox group."
+    slow = packed(WallboxRscpModel(0).get_rscp_tags_slow())
+    return [
+        cycle
+        for cycle in range(cycles)
+        if frame_data(await pipeline.collect_frame()).endswith(slow)
+    ]
+
+
+@pytest.mark.asyncio
+async def test_poll_failed_polls_groups_again() -> None:
+    """The groups of a frame which wasn't answered are due again in the next cycle."""
+    pipeline = RscpHandlerPipeline({POLL_NORMAL: 2, POLL_SLOW: 4})
+    pipeline.add_handler(WallboxRscpModel(0))
+    assert await slow_poll_cycles(pipeline, 5) == [0, 4]
+
+    pipeline.poll_failed()
+    assert await slow_poll_cycles(pipeline, 6) == [0, 4]
+
+    # a failure of the first frame of a handler
+    pipeline = RscpHandlerPipeline({POLL_NORMAL: 2, POLL_SLOW: 4})
+    pipeline.add_handler(WallboxRscpModel(0))
+    await pipeline.collect_frame()
+    pipeline.poll_failed()
+    assert await slow_poll_cycles(pipeline, 5) == [0, 4]
+
+
+@pytest.mark.asyncio
+async def test_set_poll_periods_rescales_pending_polls() -> None:
+    """Pending polls keep their time when the poll interval and the periods change."""
+    pipeline = RscpHandlerPipeline({POLL_NORMAL: 1, POLL_SLOW: 5})
+    pipeline.add_handler(WallboxRscpModel(0))
+    assert await slow_poll_cycles(pipeline, 1) == [0]
+
+    # the interval drops to a twelfth, the 4 remaining cycles become 48
+    pipeline.set_poll_periods({POLL_NORMAL: 6, POLL_SLOW: 60})
+    assert await slow_poll_cycles(pipeline, 49) == [48]
+
+    # the interval grows again, the pending poll is at most one period ahead
+    await slow_poll_cycles(pipeline, 10)
+    pipeline.set_poll_periods({POLL_NORMAL: 1, POLL_SLOW: 5})
+    assert await slow_poll_cycles(pipeline, 5) == [4]
+
+
+@pytest.mark.asyncio
+async def test_collect_frame_polls_new_handler_at_once() -> None:
+    """All poll groups of a new handler are due in the next cycle."""
+    pipeline = RscpHandlerPipeline()
+    pipeline.add_handler(WallboxRscpModel(0))
+    await pipeline.collect_frame()
+
+    wallbox = WallboxRscpModel(1)
+    pipeline.add_handler(wallbox)
+    frame = await pipeline.collect_frame()
+
+    assert frame_data(frame) == packed(
+        WallboxRscpModel(0).get_rscp_tags_fast()
+        + wallbox.get_rscp_tags_fast()
+        + wallbox.get_rscp_tags()
+        + wallbox.get_rscp_tags_slow()
+    )
+
+
+def test_set_poll_periods() -> None:
+    """Periods are only accepted for known poll groups and in full cycles."""
+    pipeline = RscpHandlerPipeline()
+    pipeline.set_poll_periods({POLL_SLOW: 10})
+    assert pipeline.poll_periods[POLL_SLOW] == 10
+
+    with pytest.raises(ValueError):
+        pipeline.set_poll_periods({"very_slow": 100})
+    with pytest.raises(ValueError):
+        pipeline.set_poll_periods({POLL_FAST: 0})
+
+
+@pytest.mark.asyncio
+async def test_process_keeps_values_of_other_poll_groups() -> None:
+    """A wallbox container of one poll group leaves the values of other groups."""
+    pipeline = RscpHandlerPipeline()
+    wallbox = WallboxRscpModel(0)
+    pipeline.add_handler(wallbox)
+
+    await pipeline.process(
+        [
+            RscpValue.construct_rscp_value(
+                "TAG_WB_DATA",
+                [
+                    ("TAG_WB_INDEX", 0),
+                    ("TAG_WB_CP_STATE", "C"),
+                    ("TAG_WB_SUN_MODE_ACTIVE", True),
+                ],
+            ),
+            RscpValue.construct_rscp_value(
+                "TAG_WB_DATA", [("TAG_WB_INDEX", 0), ("TAG_WB_DEVICE_STATE", [])]
+            ),
+        ]
+    )
+
+    assert wallbox.get_model().cp_state == "C"
+    assert wallbox.get_model().sun_mode is True
+
+
+@pytest.mark.asyncio
+async def test_process_clears_values_with_errors() -> None:
+    """Values of the fast group which are left out or answered with errors are cleared."""
+    pipeline = RscpHandlerPipeline()
+    wallbox = WallboxRscpModel(0)
+    storage = StorageRscpModel("S10-123")
+    pipeline.add_handler(wallbox)
+    pipeline.add_handler(storage)
+
+    await pipeline.process(
+        [
+            RscpValue.construct_rscp_value(
+                "TAG_WB_DATA",
+                [
+                    ("TAG_WB_INDEX", 0),
+                    ("TAG_WB_CP_STATE", "C"),
+                    ("TAG_WB_SUN_MODE_ACTIVE", True),
+                ],
+            ),
+            RscpValue().withTagName("TAG_EMS_BAT_SOC", 87),
+        ]
+    )
+    await pipeline.process(
+        [
+            unpacked(
+                container(
+                    "TAG_WB_DATA",
+                    value("TAG_WB_INDEX", 0),
+                    error_value("TAG_WB_CP_STATE", ERROR_NOT_AVAILABLE),
+                )
+            ),
+            unpacked(error_value("TAG_EMS_BAT_SOC", ERROR_NOT_AVAILABLE)),
+        ]
+    )
+
+    assert wallbox.get_model().cp_state is None
+    assert wallbox.get_model().sun_mode is None
+    assert storage.get_model().bat_soc is None
+
+
+def test_wallbox_reply_is_not_decoded_completely() -> None:
+    """The wallbox only decodes the childs it reads from a lazy container."""
+    wallbox = WallboxRscpModel(0)
+    # a child which can't be decoded, it must not be touched
+    unknown = struct.pack("<IBH", 0x0EFFFFFF, 0x03, 1) + b"\x00"
+    reply = RscpValue().withBuffer(
+        container(
+            "TAG_WB_DATA",
+            value("TAG_WB_INDEX", 0),
+            value("TAG_WB_CP_STATE", "C"),
+            unknown,
+        ),
+        lazy=True,
+    )
+
+    assert wallbox.handle_rscp_data(reply)
+    assert wallbox.get_model().cp_state == "C"
+    with pytest.raises(ValueError):
+        reply.getValue()
+
+
+class RecordingHandler(SgReadyRscpModel):
+    "Handler without routes, which records all offered values."
+
+    def __init__(self):
+        super().__init__()
+        self.offered = []
+
+    def get_rscp_routes(self):
+        return None
+
+    def handle_rscp_data(self, container: RscpValue) -> bool:
+        self.offered.append(container.getTagName())
+        return True
+
+
+def wallbox_data(index: int, cp_state: str) -> RscpValue:
+    "Returns a TAG_WB_DATA container of a wallbox."
+    return RscpValue.construct_rscp_value(
+        "TAG_WB_DATA", [("TAG_WB_INDEX", index), ("TAG_WB_CP_STATE", cp_state)]
+    )
+
+
+@pytest.mark.asyncio
+async def test_process_routes_by_index() -> None:
+    """Wallbox data is only passed to the wallbox with the matching index."""
+    pipeline = RscpHandlerPipeline()
+    wallboxes = [WallboxRscpModel(index) for index in range(3)]
+    for wallbox in wallboxes:
+        pipeline.add_handler(wallbox)
+
+    with patch.object(
+        wallboxes[0], "handle_rscp_data", wraps=wallboxes[0].handle_rscp_data
+    ) as handle_rscp_data:
+        await pipeline.process([wallbox_data(2, "C"), wallbox_data(1, "B")])
+
+    handle_rscp_data.assert_not_called()
+    assert wallboxes[1].get_model().cp_state == "B"
+    assert wallboxes[2].get_model().cp_state == "C"
+
+
+@pytest.mark.asyncio
+async def test_process_routes_namespace() -> None:
+    """All tags of a namespace are routed to the storage."""
+    pipeline = RscpHandlerPipeline()
+    storage = StorageRscpModel("S10-123")
+    pipeline.add_handler(storage)
+
+    await pipeline.process(
+        [
+            RscpValue().withTagName("TAG_EMS_BAT_SOC", 87),
+            RscpValue().withTagName("TAG_EMS_POWER_HOME", 512),
+            RscpValue().withTagName("TAG_EMS_EMERGENCY_POWER_STATUS", 2),
+        ]
+    )
+
+    model = storage.get_model()
+    assert model.bat_soc == 87
+    assert model.powers.home == 512
+    assert model.emergency_power_state == 2
+
+
+@pytest.mark.asyncio
+async def test_process_falls_back_to_unrouted_handlers() -> None:
+    """Values without route or not handled by the route are offered to unrouted handlers."""
+    pipeline = RscpHandlerPipeline()
+    pipeline.add_handler(WallboxRscpModel(0))
+    recorder = RecordingHandler()
+    pipeline.add_handler(recorder)
+
+    await pipeline.process(
+        [
+            wallbox_data(0, "A"),
+            wallbox_data(5, "A"),
+            RscpValue().withTagName("TAG_INFO_SERIAL_NUMBER", "S10-123"),
+        ]
+    )
+
+    assert recorder.offered == ["TAG_WB_DATA", "TAG_INFO_SERIAL_NUMBER"]
+
+
+def test_add_handler_with_unknown_route() -> None:
+    """Routes to unknown tags are rejected."""
+    pipeline = RscpHandlerPipeline()
+    handler = SgReadyRscpModel()
+    with patch.object(handler, "get_rscp_routes", return_value=["TAG_UNKNOWN"]):
+        with pytest.raises(ValueError):
+            pipeline.add_handler(handler)
+
+
+@pytest.mark.asyncio
+async def test_remove_handler() -> None:
+    """A removed handler polls no tags and gets no values anymore."""
+    pipeline = RscpHandlerPipeline(EVERY_CYCLE)
+    wallboxes = [WallboxRscpModel(index) for index in range(2)]
+    recorder = RecordingHandler()
+    for handler in [*wallboxes, recorder]:
+        pipeline.add_handler(handler)
+    await pipeline.collect_frame()
+
+    pipeline.remove_handler(wallboxes[0])
+    pipeline.remove_handler(recorder)
+
+    assert frame_data(await pipeline.collect_frame()) == packed(
+        wallboxes[1].get_rscp_tags_fast()
+        + wallboxes[1].get_rscp_tags()
+        + wallboxes[1].get_rscp_tags_slow()
+    )
+    await pipeline.process([wallbox_data(0, "B"), wallbox_data(1, "C")])
+    assert wallboxes[0].get_model().cp_state is None
+    assert wallboxes[1].get_model().cp_state == "C"
+    assert recorder.offered == []
+
+    # the index route is free for a new wallbox
+    wallbox = WallboxRscpModel(0)
+    pipeline.add_handler(wallbox)
+    await pipeline.process([wallbox_data(0, "B")])
+    assert wallbox.get_model().cp_state == "B"
@@ -0,0 +1,130 @@
+"This file defines tests for the RscpTags lookup functions."
+
+from pathlib import Path
+import subprocess
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc import RscpTagCodes, RscpTags
+from e3dc_rscp_connect.e3dc.RscpTagDatabase import (
+    DATABASE_PATH,
+    RscpTagDatabase,
+    build_database,
+)
+from e3dc_rscp_connect.e3dc.tags import NAMESPACES, load_namespace, load_tags
+import pytest
+
+
+def test_code_index_covers_all_namespaces() -> None:
+    """Every tag code of the table can be found in the code index."""
+    for name, description in RscpTags.rscpTags.items():
+        tag_name, tag_description = RscpTags.getTagByCode(description["tagvalue"])
+        assert tag_description["tagvalue"] == description["tagvalue"]
+        if tag_name != name:
+            # only duplicated codes may resolve to another name
+            assert RscpTags.rscpTags[tag_name]["tagvalue"] == description["tagvalue"]
+
+
+def test_get_tag_by_code() -> None:
+    """Test the lookup by code."""
+    assert RscpTags.getTagByCode(0x0E840000) == (
+        "TAG_WB_DATA",
+        RscpTags.rscpTags["TAG_WB_DATA"],
+    )
+    assert RscpTags.getTagByCode(0xDEADBEEF) is None
+
+
+def test_duplicated_code_resolves_to_first_definition() -> None:
+    """TAG_SE_PARAM_INDEX is defined twice, the first definition is used."""
+    assert RscpTags.getTagByCode(0x1B040000)[0] == "TAG_SE_PARAM_INDEX"
+
+
+def test_get_tag_by_name() -> None:
+    """Test the lookup by name."""
+    assert RscpTags.getTagByName("TAG_EMS_BAT_SOC") == (
+        "TAG_EMS_BAT_SOC",
+        RscpTags.rscpTags["TAG_EMS_BAT_SOC"],
+    )
+    assert RscpTags.getTagByName("TAG_DOES_NOT_EXIST") is None
+
+
+def test_find_tag_value() -> None:
+    """findTagValue keeps returning a single entry dict."""
+    assert RscpTags.findTagValue(0x01800008) == {
+        "TAG_EMS_BAT_SOC": RscpTags.rscpTags["TAG_EMS_BAT_SOC"]
+    }
+    assert RscpTags.findTagValue(0xDEADBEEF) is None
+
+
+def test_code_index_is_immutable() -> None:
+    """The code index can't be modified."""
+    with pytest.raises(TypeError):
+        RscpTags.rscpTagsByCode[0xDEADBEEF] = ("TAG_X", {})
+
+
+def test_tag_descriptions_are_immutable() -> None:
+    """The shared tag descriptions can't be modified."""
+    with pytest.raises(TypeError):
+        RscpTags.getTagByName("TAG_WB_DATA")[1]["tagvalue"] = 1
+    with pytest.raises(TypeError):
+        RscpTags.getTagByCode(0x0E840000)[1]["type"] = "UChar8"
+    assert RscpTags.getTagByName("TAG_WB_DATA")[1] == {
+        "tagvalue": 0x0E840000,
+        "type": "Container",
+    }
+
+
+def test_tag_codes() -> None:
+    """RscpTagCodes has a constant with the code of every tag."""
+    assert RscpTagCodes.TAG_WB_INDEX == 0x0E040001
+    assert len(RscpTagCodes.__all__) == len(RscpTags.rscpTags)
+    for name in RscpTagCodes.__all__:
+        assert getattr(RscpTagCodes, name) == RscpTags.rscpTags[name]["tagvalue"]
+
+
+def test_namespace_modules() -> None:
+    """Every module of the tags package contains only tags of its high byte and prefix."""
+    for high_byte, prefix in NAMESPACES.items():
+        tags = load_namespace(high_byte)
+        assert tags
+        for name, description in tags.items():
+            assert description["tagvalue"] >> 24 == high_byte
+            assert name.startswith(f"TAG_{prefix}_")
+
+
+def test_get_tags_by_prefix() -> None:
+    """getTagsByPrefix returns all tags of a namespace from the database."""
+    assert set(RscpTags.getTagsByPrefix("TAG_WB_")) == {
+        name for name in RscpTags.rscpTags if name.startswith("TAG_WB_")
+    }
+    assert len(RscpTags.getTagsByPrefix("TAG_")) == len(RscpTags.rscpTags)
+    assert RscpTags.getTagsByPrefix("TAG_NOT_A_NAMESPACE_") == {}
+
+
+def test_database_is_up_to_date() -> None:
+    """The shipped tag database is built from the current tag modules."""
+    assert build_database(load_tags()) == DATABASE_PATH.read_bytes()
+    with pytest.raises(ValueError):
+        RscpTagDatabase(b"RSCPTAGX" + DATABASE_PATH.read_bytes()[8:])
+
+
+def test_tags_are_loaded_from_the_database() -> None:
+    """Lookups use the database, the tag modules and the full table aren't loaded."""
+    script = """
+import sys
+from e3dc_rscp_connect.e3dc import RscpTags
+assert RscpTags.getTagByName("TAG_WB_DATA")[1]["tagvalue"] == 0x0E840000
+assert RscpTags.getTagByCode(0x0E840000) is RscpTags.getTagByName("TAG_WB_DATA")
+assert not [x for x in sys.modules if x.startswith("e3dc_rscp_connect.e3dc.tags.")]
+assert "rscpTags" not in vars(RscpTags)
+"""
+    subprocess.run(
+        [sys.executable, "-c", script],
+        check=True,
+        env={"PYTHONPATH": str(custom_components_path)},
+    )
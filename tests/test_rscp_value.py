@@ -0,0 +1,310 @@
+"This file defines tests for encoding and decoding RscpValues and RscpFrames."
+
+from pathlib import Path
+import struct
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.e3dc import RscpTagCodes
+from e3dc_rscp_connect.e3dc.RscpFrame import RscpFrame
+from e3dc_rscp_connect.e3dc.RscpPathQuery import RscpPathQuery, compile_path
+from e3dc_rscp_connect.e3dc.RscpValue import (
+    RscpErrorCodecs,
+    RscpTypeCodecs,
+    RscpTypes,
+    RscpValue,
+)
+import pytest
+
+GOLDEN_PATH = Path(__file__).parent / "benchmarks" / "golden"
+
+
+def raw_value(tag_code: int, type_identifier: int, data: bytes) -> bytes:
+    "Builds the wire format of a single value."
+    return struct.pack("<IBH", tag_code, type_identifier, len(data)) + data
+
+
+def raw_container(tag_code: int, *childs: bytes) -> bytes:
+    "Builds the wire format of a container."
+    return raw_value(tag_code, 0x0E, b"".join(childs))
+
+
+def raw_frame(*values: bytes) -> bytes:
+    "Builds the wire format of a frame."
+    data = b"".join(values)
+    return struct.pack("<HHQIH", 0xDCE3, 0x0011, 1700000000, 0, len(data)) + data
+
+
+WALLBOX_FRAME = raw_frame(
+    raw_container(
+        0x0E840000,  # TAG_WB_DATA
+        raw_value(0x0E040001, 0x03, b"\x02"),  # TAG_WB_INDEX
+        raw_value(0x0E80004D, 0x0D, b"C"),  # TAG_WB_CP_STATE
+        raw_container(
+            0x0E841029,  # TAG_WB_PARAMETER_LIST
+            *[raw_value(0x0E04104B, 0x06, struct.pack("<i", x)) for x in range(50)],
+        ),
+        raw_value(0x0E841038, 0x01, b"\x01"),  # TAG_WB_SUN_MODE_ACTIVE
+    ),
+    raw_value(0x01800008, 0x03, b"\x57"),  # TAG_EMS_BAT_SOC
+    raw_value(0x01800004, 0xFF, struct.pack("<I", 6)),  # TAG_EMS_POWER_GRID error
+)
+
+
+def unpack_frame(buffer) -> list[RscpValue]:
+    "Unpacks a frame and returns the values."
+    frame = RscpFrame()
+    frame.unpack(buffer)
+    return frame.getRscpValues()
+
+
+def test_unpack_frame() -> None:
+    """Test decoding of nested containers, strings and error values."""
+    wallbox, soc, grid = unpack_frame(WALLBOX_FRAME)
+
+    assert wallbox.isTag("TAG_WB_DATA")
+    assert wallbox.get_child("TAG_WB_INDEX").getValue() == 2
+    assert wallbox.get_child("TAG_WB_CP_STATE").getValue() == "C"
+    assert wallbox.get_child("TAG_WB_SUN_MODE_ACTIVE").getValue() is True
+    parameters = wallbox.get_child("TAG_WB_PARAMETER_LIST").getValue()
+    assert [x.getValue() for x in parameters] == list(range(50))
+
+    assert soc.getValue() == 87
+    assert not soc.isError
+    assert grid.isError
+    assert grid.getValue() == 6
+
+
+@pytest.mark.parametrize("buffer_type", [bytes, bytearray, memoryview])
+def test_unpack_frame_from_buffer_types(buffer_type) -> None:
+    """All bytes-like objects can be decoded."""
+    values = unpack_frame(buffer_type(WALLBOX_FRAME))
+    assert [x.toString() for x in values] == [
+        x.toString() for x in unpack_frame(WALLBOX_FRAME)
+    ]
+
+
+def test_unpack_lazy() -> None:
+    """Lazy containers decode to the same values as eagerly decoded ones."""
+    frame = RscpFrame()
+    frame.unpack(WALLBOX_FRAME, lazy=True)
+    wallbox, soc, grid = frame.getRscpValues()
+
+    assert wallbox.get_child("TAG_WB_CP_STATE").getValue() == "C"
+    assert wallbox.has_child_tag("TAG_WB_SUN_MODE_ACTIVE")
+    assert not wallbox.has_child_tag("TAG_WB_SERIAL")
+    assert wallbox.get_child("TAG_NOT_EXISTING") is None
+    assert (
+        len(wallbox.get_child("TAG_WB_PARAMETER_LIST").get_childs("TAG_WB_EXTERN_DATA"))
+        == 0
+    )
+    assert wallbox.getPackedDataSize() == len(WALLBOX_FRAME) - 18 - 8 - 11
+    assert [x.toString() for x in frame.getRscpValues()] == [
+        x.toString() for x in unpack_frame(WALLBOX_FRAME)
+    ]
+    assert RscpFrame().packFrame(frame.getRscpValues())[18:] == WALLBOX_FRAME[18:]
+
+
+def test_unpack_lazy_decodes_accessed_childs_only() -> None:
+    """Childs of a lazy container are not decoded until they are accessed."""
+    buffer = raw_container(
+        0x0E840000,  # TAG_WB_DATA
+        raw_value(0x0E040001, 0x03, b"\x02"),  # TAG_WB_INDEX
+        raw_value(0x0EFFFFFF, 0x03, b"\x00"),  # unknown tag
+    )
+    wallbox = RscpValue().withBuffer(buffer, lazy=True)
+    assert wallbox.get_child_tag_codes() == [0x0E040001, 0x0EFFFFFF]
+    assert wallbox.get_child("TAG_WB_INDEX").getValue() == 2
+
+    with pytest.raises(ValueError):
+        wallbox.getValue()
+    with pytest.raises(ValueError):
+        RscpValue().withBuffer(buffer)
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_get_child_tag_codes(lazy) -> None:
+    """The tag codes of the childs are the same for lazy and decoded containers."""
+    frame = RscpFrame()
+    frame.unpack(WALLBOX_FRAME, lazy=lazy)
+    wallbox = frame.getRscpValues()[0]
+
+    assert wallbox.get_child_tag_codes() == [x.getTagCode() for x in wallbox.getValue()]
+    assert frame.getRscpValues()[1].get_child_tag_codes() == []
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_access_by_tag_code(lazy) -> None:
+    """Tags can be compared and searched by code."""
+    frame = RscpFrame()
+    frame.unpack(WALLBOX_FRAME, lazy=lazy)
+    wallbox = frame.getRscpValues()[0]
+
+    assert wallbox.getTagCode() == RscpTagCodes.TAG_WB_DATA
+    assert wallbox.isTag(RscpTagCodes.TAG_WB_DATA)
+    assert not wallbox.isTag(RscpTagCodes.TAG_WB_INDEX)
+    assert wallbox.get_child(RscpTagCodes.TAG_WB_INDEX).getValue() == 2
+    assert wallbox.has_child_tag(RscpTagCodes.TAG_WB_SUN_MODE_ACTIVE)
+    assert len(wallbox.get_childs(RscpTagCodes.TAG_WB_PARAMETER_LIST)) == 1
+    assert wallbox.get_child(RscpTagCodes.TAG_WB_SERIAL) is None
+
+
+@pytest.mark.parametrize("lazy", [False, True])
+def test_get_tag_by_path(lazy) -> None:
+    """Paths select values by tag and by typed filter values."""
+    frame = RscpFrame()
+    frame.unpack(WALLBOX_FRAME, lazy=lazy)
+    values = frame.getRscpValues()
+
+    assert RscpValue.get_tag_by_path(values, "TAG_EMS_BAT_SOC").getValue() == 0x57
+    wallbox = RscpValue.get_tag_by_path(values, "TAG_WB_DATA(TAG_WB_INDEX==2)")
+    assert wallbox is values[0]
+    assert RscpValue.get_tag_by_path(values, "TAG_WB_DATA(TAG_WB_INDEX==2.0)")
+    assert RscpValue.get_tag_by_path(values, "TAG_WB_DATA(TAG_WB_INDEX==1)") is None
+
+    path = "TAG_WB_DATA(TAG_WB_INDEX==2)/TAG_WB_CP_STATE"
+    assert RscpValue.get_tag_by_path(values, path).getValue() == "C"
+    path = "TAG_WB_DATA(TAG_WB_CP_STATE==C)/TAG_WB_SUN_MODE_ACTIVE"
+    assert RscpValue.get_tag_by_path(values, path).getValue() is True
+
+    # all segments have to match, unknown tags are never found
+    assert RscpValue.get_tag_by_path(values, "TAG_WB_SERIAL/TAG_EMS_BAT_SOC") is None
+    assert RscpValue.get_tag_by_path(values, "TAG_EMS_BAT_SOC/TAG_WB_INDEX") is None
+    assert RscpValue.get_tag_by_path(values, "TAG_UNKNOWN") is None
+
+
+def test_path_query() -> None:
+    """Compiled paths are cached and reject unknown tags."""
+    query = compile_path("TAG_WB_DATA(TAG_WB_INDEX==2)/TAG_WB_CP_STATE")
+    assert compile_path(query.path) is query
+    assert query.find(unpack_frame(WALLBOX_FRAME)).getValue() == "C"
+    with pytest.raises(ValueError):
+        RscpPathQuery("TAG_WB_DATA(TAG_UNKNOWN==2)")
+    with pytest.raises(ValueError):
+        RscpPathQuery("TAG_WB_DATA(TAG_WB_INDEX)")
+
+
+def test_construct_by_tag_code() -> None:
+    """Values constructed by code are packed like values constructed by name."""
+    by_code = RscpValue.construct_rscp_value(
+        RscpTagCodes.TAG_WB_REQ_DATA,
+        [(RscpTagCodes.TAG_WB_INDEX, 1), (RscpTagCodes.TAG_WB_REQ_CP_STATE, None)],
+    )
+    by_name = RscpValue.construct_rscp_value(
+        "TAG_WB_REQ_DATA", [("TAG_WB_INDEX", 1), ("TAG_WB_REQ_CP_STATE", None)]
+    )
+    assert by_code.pack() == by_name.pack()
+    assert by_code.getTagName() == "TAG_WB_REQ_DATA"
+    with pytest.raises(KeyError):
+        RscpValue().withTagCode(0x0EFFFFFF, None)
+
+
+@pytest.mark.parametrize("name", ["poll_request", "poll_reply", "poll_reply_large"])
+@pytest.mark.parametrize("lazy", [False, True])
+def test_golden_frames(name, lazy) -> None:
+    """The golden frames of the benchmarks are decoded and encoded again unchanged."""
+    buffer = (GOLDEN_PATH / f"{name}.bin").read_bytes()
+    frame = RscpFrame()
+    frame.unpack(buffer, lazy=lazy)
+    packed = RscpFrame().packFrame(frame.getRscpValues())
+    # the frame time is the time of packing
+    assert packed[:4] == buffer[:4]
+    assert packed[16:] == buffer[16:]
+
+
+def test_unpack_frame_ignores_trailing_data() -> None:
+    """Data behind the frame is not decoded."""
+    values = unpack_frame(WALLBOX_FRAME + b"\x00" * 32)
+    assert len(values) == 3
+
+
+def test_unpack_value_at_offset() -> None:
+    """A value can be decoded in the middle of a buffer."""
+    buffer = b"\xaa" * 5 + raw_value(0x0A800001, 0x0D, b"S10-1234")
+    value = RscpValue().withBuffer(buffer, 5)
+    assert value.isTag("TAG_INFO_SERIAL_NUMBER")
+    assert value.getValue() == "S10-1234"
+
+
+def test_unpack_variable_type() -> None:
+    """Tags with variable types are decoded with the received type."""
+    buffer = raw_value(0x02040005, 0x0A, struct.pack("<f", 1.5))  # TAG_PVI_VALUE
+    assert RscpValue().withBuffer(buffer).getValue() == 1.5
+
+
+def test_unpack_checks_received_type() -> None:
+    """The received type must match the type of the tag."""
+    with pytest.raises(ValueError):
+        RscpValue().withBuffer(raw_value(0x0A800001, 0x06, bytes(4)))
+    with pytest.raises(ValueError):
+        RscpValue().withBuffer(raw_value(0x0A800001, 0x20, b""))
+    # a failed authentication is answered with an Int32 level
+    buffer = raw_value(
+        RscpTagCodes.TAG_RSCP_AUTHENTICATION, 0x06, struct.pack("<i", -1)
+    )
+    assert RscpValue().withBuffer(buffer).getValue() == -1
+
+
+def test_pack_unpack_roundtrip() -> None:
+    """A packed frame can be decoded again."""
+    request = RscpValue.construct_rscp_value(
+        "TAG_WB_REQ_DATA",
+        [("TAG_WB_INDEX", 1), ("TAG_WB_REQ_SET_SUN_MODE_ACTIVE", True)],
+    )
+    (value,) = unpack_frame(RscpFrame().packFrame([request]))
+    assert value.toString() == request.toString()
+    assert value.getPackedDataSize() == request.getPackedDataSize()
+
+
+def test_unpack_uses_received_size() -> None:
+    """The size of decoded values is taken from the header, also for multibyte strings."""
+    name = "Küche".encode()
+    (wallbox,) = unpack_frame(
+        raw_frame(
+            raw_container(
+                0x0E840000,  # TAG_WB_DATA
+                raw_value(0x0E800042, 0x0D, name),  # TAG_WB_DEVICE_NAME
+                raw_value(0x0E040001, 0x03, b"\x01"),  # TAG_WB_INDEX
+            )
+        )
+    )
+    assert wallbox.get_child("TAG_WB_DEVICE_NAME").getValue() == "Küche"
+    assert wallbox.get_child("TAG_WB_INDEX").getValue() == 1
+    assert wallbox.getPackedDataSize() == 7 + 7 + len(name) + 7 + 1
+
+
+def test_codec_table() -> None:
+    """Every RSCP type has a codec with the size of its format."""
+    for rscp_type in RscpTypes.values():
+        if rscp_type["identifier"] == 0xFF:
+            codec = RscpErrorCodecs[struct.calcsize(f"<{rscp_type['fmt']}")]
+        else:
+            codec = RscpTypeCodecs[rscp_type["identifier"]]
+        assert codec.name == rscp_type["name"]
+        if rscp_type["fmt"] in ("", "s"):
+            assert codec.data is None
+        else:
+            assert codec.data.size == struct.calcsize(f"<{rscp_type['fmt']}")
+
+
+@pytest.mark.parametrize(
+    ("tag_name", "value", "expected"),
+    [
+        ("TAG_RSCP_REQ_USER_LEVEL", None, "04000000" "00" "0000"),
+        ("TAG_WB_INDEX", 3, "0100040e" "03" "0100" "03"),
+        ("TAG_PVI_INDEX", 2, "01000402" "05" "0200" "0200"),
+        ("TAG_EMS_POWER_GRID", -2, "04008001" "06" "0400" "feffffff"),
+        ("TAG_WB_REQ_SET_SUN_MODE_ACTIVE", True, "3910040e" "01" "0100" "01"),
+        ("TAG_RSCP_AUTHENTICATION_USER", "abc", "02000000" "0d" "0300" "616263"),
+    ],
+)
+def test_pack_value(tag_name, value, expected) -> None:
+    """Values are packed with the codec of their tag type."""
+    rscp_value = RscpValue().withTagName(tag_name, value)
+    assert rscp_value.pack().hex() == expected
+    assert rscp_value.getPackedDataSize() == len(bytes.fromhex(expected))
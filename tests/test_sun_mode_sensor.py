@@ -128,7 +128,8 @@ class TestSunModeSensor:
         await sun_mode_sensor.async_select_option("Sonnenmodus")
 
         mock_coordinator.set_sun_mode.assert_called_once_with(0, True)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        # the coordinator refreshes with the request
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_select_option_mischmodus(
@@ -138,7 +139,7 @@ class TestSunModeSensor:
         await sun_mode_sensor.async_select_option("Mischmodus")
 
         mock_coordinator.set_sun_mode.assert_called_once_with(0, False)
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     @pytest.mark.asyncio
     async def test_async_select_option_with_different_wallbox_id(
@@ -158,8 +159,7 @@ class TestSunModeSensor:
         await sun_mode_sensor.async_select_option("InvalidMode")
 
         mock_coordinator.set_sun_mode.assert_not_called()
-        # Refresh should still be called
-        mock_coordinator.async_request_refresh.assert_called_once()
+        mock_coordinator.async_request_refresh.assert_not_called()
 
     def test_is_select_entity(self, sun_mode_sensor):
         """Test that SunModeSensor is a SelectEntity."""
@@ -0,0 +1,44 @@
+"This file defines tests for the update interval bounds read from the options."
+
+from pathlib import Path
+import sys
+
+# Add custom_components to path
+custom_components_path = (
+    Path(__file__).parent.parent.parent.parent / "config" / "custom_components"
+)
+sys.path.insert(0, str(custom_components_path))
+
+from e3dc_rscp_connect.coordinator import update_interval_bounds
+import pytest
+
+
+@pytest.mark.parametrize(
+    ("options", "expected"),
+    [
+        ({"update_interval": 10}, (10, 5, 60)),
+        ({"update_interval": 3}, (3, 3, 60)),
+        (
+            {
+                "update_interval": 20,
+                "min_update_interval": 10,
+                "max_update_interval": 120,
+            },
+            (20, 10, 120),
+        ),
+        # invalid bounds stored without the checks of the options flow
+        ({"update_interval": 10, "min_update_interval": 0}, (10, 5, 60)),
+        (
+            {
+                "update_interval": 10,
+                "min_update_interval": 30,
+                "max_update_interval": 20,
+            },
+            (10, 5, 60),
+        ),
+        ({"update_interval": 0}, (1, 1, 60)),
+    ],
+)
+def test_update_interval_bounds(options, expected) -> None:
+    """Valid bounds are kept, invalid bounds are replaced by the defaults."""
+    assert update_interval_bounds(options) == expected